@@ -1,12 +1,33 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-import json
-from typing import List
 import datetime
-from src.api.models import GraphResponse, QueryInfo, CompanyNode, KeywordNode, Edge # type: ignore
+from typing import List, Optional, Tuple
+from src.api.config import settings
+from src.api.encoding import EncodedBody, accepts, load_file
+from src.api.models import GraphResponse # type: ignore
+from src.database.session import SessionLocal, init_db
+from src.graph.cache import (CachedGraph, GraphCache, GraphSnapshot,
+                             cache_key)
+from src.graph.engine import build_graph
+from src.graph.wire import GRAPH_BINARY_MEDIA_TYPE, encode_graph
+
+# Creates the graph and price tables as well, their models are imported by now.
+init_db()
 
 app = FastAPI()
 
+graph_cache = GraphCache(
+    max_entries=settings.GRAPH_CACHE_MAX_ENTRIES,
+    ttl=settings.GRAPH_CACHE_TTL,
+    directory=settings.GRAPH_CACHE_DIR,
+    disk_size_limit=settings.GRAPH_CACHE_DISK_SIZE_LIMIT,
+)
+# Built graphs with their adjacency, always in memory.
+snapshot_cache = GraphCache(max_entries=settings.GRAPH_SNAPSHOT_MAX_ENTRIES, ttl=settings.GRAPH_CACHE_TTL)
+
+# Hops beyond this reach most of the graph, /graph serves that.
+MAX_NEIGHBORHOOD_HOPS = 4
+
 # CORS 설정 추가
 app.add_middleware(
     CORSMiddleware,
@@ -14,6 +35,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메소드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["ETag"],
 )
 
 
@@ -24,55 +46,110 @@ async def root():
 
 
 @app.get("/test")
-async def test():
-    with open("graph_example.json", "r") as f:
-        return json.load(f)
-
-MOCK_COMPANIES: List[CompanyNode] = [
-    CompanyNode(
-        ISIN="US67066G1040",
-        name="NVIDIA",
-        priceFrom=113.54,
-        priceTo=115.54,
-        priceChange=1.0176149375,
-        currency="USD",
-        market="NASDAQ",
-        source="Yahoo Finance",
-    )
-]
+async def test(request: Request):
+    return load_file("graph_example.json").respond(request)
+
+def _parse_range(from_date: str, to_date: str) -> Tuple[datetime.date, datetime.date]:
+    # Basic validation – ensure provided dates are parseable.
+    try:
+        return datetime.date.fromisoformat(from_date), datetime.date.fromisoformat(to_date)
+    except ValueError:
+        # If parsing fails, fall back to defaults.
+        return datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)
 
-MOCK_KEYWORDS: List[KeywordNode] = [
-    KeywordNode(keyword="AI 칩", priceChange=1.0176149375)
-]
 
-MOCK_EDGES: List[Edge] = [
-    Edge(source="NVIDIA", target="AI 칩", weight=0.5)
-]
+def _media_type(request: Request) -> str:
+    if accepts(request.headers.get("accept", ""), GRAPH_BINARY_MEDIA_TYPE):
+        return GRAPH_BINARY_MEDIA_TYPE
+    return "application/json"
+
+
+def _snapshot(sess, start: datetime.date, end: datetime.date) -> GraphSnapshot:
+    """Graph of ``start..end`` with its adjacency, built once until its data changes."""
+    snapshot_cache.sync(sess)
+    key = cache_key(start, end)
+    snapshot = snapshot_cache.get(key)
+    if snapshot is None:
+        change_id = snapshot_cache.last_change_id
+        snapshot = GraphSnapshot.from_graph(build_graph(sess, start, end), change_id)
+        snapshot_cache.put(key, snapshot)
+    return snapshot
 
 
 @app.get("/graph", response_model=GraphResponse)
-async def get_graph(from_date: str = "2024-01-01", to_date: str = "2024-01-02"):
-    """Return mocked graph data for the requested date range.
+def get_graph(
+    request: Request,
+    from_date: str = "2024-01-01",
+    to_date: str = "2024-01-02",
+    top_keywords: Optional[int] = Query(None, ge=1),
+    min_weight: Optional[float] = Query(None, ge=0),
+    max_degree: Optional[int] = Query(None, ge=1),
+    market: Optional[List[str]] = Query(None),
+    currency: Optional[List[str]] = Query(None),
+):
+    """Return the company - keyword graph of the requested date range.
+
+    The serialized response is cached per range until it expires or links
+    or prices of its days are written, along with its ETag and compressed
+    encodings, so a client holding the current version gets a 304.
+    Clients sending ``Accept: application/vnd.company-keyword-graph`` get
+    the columnar binary encoding instead of JSON, see ``encode_graph``.
 
     Args:
         from_date: ISO formatted start date string. Defaults to ``2024-01-01``.
         to_date: ISO formatted end date string. Defaults to ``2024-01-02``.
+        top_keywords: Keep the keywords with the largest ``|priceChange - 1|`` only.
+        min_weight: Drop the edges whose ``|weight|`` is lower.
+        max_degree: Keep the heaviest edges of every node only.
+        market: Keep the companies of these markets only, repeatable.
+        currency: Keep the companies of these currencies only, repeatable.
     """
-
-    # Basic validation – ensure provided dates are parseable.
-    try:
-        datetime.date.fromisoformat(from_date)
-        datetime.date.fromisoformat(to_date)
-    except ValueError:
-        # If parsing fails, fall back to defaults.
-        from_date = "2024-01-01"
-        to_date = "2024-01-02"
-
-    query_info = QueryInfo(**{"from": from_date, "to": to_date})
-
-    return GraphResponse(
-        query_info=query_info,
-        company_nodes=MOCK_COMPANIES,
-        keyword_nodes=MOCK_KEYWORDS,
-        edges=MOCK_EDGES,
+    start, end = _parse_range(from_date, to_date)
+    filters = dict(
+        top_keywords=top_keywords, min_weight=min_weight, max_degree=max_degree,
+        markets=market, currencies=currency,
     )
+    key = cache_key(start, end, **filters)
+    with SessionLocal() as sess:
+        graph_cache.sync(sess)
+        cached = graph_cache.get(key)
+        if cached is None:
+            snapshot = _snapshot(sess, start, end)
+            cached = CachedGraph.from_graph(snapshot.graph.subgraph(**filters), snapshot.change_id, source=snapshot.graph)
+            graph_cache.put(key, cached)
+    return cached.payloads[_media_type(request)].respond(request, vary="Accept, Accept-Encoding")
+
+
+@app.get("/graph/node/{node_id}", response_model=GraphResponse)
+def get_graph_node(
+    request: Request,
+    node_id: str,
+    from_date: str = "2024-01-01",
+    to_date: str = "2024-01-02",
+    hops: int = Query(1, ge=1, le=MAX_NEIGHBORHOOD_HOPS),
+):
+    """Return the nodes at most ``hops`` edges away from a company or a keyword and the edges between them.
+
+    The lookup walks the adjacency of the graph of the range, built once
+    per range and kept until its data changes, so it only costs the size
+    of the neighborhood. Negotiates JSON or binary like ``/graph``.
+
+    Args:
+        node_id: ISIN or ticker of a company, or a keyword.
+        from_date: ISO formatted start date string. Defaults to ``2024-01-01``.
+        to_date: ISO formatted end date string. Defaults to ``2024-01-02``.
+        hops: Edges between the node and the farthest node returned. Defaults to 1.
+    """
+    start, end = _parse_range(from_date, to_date)
+    with SessionLocal() as sess:
+        snapshot = _snapshot(sess, start, end)
+    node = snapshot.adjacency.find(node_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail=f"{node_id} is not a node of the graph of {start}..{end}")
+    graph = snapshot.adjacency.neighborhood(node, hops)
+    media_type = _media_type(request)
+    if media_type == GRAPH_BINARY_MEDIA_TYPE:
+        body = encode_graph(graph)
+    else:
+        body = graph.to_response().model_dump_json(by_alias=True).encode()
+    return EncodedBody.from_bytes(body, media_type=media_type).respond(request, vary="Accept, Accept-Encoding")
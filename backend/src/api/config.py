@@ -0,0 +1,24 @@
+import os
+
+from pydantic_settings import BaseSettings
+
+
+class ApiSettings(BaseSettings):
+    # /graph 응답 캐시, GRAPH_CACHE_DIR 를 지정하면 프로세스 간에 공유되는 diskcache 를 사용
+    GRAPH_CACHE_MAX_ENTRIES: int = 256
+    GRAPH_CACHE_TTL: float = 3600.0
+    GRAPH_CACHE_DIR: str | None = None
+    GRAPH_CACHE_DISK_SIZE_LIMIT: int = 2**30
+    # 기간별로 메모리에 유지하는 그래프 스냅샷 (인접 배열 포함) 개수, /graph/node 조회에 사용
+    GRAPH_SNAPSHOT_MAX_ENTRIES: int = 8
+
+    class Config:
+        env_file = (
+            ".env.dev.api" if os.getenv("ENVIRONMENT", "DEV") == 'DEV' else
+            ".env.stage.api" if os.getenv("ENVIRONMENT", "STAGE") == 'STAGE' else
+            ".env.prod.api" if os.getenv("ENVIRONMENT", "PROD") == 'PROD' else
+            ".env.api"
+        )
+        env_file_encoding = "utf-8"
+
+settings = ApiSettings() # type: ignore
@@ -0,0 +1,118 @@
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # only gzip is offered in environments installed without brotli
+    brotli = None
+
+GZIP_LEVEL = 6
+# Quality 11 costs seconds per megabyte, 5 still beats gzip on JSON.
+BROTLI_QUALITY = 5
+
+
+def _qualities(header: str) -> Dict[str, float]:
+    """Lower cased name -> quality of the items of an ``Accept`` or ``Accept-Encoding`` header."""
+    qualities = {}
+    for item in header.split(","):
+        name, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        name = name.strip().lower()
+        if name:
+            qualities[name] = quality
+    return qualities
+
+
+def accepts(accept: str, media_type: str) -> bool:
+    """Whether an ``Accept`` header names ``media_type`` explicitly with a non zero quality.
+
+    Wildcards do not count, so clients only get a media type they asked for by name.
+    """
+    return _qualities(accept).get(media_type.lower(), 0.0) > 0
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """A response body with its strong ETag and its compressed encodings, computed once.
+
+    Args:
+        body: Uncompressed body.
+        etag: Strong ETag of the uncompressed body, quoted.
+        encodings: ``Content-Encoding`` -> compressed body.
+        media_type: ``Content-Type`` of the body.
+    """
+    body: bytes
+    etag: str
+    encodings: Dict[str, bytes]
+    media_type: str = "application/json"
+
+    @classmethod
+    def from_bytes(cls, body: bytes, media_type: str = "application/json") -> "EncodedBody":
+        encodings = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            encodings["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(body=body, etag=etag, encodings=encodings, media_type=media_type)
+
+    def etag_of(self, encoding: Optional[str]) -> str:
+        """Strong ETag of one encoding, each encoding being a representation of its own."""
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def negotiate(self, accept_encoding: str) -> Optional[str]:
+        """Encoding to send for an ``Accept-Encoding`` header, None for the uncompressed body."""
+        accepted = _qualities(accept_encoding)
+        # Smallest body first.
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return encoding
+        return None
+
+    def matches(self, if_none_match: str) -> bool:
+        """Whether an ``If-None-Match`` header names one of the representations of the body."""
+        if if_none_match.strip() == "*":
+            return True
+        etags = {self.etag_of(None)} | {self.etag_of(encoding) for encoding in self.encodings}
+        # If-None-Match uses the weak comparison, a W/ prefix does not matter.
+        return any(tag.strip().removeprefix("W/") in etags for tag in if_none_match.split(","))
+
+    def respond(self, request: Request, vary: str = "Accept-Encoding") -> Response:
+        """``304 Not Modified`` when the client has the body, the best accepted encoding otherwise.
+
+        Args:
+            request: Request to answer.
+            vary: ``Vary`` header, to extend when the body was picked from other request headers.
+        """
+        encoding = self.negotiate(request.headers.get("accept-encoding", ""))
+        # no-cache lets clients keep the body but revalidate it on every use.
+        headers = {"ETag": self.etag_of(encoding), "Vary": vary, "Cache-Control": "no-cache"}
+        if self.matches(request.headers.get("if-none-match", "")):
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return Response(content=self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(content=self.encodings[encoding], media_type=self.media_type, headers=headers)
+
+
+@lru_cache(maxsize=8)
+def _load_file(path: str, mtime_ns: int, size: int) -> EncodedBody:
+    with open(path, "rb") as f:
+        return EncodedBody.from_bytes(f.read())
+
+
+def load_file(path: str) -> EncodedBody:
+    """Encoded content of ``path``, read again only once the file changes."""
+    stat = os.stat(path)
+    return _load_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
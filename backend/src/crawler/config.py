@@ -19,6 +19,15 @@ class CrawlerSettings(BaseSettings):
 
     ALEMBIC_DB_URL: str | None = None
 
+    # 기사 HTML, 리서치 PDF를 저장할 blob store: "local" | "s3"
+    BLOB_STORE_BACKEND: str = "local"
+    BLOB_STORE_DIR: str = "./blobs"
+    BLOB_STORE_S3_BUCKET: str | None = None
+    BLOB_STORE_S3_ENDPOINT_URL: str | None = None
+    BLOB_STORE_S3_ACCESS_KEY: str | None = None
+    BLOB_STORE_S3_SECRET_KEY: str | None = None
+    BLOB_STORE_S3_REGION: str | None = None
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URL(self) -> str:
@@ -32,7 +41,7 @@ class CrawlerSettings(BaseSettings):
                 path=self.POSTGRES_DB,
             )
             return str(url)
-        return f"sqlite:///../{self.SQLITE_DB_FILE}"
+        return f"sqlite:///{os.path.join('..', self.SQLITE_DB_FILE)}"
     
     def __post_init__(self):
         def display_all_fields(self):
@@ -13,4 +13,12 @@ class NaverArticleCategoryEnum(Enum):
     DISCLOSURES = "disclosures"
     FOREX = "forex"
 
-    CODE = "code"
\ No newline at end of file
+    CODE = "code"
+
+class HtmlCodecEnum(Enum):
+    NONE = "none"
+    LZMA = "lzma"
+    ZSTD = "zstd"
+
+class ReportFileCodecEnum(Enum):
+    NONE = "none"
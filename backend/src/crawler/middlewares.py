@@ -4,10 +4,19 @@
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
 # useful for handling different item types with a single interface
+import json
+import os
 import time
+from urllib.parse import urlparse
 
 from scrapy import signals
+from scrapy.exceptions import NotConfigured
 from scrapy.downloadermiddlewares.retry import RetryMiddleware
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.task import deferLater
+
+# Set on the requests NaverRateLimitMiddleware throttles, it owns their backoff.
+RATE_LIMITED_META_KEY = "naver_rate_limited"
 
 
 class TgCrawlerSpiderMiddleware:
@@ -104,29 +113,197 @@ class TgCrawlerDownloaderMiddleware:
         spider.logger.info("Spider opened: %s" % spider.name)
 
 class NaverDelayMiddleware(RetryMiddleware):
-    def __init__(self, delay=0.5):
+    """Delay and back off Naver requests without blocking the reactor.
+
+    Waits are awaited as deferreds instead of ``time.sleep`` so other requests
+    keep flowing. On 429/503 only the download slot of the failing request is
+    slowed down (its ``delay`` is doubled up to ``NAVER_MAX_BACKOFF_DELAY``) and
+    the request is retried; successful responses relax the slot back towards
+    its original delay.
+
+    Requests throttled by ``NaverRateLimitMiddleware`` are only retried, their
+    host's token bucket already slows down on 429/503 and a slot backoff on
+    top would penalize the host twice.
+    """
+    def __init__(self, settings, delay=0.5, backoff_delay=1.0, max_backoff_delay=60.0):
+        super().__init__(settings)
         self.delay = delay
+        self.backoff_delay = backoff_delay
+        self.max_backoff_delay = max_backoff_delay
+        self.crawler = None
+        self._base_delays: dict[str, float] = {}
 
     @classmethod
     def from_crawler(cls, crawler):
-        return cls(delay=crawler.settings.getfloat("NAVER_DELAY"))
+        middleware = cls(
+            crawler.settings,
+            delay=crawler.settings.getfloat("NAVER_DELAY"),
+            backoff_delay=crawler.settings.getfloat("NAVER_BACKOFF_DELAY", 1.0),
+            max_backoff_delay=crawler.settings.getfloat("NAVER_MAX_BACKOFF_DELAY", 60.0),
+        )
+        middleware.crawler = crawler
+        return middleware
 
-    def process_request(self, request, spider):
-        print(f"[Middleware] request.url: {request.url}")
+    async def process_request(self, request, spider):
+        spider.logger.debug(f"[Middleware] request.url: {request.url}")
         if "finance.naver.com" in request.url and request.meta.get("delay", None) is not None:
-            time.sleep(self.delay)
+            from twisted.internet import reactor
+            await maybe_deferred_to_future(deferLater(reactor, self.delay, lambda: None))
         return None
     
     def process_response(self, request, response, spider):
-        # 서버 응답 상태 코드에 따라 지연
+        # 서버 응답 상태 코드에 따라 해당 download slot만 지연
         if response.status in [429, 503]:  # Too Many Requests or Service Unavailable
-            print("[Middleware] Too Many Requests or Service Unavailable. Sleep 10 seconds.")
-            time.sleep(1)  # 10초 지연
-            request.meta['download_slot'] = 'slow-server'
+            key, slot = self._get_slot(request)
+            if slot is not None and not request.meta.get(RATE_LIMITED_META_KEY):
+                self._base_delays.setdefault(key, slot.delay)
+                slot.delay = min(max(slot.delay * 2, self.backoff_delay), self.max_backoff_delay)
+                spider.logger.info(
+                    f"[Middleware] {response.status} from slot {key}. Backing off to {slot.delay:.2f} seconds."
+                )
             return self._retry(request, f"Response status: {response.status}", spider) or response
-        else:
-            request.meta['download_slot'] = 'fast-server'
-            return response
+
+        key, slot = self._get_slot(request)
+        if slot is not None and key in self._base_delays:
+            base_delay = self._base_delays[key]
+            slot.delay = max(base_delay, slot.delay / 2)
+            if slot.delay <= base_delay:
+                del self._base_delays[key]
+        return response
+
+    def _get_slot(self, request):
+        key = request.meta.get("download_slot")
+        if self.crawler is None or self.crawler.engine is None:
+            return key, None
+        return key, self.crawler.engine.downloader.slots.get(key)
 
     def spider_opened(self, spider):
-        spider.logger.info("[Middleware] Spider opened: %s" % spider.name)
\ No newline at end of file
+        spider.logger.info("[Middleware] Spider opened: %s" % spider.name)
+
+
+class TokenBucket:
+    """Token bucket whose refill ``rate`` (requests/sec) can change at runtime."""
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it.
+
+        Tokens may go negative, which queues concurrent callers fairly behind
+        each other instead of letting them race for the next refill.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class NaverRateLimitMiddleware:
+    """Adaptive per-host rate limiter for the Naver endpoints.
+
+    Every host in ``NAVER_RATE_LIMIT_HOSTS`` gets its own token bucket. The rate
+    grows additively by ``NAVER_RATE_LIMIT_INCREASE`` on each 200 and is cut
+    multiplicatively by ``NAVER_RATE_LIMIT_DECREASE`` on 429/503 (AIMD). Learned
+    rates are stored in ``NAVER_RATE_LIMIT_STATE_FILE`` when the spider closes
+    and used as the starting rates of the next crawl.
+
+    This is the only backoff of the hosts it throttles, see ``RATE_LIMITED_META_KEY``.
+    """
+    THROTTLED_STATUSES = (429, 503)
+
+    def __init__(
+        self,
+        hosts: dict[str, float],
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        burst: float = 5.0,
+        state_file: str | None = None,
+        stats=None,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.state_file = state_file
+        self.stats = stats
+        learned = self._load_rates()
+        self.buckets = {
+            host: TokenBucket(self._clamp(learned.get(host, rate)), burst)
+            for host, rate in hosts.items()
+        }
+        self._last_decrease_at: dict[str, float] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("NAVER_RATE_LIMIT_ENABLED", True):
+            raise NotConfigured
+        middleware = cls(
+            hosts=crawler.settings.getdict("NAVER_RATE_LIMIT_HOSTS"),
+            min_rate=crawler.settings.getfloat("NAVER_RATE_LIMIT_MIN_RATE", 0.2),
+            max_rate=crawler.settings.getfloat("NAVER_RATE_LIMIT_MAX_RATE", 20.0),
+            increase=crawler.settings.getfloat("NAVER_RATE_LIMIT_INCREASE", 0.05),
+            decrease=crawler.settings.getfloat("NAVER_RATE_LIMIT_DECREASE", 0.5),
+            burst=crawler.settings.getfloat("NAVER_RATE_LIMIT_BURST", 5.0),
+            state_file=crawler.settings.get("NAVER_RATE_LIMIT_STATE_FILE"),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    async def process_request(self, request, spider):
+        bucket = self.buckets.get(urlparse(request.url).hostname or "")
+        if bucket is None:
+            return None
+        request.meta[RATE_LIMITED_META_KEY] = True
+        wait = bucket.reserve()
+        if wait > 0:
+            from twisted.internet import reactor
+            await maybe_deferred_to_future(deferLater(reactor, wait, lambda: None))
+        return None
+
+    def process_response(self, request, response, spider):
+        host = urlparse(request.url).hostname or ""
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            return response
+
+        if response.status in self.THROTTLED_STATUSES:
+            # In-flight requests answer with the same status, cut only once per second.
+            now = time.monotonic()
+            if now - self._last_decrease_at.get(host, 0.0) >= 1.0:
+                self._last_decrease_at[host] = now
+                bucket.rate = self._clamp(bucket.rate * self.decrease)
+                spider.logger.info(f"[RateLimit] {response.status} from {host}. Rate cut to {bucket.rate:.2f} req/s.")
+        elif response.status == 200:
+            bucket.rate = self._clamp(bucket.rate + self.increase)
+
+        if self.stats is not None:
+            self.stats.set_value(f"ratelimit/{host}/rate", round(bucket.rate, 3))
+        return response
+
+    def spider_closed(self, spider):
+        self._save_rates()
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate, max(self.min_rate, rate))
+
+    def _load_rates(self) -> dict[str, float]:
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r") as f:
+                return {host: float(rate) for host, rate in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_rates(self) -> None:
+        if not self.state_file:
+            return
+        with open(self.state_file, "w") as f:
+            json.dump({host: bucket.rate for host, bucket in self.buckets.items()}, f, indent=2)
@@ -1,22 +1,150 @@
 from src.database.models.naver_theme import NaverThemeListOrm, NaverThemeDetailOrm
-from src.database.session import SessionLocal
-import lzma
+from src.database.session import (SessionLocal, add_missing_columns,
+                                  add_missing_indexes, engine)
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import pytz  # type: ignore
 from scrapy.exceptions import DropItem
+from scrapy.utils.defer import deferred_from_coro
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from twisted.internet import task
 
-from src.crawler.spiders.commons import async_load_to_buffer
-from src.database.models.naver_article import (NaverArticleContentOrm,
+from src.crawler.report_downloader import ReportDownloadWorker
+from src.crawler.spiders.commons import PooledDownloader
+from src.database.base import Base
+from src.crawler.constant import HtmlCodecEnum
+from src.database.blob_store import get_blob_store
+from src.database.bulk import bulk_insert, bulk_update, bulk_upsert
+from src.database.codec import compress, store_zstd_dict
+from src.database.models.naver_article import (NAVER_ARTICLE_LIST_UNIQUE_INDEX,
+                                        NaverArticleContentOrm,
                                         NaverArticleFailureOrm,
                                         NaverArticleListOrm,)
-from src.database.models.naver_research import (NaverResearchReportFileOrm,
-                                        NaverResearchReportOrm)
+from src.database.models.naver_research import NaverResearchReportOrm
 from src.crawler.items import (NaverArticleContentItem, NaverArticleItem,
                               NaverArticleListFailedItem)
 
 kst = pytz.timezone('Asia/Seoul')
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_COMPRESSION_WORKERS = 4
+DEFAULT_REPORT_DOWNLOAD_CONCURRENCY = 8
+DEFAULT_REPORT_DOWNLOAD_RETRIES = 3
+
+BulkWriteFn = Callable[[Session, Type[Base], List[Dict[str, Any]]], int]  # type: ignore[valid-type]
+
+
+class BufferedBulkWriter:
+    """Buffer row mappings per ORM class and write them to the database in bulk.
+
+    A flush happens once ``batch_size`` rows are pending or ``flush_interval``
+    seconds have passed since the previous flush. The rows of a flush are
+    written in one transaction. When it fails it is rolled back and replayed
+    row by row, so a bad row only drops itself and the rows added together
+    with it by ``add_together``.
+
+    Rows are written with ``bulk_insert`` unless ``writers`` maps the ORM class
+    to another bulk write function, e.g. ``bulk_upsert``.
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        stats: Any = None,
+        stats_prefix: str = "pipeline",
+        writers: Optional[Dict[Type[Base], BulkWriteFn]] = None,  # type: ignore[valid-type]
+    ):
+        self.sess = session_factory()
+        self.writers = writers or {}
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.stats = stats
+        self.stats_prefix = stats_prefix
+        self.rows_written = 0
+        self.rows_failed = 0
+        self._units: List[List[Tuple[Type[Base], Dict[str, Any]]]] = []  # type: ignore[valid-type]
+        self._pending = 0
+        self._started_at = time.monotonic()
+        self._last_flush_at = self._started_at
+
+    def add(self, orm_cls: Type[Base], row: Dict[str, Any]) -> None:  # type: ignore[valid-type]
+        self.add_together([(orm_cls, row)])
+
+    def add_together(self, rows: List[Tuple[Type[Base], Dict[str, Any]]]) -> None:  # type: ignore[valid-type]
+        """Buffer ``(orm_cls, row)`` pairs that are committed in the same transaction or dropped together."""
+        self._units.append(rows)
+        self._pending += len(rows)
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush_if_due(self) -> None:
+        if self._pending and time.monotonic() - self._last_flush_at >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        units, self._units = self._units, []
+        self._pending = 0
+        if units:
+            self._write_units(units)
+        self._last_flush_at = time.monotonic()
+        self._update_stats()
+
+    def close(self) -> None:
+        self.flush()
+        self.sess.close()
+
+    def _write(self, orm_cls: Type[Base], rows: List[Dict[str, Any]]) -> None:  # type: ignore[valid-type]
+        self.writers.get(orm_cls, bulk_insert)(self.sess, orm_cls, rows)
+
+    def _write_units(self, units: List[List[Tuple[Type[Base], Dict[str, Any]]]]) -> None:  # type: ignore[valid-type]
+        batches: Dict[Type[Base], List[Dict[str, Any]]] = defaultdict(list)  # type: ignore[valid-type]
+        for unit in units:
+            for orm_cls, row in unit:
+                batches[orm_cls].append(row)
+        rows = sum(len(unit) for unit in units)
+        try:
+            for orm_cls, batch in batches.items():
+                self._write(orm_cls, batch)
+            self.sess.commit()
+            self.rows_written += rows
+            return
+        except SQLAlchemyError as e:
+            self.sess.rollback()
+            tables = ", ".join(orm_cls.__tablename__ for orm_cls in batches)
+            logger.warning(f"Bulk write of {rows} rows into {tables} failed, retrying row by row: {e}")
+
+        for unit in units:
+            try:
+                for orm_cls, row in unit:
+                    self._write(orm_cls, [row])
+                self.sess.commit()
+                self.rows_written += len(unit)
+            except SQLAlchemyError as e:
+                self.sess.rollback()
+                self.rows_failed += len(unit)
+                for orm_cls, row in unit:
+                    logger.error(f"Dropped row for {orm_cls.__tablename__}: {row} ({e})")
+
+    def _update_stats(self) -> None:
+        if self.stats is None:
+            return
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        self.stats.set_value(f"{self.stats_prefix}/rows_written", self.rows_written)
+        self.stats.set_value(f"{self.stats_prefix}/rows_failed", self.rows_failed)
+        self.stats.set_value(f"{self.stats_prefix}/rows_per_sec", round(self.rows_written / elapsed, 2))
+        self.stats.inc_value(f"{self.stats_prefix}/flushes")
+
 
 class NaverThemeListPipeline:
     def open_spider(self, spider): 
@@ -53,26 +181,62 @@ class FinanceNewsListPipeline:
     - validating scraped data (checking that the items contain certain fields)
     - checking for duplicates (and dropping them)
     - storing the scraped item in a database
+
+    Items are buffered and written in bulk, see ``NAVER_PIPELINE_BATCH_SIZE``
+    and ``NAVER_PIPELINE_FLUSH_INTERVAL`` in the settings. Articles are upserted
+    on (media_id, article_id, ticker, category), so re-crawling a ticker does
+    not duplicate rows. Opening the spider adds that unique index to tables
+    created before it, deleting the duplicates they already hold.
     """
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        stats: Any = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            batch_size=crawler.settings.getint("NAVER_PIPELINE_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+            flush_interval=crawler.settings.getfloat("NAVER_PIPELINE_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL),
+            stats=crawler.stats,
+        )
+
     def open_spider(self, spider): 
-        self.sess = SessionLocal()   
+        # The upsert needs the unique index, which create_all does not add to an existing table.
+        add_missing_indexes(engine, NaverArticleListOrm.__table__)
+        self.writer = BufferedBulkWriter(
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            stats=self.stats,
+            stats_prefix="pipeline/naver_article_list",
+            writers={
+                NaverArticleListOrm: partial(bulk_upsert, index_name=NAVER_ARTICLE_LIST_UNIQUE_INDEX),
+            },
+        )
+        self._flush_loop = task.LoopingCall(self.writer.flush_if_due)
+        self._flush_loop.start(self.flush_interval, now=False)
         
     def close_spider(self, spider): 
-        self.sess.close()
+        if self._flush_loop.running:
+            self._flush_loop.stop()
+        self.writer.close()
 
     def process_item(self, item: Optional[NaverArticleItem], spider):
         if item is None:
             raise DropItem("Item is None")
         if isinstance(item, NaverArticleListFailedItem):
-            failed_orm = NaverArticleFailureOrm(
+            self.writer.add(NaverArticleFailureOrm, dict(
                 ticker=item['ticker'],
                 error_code=item['error_code'].value,
-            )
-            self.sess.add(failed_orm)
-            self.sess.commit()
+            ))
             return item
 
-        article = NaverArticleListOrm(
+        self.writer.add(NaverArticleListOrm, dict(
             ticker=item['ticker'],
             article_id=item['article_id'],
             media_id=item['media_id'],
@@ -85,45 +249,116 @@ class FinanceNewsListPipeline:
             article_published_at=kst.localize(
                 datetime.strptime(item['article_published_at'].strip(), "%Y.%m.%d %H:%M")
             ) if not item.get('category') else item['article_published_at']
-        )
-        self.sess.add(article)
-        self.sess.commit()
-        print(f"Added article: {item['title']}")
+        ))
+        spider.logger.debug(f"Buffered article: {item['title']}")
         return item
 
 class FinanceNewsContentPipeline:
+    """Store article contents and mark their list rows as scraped.
+
+    The list row primary key comes in ``response.meta['list_id']``, so no
+    lookup is needed per article. Contents are inserted in bulk with
+    ``ON CONFLICT (article_id) DO NOTHING`` and the ``latest_scraped_at``
+    updates are flushed as one bulk UPDATE per batch, in the same
+    transaction, so a list row is never marked as scraped without its
+    content.
+
+    The HTML is compressed off the reactor thread in a thread or process pool
+    with the codec configured by ``NAVER_HTML_CODEC`` and written to the blob
+    store. The row only keeps its hash, size and codec. A zstd dictionary is
+    copied to the blob store as well and the row keeps its id, so decoding
+    never depends on the dictionary file.
+    """
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        stats: Any = None,
+        codec: HtmlCodecEnum = HtmlCodecEnum.LZMA,
+        compression_level: Optional[int] = None,
+        zstd_dict_path: Optional[str] = None,
+        executor_type: str = "thread",
+        compression_workers: int = DEFAULT_COMPRESSION_WORKERS,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = stats
+        self.codec = codec
+        self.compression_level = compression_level
+        self.zstd_dict_path = zstd_dict_path
+        self.executor_type = executor_type
+        self.compression_workers = compression_workers
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        compression_level = crawler.settings.get("NAVER_HTML_COMPRESSION_LEVEL")
+        return cls(
+            batch_size=crawler.settings.getint("NAVER_PIPELINE_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+            flush_interval=crawler.settings.getfloat("NAVER_PIPELINE_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL),
+            stats=crawler.stats,
+            codec=HtmlCodecEnum(crawler.settings.get("NAVER_HTML_CODEC", HtmlCodecEnum.LZMA.value)),
+            compression_level=int(compression_level) if compression_level is not None else None,
+            zstd_dict_path=crawler.settings.get("NAVER_HTML_ZSTD_DICT_PATH"),
+            executor_type=crawler.settings.get("NAVER_HTML_COMPRESSION_EXECUTOR", "thread"),
+            compression_workers=crawler.settings.getint("NAVER_HTML_COMPRESSION_WORKERS", DEFAULT_COMPRESSION_WORKERS),
+        )
+
     def open_spider(self, spider): 
-        self.sess = SessionLocal()   
+        self.executor: Executor = (
+            ProcessPoolExecutor(max_workers=self.compression_workers)
+            if self.executor_type == "process"
+            else ThreadPoolExecutor(max_workers=self.compression_workers, thread_name_prefix="html-compress")
+        )
+        # Tables created before the codec and blob store columns get them here, create_all skips them.
+        add_missing_columns(engine, NaverArticleContentOrm.__table__)
+        add_missing_indexes(engine, NaverArticleContentOrm.__table__)
+        self.blob_store = get_blob_store()
+        self.zstd_dict_id = (
+            store_zstd_dict(self.zstd_dict_path, self.blob_store)
+            if self.codec is HtmlCodecEnum.ZSTD and self.zstd_dict_path else None
+        )
+        self.writer = BufferedBulkWriter(
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            stats=self.stats,
+            stats_prefix="pipeline/naver_article_contents",
+            writers={
+                NaverArticleContentOrm: partial(bulk_upsert, key_columns=["article_id"], update_columns=[]),
+                NaverArticleListOrm: bulk_update,
+            },
+        )
+        self._flush_loop = task.LoopingCall(self.writer.flush_if_due)
+        self._flush_loop.start(self.flush_interval, now=False)
         
     def close_spider(self, spider): 
-        self.sess.close()
+        if self._flush_loop.running:
+            self._flush_loop.stop()
+        self.executor.shutdown(wait=True)
+        self.writer.close()
 
-    def process_item(self, item: NaverArticleContentItem, spider):
+    async def process_item(self, item: NaverArticleContentItem, spider):
         response = item['response']
-        article = self.sess.query(NaverArticleListOrm).filter_by(
-            article_id=response.meta['article_id'],
-            media_id=response.meta['media_id']
-        ).first()
-
-        if article is not None:
-            article.latest_scraped_at = datetime.now(kst) # type: ignore
-            self.sess.add(article)
-            self.sess.commit()
-        else:
-            raise DropItem(f"Article not found: {response.meta['article_id']}")
-        
-        exiting_record = self.sess.query(NaverArticleContentOrm).filter_by(
-            article_id=response.meta['article_id'],
-            media_id=response.meta['media_id']
-        ).first()
-        if exiting_record is not None:
-            return DropItem(f"Article content already exists: {response.meta['article_id']}")
-                
-        article_content = NaverArticleContentOrm(
+        list_id = response.meta.get('list_id')
+        if list_id is None:
+            raise DropItem(f"Article list id is missing: {response.meta['article_id']}")
+
+        html = await asyncio.wrap_future(self.executor.submit(
+            compress,
+            item['html'].encode('utf-8'),
+            self.codec,
+            self.compression_level,
+            self.zstd_dict_path,
+        ))
+        ref = await asyncio.to_thread(self.blob_store.put, html)
+        content = dict(
             ticker=item['ticker'],
             article_id=item['article_id'],
             media_id=item['media_id'],
-            html=lzma.compress(item['html'].encode('utf-8')),
+            html=b"",
+            html_sha256=ref.sha256,
+            html_size=ref.size,
+            html_codec=self.codec.value,
+            html_codec_dict=self.zstd_dict_id,
             content=item['content'],
             title=item['title'],
             language='ko',
@@ -134,19 +369,70 @@ class FinanceNewsContentPipeline:
                 datetime.strptime(item['article_modified_at'].strip(), "%Y-%m-%d %H:%M:%S")
             ) if item.get('article_modified_at') else None
         )
-        self.sess.add(article_content)
-        self.sess.commit()
-        self.sess.close()
+        scraped = dict(id=list_id, latest_scraped_at=datetime.now(kst))
+        # The list row is only marked as scraped along with its content, a dropped content is fetched again.
+        self.writer.add_together([(NaverArticleContentOrm, content), (NaverArticleListOrm, scraped)])
         return item
     
 class ResearchMarketinfoListPipeline:
+    """Store research reports right away and leave their PDF to ``ReportDownloadWorker``.
+
+    Reports are committed with ``downloaded=False`` so the item pipeline never
+    waits on a PDF. With ``NAVER_REPORT_DOWNLOAD_IN_CRAWL`` the worker drains
+    pending reports in the background while the spider runs, otherwise run
+    ``python -m src.crawler.report_downloader`` afterwards.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_REPORT_DOWNLOAD_CONCURRENCY,
+        max_retries: int = DEFAULT_REPORT_DOWNLOAD_RETRIES,
+        http2: bool = True,
+        download_in_crawl: bool = True,
+        stats: Any = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.http2 = http2
+        self.download_in_crawl = download_in_crawl
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            max_concurrency=crawler.settings.getint("NAVER_REPORT_DOWNLOAD_CONCURRENCY", DEFAULT_REPORT_DOWNLOAD_CONCURRENCY),
+            max_retries=crawler.settings.getint("NAVER_REPORT_DOWNLOAD_RETRIES", DEFAULT_REPORT_DOWNLOAD_RETRIES),
+            http2=crawler.settings.getbool("NAVER_REPORT_DOWNLOAD_HTTP2", True),
+            download_in_crawl=crawler.settings.getbool("NAVER_REPORT_DOWNLOAD_IN_CRAWL", True),
+            stats=crawler.stats,
+        )
+
     def open_spider(self, spider): 
         self.sess = SessionLocal()   
+        self._download_task = None
+        if not self.download_in_crawl:
+            return
+        self.downloader = PooledDownloader(
+            max_concurrency=self.max_concurrency,
+            max_retries=self.max_retries,
+            http2=self.http2,
+        )
+        self._stop_downloads = asyncio.Event()
+        worker = ReportDownloadWorker(self.downloader, concurrency=self.max_concurrency, stats=self.stats)
+        self._download_task = asyncio.get_event_loop().create_task(worker.run(stop=self._stop_downloads))
         
     def close_spider(self, spider): 
         self.sess.close()
+        if self._download_task is not None:
+            return deferred_from_coro(self._finish_downloads())
 
-    async def process_item(self, item: Dict[str, Any], spider):
+    async def _finish_downloads(self):
+        self._stop_downloads.set()
+        try:
+            await self._download_task
+        finally:
+            await self.downloader.aclose()
+
+    def process_item(self, item: Dict[str, Any], spider):
         research_report = NaverResearchReportOrm(
             title=item.get('title'),
             date=item.get('date_obj'),
@@ -157,35 +443,9 @@ class ResearchMarketinfoListPipeline:
             report_id=item['report_item'].get('report_id'),
             target_company=item['report_item'].get('target_company', None),    # Not provided in the input data
             target_industry=item['report_item'].get('target_industry', None),  # Not provided in the input data
+            downloaded=False,
             updated_at=datetime.now(pytz.UTC),
         )
         self.sess.add(research_report)
         self.sess.commit()
-        await fetch_and_store_report(self.sess, research_report, item)
         return item
-
-async def fetch_and_store_report(sess, report_orm: NaverResearchReportOrm, item: Dict[str, Any]):
-    report_item: Dict[str, Any] = item.get('report_item', {})
-    # TODO: Remove this print statement, replace with logger
-    print(
-        f"Fetching and storing: "
-        f"research_report/"
-        f"{report_item['date']}/"
-        f"{report_item['category']}/"
-        f"{report_item['report_id']}.pdf"
-    )
-    try:
-        buffer = bytearray()
-        await async_load_to_buffer(url=str(report_orm.file_url), buffer=buffer)
-
-        report_file = NaverResearchReportFileOrm(report_id=report_orm.id, file_data=buffer)
-        sess.add(report_file)
-        sess.commit()
-    except Exception as e:
-        raise DropItem(f"Failed to download and store report: {e}") 
-    else:
-        report_orm.downloaded = True # type: ignore
-        sess.add(report_orm)
-        sess.commit()
-        
-        
\ No newline at end of file
@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from typing import Any, Callable, Optional, Set
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.orm import Session
+
+from src.crawler.spiders.commons import PooledDownloader
+from src.database.blob_store import BlobRef, BlobStore, get_blob_store
+from src.database.models.naver_research import (NaverResearchReportFileOrm,
+                                                NaverResearchReportOrm)
+from src.database.session import SessionLocal, add_missing_columns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_POLL_INTERVAL = 5.0
+REPORT_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class ReportDownloadWorker:
+    """Download the PDFs of research reports that are not downloaded yet.
+
+    The queue is the ``naver_research_reports`` table itself: every row whose
+    ``downloaded`` flag is not true is pending, so an interrupted run simply
+    resumes on the next one. Pending rows are paged by primary key and fed to
+    ``concurrency`` download tasks sharing one ``PooledDownloader``. A report
+    that fails stays pending for the next run but is not retried in this one.
+
+    PDFs go to the blob store, the DB only keeps their hash and size. The
+    blocking DB and blob store calls run in threads, so the worker can share
+    the event loop of a crawl.
+    """
+    def __init__(
+        self,
+        downloader: PooledDownloader,
+        session_factory: Callable[[], Session] = SessionLocal,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        stats: Any = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        self.downloader = downloader
+        self.blob_store = blob_store or get_blob_store()
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.page_size = page_size
+        self.stats = stats
+        self.downloaded = 0
+        self.failed = 0
+        self.bytes = 0
+        self._failed_ids: Set[int] = set()
+        self._started_at = time.monotonic()
+
+    async def run(self, stop: Optional[asyncio.Event] = None, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Drain pending reports. With ``stop``, keep polling for new ones until it is set and nothing is left."""
+        await asyncio.to_thread(self._add_missing_columns)
+        while True:
+            attempted = await self.drain()
+            if stop is None or (stop.is_set() and attempted == 0):
+                return
+            if attempted == 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain(self) -> int:
+        """Download every report pending right now and return how many were attempted."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._consume(queue)) for _ in range(self.concurrency)]
+        attempted = 0
+        try:
+            last_id = 0
+            while True:
+                page = await asyncio.to_thread(self._fetch_pending_page, last_id)
+                if not page:
+                    break
+                last_id = page[-1].id
+                for report in page:
+                    if report.id in self._failed_ids:
+                        continue
+                    await queue.put(report)
+                    attempted += 1
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._update_stats()
+        return attempted
+
+    def summary(self) -> dict:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return dict(
+            downloaded=self.downloaded,
+            failed=self.failed,
+            bytes=self.bytes,
+            elapsed_sec=round(elapsed, 2),
+            reports_per_sec=round(self.downloaded / elapsed, 2),
+            mb_per_sec=round(self.bytes / elapsed / 1024 / 1024, 2),
+        )
+
+    def _add_missing_columns(self) -> None:
+        with self.session_factory() as sess:
+            # Tables created before the blob store lack its columns, create_all skips them.
+            add_missing_columns(sess.get_bind(), NaverResearchReportFileOrm.__table__)
+
+    def _fetch_pending_page(self, last_id: int) -> list[Row]:
+        with self.session_factory() as sess:
+            return list(sess.execute(
+                select(NaverResearchReportOrm.id, NaverResearchReportOrm.file_url)
+                .where(
+                    NaverResearchReportOrm.downloaded.isnot(True),
+                    NaverResearchReportOrm.id > last_id,
+                )
+                .order_by(NaverResearchReportOrm.id)
+                .limit(self.page_size)
+            ).all())
+
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        while True:
+            report = await queue.get()
+            try:
+                await self._download(report)
+            finally:
+                queue.task_done()
+
+    async def _download(self, report: Row) -> None:
+        try:
+            # Small reports stay in memory, large ones are spooled to a temporary file while downloading.
+            with tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_SIZE) as sink:
+                await self.downloader.stream_to(str(report.file_url), sink)  # type: ignore[arg-type]
+                sink.seek(0)
+                ref = await asyncio.to_thread(self.blob_store.put_file, sink)  # type: ignore[arg-type]
+            await asyncio.to_thread(self._store, report.id, ref)
+        except Exception as e:
+            self.failed += 1
+            self._failed_ids.add(report.id)
+            logger.error(f"Failed to download and store report {report.id} ({report.file_url}): {e}")
+        else:
+            self.downloaded += 1
+            self.bytes += ref.size
+
+    def _store(self, report_id: int, ref: BlobRef) -> None:
+        with self.session_factory() as sess:
+            sess.add(NaverResearchReportFileOrm(report_id=report_id, file_data=b"", sha256=ref.sha256, size=ref.size))
+            sess.execute(
+                update(NaverResearchReportOrm)
+                .where(NaverResearchReportOrm.id == report_id)
+                .values(downloaded=True)
+            )
+            sess.commit()
+
+    def _update_stats(self) -> None:
+        if self.stats is None:
+            return
+        for key, value in self.summary().items():
+            self.stats.set_value(f"report_download/{key}", value)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Download the PDFs of pending Naver research reports.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--no-http2", action="store_true")
+    args = parser.parse_args()
+
+    downloader = PooledDownloader(
+        max_concurrency=args.concurrency,
+        max_retries=args.retries,
+        http2=not args.no_http2,
+    )
+    worker = ReportDownloadWorker(downloader, concurrency=args.concurrency, page_size=args.page_size)
+    try:
+        await worker.run()
+    finally:
+        await downloader.aclose()
+    print(worker.summary())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -21,7 +21,8 @@ ROBOTSTXT_OBEY = False
 # Configure a delay for requests for the same website (default: 0)
 # See https://docs.scrapy.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
-DOWNLOAD_DELAY = 1
+# Naver 요청 속도는 NaverRateLimitMiddleware가 host별로 조절합니다.
+DOWNLOAD_DELAY = 0
 # The download delay setting will honor only one of:
 CONCURRENT_REQUESTS_PER_DOMAIN = 16
 CONCURRENT_REQUESTS_PER_IP = 16
@@ -56,9 +57,34 @@ TELNETCONSOLE_ENABLED = False
 #     "headless": False,
 # } 
 
+# NaverDelayMiddleware
+# NAVER_BACKOFF_DELAY / NAVER_MAX_BACKOFF_DELAY: 429/503 응답 시 해당 slot의 최소/최대 지연(초)
+# NAVER_RATE_LIMIT_HOSTS 의 host는 NaverRateLimitMiddleware가 속도를 줄이므로 재시도만 합니다.
+NAVER_BACKOFF_DELAY = 1.0
+NAVER_MAX_BACKOFF_DELAY = 60.0
+
+# NaverRateLimitMiddleware (host별 token bucket, AIMD)
+# NAVER_RATE_LIMIT_HOSTS: 제한할 host와 학습된 값이 없을 때의 시작 속도(req/s)
+#   리포트 PDF(stock.pstatic.net)는 Scrapy 밖에서 PooledDownloader가 받으므로 여기에 넣지 않습니다.
+# NAVER_RATE_LIMIT_INCREASE: 200 응답마다 더하는 속도(req/s)
+# NAVER_RATE_LIMIT_DECREASE: 429/503 응답 시 곱하는 비율
+# NAVER_RATE_LIMIT_STATE_FILE: 학습된 속도를 다음 크롤링에 이어 쓰기 위한 파일
+NAVER_RATE_LIMIT_ENABLED = True
+NAVER_RATE_LIMIT_HOSTS = {
+    "finance.naver.com": 1.0,
+    "n.news.naver.com": 1.0,
+}
+NAVER_RATE_LIMIT_MIN_RATE = 0.2
+NAVER_RATE_LIMIT_MAX_RATE = 20.0
+NAVER_RATE_LIMIT_INCREASE = 0.05
+NAVER_RATE_LIMIT_DECREASE = 0.5
+NAVER_RATE_LIMIT_BURST = 5.0
+NAVER_RATE_LIMIT_STATE_FILE = ".naver_rate_limits.json"
+
 # Disable the Scrapy User-Agent middleware
 DOWNLOADER_MIDDLEWARES = {
     'src.crawler.middlewares.NaverDelayMiddleware': 543,
+    'src.crawler.middlewares.NaverRateLimitMiddleware': 600,
     # 'scrapy.downloadermiddlewares.autothrottle.AutoThrottleMiddleware': 500,
     # 'scrapy.downloadermiddlewares.useragent.UserAgentMiddleware': None,
     # 'scrapy.downloadermiddlewares.retry.RetryMiddleware': None,
@@ -99,6 +125,36 @@ ROBOTSTXT_OBEY = False
 #    "market_mind.pipelines.FinanceNewsListPipeline": 1,
 # }
 
+# Buffered bulk writes in the item pipelines
+# NAVER_PIPELINE_BATCH_SIZE: 한 번에 DB에 기록할 최대 row 수
+# NAVER_PIPELINE_FLUSH_INTERVAL: batch가 다 차지 않아도 flush 하는 주기(초)
+NAVER_PIPELINE_BATCH_SIZE = 500
+NAVER_PIPELINE_FLUSH_INTERVAL = 5.0
+
+# NaverNewsArticleContents가 한 번에 읽어오는 미수집 기사 수 (keyset pagination)
+NAVER_CONTENT_FRONTIER_PAGE_SIZE = 1000
+
+# 기사 HTML 압축 (FinanceNewsContentPipeline)
+# NAVER_HTML_CODEC: "lzma" | "zstd" | "none"
+# NAVER_HTML_COMPRESSION_LEVEL: lzma preset 또는 zstd level (None이면 codec 기본값)
+# NAVER_HTML_ZSTD_DICT_PATH: `python -m src.database.codec`로 학습한 zstd dictionary 경로
+#   (blob store에 복사되고 각 row는 html_codec_dict에 그 sha256을 기록하므로 재학습해도 기존 row를 읽을 수 있음)
+# NAVER_HTML_COMPRESSION_EXECUTOR: "thread" | "process"
+NAVER_HTML_CODEC = "lzma"
+NAVER_HTML_COMPRESSION_LEVEL = None
+NAVER_HTML_ZSTD_DICT_PATH = None
+NAVER_HTML_COMPRESSION_EXECUTOR = "thread"
+NAVER_HTML_COMPRESSION_WORKERS = 4
+
+# 리서치 PDF 다운로드 (ReportDownloadWorker)
+# spider가 살아있는 동안 하나의 httpx.AsyncClient(HTTP/2, keep-alive)를 공유합니다.
+NAVER_REPORT_DOWNLOAD_CONCURRENCY = 8
+NAVER_REPORT_DOWNLOAD_RETRIES = 3
+NAVER_REPORT_DOWNLOAD_HTTP2 = True
+# True면 크롤링 중에 background로 PDF를 받고, False면 목록만 저장합니다.
+# 남은 PDF는 `python -m src.crawler.report_downloader`로 이어서 받을 수 있습니다.
+NAVER_REPORT_DOWNLOAD_IN_CRAWL = True
+
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
 """
@@ -108,7 +164,7 @@ AUTOTHROTTLE_MAX_DELAY: 서버가 느리게 응답하면 최대 지연 시간을
 AUTOTHROTTLE_TARGET_CONCURRENCY: 서버와 동시 연결 수를 설정합니다.
 AUTOTHROTTLE_DEBUG: 활성화하면 디버깅 정보를 로그에 표시합니다.
 """
-AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_ENABLED = False  # NaverRateLimitMiddleware로 대체
 AUTOTHROTTLE_START_DELAY = 1
 AUTOTHROTTLE_MAX_DELAY = 10
 AUTOTHROTTLE_TARGET_CONCURRENCY = 10.0
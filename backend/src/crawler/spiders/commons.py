@@ -1,6 +1,11 @@
 
 
+import asyncio
+import importlib.util
+import io
+import logging
 import re
+from typing import BinaryIO, Optional
 from urllib.parse import urlparse
 
 import httpx
@@ -48,12 +53,84 @@ def parse_report_url(url):
     else:
         return None
 
-async def async_load_to_buffer(url: str, buffer: bytearray) -> None:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        
-        if response.status_code == 200:
-            buffer.extend(response.content)
-            print("Buffer successfully loaded with data from the URL.")
-        else:
-            print(f"Failed to load buffer. Status code: {response.status_code}")
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class PooledDownloader:
+    """Shared HTTP client for report downloads, meant to live as long as the spider.
+
+    Connections to stock.pstatic.net are kept alive and reused over HTTP/2,
+    at most ``max_concurrency`` downloads run at once, and transient failures
+    are retried with exponential backoff. Bodies are streamed to the given
+    sink in chunks instead of being loaded in memory.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        http2: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.chunk_size = chunk_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 is enabled but the `h2` package is missing, downloading over HTTP/1.1: pip install 'httpx[http2]'")
+            http2 = False
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+
+    async def stream_to(self, url: str, sink: BinaryIO) -> int:
+        """Download ``url`` into the seekable binary ``sink`` and return the number of bytes written.
+
+        Raises:
+            httpx.HTTPError: If the download still fails after ``max_retries`` retries.
+        """
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                sink.seek(0)
+                sink.truncate()
+                try:
+                    return await self._stream_once(url, sink)
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code in RETRYABLE_STATUSES
+                    if not retryable or attempt == self.max_retries:
+                        raise
+                    delay = self.backoff * 2 ** attempt
+                    logger.warning(f"Download failed ({e}), retrying {url} in {delay:.1f} seconds")
+                    await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def _stream_once(self, url: str, sink: BinaryIO) -> int:
+        size = 0
+        async with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                sink.write(chunk)
+                size += len(chunk)
+        return size
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+async def async_load_to_buffer(url: str, buffer: bytearray, downloader: Optional[PooledDownloader] = None) -> None:
+    owns_downloader = downloader is None
+    downloader = downloader or PooledDownloader(max_concurrency=1)
+    try:
+        sink = io.BytesIO()
+        await downloader.stream_to(url, sink)
+        buffer.extend(sink.getbuffer())
+    finally:
+        if owns_downloader:
+            await downloader.aclose()
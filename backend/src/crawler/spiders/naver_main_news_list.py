@@ -42,6 +42,7 @@ class BaseNaverNewsSpider(scrapy.Spider, abc.ABC):
             "scrapy.downloadermiddlewares.retry.RetryMiddleware": None,
             "scrapy_fake_useragent.middleware.RandomUserAgentMiddleware": 400,
             "scrapy_fake_useragent.middleware.RetryUserAgentMiddleware": 401,
+            "src.crawler.middlewares.NaverRateLimitMiddleware": 600,
         },
         "FAKEUSERAGENT_PROVIDERS": [
             "scrapy_fake_useragent.providers.FakerProvider",
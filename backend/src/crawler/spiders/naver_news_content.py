@@ -1,13 +1,14 @@
 import logging
 import os
 from datetime import datetime
-from typing import Any, Iterable, Union
+from typing import Any, Iterable, Iterator, Union
 
 import pytz  # type: ignore
 import scrapy
 from bs4 import BeautifulSoup
 from scrapy.http import Request
 from scrapy.http.response.html import HtmlResponse
+from sqlalchemy import Row, select
 from twisted.python.failure import Failure
 
 from src.crawler.constant import NaverArticleCategoryEnum
@@ -26,6 +27,7 @@ def _get_target_url(article_id: ArticleId, office_id: OfficeId):
 
 logging.getLogger('faker').setLevel(logging.WARNING)
 kst = pytz.timezone('Asia/Seoul')
+DEFAULT_FRONTIER_PAGE_SIZE = 1000
 
 class NaverNewsArticleContents(scrapy.Spider):
     verbose = False
@@ -38,6 +40,7 @@ class NaverNewsArticleContents(scrapy.Spider):
             "scrapy.downloadermiddlewares.retry.RetryMiddleware": None,
             "scrapy_fake_useragent.middleware.RandomUserAgentMiddleware": 400,
             "scrapy_fake_useragent.middleware.RetryUserAgentMiddleware": 401,
+            "src.crawler.middlewares.NaverRateLimitMiddleware": 600,
         },
         FAKEUSERAGENT_PROVIDERS=[
             "scrapy_fake_useragent.providers.FakerProvider",
@@ -53,24 +56,11 @@ class NaverNewsArticleContents(scrapy.Spider):
         self.category = NaverArticleCategoryEnum(category) if category != "null" else None
 
     def start_requests(self) -> Iterable[Request]:
-        session = SessionLocal()
-        articles = session\
-            .query(NaverArticleListOrm)\
-            .filter(
-                NaverArticleListOrm.latest_scraped_at == None,
-                NaverArticleListOrm.ticker == self.ticker if self.ticker != None \
-                    else NaverArticleListOrm.ticker == None,
-                NaverArticleListOrm.category == self.category if self.category != None \
-                    else NaverArticleListOrm.category == None, 
-                NaverArticleListOrm.article_published_at.between(self.from_date, self.to_date)
-            )\
-            .yield_per(1000)\
-            .all()
-        
-        for article in articles:
+        for article in self._iter_pending_articles():
             yield Request(
                 _get_target_url(article.article_id, article.media_id),
                 meta=dict(
+                    list_id=article.id,
                     article_id=article.article_id,
                     media_id=article.media_id,
                     ticker=article.ticker,
@@ -78,6 +68,38 @@ class NaverNewsArticleContents(scrapy.Spider):
                 callback=self.parse,
                 errback=self.errback,
             )
+
+    def _iter_pending_articles(self) -> Iterator[Row]:
+        """Yield the articles whose contents are not scraped yet, one keyset page at a time.
+
+        Pages are read by primary key with a short-lived session each, and only
+        the columns needed to build a request are selected. Scrapy pulls
+        ``start_requests`` lazily, so the next page is only read once the
+        scheduler has drained the previous one.
+        """
+        page_size = self.settings.getint("NAVER_CONTENT_FRONTIER_PAGE_SIZE", DEFAULT_FRONTIER_PAGE_SIZE)
+        stmt = select(
+            NaverArticleListOrm.id,
+            NaverArticleListOrm.article_id,
+            NaverArticleListOrm.media_id,
+            NaverArticleListOrm.ticker,
+        ).where(
+            NaverArticleListOrm.latest_scraped_at == None,
+            NaverArticleListOrm.ticker == self.ticker if self.ticker != None \
+                else NaverArticleListOrm.ticker == None,
+            NaverArticleListOrm.category == self.category if self.category != None \
+                else NaverArticleListOrm.category == None, 
+            NaverArticleListOrm.article_published_at.between(self.from_date, self.to_date)
+        ).order_by(NaverArticleListOrm.id).limit(page_size)
+
+        last_id = 0
+        while True:
+            with SessionLocal() as session:
+                page = session.execute(stmt.where(NaverArticleListOrm.id > last_id)).all()
+            if not page:
+                return
+            yield from page
+            last_id = page[-1].id
     
     async def parse(self, response):
         if self.verbose and response.request is not None:
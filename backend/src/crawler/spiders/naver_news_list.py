@@ -32,12 +32,13 @@ class NaverNewsArticleList(scrapy.Spider):
     name = os.path.basename(__file__).replace('.py', '')
     allowed_domains = ['naver.com']
     custom_settings = {
-        "ITEM_PIPELINES": {"mm_crawler.pipelines.FinanceNewsListPipeline": 1},
+        "ITEM_PIPELINES": {"src.crawler.pipelines.FinanceNewsListPipeline": 1},
         "DOWNLOADER_MIDDLEWARES": {
             "scrapy.downloadermiddlewares.useragent.UserAgentMiddleware": None,
             "scrapy.downloadermiddlewares.retry.RetryMiddleware": None,
             "scrapy_fake_useragent.middleware.RandomUserAgentMiddleware": 400,
             "scrapy_fake_useragent.middleware.RetryUserAgentMiddleware": 401,
+            "src.crawler.middlewares.NaverRateLimitMiddleware": 600,
         },
         "FAKEUSERAGENT_PROVIDERS": [
             "scrapy_fake_useragent.providers.FakerProvider",
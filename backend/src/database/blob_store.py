@@ -0,0 +1,245 @@
+import abc
+import argparse
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, NamedTuple, Optional
+
+from sqlalchemy import func, select, text, update
+
+from src.crawler.config import settings
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobRef(NamedTuple):
+    sha256: str
+    size: int
+
+
+def blob_key(sha256: str) -> str:
+    """Shard blobs by the first two bytes of their hash, e.g. ``ab/cd/abcd...``."""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+class BlobStore(abc.ABC):
+    """Content-addressed storage for large binaries kept outside the relational DB.
+
+    Blobs are keyed by the SHA-256 of their bytes, so storing the same content
+    twice is a no-op and identical files are deduplicated for free.
+    """
+
+    def put(self, data: bytes) -> BlobRef:
+        sha256 = hashlib.sha256(data).hexdigest()
+        if not self.exists(sha256):
+            self._write(sha256, data)
+        return BlobRef(sha256, len(data))
+
+    @abc.abstractmethod
+    def put_file(self, fileobj: BinaryIO) -> BlobRef:
+        """Store the content of ``fileobj`` from its current position, reading it in chunks."""
+
+    @abc.abstractmethod
+    def get(self, sha256: str) -> bytes: ...
+
+    @abc.abstractmethod
+    def exists(self, sha256: str) -> bool: ...
+
+    @abc.abstractmethod
+    def _write(self, sha256: str, data: bytes) -> None: ...
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under ``root``, sharded as ``root/ab/cd/<sha256>``."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, sha256: str) -> str:
+        return os.path.join(self.root, blob_key(sha256))
+
+    def put_file(self, fileobj: BinaryIO) -> BlobRef:
+        digest = hashlib.sha256()
+        size = 0
+        # Hash while copying to a temporary file, then move it in place under its hash.
+        with tempfile.NamedTemporaryFile(dir=self.root, delete=False) as tmp:
+            try:
+                for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+        sha256 = digest.hexdigest()
+        if self.exists(sha256):
+            os.unlink(tmp.name)
+        else:
+            os.makedirs(os.path.dirname(self.path(sha256)), exist_ok=True)
+            os.replace(tmp.name, self.path(sha256))
+        return BlobRef(sha256, size)
+
+    def get(self, sha256: str) -> bytes:
+        with open(self.path(sha256), "rb") as f:
+            return f.read()
+
+    def exists(self, sha256: str) -> bool:
+        return os.path.exists(self.path(sha256))
+
+    def _write(self, sha256: str, data: bytes) -> None:
+        path = self.path(sha256)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+
+
+class S3BlobStore(BlobStore):
+    """Blobs in an S3-compatible bucket (AWS S3, MinIO, ...), keyed as ``ab/cd/<sha256>``."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        region: Optional[str] = None,
+    ):
+        try:
+            import boto3  # type: ignore
+        except ImportError as e:
+            raise ImportError("The s3 blob store requires the `boto3` package: pip install boto3") from e
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+        )
+
+    def put_file(self, fileobj: BinaryIO) -> BlobRef:
+        # The key is the hash, so hash first and upload the same bytes in a second pass.
+        start = fileobj.tell()
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+        sha256 = digest.hexdigest()
+        if not self.exists(sha256):
+            fileobj.seek(start)
+            self.client.upload_fileobj(fileobj, self.bucket, blob_key(sha256))
+        return BlobRef(sha256, size)
+
+    def get(self, sha256: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=blob_key(sha256))["Body"].read()
+
+    def exists(self, sha256: str) -> bool:
+        from botocore.exceptions import ClientError  # type: ignore
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=blob_key(sha256))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def _write(self, sha256: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=blob_key(sha256), Body=data)
+
+
+@lru_cache(maxsize=1)
+def get_blob_store() -> BlobStore:
+    """Return the blob store configured by ``BLOB_STORE_BACKEND`` in the crawler settings."""
+    backend = settings.BLOB_STORE_BACKEND.lower()
+    if backend == "local":
+        return LocalBlobStore(settings.BLOB_STORE_DIR)
+    if backend == "s3":
+        if not settings.BLOB_STORE_S3_BUCKET:
+            raise ValueError("BLOB_STORE_S3_BUCKET must be provided for the s3 blob store")
+        return S3BlobStore(
+            bucket=settings.BLOB_STORE_S3_BUCKET,
+            endpoint_url=settings.BLOB_STORE_S3_ENDPOINT_URL,
+            access_key=settings.BLOB_STORE_S3_ACCESS_KEY,
+            secret_key=settings.BLOB_STORE_S3_SECRET_KEY,
+            region=settings.BLOB_STORE_S3_REGION,
+        )
+    raise ValueError(f"Unknown blob store backend: {settings.BLOB_STORE_BACKEND}")
+
+
+def _migrate_table(
+    sess_factory,
+    store: BlobStore,
+    orm_cls,
+    data_column: str,
+    sha_column: str,
+    size_column: str,
+    batch_size: int,
+) -> int:
+    data, sha = getattr(orm_cls, data_column), getattr(orm_cls, sha_column)
+    moved, last_id = 0, 0
+    while True:
+        with sess_factory() as sess:
+            rows = sess.execute(
+                select(orm_cls.id, data)
+                .where(orm_cls.id > last_id, sha == None, func.length(data) > 0)  # noqa: E711
+                .order_by(orm_cls.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return moved
+            for row_id, blob in rows:
+                ref = store.put(blob)
+                # The legacy column is emptied rather than nulled, it is NOT NULL in older schemas.
+                sess.execute(
+                    update(orm_cls)
+                    .where(orm_cls.id == row_id)
+                    .values({sha_column: ref.sha256, size_column: ref.size, data_column: b""})
+                )
+            sess.commit()
+        moved += len(rows)
+        last_id = rows[-1][0]
+        print(f"{orm_cls.__tablename__}: moved {moved} rows to the blob store")
+
+
+def migrate_to_blob_store(store: BlobStore, batch_size: int = 100, vacuum: bool = False) -> None:
+    """Move article HTML and research PDFs stored in the DB into ``store``.
+
+    Safe to re-run: only rows without a hash are moved, and identical
+    contents end up as a single blob.
+    """
+    from src.database.models.naver_article import NaverArticleContentOrm
+    from src.database.models.naver_research import NaverResearchReportFileOrm
+    from src.database.session import SessionLocal, add_missing_columns, engine
+
+    for orm_cls in (NaverArticleContentOrm, NaverResearchReportFileOrm):
+        add_missing_columns(engine, orm_cls.__table__)
+
+    _migrate_table(SessionLocal, store, NaverArticleContentOrm, "html", "html_sha256", "html_size", batch_size)
+    _migrate_table(SessionLocal, store, NaverResearchReportFileOrm, "file_data", "sha256", "size", batch_size)
+
+    if vacuum:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if engine.dialect.name == "sqlite":
+                conn.execute(text("VACUUM"))
+            else:
+                for orm_cls in (NaverArticleContentOrm, NaverResearchReportFileOrm):
+                    conn.execute(text(f"VACUUM FULL {orm_cls.__tablename__}"))
+
+
+def main():
+    """Move article HTML and research PDFs stored in the DB into the blob store."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("command", choices=["migrate"])
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--vacuum", action="store_true", help="Reclaim the freed space afterwards")
+    args = parser.parse_args()
+    migrate_to_blob_store(get_blob_store(), batch_size=args.batch_size, vacuum=args.vacuum)
+
+
+if __name__ == "__main__":
+    main()
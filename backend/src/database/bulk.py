@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.database.base import Base
+
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def bulk_insert(sess: Session, orm_cls: Type[Base], rows: List[Dict[str, Any]]) -> int:  # type: ignore[valid-type]
+    """Insert ``rows`` into the table of ``orm_cls`` with a single executemany.
+
+    Args:
+        sess: Session to execute the statement on. The caller owns the transaction.
+        orm_cls: Mapped ORM class whose table receives the rows.
+        rows: Column name to value mappings, one per row.
+
+    Returns:
+        int: Number of rows handed to the database.
+    """
+    if not rows:
+        return 0
+    sess.execute(insert(orm_cls), rows)
+    return len(rows)
+
+
+def bulk_upsert(
+    sess: Session,
+    orm_cls: Type[Base],  # type: ignore[valid-type]
+    rows: List[Dict[str, Any]],
+    index_name: Optional[str] = None,
+    key_columns: Optional[Sequence[str]] = None,
+    update_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """Insert ``rows`` or update the existing ones with ``INSERT ... ON CONFLICT DO UPDATE``.
+
+    Works on SQLite and PostgreSQL. The conflict target is either the unique
+    index ``index_name`` of the table, so expression indexes are supported as
+    well, or the unique ``key_columns``.
+    Rows sharing the same key inside one call are collapsed to the last one,
+    since PostgreSQL refuses to update the same row twice in one statement.
+
+    Args:
+        sess: Session to execute the statement on. The caller owns the transaction.
+        orm_cls: Mapped ORM class whose table receives the rows.
+        rows: Column name to value mappings, one per row.
+        index_name: Name of the unique index used as the conflict target.
+        key_columns: Unique columns used as the conflict target when no
+            ``index_name`` is given.
+        update_columns: Columns overwritten on conflict. Defaults to every
+            column present in the rows that is not part of the key. An empty
+            sequence turns the statement into ``ON CONFLICT DO NOTHING``.
+
+    Returns:
+        int: Number of rows handed to the database after de-duplication.
+
+    Raises:
+        ValueError: If the index does not exist or the dialect has no upsert support.
+    """
+    if not rows:
+        return 0
+
+    table = orm_cls.__table__  # type: ignore[attr-defined]
+    if index_name is not None:
+        index = next((ix for ix in table.indexes if ix.name == index_name), None)
+        if index is None:
+            raise ValueError(f"Unique index {index_name} not found on {table.name}")
+        key_columns = [column.name for column in index.columns]
+        index_elements = list(index.expressions)
+    elif key_columns:
+        index_elements = [table.c[name] for name in key_columns]
+    else:
+        raise ValueError("Either index_name or key_columns must be provided")
+
+    dialect = sess.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise ValueError(f"Upsert is not supported for dialect: {dialect}")
+
+    deduplicated = {tuple(row.get(name) for name in key_columns): row for row in rows}
+    rows = list(deduplicated.values())
+
+    if update_columns is None:
+        update_columns = [name for name in rows[0] if name not in key_columns]
+
+    stmt = _UPSERT_INSERTS[dialect](table)
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+    sess.execute(stmt, rows)
+    return len(rows)
+
+
+def bulk_update(sess: Session, orm_cls: Type[Base], rows: List[Dict[str, Any]]) -> int:  # type: ignore[valid-type]
+    """Update rows of ``orm_cls`` by primary key with a single executemany.
+
+    Args:
+        sess: Session to execute the statement on. The caller owns the transaction.
+        orm_cls: Mapped ORM class whose table is updated.
+        rows: Mappings holding the primary key and the columns to set, one per row.
+
+    Returns:
+        int: Number of rows handed to the database.
+    """
+    if not rows:
+        return 0
+    sess.execute(update(orm_cls), rows)
+    return len(rows)
@@ -0,0 +1,143 @@
+import argparse
+import lzma
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from src.crawler.constant import HtmlCodecEnum
+
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_ZSTD_DICT_SIZE = 112_640
+
+
+def _import_zstandard():
+    try:
+        import zstandard  # type: ignore
+    except ImportError as e:
+        raise ImportError("The zstd codec requires the `zstandard` package: pip install zstandard") from e
+    return zstandard
+
+
+@lru_cache(maxsize=4)
+def _load_zstd_dict(path: str):
+    zstandard = _import_zstandard()
+    with open(path, "rb") as f:
+        return zstandard.ZstdCompressionDict(f.read())
+
+
+@lru_cache(maxsize=4)
+def _load_stored_zstd_dict(blob_store, dict_id: str):
+    zstandard = _import_zstandard()
+    return zstandard.ZstdCompressionDict(blob_store.get(dict_id))
+
+
+def store_zstd_dict(path: str, blob_store=None) -> str:
+    """Copy the zstd dictionary at ``path`` to the blob store and return its id, the SHA-256 of its bytes.
+
+    Rows compressed with it keep the id, so they still decode once the
+    dictionary file is retrained or lost.
+    """
+    from src.database.blob_store import get_blob_store
+
+    with open(path, "rb") as f:
+        return (blob_store or get_blob_store()).put(f.read()).sha256
+
+
+def compress(
+    data: bytes,
+    codec: HtmlCodecEnum | str,
+    level: Optional[int] = None,
+    zstd_dict_path: Optional[str] = None,
+) -> bytes:
+    """Compress ``data`` with ``codec``.
+
+    Top-level and picklable so it can run in a process pool.
+
+    Args:
+        data: Raw bytes to compress.
+        codec: Codec to use, see ``HtmlCodecEnum``.
+        level: lzma preset or zstd level. Defaults to the codec default.
+        zstd_dict_path: Optional trained zstd dictionary, see ``train_zstd_dictionary``.
+    """
+    codec = HtmlCodecEnum(codec)
+    if codec is HtmlCodecEnum.NONE:
+        return data
+    if codec is HtmlCodecEnum.LZMA:
+        return lzma.compress(data, preset=level) if level is not None else lzma.compress(data)
+
+    zstandard = _import_zstandard()
+    dict_data = _load_zstd_dict(zstd_dict_path) if zstd_dict_path else None
+    compressor = zstandard.ZstdCompressor(
+        level=level if level is not None else DEFAULT_ZSTD_LEVEL,
+        dict_data=dict_data,
+    )
+    return compressor.compress(data)
+
+
+def decompress(
+    data: bytes,
+    codec: HtmlCodecEnum | str | None,
+    zstd_dict_path: Optional[str] = None,
+    zstd_dict_id: Optional[str] = None,
+    blob_store=None,
+) -> bytes:
+    """Decompress ``data`` written by ``compress``. A missing codec means lzma, the legacy format.
+
+    Args:
+        data: Compressed bytes.
+        codec: Codec ``data`` was compressed with.
+        zstd_dict_path: zstd dictionary of rows stored before dictionary ids were recorded.
+        zstd_dict_id: Id of the zstd dictionary in the blob store, see ``store_zstd_dict``.
+            Takes precedence over ``zstd_dict_path``.
+        blob_store: Blob store holding the dictionary, the configured one when None.
+    """
+    codec = HtmlCodecEnum(codec) if codec else HtmlCodecEnum.LZMA
+    if codec is HtmlCodecEnum.NONE:
+        return data
+    if codec is HtmlCodecEnum.LZMA:
+        return lzma.decompress(data)
+
+    zstandard = _import_zstandard()
+    if zstd_dict_id:
+        from src.database.blob_store import get_blob_store
+
+        dict_data = _load_stored_zstd_dict(blob_store or get_blob_store(), zstd_dict_id)
+    else:
+        dict_data = _load_zstd_dict(zstd_dict_path) if zstd_dict_path else None
+    return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(data)
+
+
+def train_zstd_dictionary(samples: Iterable[bytes], dict_size: int = DEFAULT_ZSTD_DICT_SIZE) -> bytes:
+    """Train a zstd dictionary from sample documents, e.g. Naver article HTML."""
+    zstandard = _import_zstandard()
+    return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+
+def main():
+    """Train a zstd dictionary from the article HTML already stored in the database."""
+    from sqlalchemy import select
+
+    from src.database.models.naver_article import NaverArticleContentOrm
+    from src.database.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("output", help="Path of the dictionary file to write")
+    parser.add_argument("--samples", type=int, default=2000, help="Number of articles to sample")
+    parser.add_argument("--dict-size", type=int, default=DEFAULT_ZSTD_DICT_SIZE)
+    parser.add_argument("--current-dict", default=None, help="Dictionary of zstd rows stored without a dictionary id")
+    args = parser.parse_args()
+
+    with SessionLocal() as sess:
+        rows = sess.scalars(
+            select(NaverArticleContentOrm)
+            .order_by(NaverArticleContentOrm.id.desc())
+            .limit(args.samples)
+        ).all()
+        samples = [row.get_html(zstd_dict_path=args.current_dict).encode("utf-8") for row in rows]
+    dict_bytes = train_zstd_dictionary(samples, dict_size=args.dict_size)
+    with open(args.output, "wb") as f:
+        f.write(dict_bytes)
+    print(f"Trained a {len(dict_bytes)} bytes dictionary from {len(samples)} articles: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
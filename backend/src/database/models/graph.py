@@ -0,0 +1,102 @@
+from sqlalchemy import (BigInteger, Column, Date, DateTime, Float, ForeignKey,
+                        Index, Integer, String, func)
+
+from src.database.base import Base
+
+COMPANY_KEYWORD_LINK_UNIQUE_INDEX = 'uq_company_keyword_links_article'
+COMPANY_KEYWORD_PAIR_UNIQUE_INDEX = 'uq_company_keyword_pairs_pair'
+COMPANY_KEYWORD_DAILY_UNIQUE_INDEX = 'uq_company_keyword_daily_pair_date'
+
+
+class CompanyKeywordLinkOrm(Base):
+    """One company - keyword link extracted from a news article."""
+    __tablename__ = 'company_keyword_links'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    article_url = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+    company_name = Column(String, nullable=False)
+    isin = Column(String, nullable=False)
+    keyword = Column(String, nullable=False)
+    # -1.0 강한 부정, 0 중립, 1.0 강한 긍정
+    weight = Column(Float, nullable=False)
+    context = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=True)
+
+    # A re-extracted article replaces its links instead of duplicating them.
+    # Graph queries read the links of a date range from the covering index alone.
+    __table_args__ = (
+        Index(COMPANY_KEYWORD_LINK_UNIQUE_INDEX, article_url, isin, keyword, unique=True),
+        Index('ix_company_keyword_links_date', date, isin, keyword, weight),
+    )
+
+    def __repr__(self):
+        return (
+            f"<CompanyKeywordLinkOrm(date='{self.date}', isin='{self.isin}', company_name='{self.company_name}', "
+            f"keyword='{self.keyword}', weight={self.weight})>"
+        )
+
+
+class CompanyKeywordPairOrm(Base):
+    """Every company - keyword pair ever linked, with the totals of all its links."""
+    __tablename__ = 'company_keyword_pairs'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    isin = Column(String, nullable=False)
+    keyword = Column(String, nullable=False)
+    first_date = Column(Date, nullable=True)
+    last_date = Column(Date, nullable=True)
+    weight_sum = Column(Float, nullable=False, default=0.0)
+    abs_weight_sum = Column(Float, nullable=False, default=0.0)
+    link_count = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=True)
+
+    # Pairs whose links all ended before a queried range are skipped through last_date.
+    __table_args__ = (
+        Index(COMPANY_KEYWORD_PAIR_UNIQUE_INDEX, isin, keyword, unique=True),
+        Index('ix_company_keyword_pairs_last_date', last_date),
+    )
+
+    def __repr__(self):
+        return (
+            f"<CompanyKeywordPairOrm(id={self.id}, isin='{self.isin}', keyword='{self.keyword}', "
+            f"first_date='{self.first_date}', last_date='{self.last_date}', link_count={self.link_count})>"
+        )
+
+
+class CompanyKeywordDailyOrm(Base):
+    """Links of one pair on one day, with the running totals of the pair up to that day."""
+    __tablename__ = 'company_keyword_daily'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    pair_id = Column(Integer, ForeignKey('company_keyword_pairs.id'), nullable=False)
+    date = Column(Date, nullable=False)
+    weight_sum = Column(Float, nullable=False)
+    abs_weight_sum = Column(Float, nullable=False)
+    link_count = Column(BigInteger, nullable=False)
+    # 해당 일자까지의 누적 합계, 기간 합계는 두 누적 합계의 차이
+    cum_weight_sum = Column(Float, nullable=False, default=0.0)
+    cum_abs_weight_sum = Column(Float, nullable=False, default=0.0)
+    cum_link_count = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(COMPANY_KEYWORD_DAILY_UNIQUE_INDEX, pair_id, date, unique=True),
+        Index('ix_company_keyword_daily_date', date),
+    )
+
+    def __repr__(self):
+        return (
+            f"<CompanyKeywordDailyOrm(pair_id={self.pair_id}, date='{self.date}', weight_sum={self.weight_sum}, "
+            f"link_count={self.link_count}, cum_link_count={self.cum_link_count})>"
+        )
+
+
+class GraphDataChangeOrm(Base):
+    """Days whose links or prices were written, read by the API processes to invalidate their cached graphs."""
+    __tablename__ = 'graph_data_changes'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # "links" | "prices"
+    kind = Column(String, nullable=False)
+    date_from = Column(Date, nullable=False)
+    date_to = Column(Date, nullable=False)
+    changed_at = Column(DateTime(timezone=True), default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<GraphDataChangeOrm(id={self.id}, kind='{self.kind}', date_from='{self.date_from}', date_to='{self.date_to}')>"
@@ -1,12 +1,15 @@
 
-from sqlalchemy import (Boolean, Column, DateTime, Enum, ForeignKey, Integer,
-                        LargeBinary, String)
+from sqlalchemy import (Boolean, Column, DateTime, Enum, ForeignKey, Index,
+                        Integer, LargeBinary, String, literal_column)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from src.crawler.constant import NaverArticleCategoryEnum
+from src.crawler.constant import HtmlCodecEnum, NaverArticleCategoryEnum
 from src.database.base import Base
+from src.database.blob_store import get_blob_store
+from src.database.codec import decompress
 
+NAVER_ARTICLE_LIST_UNIQUE_INDEX = 'uq_naver_article_list_article'
 
 class NaverArticleListOrm(Base):
     __tablename__ = 'naver_article_list'
@@ -24,6 +27,15 @@ class NaverArticleListOrm(Base):
     latest_scraped_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=func.now(), nullable=True)
 
+    # ticker is NULL for main/section news, coalesce it so those rows collide as well.
+    __table_args__ = (
+        Index(
+            NAVER_ARTICLE_LIST_UNIQUE_INDEX,
+            media_id, article_id, func.coalesce(ticker, literal_column("''")), category,
+            unique=True,
+        ),
+    )
+
     def __repr__(self):
         attributes = [
             f"id={self.id}",
@@ -48,7 +60,14 @@ class NaverArticleContentOrm(Base):
     article_id = Column(String, unique=True, nullable=False)
     ticker = Column(String, nullable=True)
     media_id = Column(String, nullable=False)
-    html = Column(LargeBinary, nullable=False)
+    # Legacy inline HTML. New rows keep it in the blob store under html_sha256 and leave it empty,
+    # it stays NOT NULL as in the tables created before the blob store.
+    html = Column(LargeBinary, nullable=False, default=b"")
+    html_sha256 = Column(String(64), nullable=True, index=True)
+    html_size = Column(Integer, nullable=True)
+    html_codec = Column(String, nullable=False, default=HtmlCodecEnum.LZMA.value, server_default=HtmlCodecEnum.LZMA.value)
+    # zstd dictionary the HTML was compressed with, the SHA-256 of the dictionary in the blob store.
+    html_codec_dict = Column(String(64), nullable=True)
     title = Column(String, nullable=True)
     content = Column(String, nullable=True)
     language = Column(String, nullable=False)
@@ -64,6 +83,9 @@ class NaverArticleContentOrm(Base):
             'article_id': self.article_id,
             'ticker': self.ticker,
             'media_id': self.media_id,
+            'html_sha256': self.html_sha256,
+            'html_codec': self.html_codec,
+            'html_codec_dict': self.html_codec_dict,
             'title': self.title,
             'language': self.language,
             'chunked_at': self.chunked_at,
@@ -74,6 +96,21 @@ class NaverArticleContentOrm(Base):
         attr_str = ', '.join(f"{key}='{value}'" for key, value in attributes.items())
         return f"<NaverArticleContentOrm({attr_str})>"
 
+    def get_html(self, blob_store=None, zstd_dict_path=None) -> str:
+        """Return the decoded article HTML whatever codec and storage it was stored with.
+
+        ``zstd_dict_path`` is only used for zstd rows stored without ``html_codec_dict``.
+        """
+        blob_store = blob_store or get_blob_store()
+        if self.html_sha256:
+            data = blob_store.get(self.html_sha256)  # type: ignore[arg-type]
+        else:
+            data = self.html
+        return decompress(
+            data, self.html_codec,  # type: ignore[arg-type]
+            zstd_dict_path=zstd_dict_path, zstd_dict_id=self.html_codec_dict, blob_store=blob_store,  # type: ignore[arg-type]
+        ).decode('utf-8')
+
 class NaverArticleChunkOrm(Base):
     __tablename__ = 'naver_article_chunks'
 
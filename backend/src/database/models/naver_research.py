@@ -4,7 +4,9 @@ from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer,
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from src.crawler.constant import ReportFileCodecEnum
 from src.database.base import Base
+from src.database.blob_store import get_blob_store
 
 
 class NaverResearchReportOrm(Base):
@@ -50,11 +52,23 @@ class NaverResearchReportFileOrm(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     report_id = Column(Integer, ForeignKey('naver_research_reports.id'), nullable=False)
-    file_data = Column(LargeBinary, nullable=False)
+    # Legacy inline PDF. New rows keep it in the blob store under sha256 and leave it empty,
+    # it stays NOT NULL as in the tables created before the blob store.
+    file_data = Column(LargeBinary, nullable=False, default=b"")
+    sha256 = Column(String(64), nullable=True, index=True)
+    size = Column(Integer, nullable=True)
+    codec = Column(String, nullable=False, default=ReportFileCodecEnum.NONE.value, server_default=ReportFileCodecEnum.NONE.value)
     created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
 
     def __repr__(self):
-        return f"<NaverResearchReportFileOrm(id={self.id}, report_id={self.report_id}, created_at='{self.created_at}')>"
+        return (f"<NaverResearchReportFileOrm(id={self.id}, report_id={self.report_id}, sha256='{self.sha256}', "
+                f"size={self.size}, created_at='{self.created_at}')>")
+
+    def get_data(self, blob_store=None) -> bytes:
+        """Return the PDF bytes from the blob store, or from the legacy inline column."""
+        if self.sha256:
+            return (blob_store or get_blob_store()).get(self.sha256)  # type: ignore[arg-type]
+        return self.file_data  # type: ignore[return-value]
 
 class NaverResearchReportChunkOrm(Base):
     __tablename__ = 'naver_research_report_chunks'
@@ -0,0 +1,45 @@
+from sqlalchemy import (BigInteger, Column, Date, DateTime, Float, Index,
+                        Integer, String, func)
+
+from src.database.base import Base
+
+DAILY_PRICE_UNIQUE_INDEX = 'uq_daily_prices_ticker_date'
+
+
+class SecurityOrm(Base):
+    """One row per traded security, the metadata shown on the company nodes of the graph."""
+    __tablename__ = 'securities'
+    ticker = Column(String, primary_key=True)
+    isin = Column(String, nullable=True, index=True)
+    name = Column(String, nullable=False)
+    currency = Column(String, nullable=False)
+    market = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), nullable=True)
+
+    def __repr__(self):
+        return f"<SecurityOrm(ticker='{self.ticker}', isin='{self.isin}', name='{self.name}', market='{self.market}')>"
+
+
+class DailyPriceOrm(Base):
+    __tablename__ = 'daily_prices'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticker = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    volume = Column(BigInteger, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=True)
+
+    # Every range query seeks this index by ticker, then by date.
+    __table_args__ = (
+        Index(DAILY_PRICE_UNIQUE_INDEX, ticker, date, unique=True),
+    )
+
+    def __repr__(self):
+        return (
+            f"<DailyPriceOrm(ticker='{self.ticker}', date='{self.date}', open={self.open}, high={self.high}, "
+            f"low={self.low}, close={self.close}, volume={self.volume})>"
+        )
@@ -14,9 +14,16 @@ class RountineTaskOrm(BaseOrm):
     __tablename__ = 'routine_tasks'
     task_name = Column(String, nullable=False)
     status = Column(String, nullable=False)
+    inserted_count = Column(Integer, nullable=True, comment='추가된 행 수')
+    updated_count = Column(Integer, nullable=True, comment='변경된 행 수')
+    deleted_count = Column(Integer, nullable=True, comment='삭제된 행 수')
+    message = Column(String, nullable=True, comment='실패 사유')
 
     def __repr__(self):
-        return f"<RountineTaskOrm(id={self.id}, task_name='{self.task_name}', status='{self.status}')>"
+        return (
+            f"<RountineTaskOrm(id={self.id}, task_name='{self.task_name}', status='{self.status}', "
+            f"inserted={self.inserted_count}, updated={self.updated_count}, deleted={self.deleted_count})>"
+        )
     
 class t1764OutBlockOrm(BaseOrm):
     __tablename__ = 'xing_t1764_outblock'
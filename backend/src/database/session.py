@@ -1,5 +1,5 @@
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, func, inspect, select, text
 from sqlalchemy.orm import sessionmaker
 
 from src.crawler.config import settings
@@ -11,4 +11,40 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 def init_db():
     Base.metadata.create_all(bind=engine)
 
+def add_missing_columns(engine, table) -> None:
+    """``ALTER TABLE ... ADD COLUMN`` the columns of ``table`` missing in the database."""
+    existing = {column["name"] for column in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            default = f" DEFAULT '{column.server_default.arg}'" if column.server_default is not None else ""
+            conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default}'))
+
+def add_missing_indexes(engine, table) -> None:
+    """``CREATE INDEX`` the indexes of ``table`` missing in the database.
+
+    ``create_all`` skips existing tables, so their indexes are created here.
+    Rows breaking a missing unique index are deleted first, the one with
+    the lowest primary key is kept.
+    """
+    (primary_key,) = table.primary_key.columns
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            # SQLite reflection skips expression based indexes, ask the catalog instead.
+            existing = set(conn.scalars(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+                {"table": table.name},
+            ))
+        else:
+            existing = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                kept = select(func.min(primary_key)).group_by(*index.expressions)
+                conn.execute(delete(table).where(primary_key.not_in(kept)))
+            index.create(conn, checkfirst=True)
+
 init_db()
\ No newline at end of file
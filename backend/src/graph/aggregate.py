@@ -0,0 +1,255 @@
+import argparse
+import datetime
+import logging
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, case, delete, func, select, true
+from sqlalchemy.orm import Session, aliased
+
+from src.database.bulk import bulk_insert, bulk_update, bulk_upsert
+from src.database.models.graph import (COMPANY_KEYWORD_PAIR_UNIQUE_INDEX,
+                                       CompanyKeywordDailyOrm,
+                                       CompanyKeywordLinkOrm,
+                                       CompanyKeywordPairOrm)
+from src.database.session import SessionLocal
+from src.graph.changes import LINKS, day_ranges, record_changes
+
+logger = logging.getLogger(__name__)
+
+EDGE_COLUMNS = ["isin", "keyword", "weight_sum", "abs_weight_sum", "link_count"]
+
+# Stays below the bound parameter limit of SQLite for ``IN`` lists.
+_IN_CHUNK_SIZE = 10_000
+
+
+def _chunks(values: Sequence, size: int = _IN_CHUNK_SIZE) -> Iterable[Sequence]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _grouped_cumsum(values: np.ndarray, group_starts: np.ndarray, group_sizes: np.ndarray) -> np.ndarray:
+    """Running sum of ``values`` restarting at every group, groups being contiguous."""
+    total = np.cumsum(values)
+    offsets = np.concatenate(([0], total))[group_starts]
+    return total - np.repeat(offsets, group_sizes)
+
+
+def _write_running_totals(sess: Session, pair_ids: List[int], new_rows: pd.DataFrame) -> None:
+    """Insert ``new_rows`` with their running totals and fix the totals of the other rows of ``pair_ids``.
+
+    The other daily rows of the pairs are loaded, but only the ones whose
+    running totals change, those after the first new day of their pair,
+    are written back. The totals of the pairs themselves are refreshed
+    and pairs left without any daily row are deleted.
+    """
+    daily = CompanyKeywordDailyOrm
+    columns = ["weight_sum", "abs_weight_sum", "link_count"]
+    cum_columns = [f"cum_{column}" for column in columns]
+    rows = []
+    for chunk in _chunks(pair_ids):
+        stmt = (
+            select(daily.id, daily.pair_id, daily.date, *(getattr(daily, column) for column in columns + cum_columns))
+            .where(daily.pair_id.in_(chunk))
+        )
+        rows.extend(sess.execute(stmt).all())
+    existing = pd.DataFrame(rows, columns=["id", "pair_id", "date"] + columns + cum_columns)
+    frame = pd.concat([existing, new_rows.assign(id=-1)], ignore_index=True) if len(existing) else new_rows.assign(id=-1)
+    frame = frame.sort_values(["pair_id", "date"], kind="stable").reset_index(drop=True)
+
+    pair_of_row = frame["pair_id"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, pair_of_row[1:] != pair_of_row[:-1]]) if len(frame) else np.array([], dtype=np.int64)
+    sizes = np.diff(np.r_[starts, len(frame)])
+    is_new = frame["id"].to_numpy() < 0
+    changed = np.zeros(len(frame), dtype=bool)
+    for column, cum_column in zip(columns, cum_columns):
+        running = _grouped_cumsum(frame[column].to_numpy(), starts, sizes)
+        if cum_column in frame:
+            changed |= frame[cum_column].to_numpy() != running
+        frame[cum_column] = running
+    bulk_insert(sess, daily, frame.loc[is_new, ["pair_id", "date"] + columns + cum_columns].to_dict("records"))
+    bulk_update(sess, daily, frame.loc[changed & ~is_new, ["id"] + cum_columns].to_dict("records"))
+
+    # The last row of a pair holds its totals.
+    ends = starts + sizes - 1
+    now = datetime.datetime.now()
+    bulk_update(sess, CompanyKeywordPairOrm, [
+        dict(
+            id=int(pair_id), first_date=first_date, last_date=last_date,
+            weight_sum=float(weight_sum), abs_weight_sum=float(abs_weight_sum), link_count=int(link_count),
+            updated_at=now,
+        )
+        for pair_id, first_date, last_date, weight_sum, abs_weight_sum, link_count in zip(
+            pair_of_row[starts], frame["date"].to_numpy()[starts], frame["date"].to_numpy()[ends],
+            frame["cum_weight_sum"].to_numpy()[ends], frame["cum_abs_weight_sum"].to_numpy()[ends],
+            frame["cum_link_count"].to_numpy()[ends],
+        )
+    ])
+    # Pairs left without any link no longer belong to any graph.
+    emptied = sorted(set(pair_ids) - set(pair_of_row.tolist()))
+    for chunk in _chunks(emptied):
+        sess.execute(delete(CompanyKeywordPairOrm).where(CompanyKeywordPairOrm.id.in_(chunk)))
+
+
+def update_link_aggregates(sess: Session, dates: Optional[Iterable[datetime.date]] = None) -> int:
+    """Rebuild the daily aggregates of ``dates`` and the running totals they change.
+
+    Only the daily rows of the given days are recomputed from the links,
+    then the running totals of the pairs linked on those days. Called with
+    ``dates=None`` every day is rebuilt. The days are logged as changed so
+    the API drops the graphs cached for them.
+
+    Args:
+        sess: Session to execute the statements on. The caller owns the transaction.
+        dates: Days whose links changed, every day when None.
+
+    Returns:
+        int: Number of daily rows written for those days.
+    """
+    link, pair, daily = CompanyKeywordLinkOrm, CompanyKeywordPairOrm, CompanyKeywordDailyOrm
+    if dates is None:
+        day_chunks: List[Optional[Sequence[datetime.date]]] = [None]
+    else:
+        dates = sorted(set(dates))
+        day_chunks = list(_chunks(dates))
+
+    affected: set = set()
+    aggregates = []
+    for days in day_chunks:
+        link_filter = link.date.in_(days) if days is not None else true()
+        daily_filter = daily.date.in_(days) if days is not None else true()
+
+        new_pairs = sess.execute(select(link.isin, link.keyword).where(link_filter).distinct()).all()
+        bulk_upsert(
+            sess, pair, [dict(isin=isin, keyword=keyword) for isin, keyword in new_pairs],
+            index_name=COMPANY_KEYWORD_PAIR_UNIQUE_INDEX, update_columns=[],
+        )
+        affected.update(sess.scalars(select(daily.pair_id).where(daily_filter).distinct()))
+        sess.execute(delete(daily).where(daily_filter))
+
+        aggregates.extend(sess.execute(
+            select(
+                pair.id, link.date,
+                func.sum(link.weight), func.sum(func.abs(link.weight)), func.count(),
+            )
+            .join(pair, and_(pair.isin == link.isin, pair.keyword == link.keyword))
+            .where(link_filter)
+            .group_by(pair.id, link.date)
+        ).all())
+
+    new_rows = pd.DataFrame(aggregates, columns=["pair_id", "date", "weight_sum", "abs_weight_sum", "link_count"])
+    affected.update(new_rows["pair_id"].tolist())
+    # Rows of the touched days were all deleted, only the later rows of their pairs remain to be corrected.
+    _write_running_totals(sess, sorted(affected), new_rows)
+    record_changes(sess, LINKS, day_ranges(dates) if dates is not None else [(datetime.date.min, datetime.date.max)])
+    return len(new_rows)
+
+
+def _prefix_edges_statement(from_date: datetime.date, to_date: datetime.date):
+    pair, daily = CompanyKeywordPairOrm, CompanyKeywordDailyOrm
+
+    def last_row_before(condition):
+        return (
+            select(daily.id)
+            .where(daily.pair_id == pair.id, condition)
+            .order_by(daily.date.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    bounds = (
+        select(
+            pair.isin, pair.keyword, pair.weight_sum, pair.abs_weight_sum, pair.link_count,
+            case((pair.last_date > to_date, last_row_before(daily.date <= to_date))).label("row_end"),
+            case((pair.first_date < from_date, last_row_before(daily.date < from_date))).label("row_before"),
+        )
+        .where(pair.last_date >= from_date, pair.first_date <= to_date)
+        # MATERIALIZED keeps the planner from inlining the CTE, which would run every seek once more per join.
+        .cte("bounds")
+        .prefix_with("MATERIALIZED")
+    )
+    end, before = aliased(daily), aliased(daily)
+
+    def range_sum(total, column):
+        return func.coalesce(getattr(end, column), total) - func.coalesce(getattr(before, column), 0)
+
+    link_count = range_sum(bounds.c.link_count, "cum_link_count")
+    return (
+        select(
+            bounds.c.isin, bounds.c.keyword,
+            range_sum(bounds.c.weight_sum, "cum_weight_sum").label("weight_sum"),
+            range_sum(bounds.c.abs_weight_sum, "cum_abs_weight_sum").label("abs_weight_sum"),
+            link_count.label("link_count"),
+        )
+        .outerjoin(end, end.id == bounds.c.row_end)
+        .outerjoin(before, before.id == bounds.c.row_before)
+        .where(link_count > 0)
+    )
+
+
+def _scan_edges_statement(from_date: datetime.date, to_date: datetime.date):
+    pair, daily = CompanyKeywordPairOrm, CompanyKeywordDailyOrm
+    return (
+        select(
+            pair.isin, pair.keyword,
+            func.sum(daily.weight_sum), func.sum(daily.abs_weight_sum), func.sum(daily.link_count),
+        )
+        .join(pair, pair.id == daily.pair_id)
+        .where(daily.date.between(from_date, to_date))
+        .group_by(daily.pair_id)
+    )
+
+
+def load_edges(sess: Session, from_date: datetime.date, to_date: datetime.date) -> pd.DataFrame:
+    """Aggregated links of every company - keyword pair within ``from_date..to_date``.
+
+    The sums of a pair over the range are its running totals at the last
+    day on or before ``to_date`` minus the ones before ``from_date``, two
+    seeks of the ``(pair_id, date)`` index. Pairs whose links all fall
+    inside the range take their totals from the pair row without any seek,
+    and pairs whose links all end before the range are skipped through the
+    ``last_date`` index, so the cost follows the number of pairs rather than
+    the number of links.
+    Short ranges hold fewer daily rows than there are pairs, their daily
+    rows are summed directly instead.
+
+    Returns:
+        pd.DataFrame: One row per edge with the columns of ``EDGE_COLUMNS``.
+    """
+    daily = CompanyKeywordDailyOrm
+    daily_rows = sess.scalar(select(func.count()).where(daily.date.between(from_date, to_date)))
+    pairs = sess.scalar(select(func.count()).select_from(CompanyKeywordPairOrm))
+    if daily_rows < pairs:
+        stmt = _scan_edges_statement(from_date, to_date)
+    else:
+        stmt = _prefix_edges_statement(from_date, to_date)
+    # Plain DBAPI tuples, building a Row per edge costs more than the query itself.
+    rows = sess.connection().execute(stmt).cursor.fetchall()
+    return pd.DataFrame.from_records(rows, columns=EDGE_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the daily company - keyword aggregates.")
+    parser.add_argument("--from", dest="start", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="end", type=datetime.date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    dates = None
+    if args.start is not None or args.end is not None:
+        start = args.start or datetime.date.min
+        end = args.end or datetime.date.max
+        with SessionLocal() as sess:
+            dates = list(sess.scalars(
+                select(CompanyKeywordDailyOrm.date).where(CompanyKeywordDailyOrm.date.between(start, end))
+                .union(select(CompanyKeywordLinkOrm.date).where(CompanyKeywordLinkOrm.date.between(start, end)))
+            ))
+    with SessionLocal() as sess:
+        written = update_link_aggregates(sess, dates)
+        sess.commit()
+    logger.info(f"Rebuilt {written} daily company - keyword rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.api.encoding import EncodedBody
+from src.graph.changes import LINKS, DataChange, fetch_changes
+from src.graph.engine import CompanyKeywordGraph
+from src.graph.neighborhood import GraphAdjacency
+from src.graph.wire import GRAPH_BINARY_MEDIA_TYPE, encode_graph
+
+# Changes are kept in memory a little longer than the entries they may
+# invalidate, to cover entries another process built while they landed.
+_CHANGE_MARGIN = 300.0
+
+
+def cache_key(from_date: datetime.date, to_date: datetime.date, **filters: Any) -> str:
+    """Key of a graph query, identical for queries that only differ in the order or spelling of their filters.
+
+    Unset filters are dropped and sequences are sorted, so ``market=["KOSDAQ", "KOSPI"]``
+    and ``market=("KOSPI", "KOSDAQ")`` share their entry.
+    """
+    parts = [from_date.isoformat(), to_date.isoformat()]
+    for name in sorted(filters):
+        value = filters[name]
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = ",".join(sorted(str(item) for item in value))
+        parts.append(f"{name}={value}")
+    return "|".join(parts)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Days of data a cached graph was built from.
+
+    Args:
+        from_date: First day of the links of the graph.
+        to_date: Last day of the links of the graph.
+        price_from: First day of the prices of the graph, None when unbounded.
+        price_to: Last day of the prices of the graph, None when unbounded.
+        change_id: Last change known when the graph was built, later ones may not be part of it.
+    """
+    from_date: datetime.date
+    to_date: datetime.date
+    price_from: Optional[datetime.date]
+    price_to: Optional[datetime.date]
+    change_id: int
+
+    def depends_on(self, change: DataChange) -> bool:
+        if change.kind == LINKS:
+            first, last = self.from_date, self.to_date
+        else:
+            first, last = self.price_from, self.price_to
+        return (first is None or change.date_to >= first) and (last is None or change.date_from <= last)
+
+
+@dataclass(frozen=True)
+class CachedGraph(CacheEntry):
+    """Serialized graph and the days of data it was built from.
+
+    Args:
+        payloads: Media type -> body of the response with its ETag and compressed encodings,
+            the JSON ``GraphResponse`` and the binary encoding of ``encode_graph``.
+    """
+    payloads: Dict[str, EncodedBody]
+
+    @classmethod
+    def from_graph(
+        cls, graph: CompanyKeywordGraph, change_id: int, source: Optional[CompanyKeywordGraph] = None,
+    ) -> "CachedGraph":
+        """Serialize ``graph``, a subgraph of ``source`` when given, whose prices it depends on as well."""
+        price_from, price_to = (source or graph).price_window()
+        return cls(
+            payloads={
+                "application/json": EncodedBody.from_bytes(graph.to_response().model_dump_json(by_alias=True).encode()),
+                GRAPH_BINARY_MEDIA_TYPE: EncodedBody.from_bytes(encode_graph(graph), media_type=GRAPH_BINARY_MEDIA_TYPE),
+            },
+            from_date=graph.from_date,
+            to_date=graph.to_date,
+            price_from=price_from,
+            price_to=price_to,
+            change_id=change_id,
+        )
+
+
+@dataclass(frozen=True)
+class GraphSnapshot(CacheEntry):
+    """Graph of a range with its adjacency, kept in memory to select parts of it without rebuilding it.
+
+    Args:
+        adjacency: Adjacency of the graph, which holds the graph itself.
+    """
+    adjacency: GraphAdjacency
+
+    @classmethod
+    def from_graph(cls, graph: CompanyKeywordGraph, change_id: int) -> "GraphSnapshot":
+        price_from, price_to = graph.price_window()
+        return cls(
+            adjacency=GraphAdjacency.from_graph(graph),
+            from_date=graph.from_date,
+            to_date=graph.to_date,
+            price_from=price_from,
+            price_to=price_to,
+            change_id=change_id,
+        )
+
+    @property
+    def graph(self) -> CompanyKeywordGraph:
+        return self.adjacency.graph
+
+
+class GraphCache:
+    """LRU cache of graphs, expiring after ``ttl`` seconds and invalidated by the change log.
+
+    Entries live in memory, or in a ``diskcache`` directory shared by the
+    processes of the host when ``directory`` is given, which only suits
+    the serialized ``CachedGraph``. ``sync`` reads the changes logged by
+    the ingestion jobs since the last call and drops the entries whose
+    links or prices cover a changed day; ``get`` also checks
+    an entry against the changes logged after it was built, which covers
+    the entries of other processes.
+
+    Args:
+        max_entries: Entries kept in memory before the least recently used is evicted.
+        ttl: Seconds an entry is served for.
+        directory: ``diskcache`` directory, the in-memory store is used when None.
+        disk_size_limit: Bytes the ``diskcache`` store may use.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 3600.0,
+        directory: Optional[str] = None,
+        disk_size_limit: int = 2**30,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.last_change_id = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._changes: List[Tuple[float, DataChange]] = []
+        self._disk = None
+        if directory is not None:
+            import diskcache
+
+            self._disk = diskcache.Cache(directory, size_limit=disk_size_limit, eviction_policy="least-recently-used")
+
+    def _is_stale(self, entry: CacheEntry) -> bool:
+        return any(change.id > entry.change_id and entry.depends_on(change) for _, change in self._changes)
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        if self._disk is not None:
+            return self._disk.get(key)
+        stored = self._entries.get(key)
+        if stored is None:
+            return None
+        expires_at, entry = stored
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None and self._is_stale(entry):
+                self._delete(key)
+                return None
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            if self._disk is not None:
+                self._disk.set(key, entry, expire=self.ttl)
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        if self._disk is not None:
+            self._disk.delete(key)
+        else:
+            self._entries.pop(key, None)
+
+    def invalidate(self, changes: List[DataChange]) -> int:
+        """Drop the in-memory entries built from the days of ``changes``.
+
+        ``diskcache`` entries are left for ``get`` to check, rather than
+        loading every stored body to read its dates.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self._lock:
+            stale = [
+                key for key, (_, entry) in self._entries.items()
+                if any(entry.depends_on(change) for change in changes)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def sync(self, sess: Session) -> int:
+        """Apply the changes logged since the last call.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        changes = fetch_changes(sess, self.last_change_id)
+        now = time.monotonic()
+        with self._lock:
+            self._changes = [(seen, change) for seen, change in self._changes if seen > now - self.ttl - _CHANGE_MARGIN]
+            self._changes.extend((now, change) for change in changes)
+            if changes:
+                self.last_change_id = changes[-1].id
+        return self.invalidate(changes) if changes else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._disk is not None:
+                self._disk.clear()
+            self._entries.clear()
@@ -0,0 +1,58 @@
+import datetime
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.database.bulk import bulk_insert
+from src.database.models.graph import GraphDataChangeOrm
+
+LINKS = "links"
+PRICES = "prices"
+
+# Changes older than this are pruned, cached graphs must expire sooner.
+CHANGE_RETENTION = datetime.timedelta(days=7)
+
+
+@dataclass(frozen=True)
+class DataChange:
+    id: int
+    kind: str
+    date_from: datetime.date
+    date_to: datetime.date
+
+
+def record_changes(sess: Session, kind: str, ranges: Iterable[Tuple[datetime.date, datetime.date]]) -> int:
+    """Log that the ``kind`` data of every day within the ``(first, last)`` ``ranges`` changed.
+
+    The caller owns the transaction, so the change becomes visible together
+    with the data. Changes older than ``CHANGE_RETENTION`` are pruned on the way.
+    """
+    now = datetime.datetime.now()
+    sess.execute(delete(GraphDataChangeOrm).where(GraphDataChangeOrm.changed_at < now - CHANGE_RETENTION))
+    return bulk_insert(sess, GraphDataChangeOrm, [
+        dict(kind=kind, date_from=date_from, date_to=date_to, changed_at=now)
+        for date_from, date_to in ranges
+    ])
+
+
+def day_ranges(dates: Iterable[datetime.date]) -> List[Tuple[datetime.date, datetime.date]]:
+    """Runs of consecutive days of ``dates`` as ``(first, last)`` pairs."""
+    ranges: List[List[datetime.date]] = []
+    for date in sorted(set(dates)):
+        if ranges and date - ranges[-1][1] == datetime.timedelta(days=1):
+            ranges[-1][1] = date
+        else:
+            ranges.append([date, date])
+    return [(first, last) for first, last in ranges]
+
+
+def fetch_changes(sess: Session, after_id: int) -> List[DataChange]:
+    """Changes logged after the change ``after_id``, oldest first."""
+    stmt = (
+        select(GraphDataChangeOrm.id, GraphDataChangeOrm.kind, GraphDataChangeOrm.date_from, GraphDataChangeOrm.date_to)
+        .where(GraphDataChangeOrm.id > after_id)
+        .order_by(GraphDataChangeOrm.id)
+    )
+    return [DataChange(*row) for row in sess.execute(stmt).all()]
@@ -0,0 +1,242 @@
+import datetime
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.api.models import (CompanyNode, Edge, GraphResponse, KeywordNode,
+                            QueryInfo)
+from src.graph.aggregate import load_edges
+from src.graph.prices import get_price_ranges
+from src.graph.sparse import SparseMatrix
+
+
+def _top_per_group(groups: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    """Mask of the ``k`` entries of highest score within every group, ties kept in entry order."""
+    order = np.lexsort((-scores, groups))
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    keep = np.zeros(len(order), dtype=bool)
+    keep[order[rank < k]] = True
+    return keep
+
+
+@dataclass(frozen=True)
+class CompanyKeywordGraph:
+    """Company x keyword graph of a date range, kept as arrays.
+
+    Args:
+        from_date: First day of the range.
+        to_date: Last day of the range.
+        companies: One row per company node with the columns of ``get_price_ranges``.
+        keywords: Keyword of every column of ``weights``.
+        keyword_change: Price change propagated to every keyword.
+        weights: Company x keyword matrix of the mean link weight of every edge.
+        counts: Number of links behind every entry of ``weights``.
+        unpriced: Number of linked companies left out for lack of a price change.
+    """
+    from_date: datetime.date
+    to_date: datetime.date
+    companies: pd.DataFrame
+    keywords: np.ndarray
+    keyword_change: np.ndarray
+    weights: SparseMatrix
+    counts: np.ndarray
+    unpriced: int = 0
+
+    def price_window(self) -> Tuple[Optional[datetime.date], Optional[datetime.date]]:
+        """First and last day whose prices the graph depends on, None when unbounded.
+
+        A company whose prices start after ``from_date`` or end before
+        ``to_date`` would change with any earlier or later price, and so
+        would the graph if a linked company had no price at all.
+        """
+        if self.unpriced:
+            return None, None
+        if not len(self.companies):
+            return self.from_date, self.to_date
+        date_from = pd.to_datetime(self.companies["date_from"]).dt.date
+        date_to = pd.to_datetime(self.companies["date_to"]).dt.date
+        first = None if (date_from > self.from_date).any() else min(date_from.min(), self.from_date)
+        last = None if (date_to < self.to_date).any() else max(date_to.max(), self.to_date)
+        return first, last
+
+    def subgraph(
+        self,
+        top_keywords: Optional[int] = None,
+        min_weight: Optional[float] = None,
+        max_degree: Optional[int] = None,
+        markets: Optional[Sequence[str]] = None,
+        currencies: Optional[Sequence[str]] = None,
+    ) -> "CompanyKeywordGraph":
+        """The most relevant part of the graph, to bound the size of a response.
+
+        The filters apply in order: companies outside ``markets`` and
+        ``currencies``, then edges lighter than ``min_weight``, then every
+        keyword but the ``top_keywords`` moving the most. ``max_degree``
+        keeps the heaviest edges of every company, then of every keyword.
+        Nodes left without an edge are dropped. Price changes are the ones
+        of the whole graph, a keyword keeps the change of all its companies.
+
+        Args:
+            top_keywords: Keywords kept, by descending ``|priceChange - 1|``.
+            min_weight: Lowest ``|weight|`` of an edge.
+            max_degree: Edges kept per node, by descending ``|weight|``.
+            markets: Markets of the companies kept.
+            currencies: Currencies of the companies kept.
+        """
+        rows, cols = self.weights.row_ids(), self.weights.indices
+        strength = np.abs(self.weights.data)
+        keep = np.ones(self.weights.nnz, dtype=bool)
+
+        company_mask = np.ones(len(self.companies), dtype=bool)
+        if markets is not None:
+            company_mask &= self.companies["market"].isin(markets).to_numpy()
+        if currencies is not None:
+            company_mask &= self.companies["currency"].isin(currencies).to_numpy()
+        keep &= company_mask[rows]
+        if min_weight is not None:
+            keep &= strength >= min_weight
+        if top_keywords is not None:
+            candidates = np.unique(cols[keep])
+            if len(candidates) > top_keywords:
+                moves = np.abs(self.keyword_change[candidates] - 1.0)
+                # Partial selection, the order of the kept keywords does not matter.
+                top = candidates[np.argpartition(-moves, top_keywords - 1)[:top_keywords]]
+                keyword_mask = np.zeros(self.weights.shape[1], dtype=bool)
+                keyword_mask[top] = True
+                keep &= keyword_mask[cols]
+        if max_degree is not None:
+            for groups in (rows, cols):
+                entries = np.flatnonzero(keep)
+                keep[entries[~_top_per_group(groups[entries], strength[entries], max_degree)]] = False
+
+        entries = np.flatnonzero(keep)
+        return self.select_edges(entries, rows[entries])
+
+    def select_edges(self, entries: np.ndarray, entry_rows: Optional[np.ndarray] = None) -> "CompanyKeywordGraph":
+        """Graph of the edges ``entries`` of ``weights`` and of the nodes they link.
+
+        Args:
+            entries: Sorted positions of the edges in ``weights``.
+            entry_rows: Company of every edge, computed from ``weights`` when None.
+        """
+        if entry_rows is None:
+            entry_rows = self.weights.row_ids()[entries]
+        weights, rows, cols = self.weights.select(entries, entry_rows)
+        return replace(
+            self,
+            companies=self.companies.iloc[rows].reset_index(drop=True),
+            keywords=self.keywords[cols],
+            keyword_change=self.keyword_change[cols],
+            weights=weights,
+            counts=self.counts[entries],
+        )
+
+    def to_response(self) -> GraphResponse:
+        """``GraphResponse`` of the graph, keywords sorted by descending price change."""
+        names = self.companies["name"].to_numpy(dtype=object)
+        company_nodes = [
+            CompanyNode(
+                ISIN=row.isin, name=row.name, priceFrom=row.price_from, priceTo=row.price_to,
+                priceChange=row.price_change, currency=row.currency, market=row.market, source=row.source,
+            )
+            for row in self.companies.itertuples(index=False)
+        ]
+        order = np.argsort(-self.keyword_change, kind="stable")
+        keyword_nodes = [
+            KeywordNode(keyword=keyword, priceChange=change)
+            for keyword, change in zip(self.keywords[order].tolist(), self.keyword_change[order].tolist())
+        ]
+        edges = [
+            Edge(source=source, target=target, weight=weight)
+            for source, target, weight in zip(
+                names[self.weights.row_ids()].tolist(),
+                self.keywords[self.weights.indices].tolist(),
+                self.weights.data.tolist(),
+            )
+        ]
+        return GraphResponse(
+            query_info=QueryInfo(**{"from": self.from_date.isoformat(), "to": self.to_date.isoformat()}),
+            company_nodes=company_nodes,
+            keyword_nodes=keyword_nodes,
+            edges=edges,
+        )
+
+
+def build_graph_from_edges(
+    edges: pd.DataFrame,
+    prices: pd.DataFrame,
+    from_date: datetime.date,
+    to_date: datetime.date,
+) -> CompanyKeywordGraph:
+    """Assemble the company x keyword graph of ``edges`` and propagate ``prices`` to its keywords.
+
+    Edges of companies without a usable price change are dropped, so every
+    company node has prices and every keyword node at least one edge.
+    Securities without an ISIN are left out, and of several securities
+    sharing one only the first by ticker is kept.
+
+    The price change of a keyword is the link weighted mean of the returns
+    of its companies, ``1 + sum(w * (change - 1)) / sum(|w|)``, so a
+    keyword moves with the companies it is positive for and against the
+    ones it is negative for. Keywords with only neutral links stay at 1.
+
+    Args:
+        edges: Output of ``load_edges``, one row per company - keyword pair.
+        prices: Output of ``get_price_ranges``.
+        from_date: First day of the range.
+        to_date: Last day of the range.
+    """
+    prices = prices[
+        np.isfinite(prices["price_change"].to_numpy(dtype=np.float64)) & (prices["isin"].fillna("") != "")
+    ]
+    # Edges are keyed by ISIN, which securities need not have nor have alone, keep one security per ISIN.
+    prices = prices.sort_values("ticker", kind="stable").drop_duplicates("isin").reset_index(drop=True)
+    company_of_edge = pd.Index(prices["isin"]).get_indexer(edges["isin"])
+    priced = company_of_edge >= 0
+    keyword_of_edge, keywords = pd.factorize(edges["keyword"].to_numpy(dtype=object)[priced])
+
+    shape = (len(prices), len(keywords))
+    weight_sums, inverse = SparseMatrix.from_triplets(
+        company_of_edge[priced], keyword_of_edge, edges["weight_sum"].to_numpy(dtype=np.float64)[priced], shape,
+    )
+    abs_sums = weight_sums.with_data(
+        np.bincount(inverse, weights=edges["abs_weight_sum"].to_numpy(dtype=np.float64)[priced], minlength=weight_sums.nnz)
+    )
+    counts = np.bincount(inverse, weights=edges["link_count"].to_numpy(dtype=np.float64)[priced], minlength=weight_sums.nnz)
+
+    returns = prices["price_change"].to_numpy(dtype=np.float64) - 1.0
+    numerator = weight_sums.rmatvec(returns)
+    denominator = abs_sums.rmatvec(np.ones(shape[0]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        keyword_change = 1.0 + np.where(denominator > 0, numerator / denominator, 0.0)
+
+    # Only the companies with at least one edge become nodes, the matrix rows are renumbered accordingly.
+    linked = np.flatnonzero(np.diff(weight_sums.indptr) > 0)
+    weights = SparseMatrix(
+        np.concatenate(([0], weight_sums.indptr[linked + 1])),
+        weight_sums.indices,
+        weight_sums.data / counts,
+        (len(linked), len(keywords)),
+    )
+    return CompanyKeywordGraph(
+        from_date=from_date,
+        to_date=to_date,
+        companies=prices.iloc[linked].reset_index(drop=True),
+        keywords=np.asarray(keywords, dtype=object),
+        keyword_change=keyword_change,
+        weights=weights,
+        counts=counts.astype(np.int64),
+        unpriced=int(pd.unique(edges["isin"].to_numpy(dtype=object)[~priced]).size),
+    )
+
+
+def build_graph(sess: Session, from_date: datetime.date, to_date: datetime.date) -> CompanyKeywordGraph:
+    """Company x keyword graph of the links dated within ``from_date..to_date``."""
+    edges = load_edges(sess, from_date, to_date)
+    prices = get_price_ranges(sess, from_date, to_date)
+    return build_graph_from_edges(edges, prices, from_date, to_date)
@@ -0,0 +1,48 @@
+import datetime
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.database.bulk import bulk_upsert
+from src.database.models.graph import (COMPANY_KEYWORD_LINK_UNIQUE_INDEX,
+                                       CompanyKeywordLinkOrm)
+from src.graph.aggregate import update_link_aggregates
+
+# ISIN the extraction prompt uses when it does not know the real one.
+PLACEHOLDER_ISIN = "PLACEHOLDER"
+
+
+def store_article_links(sess: Session, articles: Iterable[Dict[str, Any]]) -> int:
+    """Store the links extracted from articles, in the ``article_url`` / ``date`` / ``links`` schema of the README.
+
+    The links of an article replace the ones stored for it before, and the
+    daily aggregates of the days they were and are dated on are updated.
+    Links without a real ISIN are skipped since they cannot be matched to a price.
+
+    Returns:
+        int: Number of links written.
+    """
+    articles = list(articles)
+    urls = [article["article_url"] for article in articles]
+    rows: List[Dict[str, Any]] = []
+    for article in articles:
+        date = datetime.date.fromisoformat(article["date"]) if isinstance(article["date"], str) else article["date"]
+        for link in article["links"]:
+            if not link.get("ISIN") or link["ISIN"] == PLACEHOLDER_ISIN:
+                continue
+            rows.append(dict(
+                article_url=article["article_url"],
+                date=date,
+                company_name=link["companyName"],
+                isin=link["ISIN"],
+                keyword=link["keyword"],
+                weight=max(-1.0, min(1.0, float(link["weight"]))),
+                context=link.get("context"),
+            ))
+    link = CompanyKeywordLinkOrm
+    touched = set(sess.scalars(select(link.date).where(link.article_url.in_(urls)).distinct()))
+    sess.execute(delete(link).where(link.article_url.in_(urls)))
+    written = bulk_upsert(sess, link, rows, index_name=COMPANY_KEYWORD_LINK_UNIQUE_INDEX)
+    update_link_aggregates(sess, touched | {row["date"] for row in rows})
+    return written
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.graph.engine import CompanyKeywordGraph
+
+
+@dataclass(frozen=True)
+class GraphAdjacency:
+    """CSR adjacency of the company and keyword nodes of a graph, built once to answer neighborhood lookups.
+
+    Node ``i`` is company ``i`` for ``i < n_companies``, then keyword ``i - n_companies``.
+    Every edge of ``graph.weights`` appears twice, once from each of its nodes.
+
+    Args:
+        graph: Graph the adjacency was built from.
+        indptr: Node ``i`` has the slots ``indptr[i]:indptr[i + 1]``.
+        neighbors: Node at the other end of every slot.
+        edges: Entry of ``graph.weights`` of every slot.
+        edge_rows: Company of every entry of ``graph.weights``.
+        ids: ISIN, ticker or keyword -> node.
+    """
+    graph: CompanyKeywordGraph
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    edges: np.ndarray
+    edge_rows: np.ndarray
+    ids: Dict[str, int]
+
+    @classmethod
+    def from_graph(cls, graph: CompanyKeywordGraph) -> "GraphAdjacency":
+        weights = graph.weights
+        n_companies, n_keywords = weights.shape
+        edge_rows = weights.row_ids()
+        # Entries grouped by keyword, in company order within a keyword.
+        by_keyword = np.argsort(weights.indices, kind="stable")
+        keyword_indptr = np.cumsum(np.bincount(weights.indices, minlength=n_keywords))
+
+        # Keywords first, so a company keeps the node of its ISIN or ticker when a keyword spells the same.
+        ids = {keyword: n_companies + i for i, keyword in enumerate(graph.keywords.tolist())}
+        for column in ("ticker", "isin"):
+            ids.update((value, i) for i, value in enumerate(graph.companies[column].tolist()) if value)
+        return cls(
+            graph=graph,
+            indptr=np.concatenate((weights.indptr, weights.nnz + keyword_indptr)),
+            neighbors=np.concatenate((n_companies + weights.indices, edge_rows[by_keyword])),
+            edges=np.concatenate((np.arange(weights.nnz), by_keyword)),
+            edge_rows=edge_rows,
+            ids=ids,
+        )
+
+    def find(self, node_id: str) -> Optional[int]:
+        """Node of a company by ISIN or ticker, or of a keyword. None when it is not part of the graph."""
+        return self.ids.get(node_id)
+
+    def _slots(self, nodes: np.ndarray) -> np.ndarray:
+        starts = self.indptr[nodes]
+        sizes = self.indptr[nodes + 1] - starts
+        offsets = np.cumsum(sizes) - sizes
+        return np.repeat(starts - offsets, sizes) + np.arange(sizes.sum())
+
+    def neighborhood(self, node: int, hops: int = 1) -> CompanyKeywordGraph:
+        """Graph of the nodes at most ``hops`` edges away from ``node`` and of the edges between them.
+
+        A breadth first search over the slots of the reached nodes only, so
+        the cost follows the size of the neighborhood rather than the graph.
+        The graph being bipartite, nodes at the same distance are never
+        linked, the edges of the nodes closer than ``hops`` are all of them.
+        """
+        visited = frontier = np.array([node], dtype=np.int64)
+        slots = []
+        for _ in range(hops):
+            frontier_slots = self._slots(frontier)
+            slots.append(frontier_slots)
+            frontier = np.setdiff1d(np.unique(self.neighbors[frontier_slots]), visited, assume_unique=True)
+            if not len(frontier):
+                break
+            visited = np.union1d(visited, frontier)
+        entries = np.unique(self.edges[np.concatenate(slots)])
+        return self.graph.select_edges(entries, self.edge_rows[entries])
@@ -0,0 +1,94 @@
+import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
+
+from src.database.models.price import DailyPriceOrm, SecurityOrm
+
+PRICE_RANGE_COLUMNS = [
+    "ticker", "isin", "name", "currency", "market", "source",
+    "date_from", "date_to", "price_from", "price_to", "price_change",
+]
+
+
+def _nearest_row(condition, order):
+    return (
+        select(DailyPriceOrm.id)
+        .where(DailyPriceOrm.ticker == SecurityOrm.ticker, condition)
+        .order_by(order)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def get_price_ranges(
+    sess: Session,
+    from_date: datetime.date,
+    to_date: datetime.date,
+    tickers: Optional[Sequence[str]] = None,
+    markets: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Start and end close of every security over ``from_date..to_date`` in one query.
+
+    The range used for a security is the shortest one with prices that
+    fully contains the query range: it starts at the last trading day on or
+    before ``from_date`` and ends at the first one on or after ``to_date``.
+    When the history does not reach that far, the closest trading day
+    inside the range is used instead. Each bound is a single seek of the
+    ``(ticker, date)`` index, so the cost grows with the number of
+    securities, not with the length of their history.
+
+    Args:
+        sess: Session to query with.
+        from_date: First day of the query range.
+        to_date: Last day of the query range.
+        tickers: Only these securities, all of them when None.
+        markets: Only the securities of these markets, all of them when None.
+
+    Returns:
+        pd.DataFrame: One row per security with prices, with the columns of
+            ``PRICE_RANGE_COLUMNS``. ``price_change`` is ``price_to / price_from``.
+    """
+    # Only the row ids are looked up per security, the rows themselves are fetched by primary key afterwards.
+    row_from = func.coalesce(
+        _nearest_row(DailyPriceOrm.date <= from_date, DailyPriceOrm.date.desc()),
+        _nearest_row(DailyPriceOrm.date >= from_date, DailyPriceOrm.date.asc()),
+    )
+    row_to = func.coalesce(
+        _nearest_row(DailyPriceOrm.date >= to_date, DailyPriceOrm.date.asc()),
+        _nearest_row(DailyPriceOrm.date <= to_date, DailyPriceOrm.date.desc()),
+    )
+    bounds = select(
+        SecurityOrm.ticker, SecurityOrm.isin, SecurityOrm.name,
+        SecurityOrm.currency, SecurityOrm.market, SecurityOrm.source,
+        row_from.label("row_from"), row_to.label("row_to"),
+    )
+    if tickers is not None:
+        bounds = bounds.where(SecurityOrm.ticker.in_(tickers))
+    if markets is not None:
+        bounds = bounds.where(SecurityOrm.market.in_(markets))
+    # MATERIALIZED keeps the planner from inlining the CTE, which would run every seek once more per join.
+    bounds = bounds.cte("bounds").prefix_with("MATERIALIZED")
+
+    start, end = aliased(DailyPriceOrm), aliased(DailyPriceOrm)
+    stmt = (
+        select(
+            bounds.c.ticker, bounds.c.isin, bounds.c.name,
+            bounds.c.currency, bounds.c.market, bounds.c.source,
+            start.date.label("date_from"), end.date.label("date_to"),
+            start.close.label("price_from"), end.close.label("price_to"),
+        )
+        .join(start, start.id == bounds.c.row_from)
+        .join(end, end.id == bounds.c.row_to)
+    )
+    result = sess.connection().execute(stmt)
+    frame = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    price_from = frame["price_from"].to_numpy(dtype=np.float64)
+    price_to = frame["price_to"].to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frame["price_change"] = np.where(price_from > 0, price_to / price_from, np.nan)
+    return frame[PRICE_RANGE_COLUMNS]
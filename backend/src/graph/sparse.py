@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SparseMatrix:
+    """Compressed sparse row matrix, the subset of ``scipy.sparse.csr_matrix`` the graph needs.
+
+    Args:
+        indptr: Row ``i`` holds the entries ``indptr[i]:indptr[i + 1]``.
+        indices: Column of every entry, sorted within a row.
+        data: Value of every entry.
+        shape: Number of rows and columns.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_triplets(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        data: np.ndarray,
+        shape: Tuple[int, int],
+    ) -> Tuple["SparseMatrix", np.ndarray]:
+        """Build the matrix from ``(row, col, value)`` triplets, summing the duplicated cells.
+
+        Returns:
+            Tuple of the matrix and the entry every triplet was summed into,
+            to aggregate other per triplet values the same way with ``np.bincount``.
+        """
+        n_rows, n_cols = shape
+        keys = rows.astype(np.int64) * n_cols + cols.astype(np.int64)
+        # Sorted unique keys are already in row major order, which is the CSR layout.
+        cells, inverse = np.unique(keys, return_inverse=True)
+        summed = np.bincount(inverse, weights=data, minlength=len(cells))
+        cell_rows = cells // n_cols
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_rows, minlength=n_rows), out=indptr[1:])
+        return cls(indptr, (cells % n_cols).astype(np.int64), summed, (n_rows, n_cols)), inverse
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def row_ids(self) -> np.ndarray:
+        """Row of every entry, the COO counterpart of ``indices``."""
+        return np.repeat(np.arange(self.shape[0], dtype=np.int64), np.diff(self.indptr))
+
+    def with_data(self, data: np.ndarray) -> "SparseMatrix":
+        """Same sparsity pattern holding ``data`` instead."""
+        return SparseMatrix(self.indptr, self.indices, data, self.shape)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """``A @ x``."""
+        return np.bincount(self.row_ids(), weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """``A.T @ y``."""
+        return np.bincount(self.indices, weights=self.data * y[self.row_ids()], minlength=self.shape[1])
+
+    def select(self, entries: np.ndarray, entry_rows: np.ndarray) -> Tuple["SparseMatrix", np.ndarray, np.ndarray]:
+        """Matrix of the entries ``entries`` only, without the rows and columns they leave empty.
+
+        Costs follow the number of entries kept rather than the size of the matrix.
+
+        Args:
+            entries: Sorted positions of the entries to keep.
+            entry_rows: Row of every kept entry, ``row_ids()[entries]``.
+
+        Returns:
+            Tuple of the matrix, then the rows and the columns of this matrix it kept, in order.
+        """
+        rows, local_rows = np.unique(entry_rows, return_inverse=True)
+        # Renumbering keeps the order of the columns, so they stay sorted within a row.
+        cols, local_cols = np.unique(self.indices[entries], return_inverse=True)
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(local_rows, minlength=len(rows)), out=indptr[1:])
+        return SparseMatrix(indptr, local_cols, self.data[entries], (len(rows), len(cols))), rows, cols
@@ -1,25 +1,219 @@
-from httpx import Client
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Optional
 
-from src.xing.constant import XING_AUTH_URL
+from httpx import AsyncClient, Client, Response
+
+from src.xing.constant import XING_AUTH_URL, XING_REST_URL
 from src.xing.schemas import XingAuthHeaders, XingAuthParams
 
+logger = logging.getLogger(__name__)
 
-def get_access_token(
-    client: Client, 
-    app_key: str | None, 
-    app_secret: str | None
-):
+DEFAULT_TOKEN_CACHE_PATH = ".xing_token_cache.sqlite"
+DEFAULT_REFRESH_MARGIN = 600
+# Used when the token response does not say how long the token lives.
+DEFAULT_EXPIRES_IN = 3600
+
+
+def _token_request(app_key: str | None, app_secret: str | None) -> dict:
     if not app_key or not app_secret:
         raise ValueError("app_key and app_secret must be provided")
-
-    response = client.post(
+    return dict(
         url=XING_AUTH_URL,
         headers=XingAuthHeaders().model_dump(by_alias=True),
         params=XingAuthParams(appkey=app_key, appsecretkey=app_secret).model_dump()
     )
 
+
+def _parse_token_response(response: Response) -> dict:
     if 'error_code' in response.json():
         raise Exception(response.json())
 
-    data = response.json()
-    return data["access_token"]
+    return response.json()
+
+
+def request_access_token(
+    client: Client,
+    app_key: str | None,
+    app_secret: str | None
+) -> dict:
+    """Issue a new token and return the whole token response, including ``expires_in``."""
+    response = client.post(**_token_request(app_key, app_secret))
+    return _parse_token_response(response)
+
+
+def get_access_token(
+    client: Client, 
+    app_key: str | None, 
+    app_secret: str | None
+):
+    return request_access_token(client, app_key, app_secret)["access_token"]
+
+
+async def async_get_access_token(
+    client: AsyncClient,
+    app_key: str | None,
+    app_secret: str | None
+):
+    response = await client.post(**_token_request(app_key, app_secret))
+    return _parse_token_response(response)["access_token"]
+
+
+class TokenManager:
+    """Cache of the Xing access token shared by every worker of a host.
+
+    The token is kept in memory and in a small sqlite file. A new token is
+    only issued when the cached one is within ``refresh_margin`` seconds of
+    its ``expires_in``. Issuance happens inside a sqlite write transaction,
+    so workers starting together wait for the first one's token instead of
+    each requesting their own.
+
+    Args:
+        app_key: Xing app key.
+        app_secret: Xing app secret.
+        cache_path: Path of the sqlite cache file, None keeps the token in memory only.
+        refresh_margin: Seconds before expiry at which the token is renewed.
+        base_url: Base URL of the REST API.
+    """
+    def __init__(
+        self,
+        app_key: str | None,
+        app_secret: str | None,
+        cache_path: Optional[str] = DEFAULT_TOKEN_CACHE_PATH,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        base_url: str = XING_REST_URL,
+    ):
+        if not app_key or not app_secret:
+            raise ValueError("app_key and app_secret must be provided")
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.cache_path = cache_path
+        self.refresh_margin = refresh_margin
+        self.base_url = base_url
+        # The cache row is keyed by a hash so the app key itself is never written to disk.
+        self._cache_key = hashlib.sha256(app_key.encode()).hexdigest()
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        # asyncio primitives belong to one event loop, they are created in the running one when first needed.
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_users = 0
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def _loop_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    def _is_fresh(self, expires_at: float) -> bool:
+        return expires_at - self.refresh_margin > time.time()
+
+    def get_token(self, rejected: Optional[str] = None) -> str:
+        """Return a valid token.
+
+        Args:
+            rejected: A token the API refused. It is replaced even if it has
+                not expired yet, unless another worker already replaced it.
+        """
+        if self._token and self._token != rejected and self._is_fresh(self._expires_at):
+            return self._token
+        if self.cache_path is None:
+            self._token, self._expires_at = self._issue()
+            return self._token
+
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock, so only one worker of the host issues a token at a time.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT access_token, expires_at FROM tokens WHERE key = ?", (self._cache_key,)
+            ).fetchone()
+            if row and row[0] != rejected and self._is_fresh(row[1]):
+                self._token, self._expires_at = row
+            else:
+                self._token, self._expires_at = self._issue()
+                conn.execute(
+                    "INSERT OR REPLACE INTO tokens (key, access_token, expires_at) VALUES (?, ?, ?)",
+                    (self._cache_key, self._token, self._expires_at),
+                )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return self._token  # type: ignore[return-value]
+
+    async def aget_token(self, rejected: Optional[str] = None) -> str:
+        """Async ``get_token``, the cache lookup and issuance run in a worker thread when needed."""
+        if self._token and self._token != rejected and self._is_fresh(self._expires_at):
+            return self._token
+        async with self._loop_lock():
+            return await asyncio.to_thread(self.get_token, rejected)
+
+    def start_background_refresh(self) -> asyncio.Task:
+        """Renew the token ``refresh_margin`` seconds before it expires, until every caller stopped it.
+
+        Every call must be paired with a ``stop_background_refresh``, the
+        task is shared by the clients of the manager and cancelled with the
+        last one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._refresh_task is None or self._refresh_task.done() or self._refresh_task.get_loop() is not loop:
+            # The task of a previous event loop died with it, so did its users.
+            self._refresh_task = loop.create_task(self._refresh_loop())
+            self._refresh_users = 0
+        self._refresh_users += 1
+        return self._refresh_task
+
+    async def stop_background_refresh(self) -> None:
+        self._refresh_users = max(self._refresh_users - 1, 0)
+        if self._refresh_task is not None and self._refresh_users == 0:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.aget_token()
+                delay = self._expires_at - self.refresh_margin - time.time()
+            except Exception as e:
+                logger.error(f"Failed to refresh the Xing access token: {e}")
+                delay = 60
+            await asyncio.sleep(max(delay, 1))
+
+    def _issue(self) -> tuple[str, float]:
+        with Client(verify=False, base_url=self.base_url) as client:
+            data = request_access_token(client, self.app_key, self.app_secret)
+        expires_in = float(data.get("expires_in") or DEFAULT_EXPIRES_IN)
+        logger.info(f"Issued a new Xing access token valid for {expires_in:.0f}s")
+        return data["access_token"], time.time() + expires_in
+
+    def _connect(self) -> sqlite3.Connection:
+        is_new = not os.path.exists(self.cache_path)  # type: ignore[arg-type]
+        conn = sqlite3.connect(self.cache_path, timeout=60, isolation_level=None)  # type: ignore[arg-type]
+        if is_new:
+            os.chmod(self.cache_path, 0o600)  # type: ignore[arg-type]
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, access_token TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        return conn
+
+
+@lru_cache(maxsize=None)
+def get_token_manager(
+    app_key: str | None,
+    app_secret: str | None,
+    cache_path: Optional[str] = DEFAULT_TOKEN_CACHE_PATH,
+    refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+) -> TokenManager:
+    """Return the process-wide ``TokenManager`` of an app key, so every client of the process shares its token."""
+    return TokenManager(app_key, app_secret, cache_path=cache_path, refresh_margin=refresh_margin)
@@ -1,16530 +0,0 @@
-# type: ignore 
-# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
-from typing import List
-
-from pydantic import BaseModel, Field
-
-
-# region <BMT - 시간대별투자자매매추이(BMT)>
-class BMTInBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-
-
-class BMTOutBlock(BaseModel):
-    tjjtime: str = Field(description="수신시간", default="")
-    tjjcode1: str = Field(description="투자자코드1(개인)", default="")
-    msvolume1: int = Field(description="매수 거래량1", default=0)
-    mdvolume1: int = Field(description="매도 거래량1", default=0)
-    msvol1: int = Field(description="거래량 순매수1", default=0)
-    msvalue1: int = Field(description="매수 거래대금1", default=0)
-    mdvalue1: int = Field(description="매도 거래대금1", default=0)
-    msval1: int = Field(description="거래대금 순매수1", default=0)
-    tjjcode2: str = Field(description="투자자코드2(외국인)", default="")
-    msvolume2: int = Field(description="매수 거래량2", default=0)
-    mdvolume2: int = Field(description="매도 거래량2", default=0)
-    msvol2: int = Field(description="거래량 순매수2", default=0)
-    msvalue2: int = Field(description="매수 거래대금2", default=0)
-    mdvalue2: int = Field(description="매도 거래대금2", default=0)
-    msval2: int = Field(description="거래대금 순매수2", default=0)
-    tjjcode3: str = Field(description="투자자코드3(기관계)", default="")
-    msvolume3: int = Field(description="매수 거래량3", default=0)
-    mdvolume3: int = Field(description="매도 거래량3", default=0)
-    msvol3: int = Field(description="거래량 순매수3", default=0)
-    msvalue3: int = Field(description="매수 거래대금3", default=0)
-    mdvalue3: int = Field(description="매도 거래대금3", default=0)
-    msval3: int = Field(description="거래대금 순매수3", default=0)
-    tjjcode4: str = Field(description="투자자코드4(증권)", default="")
-    msvolume4: int = Field(description="매수 거래량4", default=0)
-    mdvolume4: int = Field(description="매도 거래량4", default=0)
-    msvol4: int = Field(description="거래량 순매수4", default=0)
-    msvalue4: int = Field(description="매수 거래대금4", default=0)
-    mdvalue4: int = Field(description="매도 거래대금4", default=0)
-    msval4: int = Field(description="거래대금 순매수4", default=0)
-    tjjcode5: str = Field(description="투자자코드5(투신)", default="")
-    msvolume5: int = Field(description="매수 거래량5", default=0)
-    mdvolume5: int = Field(description="매도 거래량5", default=0)
-    msvol5: int = Field(description="거래량 순매수5", default=0)
-    msvalue5: int = Field(description="매수 거래대금5", default=0)
-    mdvalue5: int = Field(description="매도 거래대금5", default=0)
-    msval5: int = Field(description="거래대금 순매수5", default=0)
-    tjjcode6: str = Field(description="투자자코드6(은행)", default="")
-    msvolume6: int = Field(description="매수 거래량6", default=0)
-    mdvolume6: int = Field(description="매도 거래량6", default=0)
-    msvol6: int = Field(description="거래량 순매수6", default=0)
-    msvalue6: int = Field(description="매수 거래대금6", default=0)
-    mdvalue6: int = Field(description="매도 거래대금6", default=0)
-    msval6: int = Field(description="거래대금 순매수6", default=0)
-    tjjcode7: str = Field(description="투자자코드7(보험)", default="")
-    msvolume7: int = Field(description="매수 거래량7", default=0)
-    mdvolume7: int = Field(description="매도 거래량7", default=0)
-    msvol7: int = Field(description="거래량 순매수7", default=0)
-    msvalue7: int = Field(description="매수 거래대금7", default=0)
-    mdvalue7: int = Field(description="매도 거래대금7", default=0)
-    msval7: int = Field(description="거래대금 순매수7", default=0)
-    tjjcode8: str = Field(description="투자자코드8(종금)", default="")
-    msvolume8: int = Field(description="매수 거래량8", default=0)
-    mdvolume8: int = Field(description="매도 거래량8", default=0)
-    msvol8: int = Field(description="거래량 순매수8", default=0)
-    msvalue8: int = Field(description="매수 거래대금8", default=0)
-    mdvalue8: int = Field(description="매도 거래대금8", default=0)
-    msval8: int = Field(description="거래대금 순매수8", default=0)
-    tjjcode9: str = Field(description="투자자코드9(기금)", default="")
-    msvolume9: int = Field(description="매수 거래량9", default=0)
-    mdvolume9: int = Field(description="매도 거래량9", default=0)
-    msvol9: int = Field(description="거래량 순매수9", default=0)
-    msvalue9: int = Field(description="매수 거래대금9", default=0)
-    mdvalue9: int = Field(description="매도 거래대금9", default=0)
-    msval9: int = Field(description="거래대금 순매수9", default=0)
-    tjjcode10: str = Field(description="투자자코드10(선물업자)", default="")
-    msvolume10: int = Field(description="매수 거래량10", default=0)
-    mdvolume10: int = Field(description="매도 거래량10", default=0)
-    msvol10: int = Field(description="거래량 순매수10", default=0)
-    msvalue10: int = Field(description="매수 거래대금10", default=0)
-    mdvalue10: int = Field(description="매도 거래대금10", default=0)
-    msval10: int = Field(description="거래대금 순매수10", default=0)
-    tjjcode11: str = Field(description="투자자코드11(기타)", default="")
-    msvolume11: int = Field(description="매수 거래량11", default=0)
-    mdvolume11: int = Field(description="매도 거래량11", default=0)
-    msvol11: int = Field(description="거래량 순매수11", default=0)
-    msvalue11: int = Field(description="매수 거래대금11", default=0)
-    mdvalue11: int = Field(description="매도 거래대금11", default=0)
-    msval11: int = Field(description="거래대금 순매수11", default=0)
-    upcode: str = Field(description="업종코드", default="")
-    tjjcode0: str = Field(description="투자자코드0(사모펀드)", default="")
-    msvolume0: int = Field(description="매수 거래량0", default=0)
-    mdvolume0: int = Field(description="매도 거래량0", default=0)
-    msvol0: int = Field(description="거래량 순매수0", default=0)
-    msvalue0: int = Field(description="매수 거래대금0", default=0)
-    mdvalue0: int = Field(description="매도 거래대금0", default=0)
-    msval0: int = Field(description="거래대금 순매수0", default=0)
-
-
-# 시간대별투자자매매추이(BMT)
-class BMT(BaseModel):
-    inblock: BMTInBlock = Field(description="BMTInBlock")
-    outblock: BMTOutBlock = Field(description="BMTOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for BMT",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <C01 - 선물주문체결>
-class C01OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    seq: int = Field(description="일련번호", default=0)
-    trcode: str = Field(description="trcode", default="")
-    megrpno: str = Field(description="매칭그룹번호", default="")
-    boardid: str = Field(description="보드ID", default="")
-    memberno: str = Field(description="회원번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    ordno: str = Field(description="주문번호", default="")
-    ordordno: str = Field(description="원주문번호", default="")
-    expcode: str = Field(description="종목코드", default="")
-    yakseq: str = Field(description="약정번호", default="")
-    cheprice: float = Field(description="체결가격", default=0.0)
-    chevol: int = Field(description="체결수량", default=0)
-    sessionid: str = Field(description="세션ID", default="")
-    chedate: str = Field(description="체결일자", default="")
-    chetime: str = Field(description="체결시각", default="")
-    spdprc1: float = Field(description="최근월체결가격", default=0.0)
-    spdprc2: float = Field(description="차근월체결가격", default=0.0)
-    dosugb: str = Field(description="매도수구분", default="")
-    accno1: str = Field(description="계좌번호1", default="")
-    sihogagb: str = Field(description="시장조성호가구분", default="")
-    jakino: str = Field(description="위탁사번호", default="")
-    daeyong: str = Field(description="대용주권계좌번호", default="")
-    mem_filler: str = Field(description="mem_filler", default="")
-    mem_accno: str = Field(description="mem_accno", default="")
-    mem_filler1: str = Field(description="mem_filler1", default="")
-
-
-# 선물주문체결
-class C01(BaseModel):
-    outblock: C01OutBlock = Field(description="C01OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for C01",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CD0 - 상품선물실시간상하한가(D0)>
-class CD0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class CD0OutBlock(BaseModel):
-    gubun: str = Field(description="접속매매여부", default="")
-    dy_gubun: str = Field(description="실시간가격제한여부", default="")
-    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
-    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# 상품선물실시간상하한가(D0)
-class CD0(BaseModel):
-    inblock: CD0InBlock = Field(description="CD0InBlock")
-    outblock: CD0OutBlock = Field(description="CD0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for CD0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CDPCQ04700 - 계좌 거래내역>
-class CDPCQ04700InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTp: str = Field(description="조회구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    SrtNo: int = Field(description="시작번호", default=0)
-    PdptnCode: str = Field(description="상품유형코드", default="")
-    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-
-
-class CDPCQ04700OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTp: str = Field(description="조회구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    SrtNo: int = Field(description="시작번호", default=0)
-    PdptnCode: str = Field(description="상품유형코드", default="")
-    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-
-
-class CDPCQ04700OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-
-
-class CDPCQ04700OutBlock3(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-    TrdNo: int = Field(description="거래번호", default=0)
-    TpCodeNm: str = Field(description="구분코드명", default="")
-    SmryNo: str = Field(description="적요번호", default="")
-    SmryNm: str = Field(description="적요명", default="")
-    CancTpNm: str = Field(description="취소구분", default="")
-    TrdQty: int = Field(description="거래수량", default=0)
-    Trtax: int = Field(description="거래세", default=0)
-    FcurrAdjstAmt: float = Field(description="외화정산금액", default=0.0)
-    AdjstAmt: int = Field(description="정산금액", default=0)
-    OvdSum: int = Field(description="연체합", default=0)
-    DpsBfbalAmt: int = Field(description="예수금전잔금액", default=0)
-    SellPldgRfundAmt: int = Field(description="매도담보상환금", default=0)
-    DpspdgLoanBfbalAmt: int = Field(description="예탁담보대출전잔금액", default=0)
-    TrdmdaNm: str = Field(description="거래매체명", default="")
-    OrgTrdNo: int = Field(description="원거래번호", default=0)
-    IsuNm: str = Field(description="종목명", default="")
-    TrdUprc: float = Field(description="거래단가", default=0.0)
-    CmsnAmt: int = Field(description="수수료", default=0)
-    FcurrCmsnAmt: float = Field(description="외화수수료금액", default=0.0)
-    RfundDiffAmt: int = Field(description="상환차이금액", default=0)
-    RepayAmtSum: int = Field(description="변제금합계", default=0)
-    SecCrbalQty: int = Field(description="유가증권금잔수량", default=0)
-    CslLoanRfundIntrstAmt: int = Field(description="매도대금담보대출상환이자금액", default=0)
-    DpspdgLoanCrbalAmt: int = Field(description="예탁담보대출금잔금액", default=0)
-    TrxTime: str = Field(description="처리시각", default="")
-    Inouno: int = Field(description="출납번호", default=0)
-    IsuNo: str = Field(description="종목번호", default="")
-    TrdAmt: int = Field(description="거래금액", default=0)
-    ChckAmt: int = Field(description="수표금액", default=0)
-    TaxSumAmt: int = Field(description="세금합계금액", default=0)
-    FcurrTaxSumAmt: float = Field(description="외화세금합계금액", default=0.0)
-    IntrstUtlfee: int = Field(description="이자이용료", default=0)
-    MnyDvdAmt: int = Field(description="배당금액", default=0)
-    RcvblOcrAmt: int = Field(description="미수발생금액", default=0)
-    TrxBrnNo: str = Field(description="처리지점번호", default="")
-    TrxBrnNm: str = Field(description="처리지점명", default="")
-    DpspdgLoanAmt: int = Field(description="예탁담보대출금액", default=0)
-    DpspdgLoanRfundAmt: int = Field(description="예탁담보대출상환금액", default=0)
-    BasePrc: float = Field(description="기준가", default=0.0)
-    DpsCrbalAmt: int = Field(description="예수금금잔금액", default=0)
-    BoaAmt: int = Field(description="과표", default=0)
-    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
-    BcrLoanOcrAmt: int = Field(description="수익증권담보대출발생금", default=0)
-    BcrLoanBfbalAmt: int = Field(description="수익증권담보대출전잔금", default=0)
-    BnsBasePrc: float = Field(description="매매기준가", default=0.0)
-    TaxchrBasePrc: float = Field(description="과세기준가", default=0.0)
-    TrdUnit: int = Field(description="거래좌수", default=0)
-    BalUnit: int = Field(description="잔고좌수", default=0)
-    EvrTax: int = Field(description="제세금", default=0)
-    EvalAmt: int = Field(description="평가금액", default=0)
-    BcrLoanRfundAmt: int = Field(description="수익증권담보대출상환금", default=0)
-    BcrLoanCrbalAmt: int = Field(description="수익증권담보대출금잔금", default=0)
-    AddMgnOcrTotamt: int = Field(description="추가증거금발생총액", default=0)
-    AddMnyMgnOcrAmt: int = Field(description="추가현금증거금발생금액", default=0)
-    AddMgnDfryTotamt: int = Field(description="추가증거금납부총액", default=0)
-    AddMnyMgnDfryAmt: int = Field(description="추가현금증거금납부금액", default=0)
-    BnsplAmt: int = Field(description="매매손익금액", default=0)
-    Ictax: int = Field(description="소득세", default=0)
-    Ihtax: int = Field(description="주민세", default=0)
-    LoanDt: str = Field(description="대출일", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-    FcurrAmt: float = Field(description="외화금액", default=0.0)
-    FcurrTrdAmt: float = Field(description="외화거래금액", default=0.0)
-    FcurrDps: float = Field(description="외화예수금", default=0.0)
-    FcurrDpsBfbalAmt: float = Field(description="외화예수금전잔금액", default=0.0)
-    OppAcntNm: str = Field(description="상대계좌명", default="")
-    OppAcntNo: str = Field(description="상대계좌번호", default="")
-    LoanRfundAmt: int = Field(description="대출상환금액", default=0)
-    LoanIntrstAmt: int = Field(description="대출이자금액", default=0)
-    AskpsnNm: str = Field(description="의뢰인명", default="")
-    OrdDt: str = Field(description="주문일자", default="")
-    TrdXchrat: float = Field(description="거래환율", default=0.0)
-    RdctCmsn: float = Field(description="감면수수료", default=0.0)
-    FcurrStmpTx: float = Field(description="외화인지세", default=0.0)
-    FcurrElecfnTrtax: float = Field(description="외화전자금융거래세", default=0.0)
-    FcstckTrtax: float = Field(description="외화증권거래세", default=0.0)
-
-
-class CDPCQ04700OutBlock4(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    PnlSumAmt: int = Field(description="손익합계금액", default=0)
-    CtrctAsm: int = Field(description="약정누계", default=0)
-    CmsnAmtSumAmt: int = Field(description="수수료합계금액", default=0)
-
-
-class CDPCQ04700OutBlock5(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    MnyinAmt: int = Field(description="입금금액", default=0)
-    SecinAmt: int = Field(description="입고금액", default=0)
-    MnyoutAmt: int = Field(description="출금금액", default=0)
-    SecoutAmt: int = Field(description="출고금액", default=0)
-    DiffAmt: int = Field(description="차이금액", default=0)
-    DiffAmt0: int = Field(description="차이금액0", default=0)
-    SellQty: int = Field(description="매도수량", default=0)
-    SellAmt: int = Field(description="매도금액", default=0)
-    SellCmsn: int = Field(description="매도수수료", default=0)
-    EvrTax: int = Field(description="제세금", default=0)
-    FcurrSellAdjstAmt: float = Field(description="외화매도정산금액", default=0.0)
-    BuyQty: int = Field(description="매수수량", default=0)
-    BuyAmt: int = Field(description="매수금액", default=0)
-    BuyCmsn: int = Field(description="매수수수료", default=0)
-    ExecTax: int = Field(description="체결세금", default=0)
-    FcurrBuyAdjstAmt: float = Field(description="외화매수정산금액", default=0.0)
-
-
-# 계좌 거래내역
-class CDPCQ04700(BaseModel):
-    inblock1: CDPCQ04700InBlock1 = Field(description="CDPCQ04700InBlock1")
-    outblock1: CDPCQ04700OutBlock1 = Field(description="CDPCQ04700OutBlock1")
-    outblock2: CDPCQ04700OutBlock2 = Field(description="CDPCQ04700OutBlock2")
-    outblock3: List[CDPCQ04700OutBlock3] = Field(description="CDPCQ04700OutBlock3")
-    outblock4: CDPCQ04700OutBlock4 = Field(description="CDPCQ04700OutBlock4")
-    outblock5: CDPCQ04700OutBlock5 = Field(description="CDPCQ04700OutBlock5")
-    metadata: dict = Field(
-        description="The metadata information for CDPCQ04700",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAQ21100 - 유렉스 주문체결내역조회>
-class CEXAQ21100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
-    AcntNo: str = Field(description="지점번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-
-
-class CEXAQ21100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
-    AcntNo: str = Field(description="지점번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-
-
-class CEXAQ21100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    ExecQty: int = Field(description="체결수량", default=0)
-
-
-class CEXAQ21100OutBlock3(BaseModel):
-    AcntNo1: str = Field(description="계좌번호1", default="")
-    OrdDt: str = Field(description="주문일", default="")
-    OrdNo: int = Field(description="주문번호", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    MrcTpNm: str = Field(description="정정취소구분명", default="")
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-    FnoOrdprcPtnNm: str = Field(description="선물옵션호가유형명", default="")
-    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdTpNm: str = Field(description="주문구분명", default="")
-    ExecPrc: float = Field(description="체결가", default=0.0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    CommdaNm: str = Field(description="통신매체명", default="")
-
-
-# 유렉스 주문체결내역조회
-class CEXAQ21100(BaseModel):
-    inblock1: CEXAQ21100InBlock1 = Field(description="CEXAQ21100InBlock1")
-    outblock1: CEXAQ21100OutBlock1 = Field(description="CEXAQ21100OutBlock1")
-    outblock2: CEXAQ21100OutBlock2 = Field(description="CEXAQ21100OutBlock2")
-    outblock3: List[CEXAQ21100OutBlock3] = Field(description="CEXAQ21100OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CEXAQ21100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAQ21200 - 유렉스 주문가능 수량/금액 조회>
-class CEXAQ21200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    RatVal: float = Field(description="비율값", default=0.0)
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-
-
-class CEXAQ21200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    RatVal: float = Field(description="비율값", default=0.0)
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-
-
-class CEXAQ21200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    QryDt: str = Field(description="조회일", default="")
-    NowPrc: float = Field(description="현재가", default=0.0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-    NewOrdAbleQty: int = Field(description="신규주문가능수량", default=0)
-    LqdtOrdAbleQty: int = Field(description="청산주문가능수량", default=0)
-    UsePreargMgn: int = Field(description="사용예정증거금액", default=0)
-    UsePreargMnyMgn: int = Field(description="사용예정현금증거금액", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-
-
-# 유렉스 주문가능 수량/금액 조회
-class CEXAQ21200(BaseModel):
-    inblock1: CEXAQ21200InBlock1 = Field(description="CEXAQ21200InBlock1")
-    outblock1: CEXAQ21200OutBlock1 = Field(description="CEXAQ21200OutBlock1")
-    outblock2: CEXAQ21200OutBlock2 = Field(description="CEXAQ21200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CEXAQ21200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAQ31100 - 유렉스 야간장잔고및 평가현황>
-class CEXAQ31100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuCode: str = Field(description="종목코드", default="")
-    BalEvalTp: str = Field(description="잔고평가구분", default="")
-    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
-
-
-class CEXAQ31100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuCode: str = Field(description="종목코드", default="")
-    BalEvalTp: str = Field(description="잔고평가구분", default="")
-    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
-
-
-class CEXAQ31100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    BnsplAmt: int = Field(description="매매손익금액", default=0)
-    AdjstDfamt: int = Field(description="정산차금", default=0)
-    TotEvalAmt: int = Field(description="총평가금액", default=0)
-    TotPnlAmt: int = Field(description="총손익금액", default=0)
-
-
-class CEXAQ31100OutBlock3(BaseModel):
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    UnsttQty: int = Field(description="미결제수량", default=0)
-    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
-    FnoAvrPrc: float = Field(description="평균가", default=0.0)
-    BasePrc: float = Field(description="기준가", default=0.0)
-    NowPrc: float = Field(description="현재가", default=0.0)
-    CmpPrc: float = Field(description="대비가", default=0.0)
-    EvalAmt: int = Field(description="평가금액", default=0)
-    EvalPnl: int = Field(description="평가손익", default=0)
-    PnlRat: float = Field(description="손익률", default=0.0)
-    UnsttAmt: int = Field(description="미결제금액", default=0)
-    BnsplAmt: int = Field(description="매매손익금액", default=0)
-
-
-# 유렉스 야간장잔고및 평가현황
-class CEXAQ31100(BaseModel):
-    inblock1: CEXAQ31100InBlock1 = Field(description="CEXAQ31100InBlock1")
-    outblock1: CEXAQ31100OutBlock1 = Field(description="CEXAQ31100OutBlock1")
-    outblock2: CEXAQ31100OutBlock2 = Field(description="CEXAQ31100OutBlock2")
-    outblock3: List[CEXAQ31100OutBlock3] = Field(description="CEXAQ31100OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CEXAQ31100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAQ31200 - 유렉스 예탁금 및 통합잔고조회>
-class CEXAQ31200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    BalEvalTp: str = Field(description="잔고평가구분", default="")
-    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
-
-
-class CEXAQ31200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    BalEvalTp: str = Field(description="잔고평가구분", default="")
-    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
-
-
-class CEXAQ31200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    EvalDpsamtTotamt: int = Field(description="평가예탁금총액", default=0)
-    MnyEvalDpstgAmt: int = Field(description="현금평가예탁금액", default=0)
-    DpsamtTotamt: int = Field(description="예탁금총액", default=0)
-    DpstgMny: int = Field(description="예탁현금", default=0)
-    PsnOutAbleTotAmt: int = Field(description="인출가능총금액", default=0)
-    PsnOutAbleCurAmt: int = Field(description="인출가능현금액", default=0)
-    OrdAbleTotAmt: int = Field(description="주문가능총금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    CsgnMgnTotamt: int = Field(description="위탁증거금총액", default=0)
-    MnyCsgnMgn: int = Field(description="현금위탁증거금액", default=0)
-    AddMgnTotamt: int = Field(description="추가증거금총액", default=0)
-    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
-    CmsnAmt: int = Field(description="수수료", default=0)
-    FutsEvalPnlAmt: int = Field(description="선물평가손익금액", default=0)
-    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
-    OptEvalAmt: int = Field(description="옵션평가금액", default=0)
-    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
-    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
-    TotPnlAmt: int = Field(description="총손익금액", default=0)
-    NetPnlAmt: int = Field(description="순손익금액", default=0)
-    TotEvalAmt: int = Field(description="총평가금액", default=0)
-    MnyinAmt: int = Field(description="입금금액", default=0)
-    MnyoutAmt: int = Field(description="출금금액", default=0)
-    FutsCmsnAmt: int = Field(description="선물수수료금액", default=0)
-
-
-class CEXAQ31200OutBlock3(BaseModel):
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    UnsttQty: int = Field(description="미결제수량", default=0)
-    FnoAvrPrc: float = Field(description="평균가", default=0.0)
-    NowPrc: float = Field(description="현재가", default=0.0)
-    CmpPrc: float = Field(description="대비가", default=0.0)
-    EvalPnl: int = Field(description="평가손익", default=0)
-    PnlRat: float = Field(description="손익률", default=0.0)
-    EvalAmt: int = Field(description="평가금액", default=0)
-    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
-
-
-# 유렉스 예탁금 및 통합잔고조회
-class CEXAQ31200(BaseModel):
-    inblock1: CEXAQ31200InBlock1 = Field(description="CEXAQ31200InBlock1")
-    outblock1: CEXAQ31200OutBlock1 = Field(description="CEXAQ31200OutBlock1")
-    outblock2: CEXAQ31200OutBlock2 = Field(description="CEXAQ31200OutBlock2")
-    outblock3: List[CEXAQ31200OutBlock3] = Field(description="CEXAQ31200OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CEXAQ31200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAQ44200 - EUREX 야간옵션 기간주문체결조회>
-class CEXAQ44200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
-    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-
-
-class CEXAQ44200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
-    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-
-
-class CEXAQ44200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    ExecPrc: float = Field(description="체결가", default=0.0)
-
-
-class CEXAQ44200OutBlock3(BaseModel):
-    AcntNo1: str = Field(description="계좌번호1", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    OrdDt: str = Field(description="주문일", default="")
-    OrdNo: int = Field(description="주문번호", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    ErxOrdprcTpCode: str = Field(description="유렉스호가구분코드", default="")
-    MrcTpNm: str = Field(description="정정취소구분명", default="")
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-    CodeNm: str = Field(description="코드명", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    FnoRjtRsnCode: str = Field(description="선물옵션거부사유코드", default="")
-    OrdTpNm: str = Field(description="주문구분명", default="")
-    ExecTpNm: str = Field(description="체결구분명", default="")
-    ExecPrc: float = Field(description="체결가", default=0.0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    ExecTime: str = Field(description="체결시각", default="")
-    ExecNo: int = Field(description="체결번호", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    UserId: str = Field(description="사용자ID", default="")
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    CommdaCodeNm: str = Field(description="통신매체코드명", default="")
-    IpAddr: str = Field(description="IP주소", default="")
-    TrdPtnTpNm: str = Field(description="거래유형구분", default="")
-    ErxOrdStatCode: str = Field(description="유렉스주문상태코드", default="")
-    CodeNm0: str = Field(description="코드명0", default="")
-    ExchRcptTime: str = Field(description="거래소접수시각", default="")
-
-
-# EUREX 야간옵션 기간주문체결조회
-class CEXAQ44200(BaseModel):
-    inblock1: CEXAQ44200InBlock1 = Field(description="CEXAQ44200InBlock1")
-    outblock1: CEXAQ44200OutBlock1 = Field(description="CEXAQ44200OutBlock1")
-    outblock2: CEXAQ44200OutBlock2 = Field(description="CEXAQ44200OutBlock2")
-    outblock3: List[CEXAQ44200OutBlock3] = Field(description="CEXAQ44200OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CEXAQ44200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAT11100 - 유렉스 매수/매도주문>
-class CEXAT11100InBlock1(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-
-
-class CEXAT11100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CEXAT11100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 유렉스 매수/매도주문
-class CEXAT11100(BaseModel):
-    inblock1: CEXAT11100InBlock1 = Field(description="CEXAT11100InBlock1")
-    outblock1: CEXAT11100OutBlock1 = Field(description="CEXAT11100OutBlock1")
-    outblock2: CEXAT11100OutBlock2 = Field(description="CEXAT11100OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CEXAT11100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAT11200 - 유렉스 정정주문>
-class CEXAT11200InBlock1(BaseModel):
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-
-
-class CEXAT11200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    MdfyQty: int = Field(description="정정수량", default=0)
-    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CEXAT11200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금액", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 유렉스 정정주문
-class CEXAT11200(BaseModel):
-    inblock1: CEXAT11200InBlock1 = Field(description="CEXAT11200InBlock1")
-    outblock1: CEXAT11200OutBlock1 = Field(description="CEXAT11200OutBlock1")
-    outblock2: CEXAT11200OutBlock2 = Field(description="CEXAT11200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CEXAT11200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CEXAT11300 - 유렉스 취소주문>
-class CEXAT11300InBlock1(BaseModel):
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-
-
-class CEXAT11300OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    CancQty: int = Field(description="취소수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CEXAT11300OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금액", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 유렉스 취소주문
-class CEXAT11300(BaseModel):
-    inblock1: CEXAT11300InBlock1 = Field(description="CEXAT11300InBlock1")
-    outblock1: CEXAT11300OutBlock1 = Field(description="CEXAT11300OutBlock1")
-    outblock2: CEXAT11300OutBlock2 = Field(description="CEXAT11300OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CEXAT11300",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOAQ00600 - 선물옵션 계좌주문체결내역조회>
-class CFOAQ00600InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    FnoClssCode: str = Field(description="선물옵션분류코드", default="")
-    PrdgrpCode: str = Field(description="상품군코드", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CFOAQ00600OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    FnoClssCode: str = Field(description="선물옵션분류코드", default="")
-    PrdgrpCode: str = Field(description="상품군코드", default="")
-    PrdtExecTpCode: str = Field(description="체결구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CFOAQ00600OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    FutsOrdQty: int = Field(description="선물주문수량", default=0)
-    FutsExecQty: int = Field(description="선물체결수량", default=0)
-    OptOrdQty: int = Field(description="옵션주문수량", default=0)
-    OptExecQty: int = Field(description="옵션체결수량", default=0)
-
-
-class CFOAQ00600OutBlock3(BaseModel):
-    OrdDt: str = Field(description="주문일", default="")
-    OrdNo: int = Field(description="주문번호", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    MrcTpNm: str = Field(description="정정취소구분명", default="")
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-    FnoOrdprcPtnNm: str = Field(description="선물옵션호가유형명", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdTpNm: str = Field(description="주문구분명", default="")
-    ExecTpNm: str = Field(description="체결구분명", default="")
-    ExecPrc: float = Field(description="체결가", default=0.0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    CtrctTime: str = Field(description="약정시각", default="")
-    CtrctNo: int = Field(description="약정번호", default=0)
-    ExecNo: int = Field(description="체결번호", default=0)
-    BnsplAmt: int = Field(description="매매손익금액", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    UserId: str = Field(description="사용자ID", default="")
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    CommdaCodeNm: str = Field(description="통신매체코드명", default="")
-
-
-# 선물옵션 계좌주문체결내역조회
-class CFOAQ00600(BaseModel):
-    inblock1: CFOAQ00600InBlock1 = Field(description="CFOAQ00600InBlock1")
-    outblock1: CFOAQ00600OutBlock1 = Field(description="CFOAQ00600OutBlock1")
-    outblock2: CFOAQ00600OutBlock2 = Field(description="CFOAQ00600OutBlock2")
-    outblock3: List[CFOAQ00600OutBlock3] = Field(description="CFOAQ00600OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CFOAQ00600",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOAQ10100 - 선물옵션 주문가능수량조회>
-class CFOAQ10100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    RatVal: float = Field(description="비율값", default=0.0)
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-
-
-class CFOAQ10100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    RatVal: float = Field(description="비율값", default=0.0)
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-
-
-class CFOAQ10100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    QryDt: str = Field(description="조회일", default="")
-    FnoNowPrc: float = Field(description="선물옵션현재가", default=0.0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-    NewOrdAbleQty: int = Field(description="신규주문가능수량", default=0)
-    LqdtOrdAbleQty: int = Field(description="청산주문가능수량", default=0)
-    UsePreargMgn: int = Field(description="사용예정증거금액", default=0)
-    UsePreargMnyMgn: int = Field(description="사용예정현금증거금액", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-
-
-# 선물옵션 주문가능수량조회
-class CFOAQ10100(BaseModel):
-    inblock1: CFOAQ10100InBlock1 = Field(description="CFOAQ10100InBlock1")
-    outblock1: CFOAQ10100OutBlock1 = Field(description="CFOAQ10100OutBlock1")
-    outblock2: CFOAQ10100OutBlock2 = Field(description="CFOAQ10100OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOAQ10100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOAT00100 - 선물옵션 정상주문>
-class CFOAT00100InBlock1(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-
-
-class CFOAT00100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    FnoOrdPtnCode: str = Field(description="선물옵션주문유형코드", default="")
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    DscusBnsCmpltTime: str = Field(description="협의매매완료시각", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    OrdSeqno: int = Field(description="주문일련번호", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="항목번호", default=0)
-    OpDrtnNo: str = Field(description="운용지시번호", default="")
-    MgempNo: str = Field(description="관리사원번호", default="")
-    FundId: str = Field(description="펀드ID", default="")
-    FundOrdNo: int = Field(description="펀드주문번호", default=0)
-
-
-class CFOAT00100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 선물옵션 정상주문
-class CFOAT00100(BaseModel):
-    inblock1: CFOAT00100InBlock1 = Field(description="CFOAT00100InBlock1")
-    outblock1: CFOAT00100OutBlock1 = Field(description="CFOAT00100OutBlock1")
-    outblock2: CFOAT00100OutBlock2 = Field(description="CFOAT00100OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOAT00100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOAT00200 - 선물옵션 정정주문>
-class CFOAT00200InBlock1(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    MdfyQty: int = Field(description="정정수량", default=0)
-
-
-class CFOAT00200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    FnoOrdPtnCode: str = Field(description="선물옵션주문유형코드", default="")
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
-    FnoOrdPrc: float = Field(description="선물옵션주문가격", default=0.0)
-    MdfyQty: int = Field(description="정정수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    DscusBnsCmpltTime: str = Field(description="협의매매완료시각", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    OrdSeqno: int = Field(description="주문일련번호", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="아이템번호", default=0)
-    MgempNo: str = Field(description="관리사원번호", default="")
-    FundId: str = Field(description="펀드ID", default="")
-    FundOrgOrdNo: int = Field(description="펀드원주문번호", default=0)
-    FundOrdNo: int = Field(description="펀드주문번호", default=0)
-
-
-class CFOAT00200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금액", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 선물옵션 정정주문
-class CFOAT00200(BaseModel):
-    inblock1: CFOAT00200InBlock1 = Field(description="CFOAT00200InBlock1")
-    outblock1: CFOAT00200OutBlock1 = Field(description="CFOAT00200OutBlock1")
-    outblock2: CFOAT00200OutBlock2 = Field(description="CFOAT00200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOAT00200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOAT00300 - 선물옵션 취소주문>
-class CFOAT00300InBlock1(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    CancQty: int = Field(description="취소수량", default=0)
-
-
-class CFOAT00300OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    FnoOrdPtnCode: str = Field(description="선물옵션주문유형코드", default="")
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    CancQty: int = Field(description="취소수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    DscusBnsCmpltTime: str = Field(description="협의매매완료시각", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    OrdSeqno: int = Field(description="주문일련번호", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="아이템번호", default=0)
-    MgempNo: str = Field(description="관리사원번호", default="")
-    FundId: str = Field(description="펀드ID", default="")
-    FundOrgOrdNo: int = Field(description="펀드원주문번호", default=0)
-    FundOrdNo: int = Field(description="펀드주문번호", default=0)
-
-
-class CFOAT00300OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdMgn: int = Field(description="주문증거금액", default=0)
-    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 선물옵션 취소주문
-class CFOAT00300(BaseModel):
-    inblock1: CFOAT00300InBlock1 = Field(description="CFOAT00300InBlock1")
-    outblock1: CFOAT00300OutBlock1 = Field(description="CFOAT00300OutBlock1")
-    outblock2: CFOAT00300OutBlock2 = Field(description="CFOAT00300OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOAT00300",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOBQ10500 - 선물옵션 계좌예탁금증거금조회>
-class CFOBQ10500InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-
-
-class CFOBQ10500OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-
-
-class CFOBQ10500OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    DpsamtTotamt: int = Field(description="예탁금총액", default=0)
-    Dps: int = Field(description="예수금", default=0)
-    SubstAmt: int = Field(description="대용금액", default=0)
-    FilupDpsamtTotamt: int = Field(description="충당예탁금총액", default=0)
-    FilupDps: int = Field(description="충당예수금", default=0)
-    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
-    WthdwAbleAmt: int = Field(description="인출가능금액", default=0)
-    PsnOutAbleCurAmt: int = Field(description="인출가능현금액", default=0)
-    PsnOutAbleSubstAmt: int = Field(description="인출가능대용금액", default=0)
-    Mgn: int = Field(description="증거금액", default=0)
-    MnyMgn: int = Field(description="현금증거금액", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    AddMgn: int = Field(description="추가증거금액", default=0)
-    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
-    AmtPrdayChckInAmt: int = Field(description="금전일수표입금액", default=0)
-    FnoPrdaySubstSellAmt: int = Field(description="선물옵션전일대용매도금액", default=0)
-    FnoCrdaySubstSellAmt: int = Field(description="선물옵션금일대용매도금액", default=0)
-    FnoPrdayFdamt: int = Field(description="선물옵션전일가입금액", default=0)
-    FnoCrdayFdamt: int = Field(description="선물옵션금일가입금액", default=0)
-    FcurrSubstAmt: int = Field(description="외화대용금액", default=0)
-    FnoAcntAfmgnNm: str = Field(description="선물옵션계좌사후증거금명", default="")
-
-
-class CFOBQ10500OutBlock3(BaseModel):
-    PdGrpCodeNm: str = Field(description="상품군코드명", default="")
-    NetRiskMgn: int = Field(description="순위험증거금액", default=0)
-    PrcMgn: int = Field(description="가격증거금액", default=0)
-    SprdMgn: int = Field(description="스프레드증거금액", default=0)
-    PrcFlctMgn: int = Field(description="가격변동증거금액", default=0)
-    MinMgn: int = Field(description="최소증거금액", default=0)
-    OrdMgn: int = Field(description="주문증거금액", default=0)
-    OptNetBuyAmt: int = Field(description="옵션순매수금액", default=0)
-    CsgnMgn: int = Field(description="위탁증거금액", default=0)
-    MaintMgn: int = Field(description="유지증거금액", default=0)
-    FutsBuyExecAmt: int = Field(description="선물매수체결금액", default=0)
-    FutsSellExecAmt: int = Field(description="선물매도체결금액", default=0)
-    OptBuyExecAmt: int = Field(description="옵션매수체결금액", default=0)
-    OptSellExecAmt: int = Field(description="옵션매도체결금액", default=0)
-    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
-    TotRiskCsgnMgn: int = Field(description="총위험위탁증거금", default=0)
-    UndCsgnMgn: int = Field(description="인수도위탁증거금", default=0)
-    MgnRdctAmt: int = Field(description="증거금감면금액", default=0)
-
-
-# 선물옵션 계좌예탁금증거금조회
-class CFOBQ10500(BaseModel):
-    inblock1: CFOBQ10500InBlock1 = Field(description="CFOBQ10500InBlock1")
-    outblock1: CFOBQ10500OutBlock1 = Field(description="CFOBQ10500OutBlock1")
-    outblock2: CFOBQ10500OutBlock2 = Field(description="CFOBQ10500OutBlock2")
-    outblock3: List[CFOBQ10500OutBlock3] = Field(description="CFOBQ10500OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CFOBQ10500",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOBQ10800 - 선물옵션 옵션매도시 주문증거금조회>
-class CFOBQ10800InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
-    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    SettWklyCnt: str = Field(description="결제주간수", default="")
-    SpclDtPtnCode: str = Field(description="특별일자유형코드", default="")
-
-
-class CFOBQ10800OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
-    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    SettWklyCnt: str = Field(description="결제주간수", default="")
-    SpclDtPtnCode: str = Field(description="특별일자유형코드", default="")
-
-
-class CFOBQ10800OutBlock2(BaseModel):
-    ElwXrcPrc: float = Field(description="행사가", default=0.0)
-    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
-    HanglIsuNm1: str = Field(description="한글종목명1", default="")
-    TpNm1: str = Field(description="구분명1", default="")
-    UpOptRegulThrprc: float = Field(description="상승옵션조정이론가", default=0.0)
-    Thrprc1: float = Field(description="이론가1", default=0.0)
-    BasePrc1: float = Field(description="기준가1", default=0.0)
-    OrdMgn1: int = Field(description="주문증거금액1", default=0)
-    FnoIsuNo0: str = Field(description="선물옵션종목번호0", default="")
-    HanglIsuNm2: str = Field(description="한글종목명2", default="")
-    TpNm2: str = Field(description="구분명2", default="")
-    DownOptRegulThrprc: float = Field(description="하락옵션조정이론가", default=0.0)
-    Thrprc2: float = Field(description="이론가2", default=0.0)
-    BasePrc2: float = Field(description="기준가2", default=0.0)
-    OrdMgn2: int = Field(description="주문증거금액2", default=0)
-
-
-# 선물옵션 옵션매도시 주문증거금조회
-class CFOBQ10800(BaseModel):
-    inblock1: CFOBQ10800InBlock1 = Field(description="CFOBQ10800InBlock1")
-    outblock1: CFOBQ10800OutBlock1 = Field(description="CFOBQ10800OutBlock1")
-    outblock2: List[CFOBQ10800OutBlock2] = Field(description="CFOBQ10800OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOBQ10800",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOEQ11100 - 선물옵션가정산예탁금상세>
-class CFOEQ11100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BnsDt: str = Field(description="매매일", default="")
-
-
-class CFOEQ11100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BnsDt: str = Field(description="매매일", default="")
-
-
-class CFOEQ11100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    OpnmkDpsamtTotamt: int = Field(description="개장시예탁금총액", default=0)
-    OpnmkDps: int = Field(description="개장시예수금", default=0)
-    OpnmkMnyrclAmt: int = Field(description="개장시현금미수금", default=0)
-    OpnmkSubstAmt: int = Field(description="개장시대용금액", default=0)
-    TotAmt: int = Field(description="총금액", default=0)
-    Dps: int = Field(description="예수금", default=0)
-    MnyrclAmt: int = Field(description="현금미수금액", default=0)
-    SubstDsgnAmt: int = Field(description="대용지정금액", default=0)
-    CsgnMgn: int = Field(description="위탁증거금액", default=0)
-    MnyCsgnMgn: int = Field(description="현금위탁증거금액", default=0)
-    MaintMgn: int = Field(description="유지증거금액", default=0)
-    MnyMaintMgn: int = Field(description="현금유지증거금액", default=0)
-    OutAbleAmt: int = Field(description="출금가능총액", default=0)
-    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
-    SubstOutAbleAmt: int = Field(description="출금가능대용", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    AddMgnOcrTpCode: str = Field(description="추가증거금구분", default="")
-    AddMgn: int = Field(description="추가증거금액", default=0)
-    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
-    NtdayTotAmt: int = Field(description="익일예탁총액", default=0)
-    NtdayDps: int = Field(description="익일예탁현금", default=0)
-    NtdayMnyrclAmt: int = Field(description="익일미수금", default=0)
-    NtdaySubstAmt: int = Field(description="익일예탁대용", default=0)
-    NtdayCsgnMgn: int = Field(description="익일위탁증거금", default=0)
-    NtdayMnyCsgnMgn: int = Field(description="익일위탁증거금현금", default=0)
-    NtdayMaintMgn: int = Field(description="익일유지증거금", default=0)
-    NtdayMnyMaintMgn: int = Field(description="익일유지증거금현금", default=0)
-    NtdayOutAbleAmt: int = Field(description="익일인출가능금액", default=0)
-    NtdayMnyoutAbleAmt: int = Field(description="익일인출가능금액", default=0)
-    NtdaySubstOutAbleAmt: int = Field(description="익일인출가능대용", default=0)
-    NtdayOrdAbleAmt: int = Field(description="익일주문가능금액", default=0)
-    NtdayMnyOrdAbleAmt: int = Field(description="익일주문가능현금", default=0)
-    NtdayAddMgnTp: str = Field(description="익일추가증거금구분", default="")
-    NtdayAddMgn: int = Field(description="익일추가증거금", default=0)
-    NtdayMnyAddMgn: int = Field(description="익일추가증거금현금", default=0)
-    NtdaySettAmt: int = Field(description="익일결제금액", default=0)
-    EvalDpsamtTotamt: int = Field(description="평가예탁금총액", default=0)
-    MnyEvalDpstgAmt: int = Field(description="현금평가예탁금액", default=0)
-    DpsamtUtlfeeGivPrergAmt: int = Field(description="예탁금이용료지급예정금액", default=0)
-    TaxAmt: int = Field(description="세금", default=0)
-    CsgnMgnrat: float = Field(description="위탁증거금 비율", default=0.0)
-    CsgnMnyMgnrat: float = Field(description="위탁증거금현금비율", default=0.0)
-    DpstgTotamtLackAmt: int = Field(description="예탁총액부족금액(위탁증거금기준)", default=0)
-    DpstgMnyLackAmt: int = Field(description="예탁현금부족금액(위탁증거금기준)", default=0)
-    RealInAmt: int = Field(description="실입금액", default=0)
-    InAmt: int = Field(description="입금액", default=0)
-    OutAmt: int = Field(description="출금액", default=0)
-    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
-    FutsThdayDfamt: int = Field(description="선물당일차금", default=0)
-    FutsUpdtDfamt: int = Field(description="선물갱신차금", default=0)
-    FutsLastSettDfamt: int = Field(description="선물최종결제차금", default=0)
-    OptSettDfamt: int = Field(description="옵션결제차금", default=0)
-    OptBuyAmt: int = Field(description="옵션매수금액", default=0)
-    OptSellAmt: int = Field(description="옵션매도금액", default=0)
-    OptXrcDfamt: int = Field(description="옵션행사차금", default=0)
-    OptAsgnDfamt: int = Field(description="옵션배정차금", default=0)
-    RealGdsUndAmt: int = Field(description="실물인수도금액", default=0)
-    RealGdsUndAsgnAmt: int = Field(description="실물인수도배정대금", default=0)
-    RealGdsUndXrcAmt: int = Field(description="실물인수도행사대금", default=0)
-    CmsnAmt: int = Field(description="수수료", default=0)
-    FutsCmsn: int = Field(description="선물수수료", default=0)
-    OptCmsn: int = Field(description="옵션수수료", default=0)
-    FutsCtrctQty: int = Field(description="선물약정수량", default=0)
-    FutsCtrctAmt: int = Field(description="선물약정금액", default=0)
-    OptCtrctQty: int = Field(description="옵션약정수량", default=0)
-    OptCtrctAmt: int = Field(description="옵션약정금액", default=0)
-    FutsUnsttQty: int = Field(description="선물미결제수량", default=0)
-    FutsUnsttAmt: int = Field(description="선물미결제금액", default=0)
-    OptUnsttQty: int = Field(description="옵션미결제수량", default=0)
-    OptUnsttAmt: int = Field(description="옵션미결제금액", default=0)
-    FutsBuyUnsttQty: int = Field(description="선물매수미결제수량", default=0)
-    FutsBuyUnsttAmt: int = Field(description="선물매수미결제금액", default=0)
-    FutsSellUnsttQty: int = Field(description="선물매도미결제수량", default=0)
-    FutsSellUnsttAmt: int = Field(description="선물매도미결제금액", default=0)
-    OptBuyUnsttQty: int = Field(description="옵션매수미결제수량", default=0)
-    OptBuyUnsttAmt: int = Field(description="옵션매수미결제금액", default=0)
-    OptSellUnsttQty: int = Field(description="옵션매도미결제수량", default=0)
-    OptSellUnsttAmt: int = Field(description="옵션매도미결제금액", default=0)
-    FutsBuyctrQty: int = Field(description="선물매수약정수량", default=0)
-    FutsBuyctrAmt: int = Field(description="선물매수약정금액", default=0)
-    FutsSlctrQty: int = Field(description="선물매도약정수량", default=0)
-    FutsSlctrAmt: int = Field(description="선물매도약정금액", default=0)
-    OptBuyctrQty: int = Field(description="옵션매수약정수량", default=0)
-    OptBuyctrAmt: int = Field(description="옵션매수약정금액", default=0)
-    OptSlctrQty: int = Field(description="옵션매도약정수량", default=0)
-    OptSlctrAmt: int = Field(description="옵션매도약정금액", default=0)
-    FutsBnsplAmt: int = Field(description="선물매매손익금액", default=0)
-    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
-    FutsEvalPnlAmt: int = Field(description="선물평가손익금액", default=0)
-    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
-    FutsEvalAmt: int = Field(description="선물평가금액", default=0)
-    OptEvalAmt: int = Field(description="옵션평가금액", default=0)
-    MktEndAfMnyInAmt: int = Field(description="장종료후현금입금금액", default=0)
-    MktEndAfMnyOutAmt: int = Field(description="장종료후현금출금금액", default=0)
-    MktEndAfSubstDsgnAmt: int = Field(description="장종료후대용지정금액", default=0)
-    MktEndAfSubstAbndAmt: int = Field(description="장종료후대용해지금액", default=0)
-
-
-# 선물옵션가정산예탁금상세
-class CFOEQ11100(BaseModel):
-    inblock1: CFOEQ11100InBlock1 = Field(description="CFOEQ11100InBlock1")
-    outblock1: CFOEQ11100OutBlock1 = Field(description="CFOEQ11100OutBlock1")
-    outblock2: CFOEQ11100OutBlock2 = Field(description="CFOEQ11100OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CFOEQ11100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOEQ82600 - 선물옵션 일별 계좌손익내역>
-class CFOEQ82600InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-    FnoBalEvalTpCode: str = Field(description="선물옵션잔고평가구분코드", default="")
-
-
-class CFOEQ82600OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
-    FnoBalEvalTpCode: str = Field(description="선물옵션잔고평가구분코드", default="")
-
-
-class CFOEQ82600OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
-    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
-    FnoCmsnAmt: int = Field(description="선물옵션수수료", default=0)
-    PnlSumAmt: int = Field(description="손익합계금액", default=0)
-    MnyinSumAmt: int = Field(description="입금합계금액", default=0)
-    MnyoutSumAmt: int = Field(description="출금합계금액", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-
-
-class CFOEQ82600OutBlock3(BaseModel):
-    QryDt: str = Field(description="조회일", default="")
-    DpstgTotamt: int = Field(description="예탁총액", default=0)
-    DpstgMny: int = Field(description="예탁현금", default=0)
-    FnoMgn: int = Field(description="선물옵션증거금액", default=0)
-    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
-    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
-    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
-    CmsnAmt: int = Field(description="수수료", default=0)
-    SumAmt1: int = Field(description="합계금액1", default=0)
-    SumAmt2: int = Field(description="합계금액", default=0)
-    PnlSumAmt: int = Field(description="손익합계금액", default=0)
-    FutsBuyAmt: int = Field(description="선물매수금액", default=0)
-    FutsSellAmt: int = Field(description="선물매도금액", default=0)
-    OptBuyAmt: int = Field(description="옵션매수금액", default=0)
-    OptSellAmt: int = Field(description="옵션매도금액", default=0)
-    InAmt: int = Field(description="입금액", default=0)
-    OutAmt: int = Field(description="출금액", default=0)
-    EvalAmt: int = Field(description="평가금액", default=0)
-    AddupEvalAmt: int = Field(description="합산평가금액", default=0)
-    Amt2: int = Field(description="금액2", default=0)
-
-
-# 선물옵션 일별 계좌손익내역
-class CFOEQ82600(BaseModel):
-    inblock1: CFOEQ82600InBlock1 = Field(description="CFOEQ82600InBlock1")
-    outblock1: CFOEQ82600OutBlock1 = Field(description="CFOEQ82600OutBlock1")
-    outblock2: CFOEQ82600OutBlock2 = Field(description="CFOEQ82600OutBlock2")
-    outblock3: List[CFOEQ82600OutBlock3] = Field(description="CFOEQ82600OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CFOEQ82600",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CFOFQ02400 - 계좌 미결제 약정현황(평균가)>
-class CFOFQ02400InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    RegMktCode: str = Field(description="등록시장코드", default="")
-    BuyDt: str = Field(description="매수일자", default="")
-
-
-class CFOFQ02400OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    RegMktCode: str = Field(description="등록시장코드", default="")
-    BuyDt: str = Field(description="매수일자", default="")
-
-
-class CFOFQ02400OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    FutsCtrctQty: int = Field(description="선물약정수량", default=0)
-    OptCtrctQty: int = Field(description="옵션약정수량", default=0)
-    CtrctQty: int = Field(description="약정수량", default=0)
-    FutsCtrctAmt: int = Field(description="선물약정금액", default=0)
-    FutsBuyctrAmt: int = Field(description="선물매수약정금액", default=0)
-    FutsSlctrAmt: int = Field(description="선물매도약정금액", default=0)
-    CalloptCtrctAmt: int = Field(description="콜옵션약정금액", default=0)
-    CallBuyAmt: int = Field(description="콜매수금액", default=0)
-    CallSellAmt: int = Field(description="콜매도금액", default=0)
-    PutoptCtrctAmt: int = Field(description="풋옵션약정금액", default=0)
-    PutBuyAmt: int = Field(description="풋매수금액", default=0)
-    PutSellAmt: int = Field(description="풋매도금액", default=0)
-    AllCtrctAmt: int = Field(description="전체약정금액", default=0)
-    BuyctrAsmAmt: int = Field(description="매수약정누계금액", default=0)
-    SlctrAsmAmt: int = Field(description="매도약정누계금액", default=0)
-    FutsPnlSum: int = Field(description="선물손익합계", default=0)
-    OptPnlSum: int = Field(description="옵션손익합계", default=0)
-    AllPnlSum: int = Field(description="전체손익합계", default=0)
-
-
-class CFOFQ02400OutBlock3(BaseModel):
-    FnoClssCode: str = Field(description="선물옵션품목구분", default="")
-    FutsSellQty: int = Field(description="선물매도수량", default=0)
-    FutsSellPnl: int = Field(description="선물매도손익", default=0)
-    FutsBuyQty: int = Field(description="선물매수수량", default=0)
-    FutsBuyPnl: int = Field(description="선물매수손익", default=0)
-    CallSellQty: int = Field(description="콜매도수량", default=0)
-    CallSellPnl: int = Field(description="콜매도손익", default=0)
-    CallBuyQty: int = Field(description="콜매수수량", default=0)
-    CallBuyPnl: int = Field(description="콜매수손익", default=0)
-    PutSellQty: int = Field(description="풋매도수량", default=0)
-    PutSellPnl: int = Field(description="풋매도손익", default=0)
-    PutBuyQty: int = Field(description="풋매수수량", default=0)
-    PutBuyPnl: int = Field(description="풋매수손익", default=0)
-
-
-class CFOFQ02400OutBlock4(BaseModel):
-    IsuNo: str = Field(description="종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    BalQty: int = Field(description="잔고수량", default=0)
-    FnoAvrPrc: float = Field(description="평균가", default=0.0)
-    BgnAmt: int = Field(description="당초금액", default=0)
-    ThdayLqdtQty: int = Field(description="당일청산수량", default=0)
-    Curprc: float = Field(description="현재가", default=0.0)
-    EvalAmt: int = Field(description="평가금액", default=0)
-    EvalPnlAmt: int = Field(description="평가손익금액", default=0)
-    EvalErnrat: float = Field(description="평가수익률", default=0.0)
-
-
-# 계좌 미결제 약정현황(평균가)
-class CFOFQ02400(BaseModel):
-    inblock1: CFOFQ02400InBlock1 = Field(description="CFOFQ02400InBlock1")
-    outblock1: CFOFQ02400OutBlock1 = Field(description="CFOFQ02400OutBlock1")
-    outblock2: CFOFQ02400OutBlock2 = Field(description="CFOFQ02400OutBlock2")
-    outblock3: List[CFOFQ02400OutBlock3] = Field(description="CFOFQ02400OutBlock3")
-    outblock: List[CFOFQ02400OutBlock4] = Field(description="CFOFQ02400OutBlock4")
-    metadata: dict = Field(
-        description="The metadata information for CFOFQ02400",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ01400 - 해외선물 체결내역개별 조회>
-class CIDBQ01400InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-
-
-class CIDBQ01400OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-
-
-class CIDBQ01400OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-
-
-# 해외선물 체결내역개별 조회
-class CIDBQ01400(BaseModel):
-    inblock1: CIDBQ01400InBlock1 = Field(description="CIDBQ01400InBlock1")
-    outblock1: CIDBQ01400OutBlock1 = Field(description="CIDBQ01400OutBlock1")
-    outblock2: CIDBQ01400OutBlock2 = Field(description="CIDBQ01400OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ01400",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ01500 - 해외선물 미결제 잔고내역>
-class CIDBQ01500InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntTpCode: str = Field(description="계좌구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryDt: str = Field(description="조회일자", default="")
-    BalTpCode: str = Field(description="잔고구분코드", default="")
-
-
-class CIDBQ01500OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntTpCode: str = Field(description="계좌구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QryDt: str = Field(description="조회일자", default="")
-    BalTpCode: str = Field(description="잔고구분코드", default="")
-
-
-class CIDBQ01500OutBlock2(BaseModel):
-    BaseDt: str = Field(description="기준일자", default="")
-    Dps: int = Field(description="예수금", default=0)
-    LpnlAmt: float = Field(description="청산손익금액", default=0.0)
-    FutsDueBfLpnlAmt: float = Field(description="선물만기전청산손익금액", default=0.0)
-    FutsDueBfCmsn: float = Field(description="선물만기전수수료", default=0.0)
-    CsgnMgn: int = Field(description="위탁증거금액", default=0)
-    MaintMgn: int = Field(description="유지증거금", default=0)
-    CtlmtAmt: float = Field(description="신용한도금액", default=0.0)
-    AddMgn: int = Field(description="추가증거금액", default=0)
-    MgnclRat: float = Field(description="마진콜율", default=0.0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    WthdwAbleAmt: int = Field(description="인출가능금액", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    CrcyCodeVal: str = Field(description="통화코드값", default="")
-    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
-    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
-    DueDt: str = Field(description="만기일자", default="")
-    OvrsDrvtXrcPrc: float = Field(description="해외파생행사가격", default=0.0)
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    CmnCodeNm: str = Field(description="공통코드명", default="")
-    TpCodeNm: str = Field(description="구분코드명", default="")
-    BalQty: int = Field(description="잔고수량", default=0)
-    PchsPrc: float = Field(description="매입가격", default=0.0)
-    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
-    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
-    CsgnCmsn: float = Field(description="위탁수수료", default=0.0)
-    PosNo: str = Field(description="포지션번호", default="")
-    EufOneCmsnAmt: float = Field(description="거래소비용1수수료금액", default=0.0)
-    EufTwoCmsnAmt: float = Field(description="거래소비용2수수료금액", default=0.0)
-
-
-# 해외선물 미결제 잔고내역
-class CIDBQ01500(BaseModel):
-    inblock1: CIDBQ01500InBlock1 = Field(description="CIDBQ01500InBlock1")
-    outblock1: CIDBQ01500OutBlock1 = Field(description="CIDBQ01500OutBlock1")
-    outblock2: List[CIDBQ01500OutBlock2] = Field(description="CIDBQ01500OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ01500",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ01800 - 해외선물 주문체결내역 조회>
-class CIDBQ01800InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    OrdDt: str = Field(description="주문일자", default="")
-    ThdayTpCode: str = Field(description="당일구분코드", default="")
-    OrdStatCode: str = Field(description="주문상태코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
-
-
-class CIDBQ01800OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    OrdDt: str = Field(description="주문일자", default="")
-    ThdayTpCode: str = Field(description="당일구분코드", default="")
-    OrdStatCode: str = Field(description="주문상태코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
-
-
-class CIDBQ01800OutBlock2(BaseModel):
-    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    FcmOrdNo: str = Field(description="FCM주문번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    AbrdFutsXrcPrc: float = Field(description="해외선물행사가격", default=0.0)
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    BnsTpNm: str = Field(description="매매구분명", default="")
-    FutsOrdStatCode: str = Field(description="선물주문상태코드", default="")
-    TpCodeNm: str = Field(description="구분코드명", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    TrdTpNm: str = Field(description="거래구분명", default="")
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-    OrdPtnNm: str = Field(description="주문유형명", default="")
-    OrdPtnTermTpCode: str = Field(description="주문유형기간구분코드", default="")
-    CmnCodeNm: str = Field(description="공통코드명", default="")
-    AppSrtDt: str = Field(description="적용시작일자", default="")
-    AppEndDt: str = Field(description="적용종료일자", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OvrsDrvtExecIsuCode: str = Field(description="해외파생체결종목코드", default="")
-    ExecIsuNm: str = Field(description="체결종목명", default="")
-    ExecBnsTpCode: str = Field(description="체결매매구분코드", default="")
-    ExecBnsTpNm: str = Field(description="체결매매구분명", default="")
-    AbrdFutsExecPrc: float = Field(description="해외선물체결가격", default=0.0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
-    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
-    MdfyQty: int = Field(description="정정수량", default=0)
-    CancQty: int = Field(description="취소수량", default=0)
-    RjtQty: int = Field(description="거부수량", default=0)
-    CnfQty: int = Field(description="확인수량", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    CvrgYn: str = Field(description="반대매매여부", default="")
-    RegTmnlNo: str = Field(description="등록단말번호", default="")
-    RegBrnNo: str = Field(description="등록지점번호", default="")
-    RegUserId: str = Field(description="등록사용자ID", default="")
-    OrdDt: str = Field(description="주문일자", default="")
-    OrdTime: str = Field(description="주문시각", default="")
-    OvrsOptXrcRsvTpCode: str = Field(description="해외옵션행사예약구분코드", default="")
-    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
-    SprdBaseIsuYn: str = Field(description="스프레드기준종목여부", default="")
-    OvrsFutsOrdDt: str = Field(description="해외선물주문일자", default="")
-    OvrsFutsOrdNo2: str = Field(description="해외선물주문번호2", default="")
-    OvrsFutsOrgOrdNo2: str = Field(description="해외선물원주문번호2", default="")
-    OvrsDrvtIsuCode2: str = Field(description="해외파생종목코드2", default="")
-
-
-# 해외선물 주문체결내역 조회
-class CIDBQ01800(BaseModel):
-    inblock1: CIDBQ01800InBlock1 = Field(description="CIDBQ01800InBlock1")
-    outblock1: CIDBQ01800OutBlock1 = Field(description="CIDBQ01800OutBlock1")
-    outblock2: List[CIDBQ01800OutBlock2] = Field(description="CIDBQ01800OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ01800",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ02400 - 해외선물 주문체결내역 상세 조회>
-class CIDBQ02400InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    QrySrtDt: str = Field(description="조회시작일자", default="")
-    QryEndDt: str = Field(description="조회종료일자", default="")
-    ThdayTpCode: str = Field(description="당일구분코드", default="")
-    OrdStatCode: str = Field(description="주문상태코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
-
-
-class CIDBQ02400OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    QrySrtDt: str = Field(description="조회시작일자", default="")
-    QryEndDt: str = Field(description="조회종료일자", default="")
-    ThdayTpCode: str = Field(description="당일구분코드", default="")
-    OrdStatCode: str = Field(description="주문상태코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    QryTpCode: str = Field(description="조회구분코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
-
-
-class CIDBQ02400OutBlock2(BaseModel):
-    OrdDt: str = Field(description="주문일자", default="")
-    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    FcmOrdNo: str = Field(description="FCM주문번호", default="")
-    ExecDt: str = Field(description="체결일자", default="")
-    OvrsFutsExecNo: str = Field(description="해외선물체결번호", default="")
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    AbrdFutsXrcPrc: float = Field(description="해외선물행사가격", default=0.0)
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    BnsTpNm: str = Field(description="매매구분명", default="")
-    FutsOrdStatCode: str = Field(description="선물주문상태코드", default="")
-    TpCodeNm: str = Field(description="구분코드명", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    TrdTpNm: str = Field(description="거래구분명", default="")
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-    OrdPtnNm: str = Field(description="주문유형명", default="")
-    OrdPtnTermTpCode: str = Field(description="주문유형기간구분코드", default="")
-    CmnCodeNm: str = Field(description="공통코드명", default="")
-    AppSrtDt: str = Field(description="적용시작일자", default="")
-    AppEndDt: str = Field(description="적용종료일자", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    OvrsDrvtExecIsuCode: str = Field(description="해외파생체결종목코드", default="")
-    ExecIsuNm: str = Field(description="체결종목명", default="")
-    ExecBnsTpCode: str = Field(description="체결매매구분코드", default="")
-    ExecBnsTpNm: str = Field(description="체결매매구분명", default="")
-    ExecQty: int = Field(description="체결수량", default=0)
-    AbrdFutsExecPrc: float = Field(description="해외선물체결가격", default=0.0)
-    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
-    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    TrxStatCode: str = Field(description="처리상태코드", default="")
-    TrxStatCodeNm: str = Field(description="처리상태코드명", default="")
-    CsgnCmsn: float = Field(description="위탁수수료", default=0.0)
-    FcmCmsn: float = Field(description="FCM수수료", default=0.0)
-    ThcoCmsn: float = Field(description="당사수수료", default=0.0)
-    MdaCode: str = Field(description="매체코드", default="")
-    MdaCodeNm: str = Field(description="매체코드명", default="")
-    RegTmnlNo: str = Field(description="등록단말번호", default="")
-    RegUserId: str = Field(description="등록사용자ID", default="")
-    OrdSndDttm: str = Field(description="주문발송일시", default="")
-    ExecDttm: str = Field(description="체결일시", default="")
-    EufOneCmsnAmt: float = Field(description="거래소비용1수수료금액", default=0.0)
-    EufTwoCmsnAmt: float = Field(description="거래소비용2수수료금액", default=0.0)
-    LchOneCmsnAmt: float = Field(description="런던청산소1수수료금액", default=0.0)
-    LchTwoCmsnAmt: float = Field(description="런던청산소2수수료금액", default=0.0)
-    TrdOneCmsnAmt: float = Field(description="거래1수수료금액", default=0.0)
-    TrdTwoCmsnAmt: float = Field(description="거래2수수료금액", default=0.0)
-    TrdThreeCmsnAmt: float = Field(description="거래3수수료금액", default=0.0)
-    StrmOneCmsnAmt: float = Field(description="단기1수수료금액", default=0.0)
-    StrmTwoCmsnAmt: float = Field(description="단기2수수료금액", default=0.0)
-    StrmThreeCmsnAmt: float = Field(description="단기3수수료금액", default=0.0)
-    TransOneCmsnAmt: float = Field(description="전달1수수료금액", default=0.0)
-    TransTwoCmsnAmt: float = Field(description="전달2수수료금액", default=0.0)
-    TransThreeCmsnAmt: float = Field(description="전달3수수료금액", default=0.0)
-    TransFourCmsnAmt: float = Field(description="전달4수수료금액", default=0.0)
-    OvrsOptXrcRsvTpCode: str = Field(description="해외옵션행사예약구분코드", default="")
-    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
-    SprdBaseIsuYn: str = Field(description="스프레드기준종목여부", default="")
-    OvrsDrvtIsuCode2: str = Field(description="해외파생종목코드2", default="")
-
-
-# 해외선물 주문체결내역 상세 조회
-class CIDBQ02400(BaseModel):
-    inblock1: CIDBQ02400InBlock1 = Field(description="CIDBQ02400InBlock1")
-    outblock1: CIDBQ02400OutBlock1 = Field(description="CIDBQ02400OutBlock1")
-    outblock2: List[CIDBQ02400OutBlock2] = Field(description="CIDBQ02400OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ02400",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ03000 - 해외선물 예수금/잔고현황>
-class CIDBQ03000InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntTpCode: str = Field(description="계좌구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-
-
-class CIDBQ03000OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntTpCode: str = Field(description="계좌구분코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-
-
-class CIDBQ03000OutBlock2(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-    CrcyObjCode: str = Field(description="통화대상코드", default="")
-    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
-    CustmMnyioAmt: float = Field(description="고객입출금금액", default=0.0)
-    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
-    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
-    PrexchDps: float = Field(description="가환전예수금", default=0.0)
-    EvalAssetAmt: float = Field(description="평가자산금액", default=0.0)
-    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
-    AbrdFutsAddMgn: float = Field(description="해외선물추가증거금액", default=0.0)
-    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
-    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
-    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
-    LastSettPnlAmt: float = Field(description="최종결제손익금액", default=0.0)
-    OvrsOptSettAmt: float = Field(description="해외옵션결제금액", default=0.0)
-    OvrsOptBalEvalAmt: float = Field(description="해외옵션잔고평가금액", default=0.0)
-
-
-# 해외선물 예수금/잔고현황
-class CIDBQ03000(BaseModel):
-    inblock1: CIDBQ03000InBlock1 = Field(description="CIDBQ03000InBlock1")
-    outblock1: CIDBQ03000OutBlock1 = Field(description="CIDBQ03000OutBlock1")
-    outblock2: List[CIDBQ03000OutBlock2] = Field(description="CIDBQ03000OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ03000",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBQ05300 - 해외선물 계좌예탁자산조회>
-class CIDBQ05300InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OvrsAcntTpCode: str = Field(description="해외계좌구분코드", default="")
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-
-
-class CIDBQ05300OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OvrsAcntTpCode: str = Field(description="해외계좌구분코드", default="")
-    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-
-
-class CIDBQ05300OutBlock2(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
-    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
-    OvrsFutsSplmMgn: float = Field(description="해외선물추가증거금", default=0.0)
-    CustmLpnlAmt: float = Field(description="고객청산손익금액", default=0.0)
-    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
-    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
-    AbrdFutsEvalDpstgTotAmt: float = Field(description="해외선물평가예탁총금액", default=0.0)
-    Xchrat: float = Field(description="환율", default=0.0)
-    FcurrRealMxchgAmt: float = Field(description="외화실환전금액", default=0.0)
-    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
-    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
-    FutsDueNarrvLqdtPnlAmt: float = Field(description="선물만기미도래청산손익금액", default=0.0)
-    FutsDueNarrvCmsn: float = Field(description="선물만기미도래수수료", default=0.0)
-    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
-    OvrsFutsDueCmsn: float = Field(description="해외선물만기수수료", default=0.0)
-    OvrsFutsOptBuyAmt: float = Field(description="해외선물옵션매수금액", default=0.0)
-    OvrsFutsOptSellAmt: float = Field(description="해외선물옵션매도금액", default=0.0)
-    OptBuyMktWrthAmt: float = Field(description="옵션매수시장가치금액", default=0.0)
-    OptSellMktWrthAmt: float = Field(description="옵션매도시장가치금액", default=0.0)
-
-
-class CIDBQ05300OutBlock3(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
-    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
-    FutsDueNarrvLqdtPnlAmt: float = Field(description="선물만기미도래청산손익금액", default=0.0)
-    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
-    AbrdFutsEvalDpstgTotAmt: float = Field(description="해외선물평가예탁총금액", default=0.0)
-    CustmLpnlAmt: float = Field(description="고객청산손익금액", default=0.0)
-    OvrsFutsDueCmsn: float = Field(description="해외선물만기수수료", default=0.0)
-    FcurrRealMxchgAmt: float = Field(description="외화실환전금액", default=0.0)
-    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
-    FutsDueNarrvCmsn: float = Field(description="선물만기미도래수수료", default=0.0)
-    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
-    OvrsFutsMaintMgn: float = Field(description="해외선물유지증거금", default=0.0)
-    OvrsFutsOptBuyAmt: float = Field(description="해외선물옵션매수금액", default=0.0)
-    OvrsFutsOptSellAmt: float = Field(description="해외선물옵션매도금액", default=0.0)
-    CtlmtAmt: float = Field(description="신용한도금액", default=0.0)
-    OvrsFutsSplmMgn: float = Field(description="해외선물추가증거금", default=0.0)
-    MgnclRat: float = Field(description="마진콜율", default=0.0)
-    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
-    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
-    OptBuyMktWrthAmt: float = Field(description="옵션매수시장가치금액", default=0.0)
-    OptSellMktWrthAmt: float = Field(description="옵션매도시장가치금액", default=0.0)
-    OvrsOptSettAmt: float = Field(description="해외옵션결제금액", default=0.0)
-    OvrsOptBalEvalAmt: float = Field(description="해외옵션잔고평가금액", default=0.0)
-
-
-# 해외선물 계좌예탁자산조회
-class CIDBQ05300(BaseModel):
-    inblock1: CIDBQ05300InBlock1 = Field(description="CIDBQ05300InBlock1")
-    outblock1: CIDBQ05300OutBlock1 = Field(description="CIDBQ05300OutBlock1")
-    outblock2: List[CIDBQ05300OutBlock2] = Field(description="CIDBQ05300OutBlock2")
-    outblock3: CIDBQ05300OutBlock3 = Field(description="CIDBQ05300OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CIDBQ05300",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBT00100 - 해외선물신규주문>
-class CIDBT00100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    BrnCode: str = Field(description="지점코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    PrdtCode: str = Field(description="상품코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT00100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    BrnCode: str = Field(description="지점코드", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
-    CrcyCode: str = Field(description="통화코드", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    PrdtCode: str = Field(description="상품코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT00100OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
-
-
-# 해외선물신규주문
-class CIDBT00100(BaseModel):
-    inblock1: CIDBT00100InBlock1 = Field(description="CIDBT00100InBlock1")
-    outblock1: CIDBT00100OutBlock1 = Field(description="CIDBT00100OutBlock1")
-    outblock2: CIDBT00100OutBlock2 = Field(description="CIDBT00100OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBT00100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBT00900 - 해외선물정정주문>
-class CIDBT00900InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    RegBrnNo: str = Field(description="등록지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    FutsOrdPtnCode: str = Field(description="선물주문유형코드", default="")
-    CrcyCodeVal: str = Field(description="통화코드값", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT00900OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    RegBrnNo: str = Field(description="등록지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    BnsTpCode: str = Field(description="매매구분코드", default="")
-    FutsOrdPtnCode: str = Field(description="선물주문유형코드", default="")
-    CrcyCodeVal: str = Field(description="통화코드값", default="")
-    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
-    CndiOrdPrc: float = Field(description="조건주문가격", default=0.0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
-    DueYymm: str = Field(description="만기년월", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT00900OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
-    InnerMsgCnts: str = Field(description="내부메시지내용", default="")
-
-
-# 해외선물정정주문
-class CIDBT00900(BaseModel):
-    inblock1: CIDBT00900InBlock1 = Field(description="CIDBT00900InBlock1")
-    outblock1: CIDBT00900OutBlock1 = Field(description="CIDBT00900OutBlock1")
-    outblock2: CIDBT00900OutBlock2 = Field(description="CIDBT00900OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBT00900",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDBT01000 - 해외선물취소주문>
-class CIDBT01000InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    BrnNo: str = Field(description="지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    PrdtTpCode: str = Field(description="상품구분코드", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT01000OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdDt: str = Field(description="주문일자", default="")
-    BrnNo: str = Field(description="지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
-    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
-    PrdtTpCode: str = Field(description="상품구분코드", default="")
-    ExchCode: str = Field(description="거래소코드", default="")
-
-
-class CIDBT01000OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
-    InnerMsgCnts: str = Field(description="내부메시지내용", default="")
-
-
-# 해외선물취소주문
-class CIDBT01000(BaseModel):
-    inblock1: CIDBT01000InBlock1 = Field(description="CIDBT01000InBlock1")
-    outblock1: CIDBT01000OutBlock1 = Field(description="CIDBT01000OutBlock1")
-    outblock2: CIDBT01000OutBlock2 = Field(description="CIDBT01000OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDBT01000",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CIDEQ00800 - 일자별 미결제 잔고내역>
-class CIDEQ00800InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-
-
-class CIDEQ00800OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    AcntPwd: str = Field(description="계좌비밀번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-
-
-class CIDEQ00800OutBlock2(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    TrdDt: str = Field(description="거래일자", default="")
-    IsuCodeVal: str = Field(description="종목코드값", default="")
-    BnsTpNm: str = Field(description="매매구분명", default="")
-    BalQty: int = Field(description="잔고수량", default=0)
-    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
-    PchsPrc: float = Field(description="매입가격", default=0.0)
-    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
-    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
-    CustmBalAmt: float = Field(description="고객잔고금액", default=0.0)
-    FcurrEvalAmt: float = Field(description="외화평가금액", default=0.0)
-    IsuNm: str = Field(description="종목명", default="")
-    CrcyCodeVal: str = Field(description="통화코드값", default="")
-    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
-    DueDt: str = Field(description="만기일자", default="")
-    PrcntrAmt: float = Field(description="계약당금액", default=0.0)
-    FcurrEvalPnlAmt: float = Field(description="외화평가손익금액", default=0.0)
-
-
-# 일자별 미결제 잔고내역
-class CIDEQ00800(BaseModel):
-    inblock1: CIDEQ00800InBlock1 = Field(description="CIDEQ00800InBlock1")
-    outblock1: CIDEQ00800OutBlock1 = Field(description="CIDEQ00800OutBlock1")
-    outblock2: List[CIDEQ00800OutBlock2] = Field(description="CIDEQ00800OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CIDEQ00800",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CLNAQ00100 - 예탁담보융자가능종목현황조회>
-class CLNAQ00100InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTp: str = Field(description="조회구분", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    SecTpCode: str = Field(description="유가증권구분", default="")
-    LoanIntrstGrdCode: str = Field(description="대출이자등급코드", default="")
-    LoanTp: str = Field(description="대출구분", default="")
-
-
-class CLNAQ00100OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    QryTp: str = Field(description="조회구분", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    SecTpCode: str = Field(description="유가증권구분", default="")
-    LoanIntrstGrdCode: str = Field(description="대출이자등급코드", default="")
-    LoanTp: str = Field(description="대출구분", default="")
-
-
-class CLNAQ00100OutBlock2(BaseModel):
-    IsuNo: str = Field(description="종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    Parprc: float = Field(description="액면가", default=0.0)
-    PrdayCprc: float = Field(description="전일종가", default=0.0)
-    RatVal: float = Field(description="비율값", default=0.0)
-    SubstPrc: float = Field(description="대용가", default=0.0)
-    RegTpNm: str = Field(description="등록구분", default="")
-    SpotMgnLevyClssNm: str = Field(description="현물증거금징수분류명", default="")
-    FnoTrdStopRsnCnts: str = Field(description="거래정지사유", default="")
-    DgrsPtnNm: str = Field(description="요주의유형명", default="")
-    AcdPtnNm: str = Field(description="사고유형", default="")
-    MktTpNm: str = Field(description="시장구분", default="")
-    LmtVal: int = Field(description="한도값", default=0)
-    AcntLmtVal: int = Field(description="계좌한도값", default=0)
-    LoanGrdCode: str = Field(description="대출등급코드", default="")
-    LoanAmt: int = Field(description="대출금액", default=0)
-    LoanAbleRat: float = Field(description="대출가능율", default=0.0)
-    LoanIntrat1: float = Field(description="대출이율1", default=0.0)
-    RegPsnId: str = Field(description="등록자ID", default="")
-    Rat01: float = Field(description="비율값", default=0.0)
-    Rat02: float = Field(description="비율값", default=0.0)
-
-
-class CLNAQ00100OutBlock3(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    LrgMnyoutSumAmt: int = Field(description="대출금합계금액", default=0)
-
-
-# 예탁담보융자가능종목현황조회
-class CLNAQ00100(BaseModel):
-    inblock1: CLNAQ00100InBlock1 = Field(description="CLNAQ00100InBlock1")
-    outblock1: CLNAQ00100OutBlock1 = Field(description="CLNAQ00100OutBlock1")
-    outblock2: List[CLNAQ00100OutBlock2] = Field(description="CLNAQ00100OutBlock2")
-    outblock3: CLNAQ00100OutBlock3 = Field(description="CLNAQ00100OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CLNAQ00100",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAQ00600 - 계좌별신용한도조회>
-class CSPAQ00600InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CSPAQ00600OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CSPAQ00600OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    SloanLmtAmt: int = Field(description="대주한도", default=0)
-    SloanAmtSum: int = Field(description="대주금액합계", default=0)
-    SloanNewAmt: int = Field(description="대주신규금액", default=0)
-    SloanRfundAmt: int = Field(description="대주상환금액", default=0)
-    MktcplMloanLmtAmt: int = Field(description="유통융자한도금액", default=0)
-    MktcplMloanAmtSum: int = Field(description="유통융자금액합계", default=0)
-    MktcplMloanNewAmt: int = Field(description="유통융자신규금액", default=0)
-    MktcplMloanRfundAmt: int = Field(description="유통융자상환금액", default=0)
-    SfaccMloanLmtAmt: int = Field(description="자기융자한도금액", default=0)
-    SfaccMloanAmtSum: int = Field(description="자기융자금액합계", default=0)
-    SfaccMloanNewAmt: int = Field(description="자기융자신규금액", default=0)
-    SfaccMloanRfundAmt: int = Field(description="자기융자상환금액", default=0)
-    BrnMktcplMloanLmtAmt: int = Field(description="지점유통융자한도금액", default=0)
-    BrnMktcplMloanNewAmt: int = Field(description="지점유통융자신규금액", default=0)
-    BrnMktcplMloanRfundAmt: int = Field(description="지점유통융자상환금액", default=0)
-    BrnMktcplMloanUseAmt: int = Field(description="지점유통융자사용금액", default=0)
-    BrnSfaccMloanLmtAmt: int = Field(description="지점자기융자한도금액", default=0)
-    BrnSfaccMloanNewAmt: int = Field(description="지점자기융자신규금액", default=0)
-    BrnSfaccMloanRfundAmt: int = Field(description="지점자기융자상환금액", default=0)
-    BrnSfaccMloanUseAmt: int = Field(description="지점자기융자사용금액", default=0)
-    FirmMloanLmtMgmtYn: str = Field(description="이용사융자한도관리여부", default="")
-    FirmCrdtIsuRestrcTp: str = Field(description="이용사신용종목제한구분", default="")
-    PldgMaintRat: float = Field(description="담보유지비율", default=0.0)
-    FirmNm: str = Field(description="이용사명", default="")
-    PldgRat: float = Field(description="담보비율", default=0.0)
-    DpsastSum: int = Field(description="예탁자산합계", default=0)
-    LmtChgAbleAmt: int = Field(description="한도변경가능금액", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-    RcvblUablOrdAbleQty: int = Field(description="미수불가주문가능수량", default=0)
-
-
-# 계좌별신용한도조회
-class CSPAQ00600(BaseModel):
-    inblock1: CSPAQ00600InBlock1 = Field(description="CSPAQ00600InBlock1")
-    outblock1: CSPAQ00600OutBlock1 = Field(description="CSPAQ00600OutBlock1")
-    outblock2: CSPAQ00600OutBlock2 = Field(description="CSPAQ00600OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAQ00600",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAQ12200 - 현물계좌예수금 주문가능금액 총평가 조회>
-class CSPAQ12200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    MgmtBrnNo: str = Field(description="관리지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-
-
-class CSPAQ12200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    MgmtBrnNo: str = Field(description="관리지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-
-
-class CSPAQ12200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
-    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
-    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
-    BalEvalAmt: int = Field(description="잔고평가금액", default=0)
-    RcvblAmt: int = Field(description="미수금액", default=0)
-    DpsastTotamt: int = Field(description="예탁자산총액", default=0)
-    PnlRat: float = Field(description="손익율", default=0.0)
-    InvstOrgAmt: int = Field(description="투자원금", default=0)
-    InvstPlAmt: int = Field(description="투자손익금액", default=0)
-    CrdtPldgOrdAmt: int = Field(description="신용담보주문금액", default=0)
-    Dps: int = Field(description="예수금", default=0)
-    SubstAmt: int = Field(description="대용금액", default=0)
-    D1Dps: int = Field(description="D1예수금", default=0)
-    D2Dps: int = Field(description="D2예수금", default=0)
-    MnyrclAmt: int = Field(description="현금미수금액", default=0)
-    MgnMny: int = Field(description="증거금현금", default=0)
-    MgnSubst: int = Field(description="증거금대용", default=0)
-    ChckAmt: int = Field(description="수표금액", default=0)
-    SubstOrdAbleAmt: int = Field(description="대용주문가능금액", default=0)
-    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
-    MgnRat35ordAbleAmt: int = Field(description="증거금률35%주문가능금액", default=0)
-    MgnRat50ordAbleAmt: int = Field(description="증거금률50%주문가능금액", default=0)
-    PrdaySellAdjstAmt: int = Field(description="전일매도정산금액", default=0)
-    PrdayBuyAdjstAmt: int = Field(description="전일매수정산금액", default=0)
-    CrdaySellAdjstAmt: int = Field(description="금일매도정산금액", default=0)
-    CrdayBuyAdjstAmt: int = Field(description="금일매수정산금액", default=0)
-    D1ovdRepayRqrdAmt: int = Field(description="D1연체변제소요금액", default=0)
-    D2ovdRepayRqrdAmt: int = Field(description="D2연체변제소요금액", default=0)
-    D1PrsmptWthdwAbleAmt: int = Field(description="D1추정인출가능금액", default=0)
-    D2PrsmptWthdwAbleAmt: int = Field(description="D2추정인출가능금액", default=0)
-    DpspdgLoanAmt: int = Field(description="예탁담보대출금액", default=0)
-    Imreq: int = Field(description="신용설정보증금", default=0)
-    MloanAmt: int = Field(description="융자금액", default=0)
-    ChgAfPldgRat: float = Field(description="변경후담보비율", default=0.0)
-    OrgPldgAmt: int = Field(description="원담보금액", default=0)
-    SubPldgAmt: int = Field(description="부담보금액", default=0)
-    RqrdPldgAmt: int = Field(description="소요담보금액", default=0)
-    OrgPdlckAmt: int = Field(description="원담보부족금액", default=0)
-    PdlckAmt: int = Field(description="담보부족금액", default=0)
-    AddPldgMny: int = Field(description="추가담보현금", default=0)
-    D1OrdAbleAmt: int = Field(description="D1주문가능금액", default=0)
-    CrdtIntdltAmt: int = Field(description="신용이자미납금액", default=0)
-    EtclndAmt: int = Field(description="기타대여금액", default=0)
-    NtdayPrsmptCvrgAmt: int = Field(description="익일추정반대매매금액", default=0)
-    OrgPldgSumAmt: int = Field(description="원담보합계금액", default=0)
-    CrdtOrdAbleAmt: int = Field(description="신용주문가능금액", default=0)
-    SubPldgSumAmt: int = Field(description="부담보합계금액", default=0)
-    CrdtPldgAmtMny: int = Field(description="신용담보금현금", default=0)
-    CrdtPldgSubstAmt: int = Field(description="신용담보대용금액", default=0)
-    AddCrdtPldgMny: int = Field(description="추가신용담보현금", default=0)
-    CrdtPldgRuseAmt: int = Field(description="신용담보재사용금액", default=0)
-    AddCrdtPldgSubst: int = Field(description="추가신용담보대용", default=0)
-    CslLoanAmtdt1: int = Field(description="매도대금담보대출금액", default=0)
-    DpslRestrcAmt: int = Field(description="처분제한금액", default=0)
-
-
-# 현물계좌예수금 주문가능금액 총평가 조회
-class CSPAQ12200(BaseModel):
-    inblock1: CSPAQ12200InBlock1 = Field(description="CSPAQ12200InBlock1")
-    outblock1: CSPAQ12200OutBlock1 = Field(description="CSPAQ12200OutBlock1")
-    outblock2: CSPAQ12200OutBlock2 = Field(description="CSPAQ12200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAQ12200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAQ12300 - BEP단가조회>
-class CSPAQ12300InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-    CmsnAppTpCode: str = Field(description="수수료적용구분", default="")
-    D2balBaseQryTp: str = Field(description="D2잔고기준조회구분", default="")
-    UprcTpCode: str = Field(description="단가구분", default="")
-
-
-class CSPAQ12300OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-    CmsnAppTpCode: str = Field(description="수수료적용구분", default="")
-    D2balBaseQryTp: str = Field(description="D2잔고기준조회구분", default="")
-    UprcTpCode: str = Field(description="단가구분", default="")
-
-
-class CSPAQ12300OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
-    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
-    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
-    HtsOrdAbleAmt: int = Field(description="HTS주문가능금액", default=0)
-    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
-    BalEvalAmt: int = Field(description="잔고평가금액", default=0)
-    PchsAmt: int = Field(description="매입금액", default=0)
-    RcvblAmt: int = Field(description="미수금액", default=0)
-    PnlRat: float = Field(description="손익율", default=0.0)
-    InvstOrgAmt: int = Field(description="투자원금", default=0)
-    InvstPlAmt: int = Field(description="투자손익금액", default=0)
-    CrdtPldgOrdAmt: int = Field(description="신용담보주문금액", default=0)
-    Dps: int = Field(description="예수금", default=0)
-    D1Dps: int = Field(description="D1예수금", default=0)
-    D2Dps: int = Field(description="D2예수금", default=0)
-    OrdDt: str = Field(description="주문일", default="")
-    MnyMgn: int = Field(description="현금증거금액", default=0)
-    SubstMgn: int = Field(description="대용증거금액", default=0)
-    SubstAmt: int = Field(description="대용금액", default=0)
-    PrdayBuyExecAmt: int = Field(description="전일매수체결금액", default=0)
-    PrdaySellExecAmt: int = Field(description="전일매도체결금액", default=0)
-    CrdayBuyExecAmt: int = Field(description="금일매수체결금액", default=0)
-    CrdaySellExecAmt: int = Field(description="금일매도체결금액", default=0)
-    EvalPnlSum: int = Field(description="평가손익합계", default=0)
-    DpsastTotamt: int = Field(description="예탁자산총액", default=0)
-    Evrprc: int = Field(description="제비용", default=0)
-    RuseAmt: int = Field(description="재사용금액", default=0)
-    EtclndAmt: int = Field(description="기타대여금액", default=0)
-    PrcAdjstAmt: int = Field(description="가정산금액", default=0)
-    D1CmsnAmt: int = Field(description="D1수수료", default=0)
-    D2CmsnAmt: int = Field(description="D2수수료", default=0)
-    D1EvrTax: int = Field(description="D1제세금", default=0)
-    D2EvrTax: int = Field(description="D2제세금", default=0)
-    D1SettPrergAmt: int = Field(description="D1결제예정금액", default=0)
-    D2SettPrergAmt: int = Field(description="D2결제예정금액", default=0)
-    PrdayKseMnyMgn: int = Field(description="전일KSE현금증거금", default=0)
-    PrdayKseSubstMgn: int = Field(description="전일KSE대용증거금", default=0)
-    PrdayKseCrdtMnyMgn: int = Field(description="전일KSE신용현금증거금", default=0)
-    PrdayKseCrdtSubstMgn: int = Field(description="전일KSE신용대용증거금", default=0)
-    CrdayKseMnyMgn: int = Field(description="금일KSE현금증거금", default=0)
-    CrdayKseSubstMgn: int = Field(description="금일KSE대용증거금", default=0)
-    CrdayKseCrdtMnyMgn: int = Field(description="금일KSE신용현금증거금", default=0)
-    CrdayKseCrdtSubstMgn: int = Field(description="금일KSE신용대용증거금", default=0)
-    PrdayKdqMnyMgn: int = Field(description="전일코스닥현금증거금", default=0)
-    PrdayKdqSubstMgn: int = Field(description="전일코스닥대용증거금", default=0)
-    PrdayKdqCrdtMnyMgn: int = Field(description="전일코스닥신용현금증거금", default=0)
-    PrdayKdqCrdtSubstMgn: int = Field(description="전일코스닥신용대용증거금", default=0)
-    CrdayKdqMnyMgn: int = Field(description="금일코스닥현금증거금", default=0)
-    CrdayKdqSubstMgn: int = Field(description="금일코스닥대용증거금", default=0)
-    CrdayKdqCrdtMnyMgn: int = Field(description="금일코스닥신용현금증거금", default=0)
-    CrdayKdqCrdtSubstMgn: int = Field(description="금일코스닥신용대용증거금", default=0)
-    PrdayFrbrdMnyMgn: int = Field(description="전일프리보드현금증거금", default=0)
-    PrdayFrbrdSubstMgn: int = Field(description="전일프리보드대용증거금", default=0)
-    CrdayFrbrdMnyMgn: int = Field(description="금일프리보드현금증거금", default=0)
-    CrdayFrbrdSubstMgn: int = Field(description="금일프리보드대용증거금", default=0)
-    PrdayCrbmkMnyMgn: int = Field(description="전일장외현금증거금", default=0)
-    PrdayCrbmkSubstMgn: int = Field(description="전일장외대용증거금", default=0)
-    CrdayCrbmkMnyMgn: int = Field(description="금일장외현금증거금", default=0)
-    CrdayCrbmkSubstMgn: int = Field(description="금일장외대용증거금", default=0)
-    DpspdgQty: int = Field(description="예탁담보수량", default=0)
-    BuyAdjstAmtD2: int = Field(description="매수정산금(D+2)", default=0)
-    SellAdjstAmtD2: int = Field(description="매도정산금(D+2)", default=0)
-    RepayRqrdAmtD1: int = Field(description="변제소요금(D+1)", default=0)
-    RepayRqrdAmtD2: int = Field(description="변제소요금(D+2)", default=0)
-    LoanAmt: int = Field(description="대출금액", default=0)
-
-
-class CSPAQ12300OutBlock3(BaseModel):
-    IsuNo: str = Field(description="종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    SecBalPtnCode: str = Field(description="유가증권잔고유형코드", default="")
-    SecBalPtnNm: str = Field(description="유가증권잔고유형명", default="")
-    BalQty: int = Field(description="잔고수량", default=0)
-    BnsBaseBalQty: int = Field(description="매매기준잔고수량", default=0)
-    CrdayBuyExecQty: int = Field(description="금일매수체결수량", default=0)
-    CrdaySellExecQty: int = Field(description="금일매도체결수량", default=0)
-    SellPrc: float = Field(description="매도가", default=0.0)
-    BuyPrc: float = Field(description="매수가", default=0.0)
-    SellPnlAmt: int = Field(description="매도손익금액", default=0)
-    PnlRat: float = Field(description="손익율", default=0.0)
-    NowPrc: float = Field(description="현재가", default=0.0)
-    CrdtAmt: int = Field(description="신용금액", default=0)
-    DueDt: str = Field(description="만기일", default="")
-    PrdaySellExecPrc: float = Field(description="전일매도체결가", default=0.0)
-    PrdaySellQty: int = Field(description="전일매도수량", default=0)
-    PrdayBuyExecPrc: float = Field(description="전일매수체결가", default=0.0)
-    PrdayBuyQty: int = Field(description="전일매수수량", default=0)
-    LoanDt: str = Field(description="대출일", default="")
-    AvrUprc: float = Field(description="평균단가", default=0.0)
-    SellAbleQty: int = Field(description="매도가능수량", default=0)
-    SellOrdQty: int = Field(description="매도주문수량", default=0)
-    CrdayBuyExecAmt: int = Field(description="금일매수체결금액", default=0)
-    CrdaySellExecAmt: int = Field(description="금일매도체결금액", default=0)
-    PrdayBuyExecAmt: int = Field(description="전일매수체결금액", default=0)
-    PrdaySellExecAmt: int = Field(description="전일매도체결금액", default=0)
-    BalEvalAmt: int = Field(description="잔고평가금액", default=0)
-    EvalPnl: int = Field(description="평가손익", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-    SellUnercQty: int = Field(description="매도미체결수량", default=0)
-    SellUnsttQty: int = Field(description="매도미결제수량", default=0)
-    BuyUnercQty: int = Field(description="매수미체결수량", default=0)
-    BuyUnsttQty: int = Field(description="매수미결제수량", default=0)
-    UnsttQty: int = Field(description="미결제수량", default=0)
-    UnercQty: int = Field(description="미체결수량", default=0)
-    PrdayCprc: float = Field(description="전일종가", default=0.0)
-    PchsAmt: int = Field(description="매입금액", default=0)
-    RegMktCode: str = Field(description="등록시장코드", default="")
-    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
-    DpspdgLoanQty: int = Field(description="예탁담보대출수량", default=0)
-
-
-# BEP단가조회
-class CSPAQ12300(BaseModel):
-    inblock1: CSPAQ12300InBlock1 = Field(description="CSPAQ12300InBlock1")
-    outblock1: CSPAQ12300OutBlock1 = Field(description="CSPAQ12300OutBlock1")
-    outblock2: CSPAQ12300OutBlock2 = Field(description="CSPAQ12300OutBlock2")
-    outblock3: List[CSPAQ12300OutBlock3] = Field(description="CSPAQ12300OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CSPAQ12300",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAQ13700 - 현물계좌주문체결내역조회>
-class CSPAQ13700InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    ExecYn: str = Field(description="체결여부", default="")
-    OrdDt: str = Field(description="주문일", default="")
-    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
-    BkseqTpCode: str = Field(description="역순구분", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-
-
-class CSPAQ13700OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    ExecYn: str = Field(description="체결여부", default="")
-    OrdDt: str = Field(description="주문일", default="")
-    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
-    BkseqTpCode: str = Field(description="역순구분", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-
-
-class CSPAQ13700OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    SellExecAmt: int = Field(description="매도체결금액", default=0)
-    BuyExecAmt: int = Field(description="매수체결금액", default=0)
-    SellExecQty: int = Field(description="매도체결수량", default=0)
-    BuyExecQty: int = Field(description="매수체결수량", default=0)
-    SellOrdQty: int = Field(description="매도주문수량", default=0)
-    BuyOrdQty: int = Field(description="매수주문수량", default=0)
-
-
-class CSPAQ13700OutBlock3(BaseModel):
-    OrdDt: str = Field(description="주문일", default="")
-    MgmtBrnNo: str = Field(description="관리지점번호", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    OrdNo: int = Field(description="주문번호", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    IsuNo: str = Field(description="종목번호", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    BnsTpNm: str = Field(description="매매구분", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    OrdPtnNm: str = Field(description="주문유형명", default="")
-    OrdTrxPtnCode: int = Field(description="주문처리유형코드", default=0)
-    OrdTrxPtnNm: str = Field(description="주문처리유형명", default="")
-    MrcTpCode: str = Field(description="정정취소구분", default="")
-    MrcTpNm: str = Field(description="정정취소구분명", default="")
-    MrcQty: int = Field(description="정정취소수량", default=0)
-    MrcAbleQty: int = Field(description="정정취소가능수량", default=0)
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    ExecQty: int = Field(description="체결수량", default=0)
-    ExecPrc: float = Field(description="체결가", default=0.0)
-    ExecTrxTime: str = Field(description="체결처리시각", default="")
-    LastExecTime: str = Field(description="최종체결시각", default="")
-    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
-    OrdprcPtnNm: str = Field(description="호가유형명", default="")
-    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
-    AllExecQty: int = Field(description="전체체결수량", default=0)
-    RegCommdaCode: str = Field(description="통신매체코드", default="")
-    CommdaNm: str = Field(description="통신매체명", default="")
-    MbrNo: str = Field(description="회원번호", default="")
-    RsvOrdYn: str = Field(description="예약주문여부", default="")
-    LoanDt: str = Field(description="대출일", default="")
-    OrdTime: str = Field(description="주문시각", default="")
-    OpDrtnNo: str = Field(description="운용지시번호", default="")
-    OdrrId: str = Field(description="주문자ID", default="")
-
-
-# 현물계좌주문체결내역조회
-class CSPAQ13700(BaseModel):
-    inblock1: CSPAQ13700InBlock1 = Field(description="CSPAQ13700InBlock1")
-    outblock1: CSPAQ13700OutBlock1 = Field(description="CSPAQ13700OutBlock1")
-    outblock2: CSPAQ13700OutBlock2 = Field(description="CSPAQ13700OutBlock2")
-    outblock3: List[CSPAQ13700OutBlock3] = Field(description="CSPAQ13700OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for CSPAQ13700",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAQ22200 - 현물계좌예수금 주문가능금액 총평가2>
-class CSPAQ22200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    MgmtBrnNo: str = Field(description="관리지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-
-
-class CSPAQ22200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    MgmtBrnNo: str = Field(description="관리지점번호", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    BalCreTp: str = Field(description="잔고생성구분", default="")
-
-
-class CSPAQ22200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    BrnNm: str = Field(description="지점명", default="")
-    AcntNm: str = Field(description="계좌명", default="")
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    SubstOrdAbleAmt: int = Field(description="대용주문가능금액", default=0)
-    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
-    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
-    CrdtPldgOrdAmt: int = Field(description="신용담보주문금액", default=0)
-    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
-    MgnRat35ordAbleAmt: int = Field(description="증거금률35%주문가능금액", default=0)
-    MgnRat50ordAbleAmt: int = Field(description="증거금률50%주문가능금액", default=0)
-    CrdtOrdAbleAmt: int = Field(description="신용주문가능금액", default=0)
-    Dps: int = Field(description="예수금", default=0)
-    SubstAmt: int = Field(description="대용금액", default=0)
-    MgnMny: int = Field(description="증거금현금", default=0)
-    MgnSubst: int = Field(description="증거금대용", default=0)
-    D1Dps: int = Field(description="D1예수금", default=0)
-    D2Dps: int = Field(description="D2예수금", default=0)
-    RcvblAmt: int = Field(description="미수금액", default=0)
-    D1ovdRepayRqrdAmt: int = Field(description="D1연체변제소요금액", default=0)
-    D2ovdRepayRqrdAmt: int = Field(description="D2연체변제소요금액", default=0)
-    MloanAmt: int = Field(description="융자금액", default=0)
-    ChgAfPldgRat: float = Field(description="변경후담보비율", default=0.0)
-    RqrdPldgAmt: int = Field(description="소요담보금액", default=0)
-    PdlckAmt: int = Field(description="담보부족금액", default=0)
-    OrgPldgSumAmt: int = Field(description="원담보합계금액", default=0)
-    SubPldgSumAmt: int = Field(description="부담보합계금액", default=0)
-    CrdtPldgAmtMny: int = Field(description="신용담보금현금", default=0)
-    CrdtPldgSubstAmt: int = Field(description="신용담보대용금액", default=0)
-    Imreq: int = Field(description="신용설정보증금", default=0)
-    CrdtPldgRuseAmt: int = Field(description="신용담보재사용금액", default=0)
-    DpslRestrcAmt: int = Field(description="처분제한금액", default=0)
-    PrdaySellAdjstAmt: int = Field(description="전일매도정산금액", default=0)
-    PrdayBuyAdjstAmt: int = Field(description="전일매수정산금액", default=0)
-    CrdaySellAdjstAmt: int = Field(description="금일매도정산금액", default=0)
-    CrdayBuyAdjstAmt: int = Field(description="금일매수정산금액", default=0)
-    CslLoanAmtdt1: int = Field(description="매도대금담보대출금액", default=0)
-
-
-# 현물계좌예수금 주문가능금액 총평가2
-class CSPAQ22200(BaseModel):
-    inblock1: CSPAQ22200InBlock1 = Field(description="CSPAQ22200InBlock1")
-    outblock1: CSPAQ22200OutBlock1 = Field(description="CSPAQ22200OutBlock1")
-    outblock2: CSPAQ22200OutBlock2 = Field(description="CSPAQ22200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAQ22200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAT00600 - 현물주문>
-class CSPAT00600InBlock1(BaseModel):
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    BnsTpCode: str = Field(description="매매구분", default="")
-    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
-    MgntrnCode: str = Field(description="신용거래코드", default="")
-    LoanDt: str = Field(description="대출일", default="")
-    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
-
-
-class CSPAT00600OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    BnsTpCode: str = Field(description="매매구분", default="")
-    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
-    PrgmOrdprcPtnCode: str = Field(description="프로그램호가유형코드", default="")
-    StslAbleYn: str = Field(description="공매도가능여부", default="")
-    StslOrdprcTpCode: str = Field(description="공매도호가구분", default="")
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    MgntrnCode: str = Field(description="신용거래코드", default="")
-    LoanDt: str = Field(description="대출일", default="")
-    MbrNo: str = Field(description="회원번호", default="")
-    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
-    StrtgCode: str = Field(description="전략코드", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    OrdSeqNo: int = Field(description="주문회차", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="아이템번호", default=0)
-    OpDrtnNo: str = Field(description="운용지시번호", default="")
-    LpYn: str = Field(description="유동성공급자여부", default="")
-    CvrgTpCode: str = Field(description="반대매매구분", default="")
-
-
-class CSPAT00600OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    ShtnIsuNo: str = Field(description="단축종목번호", default="")
-    MgempNo: str = Field(description="관리사원번호", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    SpareOrdNo: int = Field(description="예비주문번호", default=0)
-    CvrgSeqno: int = Field(description="반대매매일련번호", default=0)
-    RsvOrdNo: int = Field(description="예약주문번호", default=0)
-    SpotOrdQty: int = Field(description="실물주문수량", default=0)
-    RuseOrdQty: int = Field(description="재사용주문수량", default=0)
-    MnyOrdAmt: int = Field(description="현금주문금액", default=0)
-    SubstOrdAmt: int = Field(description="대용주문금액", default=0)
-    RuseOrdAmt: int = Field(description="재사용주문금액", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-
-
-# 현물주문
-class CSPAT00600(BaseModel):
-    inblock1: CSPAT00600InBlock1 = Field(description="CSPAT00600InBlock1")
-    outblock1: CSPAT00600OutBlock1 = Field(description="CSPAT00600OutBlock1")
-    outblock2: CSPAT00600OutBlock2 = Field(description="CSPAT00600OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAT00600",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAT00700 - 현물정정주문>
-class CSPAT00700InBlock1(BaseModel):
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
-    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-
-
-class CSPAT00700OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    OrdprcPtnCode: str = Field(description="호가유형코드", default="")
-    OrdCndiTpCode: str = Field(description="주문조건구분", default="")
-    OrdPrc: float = Field(description="주문가", default=0.0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    StrtgCode: str = Field(description="전략코드", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    OrdSeqNo: int = Field(description="주문회차", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="아이템번호", default=0)
-
-
-class CSPAT00700OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    PrntOrdNo: int = Field(description="모주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    ShtnIsuNo: str = Field(description="단축종목번호", default="")
-    PrgmOrdprcPtnCode: str = Field(description="프로그램호가유형코드", default="")
-    StslOrdprcTpCode: str = Field(description="공매도호가구분", default="")
-    StslAbleYn: str = Field(description="공매도가능여부", default="")
-    MgntrnCode: str = Field(description="신용거래코드", default="")
-    LoanDt: str = Field(description="대출일", default="")
-    CvrgOrdTp: str = Field(description="반대매매주문구분", default="")
-    LpYn: str = Field(description="유동성공급자여부", default="")
-    MgempNo: str = Field(description="관리사원번호", default="")
-    OrdAmt: int = Field(description="주문금액", default=0)
-    BnsTpCode: str = Field(description="매매구분", default="")
-    SpareOrdNo: int = Field(description="예비주문번호", default=0)
-    CvrgSeqno: int = Field(description="반대매매일련번호", default=0)
-    RsvOrdNo: int = Field(description="예약주문번호", default=0)
-    MnyOrdAmt: int = Field(description="현금주문금액", default=0)
-    SubstOrdAmt: int = Field(description="대용주문금액", default=0)
-    RuseOrdAmt: int = Field(description="재사용주문금액", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-
-
-# 현물정정주문
-class CSPAT00700(BaseModel):
-    inblock1: CSPAT00700InBlock1 = Field(description="CSPAT00700InBlock1")
-    outblock1: CSPAT00700OutBlock1 = Field(description="CSPAT00700OutBlock1")
-    outblock2: CSPAT00700OutBlock2 = Field(description="CSPAT00700OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAT00700",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPAT00800 - 현물취소주문>
-class CSPAT00800InBlock1(BaseModel):
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-
-
-class CSPAT00800OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrgOrdNo: int = Field(description="원주문번호", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdQty: int = Field(description="주문수량", default=0)
-    CommdaCode: str = Field(description="통신매체코드", default="")
-    GrpId: str = Field(description="그룹ID", default="")
-    StrtgCode: str = Field(description="전략코드", default="")
-    OrdSeqNo: int = Field(description="주문회차", default=0)
-    PtflNo: int = Field(description="포트폴리오번호", default=0)
-    BskNo: int = Field(description="바스켓번호", default=0)
-    TrchNo: int = Field(description="트렌치번호", default=0)
-    ItemNo: int = Field(description="아이템번호", default=0)
-
-
-class CSPAT00800OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    OrdNo: int = Field(description="주문번호", default=0)
-    PrntOrdNo: int = Field(description="모주문번호", default=0)
-    OrdTime: str = Field(description="주문시각", default="")
-    OrdMktCode: str = Field(description="주문시장코드", default="")
-    OrdPtnCode: str = Field(description="주문유형코드", default="")
-    ShtnIsuNo: str = Field(description="단축종목번호", default="")
-    PrgmOrdprcPtnCode: str = Field(description="프로그램호가유형코드", default="")
-    StslOrdprcTpCode: str = Field(description="공매도호가구분", default="")
-    StslAbleYn: str = Field(description="공매도가능여부", default="")
-    MgntrnCode: str = Field(description="신용거래코드", default="")
-    LoanDt: str = Field(description="대출일", default="")
-    CvrgOrdTp: str = Field(description="반대매매주문구분", default="")
-    LpYn: str = Field(description="유동성공급자여부", default="")
-    MgempNo: str = Field(description="관리사원번호", default="")
-    BnsTpCode: str = Field(description="매매구분", default="")
-    SpareOrdNo: int = Field(description="예비주문번호", default=0)
-    CvrgSeqno: int = Field(description="반대매매일련번호", default=0)
-    RsvOrdNo: int = Field(description="예약주문번호", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-
-
-# 현물취소주문
-class CSPAT00800(BaseModel):
-    inblock1: CSPAT00800InBlock1 = Field(description="CSPAT00800InBlock1")
-    outblock1: CSPAT00800OutBlock1 = Field(description="CSPAT00800OutBlock1")
-    outblock2: CSPAT00800OutBlock2 = Field(description="CSPAT00800OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPAT00800",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CSPBQ00200 - 현물계좌증거금률별주문가능수량조회>
-class CSPBQ00200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    BnsTpCode: str = Field(description="매매구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    RegCommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CSPBQ00200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    BnsTpCode: str = Field(description="매매구분", default="")
-    AcntNo: str = Field(description="계좌번호", default="")
-    InptPwd: str = Field(description="입력비밀번호", default="")
-    IsuNo: str = Field(description="종목번호", default="")
-    OrdPrc: float = Field(description="주문가격", default=0.0)
-    RegCommdaCode: str = Field(description="통신매체코드", default="")
-
-
-class CSPBQ00200OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    IsuNm: str = Field(description="종목명", default="")
-    Dps: int = Field(description="예수금", default=0)
-    SubstAmt: int = Field(description="대용금액", default=0)
-    CrdtPldgRuseAmt: int = Field(description="신용담보재사용금액", default=0)
-    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
-    SubstOrdAbleAmt: int = Field(description="대용주문가능금액", default=0)
-    MnyMgn: int = Field(description="현금증거금액", default=0)
-    SubstMgn: int = Field(description="대용증거금액", default=0)
-    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
-    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
-    PrsmptDpsD1: int = Field(description="추정예수금(D+1)", default=0)
-    PrsmptDpsD2: int = Field(description="추정예수금(D+2)", default=0)
-    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
-    RcvblAmt: int = Field(description="미수금액", default=0)
-    CmsnRat: float = Field(description="수수료율", default=0.0)
-    AddLevyAmt: int = Field(description="추가징수금액", default=0)
-    RuseObjAmt: int = Field(description="재사용대상금액", default=0)
-    MnyRuseObjAmt: int = Field(description="현금재사용대상금액", default=0)
-    FirmMgnRat: float = Field(description="이용사증거금률", default=0.0)
-    SubstRuseObjAmt: int = Field(description="대용재사용대상금액", default=0)
-    IsuMgnRat: float = Field(description="종목증거금률", default=0.0)
-    AcntMgnRat: float = Field(description="계좌증거금률", default=0.0)
-    TrdMgnrt: float = Field(description="거래증거금률", default=0.0)
-    Cmsn: int = Field(description="수수료", default=0)
-    MgnRat20pctOrdAbleAmt: int = Field(description="증거금률20퍼센트주문가능금액", default=0)
-    MgnRat20OrdAbleQty: int = Field(description="증거금률100퍼센트현금주문가능수량?", default=0)
-    MgnRat30pctOrdAbleAmt: int = Field(description="증거금률30퍼센트주문가능금액", default=0)
-    MgnRat30OrdAbleQty: int = Field(description="증거금률30퍼센트주문가능수량??", default=0)
-    MgnRat40pctOrdAbleAmt: int = Field(description="증거금률40퍼센트주문가능금액", default=0)
-    MgnRat40OrdAbleQty: int = Field(description="증거금률40퍼센트주문가능수량??", default=0)
-    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
-    MgnRat100OrdAbleQty: int = Field(description="증거금률100퍼센트주문가능수량??", default=0)
-    MgnRat100MnyOrdAbleAmt: int = Field(description="증거금률100퍼센트현금주문가능금액?", default=0)
-    MgnRat100MnyOrdAbleQty: int = Field(description="증거금률100퍼센트현금주문가능수량", default=0)
-    MgnRat20pctRuseAbleAmt: int = Field(description="증거금률20퍼센트재사용가능금액", default=0)
-    MgnRat30pctRuseAbleAmt: int = Field(description="증거금률30퍼센트재사용가능금액", default=0)
-    MgnRat40pctRuseAbleAmt: int = Field(description="증거금률40퍼센트재사용가능금액", default=0)
-    MgnRat100pctRuseAbleAmt: int = Field(description="증거금률100퍼센트재사용가능금액", default=0)
-    OrdAbleQty: int = Field(description="주문가능수량", default=0)
-    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
-
-
-# 현물계좌증거금률별주문가능수량조회
-class CSPBQ00200(BaseModel):
-    inblock1: CSPBQ00200InBlock1 = Field(description="CSPBQ00200InBlock1")
-    outblock1: CSPBQ00200OutBlock1 = Field(description="CSPBQ00200OutBlock1")
-    outblock2: CSPBQ00200OutBlock2 = Field(description="CSPBQ00200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for CSPBQ00200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <CUR - 현물정보 USD 실시간(CUR)>
-class CURInBlock(BaseModel):
-    base_id: str = Field(description="기초자산ID", default="")
-
-
-class CUROutBlock(BaseModel):
-    time: str = Field(description="전송시간", default="")
-    offer: float = Field(description="매도호가", default=0.0)
-    bid: float = Field(description="매수호가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    price: float = Field(description="체결가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    drate: float = Field(description="등락율", default=0.0)
-    ctime: str = Field(description="데이타 발생시간", default="")
-    base_id: str = Field(description="기초자산ID", default="")
-
-
-# 현물정보 USD 실시간(CUR)
-class CUR(BaseModel):
-    inblock: CURInBlock = Field(description="CURInBlock")
-    outblock: CUROutBlock = Field(description="CUROutBlock")
-    metadata: dict = Field(
-        description="The metadata information for CUR",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <ChartExcel - 챠트엑셀데이터조회>
-class ChartExcelInBlock(BaseModel):
-    indexid: int = Field(description="지표ID", default=0)
-    indexname: str = Field(description="지표명", default="")
-    indexparam: str = Field(description="지표조건설정", default="")
-    indexouttype: str = Field(description="결과데이터 구분", default="")
-    market: str = Field(description="시장구분", default="")
-    period: str = Field(description="주기구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    isexcelout: str = Field(description="결과 지표데이터 엑셀표시 여부", default="")
-    excelfilename: str = Field(description="엑셀데이터 파일명", default="")
-    IsReal: str = Field(description="실시간 데이터수신 자동등록 여부", default="")
-
-
-class ChartExcelOutBlock(BaseModel):
-    indexid: int = Field(description="지표ID", default=0)
-    rec_cnt: int = Field(description="레코드갯수", default=0)
-    validdata_cnt: int = Field(description="유효 데이터 컬럼 갯수", default=0)
-
-
-class ChartExcelOutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    value1: float = Field(description="지표값1", default=0.0)
-    value2: float = Field(description="지표값2", default=0.0)
-    value3: float = Field(description="지표값3", default=0.0)
-    value4: float = Field(description="지표값4", default=0.0)
-    value5: float = Field(description="지표값5", default=0.0)
-    pos: int = Field(description="위치", default=0)
-
-
-# 챠트엑셀데이터조회
-class ChartExcel(BaseModel):
-    inblock: ChartExcelInBlock = Field(description="ChartExcelInBlock")
-    outblock: ChartExcelOutBlock = Field(description="ChartExcelOutBlock")
-    outblock1: List[ChartExcelOutBlock1] = Field(description="ChartExcelOutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for ChartExcel",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <ChartIndex - 챠트지표데이터조회>
-class ChartIndexInBlock(BaseModel):
-    indexid: int = Field(description="지표ID", default=0)
-    indexname: str = Field(description="지표명", default="")
-    indexparam: str = Field(description="지표조건설정", default="")
-    market: str = Field(description="시장구분", default="")
-    period: str = Field(description="주기구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    qrycnt: int = Field(description="요청건수(최대 500개)", default=0)
-    ncnt: int = Field(description="단위(n틱/n분)", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    Isamend: str = Field(description="수정주가 반영 여부", default="")
-    Isgab: str = Field(description="갭보정 여부", default="")
-    IsReal: str = Field(description="실시간 데이터수신 자동등록 여부", default="")
-
-
-class ChartIndexOutBlock(BaseModel):
-    indexid: int = Field(description="지표ID", default=0)
-    rec_cnt: int = Field(description="레코드갯수", default=0)
-    validdata_cnt: int = Field(description="유효 데이터 컬럼 갯수", default=0)
-
-
-class ChartIndexOutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    value1: float = Field(description="지표값1", default=0.0)
-    value2: float = Field(description="지표값2", default=0.0)
-    value3: float = Field(description="지표값3", default=0.0)
-    value4: float = Field(description="지표값4", default=0.0)
-    value5: float = Field(description="지표값5", default=0.0)
-    pos: int = Field(description="위치", default=0)
-
-
-# 챠트지표데이터조회
-class ChartIndex(BaseModel):
-    inblock: ChartIndexInBlock = Field(description="ChartIndexInBlock")
-    outblock: ChartIndexOutBlock = Field(description="ChartIndexOutBlock")
-    outblock1: List[ChartIndexOutBlock1] = Field(description="ChartIndexOutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for ChartIndex",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <DH1 - KOSPI시간외단일가호가잔량(DH1)>
-class DH1InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class DH1OutBlock(BaseModel):
-    dan_hotime: str = Field(description="시간외단일가호가시간", default="")
-    dan_hstatus: str = Field(description="시간외단일가장구분", default="")
-    dan_offerho1: int = Field(description="시간외단일가매도호가1", default=0)
-    dan_bidho1: int = Field(description="시간외단일가매수호가1", default=0)
-    dan_offerrem1: int = Field(description="시간외단일가매도호가잔량1", default=0)
-    dan_bidrem1: int = Field(description="시간외단일가매수호가잔량1", default=0)
-    dan_preoffercha1: int = Field(description="시간외단일가직전매도대비수량1", default=0)
-    dan_prebidcha1: int = Field(description="시간외단일가직전매수대비수량1", default=0)
-    dan_offerho2: int = Field(description="시간외단일가매도호가2", default=0)
-    dan_bidho2: int = Field(description="시간외단일가매수호가2", default=0)
-    dan_offerrem2: int = Field(description="시간외단일가매도호가잔량2", default=0)
-    dan_bidrem2: int = Field(description="시간외단일가매수호가잔량2", default=0)
-    dan_preoffercha2: int = Field(description="시간외단일가직전매도대비수량2", default=0)
-    dan_prebidcha2: int = Field(description="시간외단일가직전매수대비수량2", default=0)
-    dan_offerho3: int = Field(description="시간외단일가매도호가3", default=0)
-    dan_bidho3: int = Field(description="시간외단일가매수호가3", default=0)
-    dan_offerrem3: int = Field(description="시간외단일가매도호가잔량3", default=0)
-    dan_bidrem3: int = Field(description="시간외단일가매수호가잔량3", default=0)
-    dan_preoffercha3: int = Field(description="시간외단일가직전매도대비수량3", default=0)
-    dan_prebidcha3: int = Field(description="시간외단일가직전매수대비수량3", default=0)
-    dan_offerho4: int = Field(description="시간외단일가매도호가4", default=0)
-    dan_bidho4: int = Field(description="시간외단일가매수호가4", default=0)
-    dan_offerrem4: int = Field(description="시간외단일가매도호가잔량4", default=0)
-    dan_bidrem4: int = Field(description="시간외단일가매수호가잔량4", default=0)
-    dan_preoffercha4: int = Field(description="시간외단일가직전매도대비수량4", default=0)
-    dan_prebidcha4: int = Field(description="시간외단일가직전매수대비수량4", default=0)
-    dan_offerho5: int = Field(description="시간외단일가매도호가5", default=0)
-    dan_bidho5: int = Field(description="시간외단일가매수호가5", default=0)
-    dan_offerrem5: int = Field(description="시간외단일가매도호가잔량5", default=0)
-    dan_bidrem5: int = Field(description="시간외단일가매수호가잔량5", default=0)
-    dan_preoffercha5: int = Field(description="시간외단일가직전매도대비수량5", default=0)
-    dan_prebidcha5: int = Field(description="시간외단일가직전매수대비수량5", default=0)
-    dan_totofferrem: int = Field(description="시간외단일가총매도호가잔량", default=0)
-    dan_totbidrem: int = Field(description="시간외단일가총매수호가잔량", default=0)
-    dan_preoffercha: int = Field(description="시간외단일가직전매도호가총대비수량", default=0)
-    dan_prebidcha: int = Field(description="시간외단일가직전매수호가총대비수량", default=0)
-    dan_yeprice: int = Field(description="시간외단일가예상체결가격", default=0)
-    dan_yevolume: int = Field(description="시간외단일가예상체결수량", default=0)
-    dan_preysign: str = Field(description="시간외단일가예상가직전가대비구분", default="")
-    dan_preychange: int = Field(description="시간외단일가예상가직전가대비", default=0)
-    dan_jnilysign: str = Field(description="시간외단일가예상가전일가대비구분", default="")
-    dan_jnilychange: int = Field(description="시간외단일가예상가전일가대비", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# KOSPI시간외단일가호가잔량(DH1)
-class DH1(BaseModel):
-    inblock: DH1InBlock = Field(description="DH1InBlock")
-    outblock: DH1OutBlock = Field(description="DH1OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for DH1",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <DHA - KOSDAQ시간외단일가호가잔량(DHA)>
-class DHAInBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class DHAOutBlock(BaseModel):
-    dan_hotime: str = Field(description="시간외단일가호가시간", default="")
-    dan_hstatus: str = Field(description="시간외단일가장구분", default="")
-    dan_offerho1: int = Field(description="시간외단일가매도호가1", default=0)
-    dan_bidho1: int = Field(description="시간외단일가매수호가1", default=0)
-    dan_offerrem1: int = Field(description="시간외단일가매도호가잔량1", default=0)
-    dan_bidrem1: int = Field(description="시간외단일가매수호가잔량1", default=0)
-    dan_preoffercha1: int = Field(description="시간외단일가직전매도대비수량1", default=0)
-    dan_prebidcha1: int = Field(description="시간외단일가직전매수대비수량1", default=0)
-    dan_offerho2: int = Field(description="시간외단일가매도호가2", default=0)
-    dan_bidho2: int = Field(description="시간외단일가매수호가2", default=0)
-    dan_offerrem2: int = Field(description="시간외단일가매도호가잔량2", default=0)
-    dan_bidrem2: int = Field(description="시간외단일가매수호가잔량2", default=0)
-    dan_preoffercha2: int = Field(description="시간외단일가직전매도대비수량2", default=0)
-    dan_prebidcha2: int = Field(description="시간외단일가직전매수대비수량2", default=0)
-    dan_offerho3: int = Field(description="시간외단일가매도호가3", default=0)
-    dan_bidho3: int = Field(description="시간외단일가매수호가3", default=0)
-    dan_offerrem3: int = Field(description="시간외단일가매도호가잔량3", default=0)
-    dan_bidrem3: int = Field(description="시간외단일가매수호가잔량3", default=0)
-    dan_preoffercha3: int = Field(description="시간외단일가직전매도대비수량3", default=0)
-    dan_prebidcha3: int = Field(description="시간외단일가직전매수대비수량3", default=0)
-    dan_offerho4: int = Field(description="시간외단일가매도호가4", default=0)
-    dan_bidho4: int = Field(description="시간외단일가매수호가4", default=0)
-    dan_offerrem4: int = Field(description="시간외단일가매도호가잔량4", default=0)
-    dan_bidrem4: int = Field(description="시간외단일가매수호가잔량4", default=0)
-    dan_preoffercha4: int = Field(description="시간외단일가직전매도대비수량4", default=0)
-    dan_prebidcha4: int = Field(description="시간외단일가직전매수대비수량4", default=0)
-    dan_offerho5: int = Field(description="시간외단일가매도호가5", default=0)
-    dan_bidho5: int = Field(description="시간외단일가매수호가5", default=0)
-    dan_offerrem5: int = Field(description="시간외단일가매도호가잔량5", default=0)
-    dan_bidrem5: int = Field(description="시간외단일가매수호가잔량5", default=0)
-    dan_preoffercha5: int = Field(description="시간외단일가직전매도대비수량5", default=0)
-    dan_prebidcha5: int = Field(description="시간외단일가직전매수대비수량5", default=0)
-    dan_totofferrem: int = Field(description="시간외단일가총매도호가잔량", default=0)
-    dan_totbidrem: int = Field(description="시간외단일가총매수호가잔량", default=0)
-    dan_preoffercha: int = Field(description="시간외단일가직전매도호가총대비수량", default=0)
-    dan_prebidcha: int = Field(description="시간외단일가직전매수호가총대비수량", default=0)
-    dan_yeprice: int = Field(description="시간외단일가예상체결가격", default=0)
-    dan_yevolume: int = Field(description="시간외단일가예상체결수량", default=0)
-    dan_preysign: str = Field(description="시간외단일가예상가직전가대비구분", default="")
-    dan_preychange: int = Field(description="시간외단일가예상가직전가대비", default=0)
-    dan_jnilysign: str = Field(description="시간외단일가예상가전일가대비구분", default="")
-    dan_jnilychange: int = Field(description="시간외단일가예상가전일가대비", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# KOSDAQ시간외단일가호가잔량(DHA)
-class DHA(BaseModel):
-    inblock: DHAInBlock = Field(description="DHAInBlock")
-    outblock: DHAOutBlock = Field(description="DHAOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for DHA",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <DK3 - KOSDAQ시간외단일가체결(DK3)>
-class DK3InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class DK3OutBlock(BaseModel):
-    dan_chetime: str = Field(description="시간외단일가체결시간", default="")
-    dan_sign: str = Field(description="시간외단일가전일대비구분", default="")
-    dan_change: int = Field(description="시간외단일가전일대비", default=0)
-    dan_drate: float = Field(description="시간외단일가등락율", default=0.0)
-    dan_price: int = Field(description="시간외단일가현재가", default=0)
-    dan_opentime: str = Field(description="시간외단일가시가시간", default="")
-    dan_open: int = Field(description="시간외단일가시가", default=0)
-    dan_hightime: str = Field(description="시간외단일가고가시간", default="")
-    dan_high: int = Field(description="시간외단일가고가", default=0)
-    dan_lowtime: str = Field(description="시간외단일가저가시간", default="")
-    dan_low: int = Field(description="시간외단일가저가", default=0)
-    dan_cgubun: str = Field(description="시간외단일가체결구분", default="")
-    dan_cvolume: int = Field(description="시간외단일가체결량", default=0)
-    dan_volume: int = Field(description="시간외단일가누적거래량", default=0)
-    dan_value: int = Field(description="시간외단일가누적거래대금", default=0)
-    dan_mdvolume: int = Field(description="시간외단일가매도누적체결량", default=0)
-    dan_mdchecnt: int = Field(description="시간외단일가매도누적체결건수", default=0)
-    dan_msvolume: int = Field(description="시간외단일가매수누적체결량", default=0)
-    dan_mschecnt: int = Field(description="시간외단일가매수누적체결건수", default=0)
-    dan_prevolume: int = Field(description="시간외단일가직전거래량", default=0)
-    dan_precvolume: int = Field(description="시간외단일가직전체결수량", default=0)
-    dan_cpower: float = Field(description="시간외단일가체결강도", default=0.0)
-    dan_status: str = Field(description="시간외단일가장정보", default="")
-    shcode: str = Field(description="단축코드", default="")
-
-
-# KOSDAQ시간외단일가체결(DK3)
-class DK3(BaseModel):
-    inblock: DK3InBlock = Field(description="DK3InBlock")
-    outblock: DK3OutBlock = Field(description="DK3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for DK3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <DS3 - KOSPI시간외단일가체결(DS3)>
-class DS3InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class DS3OutBlock(BaseModel):
-    dan_chetime: str = Field(description="시간외단일가체결시간", default="")
-    dan_sign: str = Field(description="시간외단일가전일대비구분", default="")
-    dan_change: int = Field(description="시간외단일가전일대비", default=0)
-    dan_drate: float = Field(description="시간외단일가등락율", default=0.0)
-    dan_price: int = Field(description="시간외단일가현재가", default=0)
-    dan_opentime: str = Field(description="시간외단일가시가시간", default="")
-    dan_open: int = Field(description="시간외단일가시가", default=0)
-    dan_hightime: str = Field(description="시간외단일가고가시간", default="")
-    dan_high: int = Field(description="시간외단일가고가", default=0)
-    dan_lowtime: str = Field(description="시간외단일가저가시간", default="")
-    dan_low: int = Field(description="시간외단일가저가", default=0)
-    dan_cgubun: str = Field(description="시간외단일가체결구분", default="")
-    dan_cvolume: int = Field(description="시간외단일가체결량", default=0)
-    dan_volume: int = Field(description="시간외단일가누적거래량", default=0)
-    dan_value: int = Field(description="시간외단일가누적거래대금", default=0)
-    dan_mdvolume: int = Field(description="시간외단일가매도누적체결량", default=0)
-    dan_mdchecnt: int = Field(description="시간외단일가매도누적체결건수", default=0)
-    dan_msvolume: int = Field(description="시간외단일가매수누적체결량", default=0)
-    dan_mschecnt: int = Field(description="시간외단일가매수누적체결건수", default=0)
-    dan_prevolume: int = Field(description="시간외단일가직전거래량", default=0)
-    dan_precvolume: int = Field(description="시간외단일가직전체결수량", default=0)
-    dan_cpower: float = Field(description="시간외단일가체결강도", default=0.0)
-    dan_status: str = Field(description="시간외단일가장정보", default="")
-    shcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI시간외단일가체결(DS3)
-class DS3(BaseModel):
-    inblock: DS3InBlock = Field(description="DS3InBlock")
-    outblock: DS3OutBlock = Field(description="DS3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for DS3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <DVI - 시간외단일가VI발동해제(DVI)>
-class DVIInBlock(BaseModel):
-    shcode: str = Field(description="단축코드(KEY)", default="")
-
-
-class DVIOutBlock(BaseModel):
-    vi_gubun: str = Field(description="구분(0:해제 1:정적발동 2:동적발동 3:정적&동적)", default="")
-    svi_recprice: int = Field(description="정적VI발동기준가격", default=0)
-    dvi_recprice: int = Field(description="동적VI발동기준가격", default=0)
-    vi_trgprice: int = Field(description="VI발동가격", default=0)
-    shcode: str = Field(description="단축코드(KEY)", default="")
-    ref_shcode: str = Field(description="참조코드(미사용)", default="")
-    time: str = Field(description="시간", default="")
-
-
-# 시간외단일가VI발동해제(DVI)
-class DVI(BaseModel):
-    inblock: DVIInBlock = Field(description="DVIInBlock")
-    outblock: DVIOutBlock = Field(description="DVIOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for DVI",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <EC0 - EUREX연계KP200지수옵션선물체결(EC0)>
-class EC0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class EC0OutBlock(BaseModel):
-    chetime: str = Field(description="체결시간(24시간)", default="")
-    chetime1: str = Field(description="체결시간(36시간)", default="")
-    sign: str = Field(description="정규장종가대비구분", default="")
-    change: float = Field(description="정규장종가대비", default=0.0)
-    drate: float = Field(description="정규장종가기준등락율", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    cgubun: str = Field(description="체결구분", default="")
-    cvolume: int = Field(description="체결량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="누적거래대금(미제공)", default=0)
-    mdvolume: int = Field(description="매도누적체결량", default=0)
-    mdchecnt: int = Field(description="매도누적체결건수(미제공)", default=0)
-    msvolume: int = Field(description="매수누적체결량", default=0)
-    mschecnt: int = Field(description="매수누적체결건수(미제공)", default=0)
-    cpower: float = Field(description="체결강도", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    openyak: int = Field(description="미결제약정수량", default=0)
-    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
-    eqva: float = Field(description="KOSPI등가", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    openyakcha: int = Field(description="미결제약정증감", default=0)
-    timevalue: float = Field(description="시간가치", default=0.0)
-    jgubun: str = Field(description="장운영정보", default="")
-    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
-    optcode: str = Field(description="단축코드", default="")
-
-
-# EUREX연계KP200지수옵션선물체결(EC0)
-class EC0(BaseModel):
-    inblock: EC0InBlock = Field(description="EC0InBlock")
-    outblock: EC0OutBlock = Field(description="EC0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for EC0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <EH0 - EUREX연계KP200지수옵션선물호가(EH0)>
-class EH0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class EH0OutBlock(BaseModel):
-    hotime: str = Field(description="호가시간(24시간)", default="")
-    hotime1: str = Field(description="호가시간(36시간)", default="")
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt1: int = Field(description="매도호가건수1(미제공)", default=0)
-    bidcnt1: int = Field(description="매수호가건수1(미제공)", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offercnt2: int = Field(description="매도호가건수2(미제공)", default=0)
-    bidcnt2: int = Field(description="매수호가건수2(미제공)", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offercnt3: int = Field(description="매도호가건수3(미제공)", default=0)
-    bidcnt3: int = Field(description="매수호가건수3(미제공)", default=0)
-    offerho4: float = Field(description="매도호가4(미제공)", default=0.0)
-    bidho4: float = Field(description="매수호가4(미제공)", default=0.0)
-    offerrem4: int = Field(description="매도호가수량4(미제공)", default=0)
-    bidrem4: int = Field(description="매수호가수량4(미제공)", default=0)
-    offercnt4: int = Field(description="매도호가건수4(미제공)", default=0)
-    bidcnt4: int = Field(description="매수호가건수4(미제공)", default=0)
-    offerho5: float = Field(description="매도호가5(미제공)", default=0.0)
-    bidho5: float = Field(description="매수호가5(미제공)", default=0.0)
-    offerrem5: int = Field(description="매도호가수량5(미제공)", default=0)
-    bidrem5: int = Field(description="매수호가수량5(미제공)", default=0)
-    offercnt5: int = Field(description="매도호가건수5(미제공)", default=0)
-    bidcnt5: int = Field(description="매수호가건수5(미제공)", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    optcode: str = Field(description="단축코드", default="")
-    danhochk: str = Field(description="단일가호가여부", default="")
-
-
-# EUREX연계KP200지수옵션선물호가(EH0)
-class EH0(BaseModel):
-    inblock: EH0InBlock = Field(description="EH0InBlock")
-    outblock: EH0OutBlock = Field(description="EH0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for EH0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <ESN - 뉴ELW투자지표민감도(ESN)>
-class ESNInBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class ESNOutBlock(BaseModel):
-    time: str = Field(description="시간", default="")
-    theoryprice: float = Field(description="장중이론가", default=0.0)
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    ceta: float = Field(description="세타", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    rhox: float = Field(description="로우", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    egearing: float = Field(description="E.기어링", default=0.0)
-    shcode: str = Field(description="단축코드", default="")
-    elwclose: int = Field(description="ELW현재가", default=0)
-    sign: str = Field(description="ELW전일대비구분", default="")
-    change: int = Field(description="ELW전일대비", default=0)
-    date: str = Field(description="일자", default="")
-    tickvalue: float = Field(description="틱환산", default=0.0)
-    lp_impv: float = Field(description="LP내재변동성", default=0.0)
-
-
-# 뉴ELW투자지표민감도(ESN)
-class ESN(BaseModel):
-    inblock: ESNInBlock = Field(description="ESNInBlock")
-    outblock: ESNOutBlock = Field(description="ESNOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for ESN",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <EU0 - EUX접수>
-class EU0OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    trcode1: str = Field(description="tr코드", default="")
-    firmno: str = Field(description="회사번호", default="")
-    acntno: str = Field(description="계좌번호", default="")
-    acntno1: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    brnno: str = Field(description="지점번호", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordno1: str = Field(description="주문번호", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno1: str = Field(description="원주문번호", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    prntordno: str = Field(description="모주문번호", default="")
-    prntordno1: int = Field(description="모주문번호", default=0)
-    isuno: str = Field(description="종목번호", default="")
-    fnoIsuno: str = Field(description="선물옵션종목번호", default="")
-    fnoIsunm: str = Field(description="선물옵션종목명", default="")
-    pdgrpcode: str = Field(description="상품군분류코드", default="")
-    fnoIsuptntp: str = Field(description="선물옵션종목유형구분", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    mrctp: str = Field(description="정정취소구분", default="")
-    ordqty: int = Field(description="주문수량", default=0)
-    hogatype: str = Field(description="호가유형코드", default="")
-    mmgb: str = Field(description="거래유형코드", default="")
-    ordprc: float = Field(description="주문가격", default=0.0)
-    unercqty: int = Field(description="미체결수량", default=0)
-    commdacode: str = Field(description="통신매체", default="")
-    peeamtcode: str = Field(description="수수료합산코드", default="")
-    mgempno: str = Field(description="관리사원", default="")
-    fnotrdunitamt: float = Field(description="선물옵션거래단위금액", default=0.0)
-    trxtime: str = Field(description="처리시각", default="")
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: str = Field(description="주문회차", default="")
-    ptflno: str = Field(description="포트폴리오 번호", default="")
-    bskno: str = Field(description="바스켓번호", default="")
-    trchno: str = Field(description="트렌치번호", default="")
-    Itemno: str = Field(description="아이템번호", default="")
-    OrderID: str = Field(description="주문자Id", default="")
-    opdrtnno: str = Field(description="운영지시번호", default="")
-    rjtcode: str = Field(description="부적격코드", default="")
-    mrccnfqty: int = Field(description="정정취소확인수량", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmrcqty: int = Field(description="원주문정정취소수량", default=0)
-    ctrcttime: str = Field(description="약정시각(체결시각)", default="")
-    ctrctno: str = Field(description="약정번호", default="")
-    execprc: float = Field(description="체결가격", default=0.0)
-    execqty: int = Field(description="체결수량", default=0)
-    newqty: int = Field(description="신규체결수량", default=0)
-    qdtqty: int = Field(description="청산체결수량", default=0)
-    lastqty: int = Field(description="최종결제수량", default=0)
-    lallexecqty: int = Field(description="전체체결수량", default=0)
-    allexecamt: int = Field(description="전체체결금액", default=0)
-    fnobalevaltp: str = Field(description="잔고평가구분", default="")
-    bnsplamt: int = Field(description="매매손익금액", default=0)
-    fnoIsuno1: str = Field(description="선물옵션종목번호1", default="")
-    bnstp1: str = Field(description="매매구분1", default="")
-    execprc1: float = Field(description="체결가1", default=0.0)
-    newqty1: int = Field(description="신규체결수량1", default=0)
-    qdtqty1: int = Field(description="청산체결수량1", default=0)
-    allexecamt1: int = Field(description="전체체결금액1", default=0)
-    fnoIsuno2: str = Field(description="선물옵션종목번호2", default="")
-    bnstp2: str = Field(description="매매구분2", default="")
-    execprc2: float = Field(description="체결가2", default=0.0)
-    newqty2: int = Field(description="신규체결수량2", default=0)
-    lqdtqty2: int = Field(description="청산체결수량2", default=0)
-    allexecamt2: int = Field(description="전체체결금액2", default=0)
-    dps: int = Field(description="예수금", default=0)
-    ftsubtdsgnamt: int = Field(description="선물대용지정금액", default=0)
-    mgn: int = Field(description="증거금", default=0)
-    mnymgn: int = Field(description="증거금현금", default=0)
-    ordableamt: int = Field(description="주문가능금액", default=0)
-    mnyordableamt: int = Field(description="주문가능현금액", default=0)
-    fnoIsuno_1: str = Field(description="잔고 종목번호1", default="")
-    bnstp_1: str = Field(description="잔고 매매구분1", default="")
-    unsttqty_1: int = Field(description="미결제수량1", default=0)
-    lqdtableqty_1: int = Field(description="주문가능수량1", default=0)
-    avrprc_1: float = Field(description="평균가1", default=0.0)
-    fnoIsuno_2: str = Field(description="잔고 종목번호2", default="")
-    bnstp_2: str = Field(description="잔고 매매구분2", default="")
-    unsttqty_2: int = Field(description="미결제수량2", default=0)
-    lqdtableqty_2: int = Field(description="주문가능수량2", default=0)
-    avrprc_2: float = Field(description="평균가2", default=0.0)
-
-
-# EUX접수
-class EU0(BaseModel):
-    outblock: EU0OutBlock = Field(description="EU0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for EU0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <EU1 - EUX체결>
-class EU1OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    trcode1: str = Field(description="tr코드", default="")
-    firmno: str = Field(description="회사번호", default="")
-    acntno: str = Field(description="계좌번호", default="")
-    acntno1: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    brnno: str = Field(description="지점번호", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordno1: str = Field(description="주문번호", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno1: str = Field(description="원주문번호", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    prntordno: str = Field(description="모주문번호", default="")
-    prntordno1: int = Field(description="모주문번호", default=0)
-    isuno: str = Field(description="종목번호", default="")
-    fnoIsuno: str = Field(description="선물옵션종목번호", default="")
-    fnoIsunm: str = Field(description="선물옵션종목명", default="")
-    pdgrpcode: str = Field(description="상품군분류코드", default="")
-    fnoIsuptntp: str = Field(description="선물옵션종목유형구분", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    mrctp: str = Field(description="정정취소구분", default="")
-    ordqty: int = Field(description="주문수량", default=0)
-    hogatype: str = Field(description="호가유형코드", default="")
-    mmgb: str = Field(description="거래유형코드", default="")
-    ordprc: float = Field(description="주문가격", default=0.0)
-    unercqty: int = Field(description="미체결수량", default=0)
-    commdacode: str = Field(description="통신매체", default="")
-    peeamtcode: str = Field(description="수수료합산코드", default="")
-    mgempno: str = Field(description="관리사원", default="")
-    fnotrdunitamt: float = Field(description="선물옵션거래단위금액", default=0.0)
-    trxtime: str = Field(description="처리시각", default="")
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: str = Field(description="주문회차", default="")
-    ptflno: str = Field(description="포트폴리오 번호", default="")
-    bskno: str = Field(description="바스켓번호", default="")
-    trchno: str = Field(description="트렌치번호", default="")
-    Itemno: str = Field(description="아이템번호", default="")
-    OrderID: str = Field(description="주문자Id", default="")
-    opdrtnno: str = Field(description="운영지시번호", default="")
-    rjtcode: str = Field(description="부적격코드", default="")
-    mrccnfqty: int = Field(description="정정취소확인수량", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmrcqty: int = Field(description="원주문정정취소수량", default=0)
-    ctrcttime: str = Field(description="약정시각(체결시각)", default="")
-    ctrctno: str = Field(description="약정번호", default="")
-    execprc: float = Field(description="체결가격", default=0.0)
-    execqty: int = Field(description="체결수량", default=0)
-    newqty: int = Field(description="신규체결수량", default=0)
-    qdtqty: int = Field(description="청산체결수량", default=0)
-    lastqty: int = Field(description="최종결제수량", default=0)
-    lallexecqty: int = Field(description="전체체결수량", default=0)
-    allexecamt: int = Field(description="전체체결금액", default=0)
-    fnobalevaltp: str = Field(description="잔고평가구분", default="")
-    bnsplamt: int = Field(description="매매손익금액", default=0)
-    fnoIsuno1: str = Field(description="선물옵션종목번호1", default="")
-    bnstp1: str = Field(description="매매구분1", default="")
-    execprc1: float = Field(description="체결가1", default=0.0)
-    newqty1: int = Field(description="신규체결수량1", default=0)
-    qdtqty1: int = Field(description="청산체결수량1", default=0)
-    allexecamt1: int = Field(description="전체체결금액1", default=0)
-    fnoIsuno2: str = Field(description="선물옵션종목번호2", default="")
-    bnstp2: str = Field(description="매매구분2", default="")
-    execprc2: float = Field(description="체결가2", default=0.0)
-    newqty2: int = Field(description="신규체결수량2", default=0)
-    lqdtqty2: int = Field(description="청산체결수량2", default=0)
-    allexecamt2: int = Field(description="전체체결금액2", default=0)
-    dps: int = Field(description="예수금", default=0)
-    ftsubtdsgnamt: int = Field(description="선물대용지정금액", default=0)
-    mgn: int = Field(description="증거금", default=0)
-    mnymgn: int = Field(description="증거금현금", default=0)
-    ordableamt: int = Field(description="주문가능금액", default=0)
-    mnyordableamt: int = Field(description="주문가능현금액", default=0)
-    fnoIsuno_1: str = Field(description="잔고 종목번호1", default="")
-    bnstp_1: str = Field(description="잔고 매매구분1", default="")
-    unsttqty_1: int = Field(description="미결제수량1", default=0)
-    lqdtableqty_1: int = Field(description="주문가능수량1", default=0)
-    avrprc_1: float = Field(description="평균가1", default=0.0)
-    fnoIsuno_2: str = Field(description="잔고 종목번호2", default="")
-    bnstp_2: str = Field(description="잔고 매매구분2", default="")
-    unsttqty_2: int = Field(description="미결제수량2", default=0)
-    lqdtableqty_2: int = Field(description="주문가능수량2", default=0)
-    avrprc_2: float = Field(description="평균가2", default=0.0)
-
-
-# EUX체결
-class EU1(BaseModel):
-    outblock: EU1OutBlock = Field(description="EU1OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for EU1",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <EU2 - EUX확인>
-class EU2OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    trcode1: str = Field(description="tr코드", default="")
-    firmno: str = Field(description="회사번호", default="")
-    acntno: str = Field(description="계좌번호", default="")
-    acntno1: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    brnno: str = Field(description="지점번호", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordno1: str = Field(description="주문번호", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno1: str = Field(description="원주문번호", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    prntordno: str = Field(description="모주문번호", default="")
-    prntordno1: int = Field(description="모주문번호", default=0)
-    isuno: str = Field(description="종목번호", default="")
-    fnoIsuno: str = Field(description="선물옵션종목번호", default="")
-    fnoIsunm: str = Field(description="선물옵션종목명", default="")
-    pdgrpcode: str = Field(description="상품군분류코드", default="")
-    fnoIsuptntp: str = Field(description="선물옵션종목유형구분", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    mrctp: str = Field(description="정정취소구분", default="")
-    ordqty: int = Field(description="주문수량", default=0)
-    hogatype: str = Field(description="호가유형코드", default="")
-    mmgb: str = Field(description="거래유형코드", default="")
-    ordprc: float = Field(description="주문가격", default=0.0)
-    unercqty: int = Field(description="미체결수량", default=0)
-    commdacode: str = Field(description="통신매체", default="")
-    peeamtcode: str = Field(description="수수료합산코드", default="")
-    mgempno: str = Field(description="관리사원", default="")
-    fnotrdunitamt: float = Field(description="선물옵션거래단위금액", default=0.0)
-    trxtime: str = Field(description="처리시각", default="")
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: str = Field(description="주문회차", default="")
-    ptflno: str = Field(description="포트폴리오 번호", default="")
-    bskno: str = Field(description="바스켓번호", default="")
-    trchno: str = Field(description="트렌치번호", default="")
-    Itemno: str = Field(description="아이템번호", default="")
-    OrderID: str = Field(description="주문자Id", default="")
-    opdrtnno: str = Field(description="운영지시번호", default="")
-    rjtcode: str = Field(description="부적격코드", default="")
-    mrccnfqty: int = Field(description="정정취소확인수량", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmrcqty: int = Field(description="원주문정정취소수량", default=0)
-    ctrcttime: str = Field(description="약정시각(체결시각)", default="")
-    ctrctno: str = Field(description="약정번호", default="")
-    execprc: float = Field(description="체결가격", default=0.0)
-    execqty: int = Field(description="체결수량", default=0)
-    newqty: int = Field(description="신규체결수량", default=0)
-    qdtqty: int = Field(description="청산체결수량", default=0)
-    lastqty: int = Field(description="최종결제수량", default=0)
-    lallexecqty: int = Field(description="전체체결수량", default=0)
-    allexecamt: int = Field(description="전체체결금액", default=0)
-    fnobalevaltp: str = Field(description="잔고평가구분", default="")
-    bnsplamt: int = Field(description="매매손익금액", default=0)
-    fnoIsuno1: str = Field(description="선물옵션종목번호1", default="")
-    bnstp1: str = Field(description="매매구분1", default="")
-    execprc1: float = Field(description="체결가1", default=0.0)
-    newqty1: int = Field(description="신규체결수량1", default=0)
-    qdtqty1: int = Field(description="청산체결수량1", default=0)
-    allexecamt1: int = Field(description="전체체결금액1", default=0)
-    fnoIsuno2: str = Field(description="선물옵션종목번호2", default="")
-    bnstp2: str = Field(description="매매구분2", default="")
-    execprc2: float = Field(description="체결가2", default=0.0)
-    newqty2: int = Field(description="신규체결수량2", default=0)
-    lqdtqty2: int = Field(description="청산체결수량2", default=0)
-    allexecamt2: int = Field(description="전체체결금액2", default=0)
-    dps: int = Field(description="예수금", default=0)
-    ftsubtdsgnamt: int = Field(description="선물대용지정금액", default=0)
-    mgn: int = Field(description="증거금", default=0)
-    mnymgn: int = Field(description="증거금현금", default=0)
-    ordableamt: int = Field(description="주문가능금액", default=0)
-    mnyordableamt: int = Field(description="주문가능현금액", default=0)
-    fnoIsuno_1: str = Field(description="잔고 종목번호1", default="")
-    bnstp_1: str = Field(description="잔고 매매구분1", default="")
-    unsttqty_1: int = Field(description="미결제수량1", default=0)
-    lqdtableqty_1: int = Field(description="주문가능수량1", default=0)
-    avrprc_1: float = Field(description="평균가1", default=0.0)
-    fnoIsuno_2: str = Field(description="잔고 종목번호2", default="")
-    bnstp_2: str = Field(description="잔고 매매구분2", default="")
-    unsttqty_2: int = Field(description="미결제수량2", default=0)
-    lqdtableqty_2: int = Field(description="주문가능수량2", default=0)
-    avrprc_2: float = Field(description="평균가2", default=0.0)
-
-
-# EUX확인
-class EU2(BaseModel):
-    outblock: EU2OutBlock = Field(description="EU2OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for EU2",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FC0 - KOSPI200선물체결(C0)>
-class FC0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class FC0OutBlock(BaseModel):
-    chetime: str = Field(description="체결시간", default="")
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    drate: float = Field(description="등락율", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    cgubun: str = Field(description="체결구분", default="")
-    cvolume: int = Field(description="체결량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="누적거래대금", default=0)
-    mdvolume: int = Field(description="매도누적체결량", default=0)
-    mdchecnt: int = Field(description="매도누적체결건수", default=0)
-    msvolume: int = Field(description="매수누적체결량", default=0)
-    mschecnt: int = Field(description="매수누적체결건수", default=0)
-    cpower: float = Field(description="체결강도", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    openyak: int = Field(description="미결제약정수량", default=0)
-    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    kasis: float = Field(description="괴리율", default=0.0)
-    sbasis: float = Field(description="시장BASIS", default=0.0)
-    ibasis: float = Field(description="이론BASIS", default=0.0)
-    openyakcha: int = Field(description="미결제약정증감", default=0)
-    jgubun: str = Field(description="장운영정보", default="")
-    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200선물체결(C0)
-class FC0(BaseModel):
-    inblock: FC0InBlock = Field(description="FC0InBlock")
-    outblock: FC0OutBlock = Field(description="FC0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for FC0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FD0 - KOSPI200선물실시간상하한가(D0)>
-class FD0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class FD0OutBlock(BaseModel):
-    gubun: str = Field(description="접속매매여부", default="")
-    dy_gubun: str = Field(description="실시간가격제한여부", default="")
-    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
-    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200선물실시간상하한가(D0)
-class FD0(BaseModel):
-    inblock: FD0InBlock = Field(description="FD0InBlock")
-    outblock: FD0OutBlock = Field(description="FD0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for FD0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FH0 - KOSPI200선물호가(H0)>
-class FH0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class FH0OutBlock(BaseModel):
-    hotime: str = Field(description="호가시간", default="")
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offercnt2: int = Field(description="매도호가건수2", default=0)
-    bidcnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offercnt3: int = Field(description="매도호가건수3", default=0)
-    bidcnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    offercnt4: int = Field(description="매도호가건수4", default=0)
-    bidcnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    offercnt5: int = Field(description="매도호가건수5", default=0)
-    bidcnt5: int = Field(description="매수호가건수5", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    futcode: str = Field(description="단축코드", default="")
-    danhochk: str = Field(description="단일가호가여부", default="")
-    alloc_gubun: str = Field(description="배분적용구분", default="")
-
-
-# KOSPI200선물호가(H0)
-class FH0(BaseModel):
-    inblock: FH0InBlock = Field(description="FH0InBlock")
-    outblock: FH0OutBlock = Field(description="FH0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for FH0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FOCCQ33600 - 주식계좌 기간별수익률 상세>
-class FOCCQ33600InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    TermTp: str = Field(description="기간구분", default="")
-
-
-class FOCCQ33600OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    TermTp: str = Field(description="기간구분", default="")
-
-
-class FOCCQ33600OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    BnsctrAmt: int = Field(description="매매약정금액", default=0)
-    MnyinAmt: int = Field(description="입금금액", default=0)
-    MnyoutAmt: int = Field(description="출금금액", default=0)
-    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
-    InvstPlAmt: int = Field(description="투자손익금액", default=0)
-    InvstErnrat: float = Field(description="투자수익률", default=0.0)
-
-
-class FOCCQ33600OutBlock3(BaseModel):
-    BaseDt: str = Field(description="기준일", default="")
-    FdEvalAmt: int = Field(description="기초평가금액", default=0)
-    EotEvalAmt: int = Field(description="기말평가금액", default=0)
-    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
-    BnsctrAmt: int = Field(description="매매약정금액", default=0)
-    MnyinSecinAmt: int = Field(description="입금고액", default=0)
-    MnyoutSecoutAmt: int = Field(description="출금고액", default=0)
-    EvalPnlAmt: int = Field(description="평가손익금액", default=0)
-    TermErnrat: float = Field(description="기간수익률", default=0.0)
-    Idx: float = Field(description="지수", default=0.0)
-
-
-# 주식계좌 기간별수익률 상세
-class FOCCQ33600(BaseModel):
-    inblock1: FOCCQ33600InBlock1 = Field(description="FOCCQ33600InBlock1")
-    outblock1: FOCCQ33600OutBlock1 = Field(description="FOCCQ33600OutBlock1")
-    outblock2: FOCCQ33600OutBlock2 = Field(description="FOCCQ33600OutBlock2")
-    outblock3: List[FOCCQ33600OutBlock3] = Field(description="FOCCQ33600OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for FOCCQ33600",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FOCCQ33700 - 선물옵션 기간별 계좌 수익률 현황>
-class FOCCQ33700InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    BaseAmtTp: str = Field(description="기준금액구분", default="")
-    QryTermTp: str = Field(description="조회기간구분", default="")
-    PnlCalcTpCode: str = Field(description="손익산출구분코드", default="")
-
-
-class FOCCQ33700OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNo: str = Field(description="계좌번호", default="")
-    Pwd: str = Field(description="비밀번호", default="")
-    QrySrtDt: str = Field(description="조회시작일", default="")
-    QryEndDt: str = Field(description="조회종료일", default="")
-    QryTp: str = Field(description="조회구분", default="")
-    BaseAmtTp: str = Field(description="기준금액구분", default="")
-    QryTermTp: str = Field(description="조회기간구분", default="")
-    PnlCalcTpCode: str = Field(description="손익산출구분코드", default="")
-
-
-class FOCCQ33700OutBlock2(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    AcntNm: str = Field(description="계좌명", default="")
-    InAmt: int = Field(description="입금액", default=0)
-    OutAmt: int = Field(description="출금액", default=0)
-    FnoCtrctAmt: int = Field(description="선물옵션약정금액", default=0)
-    InvstPramtAvrbalAmt: int = Field(description="투자원금평잔금액", default=0)
-    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
-    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
-    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
-    InvstPlAmt: int = Field(description="투자손익금액", default=0)
-    ErnRat: float = Field(description="수익률", default=0.0)
-
-
-class FOCCQ33700OutBlock3(BaseModel):
-    TrdDt: str = Field(description="거래일", default="")
-    FdDpsastAmt: int = Field(description="기초예탁자산금액", default=0)
-    EotDpsastAmt: int = Field(description="기말예탁자산금액", default=0)
-    InAmt: int = Field(description="입금액", default=0)
-    OutAmt: int = Field(description="출금액", default=0)
-    InvstAvrbalPramt: int = Field(description="투자원금평잔금액", default=0)
-    InvstPlAmt: int = Field(description="투자손익금액", default=0)
-    Ernrat: float = Field(description="수익률", default=0.0)
-    FnoCtrctAmt: int = Field(description="선물옵션약정금액", default=0)
-    Trnrat: float = Field(description="회전율", default=0.0)
-    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
-    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
-    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
-
-
-# 선물옵션 기간별 계좌 수익률 현황
-class FOCCQ33700(BaseModel):
-    inblock1: FOCCQ33700InBlock1 = Field(description="FOCCQ33700InBlock1")
-    outblock1: FOCCQ33700OutBlock1 = Field(description="FOCCQ33700OutBlock1")
-    outblock2: FOCCQ33700OutBlock2 = Field(description="FOCCQ33700OutBlock2")
-    outblock3: List[FOCCQ33700OutBlock3] = Field(description="FOCCQ33700OutBlock3")
-    metadata: dict = Field(
-        description="The metadata information for FOCCQ33700",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <FX0 - KOSPI200선물가격제한폭확대(X0)>
-class FX0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class FX0OutBlock(BaseModel):
-    upstep: str = Field(description="적용 상한단계", default="")
-    dnstep: str = Field(description="적용 하한단계", default="")
-    uplmtprice: float = Field(description="적용 상한가", default=0.0)
-    dnlmtprice: float = Field(description="적용 하한가", default=0.0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200선물가격제한폭확대(X0)
-class FX0(BaseModel):
-    inblock: FX0InBlock = Field(description="FX0InBlock")
-    outblock: FX0OutBlock = Field(description="FX0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for FX0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <H01 - 선물주문정정취소>
-class H01OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    seq: int = Field(description="일련번호", default=0)
-    trcode: str = Field(description="trcode", default="")
-    megrpno: str = Field(description="매칭그룹번호", default="")
-    boardid: str = Field(description="보드ID", default="")
-    memberno: str = Field(description="회원번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    ordno: str = Field(description="주문번호", default="")
-    ordordno: str = Field(description="원주문번호", default="")
-    expcode: str = Field(description="종목코드", default="")
-    dosugb: str = Field(description="매도수구분", default="")
-    mocagb: str = Field(description="정정취소구분", default="")
-    accno1: str = Field(description="계좌번호1", default="")
-    qty2: int = Field(description="호가수량", default=0)
-    price: float = Field(description="호가가격", default=0.0)
-    ordgb: str = Field(description="주문유형", default="")
-    hogagb: str = Field(description="호가구분", default="")
-    sihogagb: str = Field(description="시장조성호가구분", default="")
-    treaid: str = Field(description="자사주신고서ID", default="")
-    treacode: str = Field(description="자사주매매방법", default="")
-    askcode: str = Field(description="매도유형코드", default="")
-    creditcode: str = Field(description="신용구분코드", default="")
-    jakigb: str = Field(description="위탁자기구분", default="")
-    trustnum: str = Field(description="위탁사번호", default="")
-    ptgb: str = Field(description="프로그램구분", default="")
-    substocnum: str = Field(description="대용주권계좌번호", default="")
-    accgb: str = Field(description="계좌구분코드", default="")
-    accmarggb: str = Field(description="계좌증거금코드", default="")
-    nationcode: str = Field(description="국가코드", default="")
-    investgb: str = Field(description="투자자구분", default="")
-    forecode: str = Field(description="외국인코드", default="")
-    medcode: str = Field(description="주문매체구분", default="")
-    ordid: str = Field(description="주문식별자번호", default="")
-    macid: str = Field(description="MAC주소", default="")
-    orddate: str = Field(description="호가일자", default="")
-    rcvtime: str = Field(description="회원사주문시각", default="")
-    mem_filler: str = Field(description="mem_filler", default="")
-    mem_accno: str = Field(description="mem_accno", default="")
-    mem_filler1: str = Field(description="mem_filler1", default="")
-    ordacpttm: str = Field(description="매칭접수시간", default="")
-    qty: int = Field(description="실정정취소수량", default=0)
-    autogb: str = Field(description="자동취소구분", default="")
-    rejcode: str = Field(description="거부사유", default="")
-    prgordde: str = Field(description="프로그램호가신고", default="")
-
-
-# 선물주문정정취소
-class H01(BaseModel):
-    outblock: H01OutBlock = Field(description="H01OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for H01",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <JC0 - 주식선물체결(JC0)>
-class JC0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class JC0OutBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-    chetime: str = Field(description="체결시간", default="")
-    sign: str = Field(description="대비기호", default="")
-    change: int = Field(description="전일대비", default=0)
-    drate: float = Field(description="등락율", default=0.0)
-    price: int = Field(description="현재가", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    cgubun: str = Field(description="체결구분", default="")
-    cvolume: int = Field(description="체결량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="누적거래대금", default=0)
-    mdvolume: int = Field(description="매도누적체결량", default=0)
-    mdchecnt: int = Field(description="매도누적체결건수", default=0)
-    msvolume: int = Field(description="매수누적체결량", default=0)
-    mschecnt: int = Field(description="매수누적체결건수", default=0)
-    cpower: float = Field(description="체결강도", default=0.0)
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    openyak: int = Field(description="미결제약정수량", default=0)
-    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
-    theoryprice: int = Field(description="이론가", default=0)
-    kasis: float = Field(description="괴리율", default=0.0)
-    sbasis: int = Field(description="시장BASIS", default=0)
-    ibasis: int = Field(description="이론BASIS", default=0)
-    openyakcha: int = Field(description="미결제약정증감", default=0)
-    jgubun: str = Field(description="장운영정보", default="")
-    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
-    basprice: int = Field(description="기초자산현재가", default=0)
-
-
-# 주식선물체결(JC0)
-class JC0(BaseModel):
-    inblock: JC0InBlock = Field(description="JC0InBlock")
-    outblock: JC0OutBlock = Field(description="JC0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for JC0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <JD0 - 주식선물실시간상하한가(JD0)>
-class JD0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class JD0OutBlock(BaseModel):
-    gubun: str = Field(description="접속매매여부", default="")
-    dy_gubun: str = Field(description="실시간가격제한여부", default="")
-    dy_uplmtprice: int = Field(description="실시간상한가", default=0)
-    dy_dnlmtprice: int = Field(description="실시간하한가", default=0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# 주식선물실시간상하한가(JD0)
-class JD0(BaseModel):
-    inblock: JD0InBlock = Field(description="JD0InBlock")
-    outblock: JD0OutBlock = Field(description="JD0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for JD0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <JH0 - 주식선물호가(JH0)>
-class JH0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class JH0OutBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-    hotime: str = Field(description="호가시간", default="")
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: int = Field(description="매도호가2", default=0)
-    bidho2: int = Field(description="매수호가2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offercnt2: int = Field(description="매도호가건수2", default=0)
-    bidcnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: int = Field(description="매도호가3", default=0)
-    bidho3: int = Field(description="매수호가3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offercnt3: int = Field(description="매도호가건수3", default=0)
-    bidcnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: int = Field(description="매도호가4", default=0)
-    bidho4: int = Field(description="매수호가4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    offercnt4: int = Field(description="매도호가건수4", default=0)
-    bidcnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: int = Field(description="매도호가5", default=0)
-    bidho5: int = Field(description="매수호가5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    offercnt5: int = Field(description="매도호가건수5", default=0)
-    bidcnt5: int = Field(description="매수호가건수5", default=0)
-    offerho6: int = Field(description="매도호가6", default=0)
-    bidho6: int = Field(description="매수호가6", default=0)
-    offerrem6: int = Field(description="매도호가수량6", default=0)
-    bidrem6: int = Field(description="매수호가수량6", default=0)
-    offercnt6: int = Field(description="매도호가건수6", default=0)
-    bidcnt6: int = Field(description="매수호가건수6", default=0)
-    offerho7: int = Field(description="매도호가7", default=0)
-    bidho7: int = Field(description="매수호가7", default=0)
-    offerrem7: int = Field(description="매도호가수량7", default=0)
-    bidrem7: int = Field(description="매수호가수량7", default=0)
-    offercnt7: int = Field(description="매도호가건수7", default=0)
-    bidcnt7: int = Field(description="매수호가건수7", default=0)
-    offerho8: int = Field(description="매도호가8", default=0)
-    bidho8: int = Field(description="매수호가8", default=0)
-    offerrem8: int = Field(description="매도호가수량8", default=0)
-    bidrem8: int = Field(description="매수호가수량8", default=0)
-    offercnt8: int = Field(description="매도호가건수8", default=0)
-    bidcnt8: int = Field(description="매수호가건수8", default=0)
-    offerho9: int = Field(description="매도호가9", default=0)
-    bidho9: int = Field(description="매수호가9", default=0)
-    offerrem9: int = Field(description="매도호가수량9", default=0)
-    bidrem9: int = Field(description="매수호가수량9", default=0)
-    offercnt9: int = Field(description="매도호가건수9", default=0)
-    bidcnt9: int = Field(description="매수호가건수9", default=0)
-    offerho10: int = Field(description="매도호가10", default=0)
-    bidho10: int = Field(description="매수호가10", default=0)
-    offerrem10: int = Field(description="매도호가수량10", default=0)
-    bidrem10: int = Field(description="매수호가수량10", default=0)
-    offercnt10: int = Field(description="매도호가건수10", default=0)
-    bidcnt10: int = Field(description="매수호가건수10", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    danhochk: str = Field(description="단일가호가여부", default="")
-    alloc_gubun: str = Field(description="배분적용구분", default="")
-
-
-# 주식선물호가(JH0)
-class JH0(BaseModel):
-    inblock: JH0InBlock = Field(description="JH0InBlock")
-    outblock: JH0OutBlock = Field(description="JH0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for JH0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <JIF - 장운영정보(JIF)>
-class JIFInBlock(BaseModel):
-    jangubun: str = Field(description="장구분", default="")
-
-
-class JIFOutBlock(BaseModel):
-    jangubun: str = Field(description="장구분", default="")
-    jstatus: str = Field(description="장상태", default="")
-
-
-# 장운영정보(JIF)
-class JIF(BaseModel):
-    inblock: JIFInBlock = Field(description="JIFInBlock")
-    outblock: JIFOutBlock = Field(description="JIFOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for JIF",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <JX0 - 주식선물가격제한폭확대(JX0)>
-class JX0InBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class JX0OutBlock(BaseModel):
-    upstep: str = Field(description="적용 상한단계", default="")
-    dnstep: str = Field(description="적용 하한단계", default="")
-    uplmtprice: int = Field(description="적용 상한가", default=0)
-    dnlmtprice: int = Field(description="적용 하한가", default=0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# 주식선물가격제한폭확대(JX0)
-class JX0(BaseModel):
-    inblock: JX0InBlock = Field(description="JX0InBlock")
-    outblock: JX0OutBlock = Field(description="JX0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for JX0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <MK2 - US지수(MK2)>
-class MK2InBlock(BaseModel):
-    symbol: str = Field(description="심볼코드", default="")
-
-
-class MK2OutBlock(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    kodate: str = Field(description="한국일자", default="")
-    kotime: str = Field(description="한국시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    uprate: float = Field(description="등락율", default=0.0)
-    bidho: float = Field(description="매수호가", default=0.0)
-    bidrem: int = Field(description="매수잔량", default=0)
-    offerho: float = Field(description="매도호가", default=0.0)
-    offerrem: int = Field(description="매도잔량", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    xsymbol: str = Field(description="심벌", default="")
-    cvolume: float = Field(description="체결거래량", default=0.0)
-
-
-# US지수(MK2)
-class MK2(BaseModel):
-    inblock: MK2InBlock = Field(description="MK2InBlock")
-    outblock: MK2OutBlock = Field(description="MK2OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for MK2",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <MMDAQ91200 - 파생상품증거금율조회>
-class MMDAQ91200InBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
-    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
-
-
-class MMDAQ91200OutBlock1(BaseModel):
-    RecCnt: int = Field(description="레코드갯수", default=0)
-    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
-    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
-
-
-class MMDAQ91200OutBlock2(BaseModel):
-    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
-    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
-    IsuLrgMdclssNm: str = Field(description="종목대중분류명", default="")
-    IsuLrgMidSmclssNm: str = Field(description="종목대중소분류명", default="")
-    ShtnHanglIsuNm: str = Field(description="단축한글종목명", default="")
-    CsgnMgnrt: float = Field(description="위탁증거금율", default=0.0)
-    MaintMgnrt: float = Field(description="유지증거금율", default=0.0)
-    MnyMgnrt: float = Field(description="현금증거금율", default=0.0)
-    RmndDays: int = Field(description="잔여일수", default=0)
-    OnePrcntrOrdMgn: int = Field(description="1계약당주문증거금", default=0)
-
-
-# 파생상품증거금율조회
-class MMDAQ91200(BaseModel):
-    inblock1: MMDAQ91200InBlock1 = Field(description="MMDAQ91200InBlock1")
-    outblock1: MMDAQ91200OutBlock1 = Field(description="MMDAQ91200OutBlock1")
-    outblock2: List[MMDAQ91200OutBlock2] = Field(description="MMDAQ91200OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for MMDAQ91200",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <NWS - 실시간 뉴스 제목 패킷(NWS)>
-class NWSInBlock(BaseModel):
-    nwcode: str = Field(description="뉴스코드", default="")
-
-
-class NWSOutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    id: str = Field(description="뉴스구분자", default="")
-    realkey: str = Field(description="키값", default="")
-    title: str = Field(description="제목", default="")
-    code: str = Field(description="단축종목코드", default="")
-    bodysize: int = Field(description="BODY길이", default=0)
-
-
-# 실시간 뉴스 제목 패킷(NWS)
-class NWS(BaseModel):
-    inblock: NWSInBlock = Field(description="NWSInBlock")
-    outblock: NWSOutBlock = Field(description="NWSOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for NWS",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <O01 - 선물접수>
-class O01OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    trcode1: str = Field(description="tr코드", default="")
-    firmno: str = Field(description="회사번호", default="")
-    acntno: str = Field(description="계좌번호", default="")
-    acntno1: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    brnno: str = Field(description="지점번호", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordno1: str = Field(description="주문번호", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno1: str = Field(description="원주문번호", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    prntordno: str = Field(description="모주문번호", default="")
-    prntordno1: int = Field(description="모주문번호", default=0)
-    isuno: str = Field(description="종목번호", default="")
-    fnoIsuno: str = Field(description="선물옵션종목번호", default="")
-    fnoIsunm: str = Field(description="선물옵션종목명", default="")
-    pdgrpcode: str = Field(description="상품군분류코드", default="")
-    fnoIsuptntp: str = Field(description="선물옵션종목유형구분", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    mrctp: str = Field(description="정정취소구분", default="")
-    ordqty: int = Field(description="주문수량", default=0)
-    hogatype: str = Field(description="호가유형코드", default="")
-    mmgb: str = Field(description="거래유형코드", default="")
-    ordprc: float = Field(description="주문가격", default=0.0)
-    unercqty: int = Field(description="미체결수량", default=0)
-    commdacode: str = Field(description="통신매체", default="")
-    peeamtcode: str = Field(description="수수료합산코드", default="")
-    mgempno: str = Field(description="관리사원", default="")
-    fnotrdunitamt: float = Field(description="선물옵션거래단위금액", default=0.0)
-    trxtime: str = Field(description="처리시각", default="")
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: str = Field(description="주문회차", default="")
-    ptflno: str = Field(description="포트폴리오 번호", default="")
-    bskno: str = Field(description="바스켓번호", default="")
-    trchno: str = Field(description="트렌치번호", default="")
-    Itemno: str = Field(description="아이템번호", default="")
-    userId: str = Field(description="주문자Id", default="")
-    opdrtnno: str = Field(description="운영지시번호", default="")
-    rjtcode: str = Field(description="부적격코드", default="")
-    mrccnfqty: int = Field(description="정정취소확인수량", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmrcqty: int = Field(description="원주문정정취소수량", default=0)
-    ctrcttime: str = Field(description="약정시각(체결시각)", default="")
-    ctrctno: str = Field(description="약정번호", default="")
-    execprc: float = Field(description="체결가격", default=0.0)
-    execqty: int = Field(description="체결수량", default=0)
-    newqty: int = Field(description="신규체결수량", default=0)
-    qdtqty: int = Field(description="청산체결수량", default=0)
-    lastqty: int = Field(description="최종결제수량", default=0)
-    lallexecqty: int = Field(description="전체체결수량", default=0)
-    allexecamt: int = Field(description="전체체결금액", default=0)
-    fnobalevaltp: str = Field(description="잔고평가구분", default="")
-    bnsplamt: int = Field(description="매매손익금액", default=0)
-    fnoIsuno1: str = Field(description="선물옵션종목번호1", default="")
-    bnstp1: str = Field(description="매매구분1", default="")
-    execprc1: float = Field(description="체결가1", default=0.0)
-    newqty1: int = Field(description="신규체결수량1", default=0)
-    qdtqty1: int = Field(description="청산체결수량1", default=0)
-    allexecamt1: int = Field(description="전체체결금액1", default=0)
-    fnoIsuno2: str = Field(description="선물옵션종목번호2", default="")
-    bnstp2: str = Field(description="매매구분2", default="")
-    execprc2: float = Field(description="체결가2", default=0.0)
-    newqty2: int = Field(description="신규체결수량2", default=0)
-    lqdtqty2: int = Field(description="청산체결수량2", default=0)
-    allexecamt2: int = Field(description="전체체결금액2", default=0)
-    dps: int = Field(description="예수금", default=0)
-    ftsubtdsgnamt: int = Field(description="선물대용지정금액", default=0)
-    mgn: int = Field(description="증거금", default=0)
-    mnymgn: int = Field(description="증거금현금", default=0)
-    ordableamt: int = Field(description="주문가능금액", default=0)
-    mnyordableamt: int = Field(description="주문가능현금액", default=0)
-    fnoIsuno_1: str = Field(description="잔고 종목번호1", default="")
-    bnstp_1: str = Field(description="잔고 매매구분1", default="")
-    unsttqty_1: int = Field(description="미결제수량1", default=0)
-    lqdtableqty_1: int = Field(description="주문가능수량1", default=0)
-    avrprc_1: float = Field(description="평균가1", default=0.0)
-    fnoIsuno_2: str = Field(description="잔고 종목번호2", default="")
-    bnstp_2: str = Field(description="잔고 매매구분2", default="")
-    unsttqty_2: int = Field(description="미결제수량2", default=0)
-    lqdtableqty_2: int = Field(description="주문가능수량2", default=0)
-    avrprc_2: float = Field(description="평균가2", default=0.0)
-
-
-# 선물접수
-class O01(BaseModel):
-    outblock: O01OutBlock = Field(description="O01OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for O01",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OC0 - KOSPI200옵션체결(C0)>
-class OC0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class OC0OutBlock(BaseModel):
-    chetime: str = Field(description="체결시간", default="")
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    drate: float = Field(description="등락율", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    cgubun: str = Field(description="체결구분", default="")
-    cvolume: int = Field(description="체결량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="누적거래대금", default=0)
-    mdvolume: int = Field(description="매도누적체결량", default=0)
-    mdchecnt: int = Field(description="매도누적체결건수", default=0)
-    msvolume: int = Field(description="매수누적체결량", default=0)
-    mschecnt: int = Field(description="매수누적체결건수", default=0)
-    cpower: float = Field(description="체결강도", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    openyak: int = Field(description="미결제약정수량", default=0)
-    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
-    eqva: float = Field(description="KOSPI등가", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    openyakcha: int = Field(description="미결제약정증감", default=0)
-    timevalue: float = Field(description="시간가치", default=0.0)
-    jgubun: str = Field(description="장운영정보", default="")
-    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
-    optcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200옵션체결(C0)
-class OC0(BaseModel):
-    inblock: OC0InBlock = Field(description="OC0InBlock")
-    outblock: OC0OutBlock = Field(description="OC0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OC0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OD0 - KOSPI200옵션실시간상하한가(D0)>
-class OD0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class OD0OutBlock(BaseModel):
-    gubun: str = Field(description="접속매매여부", default="")
-    dy_gubun: str = Field(description="실시간가격제한여부", default="")
-    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
-    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
-    opttcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200옵션실시간상하한가(D0)
-class OD0(BaseModel):
-    inblock: OD0InBlock = Field(description="OD0InBlock")
-    outblock: OD0OutBlock = Field(description="OD0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OD0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OH0 - KOSPI200옵션호가(H0)>
-class OH0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class OH0OutBlock(BaseModel):
-    hotime: str = Field(description="호가시간", default="")
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offercnt2: int = Field(description="매도호가건수2", default=0)
-    bidcnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offercnt3: int = Field(description="매도호가건수3", default=0)
-    bidcnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    offercnt4: int = Field(description="매도호가건수4", default=0)
-    bidcnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    offercnt5: int = Field(description="매도호가건수5", default=0)
-    bidcnt5: int = Field(description="매수호가건수5", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    optcode: str = Field(description="단축코드", default="")
-    danhochk: str = Field(description="단일가호가여부", default="")
-    alloc_gubun: str = Field(description="배분적용구분", default="")
-
-
-# KOSPI200옵션호가(H0)
-class OH0(BaseModel):
-    inblock: OH0InBlock = Field(description="OH0InBlock")
-    outblock: OH0OutBlock = Field(description="OH0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OH0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OMG - KOSPI200옵션민감도(MG)>
-class OMGInBlock(BaseModel):
-    optcode: str = Field(description="옵션코드", default="")
-
-
-class OMGOutBlock(BaseModel):
-    chetime: str = Field(description="체결시간", default="")
-    actprice: float = Field(description="행사가", default=0.0)
-    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
-    fut200jisu: float = Field(description="선물가격", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    capimpv: float = Field(description="대표내재변동성", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    delt: float = Field(description="델타(블랙숄즈)", default=0.0)
-    gama: float = Field(description="감마(블랙숄즈)", default=0.0)
-    ceta: float = Field(description="세타(블랙숄즈)", default=0.0)
-    vega: float = Field(description="베가(블랙숄즈)", default=0.0)
-    rhox: float = Field(description="로우(블랙숄즈)", default=0.0)
-    theoryprice: float = Field(description="이론가(블랙숄즈)", default=0.0)
-    bimpv: float = Field(description="전일가내재변동성", default=0.0)
-    offerimpv: float = Field(description="매도가내재변동성", default=0.0)
-    bidimpv: float = Field(description="매수가내재변동성", default=0.0)
-    optcode: str = Field(description="옵션코드", default="")
-
-
-# KOSPI200옵션민감도(MG)
-class OMG(BaseModel):
-    inblock: OMGInBlock = Field(description="OMGInBlock")
-    outblock: OMGOutBlock = Field(description="OMGOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OMG",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OVC - 해외선물 현재가체결(OVC)>
-class OVCInBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-
-
-class OVCOutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    ovsdate: str = Field(description="체결일자(현지)", default="")
-    kordate: str = Field(description="체결일자(한국)", default="")
-    trdtm: str = Field(description="체결시간(현지)", default="")
-    kortm: str = Field(description="체결시간(한국)", default="")
-    curpr: float = Field(description="체결가격", default=0.0)
-    ydiffpr: float = Field(description="전일대비", default=0.0)
-    ydiffSign: str = Field(description="전일대비기호", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    chgrate: float = Field(description="등락율", default=0.0)
-    trdq: int = Field(description="건별체결수량", default=0)
-    totq: str = Field(description="누적체결수량", default="")
-    cgubun: str = Field(description="체결구분", default="")
-    mdvolume: str = Field(description="매도누적체결수량", default="")
-    msvolume: str = Field(description="매수누적체결수량", default="")
-    ovsmkend: str = Field(description="장마감일", default="")
-
-
-# 해외선물 현재가체결(OVC)
-class OVC(BaseModel):
-    inblock: OVCInBlock = Field(description="OVCInBlock")
-    outblock: OVCOutBlock = Field(description="OVCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OVC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OVH - 해외선물 호가(OVH)>
-class OVHInBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-
-
-class OVHOutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    hotime: str = Field(description="호가시간", default="")
-    offerho1: float = Field(description="매도호가 1", default=0.0)
-    bidho1: float = Field(description="매수호가 1", default=0.0)
-    offerrem1: int = Field(description="매도호가 잔량 1", default=0)
-    bidrem1: int = Field(description="매수호가 잔량 1", default=0)
-    offerno1: int = Field(description="매도호가 건수 1", default=0)
-    bidno1: int = Field(description="매수호가 건수 1", default=0)
-    offerho2: float = Field(description="매도호가 2", default=0.0)
-    bidho2: float = Field(description="매수호가 2", default=0.0)
-    offerrem2: int = Field(description="매도호가 잔량 2", default=0)
-    bidrem2: int = Field(description="매수호가 잔량 2", default=0)
-    offerno2: int = Field(description="매도호가 건수 2", default=0)
-    bidno2: int = Field(description="매수호가 건수 2", default=0)
-    offerho3: float = Field(description="매도호가 3", default=0.0)
-    bidho3: float = Field(description="매수호가 3", default=0.0)
-    offerrem3: int = Field(description="매도호가 잔량 3", default=0)
-    bidrem3: int = Field(description="매수호가 잔량 3", default=0)
-    offerno3: int = Field(description="매도호가 건수 3", default=0)
-    bidno3: int = Field(description="매수호가 건수 3", default=0)
-    offerho4: float = Field(description="매도호가 4", default=0.0)
-    bidho4: float = Field(description="매수호가 4", default=0.0)
-    offerrem4: int = Field(description="매도호가 잔량 4", default=0)
-    bidrem4: int = Field(description="매수호가 잔량 4", default=0)
-    offerno4: int = Field(description="매도호가 건수 4", default=0)
-    bidno4: int = Field(description="매수호가 건수 4", default=0)
-    offerho5: float = Field(description="매도호가 5", default=0.0)
-    bidho5: float = Field(description="매수호가 5", default=0.0)
-    offerrem5: int = Field(description="매도호가 잔량 5", default=0)
-    bidrem5: int = Field(description="매수호가 잔량 5", default=0)
-    offerno5: int = Field(description="매도호가 건수 5", default=0)
-    bidno5: int = Field(description="매수호가 건수 5", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-
-
-# 해외선물 호가(OVH)
-class OVH(BaseModel):
-    inblock: OVHInBlock = Field(description="OVHInBlock")
-    outblock: OVHOutBlock = Field(description="OVHOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OVH",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <OX0 - KOSPI200옵션가격제한폭확대(X0)>
-class OX0InBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class OX0OutBlock(BaseModel):
-    upstep: str = Field(description="적용 상한단계", default="")
-    dnstep: str = Field(description="적용 하한단계", default="")
-    uplmtprice: float = Field(description="적용 상한가", default=0.0)
-    dnlmtprice: float = Field(description="적용 하한가", default=0.0)
-    opttcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI200옵션가격제한폭확대(X0)
-class OX0(BaseModel):
-    inblock: OX0InBlock = Field(description="OX0InBlock")
-    outblock: OX0OutBlock = Field(description="OX0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for OX0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SC0 - 주식주문접수>
-class SC0OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    ordchegb: str = Field(description="주문체결구분", default="")
-    marketgb: str = Field(description="시장구분", default="")
-    ordgb: str = Field(description="주문구분", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    accno1: str = Field(description="계좌번호", default="")
-    accno2: str = Field(description="계좌번호", default="")
-    passwd: str = Field(description="비밀번호", default="")
-    expcode: str = Field(description="종목번호", default="")
-    shtcode: str = Field(description="단축종목번호", default="")
-    hname: str = Field(description="종목명", default="")
-    ordqty: int = Field(description="주문수량", default=0)
-    ordprice: int = Field(description="주문가격", default=0)
-    hogagb: str = Field(description="주문조건", default="")
-    etfhogagb: str = Field(description="호가유형코드", default="")
-    pgmtype: int = Field(description="프로그램호가구분", default=0)
-    gmhogagb: int = Field(description="공매도호가구분", default=0)
-    gmhogayn: int = Field(description="공매도가능여부", default=0)
-    singb: str = Field(description="신용구분", default="")
-    loandt: str = Field(description="대출일", default="")
-    cvrgordtp: str = Field(description="반대매매주문구분", default="")
-    strtgcode: str = Field(description="전략코드", default="")
-    groupid: str = Field(description="그룹ID", default="")
-    ordseqno: int = Field(description="주문회차", default=0)
-    prtno: int = Field(description="포트폴리오번호", default=0)
-    basketno: int = Field(description="바스켓번호", default=0)
-    trchno: int = Field(description="트렌치번호", default=0)
-    itemno: int = Field(description="아아템번호", default=0)
-    brwmgmyn: int = Field(description="차입구분", default=0)
-    mbrno: int = Field(description="회원사번호", default=0)
-    procgb: str = Field(description="처리구분", default="")
-    admbrchno: str = Field(description="관리지점번호", default="")
-    futaccno: str = Field(description="선물계좌번호", default="")
-    futmarketgb: str = Field(description="선물상품구분", default="")
-    tongsingb: str = Field(description="통신매체구분", default="")
-    lpgb: str = Field(description="유동성공급자구분", default="")
-    dummy: str = Field(description="DUMMY", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    ordtm: str = Field(description="주문시각", default="")
-    prntordno: int = Field(description="모주문번호", default=0)
-    mgempno: str = Field(description="관리사원번호", default="")
-    orgordundrqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
-    ordordcancelqty: int = Field(description="원주문취소수량", default=0)
-    nmcpysndno: int = Field(description="비회원사송신번호", default=0)
-    ordamt: int = Field(description="주문금액", default=0)
-    bnstp: str = Field(description="매매구분", default="")
-    spareordno: int = Field(description="예비주문번호", default=0)
-    cvrgseqno: int = Field(description="반대매매일련번호", default=0)
-    rsvordno: int = Field(description="예약주문번호", default=0)
-    mtordseqno: int = Field(description="복수주문일련번호", default=0)
-    spareordqty: int = Field(description="예비주문수량", default=0)
-    orduserid: str = Field(description="주문사원번호", default="")
-    spotordqty: int = Field(description="실물주문수량", default=0)
-    ordruseqty: int = Field(description="재사용주문수량", default=0)
-    mnyordamt: int = Field(description="현금주문금액", default=0)
-    ordsubstamt: int = Field(description="주문대용금액", default=0)
-    ruseordamt: int = Field(description="재사용주문금액", default=0)
-    ordcmsnamt: int = Field(description="수수료주문금액", default=0)
-    crdtuseamt: int = Field(description="사용신용담보재사용금", default=0)
-    secbalqty: int = Field(description="잔고수량", default=0)
-    spotordableqty: int = Field(description="실물가능수량", default=0)
-    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
-    flctqty: int = Field(description="변동수량", default=0)
-    secbalqtyd2: int = Field(description="잔고수량(D2)", default=0)
-    sellableqty: int = Field(description="매도주문가능수량", default=0)
-    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
-    avrpchsprc: int = Field(description="평균매입가", default=0)
-    pchsamt: int = Field(description="매입금액", default=0)
-    deposit: int = Field(description="예수금", default=0)
-    substamt: int = Field(description="대용금", default=0)
-    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
-    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
-    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
-    ordablemny: int = Field(description="주문가능현금", default=0)
-    ordablesubstamt: int = Field(description="주문가능대용", default=0)
-    ruseableamt: int = Field(description="재사용가능금액", default=0)
-
-
-# 주식주문접수
-class SC0(BaseModel):
-    outblock: SC0OutBlock = Field(description="SC0OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SC0",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SC1 - 주식주문체결>
-class SC1OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    ordxctptncode: str = Field(description="주문체결유형코드", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordptncode: str = Field(description="주문유형코드", default="")
-    mgmtbrnno: str = Field(description="관리지점번호", default="")
-    accno1: str = Field(description="계좌번호", default="")
-    accno2: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    Isuno: str = Field(description="종목번호", default="")
-    Isunm: str = Field(description="종목명", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno: int = Field(description="원주문번호", default=0)
-    execno: int = Field(description="체결번호", default=0)
-    ordqty: int = Field(description="주문수량", default=0)
-    ordprc: int = Field(description="주문가격", default=0)
-    execqty: int = Field(description="체결수량", default=0)
-    execprc: int = Field(description="체결가격", default=0)
-    mdfycnfqty: int = Field(description="정정확인수량", default=0)
-    mdfycnfprc: int = Field(description="정정확인가격", default=0)
-    canccnfqty: int = Field(description="취소확인수량", default=0)
-    rjtqty: int = Field(description="거부수량", default=0)
-    ordtrxptncode: int = Field(description="주문처리유형코드", default=0)
-    mtiordseqno: int = Field(description="복수주문일련번호", default=0)
-    ordcndi: str = Field(description="주문조건", default="")
-    ordprcptncode: str = Field(description="호가유형코드", default="")
-    nsavtrdqty: int = Field(description="비저축체결수량", default=0)
-    shtnIsuno: str = Field(description="단축종목번호", default="")
-    opdrtnno: str = Field(description="운용지시번호", default="")
-    cvrgordtp: str = Field(description="반대매매주문구분", default="")
-    unercqty: int = Field(description="미체결수량(주문)", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
-    orgordcancqty: int = Field(description="원주문취소수량", default=0)
-    ordavrexecprc: int = Field(description="주문평균체결가격", default=0)
-    ordamt: int = Field(description="주문금액", default=0)
-    stdIsuno: str = Field(description="표준종목번호", default="")
-    bfstdIsuno: str = Field(description="전표준종목번호", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    ordtrdptncode: str = Field(description="주문거래유형코드", default="")
-    mgntrncode: str = Field(description="신용거래코드", default="")
-    adduptp: str = Field(description="수수료합산코드", default="")
-    commdacode: str = Field(description="통신매체코드", default="")
-    Loandt: str = Field(description="대출일", default="")
-    mbrnmbrno: int = Field(description="회원/비회원사번호", default=0)
-    ordacntno: str = Field(description="주문계좌번호", default="")
-    agrgbrnno: str = Field(description="집계지점번호", default="")
-    mgempno: str = Field(description="관리사원번호", default="")
-    futsLnkbrnno: str = Field(description="선물연계지점번호", default="")
-    futsLnkacntno: str = Field(description="선물연계계좌번호", default="")
-    futsmkttp: str = Field(description="선물시장구분", default="")
-    regmktcode: str = Field(description="등록시장코드", default="")
-    mnymgnrat: int = Field(description="현금증거금률", default=0)
-    substmgnrat: int = Field(description="대용증거금률", default=0)
-    mnyexecamt: int = Field(description="현금체결금액", default=0)
-    ubstexecamt: int = Field(description="대용체결금액", default=0)
-    cmsnamtexecamt: int = Field(description="수수료체결금액", default=0)
-    crdtpldgexecamt: int = Field(description="신용담보체결금액", default=0)
-    crdtexecamt: int = Field(description="신용체결금액", default=0)
-    prdayruseexecval: int = Field(description="전일재사용체결금액", default=0)
-    crdayruseexecval: int = Field(description="금일재사용체결금액", default=0)
-    spotexecqty: int = Field(description="실물체결수량", default=0)
-    stslexecqty: int = Field(description="공매도체결수량", default=0)
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: int = Field(description="주문회차", default=0)
-    ptflno: int = Field(description="포트폴리오번호", default=0)
-    bskno: int = Field(description="바스켓번호", default=0)
-    trchno: int = Field(description="트렌치번호", default=0)
-    itemno: int = Field(description="아이템번호", default=0)
-    orduserId: str = Field(description="주문자Id", default="")
-    brwmgmtYn: int = Field(description="차입관리여부", default=0)
-    frgrunqno: str = Field(description="외국인고유번호", default="")
-    trtzxLevytp: str = Field(description="거래세징수구분", default="")
-    lptp: str = Field(description="유동성공급자구분", default="")
-    exectime: str = Field(description="체결시각", default="")
-    rcptexectime: str = Field(description="거래소수신체결시각", default="")
-    rmndLoanamt: int = Field(description="잔여대출금액", default=0)
-    secbalqty: int = Field(description="잔고수량", default=0)
-    spotordableqty: int = Field(description="실물가능수량", default=0)
-    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
-    flctqty: int = Field(description="변동수량", default=0)
-    secbalqtyd2: int = Field(description="잔고수량(d2)", default=0)
-    sellableqty: int = Field(description="매도주문가능수량", default=0)
-    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
-    avrpchsprc: int = Field(description="평균매입가", default=0)
-    pchsant: int = Field(description="매입금액", default=0)
-    deposit: int = Field(description="예수금", default=0)
-    substamt: int = Field(description="대용금", default=0)
-    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
-    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
-    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
-    ordablemny: int = Field(description="주문가능현금", default=0)
-    ordablesubstamt: int = Field(description="주문가능대용", default=0)
-    ruseableamt: int = Field(description="재사용가능금액", default=0)
-
-
-# 주식주문체결
-class SC1(BaseModel):
-    outblock: SC1OutBlock = Field(description="SC1OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SC1",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SC2 - 주식주문정정>
-class SC2OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    ordxctptncode: str = Field(description="주문체결유형코드", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordptncode: str = Field(description="주문유형코드", default="")
-    mgmtbrnno: str = Field(description="관리지점번호", default="")
-    accno1: str = Field(description="계좌번호", default="")
-    accno2: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    Isuno: str = Field(description="종목번호", default="")
-    Isunm: str = Field(description="종목명", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno: int = Field(description="원주문번호", default=0)
-    execno: int = Field(description="체결번호", default=0)
-    ordqty: int = Field(description="주문수량", default=0)
-    ordprc: int = Field(description="주문가격", default=0)
-    execqty: int = Field(description="체결수량", default=0)
-    execprc: int = Field(description="체결가격", default=0)
-    mdfycnfqty: int = Field(description="정정확인수량", default=0)
-    mdfycnfprc: int = Field(description="정정확인가격", default=0)
-    canccnfqty: int = Field(description="취소확인수량", default=0)
-    rjtqty: int = Field(description="거부수량", default=0)
-    ordtrxptncode: int = Field(description="주문처리유형코드", default=0)
-    mtiordseqno: int = Field(description="복수주문일련번호", default=0)
-    ordcndi: str = Field(description="주문조건", default="")
-    ordprcptncode: str = Field(description="호가유형코드", default="")
-    nsavtrdqty: int = Field(description="비저축체결수량", default=0)
-    shtnIsuno: str = Field(description="단축종목번호", default="")
-    opdrtnno: str = Field(description="운용지시번호", default="")
-    cvrgordtp: str = Field(description="반대매매주문구분", default="")
-    unercqty: int = Field(description="미체결수량(주문)", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
-    orgordcancqty: int = Field(description="원주문취소수량", default=0)
-    ordavrexecprc: int = Field(description="주문평균체결가격", default=0)
-    ordamt: int = Field(description="주문금액", default=0)
-    stdIsuno: str = Field(description="표준종목번호", default="")
-    bfstdIsuno: str = Field(description="전표준종목번호", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    ordtrdptncode: str = Field(description="주문거래유형코드", default="")
-    mgntrncode: str = Field(description="신용거래코드", default="")
-    adduptp: str = Field(description="수수료합산코드", default="")
-    commdacode: str = Field(description="통신매체코드", default="")
-    Loandt: str = Field(description="대출일", default="")
-    mbrnmbrno: int = Field(description="회원/비회원사번호", default=0)
-    ordacntno: str = Field(description="주문계좌번호", default="")
-    agrgbrnno: str = Field(description="집계지점번호", default="")
-    mgempno: str = Field(description="관리사원번호", default="")
-    futsLnkbrnno: str = Field(description="선물연계지점번호", default="")
-    futsLnkacntno: str = Field(description="선물연계계좌번호", default="")
-    futsmkttp: str = Field(description="선물시장구분", default="")
-    regmktcode: str = Field(description="등록시장코드", default="")
-    mnymgnrat: int = Field(description="현금증거금률", default=0)
-    substmgnrat: int = Field(description="대용증거금률", default=0)
-    mnyexecamt: int = Field(description="현금체결금액", default=0)
-    ubstexecamt: int = Field(description="대용체결금액", default=0)
-    cmsnamtexecamt: int = Field(description="수수료체결금액", default=0)
-    crdtpldgexecamt: int = Field(description="신용담보체결금액", default=0)
-    crdtexecamt: int = Field(description="신용체결금액", default=0)
-    prdayruseexecval: int = Field(description="전일재사용체결금액", default=0)
-    crdayruseexecval: int = Field(description="금일재사용체결금액", default=0)
-    spotexecqty: int = Field(description="실물체결수량", default=0)
-    stslexecqty: int = Field(description="공매도체결수량", default=0)
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: int = Field(description="주문회차", default=0)
-    ptflno: int = Field(description="포트폴리오번호", default=0)
-    bskno: int = Field(description="바스켓번호", default=0)
-    trchno: int = Field(description="트렌치번호", default=0)
-    itemno: int = Field(description="아이템번호", default=0)
-    orduserId: str = Field(description="주문자Id", default="")
-    brwmgmtYn: int = Field(description="차입관리여부", default=0)
-    frgrunqno: str = Field(description="외국인고유번호", default="")
-    trtzxLevytp: str = Field(description="거래세징수구분", default="")
-    lptp: str = Field(description="유동성공급자구분", default="")
-    exectime: str = Field(description="체결시각", default="")
-    rcptexectime: str = Field(description="거래소수신체결시각", default="")
-    rmndLoanamt: int = Field(description="잔여대출금액", default=0)
-    secbalqty: int = Field(description="잔고수량", default=0)
-    spotordableqty: int = Field(description="실물가능수량", default=0)
-    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
-    flctqty: int = Field(description="변동수량", default=0)
-    secbalqtyd2: int = Field(description="잔고수량(d2)", default=0)
-    sellableqty: int = Field(description="매도주문가능수량", default=0)
-    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
-    avrpchsprc: int = Field(description="평균매입가", default=0)
-    pchsant: int = Field(description="매입금액", default=0)
-    deposit: int = Field(description="예수금", default=0)
-    substamt: int = Field(description="대용금", default=0)
-    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
-    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
-    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
-    ordablemny: int = Field(description="주문가능현금", default=0)
-    ordablesubstamt: int = Field(description="주문가능대용", default=0)
-    ruseableamt: int = Field(description="재사용가능금액", default=0)
-
-
-# 주식주문정정
-class SC2(BaseModel):
-    outblock: SC2OutBlock = Field(description="SC2OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SC2",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SC3 - 주식주문취소>
-class SC3OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    ordxctptncode: str = Field(description="주문체결유형코드", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordptncode: str = Field(description="주문유형코드", default="")
-    mgmtbrnno: str = Field(description="관리지점번호", default="")
-    accno1: str = Field(description="계좌번호", default="")
-    accno2: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    Isuno: str = Field(description="종목번호", default="")
-    Isunm: str = Field(description="종목명", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno: int = Field(description="원주문번호", default=0)
-    execno: int = Field(description="체결번호", default=0)
-    ordqty: int = Field(description="주문수량", default=0)
-    ordprc: int = Field(description="주문가격", default=0)
-    execqty: int = Field(description="체결수량", default=0)
-    execprc: int = Field(description="체결가격", default=0)
-    mdfycnfqty: int = Field(description="정정확인수량", default=0)
-    mdfycnfprc: int = Field(description="정정확인가격", default=0)
-    canccnfqty: int = Field(description="취소확인수량", default=0)
-    rjtqty: int = Field(description="거부수량", default=0)
-    ordtrxptncode: int = Field(description="주문처리유형코드", default=0)
-    mtiordseqno: int = Field(description="복수주문일련번호", default=0)
-    ordcndi: str = Field(description="주문조건", default="")
-    ordprcptncode: str = Field(description="호가유형코드", default="")
-    nsavtrdqty: int = Field(description="비저축체결수량", default=0)
-    shtnIsuno: str = Field(description="단축종목번호", default="")
-    opdrtnno: str = Field(description="운용지시번호", default="")
-    cvrgordtp: str = Field(description="반대매매주문구분", default="")
-    unercqty: int = Field(description="미체결수량(주문)", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
-    orgordcancqty: int = Field(description="원주문취소수량", default=0)
-    ordavrexecprc: int = Field(description="주문평균체결가격", default=0)
-    ordamt: int = Field(description="주문금액", default=0)
-    stdIsuno: str = Field(description="표준종목번호", default="")
-    bfstdIsuno: str = Field(description="전표준종목번호", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    ordtrdptncode: str = Field(description="주문거래유형코드", default="")
-    mgntrncode: str = Field(description="신용거래코드", default="")
-    adduptp: str = Field(description="수수료합산코드", default="")
-    commdacode: str = Field(description="통신매체코드", default="")
-    Loandt: str = Field(description="대출일", default="")
-    mbrnmbrno: int = Field(description="회원/비회원사번호", default=0)
-    ordacntno: str = Field(description="주문계좌번호", default="")
-    agrgbrnno: str = Field(description="집계지점번호", default="")
-    mgempno: str = Field(description="관리사원번호", default="")
-    futsLnkbrnno: str = Field(description="선물연계지점번호", default="")
-    futsLnkacntno: str = Field(description="선물연계계좌번호", default="")
-    futsmkttp: str = Field(description="선물시장구분", default="")
-    regmktcode: str = Field(description="등록시장코드", default="")
-    mnymgnrat: int = Field(description="현금증거금률", default=0)
-    substmgnrat: int = Field(description="대용증거금률", default=0)
-    mnyexecamt: int = Field(description="현금체결금액", default=0)
-    ubstexecamt: int = Field(description="대용체결금액", default=0)
-    cmsnamtexecamt: int = Field(description="수수료체결금액", default=0)
-    crdtpldgexecamt: int = Field(description="신용담보체결금액", default=0)
-    crdtexecamt: int = Field(description="신용체결금액", default=0)
-    prdayruseexecval: int = Field(description="전일재사용체결금액", default=0)
-    crdayruseexecval: int = Field(description="금일재사용체결금액", default=0)
-    spotexecqty: int = Field(description="실물체결수량", default=0)
-    stslexecqty: int = Field(description="공매도체결수량", default=0)
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: int = Field(description="주문회차", default=0)
-    ptflno: int = Field(description="포트폴리오번호", default=0)
-    bskno: int = Field(description="바스켓번호", default=0)
-    trchno: int = Field(description="트렌치번호", default=0)
-    itemno: int = Field(description="아이템번호", default=0)
-    orduserId: str = Field(description="주문자Id", default="")
-    brwmgmtYn: int = Field(description="차입관리여부", default=0)
-    frgrunqno: str = Field(description="외국인고유번호", default="")
-    trtzxLevytp: str = Field(description="거래세징수구분", default="")
-    lptp: str = Field(description="유동성공급자구분", default="")
-    exectime: str = Field(description="체결시각", default="")
-    rcptexectime: str = Field(description="거래소수신체결시각", default="")
-    rmndLoanamt: int = Field(description="잔여대출금액", default=0)
-    secbalqty: int = Field(description="잔고수량", default=0)
-    spotordableqty: int = Field(description="실물가능수량", default=0)
-    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
-    flctqty: int = Field(description="변동수량", default=0)
-    secbalqtyd2: int = Field(description="잔고수량(d2)", default=0)
-    sellableqty: int = Field(description="매도주문가능수량", default=0)
-    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
-    avrpchsprc: int = Field(description="평균매입가", default=0)
-    pchsant: int = Field(description="매입금액", default=0)
-    deposit: int = Field(description="예수금", default=0)
-    substamt: int = Field(description="대용금", default=0)
-    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
-    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
-    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
-    ordablemny: int = Field(description="주문가능현금", default=0)
-    ordablesubstamt: int = Field(description="주문가능대용", default=0)
-    ruseableamt: int = Field(description="재사용가능금액", default=0)
-
-
-# 주식주문취소
-class SC3(BaseModel):
-    outblock: SC3OutBlock = Field(description="SC3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SC3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SC4 - 주식주문거부>
-class SC4OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    accno: str = Field(description="계좌번호", default="")
-    user: str = Field(description="조작자ID", default="")
-    len: int = Field(description="헤더길이", default=0)
-    gubun: str = Field(description="헤더구분", default="")
-    compress: str = Field(description="압축구분", default="")
-    encrypt: str = Field(description="암호구분", default="")
-    offset: int = Field(description="공통시작지점", default=0)
-    trcode: str = Field(description="TRCODE", default="")
-    comid: str = Field(description="이용사번호", default="")
-    userid: str = Field(description="사용자ID", default="")
-    media: str = Field(description="접속매체", default="")
-    ifid: str = Field(description="I/F일련번호", default="")
-    seq: str = Field(description="전문일련번호", default="")
-    trid: str = Field(description="TR추적ID", default="")
-    pubip: str = Field(description="공인IP", default="")
-    prvip: str = Field(description="사설IP", default="")
-    pcbpno: str = Field(description="처리지점번호", default="")
-    bpno: str = Field(description="지점번호", default="")
-    termno: str = Field(description="단말번호", default="")
-    lang: str = Field(description="언어구분", default="")
-    proctm: int = Field(description="AP처리시간", default=0)
-    msgcode: str = Field(description="메세지코드", default="")
-    outgu: str = Field(description="메세지출력구분", default="")
-    compreq: str = Field(description="압축요청구분", default="")
-    funckey: str = Field(description="기능키", default="")
-    reqcnt: int = Field(description="요청레코드개수", default=0)
-    filler: str = Field(description="예비영역", default="")
-    cont: str = Field(description="연속구분", default="")
-    contkey: str = Field(description="연속키값", default="")
-    varlen: int = Field(description="가변시스템길이", default=0)
-    varhdlen: int = Field(description="가변해더길이", default=0)
-    varmsglen: int = Field(description="가변메시지길이", default=0)
-    trsrc: str = Field(description="조회발원지", default="")
-    eventid: str = Field(description="I/F이벤트ID", default="")
-    ifinfo: str = Field(description="I/F정보", default="")
-    filler1: str = Field(description="예비영역", default="")
-    ordxctptncode: str = Field(description="주문체결유형코드", default="")
-    ordmktcode: str = Field(description="주문시장코드", default="")
-    ordptncode: str = Field(description="주문유형코드", default="")
-    mgmtbrnno: str = Field(description="관리지점번호", default="")
-    accno1: str = Field(description="계좌번호", default="")
-    accno2: str = Field(description="계좌번호", default="")
-    acntnm: str = Field(description="계좌명", default="")
-    Isuno: str = Field(description="종목번호", default="")
-    Isunm: str = Field(description="종목명", default="")
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno: int = Field(description="원주문번호", default=0)
-    execno: int = Field(description="체결번호", default=0)
-    ordqty: int = Field(description="주문수량", default=0)
-    ordprc: int = Field(description="주문가격", default=0)
-    execqty: int = Field(description="체결수량", default=0)
-    execprc: int = Field(description="체결가격", default=0)
-    mdfycnfqty: int = Field(description="정정확인수량", default=0)
-    mdfycnfprc: int = Field(description="정정확인가격", default=0)
-    canccnfqty: int = Field(description="취소확인수량", default=0)
-    rjtqty: int = Field(description="거부수량", default=0)
-    ordtrxptncode: int = Field(description="주문처리유형코드", default=0)
-    mtiordseqno: int = Field(description="복수주문일련번호", default=0)
-    ordcndi: str = Field(description="주문조건", default="")
-    ordprcptncode: str = Field(description="호가유형코드", default="")
-    nsavtrdqty: int = Field(description="비저축체결수량", default=0)
-    shtnIsuno: str = Field(description="단축종목번호", default="")
-    opdrtnno: str = Field(description="운용지시번호", default="")
-    cvrgordtp: str = Field(description="반대매매주문구분", default="")
-    unercqty: int = Field(description="미체결수량(주문)", default=0)
-    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
-    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
-    orgordcancqty: int = Field(description="원주문취소수량", default=0)
-    ordavrexecprc: int = Field(description="주문평균체결가격", default=0)
-    ordamt: int = Field(description="주문금액", default=0)
-    stdIsuno: str = Field(description="표준종목번호", default="")
-    bfstdIsuno: str = Field(description="전표준종목번호", default="")
-    bnstp: str = Field(description="매매구분", default="")
-    ordtrdptncode: str = Field(description="주문거래유형코드", default="")
-    mgntrncode: str = Field(description="신용거래코드", default="")
-    adduptp: str = Field(description="수수료합산코드", default="")
-    commdacode: str = Field(description="통신매체코드", default="")
-    Loandt: str = Field(description="대출일", default="")
-    mbrnmbrno: int = Field(description="회원/비회원사번호", default=0)
-    ordacntno: str = Field(description="주문계좌번호", default="")
-    agrgbrnno: str = Field(description="집계지점번호", default="")
-    mgempno: str = Field(description="관리사원번호", default="")
-    futsLnkbrnno: str = Field(description="선물연계지점번호", default="")
-    futsLnkacntno: str = Field(description="선물연계계좌번호", default="")
-    futsmkttp: str = Field(description="선물시장구분", default="")
-    regmktcode: str = Field(description="등록시장코드", default="")
-    mnymgnrat: int = Field(description="현금증거금률", default=0)
-    substmgnrat: int = Field(description="대용증거금률", default=0)
-    mnyexecamt: int = Field(description="현금체결금액", default=0)
-    ubstexecamt: int = Field(description="대용체결금액", default=0)
-    cmsnamtexecamt: int = Field(description="수수료체결금액", default=0)
-    crdtpldgexecamt: int = Field(description="신용담보체결금액", default=0)
-    crdtexecamt: int = Field(description="신용체결금액", default=0)
-    prdayruseexecval: int = Field(description="전일재사용체결금액", default=0)
-    crdayruseexecval: int = Field(description="금일재사용체결금액", default=0)
-    spotexecqty: int = Field(description="실물체결수량", default=0)
-    stslexecqty: int = Field(description="공매도체결수량", default=0)
-    strtgcode: str = Field(description="전략코드", default="")
-    grpId: str = Field(description="그룹Id", default="")
-    ordseqno: int = Field(description="주문회차", default=0)
-    ptflno: int = Field(description="포트폴리오번호", default=0)
-    bskno: int = Field(description="바스켓번호", default=0)
-    trchno: int = Field(description="트렌치번호", default=0)
-    itemno: int = Field(description="아이템번호", default=0)
-    orduserId: str = Field(description="주문자Id", default="")
-    brwmgmtYn: int = Field(description="차입관리여부", default=0)
-    frgrunqno: str = Field(description="외국인고유번호", default="")
-    trtzxLevytp: str = Field(description="거래세징수구분", default="")
-    lptp: str = Field(description="유동성공급자구분", default="")
-    exectime: str = Field(description="체결시각", default="")
-    rcptexectime: str = Field(description="거래소수신체결시각", default="")
-    rmndLoanamt: int = Field(description="잔여대출금액", default=0)
-    secbalqty: int = Field(description="잔고수량", default=0)
-    spotordableqty: int = Field(description="실물가능수량", default=0)
-    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
-    flctqty: int = Field(description="변동수량", default=0)
-    secbalqtyd2: int = Field(description="잔고수량(d2)", default=0)
-    sellableqty: int = Field(description="매도주문가능수량", default=0)
-    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
-    avrpchsprc: int = Field(description="평균매입가", default=0)
-    pchsant: int = Field(description="매입금액", default=0)
-    deposit: int = Field(description="예수금", default=0)
-    substamt: int = Field(description="대용금", default=0)
-    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
-    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
-    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
-    ordablemny: int = Field(description="주문가능현금", default=0)
-    ordablesubstamt: int = Field(description="주문가능대용", default=0)
-    ruseableamt: int = Field(description="재사용가능금액", default=0)
-
-
-# 주식주문거부
-class SC4(BaseModel):
-    outblock: SC4OutBlock = Field(description="SC4OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SC4",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SHC - 상/하한가근접진입(SHC)>
-class SHCInBlock(BaseModel):
-    updnlmtgubun: str = Field(description="상/하한구분", default="")
-
-
-class SHCOutBlock(BaseModel):
-    sijanggubun: str = Field(description="거래소/코스닥구분", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    drate: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    volincrate: float = Field(description="거래증가율", default=0.0)
-    updnlmtprice: int = Field(description="상/하한가", default=0)
-    updnlmtdrate: float = Field(description="상/하한가대비율", default=0.0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    gwangubun: str = Field(description="관리구분", default="")
-    undergubun: str = Field(description="이상급등구분", default="")
-    tgubun: str = Field(description="투자유의구분", default="")
-    wgubun: str = Field(description="우선주구분", default="")
-    dishonest: str = Field(description="불성실구분", default="")
-    jkrate: str = Field(description="증거금률", default="")
-    updnlmtdaycnt: int = Field(description="상한가/하한가연속일수", default=0)
-
-
-# 상/하한가근접진입(SHC)
-class SHC(BaseModel):
-    inblock: SHCInBlock = Field(description="SHCInBlock")
-    outblock: SHCOutBlock = Field(description="SHCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SHC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SHD - 상/하한가근접이탈(SHD)>
-class SHDInBlock(BaseModel):
-    updnlmtgubun: str = Field(description="상/하한구분", default="")
-
-
-class SHDOutBlock(BaseModel):
-    sijanggubun: str = Field(description="거래소/코스닥구분", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    drate: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    volincrate: float = Field(description="거래증가율", default=0.0)
-    updnlmtprice: int = Field(description="상/하한가", default=0)
-    updnlmtdrate: float = Field(description="상/하한가대비율", default=0.0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    gwangubun: str = Field(description="관리구분", default="")
-    undergubun: str = Field(description="이상급등구분", default="")
-    tgubun: str = Field(description="투자유의구분", default="")
-    wgubun: str = Field(description="우선주구분", default="")
-    dishonest: str = Field(description="불성실구분", default="")
-    jkrate: str = Field(description="증거금률", default="")
-
-
-# 상/하한가근접이탈(SHD)
-class SHD(BaseModel):
-    inblock: SHDInBlock = Field(description="SHDInBlock")
-    outblock: SHDOutBlock = Field(description="SHDOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SHD",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SHI - 상/하한가진입(SHI)>
-class SHIInBlock(BaseModel):
-    updnlmtgubun: str = Field(description="상/하한구분", default="")
-
-
-class SHIOutBlock(BaseModel):
-    sijanggubun: str = Field(description="거래소/코스닥구분", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    drate: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    volincrate: float = Field(description="거래증가율", default=0.0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-    updnlmtstime: str = Field(description="상한가/하한가최종진입시간", default="")
-    updnlmtdaycnt: int = Field(description="상한가/하한가연속일수", default=0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    gwangubun: str = Field(description="관리구분", default="")
-    undergubun: str = Field(description="이상급등구분", default="")
-    tgubun: str = Field(description="투자유의구분", default="")
-    wgubun: str = Field(description="우선주구분", default="")
-    dishonest: str = Field(description="불성실구분", default="")
-    jkrate: str = Field(description="증거금률", default="")
-
-
-# 상/하한가진입(SHI)
-class SHI(BaseModel):
-    inblock: SHIInBlock = Field(description="SHIInBlock")
-    outblock: SHIOutBlock = Field(description="SHIOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SHI",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <SHO - 상/하한가이탈(SHO)>
-class SHOInBlock(BaseModel):
-    updnlmtgubun: str = Field(description="상/하한구분", default="")
-
-
-class SHOOutBlock(BaseModel):
-    sijanggubun: str = Field(description="거래소/코스닥구분", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    drate: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    volincrate: float = Field(description="거래증가율", default=0.0)
-    updnlmtprice: int = Field(description="상/하한가", default=0)
-    updnlmtchange: int = Field(description="상/하한가대비", default=0)
-    updnlmtdrate: float = Field(description="상/하한가대비율", default=0.0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-    gwangubun: str = Field(description="관리구분", default="")
-    undergubun: str = Field(description="이상급등구분", default="")
-    tgubun: str = Field(description="투자유의구분", default="")
-    wgubun: str = Field(description="우선주구분", default="")
-    dishonest: str = Field(description="불성실구분", default="")
-    jkrate: str = Field(description="증거금률", default="")
-
-
-# 상/하한가이탈(SHO)
-class SHO(BaseModel):
-    inblock: SHOInBlock = Field(description="SHOInBlock")
-    outblock: SHOOutBlock = Field(description="SHOOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for SHO",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <TC1 - 해외선물주문>
-class TC1OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    key: str = Field(description="KEY", default="")
-    user: str = Field(description="조작자ID", default="")
-    svc_id: str = Field(description="서비스ID", default="")
-    ordr_dt: str = Field(description="주문일자", default="")
-    brn_cd: str = Field(description="지점번호", default="")
-    ordr_no: int = Field(description="주문번호", default=0)
-    orgn_ordr_no: int = Field(description="원주문번호", default=0)
-    mthr_ordr_no: int = Field(description="모주문번호", default=0)
-    ac_no: str = Field(description="계좌번호", default="")
-    is_cd: str = Field(description="종목코드", default="")
-    s_b_ccd: str = Field(description="매도매수유형", default="")
-    ordr_ccd: str = Field(description="정정취소유형", default="")
-    ordr_typ_cd: str = Field(description="주문유형코드", default="")
-    ordr_typ_prd_ccd: str = Field(description="주문기간코드", default="")
-    ordr_aplc_strt_dt: str = Field(description="주문적용시작일자", default="")
-    ordr_aplc_end_dt: str = Field(description="주문적용종료일자", default="")
-    ordr_prc: float = Field(description="주문가격", default=0.0)
-    cndt_ordr_prc: float = Field(description="주문조건가격", default=0.0)
-    ordr_q: int = Field(description="주문수량", default=0)
-    ordr_tm: str = Field(description="주문시간", default="")
-    userid: str = Field(description="사용자ID", default="")
-    xrc_rsv_tcp_code: str = Field(description="만기행사유무", default="")
-
-
-# 해외선물주문
-class TC1(BaseModel):
-    outblock: TC1OutBlock = Field(description="TC1OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for TC1",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <TC2 - 해외선물응답>
-class TC2OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    key: str = Field(description="KEY", default="")
-    user: str = Field(description="조작자ID", default="")
-    svc_id: str = Field(description="서비스ID", default="")
-    ordr_dt: str = Field(description="주문일자", default="")
-    brn_cd: str = Field(description="지점번호", default="")
-    ordr_no: int = Field(description="주문번호", default=0)
-    orgn_ordr_no: int = Field(description="원주문번호", default=0)
-    mthr_ordr_no: int = Field(description="모주문번호", default=0)
-    ac_no: str = Field(description="계좌번호", default="")
-    is_cd: str = Field(description="종목코드", default="")
-    s_b_ccd: str = Field(description="매도매수유형", default="")
-    ordr_ccd: str = Field(description="정정취소유형", default="")
-    ordr_typ_cd: str = Field(description="주문유형코드", default="")
-    ordr_typ_prd_ccd: str = Field(description="주문기간코드", default="")
-    ordr_aplc_strt_dt: str = Field(description="주문적용시작일자", default="")
-    ordr_aplc_end_dt: str = Field(description="주문적용종료일자", default="")
-    ordr_prc: float = Field(description="주문가격", default=0.0)
-    cndt_ordr_prc: float = Field(description="주문조건가격", default=0.0)
-    ordr_q: int = Field(description="주문수량", default=0)
-    ordr_tm: str = Field(description="주문시간", default="")
-    cnfr_q: int = Field(description="호가확인수량", default=0)
-    rfsl_cd: str = Field(description="호가거부사유코드", default="")
-    text: str = Field(description="호가거부사유코드명", default="")
-    user_id: str = Field(description="사용자ID", default="")
-
-
-# 해외선물응답
-class TC2(BaseModel):
-    outblock: TC2OutBlock = Field(description="TC2OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for TC2",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <TC3 - 해외선물체결>
-class TC3OutBlock(BaseModel):
-    lineseq: int = Field(description="라인일련번호", default=0)
-    key: str = Field(description="KEY", default="")
-    user: str = Field(description="조작자ID", default="")
-    svc_id: str = Field(description="서비스ID", default="")
-    ordr_dt: str = Field(description="주문일자", default="")
-    brn_cd: str = Field(description="지점번호", default="")
-    ordr_no: int = Field(description="주문번호", default=0)
-    orgn_ordr_no: int = Field(description="원주문번호", default=0)
-    mthr_ordr_no: int = Field(description="모주문번호", default=0)
-    ac_no: str = Field(description="계좌번호", default="")
-    is_cd: str = Field(description="종목코드", default="")
-    s_b_ccd: str = Field(description="매도매수유형", default="")
-    ordr_ccd: str = Field(description="정정취소유형", default="")
-    ccls_q: int = Field(description="체결수량", default=0)
-    ccls_prc: float = Field(description="체결가격", default=0.0)
-    ccls_no: str = Field(description="체결번호", default="")
-    ccls_tm: str = Field(description="체결시간", default="")
-    avg_byng_uprc: float = Field(description="매입평균단가", default=0.0)
-    byug_amt: float = Field(description="매입금액", default=0.0)
-    clr_pl_amt: float = Field(description="청산손익", default=0.0)
-    ent_fee: float = Field(description="위탁수수료", default=0.0)
-    fcm_fee: int = Field(description="매입잔고수량", default=0)
-    userid: str = Field(description="사용자ID", default="")
-    now_prc: float = Field(description="현재가격", default=0.0)
-    crncy_cd: str = Field(description="통화코드", default="")
-    mtrt_dt: str = Field(description="만기일자", default="")
-    ord_prdt_tp_code: str = Field(description="주문상품구분코드", default="")
-    exec_prdt_tp_code: str = Field(description="주문상품구분코드", default="")
-    sprd_base_isu_yn: str = Field(description="스프레드종목여부", default="")
-    ccls_dt: str = Field(description="체결일자", default="")
-    filler2: str = Field(description="FILLER2", default="")
-    sprd_is_cd: str = Field(description="스프레드종목코드", default="")
-    lme_prdt_ccd: str = Field(description="LME상품유형", default="")
-    lme_sprd_prc: float = Field(description="LME스프레드가격", default=0.0)
-    last_now_prc: float = Field(description="최종현재가격", default=0.0)
-    bf_mtrt_dt: str = Field(description="이전만기일자", default="")
-    clr_q: int = Field(description="청산수량", default=0)
-
-
-# 해외선물체결
-class TC3(BaseModel):
-    outblock: TC3OutBlock = Field(description="TC3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for TC3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <WOC - 해외옵션 현재가체결(WOC)>
-class WOCInBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-
-
-class WOCOutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    ovsdate: str = Field(description="체결일자(현지)", default="")
-    kordate: str = Field(description="체결일자(한국)", default="")
-    trdtm: str = Field(description="체결시간(현지)", default="")
-    kortm: str = Field(description="체결시간(한국)", default="")
-    curpr: float = Field(description="체결가격", default=0.0)
-    ydiffpr: float = Field(description="전일대비", default=0.0)
-    ydiffSign: str = Field(description="전일대비기호", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    chgrate: float = Field(description="등락율", default=0.0)
-    trdq: int = Field(description="건별체결수량", default=0)
-    totq: str = Field(description="누적체결수량", default="")
-    cgubun: str = Field(description="체결구분", default="")
-    mdvolume: str = Field(description="매도누적체결수량", default="")
-    msvolume: str = Field(description="매수누적체결수량", default="")
-    ovsmkend: str = Field(description="장마감일", default="")
-
-
-# 해외옵션 현재가체결(WOC)
-class WOC(BaseModel):
-    inblock: WOCInBlock = Field(description="WOCInBlock")
-    outblock: WOCOutBlock = Field(description="WOCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for WOC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <WOH - 해외옵션 호가(WOH)>
-class WOHInBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-
-
-class WOHOutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    hotime: str = Field(description="호가시간", default="")
-    offerho1: float = Field(description="매도호가 1", default=0.0)
-    bidho1: float = Field(description="매수호가 1", default=0.0)
-    offerrem1: int = Field(description="매도호가 잔량 1", default=0)
-    bidrem1: int = Field(description="매수호가 잔량 1", default=0)
-    offerno1: int = Field(description="매도호가 건수 1", default=0)
-    bidno1: int = Field(description="매수호가 건수 1", default=0)
-    offerho2: float = Field(description="매도호가 2", default=0.0)
-    bidho2: float = Field(description="매수호가 2", default=0.0)
-    offerrem2: int = Field(description="매도호가 잔량 2", default=0)
-    bidrem2: int = Field(description="매수호가 잔량 2", default=0)
-    offerno2: int = Field(description="매도호가 건수 2", default=0)
-    bidno2: int = Field(description="매수호가 건수 2", default=0)
-    offerho3: float = Field(description="매도호가 3", default=0.0)
-    bidho3: float = Field(description="매수호가 3", default=0.0)
-    offerrem3: int = Field(description="매도호가 잔량 3", default=0)
-    bidrem3: int = Field(description="매수호가 잔량 3", default=0)
-    offerno3: int = Field(description="매도호가 건수 3", default=0)
-    bidno3: int = Field(description="매수호가 건수 3", default=0)
-    offerho4: float = Field(description="매도호가 4", default=0.0)
-    bidho4: float = Field(description="매수호가 4", default=0.0)
-    offerrem4: int = Field(description="매도호가 잔량 4", default=0)
-    bidrem4: int = Field(description="매수호가 잔량 4", default=0)
-    offerno4: int = Field(description="매도호가 건수 4", default=0)
-    bidno4: int = Field(description="매수호가 건수 4", default=0)
-    offerho5: float = Field(description="매도호가 5", default=0.0)
-    bidho5: float = Field(description="매수호가 5", default=0.0)
-    offerrem5: int = Field(description="매도호가 잔량 5", default=0)
-    bidrem5: int = Field(description="매수호가 잔량 5", default=0)
-    offerno5: int = Field(description="매도호가 건수 5", default=0)
-    bidno5: int = Field(description="매수호가 건수 5", default=0)
-    totoffercnt: int = Field(description="매도호가총건수", default=0)
-    totbidcnt: int = Field(description="매수호가총건수", default=0)
-    totofferrem: int = Field(description="매도호가총수량", default=0)
-    totbidrem: int = Field(description="매수호가총수량", default=0)
-
-
-# 해외옵션 호가(WOH)
-class WOH(BaseModel):
-    inblock: WOHInBlock = Field(description="WOHInBlock")
-    outblock: WOHOutBlock = Field(description="WOHOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for WOH",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YC3 - 상품선물예상체결(YC3)>
-class YC3InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class YC3OutBlock(BaseModel):
-    ychetime: str = Field(description="예상체결시간", default="")
-    yeprice: float = Field(description="예상체결가격", default=0.0)
-    yevolume: int = Field(description="예상체결수량", default=0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: float = Field(description="예상체결가전일종가대비", default=0.0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    shcode: str = Field(description="단축코드", default="")
-
-
-# 상품선물예상체결(YC3)
-class YC3(BaseModel):
-    inblock: YC3InBlock = Field(description="YC3InBlock")
-    outblock: YC3OutBlock = Field(description="YC3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YC3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YFC - 지수선물예상체결(YFC)>
-class YFCInBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class YFCOutBlock(BaseModel):
-    ychetime: str = Field(description="예상체결시간", default="")
-    yeprice: float = Field(description="예상체결가격", default=0.0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: float = Field(description="예상체결가전일종가대비", default=0.0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# 지수선물예상체결(YFC)
-class YFC(BaseModel):
-    inblock: YFCInBlock = Field(description="YFCInBlock")
-    outblock: YFCOutBlock = Field(description="YFCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YFC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YJC - 주식선물예상체결(YJC)>
-class YJCInBlock(BaseModel):
-    futcode: str = Field(description="단축코드", default="")
-
-
-class YJCOutBlock(BaseModel):
-    ychetime: str = Field(description="예상체결시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: int = Field(description="예상체결가전일종가대비", default=0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    futcode: str = Field(description="단축코드", default="")
-
-
-# 주식선물예상체결(YJC)
-class YJC(BaseModel):
-    inblock: YJCInBlock = Field(description="YJCInBlock")
-    outblock: YJCOutBlock = Field(description="YJCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YJC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YK3 - KOSDAQ예상체결(YK3)>
-class YK3InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class YK3OutBlock(BaseModel):
-    hotime: str = Field(description="호가시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yevolume: int = Field(description="예상체결수량", default=0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: int = Field(description="예상체결가전일종가대비", default=0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    yofferho0: int = Field(description="예상매도호가", default=0)
-    ybidho0: int = Field(description="예상매수호가", default=0)
-    yofferrem0: int = Field(description="예상매도호가수량", default=0)
-    ybidrem0: int = Field(description="예상매수호가수량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-
-
-# KOSDAQ예상체결(YK3)
-class YK3(BaseModel):
-    inblock: YK3InBlock = Field(description="YK3InBlock")
-    outblock: YK3OutBlock = Field(description="YK3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YK3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YOC - 지수옵션예상체결(YOC)>
-class YOCInBlock(BaseModel):
-    optcode: str = Field(description="단축코드", default="")
-
-
-class YOCOutBlock(BaseModel):
-    ychetime: str = Field(description="예상체결시간", default="")
-    yeprice: float = Field(description="예상체결가격", default=0.0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: float = Field(description="예상체결가전일종가대비", default=0.0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    optcode: str = Field(description="단축코드", default="")
-
-
-# 지수옵션예상체결(YOC)
-class YOC(BaseModel):
-    inblock: YOCInBlock = Field(description="YOCInBlock")
-    outblock: YOCOutBlock = Field(description="YOCOutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YOC",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <YS3 - KOSPI예상체결(YS3)>
-class YS3InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class YS3OutBlock(BaseModel):
-    hotime: str = Field(description="호가시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yevolume: int = Field(description="예상체결수량", default=0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilchange: int = Field(description="예상체결가전일종가대비", default=0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    yofferho0: int = Field(description="예상매도호가", default=0)
-    ybidho0: int = Field(description="예상매수호가", default=0)
-    yofferrem0: int = Field(description="예상매도호가수량", default=0)
-    ybidrem0: int = Field(description="예상매수호가수량", default=0)
-    shcode: str = Field(description="단축코드", default="")
-
-
-# KOSPI예상체결(YS3)
-class YS3(BaseModel):
-    inblock: YS3InBlock = Field(description="YS3InBlock")
-    outblock: YS3OutBlock = Field(description="YS3OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for YS3",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3101 - 해외선물마스터조회(o3101)-API용>
-class o3101InBlock(BaseModel):
-    gubun: str = Field(description="입력구분(예비)", default="")
-
-
-class o3101OutBlock(BaseModel):
-    Symbol: str = Field(description="종목코드", default="")
-    SymbolNm: str = Field(description="종목명", default="")
-    ApplDate: str = Field(description="종목배치수신일(한국일자)", default="")
-    BscGdsCd: str = Field(description="기초상품코드", default="")
-    BscGdsNm: str = Field(description="기초상품명", default="")
-    ExchCd: str = Field(description="거래소코드", default="")
-    ExchNm: str = Field(description="거래소명", default="")
-    CrncyCd: str = Field(description="기준통화코드", default="")
-    NotaCd: str = Field(description="진법구분코드", default="")
-    UntPrc: float = Field(description="호가단위가격", default=0.0)
-    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
-    RgltFctr: float = Field(description="가격조정계수", default=0.0)
-    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
-    GdsCd: str = Field(description="상품구분코드", default="")
-    LstngYr: str = Field(description="월물(년)", default="")
-    LstngM: str = Field(description="월물(월)", default="")
-    EcPrc: float = Field(description="정산가격", default=0.0)
-    DlStrtTm: str = Field(description="거래시작시간", default="")
-    DlEndTm: str = Field(description="거래종료시간", default="")
-    DlPsblCd: str = Field(description="거래가능구분코드", default="")
-    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
-    OpngMgn: float = Field(description="개시증거금", default=0.0)
-    MntncMgn: float = Field(description="유지증거금", default=0.0)
-    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
-    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
-    DotGb: int = Field(description="유효소수점자리수", default=0)
-
-    class Config:
-        from_attributes = True
-
-
-# 해외선물마스터조회(o3101)-API용
-class o3101(BaseModel):
-    inblock: o3101InBlock = Field(description="o3101InBlock")
-    outblock: List[o3101OutBlock] = Field(description="o3101OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3101",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3103 - 해외선물차트(분)(o3103)-API용>
-class o3103InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="N분주기", default=0)
-    readcnt: int = Field(description="조회건수", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-
-
-class o3103OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    timediff: int = Field(description="시차", default=0)
-    readcnt: int = Field(description="조회건수", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-
-
-class o3103OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="현지시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물차트(분)(o3103)-API용
-class o3103(BaseModel):
-    inblock: o3103InBlock = Field(description="o3103InBlock")
-    outblock: o3103OutBlock = Field(description="o3103OutBlock")
-    outblock1: List[o3103OutBlock1] = Field(description="o3103OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3103",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3104 - 해외선물일별체결조회(o3104)-API용>
-class o3104InBlock(BaseModel):
-    gubun: str = Field(description="조회구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    date: str = Field(description="조회일자", default="")
-
-
-class o3104OutBlock1(BaseModel):
-    chedate: str = Field(description="일자", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    cgubun: str = Field(description="체결구분", default="")
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# 해외선물일별체결조회(o3104)-API용
-class o3104(BaseModel):
-    inblock: o3104InBlock = Field(description="o3104InBlock")
-    outblock1: List[o3104OutBlock1] = Field(description="o3104OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3104",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3105 - 해외선물현재가(종목정보)조회(o3105)-API용>
-class o3105InBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-
-
-class o3105OutBlock(BaseModel):
-    Symbol: str = Field(description="종목코드", default="")
-    SymbolNm: str = Field(description="종목명", default="")
-    ApplDate: str = Field(description="종목배치수신일", default="")
-    BscGdsCd: str = Field(description="기초상품코드", default="")
-    BscGdsNm: str = Field(description="기초상품명", default="")
-    ExchCd: str = Field(description="거래소코드", default="")
-    ExchNm: str = Field(description="거래소명", default="")
-    EcCd: str = Field(description="정산구분코드", default="")
-    CrncyCd: str = Field(description="기준통화코드", default="")
-    NotaCd: str = Field(description="진법구분코드", default="")
-    UntPrc: float = Field(description="호가단위가격", default=0.0)
-    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
-    RgltFctr: float = Field(description="가격조정계수", default=0.0)
-    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
-    LstngMCnt: int = Field(description="상장개월수", default=0)
-    GdsCd: str = Field(description="상품구분코드", default="")
-    MrktCd: str = Field(description="시장구분코드", default="")
-    EminiCd: str = Field(description="Emini구분코드", default="")
-    LstngYr: str = Field(description="상장년", default="")
-    LstngM: str = Field(description="상장월", default="")
-    SeqNo: int = Field(description="월물순서", default=0)
-    LstngDt: str = Field(description="상장일자", default="")
-    MtrtDt: str = Field(description="최종거래가능일", default="")
-    FnlDlDt: str = Field(description="최종거래일", default="")
-    FstTrsfrDt: str = Field(description="최초인도통지일자", default="")
-    EcPrc: float = Field(description="정산가격", default=0.0)
-    DlDt: str = Field(description="거래시작일자(한국)", default="")
-    DlStrtTm: str = Field(description="거래시작시간(한국)", default="")
-    DlEndTm: str = Field(description="거래종료시간(한국)", default="")
-    OvsStrDay: str = Field(description="거래시작일자(현지)", default="")
-    OvsStrTm: str = Field(description="거래시작시간(현지)", default="")
-    OvsEndDay: str = Field(description="거래종료일자(현지)", default="")
-    OvsEndTm: str = Field(description="거래종료시간(현지)", default="")
-    DlPsblCd: str = Field(description="거래가능구분코드", default="")
-    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
-    OpngMgn: float = Field(description="개시증거금", default=0.0)
-    MntncMgn: float = Field(description="유지증거금", default=0.0)
-    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
-    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
-    DotGb: int = Field(description="유효소수점자리수", default=0)
-    TimeDiff: int = Field(description="시차", default=0)
-    OvsDate: str = Field(description="현지체결일자", default="")
-    KorDate: str = Field(description="한국체결일자", default="")
-    TrdTm: str = Field(description="현지체결시간", default="")
-    RcvTm: str = Field(description="한국체결시각", default="")
-    TrdP: float = Field(description="체결가격", default=0.0)
-    TrdQ: int = Field(description="체결수량", default=0)
-    TotQ: int = Field(description="누적거래량", default=0)
-    TrdAmt: float = Field(description="체결거래대금", default=0.0)
-    TotAmt: float = Field(description="누적거래대금", default=0.0)
-    OpenP: float = Field(description="시가", default=0.0)
-    HighP: float = Field(description="고가", default=0.0)
-    LowP: float = Field(description="저가", default=0.0)
-    CloseP: float = Field(description="전일종가", default=0.0)
-    YdiffP: float = Field(description="전일대비", default=0.0)
-    YdiffSign: str = Field(description="전일대비구분", default="")
-    Cgubun: str = Field(description="체결구분", default="")
-    Diff: float = Field(description="등락율", default=0.0)
-
-
-# 해외선물현재가(종목정보)조회(o3105)-API용
-class o3105(BaseModel):
-    inblock: o3105InBlock = Field(description="o3105InBlock")
-    outblock: o3105OutBlock = Field(description="o3105OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3105",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3106 - 해외선물현재가호가조회(o3106)-API용>
-class o3106InBlock(BaseModel):
-    symbol: str = Field(description="단축코드", default="")
-
-
-class o3106OutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    symbolname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    hotime: str = Field(description="호가수신시간", default="")
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offercnt2: int = Field(description="매도호가건수2", default=0)
-    bidcnt2: int = Field(description="매수호가건수2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offercnt3: int = Field(description="매도호가건수3", default=0)
-    bidcnt3: int = Field(description="매수호가건수3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offercnt4: int = Field(description="매도호가건수4", default=0)
-    bidcnt4: int = Field(description="매수호가건수4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offercnt5: int = Field(description="매도호가건수5", default=0)
-    bidcnt5: int = Field(description="매수호가건수5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    offercnt: int = Field(description="매도호가건수합", default=0)
-    bidcnt: int = Field(description="매수호가건수합", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-
-
-# 해외선물현재가호가조회(o3106)-API용
-class o3106(BaseModel):
-    inblock: o3106InBlock = Field(description="o3106InBlock")
-    outblock: o3106OutBlock = Field(description="o3106OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3106",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3107 - 해외선물관심종목조회(o3107)-API용>
-class o3107InBlock(BaseModel):
-    symbol: str = Field(description="종목심볼", default="")
-
-
-class o3107OutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    symbolname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt: int = Field(description="매도호가건수합", default=0)
-    bidcnt: int = Field(description="매수호가건수합", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-
-
-# 해외선물관심종목조회(o3107)-API용
-class o3107(BaseModel):
-    inblock: o3107InBlock = Field(description="o3107InBlock")
-    outblock: List[o3107OutBlock] = Field(description="o3107OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3107",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3108 - 해외선물차트(일주월)(o3108)-API용>
-class o3108InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분", default="")
-    qrycnt: int = Field(description="요청건수", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-
-
-class o3108OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    mk_stime: str = Field(description="장시작시간", default="")
-    mk_etime: str = Field(description="장마감시간", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class o3108OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물차트(일주월)(o3108)-API용
-class o3108(BaseModel):
-    inblock: o3108InBlock = Field(description="o3108InBlock")
-    outblock: o3108OutBlock = Field(description="o3108OutBlock")
-    outblock1: List[o3108OutBlock1] = Field(description="o3108OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3108",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3116 - 해외선물시간대별(Tick)체결(o3116)-API용>
-class o3116InBlock(BaseModel):
-    gubun: str = Field(description="조회구분(0:당일1:전일)", default="")
-    shcode: str = Field(description="단축코드", default="")
-    readcnt: int = Field(description="조회갯수", default=0)
-    cts_seq: int = Field(description="순번CTS", default=0)
-
-
-class o3116OutBlock(BaseModel):
-    cts_seq: int = Field(description="순번CTS", default=0)
-
-
-class o3116OutBlock1(BaseModel):
-    ovsdate: str = Field(description="현지일자", default="")
-    ovstime: str = Field(description="현지시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# 해외선물시간대별(Tick)체결(o3116)-API용
-class o3116(BaseModel):
-    inblock: o3116InBlock = Field(description="o3116InBlock")
-    outblock: o3116OutBlock = Field(description="o3116OutBlock")
-    outblock1: List[o3116OutBlock1] = Field(description="o3116OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3116",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3117 - 해외선물차트용NTick(o3117)-API용>
-class o3117InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위", default=0)
-    qrycnt: int = Field(description="건수", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class o3117OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class o3117OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물차트용NTick(o3117)-API용
-class o3117(BaseModel):
-    inblock: o3117InBlock = Field(description="o3117InBlock")
-    outblock: o3117OutBlock = Field(description="o3117OutBlock")
-    outblock1: List[o3117OutBlock1] = Field(description="o3117OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3117",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3121 - 해외선물옵션마스터조회(o3121)-API용>
-class o3121InBlock(BaseModel):
-    MktGb: str = Field(description="시장구분", default="")
-    BscGdsCd: str = Field(description="옵션기초상품코드", default="")
-
-
-class o3121OutBlock(BaseModel):
-    Symbol: str = Field(description="종목코드", default="")
-    SymbolNm: str = Field(description="종목명", default="")
-    ApplDate: str = Field(description="종목배치수신일(한국일자)", default="")
-    BscGdsCd: str = Field(description="기초상품코드", default="")
-    BscGdsNm: str = Field(description="기초상품명", default="")
-    ExchCd: str = Field(description="거래소코드", default="")
-    ExchNm: str = Field(description="거래소명", default="")
-    CrncyCd: str = Field(description="기준통화코드", default="")
-    NotaCd: str = Field(description="진법구분코드", default="")
-    UntPrc: float = Field(description="호가단위가격", default=0.0)
-    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
-    RgltFctr: float = Field(description="가격조정계수", default=0.0)
-    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
-    GdsCd: str = Field(description="상품구분코드", default="")
-    LstngYr: str = Field(description="월물(년)", default="")
-    LstngM: str = Field(description="월물(월)", default="")
-    EcPrc: float = Field(description="정산가격", default=0.0)
-    DlStrtTm: str = Field(description="거래시작시간", default="")
-    DlEndTm: str = Field(description="거래종료시간", default="")
-    DlPsblCd: str = Field(description="거래가능구분코드", default="")
-    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
-    OpngMgn: float = Field(description="개시증거금", default=0.0)
-    MntncMgn: float = Field(description="유지증거금", default=0.0)
-    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
-    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
-    DotGb: int = Field(description="유효소수점자리수", default=0)
-    XrcPrc: str = Field(description="옵션행사가", default="")
-    FdasBasePrc: str = Field(description="기초자산기준가격", default="")
-    OptTpCode: str = Field(description="옵션콜풋구분", default="")
-    RgtXrcPtnCode: str = Field(description="권리행사구분코드", default="")
-    Moneyness: str = Field(description="ATM구분", default="")
-    LastSettPtnCode: str = Field(description="해외파생기초자산종목코드", default="")
-    OptMinOrcPrc: str = Field(description="해외옵션최소호가", default="")
-    OptMinBaseOrcPrc: str = Field(description="해외옵션최소기준호가", default="")
-
-
-# 해외선물옵션마스터조회(o3121)-API용
-class o3121(BaseModel):
-    inblock: o3121InBlock = Field(description="o3121InBlock")
-    outblock: List[o3121OutBlock] = Field(description="o3121OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3121",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3123 - 해외선물옵션차트(분)(o3123)-API용>
-class o3123InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="N분주기", default=0)
-    readcnt: int = Field(description="조회건수", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-
-
-class o3123OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    timediff: int = Field(description="시차", default=0)
-    readcnt: int = Field(description="조회건수", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-
-
-class o3123OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="현지시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물옵션차트(분)(o3123)-API용
-class o3123(BaseModel):
-    inblock: o3123InBlock = Field(description="o3123InBlock")
-    outblock: o3123OutBlock = Field(description="o3123OutBlock")
-    outblock1: List[o3123OutBlock1] = Field(description="o3123OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3123",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3125 - 해외선물옵션현재가(종목정보)조회(o3125)-API용>
-class o3125InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    symbol: str = Field(description="종목코드", default="")
-
-
-class o3125OutBlock(BaseModel):
-    Symbol: str = Field(description="종목코드", default="")
-    SymbolNm: str = Field(description="종목명", default="")
-    ApplDate: str = Field(description="종목배치수신일", default="")
-    BscGdsCd: str = Field(description="기초상품코드", default="")
-    BscGdsNm: str = Field(description="기초상품명", default="")
-    ExchCd: str = Field(description="거래소코드", default="")
-    ExchNm: str = Field(description="거래소명", default="")
-    EcCd: str = Field(description="정산구분코드", default="")
-    CrncyCd: str = Field(description="기준통화코드", default="")
-    NotaCd: str = Field(description="진법구분코드", default="")
-    UntPrc: float = Field(description="호가단위가격", default=0.0)
-    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
-    RgltFctr: float = Field(description="가격조정계수", default=0.0)
-    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
-    LstngMCnt: int = Field(description="상장개월수", default=0)
-    GdsCd: str = Field(description="상품구분코드", default="")
-    MrktCd: str = Field(description="시장구분코드", default="")
-    EminiCd: str = Field(description="Emini구분코드", default="")
-    LstngYr: str = Field(description="상장년", default="")
-    LstngM: str = Field(description="상장월", default="")
-    SeqNo: int = Field(description="월물순서", default=0)
-    LstngDt: str = Field(description="상장일자", default="")
-    MtrtDt: str = Field(description="최종거래가능일", default="")
-    FnlDlDt: str = Field(description="최종거래일", default="")
-    FstTrsfrDt: str = Field(description="최초인도통지일자", default="")
-    EcPrc: float = Field(description="정산가격", default=0.0)
-    DlDt: str = Field(description="거래시작일자(한국)", default="")
-    DlStrtTm: str = Field(description="거래시작시간(한국)", default="")
-    DlEndTm: str = Field(description="거래종료시간(한국)", default="")
-    OvsStrDay: str = Field(description="거래시작일자(현지)", default="")
-    OvsStrTm: str = Field(description="거래시작시간(현지)", default="")
-    OvsEndDay: str = Field(description="거래종료일자(현지)", default="")
-    OvsEndTm: str = Field(description="거래종료시간(현지)", default="")
-    DlPsblCd: str = Field(description="거래가능구분코드", default="")
-    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
-    OpngMgn: float = Field(description="개시증거금", default=0.0)
-    MntncMgn: float = Field(description="유지증거금", default=0.0)
-    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
-    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
-    DotGb: int = Field(description="유효소수점자리수", default=0)
-    TimeDiff: int = Field(description="시차", default=0)
-    OvsDate: str = Field(description="현지체결일자", default="")
-    KorDate: str = Field(description="한국체결일자", default="")
-    TrdTm: str = Field(description="현지체결시간", default="")
-    RcvTm: str = Field(description="한국체결시각", default="")
-    TrdP: float = Field(description="체결가격", default=0.0)
-    TrdQ: int = Field(description="체결수량", default=0)
-    TotQ: int = Field(description="누적거래량", default=0)
-    TrdAmt: float = Field(description="체결거래대금", default=0.0)
-    TotAmt: float = Field(description="누적거래대금", default=0.0)
-    OpenP: float = Field(description="시가", default=0.0)
-    HighP: float = Field(description="고가", default=0.0)
-    LowP: float = Field(description="저가", default=0.0)
-    CloseP: float = Field(description="전일종가", default=0.0)
-    YdiffP: float = Field(description="전일대비", default=0.0)
-    YdiffSign: str = Field(description="전일대비구분", default="")
-    Cgubun: str = Field(description="체결구분", default="")
-    Diff: float = Field(description="등락율", default=0.0)
-    MinOrcPrc: float = Field(description="최소호가", default=0.0)
-    MinBaseOrcPrc: float = Field(description="최소기준호가", default=0.0)
-
-
-# 해외선물옵션현재가(종목정보)조회(o3125)-API용
-class o3125(BaseModel):
-    inblock: o3125InBlock = Field(description="o3125InBlock")
-    outblock: o3125OutBlock = Field(description="o3125OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3125",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3126 - 해외선물옵션현재가호가조회(o3126)-API용>
-class o3126InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    symbol: str = Field(description="단축코드", default="")
-
-
-class o3126OutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    symbolname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    hotime: str = Field(description="호가수신시간", default="")
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offercnt2: int = Field(description="매도호가건수2", default=0)
-    bidcnt2: int = Field(description="매수호가건수2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offercnt3: int = Field(description="매도호가건수3", default=0)
-    bidcnt3: int = Field(description="매수호가건수3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offercnt4: int = Field(description="매도호가건수4", default=0)
-    bidcnt4: int = Field(description="매수호가건수4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offercnt5: int = Field(description="매도호가건수5", default=0)
-    bidcnt5: int = Field(description="매수호가건수5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    offercnt: int = Field(description="매도호가건수합", default=0)
-    bidcnt: int = Field(description="매수호가건수합", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-
-
-# 해외선물옵션현재가호가조회(o3126)-API용
-class o3126(BaseModel):
-    inblock: o3126InBlock = Field(description="o3126InBlock")
-    outblock: o3126OutBlock = Field(description="o3126OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3126",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3127 - 해외선물옵션관심종목조회(o3127)-API용>
-class o3127InBlock(BaseModel):
-    nrec: int = Field(description="건수", default=0)
-
-
-class o3127InBlock1(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    symbol: str = Field(description="종목심볼", default="")
-
-
-class o3127OutBlock(BaseModel):
-    symbol: str = Field(description="종목코드", default="")
-    symbolname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offercnt1: int = Field(description="매도호가건수1", default=0)
-    bidcnt1: int = Field(description="매수호가건수1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    offercnt: int = Field(description="매도호가건수합", default=0)
-    bidcnt: int = Field(description="매수호가건수합", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-
-
-# 해외선물옵션관심종목조회(o3127)-API용
-class o3127(BaseModel):
-    inblock: o3127InBlock = Field(description="o3127InBlock")
-    inblock1: o3127InBlock1 = Field(description="o3127InBlock1")
-    outblock: List[o3127OutBlock] = Field(description="o3127OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for o3127",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3128 - 해외선물옵션차트일주월(o3128)-API용>
-class o3128InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분", default="")
-    qrycnt: int = Field(description="요청건수", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-
-
-class o3128OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    mk_stime: str = Field(description="장시작시간", default="")
-    mk_etime: str = Field(description="장마감시간", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class o3128OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물옵션차트일주월(o3128)-API용
-class o3128(BaseModel):
-    inblock: o3128InBlock = Field(description="o3128InBlock")
-    outblock: o3128OutBlock = Field(description="o3128OutBlock")
-    outblock1: List[o3128OutBlock1] = Field(description="o3128OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3128",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3136 - 해외선물옵션시간대별(Tick)체결(o3136)-API용>
-class o3136InBlock(BaseModel):
-    gubun: str = Field(description="조회구분(0:당일1:전일)", default="")
-    mktgb: str = Field(description="시장구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    readcnt: int = Field(description="조회갯수", default=0)
-    cts_seq: int = Field(description="순번CTS", default=0)
-
-
-class o3136OutBlock(BaseModel):
-    cts_seq: int = Field(description="순번CTS", default=0)
-
-
-class o3136OutBlock1(BaseModel):
-    ovsdate: str = Field(description="현지일자", default="")
-    ovstime: str = Field(description="현지시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# 해외선물옵션시간대별(Tick)체결(o3136)-API용
-class o3136(BaseModel):
-    inblock: o3136InBlock = Field(description="o3136InBlock")
-    outblock: o3136OutBlock = Field(description="o3136OutBlock")
-    outblock1: List[o3136OutBlock1] = Field(description="o3136OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3136",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3137 - 해외선물옵션차트용NTick(o3137)-API용>
-class o3137InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위", default=0)
-    qrycnt: int = Field(description="건수", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class o3137OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class o3137OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물옵션차트용NTick(o3137)-API용
-class o3137(BaseModel):
-    inblock: o3137InBlock = Field(description="o3137InBlock")
-    outblock: o3137OutBlock = Field(description="o3137OutBlock")
-    outblock1: List[o3137OutBlock1] = Field(description="o3137OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3137",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <o3139 - 해외선물옵션차트용NTick(고정형)(o3139)-API용>
-class o3139InBlock(BaseModel):
-    mktgb: str = Field(description="시장구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위", default=0)
-    qrycnt: int = Field(description="건수", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class o3139OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-    cts_seq: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-    last_count: int = Field(description="마지막Tick건수", default=0)
-
-
-class o3139OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 해외선물옵션차트용NTick(고정형)(o3139)-API용
-class o3139(BaseModel):
-    inblock: o3139InBlock = Field(description="o3139InBlock")
-    outblock: o3139OutBlock = Field(description="o3139OutBlock")
-    outblock1: List[o3139OutBlock1] = Field(description="o3139OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for o3139",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0150 - 주식당일매매일지/수수료(t0150)>
-class t0150InBlock(BaseModel):
-    accno: str = Field(description="계좌번호", default="")
-    cts_medosu: str = Field(description="CTS_매매구분", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_price: str = Field(description="CTS_단가", default="")
-    cts_middiv: str = Field(description="CTS_매체", default="")
-
-
-class t0150OutBlock(BaseModel):
-    mdqty: int = Field(description="매도수량", default=0)
-    mdamt: int = Field(description="매도약정금액", default=0)
-    mdfee: int = Field(description="매도수수료", default=0)
-    mdtax: int = Field(description="매도거래세", default=0)
-    mdargtax: int = Field(description="매도농특세", default=0)
-    tmdtax: int = Field(description="매도제비용합", default=0)
-    mdadjamt: int = Field(description="매도정산금액", default=0)
-    msqty: int = Field(description="매수수량", default=0)
-    msamt: int = Field(description="매수약정금액", default=0)
-    msfee: int = Field(description="매수수수료", default=0)
-    tmstax: int = Field(description="매수제비용합", default=0)
-    msadjamt: int = Field(description="매수정산금액", default=0)
-    tqty: int = Field(description="합계수량", default=0)
-    tamt: int = Field(description="합계약정금액", default=0)
-    tfee: int = Field(description="합계수수료", default=0)
-    tottax: int = Field(description="합계거래세", default=0)
-    targtax: int = Field(description="합계농특세", default=0)
-    ttax: int = Field(description="합계제비용합", default=0)
-    tadjamt: int = Field(description="합계정산금액", default=0)
-    cts_medosu: str = Field(description="CTS_매매구분", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_price: str = Field(description="CTS_단가", default="")
-    cts_middiv: str = Field(description="CTS_매체", default="")
-
-
-class t0150OutBlock1(BaseModel):
-    medosu: str = Field(description="매매구분", default="")
-    expcode: str = Field(description="종목번호", default="")
-    qty: int = Field(description="수량", default=0)
-    price: int = Field(description="단가", default=0)
-    amt: int = Field(description="약정금액", default=0)
-    fee: int = Field(description="수수료", default=0)
-    tax: int = Field(description="거래세", default=0)
-    argtax: int = Field(description="농특세", default=0)
-    adjamt: int = Field(description="정산금액", default=0)
-    middiv: str = Field(description="매체", default="")
-
-
-# 주식당일매매일지/수수료(t0150)
-class t0150(BaseModel):
-    inblock: t0150InBlock = Field(description="t0150InBlock")
-    outblock: t0150OutBlock = Field(description="t0150OutBlock")
-    outblock1: List[t0150OutBlock1] = Field(description="t0150OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0150",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0151 - 주식당일매매일지/수수료(전일)(t0151)>
-class t0151InBlock(BaseModel):
-    date: str = Field(description="일자", default="")
-    accno: str = Field(description="계좌번호", default="")
-    cts_medosu: str = Field(description="CTS_매매구분", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_price: str = Field(description="CTS_단가", default="")
-    cts_middiv: str = Field(description="CTS_매체", default="")
-
-
-class t0151OutBlock(BaseModel):
-    mdqty: int = Field(description="매도수량", default=0)
-    mdamt: int = Field(description="매도약정금액", default=0)
-    mdfee: int = Field(description="매도수수료", default=0)
-    mdtax: int = Field(description="매도거래세", default=0)
-    mdargtax: int = Field(description="매도농특세", default=0)
-    tmdtax: int = Field(description="매도제비용합", default=0)
-    mdadjamt: int = Field(description="매도정산금액", default=0)
-    msqty: int = Field(description="매수수량", default=0)
-    msamt: int = Field(description="매수약정금액", default=0)
-    msfee: int = Field(description="매수수수료", default=0)
-    tmstax: int = Field(description="매수제비용합", default=0)
-    msadjamt: int = Field(description="매수정산금액", default=0)
-    tqty: int = Field(description="합계수량", default=0)
-    tamt: int = Field(description="합계약정금액", default=0)
-    tfee: int = Field(description="합계수수료", default=0)
-    tottax: int = Field(description="합계거래세", default=0)
-    targtax: int = Field(description="합계농특세", default=0)
-    ttax: int = Field(description="합계제비용합", default=0)
-    tadjamt: int = Field(description="합계정산금액", default=0)
-    cts_medosu: str = Field(description="CTS_매매구분", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_price: str = Field(description="CTS_단가", default="")
-    cts_middiv: str = Field(description="CTS_매체", default="")
-
-
-class t0151OutBlock1(BaseModel):
-    medosu: str = Field(description="매매구분", default="")
-    expcode: str = Field(description="종목번호", default="")
-    qty: int = Field(description="수량", default=0)
-    price: int = Field(description="단가", default=0)
-    amt: int = Field(description="약정금액", default=0)
-    fee: int = Field(description="수수료", default=0)
-    tax: int = Field(description="거래세", default=0)
-    argtax: int = Field(description="농특세", default=0)
-    adjamt: int = Field(description="정산금액", default=0)
-    middiv: str = Field(description="매체", default="")
-
-
-# 주식당일매매일지/수수료(전일)(t0151)
-class t0151(BaseModel):
-    inblock: t0151InBlock = Field(description="t0151InBlock")
-    outblock: t0151OutBlock = Field(description="t0151OutBlock")
-    outblock1: List[t0151OutBlock1] = Field(description="t0151OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0151",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0167 - 서버시간조회(t0167)>
-class t0167InBlock(BaseModel):
-    id: str = Field(description="id", default="")
-
-
-class t0167OutBlock(BaseModel):
-    dt: str = Field(description="일자(YYYYMMDD)", default="")
-    time: str = Field(description="시간(HHMMSSssssss)", default="")
-
-
-# 서버시간조회(t0167)
-class t0167(BaseModel):
-    inblock: t0167InBlock = Field(description="t0167InBlock")
-    outblock: t0167OutBlock = Field(description="t0167OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t0167",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0424 - 주식잔고2(t0424)>
-class t0424InBlock(BaseModel):
-    accno: str = Field(description="계좌번호", default="")
-    passwd: str = Field(description="비밀번호", default="")
-    prcgb: str = Field(description="단가구분", default="")
-    chegb: str = Field(description="체결구분", default="")
-    dangb: str = Field(description="단일가구분", default="")
-    charge: str = Field(description="제비용포함여부", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-
-
-class t0424OutBlock(BaseModel):
-    sunamt: int = Field(description="추정순자산", default=0)
-    dtsunik: int = Field(description="실현손익", default=0)
-    mamt: int = Field(description="매입금액", default=0)
-    sunamt1: int = Field(description="추정D2예수금", default=0)
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    tappamt: int = Field(description="평가금액", default=0)
-    tdtsunik: int = Field(description="평가손익", default=0)
-
-
-class t0424OutBlock1(BaseModel):
-    expcode: str = Field(description="종목번호", default="")
-    jangb: str = Field(description="잔고구분", default="")
-    janqty: int = Field(description="잔고수량", default=0)
-    mdposqt: int = Field(description="매도가능수량", default=0)
-    pamt: int = Field(description="평균단가", default=0)
-    mamt: int = Field(description="매입금액", default=0)
-    sinamt: int = Field(description="대출금액", default=0)
-    lastdt: str = Field(description="만기일자", default="")
-    msat: int = Field(description="당일매수금액", default=0)
-    mpms: int = Field(description="당일매수단가", default=0)
-    mdat: int = Field(description="당일매도금액", default=0)
-    mpmd: int = Field(description="당일매도단가", default=0)
-    jsat: int = Field(description="전일매수금액", default=0)
-    jpms: int = Field(description="전일매수단가", default=0)
-    jdat: int = Field(description="전일매도금액", default=0)
-    jpmd: int = Field(description="전일매도단가", default=0)
-    sysprocseq: int = Field(description="처리순번", default=0)
-    loandt: str = Field(description="대출일자", default="")
-    hname: str = Field(description="종목명", default="")
-    marketgb: str = Field(description="시장구분", default="")
-    jonggb: str = Field(description="종목구분", default="")
-    janrt: float = Field(description="보유비중", default=0.0)
-    price: int = Field(description="현재가", default=0)
-    appamt: int = Field(description="평가금액", default=0)
-    dtsunik: int = Field(description="평가손익", default=0)
-    sunikrt: float = Field(description="수익율", default=0.0)
-    fee: int = Field(description="수수료", default=0)
-    tax: int = Field(description="제세금", default=0)
-    sininter: int = Field(description="신용이자", default=0)
-
-
-# 주식잔고2(t0424)
-class t0424(BaseModel):
-    inblock: t0424InBlock = Field(description="t0424InBlock")
-    outblock: t0424OutBlock = Field(description="t0424OutBlock")
-    outblock1: List[t0424OutBlock1] = Field(description="t0424OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0424",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0425 - 주식체결/미체결(t0425)>
-class t0425InBlock(BaseModel):
-    accno: str = Field(description="계좌번호", default="")
-    passwd: str = Field(description="비밀번호", default="")
-    expcode: str = Field(description="종목번호", default="")
-    chegb: str = Field(description="체결구분", default="")
-    medosu: str = Field(description="매매구분", default="")
-    sortgb: str = Field(description="정렬순서", default="")
-    cts_ordno: str = Field(description="주문번호", default="")
-
-
-class t0425OutBlock(BaseModel):
-    tqty: int = Field(description="총주문수량", default=0)
-    tcheqty: int = Field(description="총체결수량", default=0)
-    tordrem: int = Field(description="총미체결수량", default=0)
-    cmss: int = Field(description="추정수수료", default=0)
-    tamt: int = Field(description="총주문금액", default=0)
-    tmdamt: int = Field(description="총매도체결금액", default=0)
-    tmsamt: int = Field(description="총매수체결금액", default=0)
-    tax: int = Field(description="추정제세금", default=0)
-    cts_ordno: str = Field(description="주문번호", default="")
-
-
-class t0425OutBlock1(BaseModel):
-    ordno: int = Field(description="주문번호", default=0)
-    expcode: str = Field(description="종목번호", default="")
-    medosu: str = Field(description="구분", default="")
-    qty: int = Field(description="주문수량", default=0)
-    price: int = Field(description="주문가격", default=0)
-    cheqty: int = Field(description="체결수량", default=0)
-    cheprice: int = Field(description="체결가격", default=0)
-    ordrem: int = Field(description="미체결잔량", default=0)
-    cfmqty: int = Field(description="확인수량", default=0)
-    status: str = Field(description="상태", default="")
-    orgordno: int = Field(description="원주문번호", default=0)
-    ordgb: str = Field(description="유형", default="")
-    ordtime: str = Field(description="주문시간", default="")
-    ordermtd: str = Field(description="주문매체", default="")
-    sysprocseq: int = Field(description="처리순번", default=0)
-    hogagb: str = Field(description="호가유형", default="")
-    price1: int = Field(description="현재가", default=0)
-    orggb: str = Field(description="주문구분", default="")
-    singb: str = Field(description="신용구분", default="")
-    loandt: str = Field(description="대출일자", default="")
-
-
-# 주식체결/미체결(t0425)
-class t0425(BaseModel):
-    inblock: t0425InBlock = Field(description="t0425InBlock")
-    outblock: t0425OutBlock = Field(description="t0425OutBlock")
-    outblock1: List[t0425OutBlock1] = Field(description="t0425OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0425",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0434 - 선물/옵션체결/미체결(t0434)>
-class t0434InBlock(BaseModel):
-    accno: str = Field(description="계좌번호", default="")
-    passwd: str = Field(description="비밀번호", default="")
-    expcode: str = Field(description="종목번호", default="")
-    chegb: str = Field(description="체결구분", default="")
-    sortgb: str = Field(description="정렬순서", default="")
-    cts_ordno: str = Field(description="CTS_주문번호", default="")
-
-
-class t0434OutBlock(BaseModel):
-    cts_ordno: str = Field(description="CTS_주문번호", default="")
-
-
-class t0434OutBlock1(BaseModel):
-    ordno: int = Field(description="주문번호", default=0)
-    orgordno: int = Field(description="원주문번호", default=0)
-    medosu: str = Field(description="구분", default="")
-    ordgb: str = Field(description="유형", default="")
-    qty: int = Field(description="주문수량", default=0)
-    price: float = Field(description="주문가격", default=0.0)
-    cheqty: int = Field(description="체결수량", default=0)
-    cheprice: float = Field(description="체결가격", default=0.0)
-    ordrem: int = Field(description="미체결잔량", default=0)
-    status: str = Field(description="상태", default="")
-    ordtime: str = Field(description="주문시간", default="")
-    ordermtd: str = Field(description="주문매체", default="")
-    expcode: str = Field(description="종목번호", default="")
-    rtcode: str = Field(description="사유코드", default="")
-    sysprocseq: int = Field(description="처리순번", default=0)
-    hogatype: str = Field(description="호가타입", default="")
-
-
-# 선물/옵션체결/미체결(t0434)
-class t0434(BaseModel):
-    inblock: t0434InBlock = Field(description="t0434InBlock")
-    outblock: t0434OutBlock = Field(description="t0434OutBlock")
-    outblock1: List[t0434OutBlock1] = Field(description="t0434OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0434",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t0441 - 선물/옵션잔고평가(이동평균)(t0441)>
-class t0441InBlock(BaseModel):
-    accno: str = Field(description="계좌번호", default="")
-    passwd: str = Field(description="비밀번호", default="")
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_medocd: str = Field(description="CTS_매매구분", default="")
-
-
-class t0441OutBlock(BaseModel):
-    tdtsunik: int = Field(description="매매손익합계", default=0)
-    cts_expcode: str = Field(description="CTS_종목번호", default="")
-    cts_medocd: str = Field(description="CTS_매매구분", default="")
-    tappamt: int = Field(description="평가금액", default=0)
-    tsunik: int = Field(description="평가손익", default=0)
-
-
-class t0441OutBlock1(BaseModel):
-    expcode: str = Field(description="종목번호", default="")
-    medosu: str = Field(description="구분", default="")
-    jqty: int = Field(description="잔고수량", default=0)
-    cqty: int = Field(description="청산가능수량", default=0)
-    pamt: float = Field(description="평균단가", default=0.0)
-    mamt: int = Field(description="총매입금액", default=0)
-    medocd: str = Field(description="매매구분", default="")
-    dtsunik: int = Field(description="매매손익", default=0)
-    sysprocseq: int = Field(description="처리순번", default=0)
-    price: float = Field(description="현재가", default=0.0)
-    appamt: int = Field(description="평가금액", default=0)
-    dtsunik1: int = Field(description="평가손익", default=0)
-    sunikrt: float = Field(description="수익율", default=0.0)
-
-
-# 선물/옵션잔고평가(이동평균)(t0441)
-class t0441(BaseModel):
-    inblock: t0441InBlock = Field(description="t0441InBlock")
-    outblock: t0441OutBlock = Field(description="t0441OutBlock")
-    outblock1: List[t0441OutBlock1] = Field(description="t0441OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t0441",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1101 - 주식현재가호가조회(t1101)>
-class t1101InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1101OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    preoffercha1: int = Field(description="직전매도대비수량1", default=0)
-    prebidcha1: int = Field(description="직전매수대비수량1", default=0)
-    offerho2: int = Field(description="매도호가2", default=0)
-    bidho2: int = Field(description="매수호가2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    preoffercha2: int = Field(description="직전매도대비수량2", default=0)
-    prebidcha2: int = Field(description="직전매수대비수량2", default=0)
-    offerho3: int = Field(description="매도호가3", default=0)
-    bidho3: int = Field(description="매수호가3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    preoffercha3: int = Field(description="직전매도대비수량3", default=0)
-    prebidcha3: int = Field(description="직전매수대비수량3", default=0)
-    offerho4: int = Field(description="매도호가4", default=0)
-    bidho4: int = Field(description="매수호가4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    preoffercha4: int = Field(description="직전매도대비수량4", default=0)
-    prebidcha4: int = Field(description="직전매수대비수량4", default=0)
-    offerho5: int = Field(description="매도호가5", default=0)
-    bidho5: int = Field(description="매수호가5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    preoffercha5: int = Field(description="직전매도대비수량5", default=0)
-    prebidcha5: int = Field(description="직전매수대비수량5", default=0)
-    offerho6: int = Field(description="매도호가6", default=0)
-    bidho6: int = Field(description="매수호가6", default=0)
-    offerrem6: int = Field(description="매도호가수량6", default=0)
-    bidrem6: int = Field(description="매수호가수량6", default=0)
-    preoffercha6: int = Field(description="직전매도대비수량6", default=0)
-    prebidcha6: int = Field(description="직전매수대비수량6", default=0)
-    offerho7: int = Field(description="매도호가7", default=0)
-    bidho7: int = Field(description="매수호가7", default=0)
-    offerrem7: int = Field(description="매도호가수량7", default=0)
-    bidrem7: int = Field(description="매수호가수량7", default=0)
-    preoffercha7: int = Field(description="직전매도대비수량7", default=0)
-    prebidcha7: int = Field(description="직전매수대비수량7", default=0)
-    offerho8: int = Field(description="매도호가8", default=0)
-    bidho8: int = Field(description="매수호가8", default=0)
-    offerrem8: int = Field(description="매도호가수량8", default=0)
-    bidrem8: int = Field(description="매수호가수량8", default=0)
-    preoffercha8: int = Field(description="직전매도대비수량8", default=0)
-    prebidcha8: int = Field(description="직전매수대비수량8", default=0)
-    offerho9: int = Field(description="매도호가9", default=0)
-    bidho9: int = Field(description="매수호가9", default=0)
-    offerrem9: int = Field(description="매도호가수량9", default=0)
-    bidrem9: int = Field(description="매수호가수량9", default=0)
-    preoffercha9: int = Field(description="직전매도대비수량9", default=0)
-    prebidcha9: int = Field(description="직전매수대비수량9", default=0)
-    offerho10: int = Field(description="매도호가10", default=0)
-    bidho10: int = Field(description="매수호가10", default=0)
-    offerrem10: int = Field(description="매도호가수량10", default=0)
-    bidrem10: int = Field(description="매수호가수량10", default=0)
-    preoffercha10: int = Field(description="직전매도대비수량10", default=0)
-    prebidcha10: int = Field(description="직전매수대비수량10", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-    preoffercha: int = Field(description="직전매도대비수량합", default=0)
-    prebidcha: int = Field(description="직전매수대비수량합", default=0)
-    hotime: str = Field(description="수신시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yevolume: int = Field(description="예상체결수량", default=0)
-    yesign: str = Field(description="예상체결전일구분", default="")
-    yechange: int = Field(description="예상체결전일대비", default=0)
-    yediff: float = Field(description="예상체결등락율", default=0.0)
-    tmoffer: int = Field(description="시간외매도잔량", default=0)
-    tmbid: int = Field(description="시간외매수잔량", default=0)
-    ho_status: str = Field(description="동시구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-
-
-# 주식현재가호가조회(t1101)
-class t1101(BaseModel):
-    inblock: t1101InBlock = Field(description="t1101InBlock")
-    outblock: t1101OutBlock = Field(description="t1101OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1101",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1102 - 주식현재가(시세)조회(t1102)>
-class t1102InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1102OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    recprice: int = Field(description="기준가(평가가격)", default=0)
-    avg: int = Field(description="가중평균", default=0)
-    uplmtprice: int = Field(description="상한가(최고호가가격)", default=0)
-    dnlmtprice: int = Field(description="하한가(최저호가가격)", default=0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    volumediff: int = Field(description="거래량차", default=0)
-    open: int = Field(description="시가", default=0)
-    opentime: str = Field(description="시가시간", default="")
-    high: int = Field(description="고가", default=0)
-    hightime: str = Field(description="고가시간", default="")
-    low: int = Field(description="저가", default=0)
-    lowtime: str = Field(description="저가시간", default="")
-    high52w: int = Field(description="52최고가", default=0)
-    high52wdate: str = Field(description="52최고가일", default="")
-    low52w: int = Field(description="52최저가", default=0)
-    low52wdate: str = Field(description="52최저가일", default="")
-    exhratio: float = Field(description="소진율", default=0.0)
-    per: float = Field(description="PER", default=0.0)
-    pbrx: float = Field(description="PBRX", default=0.0)
-    listing: int = Field(description="상장주식수(천)", default=0)
-    jkrate: int = Field(description="증거금율", default=0)
-    memedan: str = Field(description="수량단위", default="")
-    offernocd1: str = Field(description="매도증권사코드1", default="")
-    bidnocd1: str = Field(description="매수증권사코드1", default="")
-    offerno1: str = Field(description="매도증권사명1", default="")
-    bidno1: str = Field(description="매수증권사명1", default="")
-    dvol1: int = Field(description="총매도수량1", default=0)
-    svol1: int = Field(description="총매수수량1", default=0)
-    dcha1: int = Field(description="매도증감1", default=0)
-    scha1: int = Field(description="매수증감1", default=0)
-    ddiff1: float = Field(description="매도비율1", default=0.0)
-    sdiff1: float = Field(description="매수비율1", default=0.0)
-    offernocd2: str = Field(description="매도증권사코드2", default="")
-    bidnocd2: str = Field(description="매수증권사코드2", default="")
-    offerno2: str = Field(description="매도증권사명2", default="")
-    bidno2: str = Field(description="매수증권사명2", default="")
-    dvol2: int = Field(description="총매도수량2", default=0)
-    svol2: int = Field(description="총매수수량2", default=0)
-    dcha2: int = Field(description="매도증감2", default=0)
-    scha2: int = Field(description="매수증감2", default=0)
-    ddiff2: float = Field(description="매도비율2", default=0.0)
-    sdiff2: float = Field(description="매수비율2", default=0.0)
-    offernocd3: str = Field(description="매도증권사코드3", default="")
-    bidnocd3: str = Field(description="매수증권사코드3", default="")
-    offerno3: str = Field(description="매도증권사명3", default="")
-    bidno3: str = Field(description="매수증권사명3", default="")
-    dvol3: int = Field(description="총매도수량3", default=0)
-    svol3: int = Field(description="총매수수량3", default=0)
-    dcha3: int = Field(description="매도증감3", default=0)
-    scha3: int = Field(description="매수증감3", default=0)
-    ddiff3: float = Field(description="매도비율3", default=0.0)
-    sdiff3: float = Field(description="매수비율3", default=0.0)
-    offernocd4: str = Field(description="매도증권사코드4", default="")
-    bidnocd4: str = Field(description="매수증권사코드4", default="")
-    offerno4: str = Field(description="매도증권사명4", default="")
-    bidno4: str = Field(description="매수증권사명4", default="")
-    dvol4: int = Field(description="총매도수량4", default=0)
-    svol4: int = Field(description="총매수수량4", default=0)
-    dcha4: int = Field(description="매도증감4", default=0)
-    scha4: int = Field(description="매수증감4", default=0)
-    ddiff4: float = Field(description="매도비율4", default=0.0)
-    sdiff4: float = Field(description="매수비율4", default=0.0)
-    offernocd5: str = Field(description="매도증권사코드5", default="")
-    bidnocd5: str = Field(description="매수증권사코드5", default="")
-    offerno5: str = Field(description="매도증권사명5", default="")
-    bidno5: str = Field(description="매수증권사명5", default="")
-    dvol5: int = Field(description="총매도수량5", default=0)
-    svol5: int = Field(description="총매수수량5", default=0)
-    dcha5: int = Field(description="매도증감5", default=0)
-    scha5: int = Field(description="매수증감5", default=0)
-    ddiff5: float = Field(description="매도비율5", default=0.0)
-    sdiff5: float = Field(description="매수비율5", default=0.0)
-    fwdvl: int = Field(description="외국계매도합계수량", default=0)
-    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
-    ftradmddiff: float = Field(description="외국계매도비율", default=0.0)
-    fwsvl: int = Field(description="외국계매수합계수량", default=0)
-    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
-    ftradmsdiff: float = Field(description="외국계매수비율", default=0.0)
-    vol: float = Field(description="회전율", default=0.0)
-    shcode: str = Field(description="단축코드", default="")
-    value: int = Field(description="누적거래대금", default=0)
-    jvolume: int = Field(description="전일동시간거래량", default=0)
-    highyear: int = Field(description="연중최고가", default=0)
-    highyeardate: str = Field(description="연중최고일자", default="")
-    lowyear: int = Field(description="연중최저가", default=0)
-    lowyeardate: str = Field(description="연중최저일자", default="")
-    target: int = Field(description="목표가", default=0)
-    capital: int = Field(description="자본금", default=0)
-    abscnt: int = Field(description="유동주식수", default=0)
-    parprice: int = Field(description="액면가", default=0)
-    gsmm: str = Field(description="결산월", default="")
-    subprice: int = Field(description="대용가", default=0)
-    total: int = Field(description="시가총액", default=0)
-    listdate: str = Field(description="상장일", default="")
-    name: str = Field(description="전분기명", default="")
-    bfsales: int = Field(description="전분기매출액", default=0)
-    bfoperatingincome: int = Field(description="전분기영업이익", default=0)
-    bfordinaryincome: int = Field(description="전분기경상이익", default=0)
-    bfnetincome: int = Field(description="전분기순이익", default=0)
-    bfeps: float = Field(description="전분기EPS", default=0.0)
-    name2: str = Field(description="전전분기명", default="")
-    bfsales2: int = Field(description="전전분기매출액", default=0)
-    bfoperatingincome2: int = Field(description="전전분기영업이익", default=0)
-    bfordinaryincome2: int = Field(description="전전분기경상이익", default=0)
-    bfnetincome2: int = Field(description="전전분기순이익", default=0)
-    bfeps2: float = Field(description="전전분기EPS", default=0.0)
-    salert: float = Field(description="전년대비매출액", default=0.0)
-    opert: float = Field(description="전년대비영업이익", default=0.0)
-    ordrt: float = Field(description="전년대비경상이익", default=0.0)
-    netrt: float = Field(description="전년대비순이익", default=0.0)
-    epsrt: float = Field(description="전년대비EPS", default=0.0)
-    info1: str = Field(description="락구분", default="")
-    info2: str = Field(description="관리/급등구분", default="")
-    info3: str = Field(description="정지/연장구분", default="")
-    info4: str = Field(description="투자/불성실구분", default="")
-    janginfo: str = Field(description="장구분", default="")
-    t_per: float = Field(description="T.PER", default=0.0)
-    tonghwa: str = Field(description="통화ISO코드", default="")
-    dval1: int = Field(description="총매도대금1", default=0)
-    sval1: int = Field(description="총매수대금1", default=0)
-    dval2: int = Field(description="총매도대금2", default=0)
-    sval2: int = Field(description="총매수대금2", default=0)
-    dval3: int = Field(description="총매도대금3", default=0)
-    sval3: int = Field(description="총매수대금3", default=0)
-    dval4: int = Field(description="총매도대금4", default=0)
-    sval4: int = Field(description="총매수대금4", default=0)
-    dval5: int = Field(description="총매도대금5", default=0)
-    sval5: int = Field(description="총매수대금5", default=0)
-    davg1: int = Field(description="총매도평단가1", default=0)
-    savg1: int = Field(description="총매수평단가1", default=0)
-    davg2: int = Field(description="총매도평단가2", default=0)
-    savg2: int = Field(description="총매수평단가2", default=0)
-    davg3: int = Field(description="총매도평단가3", default=0)
-    savg3: int = Field(description="총매수평단가3", default=0)
-    davg4: int = Field(description="총매도평단가4", default=0)
-    savg4: int = Field(description="총매수평단가4", default=0)
-    davg5: int = Field(description="총매도평단가5", default=0)
-    savg5: int = Field(description="총매수평단가5", default=0)
-    ftradmdval: int = Field(description="외국계매도대금", default=0)
-    ftradmsval: int = Field(description="외국계매수대금", default=0)
-    ftradmdvag: int = Field(description="외국계매도평단가", default=0)
-    ftradmsvag: int = Field(description="외국계매수평단가", default=0)
-    info5: str = Field(description="투자주의환기", default="")
-    spac_gubun: str = Field(description="기업인수목적회사여부", default="")
-    issueprice: int = Field(description="발행가격", default=0)
-    alloc_gubun: str = Field(description="배분적용구분코드(1:배분발생2:배분해제그외:미발생)", default="")
-    alloc_text: str = Field(description="배분적용구분", default="")
-    shterm_text: str = Field(description="단기과열/VI발동", default="")
-    svi_uplmtprice: int = Field(description="정적VI상한가", default=0)
-    svi_dnlmtprice: int = Field(description="정적VI하한가", default=0)
-    low_lqdt_gu: str = Field(description="저유동성종목여부", default="")
-    abnormal_rise_gu: str = Field(description="이상급등종목여부", default="")
-    lend_text: str = Field(description="대차불가표시", default="")
-    ty_text: str = Field(description="ETF/ETN투자유의", default="")
-
-
-# 주식현재가(시세)조회(t1102)
-class t1102(BaseModel):
-    inblock: t1102InBlock = Field(description="t1102InBlock")
-    outblock: t1102OutBlock = Field(description="t1102OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1102",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1104 - 주식현재가시세메모(t1104)>
-class t1104InBlock(BaseModel):
-    code: str = Field(description="종목코드", default="")
-    nrec: str = Field(description="건수", default="")
-
-
-class t1104InBlock1(BaseModel):
-    indx: str = Field(description="인덱스", default="")
-    gubn: str = Field(description="조건구분", default="")
-    dat1: str = Field(description="데이타1", default="")
-    dat2: str = Field(description="데이타2", default="")
-
-
-class t1104OutBlock(BaseModel):
-    nrec: str = Field(description="출력건수", default="")
-
-
-class t1104OutBlock1(BaseModel):
-    indx: str = Field(description="인덱스", default="")
-    gubn: str = Field(description="조건구분", default="")
-    vals: str = Field(description="출력값", default="")
-
-
-# 주식현재가시세메모(t1104)
-class t1104(BaseModel):
-    inblock: t1104InBlock = Field(description="t1104InBlock")
-    inblock1: t1104InBlock1 = Field(description="t1104InBlock1")
-    outblock: t1104OutBlock = Field(description="t1104OutBlock")
-    outblock1: List[t1104OutBlock1] = Field(description="t1104OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1104",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1105 - 주식피못/디마크조회(t1105)>
-class t1105InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1105OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    pbot: int = Field(description="피봇", default=0)
-    offer1: int = Field(description="1차저항", default=0)
-    supp1: int = Field(description="1차지지", default=0)
-    offer2: int = Field(description="2차저항", default=0)
-    supp2: int = Field(description="2차지지", default=0)
-    stdprc: int = Field(description="기준가격", default=0)
-    offerd: int = Field(description="D저항", default=0)
-    suppd: int = Field(description="D지지", default=0)
-
-
-# 주식피못/디마크조회(t1105)
-class t1105(BaseModel):
-    inblock: t1105InBlock = Field(description="t1105InBlock")
-    outblock: t1105OutBlock = Field(description="t1105OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1105",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1109 - 시간외체결량(t1109)>
-class t1109InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    dan_chetime: str = Field(description="체결cts", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1109OutBlock(BaseModel):
-    ctsshcode: str = Field(description="종목cts", default="")
-    ctschetime: str = Field(description="체결cts", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1109OutBlock1(BaseModel):
-    dan_chetime: str = Field(description="시간", default="")
-    dan_price: int = Field(description="현재가", default=0)
-    dan_sign: str = Field(description="전일대비구분", default="")
-    dan_change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    dan_cvolume: int = Field(description="체결량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    dan_volume: int = Field(description="누적거래량", default=0)
-
-
-# 시간외체결량(t1109)
-class t1109(BaseModel):
-    inblock: t1109InBlock = Field(description="t1109InBlock")
-    outblock: t1109OutBlock = Field(description="t1109OutBlock")
-    outblock1: List[t1109OutBlock1] = Field(description="t1109OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1109",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1301 - 주식시간대별체결조회(t1301)>
-class t1301InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    starttime: str = Field(description="시작시간", default="")
-    endtime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1301OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1301OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    revolume: int = Field(description="순체결량", default=0)
-    rechecnt: int = Field(description="순체결건수", default=0)
-
-
-# 주식시간대별체결조회(t1301)
-class t1301(BaseModel):
-    inblock: t1301InBlock = Field(description="t1301InBlock")
-    outblock: t1301OutBlock = Field(description="t1301OutBlock")
-    outblock1: List[t1301OutBlock1] = Field(description="t1301OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1301",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1302 - 주식분별주가조회(t1302)>
-class t1302InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="작업구분", default="")
-    time: str = Field(description="시간", default="")
-    cnt: str = Field(description="건수", default="")
-
-
-class t1302OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1302OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    revolume: int = Field(description="순매수체결량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    rechecnt: int = Field(description="순체결건수", default=0)
-    volume: int = Field(description="거래량", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    cvolume: int = Field(description="체결량", default=0)
-    mdchecnttm: int = Field(description="매도체결건수(시간)", default=0)
-    mschecnttm: int = Field(description="매수체결건수(시간)", default=0)
-    totofferrem: int = Field(description="매도잔량", default=0)
-    totbidrem: int = Field(description="매수잔량", default=0)
-    mdvolumetm: int = Field(description="시간별매도체결량", default=0)
-    msvolumetm: int = Field(description="시간별매수체결량", default=0)
-
-
-# 주식분별주가조회(t1302)
-class t1302(BaseModel):
-    inblock: t1302InBlock = Field(description="t1302InBlock")
-    outblock: t1302OutBlock = Field(description="t1302OutBlock")
-    outblock1: List[t1302OutBlock1] = Field(description="t1302OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1302",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1305 - 기간별주가(t1305)>
-class t1305InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    dwmcode: int = Field(description="일주월구분", default=0)
-    date: str = Field(description="날짜", default="")
-    idx: int = Field(description="IDX", default=0)
-    cnt: int = Field(description="건수", default=0)
-
-
-class t1305OutBlock(BaseModel):
-    cnt: int = Field(description="CNT", default=0)
-    date: str = Field(description="날짜", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1305OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    sojinrate: float = Field(description="소진율", default=0.0)
-    changerate: float = Field(description="회전율", default=0.0)
-    fpvolume: int = Field(description="외인순매수", default=0)
-    covolume: int = Field(description="기관순매수", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    value: int = Field(description="누적거래대금(단위:백만)", default=0)
-    ppvolume: int = Field(description="개인순매수", default=0)
-    o_sign: str = Field(description="시가대비구분", default="")
-    o_change: int = Field(description="시가대비", default=0)
-    o_diff: float = Field(description="시가기준등락율", default=0.0)
-    h_sign: str = Field(description="고가대비구분", default="")
-    h_change: int = Field(description="고가대비", default=0)
-    h_diff: float = Field(description="고가기준등락율", default=0.0)
-    l_sign: str = Field(description="저가대비구분", default="")
-    l_change: int = Field(description="저가대비", default=0)
-    l_diff: float = Field(description="저가기준등락율", default=0.0)
-    marketcap: int = Field(description="시가총액(단위:백만)", default=0)
-
-
-# 기간별주가(t1305)
-class t1305(BaseModel):
-    inblock: t1305InBlock = Field(description="t1305InBlock")
-    outblock: t1305OutBlock = Field(description="t1305OutBlock")
-    outblock1: List[t1305OutBlock1] = Field(description="t1305OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1305",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1308 - 주식시간대별체결조회챠트(t1308)>
-class t1308InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    starttime: str = Field(description="시작시간", default="")
-    endtime: str = Field(description="종료시간", default="")
-    bun_term: str = Field(description="분간격", default="")
-
-
-class t1308OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
-    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-
-
-# 주식시간대별체결조회챠트(t1308)
-class t1308(BaseModel):
-    inblock: t1308InBlock = Field(description="t1308InBlock")
-    outblock1: List[t1308OutBlock1] = Field(description="t1308OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1308",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1310 - 주식당일전일분틱조회(t1310)>
-class t1310InBlock(BaseModel):
-    daygb: str = Field(description="당일전일구분", default="")
-    timegb: str = Field(description="분틱구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    endtime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1310OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1310OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    revolume: int = Field(description="순체결량", default=0)
-    rechecnt: int = Field(description="순체결건수", default=0)
-
-
-# 주식당일전일분틱조회(t1310)
-class t1310(BaseModel):
-    inblock: t1310InBlock = Field(description="t1310InBlock")
-    outblock: t1310OutBlock = Field(description="t1310OutBlock")
-    outblock1: List[t1310OutBlock1] = Field(description="t1310OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1310",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1403 - 신규상장종목조회(t1403)>
-class t1403InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    styymm: str = Field(description="시작상장월", default="")
-    enyymm: str = Field(description="종료상장월", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1403OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1403OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    kmprice: int = Field(description="공모가", default=0)
-    date: str = Field(description="등록일", default="")
-    recprice: int = Field(description="등록일기준가", default=0)
-    kmdiff: float = Field(description="기준가등락율", default=0.0)
-    close: int = Field(description="등록일종가", default=0)
-    recdiff: float = Field(description="등록일등락율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 신규상장종목조회(t1403)
-class t1403(BaseModel):
-    inblock: t1403InBlock = Field(description="t1403InBlock")
-    outblock: t1403OutBlock = Field(description="t1403OutBlock")
-    outblock1: List[t1403OutBlock1] = Field(description="t1403OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1403",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1404 - 관리/불성실/투자유의조회(t1404)>
-class t1404InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1404OutBlock(BaseModel):
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1404OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    date: str = Field(description="지정일", default="")
-    tprice: int = Field(description="지정일주가", default=0)
-    tchange: int = Field(description="지정일대비", default=0)
-    tdiff: float = Field(description="대비율", default=0.0)
-    reason: str = Field(description="사유", default="")
-    shcode: str = Field(description="종목코드", default="")
-    edate: str = Field(description="해제일", default="")
-
-
-# 관리/불성실/투자유의조회(t1404)
-class t1404(BaseModel):
-    inblock: t1404InBlock = Field(description="t1404InBlock")
-    outblock: t1404OutBlock = Field(description="t1404OutBlock")
-    outblock1: List[t1404OutBlock1] = Field(description="t1404OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1404",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1405 - 투자경고/매매정지/정리매매조회(t1405)>
-class t1405InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1405OutBlock(BaseModel):
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1405OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    date: str = Field(description="지정일", default="")
-    edate: str = Field(description="해제일", default="")
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 투자경고/매매정지/정리매매조회(t1405)
-class t1405(BaseModel):
-    inblock: t1405InBlock = Field(description="t1405InBlock")
-    outblock: t1405OutBlock = Field(description="t1405OutBlock")
-    outblock1: List[t1405OutBlock1] = Field(description="t1405OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1405",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1410 - 초저유동성조회(t1410)>
-class t1410InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1410OutBlock(BaseModel):
-    cts_shcode: str = Field(description="종목코드_CTS", default="")
-
-
-class t1410OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 초저유동성조회(t1410)
-class t1410(BaseModel):
-    inblock: t1410InBlock = Field(description="t1410InBlock")
-    outblock: t1410OutBlock = Field(description="t1410OutBlock")
-    outblock1: List[t1410OutBlock1] = Field(description="t1410OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1410",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1411 - 증거금율별종목조회(t1411)>
-class t1411InBlock(BaseModel):
-    gubun: str = Field(description="시장구분", default="")
-    jongchk: str = Field(description="위탁신용구분", default="")
-    jkrate: str = Field(description="증거금율구분", default="")
-    shcode: str = Field(description="종목코드", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1411OutBlock(BaseModel):
-    jkrate: int = Field(description="위탁증거금율", default=0)
-    sjkrate: int = Field(description="신용증거금율", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1411OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    jkrate: int = Field(description="위탁증거금율", default=0)
-    sjkrate: int = Field(description="신용증거금율", default=0)
-    subprice: int = Field(description="대용가", default=0)
-    recprice: int = Field(description="전일종가", default=0)
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-
-
-# 증거금율별종목조회(t1411)
-class t1411(BaseModel):
-    inblock: t1411InBlock = Field(description="t1411InBlock")
-    outblock: t1411OutBlock = Field(description="t1411OutBlock")
-    outblock1: List[t1411OutBlock1] = Field(description="t1411OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1411",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1422 - 상/하한(t1422)>
-class t1422InBlock(BaseModel):
-    qrygb: str = Field(description="조회구분", default="")
-    gubun: str = Field(description="구분", default="")
-    jnilgubun: str = Field(description="전일구분", default="")
-    sign: str = Field(description="상하한구분", default="")
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1422OutBlock(BaseModel):
-    cnt: int = Field(description="CNT", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1422OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    last: str = Field(description="최종진입", default="")
-    lmtdaycnt: int = Field(description="연속", default=0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 상/하한(t1422)
-class t1422(BaseModel):
-    inblock: t1422InBlock = Field(description="t1422InBlock")
-    outblock: t1422OutBlock = Field(description="t1422OutBlock")
-    outblock1: List[t1422OutBlock1] = Field(description="t1422OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1422",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1427 - 상/하한가직전(t1427)>
-class t1427InBlock(BaseModel):
-    qrygb: str = Field(description="조회구분", default="")
-    gubun: str = Field(description="구분", default="")
-    signgubun: str = Field(description="상하한가구분", default="")
-    diff: int = Field(description="등락율", default=0)
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-    jshex: str = Field(description="전일상하한제외", default="")
-
-
-class t1427OutBlock(BaseModel):
-    cnt: int = Field(description="CNT", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1427OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    lmtprice: int = Field(description="상한가/하한가", default=0)
-    rate: float = Field(description="대비율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    lmtdaycnt: int = Field(description="연속", default=0)
-    value: int = Field(description="거래대금", default=0)
-    total: int = Field(description="시가총액", default=0)
-
-
-# 상/하한가직전(t1427)
-class t1427(BaseModel):
-    inblock: t1427InBlock = Field(description="t1427InBlock")
-    outblock: t1427OutBlock = Field(description="t1427OutBlock")
-    outblock1: List[t1427OutBlock1] = Field(description="t1427OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1427",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1441 - 등락율상위(t1441)>
-class t1441InBlock(BaseModel):
-    gubun1: str = Field(description="구분", default="")
-    gubun2: str = Field(description="상승하락", default="")
-    gubun3: str = Field(description="당일전일", default="")
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-    jc_num2: int = Field(description="대상제외2", default=0)
-
-
-class t1441OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1441OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    offerho1: int = Field(description="매도호가", default=0)
-    bidho1: int = Field(description="매수호가", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    updaycnt: int = Field(description="연속", default=0)
-    jnildiff: float = Field(description="전일등락율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    voldiff: float = Field(description="거래량대비율", default=0.0)
-    value: int = Field(description="거래대금", default=0)
-    total: int = Field(description="시가총액", default=0)
-
-
-# 등락율상위(t1441)
-class t1441(BaseModel):
-    inblock: t1441InBlock = Field(description="t1441InBlock")
-    outblock: t1441OutBlock = Field(description="t1441OutBlock")
-    outblock1: List[t1441OutBlock1] = Field(description="t1441OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1441",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1442 - 신고/신저가(t1442)>
-class t1442InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    type1: str = Field(description="신고신저", default="")
-    type2: str = Field(description="기간", default="")
-    type3: str = Field(description="유지여부", default="")
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-    jc_num2: int = Field(description="대상제외2", default=0)
-
-
-class t1442OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1442OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    pastprice: int = Field(description="이전가", default=0)
-    pastsign: str = Field(description="이전가대비구분", default="")
-    pastchange: int = Field(description="이전가대비", default=0)
-    pastdiff: float = Field(description="이전가대비율", default=0.0)
-
-
-# 신고/신저가(t1442)
-class t1442(BaseModel):
-    inblock: t1442InBlock = Field(description="t1442InBlock")
-    outblock: t1442OutBlock = Field(description="t1442OutBlock")
-    outblock1: List[t1442OutBlock1] = Field(description="t1442OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1442",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1444 - 시가총액상위(t1444)>
-class t1444InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1444OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1444OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    vol_rate: float = Field(description="거래비중", default=0.0)
-    total: int = Field(description="시가총액", default=0)
-    rate: float = Field(description="비중", default=0.0)
-    for_rate: float = Field(description="외인비중", default=0.0)
-
-
-# 시가총액상위(t1444)
-class t1444(BaseModel):
-    inblock: t1444InBlock = Field(description="t1444InBlock")
-    outblock: t1444OutBlock = Field(description="t1444OutBlock")
-    outblock1: List[t1444OutBlock1] = Field(description="t1444OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1444",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1449 - 가격대별매매비중조회(t1449)>
-class t1449InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    dategb: str = Field(description="일자구분", default="")
-
-
-class t1449OutBlock(BaseModel):
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    msvolume: int = Field(description="매수체결량", default=0)
-    mdvolume: int = Field(description="매도체결량", default=0)
-
-
-class t1449OutBlock1(BaseModel):
-    price: int = Field(description="체결가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    tickdiff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    diff: float = Field(description="비중", default=0.0)
-    mdvolume: int = Field(description="매도체결량", default=0)
-    msvolume: int = Field(description="매수체결량", default=0)
-    msdiff: float = Field(description="매수비율", default=0.0)
-
-
-# 가격대별매매비중조회(t1449)
-class t1449(BaseModel):
-    inblock: t1449InBlock = Field(description="t1449InBlock")
-    outblock: t1449OutBlock = Field(description="t1449OutBlock")
-    outblock1: List[t1449OutBlock1] = Field(description="t1449OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1449",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1452 - 거래량상위(t1452)>
-class t1452InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    jnilgubun: str = Field(description="전일구분", default="")
-    sdiff: int = Field(description="시작등락율", default=0)
-    ediff: int = Field(description="종료등락율", default=0)
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1452OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1452OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    vol: float = Field(description="회전율", default=0.0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    bef_diff: float = Field(description="전일비", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 거래량상위(t1452)
-class t1452(BaseModel):
-    inblock: t1452InBlock = Field(description="t1452InBlock")
-    outblock: t1452OutBlock = Field(description="t1452OutBlock")
-    outblock1: List[t1452OutBlock1] = Field(description="t1452OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1452",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1463 - 거래대금상위(t1463)>
-class t1463InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    jnilgubun: str = Field(description="전일구분", default="")
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-    jc_num2: int = Field(description="대상제외2", default=0)
-
-
-class t1463OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1463OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    jnilvalue: int = Field(description="전일거래대금", default=0)
-    bef_diff: float = Field(description="전일비", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    filler: str = Field(description="filler", default="")
-    jnilvolume: int = Field(description="전일거래량", default=0)
-
-
-# 거래대금상위(t1463)
-class t1463(BaseModel):
-    inblock: t1463InBlock = Field(description="t1463InBlock")
-    outblock: t1463OutBlock = Field(description="t1463OutBlock")
-    outblock1: List[t1463OutBlock1] = Field(description="t1463OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1463",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1466 - 전일동시간대비거래급증(t1466)>
-class t1466InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    type1: str = Field(description="전일거래량", default="")
-    type2: str = Field(description="거래급등율", default="")
-    jc_num: int = Field(description="대상제외", default=0)
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    idx: int = Field(description="IDX", default=0)
-    jc_num2: int = Field(description="대상제외2", default=0)
-
-
-class t1466OutBlock(BaseModel):
-    hhmm: str = Field(description="현재시분", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1466OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    stdvolume: int = Field(description="전일거래량", default=0)
-    volume: int = Field(description="당일거래량", default=0)
-    voldiff: float = Field(description="거래급등율", default=0.0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-
-
-# 전일동시간대비거래급증(t1466)
-class t1466(BaseModel):
-    inblock: t1466InBlock = Field(description="t1466InBlock")
-    outblock: t1466OutBlock = Field(description="t1466OutBlock")
-    outblock1: List[t1466OutBlock1] = Field(description="t1466OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1466",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1471 - 시간대별호가잔량추이(t1471)>
-class t1471InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    gubun: str = Field(description="분구분", default="")
-    time: str = Field(description="시간", default="")
-    cnt: str = Field(description="자료개수", default="")
-
-
-class t1471OutBlock(BaseModel):
-    time: str = Field(description="시간CTS", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-
-
-class t1471OutBlock1(BaseModel):
-    time: str = Field(description="체결시간", default="")
-    preoffercha1: int = Field(description="메도증감", default=0)
-    offerrem1: int = Field(description="매도우선잔량", default=0)
-    offerho1: int = Field(description="매도우선호가", default=0)
-    bidho1: int = Field(description="매수우선호가", default=0)
-    bidrem1: int = Field(description="매수우선잔량", default=0)
-    prebidcha1: int = Field(description="매수증감", default=0)
-    totofferrem: int = Field(description="총매도", default=0)
-    totbidrem: int = Field(description="총매수", default=0)
-    totsun: int = Field(description="순매수", default=0)
-    msrate: float = Field(description="매수비율", default=0.0)
-    close: int = Field(description="종가", default=0)
-
-
-# 시간대별호가잔량추이(t1471)
-class t1471(BaseModel):
-    inblock: t1471InBlock = Field(description="t1471InBlock")
-    outblock: t1471OutBlock = Field(description="t1471OutBlock")
-    outblock1: List[t1471OutBlock1] = Field(description="t1471OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1471",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1475 - 체결강도추이(t1475)>
-class t1475InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    vptype: str = Field(description="상승하락", default="")
-    datacnt: int = Field(description="데이터개수", default=0)
-    date: int = Field(description="기준일자", default=0)
-    time: int = Field(description="기준시간", default=0)
-    rankcnt: int = Field(description="랭크카운터", default=0)
-    gubun: str = Field(description="조회구분", default="")
-
-
-class t1475OutBlock(BaseModel):
-    date: int = Field(description="기준일자", default=0)
-    time: int = Field(description="기준시간", default=0)
-    rankcnt: int = Field(description="랭크카운터", default=0)
-
-
-class t1475OutBlock1(BaseModel):
-    datetime: str = Field(description="일자", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    todayvp: float = Field(description="당일VP", default=0.0)
-    ma5vp: float = Field(description="5일MAVP", default=0.0)
-    ma20vp: float = Field(description="20일MAVP", default=0.0)
-    ma60vp: float = Field(description="60일MAVP", default=0.0)
-
-
-# 체결강도추이(t1475)
-class t1475(BaseModel):
-    inblock: t1475InBlock = Field(description="t1475InBlock")
-    outblock: t1475OutBlock = Field(description="t1475OutBlock")
-    outblock1: List[t1475OutBlock1] = Field(description="t1475OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1475",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1481 - 시간외등락율상위(t1481)>
-class t1481InBlock(BaseModel):
-    gubun1: str = Field(description="구분", default="")
-    gubun2: str = Field(description="상승하락", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    volume: str = Field(description="거래량", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1481OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1481OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    offerho1: int = Field(description="매도호가", default=0)
-    bidho1: int = Field(description="매수호가", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    value: int = Field(description="누적거래대금", default=0)
-
-
-# 시간외등락율상위(t1481)
-class t1481(BaseModel):
-    inblock: t1481InBlock = Field(description="t1481InBlock")
-    outblock: t1481OutBlock = Field(description="t1481OutBlock")
-    outblock1: List[t1481OutBlock1] = Field(description="t1481OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1481",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1482 - 시간외거래량상위(t1482)>
-class t1482InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    jongchk: str = Field(description="거래량", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1482OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1482OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    vol: float = Field(description="회전율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    value: int = Field(description="누적거래대금", default=0)
-
-
-# 시간외거래량상위(t1482)
-class t1482(BaseModel):
-    inblock: t1482InBlock = Field(description="t1482InBlock")
-    outblock: t1482OutBlock = Field(description="t1482OutBlock")
-    outblock1: List[t1482OutBlock1] = Field(description="t1482OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1482",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1485 - 예상지수(t1485)>
-class t1485InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-    gubun: str = Field(description="조회구분", default="")
-
-
-class t1485OutBlock(BaseModel):
-    pricejisu: float = Field(description="현재지수", default=0.0)
-    sign: str = Field(description="지수전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    yhighjo: int = Field(description="상승종목수", default=0)
-    yupjo: int = Field(description="상한종목수", default=0)
-    yunchgjo: int = Field(description="보합종목수", default=0)
-    ylowjo: int = Field(description="하락종목수", default=0)
-    ydownjo: int = Field(description="하한종목수", default=0)
-    ytrajo: int = Field(description="거래형성수", default=0)
-
-
-class t1485OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    jisu: float = Field(description="예상지수", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    volume: int = Field(description="예상체결량", default=0)
-    volcha: int = Field(description="예상체결량직전대비", default=0)
-    diff: float = Field(description="예상등락율", default=0.0)
-
-
-# 예상지수(t1485)
-class t1485(BaseModel):
-    inblock: t1485InBlock = Field(description="t1485InBlock")
-    outblock: t1485OutBlock = Field(description="t1485OutBlock")
-    outblock1: List[t1485OutBlock1] = Field(description="t1485OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1485",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1486 - 시간별예상체결가(t1486)>
-class t1486InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t1486OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1486OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="예상체결가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="예상체결량", default=0)
-    offerho1: int = Field(description="매도호가", default=0)
-    bidho1: int = Field(description="매수호가", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-
-
-# 시간별예상체결가(t1486)
-class t1486(BaseModel):
-    inblock: t1486InBlock = Field(description="t1486InBlock")
-    outblock: t1486OutBlock = Field(description="t1486OutBlock")
-    outblock1: List[t1486OutBlock1] = Field(description="t1486OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1486",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1488 - 예상체결가등락율상위조회(t1488)>
-class t1488InBlock(BaseModel):
-    gubun: str = Field(description="거래소구분", default="")
-    sign: str = Field(description="상하락구분", default="")
-    jgubun: str = Field(description="장구분", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    idx: int = Field(description="IDX", default=0)
-    volume: str = Field(description="거래량", default="")
-    yesprice: int = Field(description="예상체결시작가격", default=0)
-    yeeprice: int = Field(description="예상체결종료가격", default=0)
-    yevolume: int = Field(description="예상체결량", default=0)
-
-
-class t1488OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1488OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    offerrem: int = Field(description="매도잔량", default=0)
-    offerho: int = Field(description="매도호가", default=0)
-    bidho: int = Field(description="매수호가", default=0)
-    bidrem: int = Field(description="매수잔량", default=0)
-    cnt: int = Field(description="연속일수", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    jkrate: str = Field(description="증거금율", default="")
-    jnilvolume: int = Field(description="전일거래량", default=0)
-
-
-# 예상체결가등락율상위조회(t1488)
-class t1488(BaseModel):
-    inblock: t1488InBlock = Field(description="t1488InBlock")
-    outblock: t1488OutBlock = Field(description="t1488OutBlock")
-    outblock1: List[t1488OutBlock1] = Field(description="t1488OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1488",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1489 - 예상체결량상위조회(t1489)>
-class t1489InBlock(BaseModel):
-    gubun: str = Field(description="거래소구분", default="")
-    jgubun: str = Field(description="장구분", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    idx: int = Field(description="IDX", default=0)
-    yesprice: int = Field(description="예상체결시작가격", default=0)
-    yeeprice: int = Field(description="예상체결종료가격", default=0)
-    yevolume: int = Field(description="예상체결량", default=0)
-
-
-class t1489OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1489OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="예상거래량", default=0)
-    offerho: int = Field(description="매도호가", default=0)
-    bidho: int = Field(description="매수호가", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    jnilvolume: int = Field(description="전일거래량", default=0)
-
-
-# 예상체결량상위조회(t1489)
-class t1489(BaseModel):
-    inblock: t1489InBlock = Field(description="t1489InBlock")
-    outblock: t1489OutBlock = Field(description="t1489OutBlock")
-    outblock1: List[t1489OutBlock1] = Field(description="t1489OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1489",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1492 - 단일가예상등락율상위(t1492)>
-class t1492InBlock(BaseModel):
-    gubun1: str = Field(description="구분", default="")
-    gubun2: str = Field(description="상승하락", default="")
-    jongchk: str = Field(description="종목체크", default="")
-    volume: str = Field(description="거래량", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1492OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1492OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="예상체결가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    yevolume: int = Field(description="예상체결량", default=0)
-    volume: int = Field(description="누적거래량", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    offerho1: int = Field(description="매도호가", default=0)
-    bidho1: int = Field(description="매수호가", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    value: int = Field(description="누적거래대금", default=0)
-
-
-# 단일가예상등락율상위(t1492)
-class t1492(BaseModel):
-    inblock: t1492InBlock = Field(description="t1492InBlock")
-    outblock: t1492OutBlock = Field(description="t1492OutBlock")
-    outblock1: List[t1492OutBlock1] = Field(description="t1492OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1492",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1511 - 업종현재가(t1511)>
-class t1511InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-
-
-class t1511OutBlock(BaseModel):
-    gubun: str = Field(description="업종구분", default="")
-    hname: str = Field(description="업종명", default="")
-    pricejisu: float = Field(description="현재지수", default=0.0)
-    jniljisu: float = Field(description="전일지수", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diffjisu: float = Field(description="지수등락율", default=0.0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    volume: int = Field(description="당일거래량", default=0)
-    volumechange: int = Field(description="거래량전일대비", default=0)
-    volumerate: float = Field(description="거래량비율", default=0.0)
-    jnilvalue: int = Field(description="전일거래대금", default=0)
-    value: int = Field(description="당일거래대금", default=0)
-    valuechange: int = Field(description="거래대금전일대비", default=0)
-    valuerate: float = Field(description="거래대금비율", default=0.0)
-    openjisu: float = Field(description="시가지수", default=0.0)
-    opendiff: float = Field(description="시가등락율", default=0.0)
-    opentime: str = Field(description="시가시간", default="")
-    highjisu: float = Field(description="고가지수", default=0.0)
-    highdiff: float = Field(description="고가등락율", default=0.0)
-    hightime: str = Field(description="고가시간", default="")
-    lowjisu: float = Field(description="저가지수", default=0.0)
-    lowdiff: float = Field(description="저가등락율", default=0.0)
-    lowtime: str = Field(description="저가시간", default="")
-    whjisu: float = Field(description="52주최고지수", default=0.0)
-    whchange: float = Field(description="52주최고현재가대비", default=0.0)
-    whjday: str = Field(description="52주최고지수일자", default="")
-    wljisu: float = Field(description="52주최저지수", default=0.0)
-    wlchange: float = Field(description="52주최저현재가대비", default=0.0)
-    wljday: str = Field(description="52주최저지수일자", default="")
-    yhjisu: float = Field(description="연중최고지수", default=0.0)
-    yhchange: float = Field(description="연중최고현재가대비", default=0.0)
-    yhjday: str = Field(description="연중최고지수일자", default="")
-    yljisu: float = Field(description="연중최저지수", default=0.0)
-    ylchange: float = Field(description="연중최저현재가대비", default=0.0)
-    yljday: str = Field(description="연중최저지수일자", default="")
-    firstjcode: str = Field(description="첫번째지수코드", default="")
-    firstjname: str = Field(description="첫번째지수명", default="")
-    firstjisu: float = Field(description="첫번째지수", default=0.0)
-    firsign: str = Field(description="첫번째대비구분", default="")
-    firchange: float = Field(description="첫번째전일대비", default=0.0)
-    firdiff: float = Field(description="첫번째등락율", default=0.0)
-    secondjcode: str = Field(description="두번째지수코드", default="")
-    secondjname: str = Field(description="두번째지수명", default="")
-    secondjisu: float = Field(description="두번째지수", default=0.0)
-    secsign: str = Field(description="두번째대비구분", default="")
-    secchange: float = Field(description="두번째전일대비", default=0.0)
-    secdiff: float = Field(description="두번째등락율", default=0.0)
-    thirdjcode: str = Field(description="세번째지수코드", default="")
-    thirdjname: str = Field(description="세번째지수명", default="")
-    thirdjisu: float = Field(description="세번째지수", default=0.0)
-    thrsign: str = Field(description="세번째대비구분", default="")
-    thrchange: float = Field(description="세번째전일대비", default=0.0)
-    thrdiff: float = Field(description="세번째등락율", default=0.0)
-    fourthjcode: str = Field(description="네번째지수코드", default="")
-    fourthjname: str = Field(description="네번째지수명", default="")
-    fourthjisu: float = Field(description="네번째지수", default=0.0)
-    forsign: str = Field(description="네번째대비구분", default="")
-    forchange: float = Field(description="네번째전일대비", default=0.0)
-    fordiff: float = Field(description="네번째등락율", default=0.0)
-    highjo: int = Field(description="상승종목수", default=0)
-    upjo: int = Field(description="상한종목수", default=0)
-    unchgjo: int = Field(description="보합종목수", default=0)
-    lowjo: int = Field(description="하락종목수", default=0)
-    downjo: int = Field(description="하한종목수", default=0)
-
-
-# 업종현재가(t1511)
-class t1511(BaseModel):
-    inblock: t1511InBlock = Field(description="t1511InBlock")
-    outblock: t1511OutBlock = Field(description="t1511OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1511",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1514 - 업종기간별추이(t1514)>
-class t1514InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-    gubun1: str = Field(description="구분1", default="")
-    gubun2: str = Field(description="구분2", default="")
-    cts_date: str = Field(description="CTS_일자", default="")
-    cnt: str = Field(description="조회건수", default="")
-    rate_gbn: str = Field(description="비중구분", default="")
-
-
-class t1514OutBlock(BaseModel):
-    cts_date: str = Field(description="CTS_일자", default="")
-
-
-class t1514OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    jisu: float = Field(description="지수", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    value1: int = Field(description="거래대금1", default=0)
-    high: int = Field(description="상승", default=0)
-    unchg: int = Field(description="보합", default=0)
-    low: int = Field(description="하락", default=0)
-    uprate: float = Field(description="상승종목비율", default=0.0)
-    frgsvolume: int = Field(description="외인순매수", default=0)
-    openjisu: float = Field(description="시가", default=0.0)
-    highjisu: float = Field(description="고가", default=0.0)
-    lowjisu: float = Field(description="저가", default=0.0)
-    value2: int = Field(description="거래대금2", default=0)
-    up: int = Field(description="상한", default=0)
-    down: int = Field(description="하한", default=0)
-    totjo: int = Field(description="종목수", default=0)
-    orgsvolume: int = Field(description="기관순매수", default=0)
-    upcode: str = Field(description="업종코드", default="")
-    rate: float = Field(description="거래비중", default=0.0)
-    divrate: float = Field(description="업종배당수익률", default=0.0)
-
-
-# 업종기간별추이(t1514)
-class t1514(BaseModel):
-    inblock: t1514InBlock = Field(description="t1514InBlock")
-    outblock: t1514OutBlock = Field(description="t1514OutBlock")
-    outblock1: List[t1514OutBlock1] = Field(description="t1514OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1514",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1516 - 업종별종목시세(t1516)>
-class t1516InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-    gubun: str = Field(description="구분", default="")
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t1516OutBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    pricejisu: float = Field(description="지수", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    jdiff: float = Field(description="등락율", default=0.0)
-
-
-class t1516OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    sojinrate: float = Field(description="소진율", default=0.0)
-    beta: float = Field(description="베타계수", default=0.0)
-    perx: float = Field(description="PER", default=0.0)
-    frgsvolume: int = Field(description="외인순매수", default=0)
-    orgsvolume: int = Field(description="기관순매수", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    total: int = Field(description="시가총액", default=0)
-    value: int = Field(description="거래대금", default=0)
-
-
-# 업종별종목시세(t1516)
-class t1516(BaseModel):
-    inblock: t1516InBlock = Field(description="t1516InBlock")
-    outblock: t1516OutBlock = Field(description="t1516OutBlock")
-    outblock1: List[t1516OutBlock1] = Field(description="t1516OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1516",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1531 - 테마별종목(t1531)>
-class t1531InBlock(BaseModel):
-    tmname: str = Field(description="테마명", default="")
-    tmcode: str = Field(description="테마코드", default="")
-
-
-class t1531OutBlock(BaseModel):
-    tmname: str = Field(description="테마명", default="")
-    avgdiff: float = Field(description="평균등락율", default=0.0)
-    tmcode: str = Field(description="테마코드", default="")
-
-
-# 테마별종목(t1531)
-class t1531(BaseModel):
-    inblock: t1531InBlock = Field(description="t1531InBlock")
-    outblock: List[t1531OutBlock] = Field(description="t1531OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1531",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1532 - 종목별테마(t1532)>
-class t1532InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t1532OutBlock(BaseModel):
-    tmname: str = Field(description="테마명", default="")
-    avgdiff: float = Field(description="평균등락율", default=0.0)
-    tmcode: str = Field(description="테마코드", default="")
-
-
-# 종목별테마(t1532)
-class t1532(BaseModel):
-    inblock: t1532InBlock = Field(description="t1532InBlock")
-    outblock: List[t1532OutBlock] = Field(description="t1532OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1532",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1533 - 특이테마(t1533)>
-class t1533InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    chgdate: int = Field(description="대비일자", default=0)
-
-
-class t1533OutBlock(BaseModel):
-    bdate: str = Field(description="일자", default="")
-
-
-class t1533OutBlock1(BaseModel):
-    tmname: str = Field(description="테마명", default="")
-    totcnt: int = Field(description="전체", default=0)
-    upcnt: int = Field(description="상승", default=0)
-    dncnt: int = Field(description="하락", default=0)
-    uprate: float = Field(description="상승비율", default=0.0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    avgdiff: float = Field(description="평균등락율", default=0.0)
-    chgdiff: float = Field(description="대비등락율", default=0.0)
-    tmcode: str = Field(description="테마코드", default="")
-
-
-# 특이테마(t1533)
-class t1533(BaseModel):
-    inblock: t1533InBlock = Field(description="t1533InBlock")
-    outblock: t1533OutBlock = Field(description="t1533OutBlock")
-    outblock1: List[t1533OutBlock1] = Field(description="t1533OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1533",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1537 - 테마종목별시세조회(t1537)>
-class t1537InBlock(BaseModel):
-    tmcode: str = Field(description="테마코드", default="")
-
-
-class t1537OutBlock(BaseModel):
-    upcnt: int = Field(description="상승종목수", default=0)
-    tmcnt: int = Field(description="테마종목수", default=0)
-    uprate: int = Field(description="상승종목비율", default=0)
-    tmname: str = Field(description="테마명", default="")
-
-
-class t1537OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    jniltime: float = Field(description="전일동시간", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-    yeprice: int = Field(description="예상체결가", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    value: int = Field(description="누적거래대금(단위:백만)", default=0)
-    marketcap: int = Field(description="시가총액(단위:백만)", default=0)
-
-
-# 테마종목별시세조회(t1537)
-class t1537(BaseModel):
-    inblock: t1537InBlock = Field(description="t1537InBlock")
-    outblock: t1537OutBlock = Field(description="t1537OutBlock")
-    outblock1: List[t1537OutBlock1] = Field(description="t1537OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1537",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1601 - 투자자별종합(t1601)>
-class t1601InBlock(BaseModel):
-    gubun1: str = Field(description="주식금액수량구분1", default="")
-    gubun2: str = Field(description="옵션금액수량구분2", default="")
-    gubun3: str = Field(description="금액단위", default="")
-    gubun4: str = Field(description="선물금액수량구분4", default="")
-
-
-class t1601OutBlock1(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1601OutBlock2(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1601OutBlock3(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1601OutBlock4(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1601OutBlock5(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1601OutBlock6(BaseModel):
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_11: str = Field(description="국가투자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드투자자코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-# 투자자별종합(t1601)
-class t1601(BaseModel):
-    inblock: t1601InBlock = Field(description="t1601InBlock")
-    outblock1: t1601OutBlock1 = Field(description="t1601OutBlock1")
-    outblock2: t1601OutBlock2 = Field(description="t1601OutBlock2")
-    outblock3: t1601OutBlock3 = Field(description="t1601OutBlock3")
-    outblock4: t1601OutBlock4 = Field(description="t1601OutBlock4")
-    outblock5: t1601OutBlock5 = Field(description="t1601OutBlock5")
-    outblock6: t1601OutBlock6 = Field(description="t1601OutBlock6")
-    metadata: dict = Field(
-        description="The metadata information for t1601",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1602 - 시간대별투자자매매추이(t1602)>
-class t1602InBlock(BaseModel):
-    market: str = Field(description="시장구분", default="")
-    upcode: str = Field(description="업종코드", default="")
-    gubun1: str = Field(description="수량구분", default="")
-    gubun2: str = Field(description="전일분구분", default="")
-    cts_time: str = Field(description="CTSTIME", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cnt: str = Field(description="조회건수", default="")
-    gubun3: str = Field(description="직전대비구분(C:직전대비)", default="")
-
-
-class t1602OutBlock(BaseModel):
-    cts_time: str = Field(description="CTSTIME", default="")
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_11: str = Field(description="국가투자자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t1602OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    sv_08: int = Field(description="개인순매수", default=0)
-    sv_17: int = Field(description="외국인순매수", default=0)
-    sv_18: int = Field(description="기관계순매수", default=0)
-    sv_01: int = Field(description="증권순매수", default=0)
-    sv_03: int = Field(description="투신순매수", default=0)
-    sv_04: int = Field(description="은행순매수", default=0)
-    sv_02: int = Field(description="보험순매수", default=0)
-    sv_05: int = Field(description="종금순매수", default=0)
-    sv_06: int = Field(description="기금순매수", default=0)
-    sv_07: int = Field(description="기타순매수", default=0)
-    sv_11: int = Field(description="국가순매수", default=0)
-    sv_00: int = Field(description="사모펀드순매수", default=0)
-
-
-# 시간대별투자자매매추이(t1602)
-class t1602(BaseModel):
-    inblock: t1602InBlock = Field(description="t1602InBlock")
-    outblock: t1602OutBlock = Field(description="t1602OutBlock")
-    outblock1: List[t1602OutBlock1] = Field(description="t1602OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1602",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1603 - 시간대별투자자매매추이상세(t1603)>
-class t1603InBlock(BaseModel):
-    market: str = Field(description="시장구분", default="")
-    gubun1: str = Field(description="투자자구분", default="")
-    gubun2: str = Field(description="전일분구분", default="")
-    cts_time: str = Field(description="CTSTIME", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cnt: str = Field(description="조회건수", default="")
-    upcode: str = Field(description="업종코드", default="")
-
-
-class t1603OutBlock(BaseModel):
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cts_time: str = Field(description="CTSTIME", default="")
-
-
-class t1603OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    tjjcode: str = Field(description="투자자구분", default="")
-    msvolume: int = Field(description="매수수량", default=0)
-    mdvolume: int = Field(description="매도수량", default=0)
-    msvalue: int = Field(description="매수금액", default=0)
-    mdvalue: int = Field(description="매도금액", default=0)
-    svolume: int = Field(description="순매수수량", default=0)
-    svalue: int = Field(description="순매수금액", default=0)
-
-
-# 시간대별투자자매매추이상세(t1603)
-class t1603(BaseModel):
-    inblock: t1603InBlock = Field(description="t1603InBlock")
-    outblock: t1603OutBlock = Field(description="t1603OutBlock")
-    outblock1: List[t1603OutBlock1] = Field(description="t1603OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1603",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1615 - 투자자매매종합1(t1615)>
-class t1615InBlock(BaseModel):
-    gubun1: str = Field(description="주식구분", default="")
-    gubun2: str = Field(description="옵션구분", default="")
-
-
-class t1615OutBlock(BaseModel):
-    dwvolume: int = Field(description="위탁매도수량", default=0)
-    dwvalue: int = Field(description="위탁매도금액", default=0)
-    djvolume: int = Field(description="자기매도수량", default=0)
-    djvalue: int = Field(description="자기매도금액", default=0)
-    sum_volume: int = Field(description="합계수량", default=0)
-    sum_value: int = Field(description="합계금액", default=0)
-
-
-class t1615OutBlock1(BaseModel):
-    hname: str = Field(description="시장명", default="")
-    sv_08: int = Field(description="개인", default=0)
-    sv_17: int = Field(description="외국인", default=0)
-    sv_18: int = Field(description="기관계", default=0)
-    sv_07: int = Field(description="증권", default=0)
-
-
-# 투자자매매종합1(t1615)
-class t1615(BaseModel):
-    inblock: t1615InBlock = Field(description="t1615InBlock")
-    outblock: t1615OutBlock = Field(description="t1615OutBlock")
-    outblock1: List[t1615OutBlock1] = Field(description="t1615OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1615",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1617 - 투자자매매종합2(t1617)>
-class t1617InBlock(BaseModel):
-    gubun1: str = Field(description="시장구분(1:코스피2:코스닥3:선물4:콜옵션5:풋옵션6:주식선물)", default="")
-    gubun2: str = Field(description="수량금액구분(1:수량2:금액)", default="")
-    gubun3: str = Field(description="일자구분(1:시간대별2:일별)", default="")
-    cts_date: str = Field(description="CTSDATE(연속키값-일자)", default="")
-    cts_time: str = Field(description="CTSTIME(연속키값-시간)", default="")
-
-
-class t1617OutBlock(BaseModel):
-    cts_date: str = Field(description="CTSDATE", default="")
-    cts_time: str = Field(description="CTSTIME", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    sv_08: int = Field(description="개인순매수", default=0)
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    sv_17: int = Field(description="외국인순매수", default=0)
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    sv_18: int = Field(description="기관계순매수", default=0)
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    sv_01: int = Field(description="증권순매수", default=0)
-
-
-class t1617OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    sv_08: int = Field(description="개인", default=0)
-    sv_17: int = Field(description="외국인", default=0)
-    sv_18: int = Field(description="기관계", default=0)
-    sv_01: int = Field(description="증권", default=0)
-
-
-# 투자자매매종합2(t1617)
-class t1617(BaseModel):
-    inblock: t1617InBlock = Field(description="t1617InBlock")
-    outblock: t1617OutBlock = Field(description="t1617OutBlock")
-    outblock1: List[t1617OutBlock1] = Field(description="t1617OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1617",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1621 - 업종별분별투자자매매동향(챠트용)>
-class t1621InBlock(BaseModel):
-    upcode: str = Field(description="업종코드", default="")
-    nmin: str = Field(description="N분", default="")
-    cnt: str = Field(description="조회건수", default="")
-    bgubun: str = Field(description="전일분", default="")
-
-
-class t1621OutBlock(BaseModel):
-    indcode: str = Field(description="개인투자자코드", default="")
-    forcode: str = Field(description="외국인투자자코드", default="")
-    syscode: str = Field(description="기관계투자자코드", default="")
-    stocode: str = Field(description="증권투자자코드", default="")
-    invcode: str = Field(description="투신투자자코드", default="")
-    bancode: str = Field(description="은행투자자코드", default="")
-    inscode: str = Field(description="보험투자자코드", default="")
-    fincode: str = Field(description="종금투자자코드", default="")
-    moncode: str = Field(description="기금투자자코드", default="")
-    etccode: str = Field(description="기타투자자코드", default="")
-    natcode: str = Field(description="국가투자자코드", default="")
-    pefcode: str = Field(description="사모펀드투자자코드", default="")
-    jisucd: str = Field(description="기준지수코드", default="")
-    jisunm: str = Field(description="기준지수명", default="")
-
-
-class t1621OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    datetime: str = Field(description="일자시간", default="")
-    indmsvol: int = Field(description="개인순매수거래량", default=0)
-    indmsamt: float = Field(description="개인순매수거래대금", default=0.0)
-    formsvol: int = Field(description="외국인순매수거래량", default=0)
-    formsamt: float = Field(description="외국인순매수거래대금", default=0.0)
-    sysmsvol: int = Field(description="기관계순매수거래량", default=0)
-    sysmsamt: float = Field(description="기관계순매수거래대금", default=0.0)
-    stomsvol: int = Field(description="증권순매수거래량", default=0)
-    stomsamt: float = Field(description="증권순매수거래대금", default=0.0)
-    invmsvol: int = Field(description="투신순매수거래량", default=0)
-    invmsamt: float = Field(description="투신순매수거래대금", default=0.0)
-    banmsvol: int = Field(description="은행순매수거래량", default=0)
-    banmsamt: float = Field(description="은행순매수거래대금", default=0.0)
-    insmsvol: int = Field(description="보험순매수거래량", default=0)
-    insmsamt: float = Field(description="보험순매수거래대금", default=0.0)
-    finmsvol: int = Field(description="종금순매수거래량", default=0)
-    finmsamt: float = Field(description="종금순매수거래대금", default=0.0)
-    monmsvol: int = Field(description="기금순매수거래량", default=0)
-    monmsamt: float = Field(description="기금순매수거래대금", default=0.0)
-    etcmsvol: int = Field(description="기타순매수거래량", default=0)
-    etcmsamt: float = Field(description="기타순매수거래대금", default=0.0)
-    natmsvol: int = Field(description="국가순매수거래량", default=0)
-    natmsamt: float = Field(description="국가순매수거래대금", default=0.0)
-    pefmsvol: int = Field(description="사모펀드순매수거래량", default=0)
-    pefmsamt: float = Field(description="사모펀드순매수거래대금", default=0.0)
-    upclose: float = Field(description="기준지수", default=0.0)
-    upcvolume: int = Field(description="기준체결거래량", default=0)
-    upvolume: float = Field(description="기준누적거래량", default=0.0)
-    upvalue: float = Field(description="기준거래대금", default=0.0)
-
-
-# 업종별분별투자자매매동향(챠트용)
-class t1621(BaseModel):
-    inblock: t1621InBlock = Field(description="t1621InBlock")
-    outblock: t1621OutBlock = Field(description="t1621OutBlock")
-    outblock1: List[t1621OutBlock1] = Field(description="t1621OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1621",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1631 - 프로그램매매종합조회(t1631)>
-class t1631InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    dgubun: str = Field(description="일자구분", default="")
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-
-
-class t1631OutBlock(BaseModel):
-    cdhrem: int = Field(description="매도차익미체결잔량", default=0)
-    bdhrem: int = Field(description="매도비차익미체결잔량", default=0)
-    tcdrem: int = Field(description="매도차익주문수량", default=0)
-    tbdrem: int = Field(description="매도비차익주문수량", default=0)
-    cshrem: int = Field(description="매수차익미체결잔량", default=0)
-    bshrem: int = Field(description="매수비차익미체결잔량", default=0)
-    tcsrem: int = Field(description="매수차익주문수량", default=0)
-    tbsrem: int = Field(description="매수비차익주문수량", default=0)
-
-
-class t1631OutBlock1(BaseModel):
-    offervolume: int = Field(description="매도수량", default=0)
-    offervalue: int = Field(description="매도금액", default=0)
-    bidvolume: int = Field(description="매수수량", default=0)
-    bidvalue: int = Field(description="매수금액", default=0)
-    volume: int = Field(description="순매수수량", default=0)
-    value: int = Field(description="순매수금액", default=0)
-
-
-# 프로그램매매종합조회(t1631)
-class t1631(BaseModel):
-    inblock: t1631InBlock = Field(description="t1631InBlock")
-    outblock: t1631OutBlock = Field(description="t1631OutBlock")
-    outblock1: List[t1631OutBlock1] = Field(description="t1631OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1631",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1632 - 시간대별프로그램매매추이(t1632)>
-class t1632InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    gubun1: str = Field(description="금액수량구분", default="")
-    gubun2: str = Field(description="직전대비증감", default="")
-    gubun3: str = Field(description="전일구분", default="")
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-
-
-class t1632OutBlock(BaseModel):
-    date: str = Field(description="날짜CTS", default="")
-    time: str = Field(description="시간CTS", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1632OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    k200jisu: float = Field(description="KP200", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    k200basis: float = Field(description="BASIS", default=0.0)
-    tot3: int = Field(description="전체순매수", default=0)
-    tot1: int = Field(description="전체매수", default=0)
-    tot2: int = Field(description="전체매도", default=0)
-    cha3: int = Field(description="차익순매수", default=0)
-    cha1: int = Field(description="차익매수", default=0)
-    cha2: int = Field(description="차익매도", default=0)
-    bcha3: int = Field(description="비차익순매수", default=0)
-    bcha1: int = Field(description="비차익매수", default=0)
-    bcha2: int = Field(description="비차익매도", default=0)
-
-
-# 시간대별프로그램매매추이(t1632)
-class t1632(BaseModel):
-    inblock: t1632InBlock = Field(description="t1632InBlock")
-    outblock: t1632OutBlock = Field(description="t1632OutBlock")
-    outblock1: List[t1632OutBlock1] = Field(description="t1632OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1632",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1633 - 기간별프로그램매매추이(t1633)>
-class t1633InBlock(BaseModel):
-    gubun: str = Field(description="시장구분", default="")
-    gubun1: str = Field(description="금액수량구분", default="")
-    gubun2: str = Field(description="수치누적구분", default="")
-    gubun3: str = Field(description="일주월구분", default="")
-    fdate: str = Field(description="from일자", default="")
-    tdate: str = Field(description="to일자", default="")
-    gubun4: str = Field(description="직전대비증감구분", default="")
-    date: str = Field(description="날짜", default="")
-
-
-class t1633OutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1633OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    jisu: float = Field(description="KP200", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    tot3: int = Field(description="전체순매수", default=0)
-    tot1: int = Field(description="전체매수", default=0)
-    tot2: int = Field(description="전체매도", default=0)
-    cha3: int = Field(description="차익순매수", default=0)
-    cha1: int = Field(description="차익매수", default=0)
-    cha2: int = Field(description="차익매도", default=0)
-    bcha3: int = Field(description="비차익순매수", default=0)
-    bcha1: int = Field(description="비차익매수", default=0)
-    bcha2: int = Field(description="비차익매도", default=0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 기간별프로그램매매추이(t1633)
-class t1633(BaseModel):
-    inblock: t1633InBlock = Field(description="t1633InBlock")
-    outblock: t1633OutBlock = Field(description="t1633OutBlock")
-    outblock1: List[t1633OutBlock1] = Field(description="t1633OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1633",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1636 - 종목별프로그램매매동향(t1636)>
-class t1636InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    gubun1: str = Field(description="금액수량구분", default="")
-    gubun2: str = Field(description="정렬기준", default="")
-    shcode: str = Field(description="종목코드", default="")
-    cts_idx: int = Field(description="IDXCTS", default=0)
-
-
-class t1636OutBlock(BaseModel):
-    cts_idx: int = Field(description="IDXCTS", default=0)
-
-
-class t1636OutBlock1(BaseModel):
-    rank: int = Field(description="순위", default=0)
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="대비구분", default="")
-    change: int = Field(description="대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    svalue: int = Field(description="순매수금액", default=0)
-    offervalue: int = Field(description="매도금액", default=0)
-    stksvalue: int = Field(description="매수금액", default=0)
-    svolume: int = Field(description="순매수수량", default=0)
-    offervolume: int = Field(description="매도수량", default=0)
-    stksvolume: int = Field(description="매수수량", default=0)
-    sgta: int = Field(description="시가총액", default=0)
-    rate: float = Field(description="비중", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 종목별프로그램매매동향(t1636)
-class t1636(BaseModel):
-    inblock: t1636InBlock = Field(description="t1636InBlock")
-    outblock: t1636OutBlock = Field(description="t1636OutBlock")
-    outblock1: List[t1636OutBlock1] = Field(description="t1636OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1636",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1637 - 종목별프로그램매매추이(t1637)>
-class t1637InBlock(BaseModel):
-    gubun1: str = Field(description="수량금액구분(0:수량1:금액)", default="")
-    gubun2: str = Field(description="시간일별구분(0:시간1:일자)", default="")
-    shcode: str = Field(description="종목코드", default="")
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    cts_idx: int = Field(description="IDXCTS(9999:차트)", default=0)
-
-
-class t1637OutBlock(BaseModel):
-    cts_idx: int = Field(description="IDXCTS", default=0)
-
-
-class t1637OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="대비구분", default="")
-    change: int = Field(description="대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    svalue: int = Field(description="순매수금액", default=0)
-    offervalue: int = Field(description="매도금액", default=0)
-    stksvalue: int = Field(description="매수금액", default=0)
-    svolume: int = Field(description="순매수수량", default=0)
-    offervolume: int = Field(description="매도수량", default=0)
-    stksvolume: int = Field(description="매수수량", default=0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 종목별프로그램매매추이(t1637)
-class t1637(BaseModel):
-    inblock: t1637InBlock = Field(description="t1637InBlock")
-    outblock: t1637OutBlock = Field(description="t1637OutBlock")
-    outblock1: List[t1637OutBlock1] = Field(description="t1637OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1637",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1638 - 종목별잔량/사전공시(t1638)>
-class t1638InBlock(BaseModel):
-    gubun1: str = Field(description="구분", default="")
-    shcode: str = Field(description="종목코드", default="")
-    gubun2: str = Field(description="정렬", default="")
-
-
-class t1638OutBlock(BaseModel):
-    rank: int = Field(description="순위", default=0)
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    sigatotrt: float = Field(description="시총비중", default=0.0)
-    obuyvol: int = Field(description="순매수잔량", default=0)
-    buyrem: int = Field(description="매수잔량", default=0)
-    psgvolume: int = Field(description="매수공시수량", default=0)
-    sellrem: int = Field(description="매도잔량", default=0)
-    pdgvolume: int = Field(description="매도공시수량", default=0)
-    sigatot: int = Field(description="시가총액", default=0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 종목별잔량/사전공시(t1638)
-class t1638(BaseModel):
-    inblock: t1638InBlock = Field(description="t1638InBlock")
-    outblock: List[t1638OutBlock] = Field(description="t1638OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1638",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1640 - 프로그램매매종합조회(미니)(t1640)>
-class t1640InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-
-
-class t1640OutBlock(BaseModel):
-    offervolume: int = Field(description="매도수량", default=0)
-    bidvolume: int = Field(description="매수수량", default=0)
-    volume: int = Field(description="순매수수량", default=0)
-    offerdiff: int = Field(description="매도증감", default=0)
-    biddiff: int = Field(description="매수증감", default=0)
-    sundiff: int = Field(description="순매수증감", default=0)
-    basis: float = Field(description="베이시스", default=0.0)
-    offervalue: float = Field(description="매도금액", default=0.0)
-    bidvalue: float = Field(description="매수금액", default=0.0)
-    value: float = Field(description="순매수금액", default=0.0)
-    offervaldiff: float = Field(description="매도금액증감", default=0.0)
-    bidvaldiff: float = Field(description="매수금액증감", default=0.0)
-    sunvaldiff: float = Field(description="순매수증감", default=0.0)
-
-
-# 프로그램매매종합조회(미니)(t1640)
-class t1640(BaseModel):
-    inblock: t1640InBlock = Field(description="t1640InBlock")
-    outblock: t1640OutBlock = Field(description="t1640OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1640",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1662 - 시간대별프로그램매매추이(차트)(t1662)>
-class t1662InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-    gubun1: str = Field(description="금액수량구분", default="")
-    gubun3: str = Field(description="전일구분", default="")
-
-
-class t1662OutBlock(BaseModel):
-    time: str = Field(description="시간", default="")
-    k200jisu: float = Field(description="KP200", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    k200basis: float = Field(description="BASIS", default=0.0)
-    tot3: int = Field(description="전체순매수", default=0)
-    tot1: int = Field(description="전체매수", default=0)
-    tot2: int = Field(description="전체매도", default=0)
-    cha3: int = Field(description="차익순매수", default=0)
-    cha1: int = Field(description="차익매수", default=0)
-    cha2: int = Field(description="차익매도", default=0)
-    bcha3: int = Field(description="비차익순매수", default=0)
-    bcha1: int = Field(description="비차익매수", default=0)
-    bcha2: int = Field(description="비차익매도", default=0)
-    volume: int = Field(description="거래량", default=0)
-
-
-# 시간대별프로그램매매추이(차트)(t1662)
-class t1662(BaseModel):
-    inblock: t1662InBlock = Field(description="t1662InBlock")
-    outblock: List[t1662OutBlock] = Field(description="t1662OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1662",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1664 - 투자자매매종합(챠트)>
-class t1664InBlock(BaseModel):
-    mgubun: str = Field(description="시장구분", default="")
-    vagubun: str = Field(description="금액수량구분", default="")
-    bdgubun: str = Field(description="시간일별구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t1664OutBlock1(BaseModel):
-    dt: str = Field(description="일자시간", default="")
-    tjj01: float = Field(description="증권순매수", default=0.0)
-    tjj02: float = Field(description="보험순매수", default=0.0)
-    tjj03: float = Field(description="투신순매수", default=0.0)
-    tjj04: float = Field(description="은행순매수", default=0.0)
-    tjj05: float = Field(description="종금순매수", default=0.0)
-    tjj06: float = Field(description="기금순매수", default=0.0)
-    tjj07: float = Field(description="기타순매수", default=0.0)
-    tjj08: float = Field(description="개인순매수", default=0.0)
-    tjj17: float = Field(description="외국인순매수", default=0.0)
-    tjj18: float = Field(description="기관순매수", default=0.0)
-    cha: float = Field(description="차익순매수", default=0.0)
-    bicha: float = Field(description="비차익순매수", default=0.0)
-    totcha: float = Field(description="종합순매수", default=0.0)
-    basis: float = Field(description="베이시스", default=0.0)
-
-
-# 투자자매매종합(챠트)
-class t1664(BaseModel):
-    inblock: t1664InBlock = Field(description="t1664InBlock")
-    outblock1: List[t1664OutBlock1] = Field(description="t1664OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1664",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1665 - 기간별투자자매매추이(챠트)>
-class t1665InBlock(BaseModel):
-    market: str = Field(
-        description="시장구분(1:kospi2:kp2003:kosdaq4:선물5:풋옵션6:콜옵션)",
-        default="",
-    )
-    upcode: str = Field(description="업종코드", default="")
-    gubun2: str = Field(description="수치구분(1:수치2:누적)", default="")
-    gubun3: str = Field(description="단위구분(1:일2:주3:월)", default="")
-    from_date: str = Field(description="시작날짜", default="")
-    to_date: str = Field(description="종료날짜", default="")
-
-
-class t1665OutBlock(BaseModel):
-    mcode: str = Field(description="시장코드", default="")
-    mname: str = Field(description="시장명", default="")
-
-
-class t1665OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    sv_08: int = Field(description="개인수량", default=0)
-    sv_17: int = Field(description="외인계수량(등록+미등록)", default=0)
-    sv_18: int = Field(description="기관계수량", default=0)
-    sv_01: int = Field(description="증권수량", default=0)
-    sv_03: int = Field(description="투신수량", default=0)
-    sv_04: int = Field(description="은행수량", default=0)
-    sv_02: int = Field(description="보험수량", default=0)
-    sv_05: int = Field(description="종금수량", default=0)
-    sv_06: int = Field(description="기금수량", default=0)
-    sv_07: int = Field(description="기타수량", default=0)
-    sv_00: int = Field(description="사모펀드수량", default=0)
-    sv_09: int = Field(description="등록외국인수량", default=0)
-    sv_10: int = Field(description="미등록외국인수량", default=0)
-    sv_11: int = Field(description="국가수량", default=0)
-    sv_99: int = Field(description="기타계수량(기타+국가)", default=0)
-    sa_08: float = Field(description="개인금액", default=0.0)
-    sa_17: float = Field(description="외인계금액(등록+미등록)", default=0.0)
-    sa_18: float = Field(description="기관계금액", default=0.0)
-    sa_01: float = Field(description="증권금액", default=0.0)
-    sa_03: float = Field(description="투신금액", default=0.0)
-    sa_04: float = Field(description="은행금액", default=0.0)
-    sa_02: float = Field(description="보험금액", default=0.0)
-    sa_05: float = Field(description="종금금액", default=0.0)
-    sa_06: float = Field(description="기금금액", default=0.0)
-    sa_07: float = Field(description="기타금액", default=0.0)
-    sa_00: float = Field(description="사모펀드금액", default=0.0)
-    sa_09: float = Field(description="등록외국인금액", default=0.0)
-    sa_10: float = Field(description="미등록외국인금액", default=0.0)
-    sa_11: float = Field(description="국가금액", default=0.0)
-    sa_99: float = Field(description="기타계금액(기타+국가)", default=0.0)
-    jisu: float = Field(description="시장지수", default=0.0)
-
-
-# 기간별투자자매매추이(챠트)
-class t1665(BaseModel):
-    inblock: t1665InBlock = Field(description="t1665InBlock")
-    outblock: t1665OutBlock = Field(description="t1665OutBlock")
-    outblock1: List[t1665OutBlock1] = Field(description="t1665OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1665",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1702 - 외인기관종목별동향(t1702)>
-class t1702InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    todt: str = Field(description="종료일자", default="")
-    volvalgb: str = Field(description="금액수량구분(0:금액1:수량2:단가)", default="")
-    msmdgb: str = Field(description="매수매도구분(0:순매수1:매수2:매도)", default="")
-    cumulgb: str = Field(description="누적구분(0:일간1:누적)", default="")
-    cts_date: str = Field(description="CTSDATE", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-
-
-class t1702OutBlock(BaseModel):
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cts_date: str = Field(description="CTSDATE", default="")
-
-
-class t1702OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    amt0000: int = Field(description="사모펀드", default=0)
-    amt0001: int = Field(description="증권", default=0)
-    amt0002: int = Field(description="보험", default=0)
-    amt0003: int = Field(description="투신", default=0)
-    amt0004: int = Field(description="은행", default=0)
-    amt0005: int = Field(description="종금", default=0)
-    amt0006: int = Field(description="기금", default=0)
-    amt0007: int = Field(description="기타법인", default=0)
-    amt0008: int = Field(description="개인", default=0)
-    amt0009: int = Field(description="등록외국인", default=0)
-    amt0010: int = Field(description="미등록외국인", default=0)
-    amt0011: int = Field(description="국가외", default=0)
-    amt0018: int = Field(description="기관", default=0)
-    amt0088: int = Field(description="외인계(등록+미등록)", default=0)
-    amt0099: int = Field(description="기타계(기타+국가)", default=0)
-
-
-# 외인기관종목별동향(t1702)
-class t1702(BaseModel):
-    inblock: t1702InBlock = Field(description="t1702InBlock")
-    outblock: t1702OutBlock = Field(description="t1702OutBlock")
-    outblock1: List[t1702OutBlock1] = Field(description="t1702OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1702",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1716 - 외인기관종목별동향(t1716)>
-class t1716InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    gubun: str = Field(description="구분(0:일간순매수1:기간누적순매수)", default="")
-    fromdt: str = Field(description="시작일자", default="")
-    todt: str = Field(description="종료일자", default="")
-    prapp: int = Field(description="PR감산적용율", default=0)
-    prgubun: str = Field(description="PR적용구분(0:적용안함1:적용)", default="")
-    orggubun: str = Field(description="기관적용", default="")
-    frggubun: str = Field(description="외인적용", default="")
-
-
-class t1716OutBlock(BaseModel):
-    date: str = Field(description="일자", default="")
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    krx_0008: int = Field(description="거래소_개인", default=0)
-    krx_0018: int = Field(description="거래소_기관", default=0)
-    krx_0009: int = Field(description="거래소_외국인", default=0)
-    pgmvol: int = Field(description="프로그램", default=0)
-    fsc_listing: int = Field(description="금감원_외인보유주식수", default=0)
-    fsc_sjrate: float = Field(description="금감원_소진율", default=0.0)
-    fsc_0009: int = Field(description="금감원_외국인", default=0)
-    gm_volume: int = Field(description="공매도수량", default=0)
-    gm_value: int = Field(description="공매도대금", default=0)
-
-
-# 외인기관종목별동향(t1716)
-class t1716(BaseModel):
-    inblock: t1716InBlock = Field(description="t1716InBlock")
-    outblock: List[t1716OutBlock] = Field(description="t1716OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1716",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1717 - 외인기관종목별동향(t1717)>
-class t1717InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    gubun: str = Field(description="구분(0:일간순매수1:기간누적순매수)", default="")
-    fromdt: str = Field(description="시작일자(일간조회일경우는space)", default="")
-    todt: str = Field(description="종료일자", default="")
-
-
-class t1717OutBlock(BaseModel):
-    date: str = Field(description="일자", default="")
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    tjj0000_vol: int = Field(description="사모펀드(순매수량)", default=0)
-    tjj0001_vol: int = Field(description="증권(순매수량)", default=0)
-    tjj0002_vol: int = Field(description="보험(순매수량)", default=0)
-    tjj0003_vol: int = Field(description="투신(순매수량)", default=0)
-    tjj0004_vol: int = Field(description="은행(순매수량)", default=0)
-    tjj0005_vol: int = Field(description="종금(순매수량)", default=0)
-    tjj0006_vol: int = Field(description="기금(순매수량)", default=0)
-    tjj0007_vol: int = Field(description="기타법인(순매수량)", default=0)
-    tjj0008_vol: int = Field(description="개인(순매수량)", default=0)
-    tjj0009_vol: int = Field(description="등록외국인(순매수량)", default=0)
-    tjj0010_vol: int = Field(description="미등록외국인(순매수량)", default=0)
-    tjj0011_vol: int = Field(description="국가외(순매수량)", default=0)
-    tjj0018_vol: int = Field(description="기관(순매수량)", default=0)
-    tjj0016_vol: int = Field(description="외인계(순매수량)(등록+미등록)", default=0)
-    tjj0017_vol: int = Field(description="기타계(순매수량)(기타+국가)", default=0)
-    tjj0000_dan: int = Field(description="사모펀드(단가)", default=0)
-    tjj0001_dan: int = Field(description="증권(단가)", default=0)
-    tjj0002_dan: int = Field(description="보험(단가)", default=0)
-    tjj0003_dan: int = Field(description="투신(단가)", default=0)
-    tjj0004_dan: int = Field(description="은행(단가)", default=0)
-    tjj0005_dan: int = Field(description="종금(단가)", default=0)
-    tjj0006_dan: int = Field(description="기금(단가)", default=0)
-    tjj0007_dan: int = Field(description="기타법인(단가)", default=0)
-    tjj0008_dan: int = Field(description="개인(단가)", default=0)
-    tjj0009_dan: int = Field(description="등록외국인(단가)", default=0)
-    tjj0010_dan: int = Field(description="미등록외국인(단가)", default=0)
-    tjj0011_dan: int = Field(description="국가외(단가)", default=0)
-    tjj0018_dan: int = Field(description="기관(단가)", default=0)
-    tjj0016_dan: int = Field(description="외인계(단가)(등록+미등록)", default=0)
-    tjj0017_dan: int = Field(description="기타계(단가)(기타+국가)", default=0)
-
-
-# 외인기관종목별동향(t1717)
-class t1717(BaseModel):
-    inblock: t1717InBlock = Field(description="t1717InBlock")
-    outblock: List[t1717OutBlock] = Field(description="t1717OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1717",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1752 - 종목별상위회원사(t1752)>
-class t1752InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    traddate1: str = Field(description="조회날짜1", default="")
-    traddate2: str = Field(description="조회날짜2", default="")
-    fwgubun1: str = Field(description="외국계구분", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-
-
-class t1752OutBlock(BaseModel):
-    fwdvl: int = Field(description="외국계매도", default=0)
-    fwsvl: int = Field(description="외국계매수", default=0)
-    cts_idx: int = Field(description="CTSIDX", default=0)
-
-
-class t1752OutBlock1(BaseModel):
-    tradname: str = Field(description="회원사", default="")
-    tradmdvol: int = Field(description="매도수량", default=0)
-    tradmsvol: int = Field(description="매수수량", default=0)
-    tradmssvol: int = Field(description="순매수", default=0)
-    wintrd: int = Field(description="창구거래", default=0)
-    winrat: float = Field(description="비중", default=0.0)
-    tradno: str = Field(description="회원사코드", default="")
-    wgubun: str = Field(description="외국계여부", default="")
-    swinrat: float = Field(description="순비중", default=0.0)
-
-
-# 종목별상위회원사(t1752)
-class t1752(BaseModel):
-    inblock: t1752InBlock = Field(description="t1752InBlock")
-    outblock: t1752OutBlock = Field(description="t1752OutBlock")
-    outblock1: List[t1752OutBlock1] = Field(description="t1752OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1752",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1764 - 회원사리스트(t1764)>
-class t1764InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="005930")
-    gubun1: str = Field(description="구분1", default="")
-
-
-class t1764OutBlock(BaseModel):
-    rank: int = Field(description="순위", default=0)
-    tradno: str = Field(description="거래원번호", default="")
-    tradname: str = Field(description="거래원이름", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 회원사리스트(t1764)
-class t1764(BaseModel):
-    inblock: t1764InBlock = Field(description="t1764InBlock")
-    outblock: List[t1764OutBlock] = Field(description="t1764OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1764",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1771 - 종목별회원사추이(t1771)>
-class t1771InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    tradno: str = Field(description="거래원코드", default="")
-    gubun1: str = Field(description="구분1", default="")
-    traddate1: str = Field(description="거래원날짜1", default="")
-    traddate2: str = Field(description="거래원날짜2", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cnt: str = Field(description="요청건수", default="")
-
-
-class t1771OutBlock(BaseModel):
-    cts_idx: int = Field(description="CTSIDX", default=0)
-
-
-class t1771OutBlock2(BaseModel):
-    traddate: str = Field(description="날짜", default="")
-    tradtime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="대비구분", default="")
-    change: int = Field(description="대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    tradmdcha: int = Field(description="매도", default=0)
-    tradmscha: int = Field(description="매수", default=0)
-    tradmdval: int = Field(description="매도대금", default=0)
-    tradmsval: int = Field(description="매수대금", default=0)
-    tradmsscha: int = Field(description="순매수", default=0)
-    tradmttvolume: int = Field(description="누적순매수", default=0)
-    tradavg: int = Field(description="평균단가", default=0)
-    tradmttavg: int = Field(description="누적평균단가", default=0)
-
-
-# 종목별회원사추이(t1771)
-class t1771(BaseModel):
-    inblock: t1771InBlock = Field(description="t1771InBlock")
-    outblock: t1771OutBlock = Field(description="t1771OutBlock")
-    outblock2: List[t1771OutBlock2] = Field(description="t1771OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for t1771",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1809 - 신호조회(t1809)>
-class t1809InBlock(BaseModel):
-    gubun: str = Field(description="신호구분", default="")
-    jmGb: str = Field(description="종목구분", default="")
-    jmcode: str = Field(description="종목코드", default="")
-    cts: str = Field(description="NEXTKEY", default="")
-
-
-class t1809OutBlock(BaseModel):
-    cts: str = Field(description="NEXTKEY", default="")
-
-
-class t1809OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    signal_id: str = Field(description="신호ID", default="")
-    signal_desc: str = Field(description="신호명", default="")
-    point: str = Field(description="신호강도", default="")
-    keyword: str = Field(description="뉴스신호키워드", default="")
-    seq: str = Field(description="신호별구분", default="")
-    gubun: str = Field(description="신호구분", default="")
-    jmcode: str = Field(description="신호종목", default="")
-    price: int = Field(description="종목가격", default=0)
-    sign: str = Field(description="종목등락부호", default="")
-    chgrate: float = Field(description="대비등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    datetime: str = Field(description="신호일시", default="")
-
-
-# 신호조회(t1809)
-class t1809(BaseModel):
-    inblock: t1809InBlock = Field(description="t1809InBlock")
-    outblock: t1809OutBlock = Field(description="t1809OutBlock")
-    outblock1: List[t1809OutBlock1] = Field(description="t1809OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1809",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1825 - 종목Q클릭검색(씽큐스마트)(t1825)>
-class t1825InBlock(BaseModel):
-    search_cd: str = Field(description="검색코드", default="")
-    gubun: str = Field(description="구분(0:전체1:코스피2:코스닥)", default="")
-
-
-class t1825OutBlock(BaseModel):
-    JongCnt: int = Field(description="검색종목수", default=0)
-
-
-class t1825OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    sign: str = Field(description="전일대비구분", default="")
-    signcnt: int = Field(description="연속봉수", default=0)
-    close: int = Field(description="현재가", default=0)
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    volumerate: float = Field(description="거래량전일대비율", default=0.0)
-
-
-# 종목Q클릭검색(씽큐스마트)(t1825)
-class t1825(BaseModel):
-    inblock: t1825InBlock = Field(description="t1825InBlock")
-    outblock: t1825OutBlock = Field(description="t1825OutBlock")
-    outblock1: List[t1825OutBlock1] = Field(description="t1825OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1825",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1826 - 종목Q클릭검색리스트조회(씽큐스마트)(t1826)>
-class t1826InBlock(BaseModel):
-    search_gb: str = Field(description="검색구분(0:핵심검색1:지표검색2:시세동향3:투자자동향)", default="")
-
-
-class t1826OutBlock(BaseModel):
-    search_cd: str = Field(description="검색코드", default="")
-    search_nm: str = Field(description="검색명", default="")
-
-
-# 종목Q클릭검색리스트조회(씽큐스마트)(t1826)
-class t1826(BaseModel):
-    inblock: t1826InBlock = Field(description="t1826InBlock")
-    outblock: List[t1826OutBlock] = Field(description="t1826OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1826",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1857 - e종목검색(신버전API용)>
-class t1857InBlock(BaseModel):
-    sRealFlag: str = Field(description="실시간구분(0:조회 1:실시간)", default="")
-    sSearchFlag: str = Field(description="종목검색구분(F:파일 S:서버)", default="")
-    query_index: str = Field(description="종목검색입력값", default="")
-
-
-class t1857OutBlock(BaseModel):
-    result_count: int = Field(description="검색종목수", default=0)
-    result_time: str = Field(description="포착시간", default="")
-    AlertNum: str = Field(description="실시간키", default="")
-
-
-class t1857OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    JobFlag: str = Field(description="종목상태(N:진입 R:재진입 O:이탈)", default="")
-
-
-# e종목검색(신버전API용)
-class t1857(BaseModel):
-    inblock: t1857InBlock = Field(description="t1857InBlock")
-    outblock: t1857OutBlock = Field(description="t1857OutBlock")
-    outblock1: List[t1857OutBlock1] = Field(description="t1857OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1857",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1866 - 서버저장조건리스트조회(API)(t1866)>
-class t1866InBlock(BaseModel):
-    user_id: str = Field(description="로그인ID", default="")
-    gb: str = Field(description="조회구분", default="")
-    group_name: str = Field(description="그룹명", default="")
-    cont: str = Field(description="연속여부", default="")
-    contkey: str = Field(description="연속키", default="")
-
-
-class t1866OutBlock(BaseModel):
-    result_count: int = Field(description="저장조건수", default=0)
-    cont: str = Field(description="연속여부", default="")
-    contkey: str = Field(description="연속키", default="")
-
-
-class t1866OutBlock1(BaseModel):
-    query_index: str = Field(description="서버저장인덱스", default="")
-    group_name: str = Field(description="그룹명", default="")
-    query_name: str = Field(description="조건저장명", default="")
-
-
-# 서버저장조건리스트조회(API)(t1866)
-class t1866(BaseModel):
-    inblock: t1866InBlock = Field(description="t1866InBlock")
-    outblock: t1866OutBlock = Field(description="t1866OutBlock")
-    outblock1: List[t1866OutBlock1] = Field(description="t1866OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1866",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1901 - ETF현재가(시세)조회(t1901)>
-class t1901InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1901OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    recprice: int = Field(description="기준가", default=0)
-    avg: int = Field(description="가중평균", default=0)
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    jnilvolume: float = Field(description="전일거래량", default=0.0)
-    volumediff: int = Field(description="거래량차", default=0)
-    open: int = Field(description="시가", default=0)
-    opentime: str = Field(description="시가시간", default="")
-    high: int = Field(description="고가", default=0)
-    hightime: str = Field(description="고가시간", default="")
-    low: int = Field(description="저가", default=0)
-    lowtime: str = Field(description="저가시간", default="")
-    high52w: int = Field(description="52최고가", default=0)
-    high52wdate: str = Field(description="52최고가일", default="")
-    low52w: int = Field(description="52최저가", default=0)
-    low52wdate: str = Field(description="52최저가일", default="")
-    exhratio: float = Field(description="소진율", default=0.0)
-    flmtvol: float = Field(description="외국인보유수량", default=0.0)
-    per: float = Field(description="PER", default=0.0)
-    listing: int = Field(description="상장주식수(천)", default=0)
-    jkrate: int = Field(description="증거금율", default=0)
-    vol: float = Field(description="회전율", default=0.0)
-    shcode: str = Field(description="단축코드", default="")
-    value: int = Field(description="누적거래대금", default=0)
-    highyear: int = Field(description="연중최고가", default=0)
-    highyeardate: str = Field(description="연중최고일자", default="")
-    lowyear: int = Field(description="연중최저가", default=0)
-    lowyeardate: str = Field(description="연중최저일자", default="")
-    upname: str = Field(description="업종명", default="")
-    upcode: str = Field(description="업종코드", default="")
-    upprice: float = Field(description="업종현재가", default=0.0)
-    upsign: str = Field(description="업종전일비구분", default="")
-    upchange: float = Field(description="업종전일대비", default=0.0)
-    updiff: float = Field(description="업종등락율", default=0.0)
-    futname: str = Field(description="선물최근월물명", default="")
-    futcode: str = Field(description="선물최근월물코드", default="")
-    futprice: float = Field(description="선물현재가", default=0.0)
-    futsign: str = Field(description="선물전일비구분", default="")
-    futchange: float = Field(description="선물전일대비", default=0.0)
-    futdiff: float = Field(description="선물등락율", default=0.0)
-    nav: float = Field(description="NAV", default=0.0)
-    navsign: str = Field(description="NAV전일대비구분", default="")
-    navchange: float = Field(description="NAV전일대비", default=0.0)
-    navdiff: float = Field(description="NAV등락율", default=0.0)
-    cocrate: float = Field(description="추적오차율", default=0.0)
-    kasis: float = Field(description="괴리율", default=0.0)
-    subprice: int = Field(description="대용가", default=0)
-    offerno1: str = Field(description="매도증권사코드1", default="")
-    bidno1: str = Field(description="매수증권사코드1", default="")
-    dvol1: int = Field(description="총매도수량1", default=0)
-    svol1: int = Field(description="총매수수량1", default=0)
-    dcha1: int = Field(description="매도증감1", default=0)
-    scha1: int = Field(description="매수증감1", default=0)
-    ddiff1: float = Field(description="매도비율1", default=0.0)
-    sdiff1: float = Field(description="매수비율1", default=0.0)
-    offerno2: str = Field(description="매도증권사코드2", default="")
-    bidno2: str = Field(description="매수증권사코드2", default="")
-    dvol2: int = Field(description="총매도수량2", default=0)
-    svol2: int = Field(description="총매수수량2", default=0)
-    dcha2: int = Field(description="매도증감2", default=0)
-    scha2: int = Field(description="매수증감2", default=0)
-    ddiff2: float = Field(description="매도비율2", default=0.0)
-    sdiff2: float = Field(description="매수비율2", default=0.0)
-    offerno3: str = Field(description="매도증권사코드3", default="")
-    bidno3: str = Field(description="매수증권사코드3", default="")
-    dvol3: int = Field(description="총매도수량3", default=0)
-    svol3: int = Field(description="총매수수량3", default=0)
-    dcha3: int = Field(description="매도증감3", default=0)
-    scha3: int = Field(description="매수증감3", default=0)
-    ddiff3: float = Field(description="매도비율3", default=0.0)
-    sdiff3: float = Field(description="매수비율3", default=0.0)
-    offerno4: str = Field(description="매도증권사코드4", default="")
-    bidno4: str = Field(description="매수증권사코드4", default="")
-    dvol4: int = Field(description="총매도수량4", default=0)
-    svol4: int = Field(description="총매수수량4", default=0)
-    dcha4: int = Field(description="매도증감4", default=0)
-    scha4: int = Field(description="매수증감4", default=0)
-    ddiff4: float = Field(description="매도비율4", default=0.0)
-    sdiff4: float = Field(description="매수비율4", default=0.0)
-    offerno5: str = Field(description="매도증권사코드5", default="")
-    bidno5: str = Field(description="매수증권사코드5", default="")
-    dvol5: int = Field(description="총매도수량5", default=0)
-    svol5: int = Field(description="총매수수량5", default=0)
-    dcha5: int = Field(description="매도증감5", default=0)
-    scha5: int = Field(description="매수증감5", default=0)
-    ddiff5: float = Field(description="매도비율5", default=0.0)
-    sdiff5: float = Field(description="매수비율5", default=0.0)
-    fwdvl: int = Field(description="외국계매도합계수량", default=0)
-    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
-    ftradmddiff: float = Field(description="외국계매도비율", default=0.0)
-    fwsvl: int = Field(description="외국계매수합계수량", default=0)
-    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
-    ftradmsdiff: float = Field(description="외국계매수비율", default=0.0)
-    upname2: str = Field(description="참고지수명", default="")
-    upcode2: str = Field(description="참고지수코드", default="")
-    upprice2: float = Field(description="참고지수현재가", default=0.0)
-    jnilnav: float = Field(description="전일NAV", default=0.0)
-    jnilnavsign: str = Field(description="전일NAV전일대비구분", default="")
-    jnilnavchange: float = Field(description="전일NAV전일대비", default=0.0)
-    jnilnavdiff: float = Field(description="전일NAV등락율", default=0.0)
-    etftotcap: int = Field(description="순자산총액(억원)", default=0)
-    spread: float = Field(description="스프레드", default=0.0)
-    leverage: int = Field(description="레버리지", default=0)
-    taxgubun: str = Field(description="과세구분", default="")
-    opcom_nmk: str = Field(description="운용사", default="")
-    lp_nm1: str = Field(description="LP1", default="")
-    lp_nm2: str = Field(description="LP2", default="")
-    lp_nm3: str = Field(description="LP3", default="")
-    lp_nm4: str = Field(description="LP4", default="")
-    lp_nm5: str = Field(description="LP5", default="")
-    etf_cp: str = Field(description="복제방법", default="")
-    etf_kind: str = Field(description="상품유형(Filler)", default="")
-    vi_gubun: str = Field(description="VI발동해제", default="")
-    etn_kind_cd: str = Field(description="ETN상품분류", default="")
-    lastymd: str = Field(description="ETN만기일", default="")
-    payday: str = Field(description="ETN지급일", default="")
-    lastdate: str = Field(description="ETN최종거래일", default="")
-    issuernmk: str = Field(description="ETN발행시장참가자", default="")
-    last_sdate: str = Field(description="ETN만기상환가격결정시작일", default="")
-    last_edate: str = Field(description="ETN만기상환가격결정종료일", default="")
-    lp_holdvol: str = Field(description="ETNLP보유수량", default="")
-    listdate: str = Field(description="상장일", default="")
-    etp_gb: str = Field(description="ETP상품구분코드", default="")
-    etn_elback_yn: str = Field(description="ETN조기상환가능여부", default="")
-    settletype: str = Field(description="최종결제", default="")
-    idx_asset_class1: str = Field(description="지수자산분류코드(대분류)", default="")
-    ty_text: str = Field(description="ETF/ETN투자유의", default="")
-    leverage2: float = Field(description="추적수익률배수", default=0.0)
-
-
-# ETF현재가(시세)조회(t1901)
-class t1901(BaseModel):
-    inblock: t1901InBlock = Field(description="t1901InBlock")
-    outblock: t1901OutBlock = Field(description="t1901OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1901",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1902 - ETF시간별추이(t1902)>
-class t1902InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    time: str = Field(description="시간", default="")
-
-
-class t1902OutBlock(BaseModel):
-    time: str = Field(description="시간", default="")
-    hname: str = Field(description="종목명", default="")
-    upname: str = Field(description="업종지수명", default="")
-
-
-class t1902OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    navdiff: float = Field(description="NAV대비", default=0.0)
-    nav: float = Field(description="NAV", default=0.0)
-    navchange: float = Field(description="전일대비", default=0.0)
-    crate: float = Field(description="추적오차", default=0.0)
-    grate: float = Field(description="괴리", default=0.0)
-    jisu: float = Field(description="지수", default=0.0)
-    jichange: float = Field(description="전일대비", default=0.0)
-    jirate: float = Field(description="전일대비율", default=0.0)
-
-
-# ETF시간별추이(t1902)
-class t1902(BaseModel):
-    inblock: t1902InBlock = Field(description="t1902InBlock")
-    outblock: t1902OutBlock = Field(description="t1902OutBlock")
-    outblock1: List[t1902OutBlock1] = Field(description="t1902OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1902",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1903 - ETF일별추이(t1903)>
-class t1903InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    date: str = Field(description="일자", default="")
-
-
-class t1903OutBlock(BaseModel):
-    date: str = Field(description="일자", default="")
-    hname: str = Field(description="종목명", default="")
-    upname: str = Field(description="업종지수명", default="")
-
-
-class t1903OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    navdiff: float = Field(description="NAV대비", default=0.0)
-    nav: float = Field(description="NAV", default=0.0)
-    navchange: float = Field(description="전일대비", default=0.0)
-    crate: float = Field(description="추적오차", default=0.0)
-    grate: float = Field(description="괴리", default=0.0)
-    jisu: float = Field(description="지수", default=0.0)
-    jichange: float = Field(description="전일대비", default=0.0)
-    jirate: float = Field(description="전일대비율", default=0.0)
-
-
-# ETF일별추이(t1903)
-class t1903(BaseModel):
-    inblock: t1903InBlock = Field(description="t1903InBlock")
-    outblock: t1903OutBlock = Field(description="t1903OutBlock")
-    outblock1: List[t1903OutBlock1] = Field(description="t1903OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1903",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1904 - ETF구성종목조회(t1904)>
-class t1904InBlock(BaseModel):
-    shcode: str = Field(description="ETF단축코드", default="")
-    date: str = Field(description="PDF적용일자", default="")
-    sgb: str = Field(description="정렬기준(1:평가금액2:증권수)", default="")
-
-
-class t1904OutBlock(BaseModel):
-    chk_tday: str = Field(description="당일구분", default="")
-    date: str = Field(description="PDF적용일자", default="")
-    price: int = Field(description="ETF현재가", default=0)
-    sign: str = Field(description="ETF전일대비구분", default="")
-    change: int = Field(description="ETF전일대비", default=0)
-    diff: float = Field(description="ETF등락율", default=0.0)
-    volume: int = Field(description="ETF누적거래량", default=0)
-    nav: float = Field(description="NAV", default=0.0)
-    navsign: str = Field(description="NAV전일대비구분", default="")
-    navchange: float = Field(description="NAV전일대비", default=0.0)
-    navdiff: float = Field(description="NAV등락율", default=0.0)
-    jnilnav: float = Field(description="전일NAV", default=0.0)
-    jnilnavsign: str = Field(description="전일NAV전일대비구분", default="")
-    jnilnavchange: float = Field(description="전일NAV전일대비", default=0.0)
-    jnilnavdiff: float = Field(description="전일NAV등락율", default=0.0)
-    upname: str = Field(description="업종명", default="")
-    upcode: str = Field(description="업종코드", default="")
-    upprice: float = Field(description="업종현재가", default=0.0)
-    upsign: str = Field(description="업종전일비구분", default="")
-    upchange: float = Field(description="업종전일대비", default=0.0)
-    updiff: float = Field(description="업종등락율", default=0.0)
-    futname: str = Field(description="선물최근월물명", default="")
-    futcode: str = Field(description="선물최근월물코드", default="")
-    futprice: float = Field(description="선물현재가", default=0.0)
-    futsign: str = Field(description="선물전일비구분", default="")
-    futchange: float = Field(description="선물전일대비", default=0.0)
-    futdiff: float = Field(description="선물등락율", default=0.0)
-    upname2: str = Field(description="참고지수명", default="")
-    upcode2: str = Field(description="참고지수코드", default="")
-    upprice2: float = Field(description="참고지수현재가", default=0.0)
-    etftotcap: int = Field(description="순자산총액(단위:억)", default=0)
-    etfnum: int = Field(description="구성종목수", default=0)
-    etfcunum: int = Field(description="CU주식수", default=0)
-    cash: int = Field(description="현금", default=0)
-    opcom_nmk: str = Field(description="운용사명", default="")
-    tot_pval: int = Field(description="전종목평가금액합", default=0)
-    tot_sigatval: int = Field(description="전종목구성시가총액합", default=0)
-
-
-class t1904OutBlock1(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="거래대금(백만)", default=0)
-    icux: int = Field(description="단위증권수(계약수/원화현금/USD현금/창고증권)", default=0)
-    parprice: int = Field(description="액면금액/설정현금액", default=0)
-    pvalue: int = Field(description="평가금액", default=0)
-    sigatvalue: int = Field(description="구성시가총액", default=0)
-    profitdate: str = Field(description="PDF적용일자", default="")
-    weight: float = Field(description="비중(평가금액)", default=0.0)
-    diff2: float = Field(description="ETF종목과등락차", default=0.0)
-
-
-# ETF구성종목조회(t1904)
-class t1904(BaseModel):
-    inblock: t1904InBlock = Field(description="t1904InBlock")
-    outblock: t1904OutBlock = Field(description="t1904OutBlock")
-    outblock1: List[t1904OutBlock1] = Field(description="t1904OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1904",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1906 - ETFLP호가(t1906)>
-class t1906InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1906OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    lp_offerrem1: int = Field(description="LP매도호가수량1", default=0)
-    lp_bidrem1: int = Field(description="LP매수호가수량1", default=0)
-    lp_offerrem2: int = Field(description="LP매도호가수량2", default=0)
-    lp_bidrem2: int = Field(description="LP매수호가수량2", default=0)
-    lp_offerrem3: int = Field(description="LP매도호가수량3", default=0)
-    lp_bidrem3: int = Field(description="LP매수호가수량3", default=0)
-    lp_offerrem4: int = Field(description="LP매도호가수량4", default=0)
-    lp_bidrem4: int = Field(description="LP매수호가수량4", default=0)
-    lp_offerrem5: int = Field(description="LP매도호가수량5", default=0)
-    lp_bidrem5: int = Field(description="LP매수호가수량5", default=0)
-    lp_offerrem6: int = Field(description="LP매도호가수량6", default=0)
-    lp_bidrem6: int = Field(description="LP매수호가수량6", default=0)
-    lp_offerrem7: int = Field(description="LP매도호가수량7", default=0)
-    lp_bidrem7: int = Field(description="LP매수호가수량7", default=0)
-    lp_offerrem8: int = Field(description="LP매도호가수량8", default=0)
-    lp_bidrem8: int = Field(description="LP매수호가수량8", default=0)
-    lp_offerrem9: int = Field(description="LP매도호가수량9", default=0)
-    lp_bidrem9: int = Field(description="LP매수호가수량9", default=0)
-    lp_offerrem10: int = Field(description="LP매도호가수량10", default=0)
-    lp_bidrem10: int = Field(description="LP매수호가수량10", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    preoffercha1: int = Field(description="직전매도대비수량1", default=0)
-    prebidcha1: int = Field(description="직전매수대비수량1", default=0)
-    offerho2: int = Field(description="매도호가2", default=0)
-    bidho2: int = Field(description="매수호가2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    preoffercha2: int = Field(description="직전매도대비수량2", default=0)
-    prebidcha2: int = Field(description="직전매수대비수량2", default=0)
-    offerho3: int = Field(description="매도호가3", default=0)
-    bidho3: int = Field(description="매수호가3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    preoffercha3: int = Field(description="직전매도대비수량3", default=0)
-    prebidcha3: int = Field(description="직전매수대비수량3", default=0)
-    offerho4: int = Field(description="매도호가4", default=0)
-    bidho4: int = Field(description="매수호가4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    preoffercha4: int = Field(description="직전매도대비수량4", default=0)
-    prebidcha4: int = Field(description="직전매수대비수량4", default=0)
-    offerho5: int = Field(description="매도호가5", default=0)
-    bidho5: int = Field(description="매수호가5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    preoffercha5: int = Field(description="직전매도대비수량5", default=0)
-    prebidcha5: int = Field(description="직전매수대비수량5", default=0)
-    offerho6: int = Field(description="매도호가6", default=0)
-    bidho6: int = Field(description="매수호가6", default=0)
-    offerrem6: int = Field(description="매도호가수량6", default=0)
-    bidrem6: int = Field(description="매수호가수량6", default=0)
-    preoffercha6: int = Field(description="직전매도대비수량6", default=0)
-    prebidcha6: int = Field(description="직전매수대비수량6", default=0)
-    offerho7: int = Field(description="매도호가7", default=0)
-    bidho7: int = Field(description="매수호가7", default=0)
-    offerrem7: int = Field(description="매도호가수량7", default=0)
-    bidrem7: int = Field(description="매수호가수량7", default=0)
-    preoffercha7: int = Field(description="직전매도대비수량7", default=0)
-    prebidcha7: int = Field(description="직전매수대비수량7", default=0)
-    offerho8: int = Field(description="매도호가8", default=0)
-    bidho8: int = Field(description="매수호가8", default=0)
-    offerrem8: int = Field(description="매도호가수량8", default=0)
-    bidrem8: int = Field(description="매수호가수량8", default=0)
-    preoffercha8: int = Field(description="직전매도대비수량8", default=0)
-    prebidcha8: int = Field(description="직전매수대비수량8", default=0)
-    offerho9: int = Field(description="매도호가9", default=0)
-    bidho9: int = Field(description="매수호가9", default=0)
-    offerrem9: int = Field(description="매도호가수량9", default=0)
-    bidrem9: int = Field(description="매수호가수량9", default=0)
-    preoffercha9: int = Field(description="직전매도대비수량9", default=0)
-    prebidcha9: int = Field(description="직전매수대비수량9", default=0)
-    offerho10: int = Field(description="매도호가10", default=0)
-    bidho10: int = Field(description="매수호가10", default=0)
-    offerrem10: int = Field(description="매도호가수량10", default=0)
-    bidrem10: int = Field(description="매수호가수량10", default=0)
-    preoffercha10: int = Field(description="직전매도대비수량10", default=0)
-    prebidcha10: int = Field(description="직전매수대비수량10", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-    preoffercha: int = Field(description="직전매도대비수량합", default=0)
-    prebidcha: int = Field(description="직전매수대비수량합", default=0)
-    hotime: str = Field(description="수신시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yevolume: int = Field(description="예상체결수량", default=0)
-    yesign: str = Field(description="예상체결전일구분", default="")
-    yechange: int = Field(description="예상체결전일대비", default=0)
-    yediff: float = Field(description="예상체결등락율", default=0.0)
-    tmoffer: int = Field(description="시간외매도잔량", default=0)
-    tmbid: int = Field(description="시간외매수잔량", default=0)
-    ho_status: str = Field(description="동시구분", default="")
-    shcode: str = Field(description="단축코드", default="")
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-
-
-# ETFLP호가(t1906)
-class t1906(BaseModel):
-    inblock: t1906InBlock = Field(description="t1906InBlock")
-    outblock: t1906OutBlock = Field(description="t1906OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1906",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1921 - 신용거래동향(t1921)>
-class t1921InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    gubun: str = Field(description="융자대주구분", default="")
-    date: str = Field(description="날짜", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1921OutBlock(BaseModel):
-    cnt: int = Field(description="CNT", default=0)
-    date: str = Field(description="날짜", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1921OutBlock1(BaseModel):
-    mmdate: str = Field(description="날짜", default="")
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    jchange: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    nvolume: int = Field(description="신규", default=0)
-    svolume: int = Field(description="상환", default=0)
-    jvolume: int = Field(description="잔고", default=0)
-    price: int = Field(description="금액", default=0)
-    change: int = Field(description="대비", default=0)
-    gyrate: float = Field(description="공여율", default=0.0)
-    jkrate: float = Field(description="잔고율", default=0.0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-# 신용거래동향(t1921)
-class t1921(BaseModel):
-    inblock: t1921InBlock = Field(description="t1921InBlock")
-    outblock: t1921OutBlock = Field(description="t1921OutBlock")
-    outblock1: List[t1921OutBlock1] = Field(description="t1921OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1921",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1926 - 종목별신용정보(t1926)>
-class t1926InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t1926OutBlock(BaseModel):
-    ynvolume: int = Field(description="융자신규수량", default=0)
-    ysvolume: int = Field(description="융자상환수량", default=0)
-    yjvolume: int = Field(description="융자잔고수량", default=0)
-    yvchange: int = Field(description="융자수량대비", default=0)
-    ygrate: float = Field(description="융자공여율", default=0.0)
-    yjrate: float = Field(description="융자잔고율", default=0.0)
-    ynprice: int = Field(description="융자신규금액", default=0)
-    ysprice: int = Field(description="융자상환금액", default=0)
-    yjprice: int = Field(description="융자잔고금액", default=0)
-    yachange: int = Field(description="융자금액대비", default=0)
-    dnvolume: int = Field(description="대주신규수량", default=0)
-    dsvolume: int = Field(description="대주상환수량", default=0)
-    djvolume: int = Field(description="대주잔고수량", default=0)
-    dvchange: int = Field(description="대주수량대비", default=0)
-    dgrate: float = Field(description="대주공여율", default=0.0)
-    djrate: float = Field(description="대주잔고율", default=0.0)
-    dnprice: int = Field(description="대주신규금액", default=0)
-    dsprice: int = Field(description="대주상환금액", default=0)
-    djprice: int = Field(description="대주잔고금액", default=0)
-    dachange: int = Field(description="대주금액대비", default=0)
-    mmdate: str = Field(description="결제일", default="")
-    close: int = Field(description="결제일종가", default=0)
-    volume: int = Field(description="결제일거래량", default=0)
-    value: int = Field(description="결제일거래대금", default=0)
-    pr5days: float = Field(description="주가5일증가율", default=0.0)
-    pr20days: float = Field(description="주가20일증가율", default=0.0)
-    yj5days: float = Field(description="융자5일증가율", default=0.0)
-    yj20days: float = Field(description="융자20일증가율", default=0.0)
-    dj5days: float = Field(description="대주5일증가율", default=0.0)
-    dj20days: float = Field(description="대주20일증가율", default=0.0)
-
-
-# 종목별신용정보(t1926)
-class t1926(BaseModel):
-    inblock: t1926InBlock = Field(description="t1926InBlock")
-    outblock: t1926OutBlock = Field(description="t1926OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1926",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1927 - 공매도일별추이(t1927)>
-class t1927InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    date: str = Field(description="일자", default="")
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-
-
-class t1927OutBlock(BaseModel):
-    date: str = Field(description="일자CTS", default="")
-
-
-class t1927OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    gm_vo: int = Field(description="공매도수량", default=0)
-    gm_va: int = Field(description="공매도대금", default=0)
-    gm_per: float = Field(description="공매도거래비중", default=0.0)
-    gm_avg: int = Field(description="평균공매도단가", default=0)
-    gm_vo_sum: int = Field(description="누적공매도수량", default=0)
-    gm_vo1: int = Field(description="업틱룰적용공매도수량", default=0)
-    gm_va1: int = Field(description="업틱룰적용공매도대금", default=0)
-    gm_vo2: int = Field(description="업틱룰예외공매도수량", default=0)
-    gm_va2: int = Field(description="업틱룰예외공매도대금", default=0)
-
-
-# 공매도일별추이(t1927)
-class t1927(BaseModel):
-    inblock: t1927InBlock = Field(description="t1927InBlock")
-    outblock: t1927OutBlock = Field(description="t1927OutBlock")
-    outblock1: List[t1927OutBlock1] = Field(description="t1927OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1927",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1941 - 종목별대차거래일간추이(t1941)>
-class t1941InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-
-
-class t1941OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    price: int = Field(description="종가", default=0)
-    sign: str = Field(description="대비구분", default="")
-    change: int = Field(description="대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    upvolume: int = Field(description="당일체결", default=0)
-    dnvolume: int = Field(description="당일상환", default=0)
-    tovolume: int = Field(description="당일잔고", default=0)
-    tovalue: int = Field(description="잔고금액", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    tovoldif: int = Field(description="대차증감", default=0)
-
-
-# 종목별대차거래일간추이(t1941)
-class t1941(BaseModel):
-    inblock: t1941InBlock = Field(description="t1941InBlock")
-    outblock1: List[t1941OutBlock1] = Field(description="t1941OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1941",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1950 - ELW현재가(시세)조회(t1950)>
-class t1950InBlock(BaseModel):
-    shcode: str = Field(description="ELW단축코드", default="")
-
-
-class t1950OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    chetime: str = Field(description="체결시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    recprice: int = Field(description="기준가", default=0)
-    avg: int = Field(description="가중평균", default=0)
-    jnilvolume: float = Field(description="전일거래량", default=0.0)
-    jvolume: float = Field(description="전일동시간거래량", default=0.0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    volumechg: float = Field(description="거래량차", default=0.0)
-    volumediff: float = Field(description="거래량차등락율", default=0.0)
-    open: int = Field(description="시가", default=0)
-    odiff: float = Field(description="시가등락율", default=0.0)
-    opentime: str = Field(description="시가시간", default="")
-    high: int = Field(description="고가", default=0)
-    hdiff: float = Field(description="고가등락율", default=0.0)
-    hightime: str = Field(description="고가시간", default="")
-    low: int = Field(description="저가", default=0)
-    ldiff: float = Field(description="저가등락율", default=0.0)
-    lowtime: str = Field(description="저가시간", default="")
-    high52w: int = Field(description="52최고가", default=0)
-    high52wdiff: float = Field(description="52최고가등락율", default=0.0)
-    high52wdate: str = Field(description="52최고가일", default="")
-    low52w: int = Field(description="52최저가", default=0)
-    low52wdiff: float = Field(description="52최저가등락율", default=0.0)
-    low52wdate: str = Field(description="52최저가일", default="")
-    exhratio: float = Field(description="소진율", default=0.0)
-    listing: float = Field(description="상장주식수(천)", default=0.0)
-    memedan: str = Field(description="수량단위", default="")
-    vol: float = Field(description="회전율", default=0.0)
-    parity: float = Field(description="패리티", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    issueprice: int = Field(description="발행가", default=0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="최종거래일", default="")
-    capt: float = Field(description="자본지지", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    spread: float = Field(description="스프레드", default=0.0)
-    espread: float = Field(description="최대스프레드", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    moneyness: str = Field(description="상태", default="")
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    ceta: float = Field(description="쎄타", default=0.0)
-    rhox: float = Field(description="로", default=0.0)
-    bjandatecnt: int = Field(description="잔존일수", default=0)
-    mmsdate: str = Field(description="행사개시일", default="")
-    mmedate: str = Field(description="행사종료일", default="")
-    payday: str = Field(description="지급일", default="")
-    listdate: str = Field(description="발행일", default="")
-    lpmem: str = Field(description="LP회원사", default="")
-    lp_holdvol: float = Field(description="LP보유수량", default=0.0)
-    bcode: str = Field(description="기초자산코드", default="")
-    bgubun: str = Field(description="기초자산구분", default="")
-    bprice: int = Field(description="기초자산현재가", default=0)
-    bsign: str = Field(description="기초자산전일비구분", default="")
-    bchange: int = Field(description="기초자산전일비", default=0)
-    bdiff: float = Field(description="기초자산등락율", default=0.0)
-    bvolume: float = Field(description="기초자산거래량", default=0.0)
-    info1: str = Field(description="락구분", default="")
-    info2: str = Field(description="관리/급등구분", default="")
-    info3: str = Field(description="정지/연장구분", default="")
-    info4: str = Field(description="투자/불성실구분", default="")
-    janginfo: str = Field(description="장구분", default="")
-    basketgb: str = Field(description="바스켓구분", default="")
-    basketcnt: int = Field(description="바스켓갯수", default=0)
-    elwtype: str = Field(description="ELW권리행사방식", default="")
-    settletype: str = Field(description="ELW결제방법", default="")
-    lpord: str = Field(description="LP사주문가능여부", default="")
-    elwdetail: str = Field(description="권리내용", default="")
-    valuation: str = Field(description="만기평가가격방식", default="")
-
-
-class t1950OutBlock1(BaseModel):
-    bskcode: str = Field(description="기초자산코드", default="")
-    bskbno: int = Field(description="기초자산비율", default=0)
-    bskprice: int = Field(description="기초자산현재가", default=0)
-    bsksign: str = Field(description="기초자산전일비구분", default="")
-    bskchange: int = Field(description="기초자산전일비", default=0)
-    bskdiff: float = Field(description="기초자산등락율", default=0.0)
-    bskvolume: float = Field(description="기초자산거래량", default=0.0)
-    bskjnilclose: int = Field(description="기초자산전일종가", default=0)
-
-
-# ELW현재가(시세)조회(t1950)
-class t1950(BaseModel):
-    inblock: t1950InBlock = Field(description="t1950InBlock")
-    outblock: t1950OutBlock = Field(description="t1950OutBlock")
-    outblock1: List[t1950OutBlock1] = Field(description="t1950OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1950",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1951 - ELW시간대별체결조회(t1951)>
-class t1951InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    starttime: str = Field(description="시작시간", default="")
-    endtime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1951OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1951OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    revolume: int = Field(description="순체결량", default=0)
-    rechecnt: int = Field(description="순체결건수", default=0)
-
-
-# ELW시간대별체결조회(t1951)
-class t1951(BaseModel):
-    inblock: t1951InBlock = Field(description="t1951InBlock")
-    outblock: t1951OutBlock = Field(description="t1951OutBlock")
-    outblock1: List[t1951OutBlock1] = Field(description="t1951OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1951",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1954 - ELW일별주가(t1954)>
-class t1954InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    date: str = Field(description="날짜", default="")
-    cnt: int = Field(description="건수", default=0)
-
-
-class t1954OutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    bsjgubun: str = Field(description="기초자산구분", default="")
-    bscode: str = Field(description="기초자산코드(현물)", default="")
-    bjcode: str = Field(description="기초자산코드(지수)", default="")
-
-
-class t1954OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    bsprice: int = Field(description="기초자산(현물)", default=0)
-    bjprice: float = Field(description="기초자산(지수)", default=0.0)
-    bsign: str = Field(description="전일대비구분", default="")
-    bschange: int = Field(description="전일대비(현물)", default=0)
-    bjchange: float = Field(description="전일대비(지수)", default=0.0)
-    bdiff: float = Field(description="등락율", default=0.0)
-    bvolume: float = Field(description="기초자산거래량", default=0.0)
-    parity: float = Field(description="패리티", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    capt: float = Field(description="자본지지", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    mness: str = Field(description="Moneyness", default="")
-
-
-# ELW일별주가(t1954)
-class t1954(BaseModel):
-    inblock: t1954InBlock = Field(description="t1954InBlock")
-    outblock: t1954OutBlock = Field(description="t1954OutBlock")
-    outblock1: List[t1954OutBlock1] = Field(description="t1954OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1954",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1956 - ELW현재가(확정지급액)조회(t1956)>
-class t1956InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1956OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    chetime: str = Field(description="체결시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    recprice: int = Field(description="기준가", default=0)
-    avg: int = Field(description="가중평균", default=0)
-    jnilvolume: float = Field(description="전일거래량", default=0.0)
-    jvolume: float = Field(description="전일동시간거래량", default=0.0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    volumechg: float = Field(description="거래량차", default=0.0)
-    volumediff: float = Field(description="거래량차등락율", default=0.0)
-    open: int = Field(description="시가", default=0)
-    odiff: float = Field(description="시가등락율", default=0.0)
-    opentime: str = Field(description="시가시간", default="")
-    high: int = Field(description="고가", default=0)
-    hdiff: float = Field(description="고가등락율", default=0.0)
-    hightime: str = Field(description="고가시간", default="")
-    low: int = Field(description="저가", default=0)
-    ldiff: float = Field(description="저가등락율", default=0.0)
-    lowtime: str = Field(description="저가시간", default="")
-    high52w: int = Field(description="52최고가", default=0)
-    high52wdiff: float = Field(description="52최고가등락율", default=0.0)
-    high52wdate: str = Field(description="52최고가일", default="")
-    low52w: int = Field(description="52최저가", default=0)
-    low52wdiff: float = Field(description="52최저가등락율", default=0.0)
-    low52wdate: str = Field(description="52최저가일", default="")
-    exhratio: float = Field(description="소진율", default=0.0)
-    listing: float = Field(description="상장주식수(천)", default=0.0)
-    memedan: str = Field(description="수량단위", default="")
-    vol: float = Field(description="회전율", default=0.0)
-    parity: float = Field(description="패리티", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    issueprice: int = Field(description="발행가", default=0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="최종거래일", default="")
-    capt: float = Field(description="자본지지", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    spread: float = Field(description="스프레드", default=0.0)
-    espread: float = Field(description="최대스프레드", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    moneyness: str = Field(description="상태", default="")
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    ceta: float = Field(description="쎄타", default=0.0)
-    rhox: float = Field(description="로", default=0.0)
-    bjandatecnt: int = Field(description="잔존일수", default=0)
-    mmsdate: str = Field(description="행사개시일", default="")
-    mmedate: str = Field(description="행사종료일", default="")
-    payday: str = Field(description="지급일", default="")
-    listdate: str = Field(description="발행일", default="")
-    lpmem: str = Field(description="LP회원사", default="")
-    lp_holdvol: float = Field(description="LP보유수량", default=0.0)
-    bcode: str = Field(description="기초자산코드", default="")
-    bgubun: str = Field(description="기초자산구분", default="")
-    bprice: int = Field(description="기초자산현재가", default=0)
-    bsign: str = Field(description="기초자산전일비구분", default="")
-    bchange: int = Field(description="기초자산전일비", default=0)
-    bdiff: float = Field(description="기초자산등락율", default=0.0)
-    bvolume: float = Field(description="기초자산거래량", default=0.0)
-    info1: str = Field(description="락구분", default="")
-    info2: str = Field(description="관리/급등구분", default="")
-    info3: str = Field(description="정지/연장구분", default="")
-    info4: str = Field(description="투자/불성실구분", default="")
-    janginfo: str = Field(description="장구분", default="")
-    basketgb: str = Field(description="바스켓구분", default="")
-    basketcnt: int = Field(description="바스켓갯수", default=0)
-    elwtype: str = Field(description="ELW권리행사방식", default="")
-    settletype: str = Field(description="ELW결제방법", default="")
-    lpord: str = Field(description="LP사주문가능여부", default="")
-    elwdetail: str = Field(description="권리내용", default="")
-    valuation: str = Field(description="만기평가가격방식", default="")
-    givemoney: float = Field(description="확정지급액", default=0.0)
-
-
-class t1956OutBlock1(BaseModel):
-    bskcode: str = Field(description="기초자산코드", default="")
-    bskbno: int = Field(description="기초자산비율", default=0)
-    bskprice: int = Field(description="기초자산현재가", default=0)
-    bsksign: str = Field(description="기초자산전일비구분", default="")
-    bskchange: int = Field(description="기초자산전일비", default=0)
-    bskdiff: float = Field(description="기초자산등락율", default=0.0)
-    bskvolume: float = Field(description="기초자산거래량", default=0.0)
-    bskjnilclose: int = Field(description="기초자산전일종가", default=0)
-
-
-# ELW현재가(확정지급액)조회(t1956)
-class t1956(BaseModel):
-    inblock: t1956InBlock = Field(description="t1956InBlock")
-    outblock: t1956OutBlock = Field(description="t1956OutBlock")
-    outblock1: List[t1956OutBlock1] = Field(description="t1956OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1956",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1958 - ELW종목비교(t1958)>
-class t1958InBlock(BaseModel):
-    shcode1: str = Field(description="종목코드1", default="")
-    shcode2: str = Field(description="종목코드2", default="")
-
-
-class t1958OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    item1: str = Field(description="기초자산", default="")
-    issuernmk: str = Field(description="발행사", default="")
-    elwopt: str = Field(description="콜풋구분", default="")
-    elwtype: str = Field(description="행사방식", default="")
-    settletype: str = Field(description="결제방법", default="")
-    elwexec: float = Field(description="행사가", default=0.0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    listing: float = Field(description="발행수량", default=0.0)
-    mmsdate: str = Field(description="행사개시일", default="")
-    lastdate: str = Field(description="최종거래일", default="")
-    nofdays: int = Field(description="거래잔존일수", default=0)
-    payday: str = Field(description="지급일", default="")
-    parity: float = Field(description="패리티", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    capt: float = Field(description="자본지지", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    price: int = Field(description="가격", default=0)
-    volume: float = Field(description="거래량", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-
-
-class t1958OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    item1: str = Field(description="기초자산", default="")
-    issuernmk: str = Field(description="발행사", default="")
-    elwopt: str = Field(description="콜풋구분", default="")
-    elwtype: str = Field(description="행사방식", default="")
-    settletype: str = Field(description="결제방법", default="")
-    elwexec: float = Field(description="행사가", default=0.0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    listing: float = Field(description="발행수량", default=0.0)
-    mmsdate: str = Field(description="행사개시일", default="")
-    lastdate: str = Field(description="최종거래일", default="")
-    nofdays: int = Field(description="거래잔존일수", default=0)
-    payday: str = Field(description="지급일", default="")
-    parity: float = Field(description="패리티", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    capt: float = Field(description="자본지지", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    price: int = Field(description="가격", default=0)
-    volume: float = Field(description="거래량", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-
-
-class t1958OutBlock2(BaseModel):
-    hnamecmp: str = Field(description="종목명비교", default="")
-    item1cmp: str = Field(description="기초자산비교", default="")
-    issuernmkcmp: str = Field(description="발행사비교", default="")
-    elwoptcmp: str = Field(description="콜풋구분비교", default="")
-    elwtypecmp: str = Field(description="행사방식비교", default="")
-    settlecmp: str = Field(description="결제방법비교", default="")
-    elwexeccmp: float = Field(description="행사가비교", default=0.0)
-    convcmp: float = Field(description="전환비율비교", default=0.0)
-    listingcmp: float = Field(description="발행수량비교", default=0.0)
-    mmsdatecmp: str = Field(description="행사개시일비교", default="")
-    lastdatecmp: str = Field(description="최종거래일비교", default="")
-    nofdayscmp: str = Field(description="거래잔존일수비교", default="")
-    paydaycmp: str = Field(description="지급일비교", default="")
-    paritycmp: float = Field(description="패리티비교", default=0.0)
-    premiumcmp: float = Field(description="프리미엄비교", default=0.0)
-    beratecmp: float = Field(description="손익분기비교", default=0.0)
-    captcmp: float = Field(description="자본지지비교", default=0.0)
-    gearingcmp: float = Field(description="기어링비교", default=0.0)
-    egearingcmp: float = Field(description="e.기어링비교", default=0.0)
-    pricecmp: int = Field(description="가격비교", default=0)
-    volumecmp: float = Field(description="거래량비교", default=0.0)
-    diffcmp: float = Field(description="등락율비교", default=0.0)
-
-
-# ELW종목비교(t1958)
-class t1958(BaseModel):
-    inblock: t1958InBlock = Field(description="t1958InBlock")
-    outblock: t1958OutBlock = Field(description="t1958OutBlock")
-    outblock1: t1958OutBlock1 = Field(description="t1958OutBlock1")
-    outblock2: t1958OutBlock2 = Field(description="t1958OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for t1958",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1959 - LP대상종목정보조회(t1959)>
-class t1959InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t1959OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: str = Field(description="현재가", default="")
-    sign: str = Field(description="부호", default="")
-    change: str = Field(description="대비", default="")
-    rate: float = Field(description="등락율", default=0.0)
-    volume: str = Field(description="누적거래량", default="")
-    value: str = Field(description="누적거래대금", default="")
-    lp_gb: str = Field(description="LP주문가능여부", default="")
-    lp_mem_nm1: str = Field(description="LP회원사명1", default="")
-    lp_mem_nm2: str = Field(description="LP회원사명2", default="")
-    lp_mem_nm3: str = Field(description="LP회원사명3", default="")
-    lp_mem_nm4: str = Field(description="LP회원사명4", default="")
-    lp_mem_nm5: str = Field(description="LP회원사명5", default="")
-    lp_min_qty: str = Field(description="LP최소호가수량", default="")
-    lp_st_date: str = Field(description="LP시작일", default="")
-    lp_end_date: str = Field(description="LP종료일", default="")
-    lp_spread: float = Field(description="LP스프레드", default=0.0)
-
-
-# LP대상종목정보조회(t1959)
-class t1959(BaseModel):
-    inblock: t1959InBlock = Field(description="t1959InBlock")
-    outblock1: List[t1959OutBlock1] = Field(description="t1959OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1959",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1960 - ELW등락율상위(t1960)>
-class t1960InBlock(BaseModel):
-    gubun: str = Field(description="상승하락(0:상승1:하락)", default="")
-    ggubun: str = Field(description="권리유형구분(00:EX01:콜02:풋" ":전체)", default="")
-    itemcode: str = Field(description="기초자산종목", default="")
-    lastdate: str = Field(description="조회만기일", default="")
-    exgubun: str = Field(description="대상제외", default="")
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    sjanday: int = Field(description="잔존시작일수", default=0)
-    ejanday: int = Field(description="잔존종료일수", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1960OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1960OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="만기일", default="")
-    itemcode: str = Field(description="기초자산종목코드", default="")
-    itemshcode: str = Field(description="기초자산단축코드", default="")
-    itemname: str = Field(description="기초자산종목명", default="")
-    itemprice: str = Field(description="기초자산현재가", default="")
-    itemsign: str = Field(description="기초자산대비구분", default="")
-    itemchange: str = Field(description="기초자산전일대비", default="")
-    itemdiff: float = Field(description="기초자산등락율", default=0.0)
-    elwshcode: str = Field(description="ELW종목코드", default="")
-    bepoint: float = Field(description="손익분기점", default=0.0)
-
-
-# ELW등락율상위(t1960)
-class t1960(BaseModel):
-    inblock: t1960InBlock = Field(description="t1960InBlock")
-    outblock: t1960OutBlock = Field(description="t1960OutBlock")
-    outblock1: List[t1960OutBlock1] = Field(description="t1960OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1960",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1961 - ELW거래량상위(t1961)>
-class t1961InBlock(BaseModel):
-    gubun: str = Field(description="당일전일(0:당일1:전일)", default="")
-    ggubun: str = Field(description="권리유형구분(00:EX01:콜02:풋" ":전체)", default="")
-    itemcode: str = Field(description="기초자산종목", default="")
-    lastdate: str = Field(description="조회만기일", default="")
-    exgubun: str = Field(description="대상제외", default="")
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    sjanday: int = Field(description="잔존시작일수", default=0)
-    ejanday: int = Field(description="잔존종료일수", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1961OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1961OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    jnilvolume: float = Field(description="전일거래량", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="만기일", default="")
-    itemcode: str = Field(description="기초자산종목코드", default="")
-    itemshcode: str = Field(description="기초자산단축코드", default="")
-    itemname: str = Field(description="기초자산종목명", default="")
-    itemprice: str = Field(description="기초자산현재가", default="")
-    itemsign: str = Field(description="기초자산대비구분", default="")
-    itemchange: str = Field(description="기초자산전일대비", default="")
-    itemdiff: float = Field(description="기초자산등락율", default=0.0)
-    elwshcode: str = Field(description="ELW종목코드", default="")
-
-
-# ELW거래량상위(t1961)
-class t1961(BaseModel):
-    inblock: t1961InBlock = Field(description="t1961InBlock")
-    outblock: t1961OutBlock = Field(description="t1961OutBlock")
-    outblock1: List[t1961OutBlock1] = Field(description="t1961OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1961",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1964 - ELW전광판(t1964)>
-class t1964InBlock(BaseModel):
-    item: str = Field(description="기초자산코드", default="")
-    issuercd: str = Field(description="발행사", default="")
-    lastmonth: str = Field(description="만기월물", default="")
-    elwopt: str = Field(description="콜풋구분", default="")
-    atmgubun: str = Field(description="머니구분", default="")
-    elwtype: str = Field(description="권리행사방식", default="")
-    settletype: str = Field(description="결제방법", default="")
-    elwexecgubun: str = Field(description="행사기초자산구분", default="")
-    fromrat: str = Field(description="시작비율", default="")
-    torat: str = Field(description="종료비율", default="")
-    volume: str = Field(description="거래량", default="")
-
-
-class t1964OutBlock1(BaseModel):
-    shcode: str = Field(description="ELW코드", default="")
-    hname: str = Field(description="종목명", default="")
-    item1: str = Field(description="기초자산코드", default="")
-    itemnm: str = Field(description="기초자산명", default="")
-    issuernmk: str = Field(description="발행사", default="")
-    elwopt: str = Field(description="콜풋구분", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    jandatecnt: int = Field(description="잔존일수", default=0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="최종거래일", default="")
-    mmsdate: str = Field(description="행사개시일", default="")
-    payday: str = Field(description="지급일", default="")
-    listing: int = Field(description="발행수량", default=0)
-    atmgbnm: str = Field(description="머니구분", default="")
-    parity: float = Field(description="패리티", default=0.0)
-    preminum: float = Field(description="프리미엄", default=0.0)
-    spread: float = Field(description="스프래드", default=0.0)
-    berate: float = Field(description="손익분기율", default=0.0)
-    capt: float = Field(description="자본지지율", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    egearing: float = Field(description="e기어링", default=0.0)
-    itemprice: int = Field(description="기초자산현재가", default=0)
-    itemsign: str = Field(description="기초자산전일대비구분", default="")
-    itemchange: int = Field(description="기초자산전일대비", default=0)
-    itemdiff: float = Field(description="기초자산등락율", default=0.0)
-    itemvolume: int = Field(description="기초자산거래량", default=0)
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    lp_rate: float = Field(description="LP보유비율", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    delta: float = Field(description="델타", default=0.0)
-    theta: float = Field(description="쎄타", default=0.0)
-
-
-# ELW전광판(t1964)
-class t1964(BaseModel):
-    inblock: t1964InBlock = Field(description="t1964InBlock")
-    outblock1: List[t1964OutBlock1] = Field(description="t1964OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1964",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1966 - ELW거래대금상위(t1966)>
-class t1966InBlock(BaseModel):
-    gubun: str = Field(description="당일전일(0:당일1:전일)", default="")
-    ggubun: str = Field(description="권리유형구분(00:EX01:콜02:풋" ":전체)", default="")
-    itemcode: str = Field(description="기초자산종목", default="")
-    lastdate: str = Field(description="조회만기일", default="")
-    exgubun: str = Field(description="대상제외", default="")
-    sprice: int = Field(description="시작가격", default=0)
-    eprice: int = Field(description="종료가격", default=0)
-    volume: int = Field(description="거래량", default=0)
-    sjanday: int = Field(description="잔존시작일수", default=0)
-    ejanday: int = Field(description="잔존종료일수", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1966OutBlock(BaseModel):
-    idx: int = Field(description="IDX", default=0)
-
-
-class t1966OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    value: float = Field(description="누적거래대금", default=0.0)
-    jnilvalue: float = Field(description="전일거래대금", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    lastdate: str = Field(description="만기일", default="")
-    itemcode: str = Field(description="기초자산종목코드", default="")
-    itemshcode: str = Field(description="기초자산단축코드", default="")
-    itemname: str = Field(description="기초자산종목명", default="")
-    itemprice: str = Field(description="기초자산현재가", default="")
-    itemsign: str = Field(description="기초자산대비구분", default="")
-    itemchange: str = Field(description="기초자산전일대비", default="")
-    itemdiff: float = Field(description="기초자산등락율", default=0.0)
-    elwshcode: str = Field(description="ELW종목코드", default="")
-
-
-# ELW거래대금상위(t1966)
-class t1966(BaseModel):
-    inblock: t1966InBlock = Field(description="t1966InBlock")
-    outblock: t1966OutBlock = Field(description="t1966OutBlock")
-    outblock1: List[t1966OutBlock1] = Field(description="t1966OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1966",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1969 - ELW지표검색(t1969)>
-class t1969InBlock(BaseModel):
-    chkitem: str = Field(description="기초자산chk구분", default="")
-    cbitem: str = Field(description="기초자산코드", default="")
-    chkissuer: str = Field(description="발행사chk구분", default="")
-    cbissuer: str = Field(description="발행사", default="")
-    chkcallput: str = Field(description="권리chk구분", default="")
-    cbcallput: str = Field(description="권리(call:01.put:02)", default="")
-    chkexec: str = Field(description="행사가chk구분", default="")
-    cbexec: str = Field(description="행사가(>=:1.<=:2)", default="")
-    chktype: str = Field(description="행사방식chk구분", default="")
-    cbtype: str = Field(description="행사방식", default="")
-    chksettle: str = Field(description="결제방법chk구분", default="")
-    cbsettle: str = Field(description="결제방법", default="")
-    chklast: str = Field(description="만기chk구분", default="")
-    cblast: str = Field(description="만기월별", default="")
-    chkelwexec: str = Field(description="행사가격chk구분", default="")
-    elwexecs: float = Field(description="행사가이상", default=0.0)
-    elwexece: float = Field(description="행사가이하", default=0.0)
-    chkvolume: str = Field(description="거래량chk구분", default="")
-    volumes: float = Field(description="거래량이상", default=0.0)
-    volumee: float = Field(description="거래량이하", default=0.0)
-    chkrate: str = Field(description="등락율chk구분", default="")
-    rates: float = Field(description="등락율이상", default=0.0)
-    ratee: float = Field(description="등락율이하", default=0.0)
-    chkpremium: str = Field(description="프리미엄chk구분", default="")
-    premiums: float = Field(description="프리미엄이상", default=0.0)
-    premiume: float = Field(description="프리미엄이하", default=0.0)
-    chkparity: str = Field(description="패리티chk구분", default="")
-    paritys: float = Field(description="패리티이상", default=0.0)
-    paritye: float = Field(description="패리티이하", default=0.0)
-    chkberate: str = Field(description="손익분기chk구분", default="")
-    berates: float = Field(description="손익분기이상", default=0.0)
-    beratee: float = Field(description="손익분기이하", default=0.0)
-    chkcapt: str = Field(description="자본지지chk구분", default="")
-    capts: float = Field(description="자본지지이상", default=0.0)
-    capte: float = Field(description="자본지지이하", default=0.0)
-    chkegearing: str = Field(description="e.기어링chk구분", default="")
-    egearings: float = Field(description="e.기어링이상", default=0.0)
-    egearinge: float = Field(description="e.기어링이하", default=0.0)
-    chkgearing: str = Field(description="기어링chk구분", default="")
-    gearings: float = Field(description="기어링이상", default=0.0)
-    gearinge: float = Field(description="기어링이하", default=0.0)
-    chkdelta: str = Field(description="델타chk구분", default="")
-    deltas: float = Field(description="델타이상", default=0.0)
-    deltae: float = Field(description="델타이하", default=0.0)
-    chktheta: str = Field(description="쎄타chk구분", default="")
-    thetas: float = Field(description="쎄타이상", default=0.0)
-    thetae: float = Field(description="쎄타이하", default=0.0)
-    chkduedate: str = Field(description="최종거래일chk구분", default="")
-    duedates: str = Field(description="최종거래일이상", default="")
-    duedatee: str = Field(description="최종거래일이하", default="")
-    onetickgubun: str = Field(description="LP갭1틱", default="")
-    lp_liquidity: str = Field(description="LP유동성공급", default="")
-    chklp_code: str = Field(description="LPchk구분", default="")
-    lp_code: str = Field(description="LP회원사코드", default="")
-    chkkoba: str = Field(description="조기종료chk구분", default="")
-    cbkoba: str = Field(description="조기종료(0:전체1:KOBA2:KOBA제외)", default="")
-
-
-class t1969OutBlock(BaseModel):
-    cnt: int = Field(description="종목갯수", default=0)
-
-
-class t1969OutBlock1(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="종목코드", default="")
-    issuernmk: str = Field(description="발행사", default="")
-    itemcode: str = Field(description="기초자산코드", default="")
-    cpgubun: str = Field(description="콜/풋구분", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    jnilvolume: float = Field(description="전일거래량", default=0.0)
-    elwexec: float = Field(description="행사가", default=0.0)
-    item: str = Field(description="기초자산명", default="")
-    bprice: float = Field(description="기초자산가", default=0.0)
-    bsign: str = Field(description="기초전일대비구분", default="")
-    bchange: float = Field(description="기초전일대비", default=0.0)
-    bdiff: float = Field(description="기초등락율", default=0.0)
-    premium: float = Field(description="프리미엄", default=0.0)
-    parity: float = Field(description="패리티", default=0.0)
-    berate: float = Field(description="손익분기", default=0.0)
-    capt: float = Field(description="자본지지", default=0.0)
-    egearing: float = Field(description="e.기어링", default=0.0)
-    gearing: float = Field(description="기어링", default=0.0)
-    lastdate: str = Field(description="최종거래일", default="")
-    delta: float = Field(description="델타", default=0.0)
-    theta: float = Field(description="쎄타", default=0.0)
-    lpname: str = Field(description="LP회원사", default="")
-    lphold: float = Field(description="LP보유율", default=0.0)
-    bjandatecnt: int = Field(description="잔존일수", default=0)
-    convrate: float = Field(description="전환비율", default=0.0)
-    tickvalue: float = Field(description="1틱환산", default=0.0)
-    kasis: float = Field(description="괴리율", default=0.0)
-
-
-# ELW지표검색(t1969)
-class t1969(BaseModel):
-    inblock: t1969InBlock = Field(description="t1969InBlock")
-    outblock: t1969OutBlock = Field(description="t1969OutBlock")
-    outblock1: List[t1969OutBlock1] = Field(description="t1969OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1969",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1971 - ELW현재가호가조회(t1971)>
-class t1971InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1971OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    lp_offerrem1: int = Field(description="LP매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    lp_bidrem1: int = Field(description="LP매수호가수량1", default=0)
-    preoffercha1: int = Field(description="직전매도대비수량1", default=0)
-    prebidcha1: int = Field(description="직전매수대비수량1", default=0)
-    offerho2: int = Field(description="매도호가2", default=0)
-    bidho2: int = Field(description="매수호가2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    lp_offerrem2: int = Field(description="LP매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    lp_bidrem2: int = Field(description="LP매수호가수량2", default=0)
-    preoffercha2: int = Field(description="직전매도대비수량2", default=0)
-    prebidcha2: int = Field(description="직전매수대비수량2", default=0)
-    offerho3: int = Field(description="매도호가3", default=0)
-    bidho3: int = Field(description="매수호가3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    lp_offerrem3: int = Field(description="LP매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    lp_bidrem3: int = Field(description="LP매수호가수량3", default=0)
-    preoffercha3: int = Field(description="직전매도대비수량3", default=0)
-    prebidcha3: int = Field(description="직전매수대비수량3", default=0)
-    offerho4: int = Field(description="매도호가4", default=0)
-    bidho4: int = Field(description="매수호가4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    lp_offerrem4: int = Field(description="LP매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    lp_bidrem4: int = Field(description="LP매수호가수량4", default=0)
-    preoffercha4: int = Field(description="직전매도대비수량4", default=0)
-    prebidcha4: int = Field(description="직전매수대비수량4", default=0)
-    offerho5: int = Field(description="매도호가5", default=0)
-    bidho5: int = Field(description="매수호가5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    lp_offerrem5: int = Field(description="LP매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    lp_bidrem5: int = Field(description="LP매수호가수량5", default=0)
-    preoffercha5: int = Field(description="직전매도대비수량5", default=0)
-    prebidcha5: int = Field(description="직전매수대비수량5", default=0)
-    offerho6: int = Field(description="매도호가6", default=0)
-    bidho6: int = Field(description="매수호가6", default=0)
-    offerrem6: int = Field(description="매도호가수량6", default=0)
-    lp_offerrem6: int = Field(description="LP매도호가수량6", default=0)
-    bidrem6: int = Field(description="매수호가수량6", default=0)
-    lp_bidrem6: int = Field(description="LP매수호가수량6", default=0)
-    preoffercha6: int = Field(description="직전매도대비수량6", default=0)
-    prebidcha6: int = Field(description="직전매수대비수량6", default=0)
-    offerho7: int = Field(description="매도호가7", default=0)
-    bidho7: int = Field(description="매수호가7", default=0)
-    offerrem7: int = Field(description="매도호가수량7", default=0)
-    lp_offerrem7: int = Field(description="LP매도호가수량7", default=0)
-    bidrem7: int = Field(description="매수호가수량7", default=0)
-    lp_bidrem7: int = Field(description="LP매수호가수량7", default=0)
-    preoffercha7: int = Field(description="직전매도대비수량7", default=0)
-    prebidcha7: int = Field(description="직전매수대비수량7", default=0)
-    offerho8: int = Field(description="매도호가8", default=0)
-    bidho8: int = Field(description="매수호가8", default=0)
-    offerrem8: int = Field(description="매도호가수량8", default=0)
-    lp_offerrem8: int = Field(description="LP매도호가수량8", default=0)
-    bidrem8: int = Field(description="매수호가수량8", default=0)
-    lp_bidrem8: int = Field(description="LP매수호가수량8", default=0)
-    preoffercha8: int = Field(description="직전매도대비수량8", default=0)
-    prebidcha8: int = Field(description="직전매수대비수량8", default=0)
-    offerho9: int = Field(description="매도호가9", default=0)
-    bidho9: int = Field(description="매수호가9", default=0)
-    offerrem9: int = Field(description="매도호가수량9", default=0)
-    lp_offerrem9: int = Field(description="LP매도호가수량9", default=0)
-    bidrem9: int = Field(description="매수호가수량9", default=0)
-    lp_bidrem9: int = Field(description="LP매수호가수량9", default=0)
-    preoffercha9: int = Field(description="직전매도대비수량9", default=0)
-    prebidcha9: int = Field(description="직전매수대비수량9", default=0)
-    offerho10: int = Field(description="매도호가10", default=0)
-    bidho10: int = Field(description="매수호가10", default=0)
-    offerrem10: int = Field(description="매도호가수량10", default=0)
-    lp_offerrem10: int = Field(description="LP매도호가수량10", default=0)
-    bidrem10: int = Field(description="매수호가수량10", default=0)
-    lp_bidrem10: int = Field(description="LP매수호가수량10", default=0)
-    preoffercha10: int = Field(description="직전매도대비수량10", default=0)
-    prebidcha10: int = Field(description="직전매수대비수량10", default=0)
-    offer: int = Field(description="매도호가수량합", default=0)
-    bid: int = Field(description="매수호가수량합", default=0)
-    preoffercha: int = Field(description="직전매도대비수량합", default=0)
-    prebidcha: int = Field(description="직전매수대비수량합", default=0)
-    hotime: str = Field(description="수신시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yevolume: float = Field(description="예상체결수량", default=0.0)
-    yesign: str = Field(description="예상체결전일구분", default="")
-    yechange: int = Field(description="예상체결전일대비", default=0)
-    yediff: float = Field(description="예상체결등락율", default=0.0)
-    tmoffer: int = Field(description="시간외매도잔량", default=0)
-    tmbid: int = Field(description="시간외매수잔량", default=0)
-    ho_status: str = Field(description="동시구분", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    invidx: str = Field(description="ELW권리형태(1:표준2:디지털3:조기종료)", default="")
-    koba_stdprc: float = Field(description="KO베리어", default=0.0)
-    koba_acc_rt: float = Field(description="KO접근도", default=0.0)
-    koba_yn: str = Field(description="KO발생여부(Y/N)", default="")
-
-
-# ELW현재가호가조회(t1971)
-class t1971(BaseModel):
-    inblock: t1971InBlock = Field(description="t1971InBlock")
-    outblock: t1971OutBlock = Field(description="t1971OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1971",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1972 - ELW현재가(거래원)조회(t1972)>
-class t1972InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t1972OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    expcode: str = Field(description="표준코드", default="")
-    shcode: str = Field(description="단축코드", default="")
-    offerno1: str = Field(description="매도증권사코드1", default="")
-    bidno1: str = Field(description="매수증권사코드1", default="")
-    dvol1: int = Field(description="총매도수량1", default=0)
-    svol1: int = Field(description="총매수수량1", default=0)
-    dcha1: int = Field(description="매도증감1", default=0)
-    scha1: int = Field(description="매수증감1", default=0)
-    ddiff1: float = Field(description="매도비율1", default=0.0)
-    sdiff1: float = Field(description="매수비율1", default=0.0)
-    offerno2: str = Field(description="매도증권사코드2", default="")
-    bidno2: str = Field(description="매수증권사코드2", default="")
-    dvol2: int = Field(description="총매도수량2", default=0)
-    svol2: int = Field(description="총매수수량2", default=0)
-    dcha2: int = Field(description="매도증감2", default=0)
-    scha2: int = Field(description="매수증감2", default=0)
-    ddiff2: float = Field(description="매도비율2", default=0.0)
-    sdiff2: float = Field(description="매수비율2", default=0.0)
-    offerno3: str = Field(description="매도증권사코드3", default="")
-    bidno3: str = Field(description="매수증권사코드3", default="")
-    dvol3: int = Field(description="총매도수량3", default=0)
-    svol3: int = Field(description="총매수수량3", default=0)
-    dcha3: int = Field(description="매도증감3", default=0)
-    scha3: int = Field(description="매수증감3", default=0)
-    ddiff3: float = Field(description="매도비율3", default=0.0)
-    sdiff3: float = Field(description="매수비율3", default=0.0)
-    offerno4: str = Field(description="매도증권사코드4", default="")
-    bidno4: str = Field(description="매수증권사코드4", default="")
-    dvol4: int = Field(description="총매도수량4", default=0)
-    svol4: int = Field(description="총매수수량4", default=0)
-    dcha4: int = Field(description="매도증감4", default=0)
-    scha4: int = Field(description="매수증감4", default=0)
-    ddiff4: float = Field(description="매도비율4", default=0.0)
-    sdiff4: float = Field(description="매수비율4", default=0.0)
-    offerno5: str = Field(description="매도증권사코드5", default="")
-    bidno5: str = Field(description="매수증권사코드5", default="")
-    dvol5: int = Field(description="총매도수량5", default=0)
-    svol5: int = Field(description="총매수수량5", default=0)
-    dcha5: int = Field(description="매도증감5", default=0)
-    scha5: int = Field(description="매수증감5", default=0)
-    ddiff5: float = Field(description="매도비율5", default=0.0)
-    sdiff5: float = Field(description="매수비율5", default=0.0)
-    fwdvl: int = Field(description="외국계매도합계수량", default=0)
-    fwsvl: int = Field(description="외국계매수합계수량", default=0)
-    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
-    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
-    fwddiff: float = Field(description="외국계매도합계비율", default=0.0)
-    fwsdiff: float = Field(description="외국계매수합계비율", default=0.0)
-
-
-# ELW현재가(거래원)조회(t1972)
-class t1972(BaseModel):
-    inblock: t1972InBlock = Field(description="t1972InBlock")
-    outblock: t1972OutBlock = Field(description="t1972OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t1972",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1973 - ELW시간대별예상체결조회(t1973)>
-class t1973InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1973OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t1973OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    yeprice: int = Field(description="예상체결가격", default=0)
-    yegubun: str = Field(description="예상체결구분", default="")
-    jnilysign: str = Field(description="전일종가대비구분", default="")
-    jnilychange: int = Field(description="전일종가대비", default=0)
-    yediff: float = Field(description="예상체결등락율", default=0.0)
-    yevolume: int = Field(description="예상체결량", default=0)
-    ymdvolume: int = Field(description="예상매도체결량", default=0)
-    ymsvolume: int = Field(description="예상매수체결량", default=0)
-
-
-# ELW시간대별예상체결조회(t1973)
-class t1973(BaseModel):
-    inblock: t1973InBlock = Field(description="t1973InBlock")
-    outblock: t1973OutBlock = Field(description="t1973OutBlock")
-    outblock1: List[t1973OutBlock1] = Field(description="t1973OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1973",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1974 - ELW기초자산동일종목(t1974)>
-class t1974InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t1974OutBlock(BaseModel):
-    cnt: int = Field(description="종목갯수", default=0)
-
-
-class t1974OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    cpgubun: str = Field(description="콜/풋구분", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-
-
-# ELW기초자산동일종목(t1974)
-class t1974(BaseModel):
-    inblock: t1974InBlock = Field(description="t1974InBlock")
-    outblock: t1974OutBlock = Field(description="t1974OutBlock")
-    outblock1: List[t1974OutBlock1] = Field(description="t1974OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1974",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t1988 - 기초자산리스트조회(t1988)>
-class t1988InBlock(BaseModel):
-    mkt_gb: str = Field(description="시장구분(0:전체1:코스피2:코스닥)", default="")
-    chk_price: str = Field(description="가격설정(0:전체1:조건설정)", default="")
-    from_price: str = Field(description="가격1", default="")
-    to_price: str = Field(description="가격2", default="")
-    chk_vol: str = Field(description="거래량설정(0:전체1:조건설정)", default="")
-    from_vol: str = Field(description="거래량1", default="")
-    to_vol: str = Field(description="거래량2", default="")
-    chk_rate: str = Field(description="등락율설정(0:전체1:조건설정)", default="")
-    from_rate: float = Field(description="등락율1", default=0.0)
-    to_rate: float = Field(description="등락율2", default=0.0)
-    chk_amt: str = Field(description="거래대금설정(0:전체1:조건설정)", default="")
-    from_amt: str = Field(description="거래대금1", default="")
-    to_amt: str = Field(description="거래대금2", default="")
-    chk_up: str = Field(description="양봉설정(0:전체1:조건설정)", default="")
-    chk_down: str = Field(description="음봉설정(0:전체1:조건설정)", default="")
-
-
-class t1988OutBlock(BaseModel):
-    ksp_cnt: str = Field(description="코스피종목건수", default="")
-    ksd_cnt: str = Field(description="코스닥종목건수", default="")
-
-
-class t1988OutBlock1(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="표준코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: str = Field(description="현재가", default="")
-    sign: str = Field(description="부호", default="")
-    change: str = Field(description="대비", default="")
-    rate: float = Field(description="등락율", default=0.0)
-    volume: str = Field(description="누적거래량(주)", default="")
-    value: str = Field(description="누적거래대금(백만)", default="")
-    mkt_gb: str = Field(description="시장구분", default="")
-    jvolume: str = Field(description="전일동시간대거래량(주)", default="")
-
-
-# 기초자산리스트조회(t1988)
-class t1988(BaseModel):
-    inblock: t1988InBlock = Field(description="t1988InBlock")
-    outblock: t1988OutBlock = Field(description="t1988OutBlock")
-    outblock1: List[t1988OutBlock1] = Field(description="t1988OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t1988",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2101 - 선물/옵션현재가(시세)조회(t2101)>
-class t2101InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-
-
-class t2101OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    mgjv: int = Field(description="미결제량", default=0)
-    mgjvdiff: int = Field(description="미결제증감", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    uplmtprice: float = Field(description="상한가", default=0.0)
-    dnlmtprice: float = Field(description="하한가", default=0.0)
-    high52w: float = Field(description="52최고가", default=0.0)
-    low52w: float = Field(description="52최저가", default=0.0)
-    basis: float = Field(description="베이시스", default=0.0)
-    recprice: float = Field(description="기준가", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    glyl: float = Field(description="괴리율", default=0.0)
-    cbhprice: float = Field(description="CB상한가", default=0.0)
-    cblprice: float = Field(description="CB하한가", default=0.0)
-    lastmonth: str = Field(description="만기일", default="")
-    jandatecnt: int = Field(description="잔여일", default=0)
-    pricejisu: float = Field(description="종합지수", default=0.0)
-    jisusign: str = Field(description="종합지수전일대비구분", default="")
-    jisuchange: float = Field(description="종합지수전일대비", default=0.0)
-    jisudiff: float = Field(description="종합지수등락율", default=0.0)
-    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
-    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
-    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
-    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
-    listhprice: float = Field(description="상장최고가", default=0.0)
-    listlprice: float = Field(description="상장최저가", default=0.0)
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    ceta: float = Field(description="세타", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    rhox: float = Field(description="로우", default=0.0)
-    gmprice: float = Field(description="근월물현재가", default=0.0)
-    gmsign: str = Field(description="근월물전일대비구분", default="")
-    gmchange: float = Field(description="근월물전일대비", default=0.0)
-    gmdiff: float = Field(description="근월물등락율", default=0.0)
-    theorypriceg: float = Field(description="이론가", default=0.0)
-    histimpv: float = Field(description="역사적변동성", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    sbasis: float = Field(description="시장BASIS", default=0.0)
-    ibasis: float = Field(description="이론BASIS", default=0.0)
-    gmfutcode: str = Field(description="근월물종목코드", default="")
-    actprice: float = Field(description="행사가", default=0.0)
-    greeks_time: str = Field(description="거래소민감도수신시간", default="")
-    greeks_confirm: str = Field(description="거래소민감도확정여부", default="")
-    danhochk: str = Field(description="단일가호가여부", default="")
-    yeprice: float = Field(description="예상체결가", default=0.0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilychange: float = Field(description="예상체결가전일종가대비", default=0.0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-    alloc_gubun: str = Field(description="배분구분(1:배분개시2:배분해제0:미발생)", default="")
-    bjandatecnt: int = Field(description="잔여일(영업일)", default=0)
-    focode: str = Field(description="종목코드", default="")
-    dy_gubun: str = Field(description="실시간가격제한여부(0:대상아님1:적용중2:미적용중3:일시해제)", default="")
-    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
-    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
-    updnstep_gubun: str = Field(description="가격제한폭확대(0:미확대1:확대2:대상아님)", default="")
-    upstep: str = Field(description="상한적용단계", default="")
-    dnstep: str = Field(description="하한적용단계", default="")
-    uplmtprice_3rd: float = Field(description="3단계상한가", default=0.0)
-    dnlmtprice_3rd: float = Field(description="3단계하한가", default=0.0)
-
-
-# 선물/옵션현재가(시세)조회(t2101)
-class t2101(BaseModel):
-    inblock: t2101InBlock = Field(description="t2101InBlock")
-    outblock: t2101OutBlock = Field(description="t2101OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t2101",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2105 - 선물/옵션현재가호가조회(t2105)>
-class t2105InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t2105OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    stimeqrt: float = Field(description="거래량전일동시간비율", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    dcnt1: int = Field(description="매도호가건수1", default=0)
-    scnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    dcnt2: int = Field(description="매도호가건수2", default=0)
-    scnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    dcnt3: int = Field(description="매도호가건수3", default=0)
-    scnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    dcnt4: int = Field(description="매도호가건수4", default=0)
-    scnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    dcnt5: int = Field(description="매도호가건수5", default=0)
-    scnt5: int = Field(description="매수호가건수5", default=0)
-    dvol: int = Field(description="매도호가총수량", default=0)
-    svol: int = Field(description="매수호가총수량", default=0)
-    toffernum: int = Field(description="총매도호가건수", default=0)
-    tbidnum: int = Field(description="총매수호가건수", default=0)
-    time: str = Field(description="수신시간", default="")
-    shcode: str = Field(description="단축코드", default="")
-
-
-# 선물/옵션현재가호가조회(t2105)
-class t2105(BaseModel):
-    inblock: t2105InBlock = Field(description="t2105InBlock")
-    outblock: t2105OutBlock = Field(description="t2105OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t2105",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2106 - 선물/옵션현재가시세메모(t2106)>
-class t2106InBlock(BaseModel):
-    code: str = Field(description="종목코드", default="")
-    nrec: str = Field(description="건수", default="")
-
-
-class t2106InBlock1(BaseModel):
-    indx: str = Field(description="인덱스", default="")
-    gubn: str = Field(description="조건구분", default="")
-    dat1: str = Field(description="데이타1", default="")
-    dat2: str = Field(description="데이타2", default="")
-
-
-class t2106OutBlock(BaseModel):
-    nrec: str = Field(description="출력건수", default="")
-
-
-class t2106OutBlock1(BaseModel):
-    indx: str = Field(description="인덱스", default="")
-    gubn: str = Field(description="조건구분", default="")
-    vals: str = Field(description="출력값", default="")
-
-
-# 선물/옵션현재가시세메모(t2106)
-class t2106(BaseModel):
-    inblock: t2106InBlock = Field(description="t2106InBlock")
-    inblock1: t2106InBlock1 = Field(description="t2106InBlock1")
-    outblock: t2106OutBlock = Field(description="t2106OutBlock")
-    outblock1: List[t2106OutBlock1] = Field(description="t2106OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2106",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2201 - 선물옵션시간대별체결조회(t2201)>
-class t2201InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    stime: str = Field(description="시작시간", default="")
-    etime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2201OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2201OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    offerho: float = Field(description="매도호가", default=0.0)
-    bidho: float = Field(description="매수호가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    jnilopenupdn: int = Field(description="미결전일증감", default=0)
-    ibasis: float = Field(description="이론BASIS", default=0.0)
-    sbasis: float = Field(description="시장BASIS", default=0.0)
-    kasis: float = Field(description="괴리율", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-    j_openupdn: int = Field(description="미결직전증감", default=0)
-    n_msvolume: float = Field(description="누적매수체결량", default=0.0)
-    n_mdvolume: float = Field(description="누적매도체결량", default=0.0)
-    s_msvolume: float = Field(description="누적순매수체결량", default=0.0)
-    n_mschecnt: int = Field(description="누적매수체결건수", default=0)
-    n_mdchecnt: int = Field(description="누적매도체결건수", default=0)
-    s_mschecnt: int = Field(description="누적순매수체결건수", default=0)
-
-
-# 선물옵션시간대별체결조회(t2201)
-class t2201(BaseModel):
-    inblock: t2201InBlock = Field(description="t2201InBlock")
-    outblock: t2201OutBlock = Field(description="t2201OutBlock")
-    outblock1: List[t2201OutBlock1] = Field(description="t2201OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2201",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2203 - 기간별주가(t2203)>
-class t2203InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    futcheck: str = Field(description="선물최근월물", default="")
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    cnt: str = Field(description="조회요청건수", default="")
-
-
-class t2203OutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    nowfutyn: str = Field(description="최근월선물여부", default="")
-
-
-class t2203OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    openyakupdn: int = Field(description="미결증감", default=0)
-    value: float = Field(description="거래대금", default=0.0)
-
-
-# 기간별주가(t2203)
-class t2203(BaseModel):
-    inblock: t2203InBlock = Field(description="t2203InBlock")
-    outblock: t2203OutBlock = Field(description="t2203OutBlock")
-    outblock1: List[t2203OutBlock1] = Field(description="t2203OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2203",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2209 - 선물옵션틱분별체결조회챠트(t2209)>
-class t2209InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cgubun: str = Field(description="챠트구분", default="")
-    bgubun: str = Field(description="분구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t2209OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    openupdn: int = Field(description="미결증감", default=0)
-    cvolume: int = Field(description="체결수량", default=0)
-    s_mschecnt: int = Field(description="매수순간체결건수", default=0)
-    s_mdchecnt: int = Field(description="매도순간체결건수", default=0)
-    ss_mschecnt: int = Field(description="순매수순간체결건수", default=0)
-    s_mschevol: float = Field(description="매수순간체결량", default=0.0)
-    s_mdchevol: float = Field(description="매도순간체결량", default=0.0)
-    ss_mschevol: float = Field(description="순매수순간체결량", default=0.0)
-    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
-    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
-
-
-# 선물옵션틱분별체결조회챠트(t2209)
-class t2209(BaseModel):
-    inblock: t2209InBlock = Field(description="t2209InBlock")
-    outblock1: List[t2209OutBlock1] = Field(description="t2209OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2209",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2210 - 선물옵션시간대별체결조회(단일출력용)>
-class t2210InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    stime: str = Field(description="시작시간", default="")
-    etime: str = Field(description="종료시간", default="")
-
-
-class t2210OutBlock(BaseModel):
-    mdvolume: int = Field(description="매도체결수량", default=0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: int = Field(description="매수체결수량", default=0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-
-
-# 선물옵션시간대별체결조회(단일출력용)
-class t2210(BaseModel):
-    inblock: t2210InBlock = Field(description="t2210InBlock")
-    outblock: t2210OutBlock = Field(description="t2210OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t2210",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2301 - 옵션전광판(t2301)>
-class t2301InBlock(BaseModel):
-    yyyymm: str = Field(description="월물", default="")
-    gubun: str = Field(description="미니구분(M:미니G:정규)", default="")
-
-
-class t2301OutBlock(BaseModel):
-    histimpv: int = Field(description="역사적변동성", default=0)
-    jandatecnt: int = Field(description="옵션잔존일", default=0)
-    cimpv: float = Field(description="콜옵션대표IV", default=0.0)
-    pimpv: float = Field(description="풋옵션대표IV", default=0.0)
-    gmprice: float = Field(description="근월물현재가", default=0.0)
-    gmsign: str = Field(description="근월물전일대비구분", default="")
-    gmchange: float = Field(description="근월물전일대비", default=0.0)
-    gmdiff: float = Field(description="근월물등락율", default=0.0)
-    gmvolume: int = Field(description="근월물거래량", default=0)
-    gmshcode: str = Field(description="근월물선물코드", default="")
-
-
-class t2301OutBlock1(BaseModel):
-    actprice: float = Field(description="행사가", default=0.0)
-    optcode: str = Field(description="콜옵션코드", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    iv: float = Field(description="IV", default=0.0)
-    mgjv: int = Field(description="미결제약정", default=0)
-    mgjvupdn: int = Field(description="미결제약정증감", default=0)
-    offerho1: float = Field(description="매도호가", default=0.0)
-    bidho1: float = Field(description="매수호가", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    ceta: float = Field(description="쎄타", default=0.0)
-    rhox: float = Field(description="로우", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재가치", default=0.0)
-    timevl: float = Field(description="시간가치", default=0.0)
-    jvolume: int = Field(description="잔고수량", default=0)
-    parpl: int = Field(description="평가손익", default=0)
-    jngo: int = Field(description="청산가능수량", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    atmgubun: str = Field(description="ATM구분", default="")
-    jisuconv: float = Field(description="지수환산", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-
-
-class t2301OutBlock2(BaseModel):
-    actprice: float = Field(description="행사가", default=0.0)
-    optcode: str = Field(description="풋옵션코드", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    iv: float = Field(description="IV", default=0.0)
-    mgjv: int = Field(description="미결제약정", default=0)
-    mgjvupdn: int = Field(description="미결제약정증감", default=0)
-    offerho1: float = Field(description="매도호가", default=0.0)
-    bidho1: float = Field(description="매수호가", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    ceta: float = Field(description="쎄타", default=0.0)
-    rhox: float = Field(description="로우", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    impv: float = Field(description="내재가치", default=0.0)
-    timevl: float = Field(description="시간가치", default=0.0)
-    jvolume: int = Field(description="잔고수량", default=0)
-    parpl: int = Field(description="평가손익", default=0)
-    jngo: int = Field(description="청산가능수량", default=0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    atmgubun: str = Field(description="ATM구분", default="")
-    jisuconv: float = Field(description="지수환산", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-
-
-# 옵션전광판(t2301)
-class t2301(BaseModel):
-    inblock: t2301InBlock = Field(description="t2301InBlock")
-    outblock: t2301OutBlock = Field(description="t2301OutBlock")
-    outblock1: List[t2301OutBlock1] = Field(description="t2301OutBlock1")
-    outblock2: List[t2301OutBlock2] = Field(description="t2301OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for t2301",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2405 - 선물옵션호가잔량비율챠트(t2405)>
-class t2405InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    bgubun: str = Field(description="분구분", default="")
-    nmin: str = Field(description="N분", default="")
-    etime: str = Field(description="종료시간", default="")
-    hgubun: str = Field(description="호가구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2405OutBlock(BaseModel):
-    mdvolume: float = Field(description="매도체결수량", default=0.0)
-    mdchecnt: int = Field(description="매도체결건수", default=0)
-    msvolume: float = Field(description="매수체결수량", default=0.0)
-    mschecnt: int = Field(description="매수체결건수", default=0)
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2405OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    offerho1: float = Field(description="매도1호가", default=0.0)
-    bidho1: float = Field(description="매수1호가", default=0.0)
-    offerrem: int = Field(description="매도수량", default=0)
-    bidrem: int = Field(description="매수수량", default=0)
-    offercnt: int = Field(description="매도건수", default=0)
-    bidcnt: int = Field(description="매수건수", default=0)
-    c_offerrem: int = Field(description="매도증감수량", default=0)
-    c_bidrem: int = Field(description="매수증감수량", default=0)
-    c_offercnt: int = Field(description="매도증감건수", default=0)
-    c_bidcnt: int = Field(description="매수증감건수", default=0)
-    r_bidrem: float = Field(description="매수수량비율", default=0.0)
-    r_bidcnt: float = Field(description="매수건수비율", default=0.0)
-    r_sign: str = Field(description="매수비율구분", default="")
-    date: str = Field(description="일자", default="")
-
-
-# 선물옵션호가잔량비율챠트(t2405)
-class t2405(BaseModel):
-    inblock: t2405InBlock = Field(description="t2405InBlock")
-    outblock: t2405OutBlock = Field(description="t2405OutBlock")
-    outblock1: List[t2405OutBlock1] = Field(description="t2405OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2405",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2421 - 미결제약정추이(t2421)>
-class t2421InBlock(BaseModel):
-    focode: str = Field(description="종목코드", default="")
-    bdgubun: str = Field(description="분일구분", default="")
-    nmin: str = Field(description="N분", default="")
-    tcgubun: str = Field(description="당일연결구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t2421OutBlock(BaseModel):
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    openyak: int = Field(description="미결제수량", default=0)
-
-
-class t2421OutBlock1(BaseModel):
-    dt: str = Field(description="일자시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    openopenyak: int = Field(description="미결제시량", default=0)
-    highopenyak: int = Field(description="미결제고량", default=0)
-    lowopenyak: int = Field(description="미결제저량", default=0)
-    closeopenyak: int = Field(description="미결제종량", default=0)
-    openupdn: int = Field(description="미결증감", default=0)
-
-
-# 미결제약정추이(t2421)
-class t2421(BaseModel):
-    inblock: t2421InBlock = Field(description="t2421InBlock")
-    outblock: t2421OutBlock = Field(description="t2421OutBlock")
-    outblock1: List[t2421OutBlock1] = Field(description="t2421OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2421",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2541 - 상품선물투자자매매동향(실시간)(t2541)>
-class t2541InBlock(BaseModel):
-    eitem: str = Field(description="상품ID", default="")
-    market: str = Field(description="시장구분", default="")
-    upcode: str = Field(description="업종코드", default="")
-    gubun1: str = Field(description="수량구분", default="")
-    gubun2: str = Field(description="전일분구분", default="")
-    cts_time: str = Field(description="CTSTIME", default="")
-    cts_idx: int = Field(description="CTSIDX", default=0)
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t2541OutBlock(BaseModel):
-    eitem: str = Field(description="상품ID", default="")
-    sgubun: str = Field(description="시장구분", default="")
-    cts_time: str = Field(description="CTSTIME", default="")
-    tjjcode_08: str = Field(description="개인투자자코드", default="")
-    ms_08: int = Field(description="개인매수", default=0)
-    md_08: int = Field(description="개인매도", default=0)
-    rate_08: int = Field(description="개인증감", default=0)
-    svolume_08: int = Field(description="개인순매수", default=0)
-    jjcode_17: str = Field(description="외국인투자자코드", default="")
-    ms_17: int = Field(description="외국인매수", default=0)
-    md_17: int = Field(description="외국인매도", default=0)
-    rate_17: int = Field(description="외국인증감", default=0)
-    svolume_17: int = Field(description="외국인순매수", default=0)
-    jjcode_18: str = Field(description="기관계투자자코드", default="")
-    ms_18: int = Field(description="기관계매수", default=0)
-    md_18: int = Field(description="기관계매도", default=0)
-    rate_18: int = Field(description="기관계증감", default=0)
-    svolume_18: int = Field(description="기관계순매수", default=0)
-    jjcode_01: str = Field(description="증권투자자코드", default="")
-    ms_01: int = Field(description="증권매수", default=0)
-    md_01: int = Field(description="증권매도", default=0)
-    rate_01: int = Field(description="증권증감", default=0)
-    svolume_01: int = Field(description="증권순매수", default=0)
-    jjcode_03: str = Field(description="투신투자자코드", default="")
-    ms_03: int = Field(description="투신매수", default=0)
-    md_03: int = Field(description="투신매도", default=0)
-    rate_03: int = Field(description="투신증감", default=0)
-    svolume_03: int = Field(description="투신순매수", default=0)
-    jjcode_04: str = Field(description="은행투자자코드", default="")
-    ms_04: int = Field(description="은행매수", default=0)
-    md_04: int = Field(description="은행매도", default=0)
-    rate_04: int = Field(description="은행증감", default=0)
-    svolume_04: int = Field(description="은행순매수", default=0)
-    jjcode_02: str = Field(description="보험투자자코드", default="")
-    ms_02: int = Field(description="보험매수", default=0)
-    md_02: int = Field(description="보험매도", default=0)
-    rate_02: int = Field(description="보험증감", default=0)
-    svolume_02: int = Field(description="보험순매수", default=0)
-    jjcode_05: str = Field(description="종금투자자코드", default="")
-    ms_05: int = Field(description="종금매수", default=0)
-    md_05: int = Field(description="종금매도", default=0)
-    rate_05: int = Field(description="종금증감", default=0)
-    svolume_05: int = Field(description="종금순매수", default=0)
-    jjcode_06: str = Field(description="기금투자자코드", default="")
-    ms_06: int = Field(description="기금매수", default=0)
-    md_06: int = Field(description="기금매도", default=0)
-    rate_06: int = Field(description="기금증감", default=0)
-    svolume_06: int = Field(description="기금순매수", default=0)
-    jjcode_07: str = Field(description="기타투자자코드", default="")
-    ms_07: int = Field(description="기타매수", default=0)
-    md_07: int = Field(description="기타매도", default=0)
-    rate_07: int = Field(description="기타증감", default=0)
-    svolume_07: int = Field(description="기타순매수", default=0)
-    jjcode_11: str = Field(description="국가투자자코드", default="")
-    ms_11: int = Field(description="국가매수", default=0)
-    md_11: int = Field(description="국가매도", default=0)
-    rate_11: int = Field(description="국가증감", default=0)
-    svolume_11: int = Field(description="국가순매수", default=0)
-    jjcode_00: str = Field(description="사모펀드코드", default="")
-    ms_00: int = Field(description="사모펀드매수", default=0)
-    md_00: int = Field(description="사모펀드매도", default=0)
-    rate_00: int = Field(description="사모펀드증감", default=0)
-    svolume_00: int = Field(description="사모펀드순매수", default=0)
-
-
-class t2541OutBlock1(BaseModel):
-    time: str = Field(description="시간", default="")
-    sv_08: int = Field(description="개인순매수", default=0)
-    sv_17: int = Field(description="외국인순매수", default=0)
-    sv_18: int = Field(description="기관계순매수", default=0)
-    sv_01: int = Field(description="증권순매수", default=0)
-    sv_03: int = Field(description="투신순매수", default=0)
-    sv_04: int = Field(description="은행순매수", default=0)
-    sv_02: int = Field(description="보험순매수", default=0)
-    sv_05: int = Field(description="종금순매수", default=0)
-    sv_06: int = Field(description="기금순매수", default=0)
-    sv_07: int = Field(description="기타순매수", default=0)
-    sv_11: int = Field(description="국가순매수", default=0)
-    sv_00: int = Field(description="사모펀드순매수", default=0)
-
-
-# 상품선물투자자매매동향(실시간)(t2541)
-class t2541(BaseModel):
-    inblock: t2541InBlock = Field(description="t2541InBlock")
-    outblock: t2541OutBlock = Field(description="t2541OutBlock")
-    outblock1: List[t2541OutBlock1] = Field(description="t2541OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2541",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2545 - 상품선물투자자매매동향(챠트용)>
-class t2545InBlock(BaseModel):
-    eitem: str = Field(description="상품ID", default="")
-    sgubun: str = Field(description="시장구분", default="")
-    upcode: str = Field(description="업종코드", default="")
-    nmin: str = Field(description="N분", default="")
-    cnt: str = Field(description="조회건수", default="")
-    bgubun: str = Field(description="전일분", default="")
-
-
-class t2545OutBlock(BaseModel):
-    eitem: str = Field(description="상품ID", default="")
-    sgubun: str = Field(description="시장구분", default="")
-    indcode: str = Field(description="개인투자자코드", default="")
-    forcode: str = Field(description="외국인투자자코드", default="")
-    syscode: str = Field(description="기관계투자자코드", default="")
-    stocode: str = Field(description="증권투자자코드", default="")
-    invcode: str = Field(description="투신투자자코드", default="")
-    bancode: str = Field(description="은행투자자코드", default="")
-    inscode: str = Field(description="보험투자자코드", default="")
-    fincode: str = Field(description="종금투자자코드", default="")
-    moncode: str = Field(description="기금투자자코드", default="")
-    etccode: str = Field(description="기타투자자코드", default="")
-    natcode: str = Field(description="국가투자자코드", default="")
-    pefcode: str = Field(description="사모펀드투자자코드", default="")
-    jisucd: str = Field(description="기준지수코드", default="")
-    jisunm: str = Field(description="기준지수명", default="")
-
-
-class t2545OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    datetime: str = Field(description="일자시간", default="")
-    indmsvol: int = Field(description="개인순매수거래량", default=0)
-    indmsamt: float = Field(description="개인순매수거래대금", default=0.0)
-    formsvol: int = Field(description="외국인순매수거래량", default=0)
-    formsamt: float = Field(description="외국인순매수거래대금", default=0.0)
-    sysmsvol: int = Field(description="기관계순매수거래량", default=0)
-    sysmsamt: float = Field(description="기관계순매수거래대금", default=0.0)
-    stomsvol: int = Field(description="증권순매수거래량", default=0)
-    stomsamt: float = Field(description="증권순매수거래대금", default=0.0)
-    invmsvol: int = Field(description="투신순매수거래량", default=0)
-    invmsamt: float = Field(description="투신순매수거래대금", default=0.0)
-    banmsvol: int = Field(description="은행순매수거래량", default=0)
-    banmsamt: float = Field(description="은행순매수거래대금", default=0.0)
-    insmsvol: int = Field(description="보험순매수거래량", default=0)
-    insmsamt: float = Field(description="보험순매수거래대금", default=0.0)
-    finmsvol: int = Field(description="종금순매수거래량", default=0)
-    finmsamt: float = Field(description="종금순매수거래대금", default=0.0)
-    monmsvol: int = Field(description="기금순매수거래량", default=0)
-    monmsamt: float = Field(description="기금순매수거래대금", default=0.0)
-    etcmsvol: int = Field(description="기타순매수거래량", default=0)
-    etcmsamt: float = Field(description="기타순매수거래대금", default=0.0)
-    natmsvol: int = Field(description="국가순매수거래량", default=0)
-    natmsamt: float = Field(description="국가순매수거래대금", default=0.0)
-    pefmsvol: int = Field(description="사모펀드순매수거래량", default=0)
-    pefmsamt: float = Field(description="사모펀드순매수거래대금", default=0.0)
-    upclose: float = Field(description="기준지수", default=0.0)
-    upcvolume: int = Field(description="기준체결거래량", default=0)
-    upvolume: float = Field(description="기준누적거래량", default=0.0)
-    upvalue: float = Field(description="기준거래대금", default=0.0)
-
-
-# 상품선물투자자매매동향(챠트용)
-class t2545(BaseModel):
-    inblock: t2545InBlock = Field(description="t2545InBlock")
-    outblock: t2545OutBlock = Field(description="t2545OutBlock")
-    outblock1: List[t2545OutBlock1] = Field(description="t2545OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2545",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2830 - EUREXKOSPI200옵션선물현재가(시세)조회(t2830)>
-class t2830InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-
-
-class t2830OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    recprice: float = Field(description="기준가", default=0.0)
-    theoryprice: float = Field(description="이론가", default=0.0)
-    actprice: float = Field(description="행사가", default=0.0)
-    impv: float = Field(description="내재가치", default=0.0)
-    timevl: float = Field(description="시간가치", default=0.0)
-    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
-    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
-    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
-    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
-    cmeprice: float = Field(description="CME야간선물현재가", default=0.0)
-    cmesign: str = Field(description="CME야간선물전일대비구분", default="")
-    cmechange: float = Field(description="CME야간선물전일대비", default=0.0)
-    cmediff: float = Field(description="CME야간선물등락율", default=0.0)
-    cmefocode: str = Field(description="CME야간선물종목코드", default="")
-    uplmtprice: float = Field(description="정규장적용상한가", default=0.0)
-    dnlmtprice: float = Field(description="정규장적용하한가", default=0.0)
-    focode: str = Field(description="단축코드", default="")
-    yeprice: float = Field(description="예상체결가", default=0.0)
-    ysign: str = Field(description="전일대비구분", default="")
-    ychange: float = Field(description="전일대비", default=0.0)
-    ydiff: float = Field(description="등락율", default=0.0)
-    danhochk: str = Field(description="단일가호가여부", default="")
-    jnilvolume: int = Field(description="전일거래량", default=0)
-    jnilvalue: int = Field(description="전일거래대금", default=0)
-    uplmtprice_3rd: float = Field(description="정규장3단계상한가", default=0.0)
-    dnlmtprice_3rd: float = Field(description="정규장3단계하한가", default=0.0)
-
-
-# EUREXKOSPI200옵션선물현재가(시세)조회(t2830)
-class t2830(BaseModel):
-    inblock: t2830InBlock = Field(description="t2830InBlock")
-    outblock: t2830OutBlock = Field(description="t2830OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t2830",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2831 - EUREXKOSPI200옵션선물호가조회(t2831)>
-class t2831InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t2831OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    offerho1: float = Field(description="매도호가1", default=0.0)
-    bidho1: float = Field(description="매수호가1", default=0.0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    dcnt1: int = Field(description="매도호가건수1", default=0)
-    scnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: float = Field(description="매도호가2", default=0.0)
-    bidho2: float = Field(description="매수호가2", default=0.0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    dcnt2: int = Field(description="매도호가건수2", default=0)
-    scnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: float = Field(description="매도호가3", default=0.0)
-    bidho3: float = Field(description="매수호가3", default=0.0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    dcnt3: int = Field(description="매도호가건수3", default=0)
-    scnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: float = Field(description="매도호가4", default=0.0)
-    bidho4: float = Field(description="매수호가4", default=0.0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    dcnt4: int = Field(description="매도호가건수4", default=0)
-    scnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: float = Field(description="매도호가5", default=0.0)
-    bidho5: float = Field(description="매수호가5", default=0.0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    dcnt5: int = Field(description="매도호가건수5", default=0)
-    scnt5: int = Field(description="매수호가건수5", default=0)
-    dvol: int = Field(description="매도호가총수량", default=0)
-    svol: int = Field(description="매수호가총수량", default=0)
-    toffernum: int = Field(description="총매도호가건수", default=0)
-    tbidnum: int = Field(description="총매수호가건수", default=0)
-    time: str = Field(description="수신시간", default="")
-    shcode: str = Field(description="단축코드", default="")
-
-
-# EUREXKOSPI200옵션선물호가조회(t2831)
-class t2831(BaseModel):
-    inblock: t2831InBlock = Field(description="t2831InBlock")
-    outblock: t2831OutBlock = Field(description="t2831OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t2831",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2832 - EUREX야간옵션선물시간대별체결조회(t2832)>
-class t2832InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    stime: str = Field(description="시작시간", default="")
-    etime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2832OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t2832OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    offerho: float = Field(description="매도호가", default=0.0)
-    bidho: float = Field(description="매수호가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    n_msvolume: float = Field(description="누적매수체결량", default=0.0)
-    n_mdvolume: float = Field(description="누적매도체결량", default=0.0)
-    s_msvolume: float = Field(description="누적순매수체결량", default=0.0)
-    n_mschecnt: int = Field(description="누적매수체결건수", default=0)
-    n_mdchecnt: int = Field(description="누적매도체결건수", default=0)
-    s_mschecnt: int = Field(description="누적순매수체결건수", default=0)
-
-
-# EUREX야간옵션선물시간대별체결조회(t2832)
-class t2832(BaseModel):
-    inblock: t2832InBlock = Field(description="t2832InBlock")
-    outblock: t2832OutBlock = Field(description="t2832OutBlock")
-    outblock1: List[t2832OutBlock1] = Field(description="t2832OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2832",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2833 - EUREX야간옵션선물기간별추이(t2833)>
-class t2833InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    futcheck: str = Field(description="선물최근월물", default="")
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    cnt: str = Field(description="조회요청건수", default="")
-
-
-class t2833OutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    nowfutyn: str = Field(description="최근월선물여부", default="")
-
-
-class t2833OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-
-
-# EUREX야간옵션선물기간별추이(t2833)
-class t2833(BaseModel):
-    inblock: t2833InBlock = Field(description="t2833InBlock")
-    outblock: t2833OutBlock = Field(description="t2833OutBlock")
-    outblock1: List[t2833OutBlock1] = Field(description="t2833OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t2833",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t2835 - EUREX옵션선물시세전광판(t2835)>
-class t2835InBlock(BaseModel):
-    yyyymm: str = Field(description="월물(혹은주물WN)", default="")
-    gubun: str = Field(description="구분(G:원지수W:위클리)", default="")
-
-
-class t2835OutBlock(BaseModel):
-    gmprice: float = Field(description="근월물현재가", default=0.0)
-    gmsign: str = Field(description="근월물전일대비구분", default="")
-    gmchange: float = Field(description="근월물전일대비", default=0.0)
-    gmdiff: float = Field(description="근월물등락율", default=0.0)
-    gmvolume: int = Field(description="근월물거래량", default=0)
-    gmshcode: str = Field(description="근월물선물코드", default="")
-
-
-class t2835OutBlock1(BaseModel):
-    actprice: float = Field(description="행사가", default=0.0)
-    optcode: str = Field(description="콜옵션코드", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    offerho1: float = Field(description="매도호가", default=0.0)
-    bidho1: float = Field(description="매수호가", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    impv: float = Field(description="내재가치", default=0.0)
-    timevl: float = Field(description="시간가치", default=0.0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    atmgubun: str = Field(description="ATM구분", default="")
-    jisuconv: float = Field(description="지수환산", default=0.0)
-
-
-class t2835OutBlock2(BaseModel):
-    actprice: float = Field(description="행사가", default=0.0)
-    optcode: str = Field(description="풋옵션코드", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    offerho1: float = Field(description="매도호가", default=0.0)
-    bidho1: float = Field(description="매수호가", default=0.0)
-    cvolume: int = Field(description="체결량", default=0)
-    impv: float = Field(description="내재가치", default=0.0)
-    timevl: float = Field(description="시간가치", default=0.0)
-    offerrem1: int = Field(description="매도잔량", default=0)
-    bidrem1: int = Field(description="매수잔량", default=0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    atmgubun: str = Field(description="ATM구분", default="")
-    jisuconv: float = Field(description="지수환산", default=0.0)
-
-
-# EUREX옵션선물시세전광판(t2835)
-class t2835(BaseModel):
-    inblock: t2835InBlock = Field(description="t2835InBlock")
-    outblock: t2835OutBlock = Field(description="t2835OutBlock")
-    outblock1: List[t2835OutBlock1] = Field(description="t2835OutBlock1")
-    outblock2: List[t2835OutBlock2] = Field(description="t2835OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for t2835",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3102 - 뉴스본문(t3102)>
-class t3102InBlock(BaseModel):
-    sNewsno: str = Field(description="뉴스번호", default="")
-
-
-class t3102OutBlock(BaseModel):
-    sJongcode: str = Field(description="뉴스종목", default="")
-
-
-class t3102OutBlock1(BaseModel):
-    sBody: str = Field(description="뉴스본문", default="")
-
-
-class t3102OutBlock2(BaseModel):
-    sTitle: str = Field(description="뉴스타이틀", default="")
-
-
-# 뉴스본문(t3102)
-class t3102(BaseModel):
-    inblock: t3102InBlock = Field(description="t3102InBlock")
-    outblock: List[t3102OutBlock] = Field(description="t3102OutBlock")
-    outblock1: List[t3102OutBlock1] = Field(description="t3102OutBlock1")
-    outblock2: t3102OutBlock2 = Field(description="t3102OutBlock2")
-    metadata: dict = Field(
-        description="The metadata information for t3102",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3202 - 종목별증시일정(t3202)>
-class t3202InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    date: str = Field(description="조회일자", default="")
-
-
-class t3202OutBlock(BaseModel):
-    recdt: str = Field(description="기준일", default="")
-    tableid: str = Field(description="테이블아이디", default="")
-    upgu: str = Field(description="업무구분", default="")
-    custno: str = Field(description="발행체번호", default="")
-    custnm: str = Field(description="발행회사명", default="")
-    shcode: str = Field(description="종목코드", default="")
-    upunm: str = Field(description="업무명", default="")
-
-
-# 종목별증시일정(t3202)
-class t3202(BaseModel):
-    inblock: t3202InBlock = Field(description="t3202InBlock")
-    outblock: List[t3202OutBlock] = Field(description="t3202OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t3202",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3320 - FNG_요약(t3320)>
-class t3320InBlock(BaseModel):
-    gicode: str = Field(description="종목코드", default="")
-
-
-class t3320OutBlock(BaseModel):
-    upgubunnm: str = Field(description="업종구분명", default="")
-    sijangcd: str = Field(description="시장구분", default="")
-    marketnm: str = Field(description="시장구분명", default="")
-    company: str = Field(description="한글기업명", default="")
-    baddress: str = Field(description="본사주소", default="")
-    btelno: str = Field(description="본사전화번호", default="")
-    gsyyyy: str = Field(description="최근결산년도", default="")
-    gsmm: str = Field(description="결산월", default="")
-    gsym: str = Field(description="최근결산년월", default="")
-    lstprice: int = Field(description="주당액면가", default=0)
-    gstock: int = Field(description="주식수", default=0)
-    homeurl: str = Field(description="Homepage", default="")
-    grdnm: str = Field(description="그룹명", default="")
-    foreignratio: float = Field(description="외국인", default=0.0)
-    irtel: str = Field(description="주담전화", default="")
-    capital: float = Field(description="자본금", default=0.0)
-    sigavalue: float = Field(description="시가총액", default=0.0)
-    cashsis: float = Field(description="배당금", default=0.0)
-    cashrate: float = Field(description="배당수익율", default=0.0)
-    price: int = Field(description="현재가", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    notice1: str = Field(description="위험고지구분1_정리매매", default="")
-    notice2: str = Field(description="위험고지구분2_투자위험", default="")
-    notice3: str = Field(description="위험고지구분3_단기과열", default="")
-
-
-class t3320OutBlock1(BaseModel):
-    gicode: str = Field(description="기업코드", default="")
-    gsym: str = Field(description="결산년월", default="")
-    gsgb: str = Field(description="결산구분", default="")
-    per: float = Field(description="PER", default=0.0)
-    eps: float = Field(description="EPS", default=0.0)
-    pbr: float = Field(description="PBR", default=0.0)
-    roa: float = Field(description="ROA", default=0.0)
-    roe: float = Field(description="ROE", default=0.0)
-    ebitda: float = Field(description="EBITDA", default=0.0)
-    evebitda: float = Field(description="EVEBITDA", default=0.0)
-    par: float = Field(description="액면가", default=0.0)
-    sps: float = Field(description="SPS", default=0.0)
-    cps: float = Field(description="CPS", default=0.0)
-    bps: float = Field(description="BPS", default=0.0)
-    t_per: float = Field(description="T.PER", default=0.0)
-    t_eps: float = Field(description="T.EPS", default=0.0)
-    peg: float = Field(description="PEG", default=0.0)
-    t_peg: float = Field(description="T.PEG", default=0.0)
-    t_gsym: str = Field(description="최근분기년도", default="")
-
-
-# FNG_요약(t3320)
-class t3320(BaseModel):
-    inblock: t3320InBlock = Field(description="t3320InBlock")
-    outblock: t3320OutBlock = Field(description="t3320OutBlock")
-    outblock1: t3320OutBlock1 = Field(description="t3320OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t3320",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3341 - 재무순위종합(t3341)>
-class t3341InBlock(BaseModel):
-    gubun: str = Field(description="시장구분", default="")
-    gubun1: str = Field(
-        description="순위구분(1:매출액증가율2:영업이익증가율3:세전계속이익증가율4:부채비율5:유보율6:EPS7:BPS8:ROE9:PERa:PBRb:PEG)",
-        default="",
-    )
-    gubun2: str = Field(description="대비구분", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t3341OutBlock(BaseModel):
-    cnt: int = Field(description="CNT", default=0)
-    idx: int = Field(description="IDX", default=0)
-
-
-class t3341OutBlock1(BaseModel):
-    rank: int = Field(description="순위", default=0)
-    hname: str = Field(description="기업명", default="")
-    salesgrowth: int = Field(description="매출액증가율", default=0)
-    operatingincomegrowt: int = Field(description="영업이익증가율", default=0)
-    ordinaryincomegrowth: int = Field(description="경상이익증가율", default=0)
-    liabilitytoequity: int = Field(description="부채비율", default=0)
-    enterpriseratio: int = Field(description="유보율", default=0)
-    eps: int = Field(description="EPS", default=0)
-    bps: int = Field(description="BPS", default=0)
-    roe: int = Field(description="ROE", default=0)
-    shcode: str = Field(description="종목코드", default="")
-    per: float = Field(description="PER", default=0.0)
-    pbr: float = Field(description="PBR", default=0.0)
-    peg: float = Field(description="PEG", default=0.0)
-
-
-# 재무순위종합(t3341)
-class t3341(BaseModel):
-    inblock: t3341InBlock = Field(description="t3341InBlock")
-    outblock: t3341OutBlock = Field(description="t3341OutBlock")
-    outblock1: List[t3341OutBlock1] = Field(description="t3341OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t3341",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3401 - 투자의견(t3401)>
-class t3401InBlock(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    gubun1: str = Field(description="구분", default="")
-    tradno: str = Field(description="회원사코드", default="")
-    cts_date: str = Field(description="IDXDATE", default="")
-
-
-class t3401OutBlock(BaseModel):
-    cts_date: str = Field(description="IDXDATE", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="대비속성", default="")
-    change: int = Field(description="대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-
-
-class t3401OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    tradno: str = Field(description="회원사코드", default="")
-    date: str = Field(description="의견일자", default="")
-    tradname: str = Field(description="회원사명", default="")
-    bopn: str = Field(description="투자의견변경후", default="")
-    nopn: str = Field(description="투자의견변경전", default="")
-    boga: int = Field(description="목표가변경전", default=0)
-    noga: int = Field(description="목표가변경후", default=0)
-    close: int = Field(description="의견일종가", default=0)
-
-
-# 투자의견(t3401)
-class t3401(BaseModel):
-    inblock: t3401InBlock = Field(description="t3401InBlock")
-    outblock: t3401OutBlock = Field(description="t3401OutBlock")
-    outblock1: List[t3401OutBlock1] = Field(description="t3401OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t3401",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3518 - 해외실시간지수(t3518)>
-class t3518InBlock(BaseModel):
-    kind: str = Field(description="종목종류", default="")
-    symbol: str = Field(description="SYMBOL", default="")
-    cnt: int = Field(description="입력건수", default=0)
-    jgbn: str = Field(description="조회구분", default="")
-    nmin: int = Field(description="N분", default=0)
-    cts_date: str = Field(description="CTS_DATE", default="")
-    cts_time: str = Field(description="CTS_TIME", default="")
-
-
-class t3518OutBlock(BaseModel):
-    cts_date: str = Field(description="CTS_DATE", default="")
-    cts_time: str = Field(description="CTS_TIME", default="")
-
-
-class t3518OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    uprate: float = Field(description="등락율", default=0.0)
-    volume: float = Field(description="누적거래량", default=0.0)
-    bidho: float = Field(description="매수호가", default=0.0)
-    offerho: float = Field(description="매도호가", default=0.0)
-    bidrem: float = Field(description="매수잔량", default=0.0)
-    offerrem: float = Field(description="매도잔량", default=0.0)
-    kind: str = Field(description="종목종류", default="")
-    symbol: str = Field(description="SYMBOL", default="")
-    exid: str = Field(description="EXID", default="")
-    kodate: str = Field(description="한국일자", default="")
-    kotime: str = Field(description="한국시간", default="")
-
-
-# 해외실시간지수(t3518)
-class t3518(BaseModel):
-    inblock: t3518InBlock = Field(description="t3518InBlock")
-    outblock: t3518OutBlock = Field(description="t3518OutBlock")
-    outblock1: List[t3518OutBlock1] = Field(description="t3518OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t3518",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t3521 - 해외지수조회(API용)(t3521)>
-class t3521InBlock(BaseModel):
-    kind: str = Field(description="종목종류", default="")
-    symbol: str = Field(description="SYMBOL", default="")
-
-
-class t3521OutBlock(BaseModel):
-    symbol: str = Field(description="심벌", default="")
-    hname: str = Field(description="지수명", default="")
-    close: float = Field(description="지수", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    date: str = Field(description="일자", default="")
-
-
-# 해외지수조회(API용)(t3521)
-class t3521(BaseModel):
-    inblock: t3521InBlock = Field(description="t3521InBlock")
-    outblock: t3521OutBlock = Field(description="t3521OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t3521",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t4203 - 업종챠트(종합)(t4203)>
-class t4203InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분(0:틱1:분2:일3:주4:월)", default="")
-    ncnt: int = Field(description="틱개수", default=0)
-    qrycnt: int = Field(description="건수", default=0)
-    tdgb: str = Field(description="당일구분(0:전체1:당일만)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분(0:연속전체1:연속당일만2:연속전일만)", default="")
-
-
-class t4203OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    disvalue: int = Field(description="당일거래대금", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    cts_daygb: str = Field(description="연속당일구분", default="")
-
-
-class t4203OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-
-
-# 업종챠트(종합)(t4203)
-class t4203(BaseModel):
-    inblock: t4203InBlock = Field(description="t4203InBlock")
-    outblock: t4203OutBlock = Field(description="t4203OutBlock")
-    outblock1: List[t4203OutBlock1] = Field(description="t4203OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t4203",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8401 - 주식선물마스터조회(API용)(t8401)>
-class t8401InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t8401OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    basecode: str = Field(description="기초자산코드", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 주식선물마스터조회(API용)(t8401)
-class t8401(BaseModel):
-    inblock: t8401InBlock = Field(description="t8401InBlock")
-    outblock: List[t8401OutBlock] = Field(description="t8401OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8401",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8402 - 주식선물현재가조회(API용)(t8402)>
-class t8402InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-
-
-class t8402OutBlock(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    stimeqrt: float = Field(description="거래량전일동시간비율", default=0.0)
-    value: int = Field(description="거래대금", default=0)
-    mgjv: int = Field(description="미결제량", default=0)
-    mgjvdiff: int = Field(description="미결제증감", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    high52w: int = Field(description="52최고가", default=0)
-    low52w: int = Field(description="52최저가", default=0)
-    basis: float = Field(description="베이시스", default=0.0)
-    recprice: int = Field(description="기준가", default=0)
-    theoryprice: int = Field(description="이론가", default=0)
-    glyl: float = Field(description="괴리율", default=0.0)
-    lastmonth: str = Field(description="만기일", default="")
-    jandatecnt: int = Field(description="잔여일", default=0)
-    pricejisu: float = Field(description="종합지수", default=0.0)
-    jisusign: str = Field(description="종합지수전일대비구분", default="")
-    jisuchange: float = Field(description="종합지수전일대비", default=0.0)
-    jisudiff: float = Field(description="종합지수등락율", default=0.0)
-    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
-    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
-    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
-    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
-    listhprice: int = Field(description="상장최고가", default=0)
-    listlprice: int = Field(description="상장최저가", default=0)
-    delt: float = Field(description="델타", default=0.0)
-    gama: float = Field(description="감마", default=0.0)
-    ceta: float = Field(description="세타", default=0.0)
-    vega: float = Field(description="베가", default=0.0)
-    rhox: float = Field(description="로우", default=0.0)
-    gmprice: int = Field(description="근월물현재가", default=0)
-    gmsign: str = Field(description="근월물전일대비구분", default="")
-    gmchange: int = Field(description="근월물전일대비", default=0)
-    gmdiff: float = Field(description="근월물등락율", default=0.0)
-    theorypriceg: int = Field(description="이론가", default=0)
-    histimpv: float = Field(description="역사적변동성", default=0.0)
-    impv: float = Field(description="내재변동성", default=0.0)
-    sbasis: int = Field(description="시장BASIS", default=0)
-    ibasis: int = Field(description="이론BASIS", default=0)
-    gmfutcode: str = Field(description="근월물종목코드", default="")
-    actprice: int = Field(description="행사가", default=0)
-    shcode: str = Field(description="기초자산단축코드", default="")
-    basehname: str = Field(description="기초자산한글명", default="")
-    baseprice: int = Field(description="기초자산현재가", default=0)
-    basesign: str = Field(description="기초자산현재가대비구분", default="")
-    basechange: int = Field(description="기초자산현재가전일대비", default=0)
-    basediff: float = Field(description="기초자산등락률", default=0.0)
-    basevol: int = Field(description="기초자산거래량", default=0)
-    baseprevol: int = Field(description="기초자산전일거래량", default=0)
-    basebidprc: int = Field(description="기초자산매수호가", default=0)
-    baseaskprc: int = Field(description="기초자산매도호가", default=0)
-    basefornetbid: int = Field(description="기초자산외국계회원사순매수", default=0)
-    prodgrp: str = Field(description="상품군", default="")
-    mulcnt: float = Field(description="승수", default=0.0)
-    danhochk: str = Field(description="단일가호가여부", default="")
-    yeprice: int = Field(description="예상체결가", default=0)
-    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
-    jnilychange: int = Field(description="예상체결가전일종가대비", default=0)
-    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
-
-
-# 주식선물현재가조회(API용)(t8402)
-class t8402(BaseModel):
-    inblock: t8402InBlock = Field(description="t8402InBlock")
-    outblock: t8402OutBlock = Field(description="t8402OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8402",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8403 - 주식선물호가조회(API용)(t8403)>
-class t8403InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-
-
-class t8403OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    stimeqrt: float = Field(description="거래량전일동시간비율", default=0.0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    offerho1: int = Field(description="매도호가1", default=0)
-    bidho1: int = Field(description="매수호가1", default=0)
-    offerrem1: int = Field(description="매도호가수량1", default=0)
-    bidrem1: int = Field(description="매수호가수량1", default=0)
-    dcnt1: int = Field(description="매도호가건수1", default=0)
-    scnt1: int = Field(description="매수호가건수1", default=0)
-    offerho2: int = Field(description="매도호가2", default=0)
-    bidho2: int = Field(description="매수호가2", default=0)
-    offerrem2: int = Field(description="매도호가수량2", default=0)
-    bidrem2: int = Field(description="매수호가수량2", default=0)
-    dcnt2: int = Field(description="매도호가건수2", default=0)
-    scnt2: int = Field(description="매수호가건수2", default=0)
-    offerho3: int = Field(description="매도호가3", default=0)
-    bidho3: int = Field(description="매수호가3", default=0)
-    offerrem3: int = Field(description="매도호가수량3", default=0)
-    bidrem3: int = Field(description="매수호가수량3", default=0)
-    dcnt3: int = Field(description="매도호가건수3", default=0)
-    scnt3: int = Field(description="매수호가건수3", default=0)
-    offerho4: int = Field(description="매도호가4", default=0)
-    bidho4: int = Field(description="매수호가4", default=0)
-    offerrem4: int = Field(description="매도호가수량4", default=0)
-    bidrem4: int = Field(description="매수호가수량4", default=0)
-    dcnt4: int = Field(description="매도호가건수4", default=0)
-    scnt4: int = Field(description="매수호가건수4", default=0)
-    offerho5: int = Field(description="매도호가5", default=0)
-    bidho5: int = Field(description="매수호가5", default=0)
-    offerrem5: int = Field(description="매도호가수량5", default=0)
-    bidrem5: int = Field(description="매수호가수량5", default=0)
-    dcnt5: int = Field(description="매도호가건수5", default=0)
-    scnt5: int = Field(description="매수호가건수5", default=0)
-    offerho6: int = Field(description="매도호가6", default=0)
-    bidho6: int = Field(description="매수호가6", default=0)
-    offerrem6: int = Field(description="매도호가수량6", default=0)
-    bidrem6: int = Field(description="매수호가수량6", default=0)
-    dcnt6: int = Field(description="매도호가건수6", default=0)
-    scnt6: int = Field(description="매수호가건수6", default=0)
-    offerho7: int = Field(description="매도호가7", default=0)
-    bidho7: int = Field(description="매수호가7", default=0)
-    offerrem7: int = Field(description="매도호가수량7", default=0)
-    bidrem7: int = Field(description="매수호가수량7", default=0)
-    dcnt7: int = Field(description="매도호가건수7", default=0)
-    scnt7: int = Field(description="매수호가건수7", default=0)
-    offerho8: int = Field(description="매도호가8", default=0)
-    bidho8: int = Field(description="매수호가8", default=0)
-    offerrem8: int = Field(description="매도호가수량8", default=0)
-    bidrem8: int = Field(description="매수호가수량8", default=0)
-    dcnt8: int = Field(description="매도호가건수8", default=0)
-    scnt8: int = Field(description="매수호가건수8", default=0)
-    offerho9: int = Field(description="매도호가9", default=0)
-    bidho9: int = Field(description="매수호가9", default=0)
-    offerrem9: int = Field(description="매도호가수량9", default=0)
-    bidrem9: int = Field(description="매수호가수량9", default=0)
-    dcnt9: int = Field(description="매도호가건수9", default=0)
-    scnt9: int = Field(description="매수호가건수9", default=0)
-    offerho10: int = Field(description="매도호가10", default=0)
-    bidho10: int = Field(description="매수호가10", default=0)
-    offerrem10: int = Field(description="매도호가수량10", default=0)
-    bidrem10: int = Field(description="매수호가수량10", default=0)
-    dcnt10: int = Field(description="매도호가건수10", default=0)
-    scnt10: int = Field(description="매수호가건수10", default=0)
-    dvol: int = Field(description="매도호가총수량", default=0)
-    svol: int = Field(description="매수호가총수량", default=0)
-    toffernum: int = Field(description="총매도호가건수", default=0)
-    tbidnum: int = Field(description="총매수호가건수", default=0)
-    time: str = Field(description="수신시간", default="")
-    shcode: str = Field(description="단축코드", default="")
-
-
-# 주식선물호가조회(API용)(t8403)
-class t8403(BaseModel):
-    inblock: t8403InBlock = Field(description="t8403InBlock")
-    outblock: t8403OutBlock = Field(description="t8403OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8403",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8404 - 주식선물시간대별체결조회(API용)(t8404)>
-class t8404InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cvolume: int = Field(description="특이거래량", default=0)
-    stime: str = Field(description="시작시간", default="")
-    etime: str = Field(description="종료시간", default="")
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t8404OutBlock(BaseModel):
-    cts_time: str = Field(description="시간CTS", default="")
-
-
-class t8404OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    offerho: int = Field(description="매도호가", default=0)
-    bidho: int = Field(description="매수호가", default=0)
-    volume: float = Field(description="거래량", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    jnilopenupdn: int = Field(description="미결전일증감", default=0)
-    ibasis: int = Field(description="이론BASIS", default=0)
-    sbasis: int = Field(description="시장BASIS", default=0)
-    kasis: float = Field(description="괴리율", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-    j_openupdn: int = Field(description="미결직전증감", default=0)
-    n_msvolume: float = Field(description="누적매수체결량", default=0.0)
-    n_mdvolume: float = Field(description="누적매도체결량", default=0.0)
-    s_msvolume: float = Field(description="누적순매수체결량", default=0.0)
-    n_mschecnt: int = Field(description="누적매수체결건수", default=0)
-    n_mdchecnt: int = Field(description="누적매도체결건수", default=0)
-    s_mschecnt: int = Field(description="누적순매수체결건수", default=0)
-
-
-# 주식선물시간대별체결조회(API용)(t8404)
-class t8404(BaseModel):
-    inblock: t8404InBlock = Field(description="t8404InBlock")
-    outblock: t8404OutBlock = Field(description="t8404OutBlock")
-    outblock1: List[t8404OutBlock1] = Field(description="t8404OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8404",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8405 - 주식선물기간별주가(API용)(t8405)>
-class t8405InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    futcheck: str = Field(description="선물최근월물", default="")
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    cnt: str = Field(description="조회요청건수", default="")
-
-
-class t8405OutBlock(BaseModel):
-    date: str = Field(description="날짜", default="")
-    cts_code: str = Field(description="CTS종목코드", default="")
-    lastdate: str = Field(description="전종목만기일", default="")
-    nowfutyn: str = Field(description="최근월선물여부", default="")
-
-
-class t8405OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    openyakupdn: int = Field(description="미결증감", default=0)
-    value: float = Field(description="거래대금", default=0.0)
-
-
-# 주식선물기간별주가(API용)(t8405)
-class t8405(BaseModel):
-    inblock: t8405InBlock = Field(description="t8405InBlock")
-    outblock: t8405OutBlock = Field(description="t8405OutBlock")
-    outblock1: List[t8405OutBlock1] = Field(description="t8405OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8405",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8406 - 주식선물틱분별체결조회(API용)(t8406)>
-class t8406InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cgubun: str = Field(description="챠트구분", default="")
-    bgubun: str = Field(description="분구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t8406OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    volume: float = Field(description="거래량", default=0.0)
-    value: float = Field(description="거래대금", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    openupdn: int = Field(description="미결증감", default=0)
-    cvolume: int = Field(description="체결수량", default=0)
-    s_mschecnt: int = Field(description="매수순간체결건수", default=0)
-    s_mdchecnt: int = Field(description="매도순간체결건수", default=0)
-    ss_mschecnt: int = Field(description="순매수순간체결건수", default=0)
-    s_mschevol: float = Field(description="매수순간체결량", default=0.0)
-    s_mdchevol: float = Field(description="매도순간체결량", default=0.0)
-    ss_mschevol: float = Field(description="순매수순간체결량", default=0.0)
-    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
-    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
-
-
-# 주식선물틱분별체결조회(API용)(t8406)
-class t8406(BaseModel):
-    inblock: t8406InBlock = Field(description="t8406InBlock")
-    outblock1: List[t8406OutBlock1] = Field(description="t8406OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8406",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8407 - API용주식멀티현재가조회(t8407)>
-class t8407InBlock(BaseModel):
-    nrec: int = Field(description="건수", default=0)
-    shcode: str = Field(description="종목코드", default="")
-
-
-class t8407OutBlock1(BaseModel):
-    shcode: str = Field(description="종목코드", default="")
-    hname: str = Field(description="종목명", default="")
-    price: int = Field(description="현재가", default=0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: int = Field(description="전일대비", default=0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    offerho: int = Field(description="매도호가", default=0)
-    bidho: int = Field(description="매수호가", default=0)
-    cvolume: int = Field(description="체결수량", default=0)
-    chdegree: float = Field(description="체결강도", default=0.0)
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    value: int = Field(description="거래대금(백만)", default=0)
-    offerrem: int = Field(description="우선매도잔량", default=0)
-    bidrem: int = Field(description="우선매수잔량", default=0)
-    totofferrem: int = Field(description="총매도잔량", default=0)
-    totbidrem: int = Field(description="총매수잔량", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-
-
-# API용주식멀티현재가조회(t8407)
-class t8407(BaseModel):
-    inblock: t8407InBlock = Field(description="t8407InBlock")
-    outblock1: List[t8407OutBlock1] = Field(description="t8407OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8407",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8410 - API전용주식챠트(일주월년)(t8410)>
-class t8410InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분(2:일3:주4:월5:년)", default="")
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-    sujung: str = Field(description="수정주가여부(Y:적용N:비적용)", default="")
-
-
-class t8410OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: int = Field(description="전일시가", default=0)
-    jihigh: int = Field(description="전일고가", default=0)
-    jilow: int = Field(description="전일저가", default=0)
-    jiclose: int = Field(description="전일종가", default=0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: int = Field(description="당일시가", default=0)
-    dihigh: int = Field(description="당일고가", default=0)
-    dilow: int = Field(description="당일저가", default=0)
-    diclose: int = Field(description="당일종가", default=0)
-    highend: int = Field(description="상한가", default=0)
-    lowend: int = Field(description="하한가", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-    svi_uplmtprice: int = Field(description="정적VI상한가", default=0)
-    svi_dnlmtprice: int = Field(description="정적VI하한가", default=0)
-
-
-class t8410OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    jongchk: int = Field(description="수정구분", default=0)
-    rate: float = Field(description="수정비율", default=0.0)
-    pricechk: int = Field(description="수정주가반영항목", default=0)
-    ratevalue: int = Field(description="수정비율반영거래대금", default=0)
-    sign: str = Field(description="종가등락구분(1:상한2:상승3:보합4:하한5:하락주식일만사용)", default="")
-
-
-# API전용주식챠트(일주월년)(t8410)
-class t8410(BaseModel):
-    inblock: t8410InBlock = Field(description="t8410InBlock")
-    outblock: t8410OutBlock = Field(description="t8410OutBlock")
-    outblock1: List[t8410OutBlock1] = Field(description="t8410OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8410",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8411 - 주식챠트(틱/n틱)(t8411)>
-class t8411InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n틱)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8411OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: int = Field(description="전일시가", default=0)
-    jihigh: int = Field(description="전일고가", default=0)
-    jilow: int = Field(description="전일저가", default=0)
-    jiclose: int = Field(description="전일종가", default=0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: int = Field(description="당일시가", default=0)
-    dihigh: int = Field(description="당일고가", default=0)
-    dilow: int = Field(description="당일저가", default=0)
-    diclose: int = Field(description="당일종가", default=0)
-    highend: int = Field(description="상한가", default=0)
-    lowend: int = Field(description="하한가", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8411OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    jongchk: int = Field(description="수정구분", default=0)
-    rate: float = Field(description="수정비율", default=0.0)
-    pricechk: int = Field(description="수정주가반영항목", default=0)
-
-
-# 주식챠트(틱/n틱)(t8411)
-class t8411(BaseModel):
-    inblock: t8411InBlock = Field(description="t8411InBlock")
-    outblock: t8411OutBlock = Field(description="t8411OutBlock")
-    outblock1: List[t8411OutBlock1] = Field(description="t8411OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8411",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8412 - 주식챠트(N분)(t8412)>
-class t8412InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n분)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8412OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: int = Field(description="전일시가", default=0)
-    jihigh: int = Field(description="전일고가", default=0)
-    jilow: int = Field(description="전일저가", default=0)
-    jiclose: int = Field(description="전일종가", default=0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: int = Field(description="당일시가", default=0)
-    dihigh: int = Field(description="당일고가", default=0)
-    dilow: int = Field(description="당일저가", default=0)
-    diclose: int = Field(description="당일종가", default=0)
-    highend: int = Field(description="상한가", default=0)
-    lowend: int = Field(description="하한가", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8412OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: int = Field(description="시가", default=0)
-    high: int = Field(description="고가", default=0)
-    low: int = Field(description="저가", default=0)
-    close: int = Field(description="종가", default=0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    jongchk: int = Field(description="수정구분", default=0)
-    rate: float = Field(description="수정비율", default=0.0)
-    sign: str = Field(description="종가등락구분(1:상한2:상승3:보합4:하한5:하락)", default="")
-
-
-# 주식챠트(N분)(t8412)
-class t8412(BaseModel):
-    inblock: t8412InBlock = Field(description="t8412InBlock")
-    outblock: t8412OutBlock = Field(description="t8412OutBlock")
-    outblock1: List[t8412OutBlock1] = Field(description="t8412OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8412",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8414 - 선물옵션차트(틱/n틱)(t8414)>
-class t8414InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n틱)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8414OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    highend: float = Field(description="상한가", default=0.0)
-    lowend: float = Field(description="하한가", default=0.0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8414OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    openyak: int = Field(description="미결제약정", default=0)
-
-
-# 선물옵션차트(틱/n틱)(t8414)
-class t8414(BaseModel):
-    inblock: t8414InBlock = Field(description="t8414InBlock")
-    outblock: t8414OutBlock = Field(description="t8414OutBlock")
-    outblock1: List[t8414OutBlock1] = Field(description="t8414OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8414",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8415 - 선물/옵션챠트(N분)(t8415)>
-class t8415InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n분)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8415OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    highend: float = Field(description="상한가", default=0.0)
-    lowend: float = Field(description="하한가", default=0.0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8415OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    openyak: int = Field(description="미결제약정", default=0)
-
-
-# 선물/옵션챠트(N분)(t8415)
-class t8415(BaseModel):
-    inblock: t8415InBlock = Field(description="t8415InBlock")
-    outblock: t8415OutBlock = Field(description="t8415OutBlock")
-    outblock1: List[t8415OutBlock1] = Field(description="t8415OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8415",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8416 - 선물/옵션챠트(일주월)(t8416)>
-class t8416InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분(2:일3:주4:월)", default="")
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8416OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    highend: float = Field(description="상한가", default=0.0)
-    lowend: float = Field(description="하한가", default=0.0)
-    cts_date: str = Field(description="연속일자", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8416OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="누적거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-    openyak: int = Field(description="미결제약정", default=0)
-
-
-# 선물/옵션챠트(일주월)(t8416)
-class t8416(BaseModel):
-    inblock: t8416InBlock = Field(description="t8416InBlock")
-    outblock: t8416OutBlock = Field(description="t8416OutBlock")
-    outblock1: List[t8416OutBlock1] = Field(description="t8416OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8416",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8417 - 업종차트(틱/n틱)(t8417)>
-class t8417InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n틱)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8417OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8417OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-
-
-# 업종차트(틱/n틱)(t8417)
-class t8417(BaseModel):
-    inblock: t8417InBlock = Field(description="t8417InBlock")
-    outblock: t8417OutBlock = Field(description="t8417OutBlock")
-    outblock1: List[t8417OutBlock1] = Field(description="t8417OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8417",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8418 - 업종챠트(N분)(t8418)>
-class t8418InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    ncnt: int = Field(description="단위(n분)", default=0)
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
-    sdate: str = Field(description="시작일자", default="")
-    stime: str = Field(description="시작시간(현재미사용)", default="")
-    edate: str = Field(description="종료일자", default="")
-    etime: str = Field(description="종료시간(현재미사용)", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8418OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    disvalue: int = Field(description="당일거래대금", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    cts_time: str = Field(description="연속시간", default="")
-    s_time: str = Field(description="업종시작시간(HHMMSS)", default="")
-    e_time: str = Field(description="업종종료시간(HHMMSS)", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8418OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-
-
-# 업종챠트(N분)(t8418)
-class t8418(BaseModel):
-    inblock: t8418InBlock = Field(description="t8418InBlock")
-    outblock: t8418OutBlock = Field(description="t8418OutBlock")
-    outblock1: List[t8418OutBlock1] = Field(description="t8418OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8418",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8419 - 업종챠트(일주월)(t8419)>
-class t8419InBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    gubun: str = Field(description="주기구분(2:일3:주4:월)", default="")
-    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
-    sdate: str = Field(description="시작일자", default="")
-    edate: str = Field(description="종료일자", default="")
-    cts_date: str = Field(description="연속일자", default="")
-    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
-
-
-class t8419OutBlock(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    jisiga: float = Field(description="전일시가", default=0.0)
-    jihigh: float = Field(description="전일고가", default=0.0)
-    jilow: float = Field(description="전일저가", default=0.0)
-    jiclose: float = Field(description="전일종가", default=0.0)
-    jivolume: int = Field(description="전일거래량", default=0)
-    disiga: float = Field(description="당일시가", default=0.0)
-    dihigh: float = Field(description="당일고가", default=0.0)
-    dilow: float = Field(description="당일저가", default=0.0)
-    diclose: float = Field(description="당일종가", default=0.0)
-    disvalue: int = Field(description="당일거래대금", default=0)
-    cts_date: str = Field(description="연속일자", default="")
-    s_time: str = Field(description="업종시작시간", default="")
-    e_time: str = Field(description="업종종료시간", default="")
-    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
-    rec_count: int = Field(description="레코드카운트", default=0)
-
-
-class t8419OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    jdiff_vol: int = Field(description="거래량", default=0)
-    value: int = Field(description="거래대금", default=0)
-
-
-# 업종챠트(일주월)(t8419)
-class t8419(BaseModel):
-    inblock: t8419InBlock = Field(description="t8419InBlock")
-    outblock: t8419OutBlock = Field(description="t8419OutBlock")
-    outblock1: List[t8419OutBlock1] = Field(description="t8419OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8419",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8424 - 전체업종(t8424)>
-class t8424InBlock(BaseModel):
-    gubun1: str = Field(description="구분1", default="")
-
-
-class t8424OutBlock(BaseModel):
-    hname: str = Field(description="업종명", default="")
-    upcode: str = Field(description="업종코드", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 전체업종(t8424)
-class t8424(BaseModel):
-    inblock: t8424InBlock = Field(description="t8424InBlock")
-    outblock: List[t8424OutBlock] = Field(description="t8424OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8424",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8425 - 전체테마(t8425)>
-class t8425InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t8425OutBlock(BaseModel):
-    tmname: str = Field(description="테마명", default="")
-    tmcode: str = Field(description="테마코드", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 전체테마(t8425)
-class t8425(BaseModel):
-    inblock: t8425InBlock = Field(description="t8425InBlock")
-    outblock: List[t8425OutBlock] = Field(description="t8425OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8425",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8426 - 상품선물마스터조회(API용)(t8426)>
-class t8426InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t8426OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 상품선물마스터조회(API용)(t8426)
-class t8426(BaseModel):
-    inblock: t8426InBlock = Field(description="t8426InBlock")
-    outblock: List[t8426OutBlock] = Field(description="t8426OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8426",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8427 - 과거데이터시간대별조회(t8427)>
-class t8427InBlock(BaseModel):
-    fo_gbn: str = Field(description="선물옵션구분", default="")
-    yyyy: str = Field(description="조회년도", default="")
-    mm: str = Field(description="조회월", default="")
-    cp_gbn: str = Field(description="옵션콜풋구분", default="")
-    actprice: float = Field(description="옵션행사가", default=0.0)
-    focode: str = Field(description="선물옵션코드", default="")
-    dt_gbn: str = Field(description="일분구분", default="")
-    min_term: str = Field(description="분간격", default="")
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-
-
-class t8427OutBlock(BaseModel):
-    focode: str = Field(description="선물옵션코드", default="")
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-
-
-class t8427OutBlock1(BaseModel):
-    date: str = Field(description="날짜", default="")
-    time: str = Field(description="시간", default="")
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    close: float = Field(description="종가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    diff_vol: float = Field(description="거래증가율", default=0.0)
-    openyak: int = Field(description="미결수량", default=0)
-    openyakupdn: int = Field(description="미결증감", default=0)
-    value: float = Field(description="거래대금", default=0.0)
-
-
-# 과거데이터시간대별조회(t8427)
-class t8427(BaseModel):
-    inblock: t8427InBlock = Field(description="t8427InBlock")
-    outblock: t8427OutBlock = Field(description="t8427OutBlock")
-    outblock1: List[t8427OutBlock1] = Field(description="t8427OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8427",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8428 - 증시주변자금추이(t8428)>
-class t8428InBlock(BaseModel):
-    fdate: str = Field(description="from일자", default="")
-    tdate: str = Field(description="to일자", default="")
-    gubun: str = Field(description="구분", default="")
-    key_date: str = Field(description="날짜", default="")
-    upcode: str = Field(description="업종코드", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t8428OutBlock(BaseModel):
-    date: str = Field(description="날짜CTS", default="")
-    idx: int = Field(description="IDX", default=0)
-
-
-class t8428OutBlock1(BaseModel):
-    date: str = Field(description="일자", default="")
-    jisu: float = Field(description="지수", default=0.0)
-    sign: str = Field(description="대비구분", default="")
-    change: float = Field(description="대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="거래량", default=0)
-    custmoney: int = Field(description="고객예탁금_억원", default=0)
-    yecha: int = Field(description="예탁증감_억원", default=0)
-    vol: float = Field(description="회전율", default=0.0)
-    outmoney: int = Field(description="미수금_억원", default=0)
-    trjango: int = Field(description="신용잔고_억원", default=0)
-    futymoney: int = Field(description="선물예수금_억원", default=0)
-    stkmoney: int = Field(description="주식형_억원", default=0)
-    mstkmoney: int = Field(description="혼합형_억원(주식)", default=0)
-    mbndmoney: int = Field(description="혼합형_억원(채권)", default=0)
-    bndmoney: int = Field(description="채권형_억원", default=0)
-    bndsmoney: int = Field(description="필러(구.단기채권)", default=0)
-    mmfmoney: int = Field(description="MMF_억원(주식)", default=0)
-
-
-# 증시주변자금추이(t8428)
-class t8428(BaseModel):
-    inblock: t8428InBlock = Field(description="t8428InBlock")
-    outblock: t8428OutBlock = Field(description="t8428OutBlock")
-    outblock1: List[t8428OutBlock1] = Field(description="t8428OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8428",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8429 - EUREX야간옵션선물틱분별체결조회챠트(t8429)>
-class t8429InBlock(BaseModel):
-    focode: str = Field(description="단축코드", default="")
-    cgubun: str = Field(description="챠트구분", default="")
-    bgubun: str = Field(description="분구분", default="")
-    cnt: str = Field(description="조회건수", default="")
-
-
-class t8429OutBlock1(BaseModel):
-    chetime: str = Field(description="시간", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    open: float = Field(description="시가", default=0.0)
-    high: float = Field(description="고가", default=0.0)
-    low: float = Field(description="저가", default=0.0)
-    volume: float = Field(description="거래량", default=0.0)
-    cvolume: int = Field(description="체결수량", default=0)
-    s_mschecnt: int = Field(description="매수순간체결건수", default=0)
-    s_mdchecnt: int = Field(description="매도순간체결건수", default=0)
-    ss_mschecnt: int = Field(description="순매수순간체결건수", default=0)
-    s_mschevol: float = Field(description="매수순간체결량", default=0.0)
-    s_mdchevol: float = Field(description="매도순간체결량", default=0.0)
-    ss_mschevol: float = Field(description="순매수순간체결량", default=0.0)
-    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
-    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
-
-
-# EUREX야간옵션선물틱분별체결조회챠트(t8429)
-class t8429(BaseModel):
-    inblock: t8429InBlock = Field(description="t8429InBlock")
-    outblock1: List[t8429OutBlock1] = Field(description="t8429OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8429",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8430 - 주식종목조회(t8430)>
-class t8430InBlock(BaseModel):
-    gubun: str = Field(description="구분(0:전체1:코스피2:코스닥)", default="")
-
-
-class t8430OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    etfgubun: str = Field(description="ETF구분(1:ETF)", default="")
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    jnilclose: int = Field(description="전일가", default=0)
-    memedan: str = Field(description="주문수량단위", default="")
-    recprice: int = Field(description="기준가", default=0)
-    gubun: str = Field(description="구분(1:코스피2:코스닥)", default="")
-
-
-# 주식종목조회(t8430)
-class t8430(BaseModel):
-    inblock: t8430InBlock = Field(description="t8430InBlock")
-    outblock: List[t8430OutBlock] = Field(description="t8430OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8430",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8431 - ELW종목조회(t8431)>
-class t8431InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t8431OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    jnilclose: int = Field(description="전일종가", default=0)
-    recprice: int = Field(description="기준가", default=0)
-
-
-# ELW종목조회(t8431)
-class t8431(BaseModel):
-    inblock: t8431InBlock = Field(description="t8431InBlock")
-    outblock: List[t8431OutBlock] = Field(description="t8431OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8431",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8432 - 지수선물마스터조회API용(t8432)>
-class t8432InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-
-
-class t8432OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    uplmtprice: float = Field(description="상한가", default=0.0)
-    dnlmtprice: float = Field(description="하한가", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    jnilhigh: float = Field(description="전일고가", default=0.0)
-    jnillow: float = Field(description="전일저가", default=0.0)
-    recprice: float = Field(description="기준가", default=0.0)
-
-
-# 지수선물마스터조회API용(t8432)
-class t8432(BaseModel):
-    inblock: t8432InBlock = Field(description="t8432InBlock")
-    outblock: List[t8432OutBlock] = Field(description="t8432OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8432",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8433 - 지수옵션마스터조회API용(t8433)>
-class t8433InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t8433OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    hprice: float = Field(description="상한가", default=0.0)
-    lprice: float = Field(description="하한가", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    jnilhigh: float = Field(description="전일고가", default=0.0)
-    jnillow: float = Field(description="전일저가", default=0.0)
-    recprice: float = Field(description="기준가", default=0.0)
-
-
-# 지수옵션마스터조회API용(t8433)
-class t8433(BaseModel):
-    inblock: t8433InBlock = Field(description="t8433InBlock")
-    outblock: List[t8433OutBlock] = Field(description="t8433OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8433",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8434 - 선물/옵션멀티현재가조회(t8434)>
-class t8434InBlock(BaseModel):
-    qrycnt: int = Field(description="건수", default=0)
-    focode: str = Field(description="단축코드", default="")
-
-
-class t8434OutBlock1(BaseModel):
-    hname: str = Field(description="한글명", default="")
-    price: float = Field(description="현재가", default=0.0)
-    sign: str = Field(description="전일대비구분", default="")
-    change: float = Field(description="전일대비", default=0.0)
-    diff: float = Field(description="등락율", default=0.0)
-    volume: int = Field(description="누적거래량", default=0)
-    checnt: int = Field(description="체결건수", default=0)
-    focode: str = Field(description="단축코드", default="")
-
-
-# 선물/옵션멀티현재가조회(t8434)
-class t8434(BaseModel):
-    inblock: t8434InBlock = Field(description="t8434InBlock")
-    outblock1: List[t8434OutBlock1] = Field(description="t8434OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t8434",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8435 - 파생종목마스터조회API용(t8435)>
-class t8435InBlock(BaseModel):
-    gubun: str = Field(description="구분(MF/MO)", default="")
-
-
-class t8435OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    uplmtprice: float = Field(description="상한가", default=0.0)
-    dnlmtprice: float = Field(description="하한가", default=0.0)
-    jnilclose: float = Field(description="전일종가", default=0.0)
-    jnilhigh: float = Field(description="전일고가", default=0.0)
-    jnillow: float = Field(description="전일저가", default=0.0)
-    recprice: float = Field(description="기준가", default=0.0)
-
-
-# 파생종목마스터조회API용(t8435)
-class t8435(BaseModel):
-    inblock: t8435InBlock = Field(description="t8435InBlock")
-    outblock: List[t8435OutBlock] = Field(description="t8435OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8435",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8436 - 주식종목조회 API용(t8436)>
-class t8436InBlock(BaseModel):
-    gubun: str = Field(description="구분(0:전체1:코스피2:코스닥)", default="")
-
-
-class t8436OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    etfgubun: str = Field(description="ETF구분(1:ETF2:ETN)", default="")
-    uplmtprice: int = Field(description="상한가", default=0)
-    dnlmtprice: int = Field(description="하한가", default=0)
-    jnilclose: int = Field(description="전일가", default=0)
-    memedan: str = Field(description="주문수량단위", default="")
-    recprice: int = Field(description="기준가", default=0)
-    gubun: str = Field(description="구분(1:코스피2:코스닥)", default="")
-    bu12gubun: str = Field(description="증권그룹", default="")
-    spac_gubun: str = Field(description="기업인수목적회사여부(Y/N)", default="")
-    filler: str = Field(description="filler(미사용)", default="")
-
-    class Config:
-        from_attributes = True
-
-
-# 주식종목조회 API용(t8436)
-class t8436(BaseModel):
-    inblock: t8436InBlock = Field(description="t8436InBlock")
-    outblock: List[t8436OutBlock] = Field(description="t8436OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8436",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t8437 - CME/EUREX마스터조회(API용)(t8437)>
-class t8437InBlock(BaseModel):
-    gubun: str = Field(description="구분(NF/NC/NM/NO)", default="")
-
-
-class t8437OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="종목코드", default="")
-    expcode: str = Field(description="표준코드", default="")
-    tradeunit: float = Field(description="거래승수", default=0.0)
-    atmgb: str = Field(description="ATM구분(1:ATM2:ITM3:OTM)", default="")
-
-
-# CME/EUREX마스터조회(API용)(t8437)
-class t8437(BaseModel):
-    inblock: t8437InBlock = Field(description="t8437InBlock")
-    outblock: List[t8437OutBlock] = Field(description="t8437OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t8437",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9905 - 기초자산리스트조회(t9905)>
-class t9905InBlock(BaseModel):
-    dummy: str = Field(description="DUMMY", default="")
-
-
-class t9905OutBlock1(BaseModel):
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="표준코드", default="")
-    hname: str = Field(description="종목명", default="")
-
-
-# 기초자산리스트조회(t9905)
-class t9905(BaseModel):
-    inblock: t9905InBlock = Field(description="t9905InBlock")
-    outblock1: List[t9905OutBlock1] = Field(description="t9905OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t9905",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9907 - 만기월조회(t9907)>
-class t9907InBlock(BaseModel):
-    dummy: str = Field(description="DUMMY", default="")
-
-
-class t9907OutBlock1(BaseModel):
-    lastym: str = Field(description="만기월", default="")
-    lastnm: str = Field(description="만기월명", default="")
-
-
-# 만기월조회(t9907)
-class t9907(BaseModel):
-    inblock: t9907InBlock = Field(description="t9907InBlock")
-    outblock1: List[t9907OutBlock1] = Field(description="t9907OutBlock1")
-    metadata: dict = Field(
-        description="The metadata information for t9907",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9942 - ELW마스터조회API용(t9942)>
-class t9942InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t9942OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-
-
-# ELW마스터조회API용(t9942)
-class t9942(BaseModel):
-    inblock: t9942InBlock = Field(description="t9942InBlock")
-    outblock: List[t9942OutBlock] = Field(description="t9942OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t9942",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9943 - 지수선물마스터조회API용(t9943)>
-class t9943InBlock(BaseModel):
-    gubun: str = Field(description="구분", default="")
-
-
-class t9943OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    
-    class Config:
-        from_attributes = True
-
-
-# 지수선물마스터조회API용(t9943)
-class t9943(BaseModel):
-    inblock: t9943InBlock = Field(description="t9943InBlock")
-    outblock: List[t9943OutBlock] = Field(description="t9943OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t9943",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9944 - 지수옵션마스터조회API용(t9944)>
-class t9944InBlock(BaseModel):
-    dummy: str = Field(description="Dummy", default="")
-
-
-class t9944OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-
-
-# 지수옵션마스터조회API용(t9944)
-class t9944(BaseModel):
-    inblock: t9944InBlock = Field(description="t9944InBlock")
-    outblock: List[t9944OutBlock] = Field(description="t9944OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t9944",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-# region <t9945 - 주식마스터조회API용-종목명40bytes(t9945)>
-class t9945InBlock(BaseModel):
-    gubun: str = Field(description="구분(KSP:1KSD:2)", default="")
-
-
-class t9945OutBlock(BaseModel):
-    hname: str = Field(description="종목명", default="")
-    shcode: str = Field(description="단축코드", default="")
-    expcode: str = Field(description="확장코드", default="")
-    etfchk: str = Field(description="ETF구분", default="")
-    filler: str = Field(description="filler", default="")
-
-
-# 주식마스터조회API용-종목명40bytes(t9945)
-class t9945(BaseModel):
-    inblock: t9945InBlock = Field(description="t9945InBlock")
-    outblock: List[t9945OutBlock] = Field(description="t9945OutBlock")
-    metadata: dict = Field(
-        description="The metadata information for t9945",
-        default_factory=lambda: dict(),
-    )
-
-
-# endregion
-
-
-QUERY_MAP = {
-    "BMT": BMT,  # 시간대별투자자매매추이(BMT)
-    "C01": C01,  # 선물주문체결
-    "CD0": CD0,  # 상품선물실시간상하한가(D0)
-    "CDPCQ04700": CDPCQ04700,  # 계좌 거래내역
-    "CEXAQ21100": CEXAQ21100,  # 유렉스 주문체결내역조회
-    "CEXAQ21200": CEXAQ21200,  # 유렉스 주문가능 수량/금액 조회
-    "CEXAQ31100": CEXAQ31100,  # 유렉스 야간장잔고및 평가현황
-    "CEXAQ31200": CEXAQ31200,  # 유렉스 예탁금 및 통합잔고조회
-    "CEXAQ44200": CEXAQ44200,  # EUREX 야간옵션 기간주문체결조회
-    "CEXAT11100": CEXAT11100,  # 유렉스 매수/매도주문
-    "CEXAT11200": CEXAT11200,  # 유렉스 정정주문
-    "CEXAT11300": CEXAT11300,  # 유렉스 취소주문
-    "CFOAQ00600": CFOAQ00600,  # 선물옵션 계좌주문체결내역조회
-    "CFOAQ10100": CFOAQ10100,  # 선물옵션 주문가능수량조회
-    "CFOAT00100": CFOAT00100,  # 선물옵션 정상주문
-    "CFOAT00200": CFOAT00200,  # 선물옵션 정정주문
-    "CFOAT00300": CFOAT00300,  # 선물옵션 취소주문
-    "CFOBQ10500": CFOBQ10500,  # 선물옵션 계좌예탁금증거금조회
-    "CFOBQ10800": CFOBQ10800,  # 선물옵션 옵션매도시 주문증거금조회
-    "CFOEQ11100": CFOEQ11100,  # 선물옵션가정산예탁금상세
-    "CFOEQ82600": CFOEQ82600,  # 선물옵션 일별 계좌손익내역
-    "CFOFQ02400": CFOFQ02400,  # 계좌 미결제 약정현황(평균가)
-    "CIDBQ01400": CIDBQ01400,  # 해외선물 체결내역개별 조회
-    "CIDBQ01500": CIDBQ01500,  # 해외선물 미결제 잔고내역
-    "CIDBQ01800": CIDBQ01800,  # 해외선물 주문체결내역 조회
-    "CIDBQ02400": CIDBQ02400,  # 해외선물 주문체결내역 상세 조회
-    "CIDBQ03000": CIDBQ03000,  # 해외선물 예수금/잔고현황
-    "CIDBQ05300": CIDBQ05300,  # 해외선물 계좌예탁자산조회
-    "CIDBT00100": CIDBT00100,  # 해외선물신규주문
-    "CIDBT00900": CIDBT00900,  # 해외선물정정주문
-    "CIDBT01000": CIDBT01000,  # 해외선물취소주문
-    "CIDEQ00800": CIDEQ00800,  # 일자별 미결제 잔고내역
-    "CLNAQ00100": CLNAQ00100,  # 예탁담보융자가능종목현황조회
-    "CSPAQ00600": CSPAQ00600,  # 계좌별신용한도조회
-    "CSPAQ12200": CSPAQ12200,  # 현물계좌예수금 주문가능금액 총평가 조회
-    "CSPAQ12300": CSPAQ12300,  # BEP단가조회
-    "CSPAQ13700": CSPAQ13700,  # 현물계좌주문체결내역조회
-    "CSPAQ22200": CSPAQ22200,  # 현물계좌예수금 주문가능금액 총평가2
-    "CSPAT00600": CSPAT00600,  # 현물주문
-    "CSPAT00700": CSPAT00700,  # 현물정정주문
-    "CSPAT00800": CSPAT00800,  # 현물취소주문
-    "CSPBQ00200": CSPBQ00200,  # 현물계좌증거금률별주문가능수량조회
-    "CUR": CUR,  # 현물정보 USD 실시간(CUR)
-    "ChartExcel": ChartExcel,  # 챠트엑셀데이터조회
-    "ChartIndex": ChartIndex,  # 챠트지표데이터조회
-    "DH1": DH1,  # KOSPI시간외단일가호가잔량(DH1)
-    "DHA": DHA,  # KOSDAQ시간외단일가호가잔량(DHA)
-    "DK3": DK3,  # KOSDAQ시간외단일가체결(DK3)
-    "DS3": DS3,  # KOSPI시간외단일가체결(DS3)
-    "DVI": DVI,  # 시간외단일가VI발동해제(DVI)
-    "EC0": EC0,  # EUREX연계KP200지수옵션선물체결(EC0)
-    "EH0": EH0,  # EUREX연계KP200지수옵션선물호가(EH0)
-    "ESN": ESN,  # 뉴ELW투자지표민감도(ESN)
-    "EU0": EU0,  # EUX접수
-    "EU1": EU1,  # EUX체결
-    "EU2": EU2,  # EUX확인
-    "FC0": FC0,  # KOSPI200선물체결(C0)
-    "FD0": FD0,  # KOSPI200선물실시간상하한가(D0)
-    "FH0": FH0,  # KOSPI200선물호가(H0)
-    "FOCCQ33600": FOCCQ33600,  # 주식계좌 기간별수익률 상세
-    "FOCCQ33700": FOCCQ33700,  # 선물옵션 기간별 계좌 수익률 현황
-    "FX0": FX0,  # KOSPI200선물가격제한폭확대(X0)
-    "H01": H01,  # 선물주문정정취소
-    "JC0": JC0,  # 주식선물체결(JC0)
-    "JD0": JD0,  # 주식선물실시간상하한가(JD0)
-    "JH0": JH0,  # 주식선물호가(JH0)
-    "JIF": JIF,  # 장운영정보(JIF)
-    "JX0": JX0,  # 주식선물가격제한폭확대(JX0)
-    "MK2": MK2,  # US지수(MK2)
-    "MMDAQ91200": MMDAQ91200,  # 파생상품증거금율조회
-    "NWS": NWS,  # 실시간 뉴스 제목 패킷(NWS)
-    "O01": O01,  # 선물접수
-    "OC0": OC0,  # KOSPI200옵션체결(C0)
-    "OD0": OD0,  # KOSPI200옵션실시간상하한가(D0)
-    "OH0": OH0,  # KOSPI200옵션호가(H0)
-    "OMG": OMG,  # KOSPI200옵션민감도(MG)
-    "OVC": OVC,  # 해외선물 현재가체결(OVC)
-    "OVH": OVH,  # 해외선물 호가(OVH)
-    "OX0": OX0,  # KOSPI200옵션가격제한폭확대(X0)
-    "SC0": SC0,  # 주식주문접수
-    "SC1": SC1,  # 주식주문체결
-    "SC2": SC2,  # 주식주문정정
-    "SC3": SC3,  # 주식주문취소
-    "SC4": SC4,  # 주식주문거부
-    "SHC": SHC,  # 상/하한가근접진입(SHC)
-    "SHD": SHD,  # 상/하한가근접이탈(SHD)
-    "SHI": SHI,  # 상/하한가진입(SHI)
-    "SHO": SHO,  # 상/하한가이탈(SHO)
-    "TC1": TC1,  # 해외선물주문
-    "TC2": TC2,  # 해외선물응답
-    "TC3": TC3,  # 해외선물체결
-    "WOC": WOC,  # 해외옵션 현재가체결(WOC)
-    "WOH": WOH,  # 해외옵션 호가(WOH)
-    "YC3": YC3,  # 상품선물예상체결(YC3)
-    "YFC": YFC,  # 지수선물예상체결(YFC)
-    "YJC": YJC,  # 주식선물예상체결(YJC)
-    "YK3": YK3,  # KOSDAQ예상체결(YK3)
-    "YOC": YOC,  # 지수옵션예상체결(YOC)
-    "YS3": YS3,  # KOSPI예상체결(YS3)
-    "o3101": o3101,  # 해외선물마스터조회(o3101)-API용
-    "o3103": o3103,  # 해외선물차트(분)(o3103)-API용
-    "o3104": o3104,  # 해외선물일별체결조회(o3104)-API용
-    "o3105": o3105,  # 해외선물현재가(종목정보)조회(o3105)-API용
-    "o3106": o3106,  # 해외선물현재가호가조회(o3106)-API용
-    "o3107": o3107,  # 해외선물관심종목조회(o3107)-API용
-    "o3108": o3108,  # 해외선물차트(일주월)(o3108)-API용
-    "o3116": o3116,  # 해외선물시간대별(Tick)체결(o3116)-API용
-    "o3117": o3117,  # 해외선물차트용NTick(o3117)-API용
-    "o3121": o3121,  # 해외선물옵션마스터조회(o3121)-API용
-    "o3123": o3123,  # 해외선물옵션차트(분)(o3123)-API용
-    "o3125": o3125,  # 해외선물옵션현재가(종목정보)조회(o3125)-API용
-    "o3126": o3126,  # 해외선물옵션현재가호가조회(o3126)-API용
-    "o3127": o3127,  # 해외선물옵션관심종목조회(o3127)-API용
-    "o3128": o3128,  # 해외선물옵션차트일주월(o3128)-API용
-    "o3136": o3136,  # 해외선물옵션시간대별(Tick)체결(o3136)-API용
-    "o3137": o3137,  # 해외선물옵션차트용NTick(o3137)-API용
-    "o3139": o3139,  # 해외선물옵션차트용NTick(고정형)(o3139)-API용
-    "t0150": t0150,  # 주식당일매매일지/수수료(t0150)
-    "t0151": t0151,  # 주식당일매매일지/수수료(전일)(t0151)
-    "t0167": t0167,  # 서버시간조회(t0167)
-    "t0424": t0424,  # 주식잔고2(t0424)
-    "t0425": t0425,  # 주식체결/미체결(t0425)
-    "t0434": t0434,  # 선물/옵션체결/미체결(t0434)
-    "t0441": t0441,  # 선물/옵션잔고평가(이동평균)(t0441)
-    "t1101": t1101,  # 주식현재가호가조회(t1101)
-    "t1102": t1102,  # 주식현재가(시세)조회(t1102)
-    "t1104": t1104,  # 주식현재가시세메모(t1104)
-    "t1105": t1105,  # 주식피못/디마크조회(t1105)
-    "t1109": t1109,  # 시간외체결량(t1109)
-    "t1301": t1301,  # 주식시간대별체결조회(t1301)
-    "t1302": t1302,  # 주식분별주가조회(t1302)
-    "t1305": t1305,  # 기간별주가(t1305)
-    "t1308": t1308,  # 주식시간대별체결조회챠트(t1308)
-    "t1310": t1310,  # 주식당일전일분틱조회(t1310)
-    "t1403": t1403,  # 신규상장종목조회(t1403)
-    "t1404": t1404,  # 관리/불성실/투자유의조회(t1404)
-    "t1405": t1405,  # 투자경고/매매정지/정리매매조회(t1405)
-    "t1410": t1410,  # 초저유동성조회(t1410)
-    "t1411": t1411,  # 증거금율별종목조회(t1411)
-    "t1422": t1422,  # 상/하한(t1422)
-    "t1427": t1427,  # 상/하한가직전(t1427)
-    "t1441": t1441,  # 등락율상위(t1441)
-    "t1442": t1442,  # 신고/신저가(t1442)
-    "t1444": t1444,  # 시가총액상위(t1444)
-    "t1449": t1449,  # 가격대별매매비중조회(t1449)
-    "t1452": t1452,  # 거래량상위(t1452)
-    "t1463": t1463,  # 거래대금상위(t1463)
-    "t1466": t1466,  # 전일동시간대비거래급증(t1466)
-    "t1471": t1471,  # 시간대별호가잔량추이(t1471)
-    "t1475": t1475,  # 체결강도추이(t1475)
-    "t1481": t1481,  # 시간외등락율상위(t1481)
-    "t1482": t1482,  # 시간외거래량상위(t1482)
-    "t1485": t1485,  # 예상지수(t1485)
-    "t1486": t1486,  # 시간별예상체결가(t1486)
-    "t1488": t1488,  # 예상체결가등락율상위조회(t1488)
-    "t1489": t1489,  # 예상체결량상위조회(t1489)
-    "t1492": t1492,  # 단일가예상등락율상위(t1492)
-    "t1511": t1511,  # 업종현재가(t1511)
-    "t1514": t1514,  # 업종기간별추이(t1514)
-    "t1516": t1516,  # 업종별종목시세(t1516)
-    "t1531": t1531,  # 테마별종목(t1531)
-    "t1532": t1532,  # 종목별테마(t1532)
-    "t1533": t1533,  # 특이테마(t1533)
-    "t1537": t1537,  # 테마종목별시세조회(t1537)
-    "t1601": t1601,  # 투자자별종합(t1601)
-    "t1602": t1602,  # 시간대별투자자매매추이(t1602)
-    "t1603": t1603,  # 시간대별투자자매매추이상세(t1603)
-    "t1615": t1615,  # 투자자매매종합1(t1615)
-    "t1617": t1617,  # 투자자매매종합2(t1617)
-    "t1621": t1621,  # 업종별분별투자자매매동향(챠트용)
-    "t1631": t1631,  # 프로그램매매종합조회(t1631)
-    "t1632": t1632,  # 시간대별프로그램매매추이(t1632)
-    "t1633": t1633,  # 기간별프로그램매매추이(t1633)
-    "t1636": t1636,  # 종목별프로그램매매동향(t1636)
-    "t1637": t1637,  # 종목별프로그램매매추이(t1637)
-    "t1638": t1638,  # 종목별잔량/사전공시(t1638)
-    "t1640": t1640,  # 프로그램매매종합조회(미니)(t1640)
-    "t1662": t1662,  # 시간대별프로그램매매추이(차트)(t1662)
-    "t1664": t1664,  # 투자자매매종합(챠트)
-    "t1665": t1665,  # 기간별투자자매매추이(챠트)
-    "t1702": t1702,  # 외인기관종목별동향(t1702)
-    "t1716": t1716,  # 외인기관종목별동향(t1716)
-    "t1717": t1717,  # 외인기관종목별동향(t1717)
-    "t1752": t1752,  # 종목별상위회원사(t1752)
-    "t1764": t1764,  # 회원사리스트(t1764)
-    "t1771": t1771,  # 종목별회원사추이(t1771)
-    "t1809": t1809,  # 신호조회(t1809)
-    "t1825": t1825,  # 종목Q클릭검색(씽큐스마트)(t1825)
-    "t1826": t1826,  # 종목Q클릭검색리스트조회(씽큐스마트)(t1826)
-    "t1857": t1857,  # e종목검색(신버전API용)
-    "t1866": t1866,  # 서버저장조건리스트조회(API)(t1866)
-    "t1901": t1901,  # ETF현재가(시세)조회(t1901)
-    "t1902": t1902,  # ETF시간별추이(t1902)
-    "t1903": t1903,  # ETF일별추이(t1903)
-    "t1904": t1904,  # ETF구성종목조회(t1904)
-    "t1906": t1906,  # ETFLP호가(t1906)
-    "t1921": t1921,  # 신용거래동향(t1921)
-    "t1926": t1926,  # 종목별신용정보(t1926)
-    "t1927": t1927,  # 공매도일별추이(t1927)
-    "t1941": t1941,  # 종목별대차거래일간추이(t1941)
-    "t1950": t1950,  # ELW현재가(시세)조회(t1950)
-    "t1951": t1951,  # ELW시간대별체결조회(t1951)
-    "t1954": t1954,  # ELW일별주가(t1954)
-    "t1956": t1956,  # ELW현재가(확정지급액)조회(t1956)
-    "t1958": t1958,  # ELW종목비교(t1958)
-    "t1959": t1959,  # LP대상종목정보조회(t1959)
-    "t1960": t1960,  # ELW등락율상위(t1960)
-    "t1961": t1961,  # ELW거래량상위(t1961)
-    "t1964": t1964,  # ELW전광판(t1964)
-    "t1966": t1966,  # ELW거래대금상위(t1966)
-    "t1969": t1969,  # ELW지표검색(t1969)
-    "t1971": t1971,  # ELW현재가호가조회(t1971)
-    "t1972": t1972,  # ELW현재가(거래원)조회(t1972)
-    "t1973": t1973,  # ELW시간대별예상체결조회(t1973)
-    "t1974": t1974,  # ELW기초자산동일종목(t1974)
-    "t1988": t1988,  # 기초자산리스트조회(t1988)
-    "t2101": t2101,  # 선물/옵션현재가(시세)조회(t2101)
-    "t2105": t2105,  # 선물/옵션현재가호가조회(t2105)
-    "t2106": t2106,  # 선물/옵션현재가시세메모(t2106)
-    "t2201": t2201,  # 선물옵션시간대별체결조회(t2201)
-    "t2203": t2203,  # 기간별주가(t2203)
-    "t2209": t2209,  # 선물옵션틱분별체결조회챠트(t2209)
-    "t2210": t2210,  # 선물옵션시간대별체결조회(단일출력용)
-    "t2301": t2301,  # 옵션전광판(t2301)
-    "t2405": t2405,  # 선물옵션호가잔량비율챠트(t2405)
-    "t2421": t2421,  # 미결제약정추이(t2421)
-    "t2541": t2541,  # 상품선물투자자매매동향(실시간)(t2541)
-    "t2545": t2545,  # 상품선물투자자매매동향(챠트용)
-    "t2830": t2830,  # EUREXKOSPI200옵션선물현재가(시세)조회(t2830)
-    "t2831": t2831,  # EUREXKOSPI200옵션선물호가조회(t2831)
-    "t2832": t2832,  # EUREX야간옵션선물시간대별체결조회(t2832)
-    "t2833": t2833,  # EUREX야간옵션선물기간별추이(t2833)
-    "t2835": t2835,  # EUREX옵션선물시세전광판(t2835)
-    "t3102": t3102,  # 뉴스본문(t3102)
-    "t3202": t3202,  # 종목별증시일정(t3202)
-    "t3320": t3320,  # FNG_요약(t3320)
-    "t3341": t3341,  # 재무순위종합(t3341)
-    "t3401": t3401,  # 투자의견(t3401)
-    "t3518": t3518,  # 해외실시간지수(t3518)
-    "t3521": t3521,  # 해외지수조회(API용)(t3521)
-    "t4203": t4203,  # 업종챠트(종합)(t4203)
-    "t8401": t8401,  # 주식선물마스터조회(API용)(t8401)
-    "t8402": t8402,  # 주식선물현재가조회(API용)(t8402)
-    "t8403": t8403,  # 주식선물호가조회(API용)(t8403)
-    "t8404": t8404,  # 주식선물시간대별체결조회(API용)(t8404)
-    "t8405": t8405,  # 주식선물기간별주가(API용)(t8405)
-    "t8406": t8406,  # 주식선물틱분별체결조회(API용)(t8406)
-    "t8407": t8407,  # API용주식멀티현재가조회(t8407)
-    "t8410": t8410,  # API전용주식챠트(일주월년)(t8410)
-    "t8411": t8411,  # 주식챠트(틱/n틱)(t8411)
-    "t8412": t8412,  # 주식챠트(N분)(t8412)
-    "t8414": t8414,  # 선물옵션차트(틱/n틱)(t8414)
-    "t8415": t8415,  # 선물/옵션챠트(N분)(t8415)
-    "t8416": t8416,  # 선물/옵션챠트(일주월)(t8416)
-    "t8417": t8417,  # 업종차트(틱/n틱)(t8417)
-    "t8418": t8418,  # 업종챠트(N분)(t8418)
-    "t8419": t8419,  # 업종챠트(일주월)(t8419)
-    "t8424": t8424,  # 전체업종(t8424)
-    "t8425": t8425,  # 전체테마(t8425)
-    "t8426": t8426,  # 상품선물마스터조회(API용)(t8426)
-    "t8427": t8427,  # 과거데이터시간대별조회(t8427)
-    "t8428": t8428,  # 증시주변자금추이(t8428)
-    "t8429": t8429,  # EUREX야간옵션선물틱분별체결조회챠트(t8429)
-    "t8430": t8430,  # 주식종목조회(t8430)
-    "t8431": t8431,  # ELW종목조회(t8431)
-    "t8432": t8432,  # 지수선물마스터조회API용(t8432)
-    "t8433": t8433,  # 지수옵션마스터조회API용(t8433)
-    "t8434": t8434,  # 선물/옵션멀티현재가조회(t8434)
-    "t8435": t8435,  # 파생종목마스터조회API용(t8435)
-    "t8436": t8436,  # 주식종목조회 API용(t8436)
-    "t8437": t8437,  # CME/EUREX마스터조회(API용)(t8437)
-    "t9905": t9905,  # 기초자산리스트조회(t9905)
-    "t9907": t9907,  # 만기월조회(t9907)
-    "t9942": t9942,  # ELW마스터조회API용(t9942)
-    "t9943": t9943,  # 지수선물마스터조회API용(t9943)
-    "t9944": t9944,  # 지수옵션마스터조회API용(t9944)
-    "t9945": t9945,  # 주식마스터조회API용-종목명40bytes(t9945)
-}
-
-QUERY_OUTBLOCK_MAP = {
-    "BMT": {"BMTOutBlock"},
-    "C01": {"C01OutBlock"},
-    "CD0": {"CD0OutBlock"},
-    "CDPCQ04700": {
-        "CDPCQ04700OutBlock1",
-        "CDPCQ04700OutBlock2",
-        "CDPCQ04700OutBlock3",
-        "CDPCQ04700OutBlock4",
-        "CDPCQ04700OutBlock5",
-    },
-    "CEXAQ21100": {
-        "CEXAQ21100OutBlock1",
-        "CEXAQ21100OutBlock2",
-        "CEXAQ21100OutBlock3",
-    },
-    "CEXAQ21200": {"CEXAQ21200OutBlock2", "CEXAQ21200OutBlock1"},
-    "CEXAQ31100": {
-        "CEXAQ31100OutBlock1",
-        "CEXAQ31100OutBlock2",
-        "CEXAQ31100OutBlock3",
-    },
-    "CEXAQ31200": {
-        "CEXAQ31200OutBlock1",
-        "CEXAQ31200OutBlock2",
-        "CEXAQ31200OutBlock3",
-    },
-    "CEXAQ44200": {
-        "CEXAQ44200OutBlock1",
-        "CEXAQ44200OutBlock2",
-        "CEXAQ44200OutBlock3",
-    },
-    "CEXAT11100": {"CEXAT11100OutBlock2", "CEXAT11100OutBlock1"},
-    "CEXAT11200": {"CEXAT11200OutBlock2", "CEXAT11200OutBlock1"},
-    "CEXAT11300": {"CEXAT11300OutBlock1", "CEXAT11300OutBlock2"},
-    "CFOAQ00600": {
-        "CFOAQ00600OutBlock1",
-        "CFOAQ00600OutBlock2",
-        "CFOAQ00600OutBlock3",
-    },
-    "CFOAQ10100": {"CFOAQ10100OutBlock2", "CFOAQ10100OutBlock1"},
-    "CFOAT00100": {"CFOAT00100OutBlock2", "CFOAT00100OutBlock1"},
-    "CFOAT00200": {"CFOAT00200OutBlock1", "CFOAT00200OutBlock2"},
-    "CFOAT00300": {"CFOAT00300OutBlock1", "CFOAT00300OutBlock2"},
-    "CFOBQ10500": {
-        "CFOBQ10500OutBlock1",
-        "CFOBQ10500OutBlock2",
-        "CFOBQ10500OutBlock3",
-    },
-    "CFOBQ10800": {"CFOBQ10800OutBlock2", "CFOBQ10800OutBlock1"},
-    "CFOEQ11100": {"CFOEQ11100OutBlock2", "CFOEQ11100OutBlock1"},
-    "CFOEQ82600": {
-        "CFOEQ82600OutBlock1",
-        "CFOEQ82600OutBlock2",
-        "CFOEQ82600OutBlock3",
-    },
-    "CFOFQ02400": {
-        "CFOFQ02400OutBlock1",
-        "CFOFQ02400OutBlock2",
-        "CFOFQ02400OutBlock3",
-        "CFOFQ02400OutBlock4",
-    },
-    "CIDBQ01400": {"CIDBQ01400OutBlock2", "CIDBQ01400OutBlock1"},
-    "CIDBQ01500": {"CIDBQ01500OutBlock2", "CIDBQ01500OutBlock1"},
-    "CIDBQ01800": {"CIDBQ01800OutBlock1", "CIDBQ01800OutBlock2"},
-    "CIDBQ02400": {"CIDBQ02400OutBlock1", "CIDBQ02400OutBlock2"},
-    "CIDBQ03000": {"CIDBQ03000OutBlock2", "CIDBQ03000OutBlock1"},
-    "CIDBQ05300": {
-        "CIDBQ05300OutBlock1",
-        "CIDBQ05300OutBlock2",
-        "CIDBQ05300OutBlock3",
-    },
-    "CIDBT00100": {"CIDBT00100OutBlock1", "CIDBT00100OutBlock2"},
-    "CIDBT00900": {"CIDBT00900OutBlock2", "CIDBT00900OutBlock1"},
-    "CIDBT01000": {"CIDBT01000OutBlock2", "CIDBT01000OutBlock1"},
-    "CIDEQ00800": {"CIDEQ00800OutBlock2", "CIDEQ00800OutBlock1"},
-    "CLNAQ00100": {
-        "CLNAQ00100OutBlock1",
-        "CLNAQ00100OutBlock2",
-        "CLNAQ00100OutBlock3",
-    },
-    "CSPAQ00600": {"CSPAQ00600OutBlock1", "CSPAQ00600OutBlock2"},
-    "CSPAQ12200": {"CSPAQ12200OutBlock1", "CSPAQ12200OutBlock2"},
-    "CSPAQ12300": {
-        "CSPAQ12300OutBlock1",
-        "CSPAQ12300OutBlock2",
-        "CSPAQ12300OutBlock3",
-    },
-    "CSPAQ13700": {
-        "CSPAQ13700OutBlock1",
-        "CSPAQ13700OutBlock2",
-        "CSPAQ13700OutBlock3",
-    },
-    "CSPAQ22200": {"CSPAQ22200OutBlock1", "CSPAQ22200OutBlock2"},
-    "CSPAT00600": {"CSPAT00600OutBlock2", "CSPAT00600OutBlock1"},
-    "CSPAT00700": {"CSPAT00700OutBlock2", "CSPAT00700OutBlock1"},
-    "CSPAT00800": {"CSPAT00800OutBlock1", "CSPAT00800OutBlock2"},
-    "CSPBQ00200": {"CSPBQ00200OutBlock2", "CSPBQ00200OutBlock1"},
-    "CUR": {"CUROutBlock"},
-    "ChartExcel": {"ChartExcelOutBlock", "ChartExcelOutBlock1"},
-    "ChartIndex": {"ChartIndexOutBlock", "ChartIndexOutBlock1"},
-    "DH1": {"DH1OutBlock"},
-    "DHA": {"DHAOutBlock"},
-    "DK3": {"DK3OutBlock"},
-    "DS3": {"DS3OutBlock"},
-    "DVI": {"DVIOutBlock"},
-    "EC0": {"EC0OutBlock"},
-    "EH0": {"EH0OutBlock"},
-    "ESN": {"ESNOutBlock"},
-    "EU0": {"EU0OutBlock"},
-    "EU1": {"EU1OutBlock"},
-    "EU2": {"EU2OutBlock"},
-    "FC0": {"FC0OutBlock"},
-    "FD0": {"FD0OutBlock"},
-    "FH0": {"FH0OutBlock"},
-    "FOCCQ33600": {
-        "FOCCQ33600OutBlock1",
-        "FOCCQ33600OutBlock2",
-        "FOCCQ33600OutBlock3",
-    },
-    "FOCCQ33700": {
-        "FOCCQ33700OutBlock1",
-        "FOCCQ33700OutBlock2",
-        "FOCCQ33700OutBlock3",
-    },
-    "FX0": {"FX0OutBlock"},
-    "H01": {"H01OutBlock"},
-    "JC0": {"JC0OutBlock"},
-    "JD0": {"JD0OutBlock"},
-    "JH0": {"JH0OutBlock"},
-    "JIF": {"JIFOutBlock"},
-    "JX0": {"JX0OutBlock"},
-    "MK2": {"MK2OutBlock"},
-    "MMDAQ91200": {"MMDAQ91200OutBlock2", "MMDAQ91200OutBlock1"},
-    "NWS": {"NWSOutBlock"},
-    "O01": {"O01OutBlock"},
-    "OC0": {"OC0OutBlock"},
-    "OD0": {"OD0OutBlock"},
-    "OH0": {"OH0OutBlock"},
-    "OMG": {"OMGOutBlock"},
-    "OVC": {"OVCOutBlock"},
-    "OVH": {"OVHOutBlock"},
-    "OX0": {"OX0OutBlock"},
-    "SC0": {"SC0OutBlock"},
-    "SC1": {"SC1OutBlock"},
-    "SC2": {"SC2OutBlock"},
-    "SC3": {"SC3OutBlock"},
-    "SC4": {"SC4OutBlock"},
-    "SHC": {"SHCOutBlock"},
-    "SHD": {"SHDOutBlock"},
-    "SHI": {"SHIOutBlock"},
-    "SHO": {"SHOOutBlock"},
-    "TC1": {"TC1OutBlock"},
-    "TC2": {"TC2OutBlock"},
-    "TC3": {"TC3OutBlock"},
-    "WOC": {"WOCOutBlock"},
-    "WOH": {"WOHOutBlock"},
-    "YC3": {"YC3OutBlock"},
-    "YFC": {"YFCOutBlock"},
-    "YJC": {"YJCOutBlock"},
-    "YK3": {"YK3OutBlock"},
-    "YOC": {"YOCOutBlock"},
-    "YS3": {"YS3OutBlock"},
-    "o3101": {"o3101OutBlock"},
-    "o3103": {"o3103OutBlock", "o3103OutBlock1"},
-    "o3104": {"o3104OutBlock1"},
-    "o3105": {"o3105OutBlock"},
-    "o3106": {"o3106OutBlock"},
-    "o3107": {"o3107OutBlock"},
-    "o3108": {"o3108OutBlock1", "o3108OutBlock"},
-    "o3116": {"o3116OutBlock", "o3116OutBlock1"},
-    "o3117": {"o3117OutBlock1", "o3117OutBlock"},
-    "o3121": {"o3121OutBlock"},
-    "o3123": {"o3123OutBlock1", "o3123OutBlock"},
-    "o3125": {"o3125OutBlock"},
-    "o3126": {"o3126OutBlock"},
-    "o3127": {"o3127OutBlock"},
-    "o3128": {"o3128OutBlock", "o3128OutBlock1"},
-    "o3136": {"o3136OutBlock", "o3136OutBlock1"},
-    "o3137": {"o3137OutBlock1", "o3137OutBlock"},
-    "o3139": {"o3139OutBlock1", "o3139OutBlock"},
-    "t0150": {"t0150OutBlock", "t0150OutBlock1"},
-    "t0151": {"t0151OutBlock1", "t0151OutBlock"},
-    "t0167": {"t0167OutBlock"},
-    "t0424": {"t0424OutBlock1", "t0424OutBlock"},
-    "t0425": {"t0425OutBlock1", "t0425OutBlock"},
-    "t0434": {"t0434OutBlock", "t0434OutBlock1"},
-    "t0441": {"t0441OutBlock", "t0441OutBlock1"},
-    "t1101": {"t1101OutBlock"},
-    "t1102": {"t1102OutBlock"},
-    "t1104": {"t1104OutBlock1", "t1104OutBlock"},
-    "t1105": {"t1105OutBlock"},
-    "t1109": {"t1109OutBlock", "t1109OutBlock1"},
-    "t1301": {"t1301OutBlock1", "t1301OutBlock"},
-    "t1302": {"t1302OutBlock", "t1302OutBlock1"},
-    "t1305": {"t1305OutBlock", "t1305OutBlock1"},
-    "t1308": {"t1308OutBlock1"},
-    "t1310": {"t1310OutBlock1", "t1310OutBlock"},
-    "t1403": {"t1403OutBlock", "t1403OutBlock1"},
-    "t1404": {"t1404OutBlock1", "t1404OutBlock"},
-    "t1405": {"t1405OutBlock1", "t1405OutBlock"},
-    "t1410": {"t1410OutBlock", "t1410OutBlock1"},
-    "t1411": {"t1411OutBlock", "t1411OutBlock1"},
-    "t1422": {"t1422OutBlock", "t1422OutBlock1"},
-    "t1427": {"t1427OutBlock", "t1427OutBlock1"},
-    "t1441": {"t1441OutBlock", "t1441OutBlock1"},
-    "t1442": {"t1442OutBlock1", "t1442OutBlock"},
-    "t1444": {"t1444OutBlock", "t1444OutBlock1"},
-    "t1449": {"t1449OutBlock1", "t1449OutBlock"},
-    "t1452": {"t1452OutBlock", "t1452OutBlock1"},
-    "t1463": {"t1463OutBlock1", "t1463OutBlock"},
-    "t1466": {"t1466OutBlock1", "t1466OutBlock"},
-    "t1471": {"t1471OutBlock", "t1471OutBlock1"},
-    "t1475": {"t1475OutBlock", "t1475OutBlock1"},
-    "t1481": {"t1481OutBlock1", "t1481OutBlock"},
-    "t1482": {"t1482OutBlock1", "t1482OutBlock"},
-    "t1485": {"t1485OutBlock", "t1485OutBlock1"},
-    "t1486": {"t1486OutBlock", "t1486OutBlock1"},
-    "t1488": {"t1488OutBlock", "t1488OutBlock1"},
-    "t1489": {"t1489OutBlock1", "t1489OutBlock"},
-    "t1492": {"t1492OutBlock", "t1492OutBlock1"},
-    "t1511": {"t1511OutBlock"},
-    "t1514": {"t1514OutBlock1", "t1514OutBlock"},
-    "t1516": {"t1516OutBlock", "t1516OutBlock1"},
-    "t1531": {"t1531OutBlock"},
-    "t1532": {"t1532OutBlock"},
-    "t1533": {"t1533OutBlock1", "t1533OutBlock"},
-    "t1537": {"t1537OutBlock", "t1537OutBlock1"},
-    "t1601": {
-        "t1601OutBlock1",
-        "t1601OutBlock2",
-        "t1601OutBlock3",
-        "t1601OutBlock4",
-        "t1601OutBlock5",
-        "t1601OutBlock6",
-    },
-    "t1602": {"t1602OutBlock1", "t1602OutBlock"},
-    "t1603": {"t1603OutBlock1", "t1603OutBlock"},
-    "t1615": {"t1615OutBlock1", "t1615OutBlock"},
-    "t1617": {"t1617OutBlock1", "t1617OutBlock"},
-    "t1621": {"t1621OutBlock1", "t1621OutBlock"},
-    "t1631": {"t1631OutBlock1", "t1631OutBlock"},
-    "t1632": {"t1632OutBlock1", "t1632OutBlock"},
-    "t1633": {"t1633OutBlock1", "t1633OutBlock"},
-    "t1636": {"t1636OutBlock1", "t1636OutBlock"},
-    "t1637": {"t1637OutBlock1", "t1637OutBlock"},
-    "t1638": {"t1638OutBlock"},
-    "t1640": {"t1640OutBlock"},
-    "t1662": {"t1662OutBlock"},
-    "t1664": {"t1664OutBlock1"},
-    "t1665": {"t1665OutBlock1", "t1665OutBlock"},
-    "t1702": {"t1702OutBlock1", "t1702OutBlock"},
-    "t1716": {"t1716OutBlock"},
-    "t1717": {"t1717OutBlock"},
-    "t1752": {"t1752OutBlock", "t1752OutBlock1"},
-    "t1764": {"t1764OutBlock"},
-    "t1771": {"t1771OutBlock2", "t1771OutBlock"},
-    "t1809": {"t1809OutBlock1", "t1809OutBlock"},
-    "t1825": {"t1825OutBlock", "t1825OutBlock1"},
-    "t1826": {"t1826OutBlock"},
-    "t1857": {"t1857OutBlock1", "t1857OutBlock"},
-    "t1866": {"t1866OutBlock1", "t1866OutBlock"},
-    "t1901": {"t1901OutBlock"},
-    "t1902": {"t1902OutBlock1", "t1902OutBlock"},
-    "t1903": {"t1903OutBlock", "t1903OutBlock1"},
-    "t1904": {"t1904OutBlock1", "t1904OutBlock"},
-    "t1906": {"t1906OutBlock"},
-    "t1921": {"t1921OutBlock1", "t1921OutBlock"},
-    "t1926": {"t1926OutBlock"},
-    "t1927": {"t1927OutBlock", "t1927OutBlock1"},
-    "t1941": {"t1941OutBlock1"},
-    "t1950": {"t1950OutBlock", "t1950OutBlock1"},
-    "t1951": {"t1951OutBlock1", "t1951OutBlock"},
-    "t1954": {"t1954OutBlock", "t1954OutBlock1"},
-    "t1956": {"t1956OutBlock1", "t1956OutBlock"},
-    "t1958": {"t1958OutBlock", "t1958OutBlock2", "t1958OutBlock1"},
-    "t1959": {"t1959OutBlock1"},
-    "t1960": {"t1960OutBlock1", "t1960OutBlock"},
-    "t1961": {"t1961OutBlock1", "t1961OutBlock"},
-    "t1964": {"t1964OutBlock1"},
-    "t1966": {"t1966OutBlock", "t1966OutBlock1"},
-    "t1969": {"t1969OutBlock1", "t1969OutBlock"},
-    "t1971": {"t1971OutBlock"},
-    "t1972": {"t1972OutBlock"},
-    "t1973": {"t1973OutBlock", "t1973OutBlock1"},
-    "t1974": {"t1974OutBlock1", "t1974OutBlock"},
-    "t1988": {"t1988OutBlock", "t1988OutBlock1"},
-    "t2101": {"t2101OutBlock"},
-    "t2105": {"t2105OutBlock"},
-    "t2106": {"t2106OutBlock", "t2106OutBlock1"},
-    "t2201": {"t2201OutBlock1", "t2201OutBlock"},
-    "t2203": {"t2203OutBlock1", "t2203OutBlock"},
-    "t2209": {"t2209OutBlock1"},
-    "t2210": {"t2210OutBlock"},
-    "t2301": {"t2301OutBlock2", "t2301OutBlock", "t2301OutBlock1"},
-    "t2405": {"t2405OutBlock", "t2405OutBlock1"},
-    "t2421": {"t2421OutBlock", "t2421OutBlock1"},
-    "t2541": {"t2541OutBlock1", "t2541OutBlock"},
-    "t2545": {"t2545OutBlock1", "t2545OutBlock"},
-    "t2830": {"t2830OutBlock"},
-    "t2831": {"t2831OutBlock"},
-    "t2832": {"t2832OutBlock1", "t2832OutBlock"},
-    "t2833": {"t2833OutBlock", "t2833OutBlock1"},
-    "t2835": {"t2835OutBlock", "t2835OutBlock2", "t2835OutBlock1"},
-    "t3102": {"t3102OutBlock2", "t3102OutBlock1", "t3102OutBlock"},
-    "t3202": {"t3202OutBlock"},
-    "t3320": {"t3320OutBlock1", "t3320OutBlock"},
-    "t3341": {"t3341OutBlock1", "t3341OutBlock"},
-    "t3401": {"t3401OutBlock", "t3401OutBlock1"},
-    "t3518": {"t3518OutBlock1", "t3518OutBlock"},
-    "t3521": {"t3521OutBlock"},
-    "t4203": {"t4203OutBlock", "t4203OutBlock1"},
-    "t8401": {"t8401OutBlock"},
-    "t8402": {"t8402OutBlock"},
-    "t8403": {"t8403OutBlock"},
-    "t8404": {"t8404OutBlock", "t8404OutBlock1"},
-    "t8405": {"t8405OutBlock", "t8405OutBlock1"},
-    "t8406": {"t8406OutBlock1"},
-    "t8407": {"t8407OutBlock1"},
-    "t8410": {"t8410OutBlock", "t8410OutBlock1"},
-    "t8411": {"t8411OutBlock", "t8411OutBlock1"},
-    "t8412": {"t8412OutBlock", "t8412OutBlock1"},
-    "t8414": {"t8414OutBlock", "t8414OutBlock1"},
-    "t8415": {"t8415OutBlock1", "t8415OutBlock"},
-    "t8416": {"t8416OutBlock", "t8416OutBlock1"},
-    "t8417": {"t8417OutBlock", "t8417OutBlock1"},
-    "t8418": {"t8418OutBlock", "t8418OutBlock1"},
-    "t8419": {"t8419OutBlock", "t8419OutBlock1"},
-    "t8424": {"t8424OutBlock"},
-    "t8425": {"t8425OutBlock"},
-    "t8426": {"t8426OutBlock"},
-    "t8427": {"t8427OutBlock1", "t8427OutBlock"},
-    "t8428": {"t8428OutBlock", "t8428OutBlock1"},
-    "t8429": {"t8429OutBlock1"},
-    "t8430": {"t8430OutBlock"},
-    "t8431": {"t8431OutBlock"},
-    "t8432": {"t8432OutBlock"},
-    "t8433": {"t8433OutBlock"},
-    "t8434": {"t8434OutBlock1"},
-    "t8435": {"t8435OutBlock"},
-    "t8436": {"t8436OutBlock"},
-    "t8437": {"t8437OutBlock"},
-    "t9905": {"t9905OutBlock1"},
-    "t9907": {"t9907OutBlock1"},
-    "t9942": {"t9942OutBlock"},
-    "t9943": {"t9943OutBlock"},
-    "t9944": {"t9944OutBlock"},
-    "t9945": {"t9945OutBlock"},
-}
@@ -0,0 +1,47 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <C01 - 선물주문체결>
+class C01OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    accno: str = Field(description="계좌번호", default="")
+    user: str = Field(description="조작자ID", default="")
+    seq: int = Field(description="일련번호", default=0)
+    trcode: str = Field(description="trcode", default="")
+    megrpno: str = Field(description="매칭그룹번호", default="")
+    boardid: str = Field(description="보드ID", default="")
+    memberno: str = Field(description="회원번호", default="")
+    bpno: str = Field(description="지점번호", default="")
+    ordno: str = Field(description="주문번호", default="")
+    ordordno: str = Field(description="원주문번호", default="")
+    expcode: str = Field(description="종목코드", default="")
+    yakseq: str = Field(description="약정번호", default="")
+    cheprice: float = Field(description="체결가격", default=0.0)
+    chevol: int = Field(description="체결수량", default=0)
+    sessionid: str = Field(description="세션ID", default="")
+    chedate: str = Field(description="체결일자", default="")
+    chetime: str = Field(description="체결시각", default="")
+    spdprc1: float = Field(description="최근월체결가격", default=0.0)
+    spdprc2: float = Field(description="차근월체결가격", default=0.0)
+    dosugb: str = Field(description="매도수구분", default="")
+    accno1: str = Field(description="계좌번호1", default="")
+    sihogagb: str = Field(description="시장조성호가구분", default="")
+    jakino: str = Field(description="위탁사번호", default="")
+    daeyong: str = Field(description="대용주권계좌번호", default="")
+    mem_filler: str = Field(description="mem_filler", default="")
+    mem_accno: str = Field(description="mem_accno", default="")
+    mem_filler1: str = Field(description="mem_filler1", default="")
+
+
+# 선물주문체결
+class C01(BaseModel):
+    outblock: C01OutBlock = Field(description="C01OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for C01",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
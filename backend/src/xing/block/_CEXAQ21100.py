@@ -0,0 +1,70 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CEXAQ21100 - 유렉스 주문체결내역조회>
+class CEXAQ21100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
+    AcntNo: str = Field(description="지점번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+
+
+class CEXAQ21100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
+    AcntNo: str = Field(description="지점번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+
+
+class CEXAQ21100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    OrdQty: int = Field(description="주문수량", default=0)
+    ExecQty: int = Field(description="체결수량", default=0)
+
+
+class CEXAQ21100OutBlock3(BaseModel):
+    AcntNo1: str = Field(description="계좌번호1", default="")
+    OrdDt: str = Field(description="주문일", default="")
+    OrdNo: int = Field(description="주문번호", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    OrdTime: str = Field(description="주문시각", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    MrcTpNm: str = Field(description="정정취소구분명", default="")
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+    FnoOrdprcPtnNm: str = Field(description="선물옵션호가유형명", default="")
+    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdTpNm: str = Field(description="주문구분명", default="")
+    ExecPrc: float = Field(description="체결가", default=0.0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    CommdaNm: str = Field(description="통신매체명", default="")
+
+
+# 유렉스 주문체결내역조회
+class CEXAQ21100(BaseModel):
+    inblock1: CEXAQ21100InBlock1 = Field(description="CEXAQ21100InBlock1")
+    outblock1: CEXAQ21100OutBlock1 = Field(description="CEXAQ21100OutBlock1")
+    outblock2: CEXAQ21100OutBlock2 = Field(description="CEXAQ21100OutBlock2")
+    outblock3: List[CEXAQ21100OutBlock3] = Field(description="CEXAQ21100OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CEXAQ21100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
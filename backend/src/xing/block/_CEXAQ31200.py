@@ -0,0 +1,82 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CEXAQ31200 - 유렉스 예탁금 및 통합잔고조회>
+class CEXAQ31200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    BalEvalTp: str = Field(description="잔고평가구분", default="")
+    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
+
+
+class CEXAQ31200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    BalEvalTp: str = Field(description="잔고평가구분", default="")
+    FutsPrcEvalTp: str = Field(description="선물가격평가구분", default="")
+
+
+class CEXAQ31200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    EvalDpsamtTotamt: int = Field(description="평가예탁금총액", default=0)
+    MnyEvalDpstgAmt: int = Field(description="현금평가예탁금액", default=0)
+    DpsamtTotamt: int = Field(description="예탁금총액", default=0)
+    DpstgMny: int = Field(description="예탁현금", default=0)
+    PsnOutAbleTotAmt: int = Field(description="인출가능총금액", default=0)
+    PsnOutAbleCurAmt: int = Field(description="인출가능현금액", default=0)
+    OrdAbleTotAmt: int = Field(description="주문가능총금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    CsgnMgnTotamt: int = Field(description="위탁증거금총액", default=0)
+    MnyCsgnMgn: int = Field(description="현금위탁증거금액", default=0)
+    AddMgnTotamt: int = Field(description="추가증거금총액", default=0)
+    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
+    CmsnAmt: int = Field(description="수수료", default=0)
+    FutsEvalPnlAmt: int = Field(description="선물평가손익금액", default=0)
+    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
+    OptEvalAmt: int = Field(description="옵션평가금액", default=0)
+    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
+    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
+    TotPnlAmt: int = Field(description="총손익금액", default=0)
+    NetPnlAmt: int = Field(description="순손익금액", default=0)
+    TotEvalAmt: int = Field(description="총평가금액", default=0)
+    MnyinAmt: int = Field(description="입금금액", default=0)
+    MnyoutAmt: int = Field(description="출금금액", default=0)
+    FutsCmsnAmt: int = Field(description="선물수수료금액", default=0)
+
+
+class CEXAQ31200OutBlock3(BaseModel):
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    UnsttQty: int = Field(description="미결제수량", default=0)
+    FnoAvrPrc: float = Field(description="평균가", default=0.0)
+    NowPrc: float = Field(description="현재가", default=0.0)
+    CmpPrc: float = Field(description="대비가", default=0.0)
+    EvalPnl: int = Field(description="평가손익", default=0)
+    PnlRat: float = Field(description="손익률", default=0.0)
+    EvalAmt: int = Field(description="평가금액", default=0)
+    LqdtAbleQty: int = Field(description="청산가능수량", default=0)
+
+
+# 유렉스 예탁금 및 통합잔고조회
+class CEXAQ31200(BaseModel):
+    inblock1: CEXAQ31200InBlock1 = Field(description="CEXAQ31200InBlock1")
+    outblock1: CEXAQ31200OutBlock1 = Field(description="CEXAQ31200OutBlock1")
+    outblock2: CEXAQ31200OutBlock2 = Field(description="CEXAQ31200OutBlock2")
+    outblock3: List[CEXAQ31200OutBlock3] = Field(description="CEXAQ31200OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CEXAQ31200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
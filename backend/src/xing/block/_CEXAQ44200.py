@@ -0,0 +1,90 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CEXAQ44200 - EUREX 야간옵션 기간주문체결조회>
+class CEXAQ44200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
+    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+
+
+class CEXAQ44200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    ChoicInptTpCode: str = Field(description="선택입력구분", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    FnoTrdPtnCode: str = Field(description="선물옵션거래유형코드", default="")
+    SrtOrdNo2: int = Field(description="시작주문번호2", default=0)
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+
+
+class CEXAQ44200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    ExecPrc: float = Field(description="체결가", default=0.0)
+
+
+class CEXAQ44200OutBlock3(BaseModel):
+    AcntNo1: str = Field(description="계좌번호1", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    OrdDt: str = Field(description="주문일", default="")
+    OrdNo: int = Field(description="주문번호", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    OrdTime: str = Field(description="주문시각", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    ErxOrdprcTpCode: str = Field(description="유렉스호가구분코드", default="")
+    MrcTpNm: str = Field(description="정정취소구분명", default="")
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+    CodeNm: str = Field(description="코드명", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    FnoRjtRsnCode: str = Field(description="선물옵션거부사유코드", default="")
+    OrdTpNm: str = Field(description="주문구분명", default="")
+    ExecTpNm: str = Field(description="체결구분명", default="")
+    ExecPrc: float = Field(description="체결가", default=0.0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    ExecTime: str = Field(description="체결시각", default="")
+    ExecNo: int = Field(description="체결번호", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    UserId: str = Field(description="사용자ID", default="")
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    CommdaCodeNm: str = Field(description="통신매체코드명", default="")
+    IpAddr: str = Field(description="IP주소", default="")
+    TrdPtnTpNm: str = Field(description="거래유형구분", default="")
+    ErxOrdStatCode: str = Field(description="유렉스주문상태코드", default="")
+    CodeNm0: str = Field(description="코드명0", default="")
+    ExchRcptTime: str = Field(description="거래소접수시각", default="")
+
+
+# EUREX 야간옵션 기간주문체결조회
+class CEXAQ44200(BaseModel):
+    inblock1: CEXAQ44200InBlock1 = Field(description="CEXAQ44200InBlock1")
+    outblock1: CEXAQ44200OutBlock1 = Field(description="CEXAQ44200OutBlock1")
+    outblock2: CEXAQ44200OutBlock2 = Field(description="CEXAQ44200OutBlock2")
+    outblock3: List[CEXAQ44200OutBlock3] = Field(description="CEXAQ44200OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CEXAQ44200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
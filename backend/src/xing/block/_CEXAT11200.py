@@ -0,0 +1,53 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CEXAT11200 - 유렉스 정정주문>
+class CEXAT11200InBlock1(BaseModel):
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+
+
+class CEXAT11200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    ErxPrcCndiTpCode: str = Field(description="유렉스가격조건구분코드", default="")
+    OrdPrc: float = Field(description="주문가격", default=0.0)
+    MdfyQty: int = Field(description="정정수량", default=0)
+    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CEXAT11200OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdMgn: int = Field(description="주문증거금액", default=0)
+    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 유렉스 정정주문
+class CEXAT11200(BaseModel):
+    inblock1: CEXAT11200InBlock1 = Field(description="CEXAT11200InBlock1")
+    outblock1: CEXAT11200OutBlock1 = Field(description="CEXAT11200OutBlock1")
+    outblock2: CEXAT11200OutBlock2 = Field(description="CEXAT11200OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CEXAT11200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
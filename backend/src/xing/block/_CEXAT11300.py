@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CEXAT11300 - 유렉스 취소주문>
+class CEXAT11300InBlock1(BaseModel):
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+
+
+class CEXAT11300OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    CancQty: int = Field(description="취소수량", default=0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CEXAT11300OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdNo: int = Field(description="주문번호", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdMgn: int = Field(description="주문증거금액", default=0)
+    MnyOrdMgn: int = Field(description="현금주문증거금액", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+
+
+# 유렉스 취소주문
+class CEXAT11300(BaseModel):
+    inblock1: CEXAT11300InBlock1 = Field(description="CEXAT11300InBlock1")
+    outblock1: CEXAT11300OutBlock1 = Field(description="CEXAT11300OutBlock1")
+    outblock2: CEXAT11300OutBlock2 = Field(description="CEXAT11300OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CEXAT11300",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
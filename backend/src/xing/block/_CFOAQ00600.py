@@ -0,0 +1,83 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CFOAQ00600 - 선물옵션 계좌주문체결내역조회>
+class CFOAQ00600InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    FnoClssCode: str = Field(description="선물옵션분류코드", default="")
+    PrdgrpCode: str = Field(description="상품군코드", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CFOAQ00600OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    FnoClssCode: str = Field(description="선물옵션분류코드", default="")
+    PrdgrpCode: str = Field(description="상품군코드", default="")
+    PrdtExecTpCode: str = Field(description="체결구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CFOAQ00600OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    FutsOrdQty: int = Field(description="선물주문수량", default=0)
+    FutsExecQty: int = Field(description="선물체결수량", default=0)
+    OptOrdQty: int = Field(description="옵션주문수량", default=0)
+    OptExecQty: int = Field(description="옵션체결수량", default=0)
+
+
+class CFOAQ00600OutBlock3(BaseModel):
+    OrdDt: str = Field(description="주문일", default="")
+    OrdNo: int = Field(description="주문번호", default=0)
+    OrgOrdNo: int = Field(description="원주문번호", default=0)
+    OrdTime: str = Field(description="주문시각", default="")
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    MrcTpNm: str = Field(description="정정취소구분명", default="")
+    FnoOrdprcPtnCode: str = Field(description="선물옵션호가유형코드", default="")
+    FnoOrdprcPtnNm: str = Field(description="선물옵션호가유형명", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OrdTpNm: str = Field(description="주문구분명", default="")
+    ExecTpNm: str = Field(description="체결구분명", default="")
+    ExecPrc: float = Field(description="체결가", default=0.0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    CtrctTime: str = Field(description="약정시각", default="")
+    CtrctNo: int = Field(description="약정번호", default=0)
+    ExecNo: int = Field(description="체결번호", default=0)
+    BnsplAmt: int = Field(description="매매손익금액", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    UserId: str = Field(description="사용자ID", default="")
+    CommdaCode: str = Field(description="통신매체코드", default="")
+    CommdaCodeNm: str = Field(description="통신매체코드명", default="")
+
+
+# 선물옵션 계좌주문체결내역조회
+class CFOAQ00600(BaseModel):
+    inblock1: CFOAQ00600InBlock1 = Field(description="CFOAQ00600InBlock1")
+    outblock1: CFOAQ00600OutBlock1 = Field(description="CFOAQ00600OutBlock1")
+    outblock2: CFOAQ00600OutBlock2 = Field(description="CFOAQ00600OutBlock2")
+    outblock3: List[CFOAQ00600OutBlock3] = Field(description="CFOAQ00600OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CFOAQ00600",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,81 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CFOBQ10500 - 선물옵션 계좌예탁금증거금조회>
+class CFOBQ10500InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+
+
+class CFOBQ10500OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+
+
+class CFOBQ10500OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    DpsamtTotamt: int = Field(description="예탁금총액", default=0)
+    Dps: int = Field(description="예수금", default=0)
+    SubstAmt: int = Field(description="대용금액", default=0)
+    FilupDpsamtTotamt: int = Field(description="충당예탁금총액", default=0)
+    FilupDps: int = Field(description="충당예수금", default=0)
+    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
+    WthdwAbleAmt: int = Field(description="인출가능금액", default=0)
+    PsnOutAbleCurAmt: int = Field(description="인출가능현금액", default=0)
+    PsnOutAbleSubstAmt: int = Field(description="인출가능대용금액", default=0)
+    Mgn: int = Field(description="증거금액", default=0)
+    MnyMgn: int = Field(description="현금증거금액", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    AddMgn: int = Field(description="추가증거금액", default=0)
+    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
+    AmtPrdayChckInAmt: int = Field(description="금전일수표입금액", default=0)
+    FnoPrdaySubstSellAmt: int = Field(description="선물옵션전일대용매도금액", default=0)
+    FnoCrdaySubstSellAmt: int = Field(description="선물옵션금일대용매도금액", default=0)
+    FnoPrdayFdamt: int = Field(description="선물옵션전일가입금액", default=0)
+    FnoCrdayFdamt: int = Field(description="선물옵션금일가입금액", default=0)
+    FcurrSubstAmt: int = Field(description="외화대용금액", default=0)
+    FnoAcntAfmgnNm: str = Field(description="선물옵션계좌사후증거금명", default="")
+
+
+class CFOBQ10500OutBlock3(BaseModel):
+    PdGrpCodeNm: str = Field(description="상품군코드명", default="")
+    NetRiskMgn: int = Field(description="순위험증거금액", default=0)
+    PrcMgn: int = Field(description="가격증거금액", default=0)
+    SprdMgn: int = Field(description="스프레드증거금액", default=0)
+    PrcFlctMgn: int = Field(description="가격변동증거금액", default=0)
+    MinMgn: int = Field(description="최소증거금액", default=0)
+    OrdMgn: int = Field(description="주문증거금액", default=0)
+    OptNetBuyAmt: int = Field(description="옵션순매수금액", default=0)
+    CsgnMgn: int = Field(description="위탁증거금액", default=0)
+    MaintMgn: int = Field(description="유지증거금액", default=0)
+    FutsBuyExecAmt: int = Field(description="선물매수체결금액", default=0)
+    FutsSellExecAmt: int = Field(description="선물매도체결금액", default=0)
+    OptBuyExecAmt: int = Field(description="옵션매수체결금액", default=0)
+    OptSellExecAmt: int = Field(description="옵션매도체결금액", default=0)
+    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
+    TotRiskCsgnMgn: int = Field(description="총위험위탁증거금", default=0)
+    UndCsgnMgn: int = Field(description="인수도위탁증거금", default=0)
+    MgnRdctAmt: int = Field(description="증거금감면금액", default=0)
+
+
+# 선물옵션 계좌예탁금증거금조회
+class CFOBQ10500(BaseModel):
+    inblock1: CFOBQ10500InBlock1 = Field(description="CFOBQ10500InBlock1")
+    outblock1: CFOBQ10500OutBlock1 = Field(description="CFOBQ10500OutBlock1")
+    outblock2: CFOBQ10500OutBlock2 = Field(description="CFOBQ10500OutBlock2")
+    outblock3: List[CFOBQ10500OutBlock3] = Field(description="CFOBQ10500OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CFOBQ10500",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
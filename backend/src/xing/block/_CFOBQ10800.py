@@ -0,0 +1,56 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CFOBQ10800 - 선물옵션 옵션매도시 주문증거금조회>
+class CFOBQ10800InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
+    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    SettWklyCnt: str = Field(description="결제주간수", default="")
+    SpclDtPtnCode: str = Field(description="특별일자유형코드", default="")
+
+
+class CFOBQ10800OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
+    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
+    DueYymm: str = Field(description="만기년월", default="")
+    SettWklyCnt: str = Field(description="결제주간수", default="")
+    SpclDtPtnCode: str = Field(description="특별일자유형코드", default="")
+
+
+class CFOBQ10800OutBlock2(BaseModel):
+    ElwXrcPrc: float = Field(description="행사가", default=0.0)
+    FnoIsuNo: str = Field(description="선물옵션종목번호", default="")
+    HanglIsuNm1: str = Field(description="한글종목명1", default="")
+    TpNm1: str = Field(description="구분명1", default="")
+    UpOptRegulThrprc: float = Field(description="상승옵션조정이론가", default=0.0)
+    Thrprc1: float = Field(description="이론가1", default=0.0)
+    BasePrc1: float = Field(description="기준가1", default=0.0)
+    OrdMgn1: int = Field(description="주문증거금액1", default=0)
+    FnoIsuNo0: str = Field(description="선물옵션종목번호0", default="")
+    HanglIsuNm2: str = Field(description="한글종목명2", default="")
+    TpNm2: str = Field(description="구분명2", default="")
+    DownOptRegulThrprc: float = Field(description="하락옵션조정이론가", default=0.0)
+    Thrprc2: float = Field(description="이론가2", default=0.0)
+    BasePrc2: float = Field(description="기준가2", default=0.0)
+    OrdMgn2: int = Field(description="주문증거금액2", default=0)
+
+
+# 선물옵션 옵션매도시 주문증거금조회
+class CFOBQ10800(BaseModel):
+    inblock1: CFOBQ10800InBlock1 = Field(description="CFOBQ10800InBlock1")
+    outblock1: CFOBQ10800OutBlock1 = Field(description="CFOBQ10800OutBlock1")
+    outblock2: List[CFOBQ10800OutBlock2] = Field(description="CFOBQ10800OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CFOBQ10800",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,134 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CFOEQ11100 - 선물옵션가정산예탁금상세>
+class CFOEQ11100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BnsDt: str = Field(description="매매일", default="")
+
+
+class CFOEQ11100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BnsDt: str = Field(description="매매일", default="")
+
+
+class CFOEQ11100OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    OpnmkDpsamtTotamt: int = Field(description="개장시예탁금총액", default=0)
+    OpnmkDps: int = Field(description="개장시예수금", default=0)
+    OpnmkMnyrclAmt: int = Field(description="개장시현금미수금", default=0)
+    OpnmkSubstAmt: int = Field(description="개장시대용금액", default=0)
+    TotAmt: int = Field(description="총금액", default=0)
+    Dps: int = Field(description="예수금", default=0)
+    MnyrclAmt: int = Field(description="현금미수금액", default=0)
+    SubstDsgnAmt: int = Field(description="대용지정금액", default=0)
+    CsgnMgn: int = Field(description="위탁증거금액", default=0)
+    MnyCsgnMgn: int = Field(description="현금위탁증거금액", default=0)
+    MaintMgn: int = Field(description="유지증거금액", default=0)
+    MnyMaintMgn: int = Field(description="현금유지증거금액", default=0)
+    OutAbleAmt: int = Field(description="출금가능총액", default=0)
+    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
+    SubstOutAbleAmt: int = Field(description="출금가능대용", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    AddMgnOcrTpCode: str = Field(description="추가증거금구분", default="")
+    AddMgn: int = Field(description="추가증거금액", default=0)
+    MnyAddMgn: int = Field(description="현금추가증거금액", default=0)
+    NtdayTotAmt: int = Field(description="익일예탁총액", default=0)
+    NtdayDps: int = Field(description="익일예탁현금", default=0)
+    NtdayMnyrclAmt: int = Field(description="익일미수금", default=0)
+    NtdaySubstAmt: int = Field(description="익일예탁대용", default=0)
+    NtdayCsgnMgn: int = Field(description="익일위탁증거금", default=0)
+    NtdayMnyCsgnMgn: int = Field(description="익일위탁증거금현금", default=0)
+    NtdayMaintMgn: int = Field(description="익일유지증거금", default=0)
+    NtdayMnyMaintMgn: int = Field(description="익일유지증거금현금", default=0)
+    NtdayOutAbleAmt: int = Field(description="익일인출가능금액", default=0)
+    NtdayMnyoutAbleAmt: int = Field(description="익일인출가능금액", default=0)
+    NtdaySubstOutAbleAmt: int = Field(description="익일인출가능대용", default=0)
+    NtdayOrdAbleAmt: int = Field(description="익일주문가능금액", default=0)
+    NtdayMnyOrdAbleAmt: int = Field(description="익일주문가능현금", default=0)
+    NtdayAddMgnTp: str = Field(description="익일추가증거금구분", default="")
+    NtdayAddMgn: int = Field(description="익일추가증거금", default=0)
+    NtdayMnyAddMgn: int = Field(description="익일추가증거금현금", default=0)
+    NtdaySettAmt: int = Field(description="익일결제금액", default=0)
+    EvalDpsamtTotamt: int = Field(description="평가예탁금총액", default=0)
+    MnyEvalDpstgAmt: int = Field(description="현금평가예탁금액", default=0)
+    DpsamtUtlfeeGivPrergAmt: int = Field(description="예탁금이용료지급예정금액", default=0)
+    TaxAmt: int = Field(description="세금", default=0)
+    CsgnMgnrat: float = Field(description="위탁증거금 비율", default=0.0)
+    CsgnMnyMgnrat: float = Field(description="위탁증거금현금비율", default=0.0)
+    DpstgTotamtLackAmt: int = Field(description="예탁총액부족금액(위탁증거금기준)", default=0)
+    DpstgMnyLackAmt: int = Field(description="예탁현금부족금액(위탁증거금기준)", default=0)
+    RealInAmt: int = Field(description="실입금액", default=0)
+    InAmt: int = Field(description="입금액", default=0)
+    OutAmt: int = Field(description="출금액", default=0)
+    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
+    FutsThdayDfamt: int = Field(description="선물당일차금", default=0)
+    FutsUpdtDfamt: int = Field(description="선물갱신차금", default=0)
+    FutsLastSettDfamt: int = Field(description="선물최종결제차금", default=0)
+    OptSettDfamt: int = Field(description="옵션결제차금", default=0)
+    OptBuyAmt: int = Field(description="옵션매수금액", default=0)
+    OptSellAmt: int = Field(description="옵션매도금액", default=0)
+    OptXrcDfamt: int = Field(description="옵션행사차금", default=0)
+    OptAsgnDfamt: int = Field(description="옵션배정차금", default=0)
+    RealGdsUndAmt: int = Field(description="실물인수도금액", default=0)
+    RealGdsUndAsgnAmt: int = Field(description="실물인수도배정대금", default=0)
+    RealGdsUndXrcAmt: int = Field(description="실물인수도행사대금", default=0)
+    CmsnAmt: int = Field(description="수수료", default=0)
+    FutsCmsn: int = Field(description="선물수수료", default=0)
+    OptCmsn: int = Field(description="옵션수수료", default=0)
+    FutsCtrctQty: int = Field(description="선물약정수량", default=0)
+    FutsCtrctAmt: int = Field(description="선물약정금액", default=0)
+    OptCtrctQty: int = Field(description="옵션약정수량", default=0)
+    OptCtrctAmt: int = Field(description="옵션약정금액", default=0)
+    FutsUnsttQty: int = Field(description="선물미결제수량", default=0)
+    FutsUnsttAmt: int = Field(description="선물미결제금액", default=0)
+    OptUnsttQty: int = Field(description="옵션미결제수량", default=0)
+    OptUnsttAmt: int = Field(description="옵션미결제금액", default=0)
+    FutsBuyUnsttQty: int = Field(description="선물매수미결제수량", default=0)
+    FutsBuyUnsttAmt: int = Field(description="선물매수미결제금액", default=0)
+    FutsSellUnsttQty: int = Field(description="선물매도미결제수량", default=0)
+    FutsSellUnsttAmt: int = Field(description="선물매도미결제금액", default=0)
+    OptBuyUnsttQty: int = Field(description="옵션매수미결제수량", default=0)
+    OptBuyUnsttAmt: int = Field(description="옵션매수미결제금액", default=0)
+    OptSellUnsttQty: int = Field(description="옵션매도미결제수량", default=0)
+    OptSellUnsttAmt: int = Field(description="옵션매도미결제금액", default=0)
+    FutsBuyctrQty: int = Field(description="선물매수약정수량", default=0)
+    FutsBuyctrAmt: int = Field(description="선물매수약정금액", default=0)
+    FutsSlctrQty: int = Field(description="선물매도약정수량", default=0)
+    FutsSlctrAmt: int = Field(description="선물매도약정금액", default=0)
+    OptBuyctrQty: int = Field(description="옵션매수약정수량", default=0)
+    OptBuyctrAmt: int = Field(description="옵션매수약정금액", default=0)
+    OptSlctrQty: int = Field(description="옵션매도약정수량", default=0)
+    OptSlctrAmt: int = Field(description="옵션매도약정금액", default=0)
+    FutsBnsplAmt: int = Field(description="선물매매손익금액", default=0)
+    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
+    FutsEvalPnlAmt: int = Field(description="선물평가손익금액", default=0)
+    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
+    FutsEvalAmt: int = Field(description="선물평가금액", default=0)
+    OptEvalAmt: int = Field(description="옵션평가금액", default=0)
+    MktEndAfMnyInAmt: int = Field(description="장종료후현금입금금액", default=0)
+    MktEndAfMnyOutAmt: int = Field(description="장종료후현금출금금액", default=0)
+    MktEndAfSubstDsgnAmt: int = Field(description="장종료후대용지정금액", default=0)
+    MktEndAfSubstAbndAmt: int = Field(description="장종료후대용해지금액", default=0)
+
+
+# 선물옵션가정산예탁금상세
+class CFOEQ11100(BaseModel):
+    inblock1: CFOEQ11100InBlock1 = Field(description="CFOEQ11100InBlock1")
+    outblock1: CFOEQ11100OutBlock1 = Field(description="CFOEQ11100OutBlock1")
+    outblock2: CFOEQ11100OutBlock2 = Field(description="CFOEQ11100OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CFOEQ11100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
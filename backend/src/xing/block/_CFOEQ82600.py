@@ -0,0 +1,77 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CFOEQ82600 - 선물옵션 일별 계좌손익내역>
+class CFOEQ82600InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+    FnoBalEvalTpCode: str = Field(description="선물옵션잔고평가구분코드", default="")
+
+
+class CFOEQ82600OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QrySrtDt: str = Field(description="조회시작일", default="")
+    QryEndDt: str = Field(description="조회종료일", default="")
+    QryTp: str = Field(description="조회구분", default="")
+    StnlnSeqTp: str = Field(description="정렬순서구분", default="")
+    FnoBalEvalTpCode: str = Field(description="선물옵션잔고평가구분코드", default="")
+
+
+class CFOEQ82600OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    FutsAdjstDfamt: int = Field(description="선물정산차금", default=0)
+    OptBnsplAmt: int = Field(description="옵션매매손익금액", default=0)
+    FnoCmsnAmt: int = Field(description="선물옵션수수료", default=0)
+    PnlSumAmt: int = Field(description="손익합계금액", default=0)
+    MnyinSumAmt: int = Field(description="입금합계금액", default=0)
+    MnyoutSumAmt: int = Field(description="출금합계금액", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+
+
+class CFOEQ82600OutBlock3(BaseModel):
+    QryDt: str = Field(description="조회일", default="")
+    DpstgTotamt: int = Field(description="예탁총액", default=0)
+    DpstgMny: int = Field(description="예탁현금", default=0)
+    FnoMgn: int = Field(description="선물옵션증거금액", default=0)
+    FutsPnlAmt: int = Field(description="선물손익금액", default=0)
+    OptBsnPnlAmt: int = Field(description="옵션매매손익금액", default=0)
+    OptEvalPnlAmt: int = Field(description="옵션평가손익금액", default=0)
+    CmsnAmt: int = Field(description="수수료", default=0)
+    SumAmt1: int = Field(description="합계금액1", default=0)
+    SumAmt2: int = Field(description="합계금액", default=0)
+    PnlSumAmt: int = Field(description="손익합계금액", default=0)
+    FutsBuyAmt: int = Field(description="선물매수금액", default=0)
+    FutsSellAmt: int = Field(description="선물매도금액", default=0)
+    OptBuyAmt: int = Field(description="옵션매수금액", default=0)
+    OptSellAmt: int = Field(description="옵션매도금액", default=0)
+    InAmt: int = Field(description="입금액", default=0)
+    OutAmt: int = Field(description="출금액", default=0)
+    EvalAmt: int = Field(description="평가금액", default=0)
+    AddupEvalAmt: int = Field(description="합산평가금액", default=0)
+    Amt2: int = Field(description="금액2", default=0)
+
+
+# 선물옵션 일별 계좌손익내역
+class CFOEQ82600(BaseModel):
+    inblock1: CFOEQ82600InBlock1 = Field(description="CFOEQ82600InBlock1")
+    outblock1: CFOEQ82600OutBlock1 = Field(description="CFOEQ82600OutBlock1")
+    outblock2: CFOEQ82600OutBlock2 = Field(description="CFOEQ82600OutBlock2")
+    outblock3: List[CFOEQ82600OutBlock3] = Field(description="CFOEQ82600OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CFOEQ82600",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,92 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CFOFQ02400 - 계좌 미결제 약정현황(평균가)>
+class CFOFQ02400InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    RegMktCode: str = Field(description="등록시장코드", default="")
+    BuyDt: str = Field(description="매수일자", default="")
+
+
+class CFOFQ02400OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    RegMktCode: str = Field(description="등록시장코드", default="")
+    BuyDt: str = Field(description="매수일자", default="")
+
+
+class CFOFQ02400OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    FutsCtrctQty: int = Field(description="선물약정수량", default=0)
+    OptCtrctQty: int = Field(description="옵션약정수량", default=0)
+    CtrctQty: int = Field(description="약정수량", default=0)
+    FutsCtrctAmt: int = Field(description="선물약정금액", default=0)
+    FutsBuyctrAmt: int = Field(description="선물매수약정금액", default=0)
+    FutsSlctrAmt: int = Field(description="선물매도약정금액", default=0)
+    CalloptCtrctAmt: int = Field(description="콜옵션약정금액", default=0)
+    CallBuyAmt: int = Field(description="콜매수금액", default=0)
+    CallSellAmt: int = Field(description="콜매도금액", default=0)
+    PutoptCtrctAmt: int = Field(description="풋옵션약정금액", default=0)
+    PutBuyAmt: int = Field(description="풋매수금액", default=0)
+    PutSellAmt: int = Field(description="풋매도금액", default=0)
+    AllCtrctAmt: int = Field(description="전체약정금액", default=0)
+    BuyctrAsmAmt: int = Field(description="매수약정누계금액", default=0)
+    SlctrAsmAmt: int = Field(description="매도약정누계금액", default=0)
+    FutsPnlSum: int = Field(description="선물손익합계", default=0)
+    OptPnlSum: int = Field(description="옵션손익합계", default=0)
+    AllPnlSum: int = Field(description="전체손익합계", default=0)
+
+
+class CFOFQ02400OutBlock3(BaseModel):
+    FnoClssCode: str = Field(description="선물옵션품목구분", default="")
+    FutsSellQty: int = Field(description="선물매도수량", default=0)
+    FutsSellPnl: int = Field(description="선물매도손익", default=0)
+    FutsBuyQty: int = Field(description="선물매수수량", default=0)
+    FutsBuyPnl: int = Field(description="선물매수손익", default=0)
+    CallSellQty: int = Field(description="콜매도수량", default=0)
+    CallSellPnl: int = Field(description="콜매도손익", default=0)
+    CallBuyQty: int = Field(description="콜매수수량", default=0)
+    CallBuyPnl: int = Field(description="콜매수손익", default=0)
+    PutSellQty: int = Field(description="풋매도수량", default=0)
+    PutSellPnl: int = Field(description="풋매도손익", default=0)
+    PutBuyQty: int = Field(description="풋매수수량", default=0)
+    PutBuyPnl: int = Field(description="풋매수손익", default=0)
+
+
+class CFOFQ02400OutBlock4(BaseModel):
+    IsuNo: str = Field(description="종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    BnsTpCode: str = Field(description="매매구분", default="")
+    BnsTpNm: str = Field(description="매매구분", default="")
+    BalQty: int = Field(description="잔고수량", default=0)
+    FnoAvrPrc: float = Field(description="평균가", default=0.0)
+    BgnAmt: int = Field(description="당초금액", default=0)
+    ThdayLqdtQty: int = Field(description="당일청산수량", default=0)
+    Curprc: float = Field(description="현재가", default=0.0)
+    EvalAmt: int = Field(description="평가금액", default=0)
+    EvalPnlAmt: int = Field(description="평가손익금액", default=0)
+    EvalErnrat: float = Field(description="평가수익률", default=0.0)
+
+
+# 계좌 미결제 약정현황(평균가)
+class CFOFQ02400(BaseModel):
+    inblock1: CFOFQ02400InBlock1 = Field(description="CFOFQ02400InBlock1")
+    outblock1: CFOFQ02400OutBlock1 = Field(description="CFOFQ02400OutBlock1")
+    outblock2: CFOFQ02400OutBlock2 = Field(description="CFOFQ02400OutBlock2")
+    outblock3: List[CFOFQ02400OutBlock3] = Field(description="CFOFQ02400OutBlock3")
+    outblock: List[CFOFQ02400OutBlock4] = Field(description="CFOFQ02400OutBlock4")
+    metadata: dict = Field(
+        description="The metadata information for CFOFQ02400",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,74 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ01500 - 해외선물 미결제 잔고내역>
+class CIDBQ01500InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntTpCode: str = Field(description="계좌구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryDt: str = Field(description="조회일자", default="")
+    BalTpCode: str = Field(description="잔고구분코드", default="")
+
+
+class CIDBQ01500OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntTpCode: str = Field(description="계좌구분코드", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    QryDt: str = Field(description="조회일자", default="")
+    BalTpCode: str = Field(description="잔고구분코드", default="")
+
+
+class CIDBQ01500OutBlock2(BaseModel):
+    BaseDt: str = Field(description="기준일자", default="")
+    Dps: int = Field(description="예수금", default=0)
+    LpnlAmt: float = Field(description="청산손익금액", default=0.0)
+    FutsDueBfLpnlAmt: float = Field(description="선물만기전청산손익금액", default=0.0)
+    FutsDueBfCmsn: float = Field(description="선물만기전수수료", default=0.0)
+    CsgnMgn: int = Field(description="위탁증거금액", default=0)
+    MaintMgn: int = Field(description="유지증거금", default=0)
+    CtlmtAmt: float = Field(description="신용한도금액", default=0.0)
+    AddMgn: int = Field(description="추가증거금액", default=0)
+    MgnclRat: float = Field(description="마진콜율", default=0.0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    WthdwAbleAmt: int = Field(description="인출가능금액", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    CrcyCodeVal: str = Field(description="통화코드값", default="")
+    OvrsDrvtPrdtCode: str = Field(description="해외파생상품코드", default="")
+    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
+    DueDt: str = Field(description="만기일자", default="")
+    OvrsDrvtXrcPrc: float = Field(description="해외파생행사가격", default=0.0)
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    CmnCodeNm: str = Field(description="공통코드명", default="")
+    TpCodeNm: str = Field(description="구분코드명", default="")
+    BalQty: int = Field(description="잔고수량", default=0)
+    PchsPrc: float = Field(description="매입가격", default=0.0)
+    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
+    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
+    CsgnCmsn: float = Field(description="위탁수수료", default=0.0)
+    PosNo: str = Field(description="포지션번호", default="")
+    EufOneCmsnAmt: float = Field(description="거래소비용1수수료금액", default=0.0)
+    EufTwoCmsnAmt: float = Field(description="거래소비용2수수료금액", default=0.0)
+
+
+# 해외선물 미결제 잔고내역
+class CIDBQ01500(BaseModel):
+    inblock1: CIDBQ01500InBlock1 = Field(description="CIDBQ01500InBlock1")
+    outblock1: CIDBQ01500OutBlock1 = Field(description="CIDBQ01500OutBlock1")
+    outblock2: List[CIDBQ01500OutBlock2] = Field(description="CIDBQ01500OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ01500",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,98 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ01800 - 해외선물 주문체결내역 조회>
+class CIDBQ01800InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    OrdDt: str = Field(description="주문일자", default="")
+    ThdayTpCode: str = Field(description="당일구분코드", default="")
+    OrdStatCode: str = Field(description="주문상태코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
+
+
+class CIDBQ01800OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    OrdDt: str = Field(description="주문일자", default="")
+    ThdayTpCode: str = Field(description="당일구분코드", default="")
+    OrdStatCode: str = Field(description="주문상태코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
+
+
+class CIDBQ01800OutBlock2(BaseModel):
+    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    FcmOrdNo: str = Field(description="FCM주문번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    AbrdFutsXrcPrc: float = Field(description="해외선물행사가격", default=0.0)
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    BnsTpNm: str = Field(description="매매구분명", default="")
+    FutsOrdStatCode: str = Field(description="선물주문상태코드", default="")
+    TpCodeNm: str = Field(description="구분코드명", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    TrdTpNm: str = Field(description="거래구분명", default="")
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+    OrdPtnNm: str = Field(description="주문유형명", default="")
+    OrdPtnTermTpCode: str = Field(description="주문유형기간구분코드", default="")
+    CmnCodeNm: str = Field(description="공통코드명", default="")
+    AppSrtDt: str = Field(description="적용시작일자", default="")
+    AppEndDt: str = Field(description="적용종료일자", default="")
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    OrdQty: int = Field(description="주문수량", default=0)
+    OvrsDrvtExecIsuCode: str = Field(description="해외파생체결종목코드", default="")
+    ExecIsuNm: str = Field(description="체결종목명", default="")
+    ExecBnsTpCode: str = Field(description="체결매매구분코드", default="")
+    ExecBnsTpNm: str = Field(description="체결매매구분명", default="")
+    AbrdFutsExecPrc: float = Field(description="해외선물체결가격", default=0.0)
+    ExecQty: int = Field(description="체결수량", default=0)
+    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
+    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
+    MdfyQty: int = Field(description="정정수량", default=0)
+    CancQty: int = Field(description="취소수량", default=0)
+    RjtQty: int = Field(description="거부수량", default=0)
+    CnfQty: int = Field(description="확인수량", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    CvrgYn: str = Field(description="반대매매여부", default="")
+    RegTmnlNo: str = Field(description="등록단말번호", default="")
+    RegBrnNo: str = Field(description="등록지점번호", default="")
+    RegUserId: str = Field(description="등록사용자ID", default="")
+    OrdDt: str = Field(description="주문일자", default="")
+    OrdTime: str = Field(description="주문시각", default="")
+    OvrsOptXrcRsvTpCode: str = Field(description="해외옵션행사예약구분코드", default="")
+    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
+    SprdBaseIsuYn: str = Field(description="스프레드기준종목여부", default="")
+    OvrsFutsOrdDt: str = Field(description="해외선물주문일자", default="")
+    OvrsFutsOrdNo2: str = Field(description="해외선물주문번호2", default="")
+    OvrsFutsOrgOrdNo2: str = Field(description="해외선물원주문번호2", default="")
+    OvrsDrvtIsuCode2: str = Field(description="해외파생종목코드2", default="")
+
+
+# 해외선물 주문체결내역 조회
+class CIDBQ01800(BaseModel):
+    inblock1: CIDBQ01800InBlock1 = Field(description="CIDBQ01800InBlock1")
+    outblock1: CIDBQ01800OutBlock1 = Field(description="CIDBQ01800OutBlock1")
+    outblock2: List[CIDBQ01800OutBlock2] = Field(description="CIDBQ01800OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ01800",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,115 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ02400 - 해외선물 주문체결내역 상세 조회>
+class CIDBQ02400InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    QrySrtDt: str = Field(description="조회시작일자", default="")
+    QryEndDt: str = Field(description="조회종료일자", default="")
+    ThdayTpCode: str = Field(description="당일구분코드", default="")
+    OrdStatCode: str = Field(description="주문상태코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
+
+
+class CIDBQ02400OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    QrySrtDt: str = Field(description="조회시작일자", default="")
+    QryEndDt: str = Field(description="조회종료일자", default="")
+    ThdayTpCode: str = Field(description="당일구분코드", default="")
+    OrdStatCode: str = Field(description="주문상태코드", default="")
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    QryTpCode: str = Field(description="조회구분코드", default="")
+    OrdPtnCode: str = Field(description="주문유형코드", default="")
+    OvrsDrvtFnoTpCode: str = Field(description="해외파생선물옵션구분코드", default="")
+
+
+class CIDBQ02400OutBlock2(BaseModel):
+    OrdDt: str = Field(description="주문일자", default="")
+    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    FcmOrdNo: str = Field(description="FCM주문번호", default="")
+    ExecDt: str = Field(description="체결일자", default="")
+    OvrsFutsExecNo: str = Field(description="해외선물체결번호", default="")
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    AbrdFutsXrcPrc: float = Field(description="해외선물행사가격", default=0.0)
+    BnsTpCode: str = Field(description="매매구분코드", default="")
+    BnsTpNm: str = Field(description="매매구분명", default="")
+    FutsOrdStatCode: str = Field(description="선물주문상태코드", default="")
+    TpCodeNm: str = Field(description="구분코드명", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    TrdTpNm: str = Field(description="거래구분명", default="")
+    AbrdFutsOrdPtnCode: str = Field(description="해외선물주문유형코드", default="")
+    OrdPtnNm: str = Field(description="주문유형명", default="")
+    OrdPtnTermTpCode: str = Field(description="주문유형기간구분코드", default="")
+    CmnCodeNm: str = Field(description="공통코드명", default="")
+    AppSrtDt: str = Field(description="적용시작일자", default="")
+    AppEndDt: str = Field(description="적용종료일자", default="")
+    OrdQty: int = Field(description="주문수량", default=0)
+    OvrsDrvtOrdPrc: float = Field(description="해외파생주문가격", default=0.0)
+    OvrsDrvtExecIsuCode: str = Field(description="해외파생체결종목코드", default="")
+    ExecIsuNm: str = Field(description="체결종목명", default="")
+    ExecBnsTpCode: str = Field(description="체결매매구분코드", default="")
+    ExecBnsTpNm: str = Field(description="체결매매구분명", default="")
+    ExecQty: int = Field(description="체결수량", default=0)
+    AbrdFutsExecPrc: float = Field(description="해외선물체결가격", default=0.0)
+    OrdCndiPrc: float = Field(description="주문조건가격", default=0.0)
+    OvrsDrvtNowPrc: float = Field(description="해외파생현재가", default=0.0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    TrxStatCode: str = Field(description="처리상태코드", default="")
+    TrxStatCodeNm: str = Field(description="처리상태코드명", default="")
+    CsgnCmsn: float = Field(description="위탁수수료", default=0.0)
+    FcmCmsn: float = Field(description="FCM수수료", default=0.0)
+    ThcoCmsn: float = Field(description="당사수수료", default=0.0)
+    MdaCode: str = Field(description="매체코드", default="")
+    MdaCodeNm: str = Field(description="매체코드명", default="")
+    RegTmnlNo: str = Field(description="등록단말번호", default="")
+    RegUserId: str = Field(description="등록사용자ID", default="")
+    OrdSndDttm: str = Field(description="주문발송일시", default="")
+    ExecDttm: str = Field(description="체결일시", default="")
+    EufOneCmsnAmt: float = Field(description="거래소비용1수수료금액", default=0.0)
+    EufTwoCmsnAmt: float = Field(description="거래소비용2수수료금액", default=0.0)
+    LchOneCmsnAmt: float = Field(description="런던청산소1수수료금액", default=0.0)
+    LchTwoCmsnAmt: float = Field(description="런던청산소2수수료금액", default=0.0)
+    TrdOneCmsnAmt: float = Field(description="거래1수수료금액", default=0.0)
+    TrdTwoCmsnAmt: float = Field(description="거래2수수료금액", default=0.0)
+    TrdThreeCmsnAmt: float = Field(description="거래3수수료금액", default=0.0)
+    StrmOneCmsnAmt: float = Field(description="단기1수수료금액", default=0.0)
+    StrmTwoCmsnAmt: float = Field(description="단기2수수료금액", default=0.0)
+    StrmThreeCmsnAmt: float = Field(description="단기3수수료금액", default=0.0)
+    TransOneCmsnAmt: float = Field(description="전달1수수료금액", default=0.0)
+    TransTwoCmsnAmt: float = Field(description="전달2수수료금액", default=0.0)
+    TransThreeCmsnAmt: float = Field(description="전달3수수료금액", default=0.0)
+    TransFourCmsnAmt: float = Field(description="전달4수수료금액", default=0.0)
+    OvrsOptXrcRsvTpCode: str = Field(description="해외옵션행사예약구분코드", default="")
+    OvrsDrvtOptTpCode: str = Field(description="해외파생옵션구분코드", default="")
+    SprdBaseIsuYn: str = Field(description="스프레드기준종목여부", default="")
+    OvrsDrvtIsuCode2: str = Field(description="해외파생종목코드2", default="")
+
+
+# 해외선물 주문체결내역 상세 조회
+class CIDBQ02400(BaseModel):
+    inblock1: CIDBQ02400InBlock1 = Field(description="CIDBQ02400InBlock1")
+    outblock1: CIDBQ02400OutBlock1 = Field(description="CIDBQ02400OutBlock1")
+    outblock2: List[CIDBQ02400OutBlock2] = Field(description="CIDBQ02400OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ02400",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,90 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CIDBQ05300 - 해외선물 계좌예탁자산조회>
+class CIDBQ05300InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OvrsAcntTpCode: str = Field(description="해외계좌구분코드", default="")
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+
+
+class CIDBQ05300OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OvrsAcntTpCode: str = Field(description="해외계좌구분코드", default="")
+    FcmAcntNo: str = Field(description="FCM계좌번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    AcntPwd: str = Field(description="계좌비밀번호", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+
+
+class CIDBQ05300OutBlock2(BaseModel):
+    AcntNo: str = Field(description="계좌번호", default="")
+    CrcyCode: str = Field(description="통화코드", default="")
+    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
+    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
+    OvrsFutsSplmMgn: float = Field(description="해외선물추가증거금", default=0.0)
+    CustmLpnlAmt: float = Field(description="고객청산손익금액", default=0.0)
+    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
+    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
+    AbrdFutsEvalDpstgTotAmt: float = Field(description="해외선물평가예탁총금액", default=0.0)
+    Xchrat: float = Field(description="환율", default=0.0)
+    FcurrRealMxchgAmt: float = Field(description="외화실환전금액", default=0.0)
+    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
+    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
+    FutsDueNarrvLqdtPnlAmt: float = Field(description="선물만기미도래청산손익금액", default=0.0)
+    FutsDueNarrvCmsn: float = Field(description="선물만기미도래수수료", default=0.0)
+    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
+    OvrsFutsDueCmsn: float = Field(description="해외선물만기수수료", default=0.0)
+    OvrsFutsOptBuyAmt: float = Field(description="해외선물옵션매수금액", default=0.0)
+    OvrsFutsOptSellAmt: float = Field(description="해외선물옵션매도금액", default=0.0)
+    OptBuyMktWrthAmt: float = Field(description="옵션매수시장가치금액", default=0.0)
+    OptSellMktWrthAmt: float = Field(description="옵션매도시장가치금액", default=0.0)
+
+
+class CIDBQ05300OutBlock3(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OvrsFutsDps: float = Field(description="해외선물예수금", default=0.0)
+    AbrdFutsLqdtPnlAmt: float = Field(description="해외선물청산손익금액", default=0.0)
+    FutsDueNarrvLqdtPnlAmt: float = Field(description="선물만기미도래청산손익금액", default=0.0)
+    AbrdFutsEvalPnlAmt: float = Field(description="해외선물평가손익금액", default=0.0)
+    AbrdFutsEvalDpstgTotAmt: float = Field(description="해외선물평가예탁총금액", default=0.0)
+    CustmLpnlAmt: float = Field(description="고객청산손익금액", default=0.0)
+    OvrsFutsDueCmsn: float = Field(description="해외선물만기수수료", default=0.0)
+    FcurrRealMxchgAmt: float = Field(description="외화실환전금액", default=0.0)
+    AbrdFutsCmsnAmt: float = Field(description="해외선물수수료금액", default=0.0)
+    FutsDueNarrvCmsn: float = Field(description="선물만기미도래수수료", default=0.0)
+    AbrdFutsCsgnMgn: float = Field(description="해외선물위탁증거금액", default=0.0)
+    OvrsFutsMaintMgn: float = Field(description="해외선물유지증거금", default=0.0)
+    OvrsFutsOptBuyAmt: float = Field(description="해외선물옵션매수금액", default=0.0)
+    OvrsFutsOptSellAmt: float = Field(description="해외선물옵션매도금액", default=0.0)
+    CtlmtAmt: float = Field(description="신용한도금액", default=0.0)
+    OvrsFutsSplmMgn: float = Field(description="해외선물추가증거금", default=0.0)
+    MgnclRat: float = Field(description="마진콜율", default=0.0)
+    AbrdFutsOrdAbleAmt: float = Field(description="해외선물주문가능금액", default=0.0)
+    AbrdFutsWthdwAbleAmt: float = Field(description="해외선물인출가능금액", default=0.0)
+    OptBuyMktWrthAmt: float = Field(description="옵션매수시장가치금액", default=0.0)
+    OptSellMktWrthAmt: float = Field(description="옵션매도시장가치금액", default=0.0)
+    OvrsOptSettAmt: float = Field(description="해외옵션결제금액", default=0.0)
+    OvrsOptBalEvalAmt: float = Field(description="해외옵션잔고평가금액", default=0.0)
+
+
+# 해외선물 계좌예탁자산조회
+class CIDBQ05300(BaseModel):
+    inblock1: CIDBQ05300InBlock1 = Field(description="CIDBQ05300InBlock1")
+    outblock1: CIDBQ05300OutBlock1 = Field(description="CIDBQ05300OutBlock1")
+    outblock2: List[CIDBQ05300OutBlock2] = Field(description="CIDBQ05300OutBlock2")
+    outblock3: CIDBQ05300OutBlock3 = Field(description="CIDBQ05300OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CIDBQ05300",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,51 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CIDBT01000 - 해외선물취소주문>
+class CIDBT01000InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    BrnNo: str = Field(description="지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    PrdtTpCode: str = Field(description="상품구분코드", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT01000OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    OrdDt: str = Field(description="주문일자", default="")
+    BrnNo: str = Field(description="지점번호", default="")
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    IsuCodeVal: str = Field(description="종목코드값", default="")
+    OvrsFutsOrgOrdNo: str = Field(description="해외선물원주문번호", default="")
+    FutsOrdTpCode: str = Field(description="선물주문구분코드", default="")
+    PrdtTpCode: str = Field(description="상품구분코드", default="")
+    ExchCode: str = Field(description="거래소코드", default="")
+
+
+class CIDBT01000OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    OvrsFutsOrdNo: str = Field(description="해외선물주문번호", default="")
+    InnerMsgCnts: str = Field(description="내부메시지내용", default="")
+
+
+# 해외선물취소주문
+class CIDBT01000(BaseModel):
+    inblock1: CIDBT01000InBlock1 = Field(description="CIDBT01000InBlock1")
+    outblock1: CIDBT01000OutBlock1 = Field(description="CIDBT01000OutBlock1")
+    outblock2: CIDBT01000OutBlock2 = Field(description="CIDBT01000OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CIDBT01000",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
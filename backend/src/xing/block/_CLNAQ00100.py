@@ -0,0 +1,68 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CLNAQ00100 - 예탁담보융자가능종목현황조회>
+class CLNAQ00100InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTp: str = Field(description="조회구분", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    SecTpCode: str = Field(description="유가증권구분", default="")
+    LoanIntrstGrdCode: str = Field(description="대출이자등급코드", default="")
+    LoanTp: str = Field(description="대출구분", default="")
+
+
+class CLNAQ00100OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    QryTp: str = Field(description="조회구분", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    SecTpCode: str = Field(description="유가증권구분", default="")
+    LoanIntrstGrdCode: str = Field(description="대출이자등급코드", default="")
+    LoanTp: str = Field(description="대출구분", default="")
+
+
+class CLNAQ00100OutBlock2(BaseModel):
+    IsuNo: str = Field(description="종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    Parprc: float = Field(description="액면가", default=0.0)
+    PrdayCprc: float = Field(description="전일종가", default=0.0)
+    RatVal: float = Field(description="비율값", default=0.0)
+    SubstPrc: float = Field(description="대용가", default=0.0)
+    RegTpNm: str = Field(description="등록구분", default="")
+    SpotMgnLevyClssNm: str = Field(description="현물증거금징수분류명", default="")
+    FnoTrdStopRsnCnts: str = Field(description="거래정지사유", default="")
+    DgrsPtnNm: str = Field(description="요주의유형명", default="")
+    AcdPtnNm: str = Field(description="사고유형", default="")
+    MktTpNm: str = Field(description="시장구분", default="")
+    LmtVal: int = Field(description="한도값", default=0)
+    AcntLmtVal: int = Field(description="계좌한도값", default=0)
+    LoanGrdCode: str = Field(description="대출등급코드", default="")
+    LoanAmt: int = Field(description="대출금액", default=0)
+    LoanAbleRat: float = Field(description="대출가능율", default=0.0)
+    LoanIntrat1: float = Field(description="대출이율1", default=0.0)
+    RegPsnId: str = Field(description="등록자ID", default="")
+    Rat01: float = Field(description="비율값", default=0.0)
+    Rat02: float = Field(description="비율값", default=0.0)
+
+
+class CLNAQ00100OutBlock3(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    LrgMnyoutSumAmt: int = Field(description="대출금합계금액", default=0)
+
+
+# 예탁담보융자가능종목현황조회
+class CLNAQ00100(BaseModel):
+    inblock1: CLNAQ00100InBlock1 = Field(description="CLNAQ00100InBlock1")
+    outblock1: CLNAQ00100OutBlock1 = Field(description="CLNAQ00100OutBlock1")
+    outblock2: List[CLNAQ00100OutBlock2] = Field(description="CLNAQ00100OutBlock2")
+    outblock3: CLNAQ00100OutBlock3 = Field(description="CLNAQ00100OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CLNAQ00100",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
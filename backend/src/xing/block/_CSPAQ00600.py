@@ -0,0 +1,74 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <CSPAQ00600 - 계좌별신용한도조회>
+class CSPAQ00600InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CSPAQ00600OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    InptPwd: str = Field(description="입력비밀번호", default="")
+    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
+    IsuNo: str = Field(description="종목번호", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    CommdaCode: str = Field(description="통신매체코드", default="")
+
+
+class CSPAQ00600OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNm: str = Field(description="계좌명", default="")
+    OrdPrc: float = Field(description="주문가", default=0.0)
+    SloanLmtAmt: int = Field(description="대주한도", default=0)
+    SloanAmtSum: int = Field(description="대주금액합계", default=0)
+    SloanNewAmt: int = Field(description="대주신규금액", default=0)
+    SloanRfundAmt: int = Field(description="대주상환금액", default=0)
+    MktcplMloanLmtAmt: int = Field(description="유통융자한도금액", default=0)
+    MktcplMloanAmtSum: int = Field(description="유통융자금액합계", default=0)
+    MktcplMloanNewAmt: int = Field(description="유통융자신규금액", default=0)
+    MktcplMloanRfundAmt: int = Field(description="유통융자상환금액", default=0)
+    SfaccMloanLmtAmt: int = Field(description="자기융자한도금액", default=0)
+    SfaccMloanAmtSum: int = Field(description="자기융자금액합계", default=0)
+    SfaccMloanNewAmt: int = Field(description="자기융자신규금액", default=0)
+    SfaccMloanRfundAmt: int = Field(description="자기융자상환금액", default=0)
+    BrnMktcplMloanLmtAmt: int = Field(description="지점유통융자한도금액", default=0)
+    BrnMktcplMloanNewAmt: int = Field(description="지점유통융자신규금액", default=0)
+    BrnMktcplMloanRfundAmt: int = Field(description="지점유통융자상환금액", default=0)
+    BrnMktcplMloanUseAmt: int = Field(description="지점유통융자사용금액", default=0)
+    BrnSfaccMloanLmtAmt: int = Field(description="지점자기융자한도금액", default=0)
+    BrnSfaccMloanNewAmt: int = Field(description="지점자기융자신규금액", default=0)
+    BrnSfaccMloanRfundAmt: int = Field(description="지점자기융자상환금액", default=0)
+    BrnSfaccMloanUseAmt: int = Field(description="지점자기융자사용금액", default=0)
+    FirmMloanLmtMgmtYn: str = Field(description="이용사융자한도관리여부", default="")
+    FirmCrdtIsuRestrcTp: str = Field(description="이용사신용종목제한구분", default="")
+    PldgMaintRat: float = Field(description="담보유지비율", default=0.0)
+    FirmNm: str = Field(description="이용사명", default="")
+    PldgRat: float = Field(description="담보비율", default=0.0)
+    DpsastSum: int = Field(description="예탁자산합계", default=0)
+    LmtChgAbleAmt: int = Field(description="한도변경가능금액", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    OrdAbleQty: int = Field(description="주문가능수량", default=0)
+    RcvblUablOrdAbleQty: int = Field(description="미수불가주문가능수량", default=0)
+
+
+# 계좌별신용한도조회
+class CSPAQ00600(BaseModel):
+    inblock1: CSPAQ00600InBlock1 = Field(description="CSPAQ00600InBlock1")
+    outblock1: CSPAQ00600OutBlock1 = Field(description="CSPAQ00600OutBlock1")
+    outblock2: CSPAQ00600OutBlock2 = Field(description="CSPAQ00600OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for CSPAQ00600",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,158 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <CSPAQ12300 - BEP단가조회>
+class CSPAQ12300InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BalCreTp: str = Field(description="잔고생성구분", default="")
+    CmsnAppTpCode: str = Field(description="수수료적용구분", default="")
+    D2balBaseQryTp: str = Field(description="D2잔고기준조회구분", default="")
+    UprcTpCode: str = Field(description="단가구분", default="")
+
+
+class CSPAQ12300OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    AcntNo: str = Field(description="계좌번호", default="")
+    Pwd: str = Field(description="비밀번호", default="")
+    BalCreTp: str = Field(description="잔고생성구분", default="")
+    CmsnAppTpCode: str = Field(description="수수료적용구분", default="")
+    D2balBaseQryTp: str = Field(description="D2잔고기준조회구분", default="")
+    UprcTpCode: str = Field(description="단가구분", default="")
+
+
+class CSPAQ12300OutBlock2(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    BrnNm: str = Field(description="지점명", default="")
+    AcntNm: str = Field(description="계좌명", default="")
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    MnyoutAbleAmt: int = Field(description="출금가능금액", default=0)
+    SeOrdAbleAmt: int = Field(description="거래소금액", default=0)
+    KdqOrdAbleAmt: int = Field(description="코스닥금액", default=0)
+    HtsOrdAbleAmt: int = Field(description="HTS주문가능금액", default=0)
+    MgnRat100pctOrdAbleAmt: int = Field(description="증거금률100퍼센트주문가능금액", default=0)
+    BalEvalAmt: int = Field(description="잔고평가금액", default=0)
+    PchsAmt: int = Field(description="매입금액", default=0)
+    RcvblAmt: int = Field(description="미수금액", default=0)
+    PnlRat: float = Field(description="손익율", default=0.0)
+    InvstOrgAmt: int = Field(description="투자원금", default=0)
+    InvstPlAmt: int = Field(description="투자손익금액", default=0)
+    CrdtPldgOrdAmt: int = Field(description="신용담보주문금액", default=0)
+    Dps: int = Field(description="예수금", default=0)
+    D1Dps: int = Field(description="D1예수금", default=0)
+    D2Dps: int = Field(description="D2예수금", default=0)
+    OrdDt: str = Field(description="주문일", default="")
+    MnyMgn: int = Field(description="현금증거금액", default=0)
+    SubstMgn: int = Field(description="대용증거금액", default=0)
+    SubstAmt: int = Field(description="대용금액", default=0)
+    PrdayBuyExecAmt: int = Field(description="전일매수체결금액", default=0)
+    PrdaySellExecAmt: int = Field(description="전일매도체결금액", default=0)
+    CrdayBuyExecAmt: int = Field(description="금일매수체결금액", default=0)
+    CrdaySellExecAmt: int = Field(description="금일매도체결금액", default=0)
+    EvalPnlSum: int = Field(description="평가손익합계", default=0)
+    DpsastTotamt: int = Field(description="예탁자산총액", default=0)
+    Evrprc: int = Field(description="제비용", default=0)
+    RuseAmt: int = Field(description="재사용금액", default=0)
+    EtclndAmt: int = Field(description="기타대여금액", default=0)
+    PrcAdjstAmt: int = Field(description="가정산금액", default=0)
+    D1CmsnAmt: int = Field(description="D1수수료", default=0)
+    D2CmsnAmt: int = Field(description="D2수수료", default=0)
+    D1EvrTax: int = Field(description="D1제세금", default=0)
+    D2EvrTax: int = Field(description="D2제세금", default=0)
+    D1SettPrergAmt: int = Field(description="D1결제예정금액", default=0)
+    D2SettPrergAmt: int = Field(description="D2결제예정금액", default=0)
+    PrdayKseMnyMgn: int = Field(description="전일KSE현금증거금", default=0)
+    PrdayKseSubstMgn: int = Field(description="전일KSE대용증거금", default=0)
+    PrdayKseCrdtMnyMgn: int = Field(description="전일KSE신용현금증거금", default=0)
+    PrdayKseCrdtSubstMgn: int = Field(description="전일KSE신용대용증거금", default=0)
+    CrdayKseMnyMgn: int = Field(description="금일KSE현금증거금", default=0)
+    CrdayKseSubstMgn: int = Field(description="금일KSE대용증거금", default=0)
+    CrdayKseCrdtMnyMgn: int = Field(description="금일KSE신용현금증거금", default=0)
+    CrdayKseCrdtSubstMgn: int = Field(description="금일KSE신용대용증거금", default=0)
+    PrdayKdqMnyMgn: int = Field(description="전일코스닥현금증거금", default=0)
+    PrdayKdqSubstMgn: int = Field(description="전일코스닥대용증거금", default=0)
+    PrdayKdqCrdtMnyMgn: int = Field(description="전일코스닥신용현금증거금", default=0)
+    PrdayKdqCrdtSubstMgn: int = Field(description="전일코스닥신용대용증거금", default=0)
+    CrdayKdqMnyMgn: int = Field(description="금일코스닥현금증거금", default=0)
+    CrdayKdqSubstMgn: int = Field(description="금일코스닥대용증거금", default=0)
+    CrdayKdqCrdtMnyMgn: int = Field(description="금일코스닥신용현금증거금", default=0)
+    CrdayKdqCrdtSubstMgn: int = Field(description="금일코스닥신용대용증거금", default=0)
+    PrdayFrbrdMnyMgn: int = Field(description="전일프리보드현금증거금", default=0)
+    PrdayFrbrdSubstMgn: int = Field(description="전일프리보드대용증거금", default=0)
+    CrdayFrbrdMnyMgn: int = Field(description="금일프리보드현금증거금", default=0)
+    CrdayFrbrdSubstMgn: int = Field(description="금일프리보드대용증거금", default=0)
+    PrdayCrbmkMnyMgn: int = Field(description="전일장외현금증거금", default=0)
+    PrdayCrbmkSubstMgn: int = Field(description="전일장외대용증거금", default=0)
+    CrdayCrbmkMnyMgn: int = Field(description="금일장외현금증거금", default=0)
+    CrdayCrbmkSubstMgn: int = Field(description="금일장외대용증거금", default=0)
+    DpspdgQty: int = Field(description="예탁담보수량", default=0)
+    BuyAdjstAmtD2: int = Field(description="매수정산금(D+2)", default=0)
+    SellAdjstAmtD2: int = Field(description="매도정산금(D+2)", default=0)
+    RepayRqrdAmtD1: int = Field(description="변제소요금(D+1)", default=0)
+    RepayRqrdAmtD2: int = Field(description="변제소요금(D+2)", default=0)
+    LoanAmt: int = Field(description="대출금액", default=0)
+
+
+class CSPAQ12300OutBlock3(BaseModel):
+    IsuNo: str = Field(description="종목번호", default="")
+    IsuNm: str = Field(description="종목명", default="")
+    SecBalPtnCode: str = Field(description="유가증권잔고유형코드", default="")
+    SecBalPtnNm: str = Field(description="유가증권잔고유형명", default="")
+    BalQty: int = Field(description="잔고수량", default=0)
+    BnsBaseBalQty: int = Field(description="매매기준잔고수량", default=0)
+    CrdayBuyExecQty: int = Field(description="금일매수체결수량", default=0)
+    CrdaySellExecQty: int = Field(description="금일매도체결수량", default=0)
+    SellPrc: float = Field(description="매도가", default=0.0)
+    BuyPrc: float = Field(description="매수가", default=0.0)
+    SellPnlAmt: int = Field(description="매도손익금액", default=0)
+    PnlRat: float = Field(description="손익율", default=0.0)
+    NowPrc: float = Field(description="현재가", default=0.0)
+    CrdtAmt: int = Field(description="신용금액", default=0)
+    DueDt: str = Field(description="만기일", default="")
+    PrdaySellExecPrc: float = Field(description="전일매도체결가", default=0.0)
+    PrdaySellQty: int = Field(description="전일매도수량", default=0)
+    PrdayBuyExecPrc: float = Field(description="전일매수체결가", default=0.0)
+    PrdayBuyQty: int = Field(description="전일매수수량", default=0)
+    LoanDt: str = Field(description="대출일", default="")
+    AvrUprc: float = Field(description="평균단가", default=0.0)
+    SellAbleQty: int = Field(description="매도가능수량", default=0)
+    SellOrdQty: int = Field(description="매도주문수량", default=0)
+    CrdayBuyExecAmt: int = Field(description="금일매수체결금액", default=0)
+    CrdaySellExecAmt: int = Field(description="금일매도체결금액", default=0)
+    PrdayBuyExecAmt: int = Field(description="전일매수체결금액", default=0)
+    PrdaySellExecAmt: int = Field(description="전일매도체결금액", default=0)
+    BalEvalAmt: int = Field(description="잔고평가금액", default=0)
+    EvalPnl: int = Field(description="평가손익", default=0)
+    MnyOrdAbleAmt: int = Field(description="현금주문가능금액", default=0)
+    OrdAbleAmt: int = Field(description="주문가능금액", default=0)
+    SellUnercQty: int = Field(description="매도미체결수량", default=0)
+    SellUnsttQty: int = Field(description="매도미결제수량", default=0)
+    BuyUnercQty: int = Field(description="매수미체결수량", default=0)
+    BuyUnsttQty: int = Field(description="매수미결제수량", default=0)
+    UnsttQty: int = Field(description="미결제수량", default=0)
+    UnercQty: int = Field(description="미체결수량", default=0)
+    PrdayCprc: float = Field(description="전일종가", default=0.0)
+    PchsAmt: int = Field(description="매입금액", default=0)
+    RegMktCode: str = Field(description="등록시장코드", default="")
+    LoanDtlClssCode: str = Field(description="대출상세분류코드", default="")
+    DpspdgLoanQty: int = Field(description="예탁담보대출수량", default=0)
+
+
+# BEP단가조회
+class CSPAQ12300(BaseModel):
+    inblock1: CSPAQ12300InBlock1 = Field(description="CSPAQ12300InBlock1")
+    outblock1: CSPAQ12300OutBlock1 = Field(description="CSPAQ12300OutBlock1")
+    outblock2: CSPAQ12300OutBlock2 = Field(description="CSPAQ12300OutBlock2")
+    outblock3: List[CSPAQ12300OutBlock3] = Field(description="CSPAQ12300OutBlock3")
+    metadata: dict = Field(
+        description="The metadata information for CSPAQ12300",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,55 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <ChartExcel - 챠트엑셀데이터조회>
+class ChartExcelInBlock(BaseModel):
+    indexid: int = Field(description="지표ID", default=0)
+    indexname: str = Field(description="지표명", default="")
+    indexparam: str = Field(description="지표조건설정", default="")
+    indexouttype: str = Field(description="결과데이터 구분", default="")
+    market: str = Field(description="시장구분", default="")
+    period: str = Field(description="주기구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    isexcelout: str = Field(description="결과 지표데이터 엑셀표시 여부", default="")
+    excelfilename: str = Field(description="엑셀데이터 파일명", default="")
+    IsReal: str = Field(description="실시간 데이터수신 자동등록 여부", default="")
+
+
+class ChartExcelOutBlock(BaseModel):
+    indexid: int = Field(description="지표ID", default=0)
+    rec_cnt: int = Field(description="레코드갯수", default=0)
+    validdata_cnt: int = Field(description="유효 데이터 컬럼 갯수", default=0)
+
+
+class ChartExcelOutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    value1: float = Field(description="지표값1", default=0.0)
+    value2: float = Field(description="지표값2", default=0.0)
+    value3: float = Field(description="지표값3", default=0.0)
+    value4: float = Field(description="지표값4", default=0.0)
+    value5: float = Field(description="지표값5", default=0.0)
+    pos: int = Field(description="위치", default=0)
+
+
+# 챠트엑셀데이터조회
+class ChartExcel(BaseModel):
+    inblock: ChartExcelInBlock = Field(description="ChartExcelInBlock")
+    outblock: ChartExcelOutBlock = Field(description="ChartExcelOutBlock")
+    outblock1: List[ChartExcelOutBlock1] = Field(description="ChartExcelOutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for ChartExcel",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,58 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <ChartIndex - 챠트지표데이터조회>
+class ChartIndexInBlock(BaseModel):
+    indexid: int = Field(description="지표ID", default=0)
+    indexname: str = Field(description="지표명", default="")
+    indexparam: str = Field(description="지표조건설정", default="")
+    market: str = Field(description="시장구분", default="")
+    period: str = Field(description="주기구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    qrycnt: int = Field(description="요청건수(최대 500개)", default=0)
+    ncnt: int = Field(description="단위(n틱/n분)", default=0)
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+    Isamend: str = Field(description="수정주가 반영 여부", default="")
+    Isgab: str = Field(description="갭보정 여부", default="")
+    IsReal: str = Field(description="실시간 데이터수신 자동등록 여부", default="")
+
+
+class ChartIndexOutBlock(BaseModel):
+    indexid: int = Field(description="지표ID", default=0)
+    rec_cnt: int = Field(description="레코드갯수", default=0)
+    validdata_cnt: int = Field(description="유효 데이터 컬럼 갯수", default=0)
+
+
+class ChartIndexOutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    value1: float = Field(description="지표값1", default=0.0)
+    value2: float = Field(description="지표값2", default=0.0)
+    value3: float = Field(description="지표값3", default=0.0)
+    value4: float = Field(description="지표값4", default=0.0)
+    value5: float = Field(description="지표값5", default=0.0)
+    pos: int = Field(description="위치", default=0)
+
+
+# 챠트지표데이터조회
+class ChartIndex(BaseModel):
+    inblock: ChartIndexInBlock = Field(description="ChartIndexInBlock")
+    outblock: ChartIndexOutBlock = Field(description="ChartIndexOutBlock")
+    outblock1: List[ChartIndexOutBlock1] = Field(description="ChartIndexOutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for ChartIndex",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
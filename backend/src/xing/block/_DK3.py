@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <DK3 - KOSDAQ시간외단일가체결(DK3)>
+class DK3InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class DK3OutBlock(BaseModel):
+    dan_chetime: str = Field(description="시간외단일가체결시간", default="")
+    dan_sign: str = Field(description="시간외단일가전일대비구분", default="")
+    dan_change: int = Field(description="시간외단일가전일대비", default=0)
+    dan_drate: float = Field(description="시간외단일가등락율", default=0.0)
+    dan_price: int = Field(description="시간외단일가현재가", default=0)
+    dan_opentime: str = Field(description="시간외단일가시가시간", default="")
+    dan_open: int = Field(description="시간외단일가시가", default=0)
+    dan_hightime: str = Field(description="시간외단일가고가시간", default="")
+    dan_high: int = Field(description="시간외단일가고가", default=0)
+    dan_lowtime: str = Field(description="시간외단일가저가시간", default="")
+    dan_low: int = Field(description="시간외단일가저가", default=0)
+    dan_cgubun: str = Field(description="시간외단일가체결구분", default="")
+    dan_cvolume: int = Field(description="시간외단일가체결량", default=0)
+    dan_volume: int = Field(description="시간외단일가누적거래량", default=0)
+    dan_value: int = Field(description="시간외단일가누적거래대금", default=0)
+    dan_mdvolume: int = Field(description="시간외단일가매도누적체결량", default=0)
+    dan_mdchecnt: int = Field(description="시간외단일가매도누적체결건수", default=0)
+    dan_msvolume: int = Field(description="시간외단일가매수누적체결량", default=0)
+    dan_mschecnt: int = Field(description="시간외단일가매수누적체결건수", default=0)
+    dan_prevolume: int = Field(description="시간외단일가직전거래량", default=0)
+    dan_precvolume: int = Field(description="시간외단일가직전체결수량", default=0)
+    dan_cpower: float = Field(description="시간외단일가체결강도", default=0.0)
+    dan_status: str = Field(description="시간외단일가장정보", default="")
+    shcode: str = Field(description="단축코드", default="")
+
+
+# KOSDAQ시간외단일가체결(DK3)
+class DK3(BaseModel):
+    inblock: DK3InBlock = Field(description="DK3InBlock")
+    outblock: DK3OutBlock = Field(description="DK3OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for DK3",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
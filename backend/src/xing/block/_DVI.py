@@ -0,0 +1,31 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <DVI - 시간외단일가VI발동해제(DVI)>
+class DVIInBlock(BaseModel):
+    shcode: str = Field(description="단축코드(KEY)", default="")
+
+
+class DVIOutBlock(BaseModel):
+    vi_gubun: str = Field(description="구분(0:해제 1:정적발동 2:동적발동 3:정적&동적)", default="")
+    svi_recprice: int = Field(description="정적VI발동기준가격", default=0)
+    dvi_recprice: int = Field(description="동적VI발동기준가격", default=0)
+    vi_trgprice: int = Field(description="VI발동가격", default=0)
+    shcode: str = Field(description="단축코드(KEY)", default="")
+    ref_shcode: str = Field(description="참조코드(미사용)", default="")
+    time: str = Field(description="시간", default="")
+
+
+# 시간외단일가VI발동해제(DVI)
+class DVI(BaseModel):
+    inblock: DVIInBlock = Field(description="DVIInBlock")
+    outblock: DVIOutBlock = Field(description="DVIOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for DVI",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
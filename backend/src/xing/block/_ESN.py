@@ -0,0 +1,40 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <ESN - 뉴ELW투자지표민감도(ESN)>
+class ESNInBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class ESNOutBlock(BaseModel):
+    time: str = Field(description="시간", default="")
+    theoryprice: float = Field(description="장중이론가", default=0.0)
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    ceta: float = Field(description="세타", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    rhox: float = Field(description="로우", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    egearing: float = Field(description="E.기어링", default=0.0)
+    shcode: str = Field(description="단축코드", default="")
+    elwclose: int = Field(description="ELW현재가", default=0)
+    sign: str = Field(description="ELW전일대비구분", default="")
+    change: int = Field(description="ELW전일대비", default=0)
+    date: str = Field(description="일자", default="")
+    tickvalue: float = Field(description="틱환산", default=0.0)
+    lp_impv: float = Field(description="LP내재변동성", default=0.0)
+
+
+# 뉴ELW투자지표민감도(ESN)
+class ESN(BaseModel):
+    inblock: ESNInBlock = Field(description="ESNInBlock")
+    outblock: ESNOutBlock = Field(description="ESNOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for ESN",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
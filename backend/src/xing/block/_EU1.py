@@ -0,0 +1,138 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <EU1 - EUX체결>
+class EU1OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    accno: str = Field(description="계좌번호", default="")
+    user: str = Field(description="조작자ID", default="")
+    len: int = Field(description="헤더길이", default=0)
+    gubun: str = Field(description="헤더구분", default="")
+    compress: str = Field(description="압축구분", default="")
+    encrypt: str = Field(description="암호구분", default="")
+    offset: int = Field(description="공통시작지점", default=0)
+    trcode: str = Field(description="TRCODE", default="")
+    comid: str = Field(description="이용사번호", default="")
+    userid: str = Field(description="사용자ID", default="")
+    media: str = Field(description="접속매체", default="")
+    ifid: str = Field(description="I/F일련번호", default="")
+    seq: str = Field(description="전문일련번호", default="")
+    trid: str = Field(description="TR추적ID", default="")
+    pubip: str = Field(description="공인IP", default="")
+    prvip: str = Field(description="사설IP", default="")
+    pcbpno: str = Field(description="처리지점번호", default="")
+    bpno: str = Field(description="지점번호", default="")
+    termno: str = Field(description="단말번호", default="")
+    lang: str = Field(description="언어구분", default="")
+    proctm: int = Field(description="AP처리시간", default=0)
+    msgcode: str = Field(description="메세지코드", default="")
+    outgu: str = Field(description="메세지출력구분", default="")
+    compreq: str = Field(description="압축요청구분", default="")
+    funckey: str = Field(description="기능키", default="")
+    reqcnt: int = Field(description="요청레코드개수", default=0)
+    filler: str = Field(description="예비영역", default="")
+    cont: str = Field(description="연속구분", default="")
+    contkey: str = Field(description="연속키값", default="")
+    varlen: int = Field(description="가변시스템길이", default=0)
+    varhdlen: int = Field(description="가변해더길이", default=0)
+    varmsglen: int = Field(description="가변메시지길이", default=0)
+    trsrc: str = Field(description="조회발원지", default="")
+    eventid: str = Field(description="I/F이벤트ID", default="")
+    ifinfo: str = Field(description="I/F정보", default="")
+    filler1: str = Field(description="예비영역", default="")
+    trcode1: str = Field(description="tr코드", default="")
+    firmno: str = Field(description="회사번호", default="")
+    acntno: str = Field(description="계좌번호", default="")
+    acntno1: str = Field(description="계좌번호", default="")
+    acntnm: str = Field(description="계좌명", default="")
+    brnno: str = Field(description="지점번호", default="")
+    ordmktcode: str = Field(description="주문시장코드", default="")
+    ordno1: str = Field(description="주문번호", default="")
+    ordno: int = Field(description="주문번호", default=0)
+    orgordno1: str = Field(description="원주문번호", default="")
+    orgordno: int = Field(description="원주문번호", default=0)
+    prntordno: str = Field(description="모주문번호", default="")
+    prntordno1: int = Field(description="모주문번호", default=0)
+    isuno: str = Field(description="종목번호", default="")
+    fnoIsuno: str = Field(description="선물옵션종목번호", default="")
+    fnoIsunm: str = Field(description="선물옵션종목명", default="")
+    pdgrpcode: str = Field(description="상품군분류코드", default="")
+    fnoIsuptntp: str = Field(description="선물옵션종목유형구분", default="")
+    bnstp: str = Field(description="매매구분", default="")
+    mrctp: str = Field(description="정정취소구분", default="")
+    ordqty: int = Field(description="주문수량", default=0)
+    hogatype: str = Field(description="호가유형코드", default="")
+    mmgb: str = Field(description="거래유형코드", default="")
+    ordprc: float = Field(description="주문가격", default=0.0)
+    unercqty: int = Field(description="미체결수량", default=0)
+    commdacode: str = Field(description="통신매체", default="")
+    peeamtcode: str = Field(description="수수료합산코드", default="")
+    mgempno: str = Field(description="관리사원", default="")
+    fnotrdunitamt: float = Field(description="선물옵션거래단위금액", default=0.0)
+    trxtime: str = Field(description="처리시각", default="")
+    strtgcode: str = Field(description="전략코드", default="")
+    grpId: str = Field(description="그룹Id", default="")
+    ordseqno: str = Field(description="주문회차", default="")
+    ptflno: str = Field(description="포트폴리오 번호", default="")
+    bskno: str = Field(description="바스켓번호", default="")
+    trchno: str = Field(description="트렌치번호", default="")
+    Itemno: str = Field(description="아이템번호", default="")
+    OrderID: str = Field(description="주문자Id", default="")
+    opdrtnno: str = Field(description="운영지시번호", default="")
+    rjtcode: str = Field(description="부적격코드", default="")
+    mrccnfqty: int = Field(description="정정취소확인수량", default=0)
+    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
+    orgordmrcqty: int = Field(description="원주문정정취소수량", default=0)
+    ctrcttime: str = Field(description="약정시각(체결시각)", default="")
+    ctrctno: str = Field(description="약정번호", default="")
+    execprc: float = Field(description="체결가격", default=0.0)
+    execqty: int = Field(description="체결수량", default=0)
+    newqty: int = Field(description="신규체결수량", default=0)
+    qdtqty: int = Field(description="청산체결수량", default=0)
+    lastqty: int = Field(description="최종결제수량", default=0)
+    lallexecqty: int = Field(description="전체체결수량", default=0)
+    allexecamt: int = Field(description="전체체결금액", default=0)
+    fnobalevaltp: str = Field(description="잔고평가구분", default="")
+    bnsplamt: int = Field(description="매매손익금액", default=0)
+    fnoIsuno1: str = Field(description="선물옵션종목번호1", default="")
+    bnstp1: str = Field(description="매매구분1", default="")
+    execprc1: float = Field(description="체결가1", default=0.0)
+    newqty1: int = Field(description="신규체결수량1", default=0)
+    qdtqty1: int = Field(description="청산체결수량1", default=0)
+    allexecamt1: int = Field(description="전체체결금액1", default=0)
+    fnoIsuno2: str = Field(description="선물옵션종목번호2", default="")
+    bnstp2: str = Field(description="매매구분2", default="")
+    execprc2: float = Field(description="체결가2", default=0.0)
+    newqty2: int = Field(description="신규체결수량2", default=0)
+    lqdtqty2: int = Field(description="청산체결수량2", default=0)
+    allexecamt2: int = Field(description="전체체결금액2", default=0)
+    dps: int = Field(description="예수금", default=0)
+    ftsubtdsgnamt: int = Field(description="선물대용지정금액", default=0)
+    mgn: int = Field(description="증거금", default=0)
+    mnymgn: int = Field(description="증거금현금", default=0)
+    ordableamt: int = Field(description="주문가능금액", default=0)
+    mnyordableamt: int = Field(description="주문가능현금액", default=0)
+    fnoIsuno_1: str = Field(description="잔고 종목번호1", default="")
+    bnstp_1: str = Field(description="잔고 매매구분1", default="")
+    unsttqty_1: int = Field(description="미결제수량1", default=0)
+    lqdtableqty_1: int = Field(description="주문가능수량1", default=0)
+    avrprc_1: float = Field(description="평균가1", default=0.0)
+    fnoIsuno_2: str = Field(description="잔고 종목번호2", default="")
+    bnstp_2: str = Field(description="잔고 매매구분2", default="")
+    unsttqty_2: int = Field(description="미결제수량2", default=0)
+    lqdtableqty_2: int = Field(description="주문가능수량2", default=0)
+    avrprc_2: float = Field(description="평균가2", default=0.0)
+
+
+# EUX체결
+class EU1(BaseModel):
+    outblock: EU1OutBlock = Field(description="EU1OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for EU1",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
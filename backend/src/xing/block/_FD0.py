@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <FD0 - KOSPI200선물실시간상하한가(D0)>
+class FD0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class FD0OutBlock(BaseModel):
+    gubun: str = Field(description="접속매매여부", default="")
+    dy_gubun: str = Field(description="실시간가격제한여부", default="")
+    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
+    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# KOSPI200선물실시간상하한가(D0)
+class FD0(BaseModel):
+    inblock: FD0InBlock = Field(description="FD0InBlock")
+    outblock: FD0OutBlock = Field(description="FD0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for FD0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,62 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <FH0 - KOSPI200선물호가(H0)>
+class FH0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class FH0OutBlock(BaseModel):
+    hotime: str = Field(description="호가시간", default="")
+    offerho1: float = Field(description="매도호가1", default=0.0)
+    bidho1: float = Field(description="매수호가1", default=0.0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    offercnt1: int = Field(description="매도호가건수1", default=0)
+    bidcnt1: int = Field(description="매수호가건수1", default=0)
+    offerho2: float = Field(description="매도호가2", default=0.0)
+    bidho2: float = Field(description="매수호가2", default=0.0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    offercnt2: int = Field(description="매도호가건수2", default=0)
+    bidcnt2: int = Field(description="매수호가건수2", default=0)
+    offerho3: float = Field(description="매도호가3", default=0.0)
+    bidho3: float = Field(description="매수호가3", default=0.0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    offercnt3: int = Field(description="매도호가건수3", default=0)
+    bidcnt3: int = Field(description="매수호가건수3", default=0)
+    offerho4: float = Field(description="매도호가4", default=0.0)
+    bidho4: float = Field(description="매수호가4", default=0.0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    offercnt4: int = Field(description="매도호가건수4", default=0)
+    bidcnt4: int = Field(description="매수호가건수4", default=0)
+    offerho5: float = Field(description="매도호가5", default=0.0)
+    bidho5: float = Field(description="매수호가5", default=0.0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    offercnt5: int = Field(description="매도호가건수5", default=0)
+    bidcnt5: int = Field(description="매수호가건수5", default=0)
+    totofferrem: int = Field(description="매도호가총수량", default=0)
+    totbidrem: int = Field(description="매수호가총수량", default=0)
+    totoffercnt: int = Field(description="매도호가총건수", default=0)
+    totbidcnt: int = Field(description="매수호가총건수", default=0)
+    futcode: str = Field(description="단축코드", default="")
+    danhochk: str = Field(description="단일가호가여부", default="")
+    alloc_gubun: str = Field(description="배분적용구분", default="")
+
+
+# KOSPI200선물호가(H0)
+class FH0(BaseModel):
+    inblock: FH0InBlock = Field(description="FH0InBlock")
+    outblock: FH0OutBlock = Field(description="FH0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for FH0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
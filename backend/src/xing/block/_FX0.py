@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <FX0 - KOSPI200선물가격제한폭확대(X0)>
+class FX0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class FX0OutBlock(BaseModel):
+    upstep: str = Field(description="적용 상한단계", default="")
+    dnstep: str = Field(description="적용 하한단계", default="")
+    uplmtprice: float = Field(description="적용 상한가", default=0.0)
+    dnlmtprice: float = Field(description="적용 하한가", default=0.0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# KOSPI200선물가격제한폭확대(X0)
+class FX0(BaseModel):
+    inblock: FX0InBlock = Field(description="FX0InBlock")
+    outblock: FX0OutBlock = Field(description="FX0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for FX0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,65 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <H01 - 선물주문정정취소>
+class H01OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    accno: str = Field(description="계좌번호", default="")
+    user: str = Field(description="조작자ID", default="")
+    seq: int = Field(description="일련번호", default=0)
+    trcode: str = Field(description="trcode", default="")
+    megrpno: str = Field(description="매칭그룹번호", default="")
+    boardid: str = Field(description="보드ID", default="")
+    memberno: str = Field(description="회원번호", default="")
+    bpno: str = Field(description="지점번호", default="")
+    ordno: str = Field(description="주문번호", default="")
+    ordordno: str = Field(description="원주문번호", default="")
+    expcode: str = Field(description="종목코드", default="")
+    dosugb: str = Field(description="매도수구분", default="")
+    mocagb: str = Field(description="정정취소구분", default="")
+    accno1: str = Field(description="계좌번호1", default="")
+    qty2: int = Field(description="호가수량", default=0)
+    price: float = Field(description="호가가격", default=0.0)
+    ordgb: str = Field(description="주문유형", default="")
+    hogagb: str = Field(description="호가구분", default="")
+    sihogagb: str = Field(description="시장조성호가구분", default="")
+    treaid: str = Field(description="자사주신고서ID", default="")
+    treacode: str = Field(description="자사주매매방법", default="")
+    askcode: str = Field(description="매도유형코드", default="")
+    creditcode: str = Field(description="신용구분코드", default="")
+    jakigb: str = Field(description="위탁자기구분", default="")
+    trustnum: str = Field(description="위탁사번호", default="")
+    ptgb: str = Field(description="프로그램구분", default="")
+    substocnum: str = Field(description="대용주권계좌번호", default="")
+    accgb: str = Field(description="계좌구분코드", default="")
+    accmarggb: str = Field(description="계좌증거금코드", default="")
+    nationcode: str = Field(description="국가코드", default="")
+    investgb: str = Field(description="투자자구분", default="")
+    forecode: str = Field(description="외국인코드", default="")
+    medcode: str = Field(description="주문매체구분", default="")
+    ordid: str = Field(description="주문식별자번호", default="")
+    macid: str = Field(description="MAC주소", default="")
+    orddate: str = Field(description="호가일자", default="")
+    rcvtime: str = Field(description="회원사주문시각", default="")
+    mem_filler: str = Field(description="mem_filler", default="")
+    mem_accno: str = Field(description="mem_accno", default="")
+    mem_filler1: str = Field(description="mem_filler1", default="")
+    ordacpttm: str = Field(description="매칭접수시간", default="")
+    qty: int = Field(description="실정정취소수량", default=0)
+    autogb: str = Field(description="자동취소구분", default="")
+    rejcode: str = Field(description="거부사유", default="")
+    prgordde: str = Field(description="프로그램호가신고", default="")
+
+
+# 선물주문정정취소
+class H01(BaseModel):
+    outblock: H01OutBlock = Field(description="H01OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for H01",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,54 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <JC0 - 주식선물체결(JC0)>
+class JC0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class JC0OutBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+    chetime: str = Field(description="체결시간", default="")
+    sign: str = Field(description="대비기호", default="")
+    change: int = Field(description="전일대비", default=0)
+    drate: float = Field(description="등락율", default=0.0)
+    price: int = Field(description="현재가", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    cgubun: str = Field(description="체결구분", default="")
+    cvolume: int = Field(description="체결량", default=0)
+    volume: int = Field(description="누적거래량", default=0)
+    value: int = Field(description="누적거래대금", default=0)
+    mdvolume: int = Field(description="매도누적체결량", default=0)
+    mdchecnt: int = Field(description="매도누적체결건수", default=0)
+    msvolume: int = Field(description="매수누적체결량", default=0)
+    mschecnt: int = Field(description="매수누적체결건수", default=0)
+    cpower: float = Field(description="체결강도", default=0.0)
+    offerho1: int = Field(description="매도호가1", default=0)
+    bidho1: int = Field(description="매수호가1", default=0)
+    openyak: int = Field(description="미결제약정수량", default=0)
+    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
+    theoryprice: int = Field(description="이론가", default=0)
+    kasis: float = Field(description="괴리율", default=0.0)
+    sbasis: int = Field(description="시장BASIS", default=0)
+    ibasis: int = Field(description="이론BASIS", default=0)
+    openyakcha: int = Field(description="미결제약정증감", default=0)
+    jgubun: str = Field(description="장운영정보", default="")
+    jnilvolume: int = Field(description="전일동시간대거래량", default=0)
+    basprice: int = Field(description="기초자산현재가", default=0)
+
+
+# 주식선물체결(JC0)
+class JC0(BaseModel):
+    inblock: JC0InBlock = Field(description="JC0InBlock")
+    outblock: JC0OutBlock = Field(description="JC0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for JC0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
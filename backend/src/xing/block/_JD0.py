@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <JD0 - 주식선물실시간상하한가(JD0)>
+class JD0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class JD0OutBlock(BaseModel):
+    gubun: str = Field(description="접속매매여부", default="")
+    dy_gubun: str = Field(description="실시간가격제한여부", default="")
+    dy_uplmtprice: int = Field(description="실시간상한가", default=0)
+    dy_dnlmtprice: int = Field(description="실시간하한가", default=0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# 주식선물실시간상하한가(JD0)
+class JD0(BaseModel):
+    inblock: JD0InBlock = Field(description="JD0InBlock")
+    outblock: JD0OutBlock = Field(description="JD0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for JD0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
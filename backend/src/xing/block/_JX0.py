@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <JX0 - 주식선물가격제한폭확대(JX0)>
+class JX0InBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class JX0OutBlock(BaseModel):
+    upstep: str = Field(description="적용 상한단계", default="")
+    dnstep: str = Field(description="적용 하한단계", default="")
+    uplmtprice: int = Field(description="적용 상한가", default=0)
+    dnlmtprice: int = Field(description="적용 하한가", default=0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# 주식선물가격제한폭확대(JX0)
+class JX0(BaseModel):
+    inblock: JX0InBlock = Field(description="JX0InBlock")
+    outblock: JX0OutBlock = Field(description="JX0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for JX0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <MK2 - US지수(MK2)>
+class MK2InBlock(BaseModel):
+    symbol: str = Field(description="심볼코드", default="")
+
+
+class MK2OutBlock(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    kodate: str = Field(description="한국일자", default="")
+    kotime: str = Field(description="한국시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    uprate: float = Field(description="등락율", default=0.0)
+    bidho: float = Field(description="매수호가", default=0.0)
+    bidrem: int = Field(description="매수잔량", default=0)
+    offerho: float = Field(description="매도호가", default=0.0)
+    offerrem: int = Field(description="매도잔량", default=0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    xsymbol: str = Field(description="심벌", default="")
+    cvolume: float = Field(description="체결거래량", default=0.0)
+
+
+# US지수(MK2)
+class MK2(BaseModel):
+    inblock: MK2InBlock = Field(description="MK2InBlock")
+    outblock: MK2OutBlock = Field(description="MK2OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for MK2",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,45 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <MMDAQ91200 - 파생상품증거금율조회>
+class MMDAQ91200InBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
+    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
+
+
+class MMDAQ91200OutBlock1(BaseModel):
+    RecCnt: int = Field(description="레코드갯수", default=0)
+    IsuLgclssCode: str = Field(description="종목대분류코드", default="")
+    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
+
+
+class MMDAQ91200OutBlock2(BaseModel):
+    IsuSmclssCode: str = Field(description="종목소분류코드", default="")
+    IsuMdclssCode: str = Field(description="종목중분류코드", default="")
+    IsuLrgMdclssNm: str = Field(description="종목대중분류명", default="")
+    IsuLrgMidSmclssNm: str = Field(description="종목대중소분류명", default="")
+    ShtnHanglIsuNm: str = Field(description="단축한글종목명", default="")
+    CsgnMgnrt: float = Field(description="위탁증거금율", default=0.0)
+    MaintMgnrt: float = Field(description="유지증거금율", default=0.0)
+    MnyMgnrt: float = Field(description="현금증거금율", default=0.0)
+    RmndDays: int = Field(description="잔여일수", default=0)
+    OnePrcntrOrdMgn: int = Field(description="1계약당주문증거금", default=0)
+
+
+# 파생상품증거금율조회
+class MMDAQ91200(BaseModel):
+    inblock1: MMDAQ91200InBlock1 = Field(description="MMDAQ91200InBlock1")
+    outblock1: MMDAQ91200OutBlock1 = Field(description="MMDAQ91200OutBlock1")
+    outblock2: List[MMDAQ91200OutBlock2] = Field(description="MMDAQ91200OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for MMDAQ91200",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <OMG - KOSPI200옵션민감도(MG)>
+class OMGInBlock(BaseModel):
+    optcode: str = Field(description="옵션코드", default="")
+
+
+class OMGOutBlock(BaseModel):
+    chetime: str = Field(description="체결시간", default="")
+    actprice: float = Field(description="행사가", default=0.0)
+    k200jisu: float = Field(description="KOSPI200지수", default=0.0)
+    fut200jisu: float = Field(description="선물가격", default=0.0)
+    price: float = Field(description="현재가", default=0.0)
+    capimpv: float = Field(description="대표내재변동성", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    delt: float = Field(description="델타(블랙숄즈)", default=0.0)
+    gama: float = Field(description="감마(블랙숄즈)", default=0.0)
+    ceta: float = Field(description="세타(블랙숄즈)", default=0.0)
+    vega: float = Field(description="베가(블랙숄즈)", default=0.0)
+    rhox: float = Field(description="로우(블랙숄즈)", default=0.0)
+    theoryprice: float = Field(description="이론가(블랙숄즈)", default=0.0)
+    bimpv: float = Field(description="전일가내재변동성", default=0.0)
+    offerimpv: float = Field(description="매도가내재변동성", default=0.0)
+    bidimpv: float = Field(description="매수가내재변동성", default=0.0)
+    optcode: str = Field(description="옵션코드", default="")
+
+
+# KOSPI200옵션민감도(MG)
+class OMG(BaseModel):
+    inblock: OMGInBlock = Field(description="OMGInBlock")
+    outblock: OMGOutBlock = Field(description="OMGOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for OMG",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <OX0 - KOSPI200옵션가격제한폭확대(X0)>
+class OX0InBlock(BaseModel):
+    optcode: str = Field(description="단축코드", default="")
+
+
+class OX0OutBlock(BaseModel):
+    upstep: str = Field(description="적용 상한단계", default="")
+    dnstep: str = Field(description="적용 하한단계", default="")
+    uplmtprice: float = Field(description="적용 상한가", default=0.0)
+    dnlmtprice: float = Field(description="적용 하한가", default=0.0)
+    opttcode: str = Field(description="단축코드", default="")
+
+
+# KOSPI200옵션가격제한폭확대(X0)
+class OX0(BaseModel):
+    inblock: OX0InBlock = Field(description="OX0InBlock")
+    outblock: OX0OutBlock = Field(description="OX0OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for OX0",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
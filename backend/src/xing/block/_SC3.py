@@ -0,0 +1,149 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <SC3 - 주식주문취소>
+class SC3OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    accno: str = Field(description="계좌번호", default="")
+    user: str = Field(description="조작자ID", default="")
+    len: int = Field(description="헤더길이", default=0)
+    gubun: str = Field(description="헤더구분", default="")
+    compress: str = Field(description="압축구분", default="")
+    encrypt: str = Field(description="암호구분", default="")
+    offset: int = Field(description="공통시작지점", default=0)
+    trcode: str = Field(description="TRCODE", default="")
+    comid: str = Field(description="이용사번호", default="")
+    userid: str = Field(description="사용자ID", default="")
+    media: str = Field(description="접속매체", default="")
+    ifid: str = Field(description="I/F일련번호", default="")
+    seq: str = Field(description="전문일련번호", default="")
+    trid: str = Field(description="TR추적ID", default="")
+    pubip: str = Field(description="공인IP", default="")
+    prvip: str = Field(description="사설IP", default="")
+    pcbpno: str = Field(description="처리지점번호", default="")
+    bpno: str = Field(description="지점번호", default="")
+    termno: str = Field(description="단말번호", default="")
+    lang: str = Field(description="언어구분", default="")
+    proctm: int = Field(description="AP처리시간", default=0)
+    msgcode: str = Field(description="메세지코드", default="")
+    outgu: str = Field(description="메세지출력구분", default="")
+    compreq: str = Field(description="압축요청구분", default="")
+    funckey: str = Field(description="기능키", default="")
+    reqcnt: int = Field(description="요청레코드개수", default=0)
+    filler: str = Field(description="예비영역", default="")
+    cont: str = Field(description="연속구분", default="")
+    contkey: str = Field(description="연속키값", default="")
+    varlen: int = Field(description="가변시스템길이", default=0)
+    varhdlen: int = Field(description="가변해더길이", default=0)
+    varmsglen: int = Field(description="가변메시지길이", default=0)
+    trsrc: str = Field(description="조회발원지", default="")
+    eventid: str = Field(description="I/F이벤트ID", default="")
+    ifinfo: str = Field(description="I/F정보", default="")
+    filler1: str = Field(description="예비영역", default="")
+    ordxctptncode: str = Field(description="주문체결유형코드", default="")
+    ordmktcode: str = Field(description="주문시장코드", default="")
+    ordptncode: str = Field(description="주문유형코드", default="")
+    mgmtbrnno: str = Field(description="관리지점번호", default="")
+    accno1: str = Field(description="계좌번호", default="")
+    accno2: str = Field(description="계좌번호", default="")
+    acntnm: str = Field(description="계좌명", default="")
+    Isuno: str = Field(description="종목번호", default="")
+    Isunm: str = Field(description="종목명", default="")
+    ordno: int = Field(description="주문번호", default=0)
+    orgordno: int = Field(description="원주문번호", default=0)
+    execno: int = Field(description="체결번호", default=0)
+    ordqty: int = Field(description="주문수량", default=0)
+    ordprc: int = Field(description="주문가격", default=0)
+    execqty: int = Field(description="체결수량", default=0)
+    execprc: int = Field(description="체결가격", default=0)
+    mdfycnfqty: int = Field(description="정정확인수량", default=0)
+    mdfycnfprc: int = Field(description="정정확인가격", default=0)
+    canccnfqty: int = Field(description="취소확인수량", default=0)
+    rjtqty: int = Field(description="거부수량", default=0)
+    ordtrxptncode: int = Field(description="주문처리유형코드", default=0)
+    mtiordseqno: int = Field(description="복수주문일련번호", default=0)
+    ordcndi: str = Field(description="주문조건", default="")
+    ordprcptncode: str = Field(description="호가유형코드", default="")
+    nsavtrdqty: int = Field(description="비저축체결수량", default=0)
+    shtnIsuno: str = Field(description="단축종목번호", default="")
+    opdrtnno: str = Field(description="운용지시번호", default="")
+    cvrgordtp: str = Field(description="반대매매주문구분", default="")
+    unercqty: int = Field(description="미체결수량(주문)", default=0)
+    orgordunercqty: int = Field(description="원주문미체결수량", default=0)
+    orgordmdfyqty: int = Field(description="원주문정정수량", default=0)
+    orgordcancqty: int = Field(description="원주문취소수량", default=0)
+    ordavrexecprc: int = Field(description="주문평균체결가격", default=0)
+    ordamt: int = Field(description="주문금액", default=0)
+    stdIsuno: str = Field(description="표준종목번호", default="")
+    bfstdIsuno: str = Field(description="전표준종목번호", default="")
+    bnstp: str = Field(description="매매구분", default="")
+    ordtrdptncode: str = Field(description="주문거래유형코드", default="")
+    mgntrncode: str = Field(description="신용거래코드", default="")
+    adduptp: str = Field(description="수수료합산코드", default="")
+    commdacode: str = Field(description="통신매체코드", default="")
+    Loandt: str = Field(description="대출일", default="")
+    mbrnmbrno: int = Field(description="회원/비회원사번호", default=0)
+    ordacntno: str = Field(description="주문계좌번호", default="")
+    agrgbrnno: str = Field(description="집계지점번호", default="")
+    mgempno: str = Field(description="관리사원번호", default="")
+    futsLnkbrnno: str = Field(description="선물연계지점번호", default="")
+    futsLnkacntno: str = Field(description="선물연계계좌번호", default="")
+    futsmkttp: str = Field(description="선물시장구분", default="")
+    regmktcode: str = Field(description="등록시장코드", default="")
+    mnymgnrat: int = Field(description="현금증거금률", default=0)
+    substmgnrat: int = Field(description="대용증거금률", default=0)
+    mnyexecamt: int = Field(description="현금체결금액", default=0)
+    ubstexecamt: int = Field(description="대용체결금액", default=0)
+    cmsnamtexecamt: int = Field(description="수수료체결금액", default=0)
+    crdtpldgexecamt: int = Field(description="신용담보체결금액", default=0)
+    crdtexecamt: int = Field(description="신용체결금액", default=0)
+    prdayruseexecval: int = Field(description="전일재사용체결금액", default=0)
+    crdayruseexecval: int = Field(description="금일재사용체결금액", default=0)
+    spotexecqty: int = Field(description="실물체결수량", default=0)
+    stslexecqty: int = Field(description="공매도체결수량", default=0)
+    strtgcode: str = Field(description="전략코드", default="")
+    grpId: str = Field(description="그룹Id", default="")
+    ordseqno: int = Field(description="주문회차", default=0)
+    ptflno: int = Field(description="포트폴리오번호", default=0)
+    bskno: int = Field(description="바스켓번호", default=0)
+    trchno: int = Field(description="트렌치번호", default=0)
+    itemno: int = Field(description="아이템번호", default=0)
+    orduserId: str = Field(description="주문자Id", default="")
+    brwmgmtYn: int = Field(description="차입관리여부", default=0)
+    frgrunqno: str = Field(description="외국인고유번호", default="")
+    trtzxLevytp: str = Field(description="거래세징수구분", default="")
+    lptp: str = Field(description="유동성공급자구분", default="")
+    exectime: str = Field(description="체결시각", default="")
+    rcptexectime: str = Field(description="거래소수신체결시각", default="")
+    rmndLoanamt: int = Field(description="잔여대출금액", default=0)
+    secbalqty: int = Field(description="잔고수량", default=0)
+    spotordableqty: int = Field(description="실물가능수량", default=0)
+    ordableruseqty: int = Field(description="재사용가능수량(매도)", default=0)
+    flctqty: int = Field(description="변동수량", default=0)
+    secbalqtyd2: int = Field(description="잔고수량(d2)", default=0)
+    sellableqty: int = Field(description="매도주문가능수량", default=0)
+    unercsellordqty: int = Field(description="미체결매도주문수량", default=0)
+    avrpchsprc: int = Field(description="평균매입가", default=0)
+    pchsant: int = Field(description="매입금액", default=0)
+    deposit: int = Field(description="예수금", default=0)
+    substamt: int = Field(description="대용금", default=0)
+    csgnmnymgn: int = Field(description="위탁증거금현금", default=0)
+    csgnsubstmgn: int = Field(description="위탁증거금대용", default=0)
+    crdtpldgruseamt: int = Field(description="신용담보재사용금", default=0)
+    ordablemny: int = Field(description="주문가능현금", default=0)
+    ordablesubstamt: int = Field(description="주문가능대용", default=0)
+    ruseableamt: int = Field(description="재사용가능금액", default=0)
+
+
+# 주식주문취소
+class SC3(BaseModel):
+    outblock: SC3OutBlock = Field(description="SC3OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for SC3",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
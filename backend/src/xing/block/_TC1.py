@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <TC1 - 해외선물주문>
+class TC1OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    key: str = Field(description="KEY", default="")
+    user: str = Field(description="조작자ID", default="")
+    svc_id: str = Field(description="서비스ID", default="")
+    ordr_dt: str = Field(description="주문일자", default="")
+    brn_cd: str = Field(description="지점번호", default="")
+    ordr_no: int = Field(description="주문번호", default=0)
+    orgn_ordr_no: int = Field(description="원주문번호", default=0)
+    mthr_ordr_no: int = Field(description="모주문번호", default=0)
+    ac_no: str = Field(description="계좌번호", default="")
+    is_cd: str = Field(description="종목코드", default="")
+    s_b_ccd: str = Field(description="매도매수유형", default="")
+    ordr_ccd: str = Field(description="정정취소유형", default="")
+    ordr_typ_cd: str = Field(description="주문유형코드", default="")
+    ordr_typ_prd_ccd: str = Field(description="주문기간코드", default="")
+    ordr_aplc_strt_dt: str = Field(description="주문적용시작일자", default="")
+    ordr_aplc_end_dt: str = Field(description="주문적용종료일자", default="")
+    ordr_prc: float = Field(description="주문가격", default=0.0)
+    cndt_ordr_prc: float = Field(description="주문조건가격", default=0.0)
+    ordr_q: int = Field(description="주문수량", default=0)
+    ordr_tm: str = Field(description="주문시간", default="")
+    userid: str = Field(description="사용자ID", default="")
+    xrc_rsv_tcp_code: str = Field(description="만기행사유무", default="")
+
+
+# 해외선물주문
+class TC1(BaseModel):
+    outblock: TC1OutBlock = Field(description="TC1OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for TC1",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
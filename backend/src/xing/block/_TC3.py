@@ -0,0 +1,56 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <TC3 - 해외선물체결>
+class TC3OutBlock(BaseModel):
+    lineseq: int = Field(description="라인일련번호", default=0)
+    key: str = Field(description="KEY", default="")
+    user: str = Field(description="조작자ID", default="")
+    svc_id: str = Field(description="서비스ID", default="")
+    ordr_dt: str = Field(description="주문일자", default="")
+    brn_cd: str = Field(description="지점번호", default="")
+    ordr_no: int = Field(description="주문번호", default=0)
+    orgn_ordr_no: int = Field(description="원주문번호", default=0)
+    mthr_ordr_no: int = Field(description="모주문번호", default=0)
+    ac_no: str = Field(description="계좌번호", default="")
+    is_cd: str = Field(description="종목코드", default="")
+    s_b_ccd: str = Field(description="매도매수유형", default="")
+    ordr_ccd: str = Field(description="정정취소유형", default="")
+    ccls_q: int = Field(description="체결수량", default=0)
+    ccls_prc: float = Field(description="체결가격", default=0.0)
+    ccls_no: str = Field(description="체결번호", default="")
+    ccls_tm: str = Field(description="체결시간", default="")
+    avg_byng_uprc: float = Field(description="매입평균단가", default=0.0)
+    byug_amt: float = Field(description="매입금액", default=0.0)
+    clr_pl_amt: float = Field(description="청산손익", default=0.0)
+    ent_fee: float = Field(description="위탁수수료", default=0.0)
+    fcm_fee: int = Field(description="매입잔고수량", default=0)
+    userid: str = Field(description="사용자ID", default="")
+    now_prc: float = Field(description="현재가격", default=0.0)
+    crncy_cd: str = Field(description="통화코드", default="")
+    mtrt_dt: str = Field(description="만기일자", default="")
+    ord_prdt_tp_code: str = Field(description="주문상품구분코드", default="")
+    exec_prdt_tp_code: str = Field(description="주문상품구분코드", default="")
+    sprd_base_isu_yn: str = Field(description="스프레드종목여부", default="")
+    ccls_dt: str = Field(description="체결일자", default="")
+    filler2: str = Field(description="FILLER2", default="")
+    sprd_is_cd: str = Field(description="스프레드종목코드", default="")
+    lme_prdt_ccd: str = Field(description="LME상품유형", default="")
+    lme_sprd_prc: float = Field(description="LME스프레드가격", default=0.0)
+    last_now_prc: float = Field(description="최종현재가격", default=0.0)
+    bf_mtrt_dt: str = Field(description="이전만기일자", default="")
+    clr_q: int = Field(description="청산수량", default=0)
+
+
+# 해외선물체결
+class TC3(BaseModel):
+    outblock: TC3OutBlock = Field(description="TC3OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for TC3",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
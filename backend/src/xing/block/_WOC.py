@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <WOC - 해외옵션 현재가체결(WOC)>
+class WOCInBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+
+
+class WOCOutBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+    ovsdate: str = Field(description="체결일자(현지)", default="")
+    kordate: str = Field(description="체결일자(한국)", default="")
+    trdtm: str = Field(description="체결시간(현지)", default="")
+    kortm: str = Field(description="체결시간(한국)", default="")
+    curpr: float = Field(description="체결가격", default=0.0)
+    ydiffpr: float = Field(description="전일대비", default=0.0)
+    ydiffSign: str = Field(description="전일대비기호", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    chgrate: float = Field(description="등락율", default=0.0)
+    trdq: int = Field(description="건별체결수량", default=0)
+    totq: str = Field(description="누적체결수량", default="")
+    cgubun: str = Field(description="체결구분", default="")
+    mdvolume: str = Field(description="매도누적체결수량", default="")
+    msvolume: str = Field(description="매수누적체결수량", default="")
+    ovsmkend: str = Field(description="장마감일", default="")
+
+
+# 해외옵션 현재가체결(WOC)
+class WOC(BaseModel):
+    inblock: WOCInBlock = Field(description="WOCInBlock")
+    outblock: WOCOutBlock = Field(description="WOCOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for WOC",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,31 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <YC3 - 상품선물예상체결(YC3)>
+class YC3InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class YC3OutBlock(BaseModel):
+    ychetime: str = Field(description="예상체결시간", default="")
+    yeprice: float = Field(description="예상체결가격", default=0.0)
+    yevolume: int = Field(description="예상체결수량", default=0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilchange: float = Field(description="예상체결가전일종가대비", default=0.0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+    shcode: str = Field(description="단축코드", default="")
+
+
+# 상품선물예상체결(YC3)
+class YC3(BaseModel):
+    inblock: YC3InBlock = Field(description="YC3InBlock")
+    outblock: YC3OutBlock = Field(description="YC3OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for YC3",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,30 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <YJC - 주식선물예상체결(YJC)>
+class YJCInBlock(BaseModel):
+    futcode: str = Field(description="단축코드", default="")
+
+
+class YJCOutBlock(BaseModel):
+    ychetime: str = Field(description="예상체결시간", default="")
+    yeprice: int = Field(description="예상체결가격", default=0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilchange: int = Field(description="예상체결가전일종가대비", default=0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+    futcode: str = Field(description="단축코드", default="")
+
+
+# 주식선물예상체결(YJC)
+class YJC(BaseModel):
+    inblock: YJCInBlock = Field(description="YJCInBlock")
+    outblock: YJCOutBlock = Field(description="YJCOutBlock")
+    metadata: dict = Field(
+        description="The metadata information for YJC",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,35 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <YS3 - KOSPI예상체결(YS3)>
+class YS3InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class YS3OutBlock(BaseModel):
+    hotime: str = Field(description="호가시간", default="")
+    yeprice: int = Field(description="예상체결가격", default=0)
+    yevolume: int = Field(description="예상체결수량", default=0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilchange: int = Field(description="예상체결가전일종가대비", default=0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+    yofferho0: int = Field(description="예상매도호가", default=0)
+    ybidho0: int = Field(description="예상매수호가", default=0)
+    yofferrem0: int = Field(description="예상매도호가수량", default=0)
+    ybidrem0: int = Field(description="예상매수호가수량", default=0)
+    shcode: str = Field(description="단축코드", default="")
+
+
+# KOSPI예상체결(YS3)
+class YS3(BaseModel):
+    inblock: YS3InBlock = Field(description="YS3InBlock")
+    outblock: YS3OutBlock = Field(description="YS3OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for YS3",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
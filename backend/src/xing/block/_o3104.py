@@ -0,0 +1,38 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3104 - 해외선물일별체결조회(o3104)-API용>
+class o3104InBlock(BaseModel):
+    gubun: str = Field(description="조회구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    date: str = Field(description="조회일자", default="")
+
+
+class o3104OutBlock1(BaseModel):
+    chedate: str = Field(description="일자", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    cgubun: str = Field(description="체결구분", default="")
+    volume: int = Field(description="누적거래량", default=0)
+
+
+# 해외선물일별체결조회(o3104)-API용
+class o3104(BaseModel):
+    inblock: o3104InBlock = Field(description="o3104InBlock")
+    outblock1: List[o3104OutBlock1] = Field(description="o3104OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3104",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,70 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <o3106 - 해외선물현재가호가조회(o3106)-API용>
+class o3106InBlock(BaseModel):
+    symbol: str = Field(description="단축코드", default="")
+
+
+class o3106OutBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+    symbolname: str = Field(description="종목명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    hotime: str = Field(description="호가수신시간", default="")
+    offerho1: float = Field(description="매도호가1", default=0.0)
+    bidho1: float = Field(description="매수호가1", default=0.0)
+    offercnt1: int = Field(description="매도호가건수1", default=0)
+    bidcnt1: int = Field(description="매수호가건수1", default=0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    offerho2: float = Field(description="매도호가2", default=0.0)
+    bidho2: float = Field(description="매수호가2", default=0.0)
+    offercnt2: int = Field(description="매도호가건수2", default=0)
+    bidcnt2: int = Field(description="매수호가건수2", default=0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    offerho3: float = Field(description="매도호가3", default=0.0)
+    bidho3: float = Field(description="매수호가3", default=0.0)
+    offercnt3: int = Field(description="매도호가건수3", default=0)
+    bidcnt3: int = Field(description="매수호가건수3", default=0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    offerho4: float = Field(description="매도호가4", default=0.0)
+    bidho4: float = Field(description="매수호가4", default=0.0)
+    offercnt4: int = Field(description="매도호가건수4", default=0)
+    bidcnt4: int = Field(description="매수호가건수4", default=0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    offerho5: float = Field(description="매도호가5", default=0.0)
+    bidho5: float = Field(description="매수호가5", default=0.0)
+    offercnt5: int = Field(description="매도호가건수5", default=0)
+    bidcnt5: int = Field(description="매수호가건수5", default=0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    offercnt: int = Field(description="매도호가건수합", default=0)
+    bidcnt: int = Field(description="매수호가건수합", default=0)
+    offer: int = Field(description="매도호가수량합", default=0)
+    bid: int = Field(description="매수호가수량합", default=0)
+
+
+# 해외선물현재가호가조회(o3106)-API용
+class o3106(BaseModel):
+    inblock: o3106InBlock = Field(description="o3106InBlock")
+    outblock: o3106OutBlock = Field(description="o3106OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for o3106",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
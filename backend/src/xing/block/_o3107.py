@@ -0,0 +1,47 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3107 - 해외선물관심종목조회(o3107)-API용>
+class o3107InBlock(BaseModel):
+    symbol: str = Field(description="종목심볼", default="")
+
+
+class o3107OutBlock(BaseModel):
+    symbol: str = Field(description="종목코드", default="")
+    symbolname: str = Field(description="종목명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    offerho1: float = Field(description="매도호가1", default=0.0)
+    bidho1: float = Field(description="매수호가1", default=0.0)
+    offercnt1: int = Field(description="매도호가건수1", default=0)
+    bidcnt1: int = Field(description="매수호가건수1", default=0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    offercnt: int = Field(description="매도호가건수합", default=0)
+    bidcnt: int = Field(description="매수호가건수합", default=0)
+    offer: int = Field(description="매도호가수량합", default=0)
+    bid: int = Field(description="매수호가수량합", default=0)
+
+
+# 해외선물관심종목조회(o3107)-API용
+class o3107(BaseModel):
+    inblock: o3107InBlock = Field(description="o3107InBlock")
+    outblock: List[o3107OutBlock] = Field(description="o3107OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for o3107",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
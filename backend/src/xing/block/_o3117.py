@@ -0,0 +1,45 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3117 - 해외선물차트용NTick(o3117)-API용>
+class o3117InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="단위", default=0)
+    qrycnt: int = Field(description="건수", default=0)
+    cts_seq: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분", default="")
+
+
+class o3117OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+    cts_seq: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분", default="")
+
+
+class o3117OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 해외선물차트용NTick(o3117)-API용
+class o3117(BaseModel):
+    inblock: o3117InBlock = Field(description="o3117InBlock")
+    outblock: o3117OutBlock = Field(description="o3117OutBlock")
+    outblock1: List[o3117OutBlock1] = Field(description="o3117OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3117",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,61 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3121 - 해외선물옵션마스터조회(o3121)-API용>
+class o3121InBlock(BaseModel):
+    MktGb: str = Field(description="시장구분", default="")
+    BscGdsCd: str = Field(description="옵션기초상품코드", default="")
+
+
+class o3121OutBlock(BaseModel):
+    Symbol: str = Field(description="종목코드", default="")
+    SymbolNm: str = Field(description="종목명", default="")
+    ApplDate: str = Field(description="종목배치수신일(한국일자)", default="")
+    BscGdsCd: str = Field(description="기초상품코드", default="")
+    BscGdsNm: str = Field(description="기초상품명", default="")
+    ExchCd: str = Field(description="거래소코드", default="")
+    ExchNm: str = Field(description="거래소명", default="")
+    CrncyCd: str = Field(description="기준통화코드", default="")
+    NotaCd: str = Field(description="진법구분코드", default="")
+    UntPrc: float = Field(description="호가단위가격", default=0.0)
+    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
+    RgltFctr: float = Field(description="가격조정계수", default=0.0)
+    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
+    GdsCd: str = Field(description="상품구분코드", default="")
+    LstngYr: str = Field(description="월물(년)", default="")
+    LstngM: str = Field(description="월물(월)", default="")
+    EcPrc: float = Field(description="정산가격", default=0.0)
+    DlStrtTm: str = Field(description="거래시작시간", default="")
+    DlEndTm: str = Field(description="거래종료시간", default="")
+    DlPsblCd: str = Field(description="거래가능구분코드", default="")
+    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
+    OpngMgn: float = Field(description="개시증거금", default=0.0)
+    MntncMgn: float = Field(description="유지증거금", default=0.0)
+    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
+    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
+    DotGb: int = Field(description="유효소수점자리수", default=0)
+    XrcPrc: str = Field(description="옵션행사가", default="")
+    FdasBasePrc: str = Field(description="기초자산기준가격", default="")
+    OptTpCode: str = Field(description="옵션콜풋구분", default="")
+    RgtXrcPtnCode: str = Field(description="권리행사구분코드", default="")
+    Moneyness: str = Field(description="ATM구분", default="")
+    LastSettPtnCode: str = Field(description="해외파생기초자산종목코드", default="")
+    OptMinOrcPrc: str = Field(description="해외옵션최소호가", default="")
+    OptMinBaseOrcPrc: str = Field(description="해외옵션최소기준호가", default="")
+
+
+# 해외선물옵션마스터조회(o3121)-API용
+class o3121(BaseModel):
+    inblock: o3121InBlock = Field(description="o3121InBlock")
+    outblock: List[o3121OutBlock] = Field(description="o3121OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for o3121",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
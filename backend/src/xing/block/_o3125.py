@@ -0,0 +1,85 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <o3125 - 해외선물옵션현재가(종목정보)조회(o3125)-API용>
+class o3125InBlock(BaseModel):
+    mktgb: str = Field(description="시장구분", default="")
+    symbol: str = Field(description="종목코드", default="")
+
+
+class o3125OutBlock(BaseModel):
+    Symbol: str = Field(description="종목코드", default="")
+    SymbolNm: str = Field(description="종목명", default="")
+    ApplDate: str = Field(description="종목배치수신일", default="")
+    BscGdsCd: str = Field(description="기초상품코드", default="")
+    BscGdsNm: str = Field(description="기초상품명", default="")
+    ExchCd: str = Field(description="거래소코드", default="")
+    ExchNm: str = Field(description="거래소명", default="")
+    EcCd: str = Field(description="정산구분코드", default="")
+    CrncyCd: str = Field(description="기준통화코드", default="")
+    NotaCd: str = Field(description="진법구분코드", default="")
+    UntPrc: float = Field(description="호가단위가격", default=0.0)
+    MnChgAmt: float = Field(description="최소가격변동금액", default=0.0)
+    RgltFctr: float = Field(description="가격조정계수", default=0.0)
+    CtrtPrAmt: float = Field(description="계약당금액", default=0.0)
+    LstngMCnt: int = Field(description="상장개월수", default=0)
+    GdsCd: str = Field(description="상품구분코드", default="")
+    MrktCd: str = Field(description="시장구분코드", default="")
+    EminiCd: str = Field(description="Emini구분코드", default="")
+    LstngYr: str = Field(description="상장년", default="")
+    LstngM: str = Field(description="상장월", default="")
+    SeqNo: int = Field(description="월물순서", default=0)
+    LstngDt: str = Field(description="상장일자", default="")
+    MtrtDt: str = Field(description="최종거래가능일", default="")
+    FnlDlDt: str = Field(description="최종거래일", default="")
+    FstTrsfrDt: str = Field(description="최초인도통지일자", default="")
+    EcPrc: float = Field(description="정산가격", default=0.0)
+    DlDt: str = Field(description="거래시작일자(한국)", default="")
+    DlStrtTm: str = Field(description="거래시작시간(한국)", default="")
+    DlEndTm: str = Field(description="거래종료시간(한국)", default="")
+    OvsStrDay: str = Field(description="거래시작일자(현지)", default="")
+    OvsStrTm: str = Field(description="거래시작시간(현지)", default="")
+    OvsEndDay: str = Field(description="거래종료일자(현지)", default="")
+    OvsEndTm: str = Field(description="거래종료시간(현지)", default="")
+    DlPsblCd: str = Field(description="거래가능구분코드", default="")
+    MgnCltCd: str = Field(description="증거금징수구분코드", default="")
+    OpngMgn: float = Field(description="개시증거금", default=0.0)
+    MntncMgn: float = Field(description="유지증거금", default=0.0)
+    OpngMgnR: float = Field(description="개시증거금율", default=0.0)
+    MntncMgnR: float = Field(description="유지증거금율", default=0.0)
+    DotGb: int = Field(description="유효소수점자리수", default=0)
+    TimeDiff: int = Field(description="시차", default=0)
+    OvsDate: str = Field(description="현지체결일자", default="")
+    KorDate: str = Field(description="한국체결일자", default="")
+    TrdTm: str = Field(description="현지체결시간", default="")
+    RcvTm: str = Field(description="한국체결시각", default="")
+    TrdP: float = Field(description="체결가격", default=0.0)
+    TrdQ: int = Field(description="체결수량", default=0)
+    TotQ: int = Field(description="누적거래량", default=0)
+    TrdAmt: float = Field(description="체결거래대금", default=0.0)
+    TotAmt: float = Field(description="누적거래대금", default=0.0)
+    OpenP: float = Field(description="시가", default=0.0)
+    HighP: float = Field(description="고가", default=0.0)
+    LowP: float = Field(description="저가", default=0.0)
+    CloseP: float = Field(description="전일종가", default=0.0)
+    YdiffP: float = Field(description="전일대비", default=0.0)
+    YdiffSign: str = Field(description="전일대비구분", default="")
+    Cgubun: str = Field(description="체결구분", default="")
+    Diff: float = Field(description="등락율", default=0.0)
+    MinOrcPrc: float = Field(description="최소호가", default=0.0)
+    MinBaseOrcPrc: float = Field(description="최소기준호가", default=0.0)
+
+
+# 해외선물옵션현재가(종목정보)조회(o3125)-API용
+class o3125(BaseModel):
+    inblock: o3125InBlock = Field(description="o3125InBlock")
+    outblock: o3125OutBlock = Field(description="o3125OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for o3125",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
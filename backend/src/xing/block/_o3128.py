@@ -0,0 +1,56 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <o3128 - 해외선물옵션차트일주월(o3128)-API용>
+class o3128InBlock(BaseModel):
+    mktgb: str = Field(description="시장구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    gubun: str = Field(description="주기구분", default="")
+    qrycnt: int = Field(description="요청건수", default=0)
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+    cts_date: str = Field(description="연속일자", default="")
+
+
+class o3128OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: float = Field(description="전일시가", default=0.0)
+    jihigh: float = Field(description="전일고가", default=0.0)
+    jilow: float = Field(description="전일저가", default=0.0)
+    jiclose: float = Field(description="전일종가", default=0.0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: float = Field(description="당일시가", default=0.0)
+    dihigh: float = Field(description="당일고가", default=0.0)
+    dilow: float = Field(description="당일저가", default=0.0)
+    diclose: float = Field(description="당일종가", default=0.0)
+    mk_stime: str = Field(description="장시작시간", default="")
+    mk_etime: str = Field(description="장마감시간", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+
+
+class o3128OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+
+
+# 해외선물옵션차트일주월(o3128)-API용
+class o3128(BaseModel):
+    inblock: o3128InBlock = Field(description="o3128InBlock")
+    outblock: o3128OutBlock = Field(description="o3128OutBlock")
+    outblock1: List[o3128OutBlock1] = Field(description="o3128OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for o3128",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
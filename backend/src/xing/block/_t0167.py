@@ -0,0 +1,26 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t0167 - 서버시간조회(t0167)>
+class t0167InBlock(BaseModel):
+    id: str = Field(description="id", default="")
+
+
+class t0167OutBlock(BaseModel):
+    dt: str = Field(description="일자(YYYYMMDD)", default="")
+    time: str = Field(description="시간(HHMMSSssssss)", default="")
+
+
+# 서버시간조회(t0167)
+class t0167(BaseModel):
+    inblock: t0167InBlock = Field(description="t0167InBlock")
+    outblock: t0167OutBlock = Field(description="t0167OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t0167",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
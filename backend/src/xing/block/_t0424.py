@@ -0,0 +1,72 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t0424 - 주식잔고2(t0424)>
+class t0424InBlock(BaseModel):
+    accno: str = Field(description="계좌번호", default="")
+    passwd: str = Field(description="비밀번호", default="")
+    prcgb: str = Field(description="단가구분", default="")
+    chegb: str = Field(description="체결구분", default="")
+    dangb: str = Field(description="단일가구분", default="")
+    charge: str = Field(description="제비용포함여부", default="")
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+
+
+class t0424OutBlock(BaseModel):
+    sunamt: int = Field(description="추정순자산", default=0)
+    dtsunik: int = Field(description="실현손익", default=0)
+    mamt: int = Field(description="매입금액", default=0)
+    sunamt1: int = Field(description="추정D2예수금", default=0)
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+    tappamt: int = Field(description="평가금액", default=0)
+    tdtsunik: int = Field(description="평가손익", default=0)
+
+
+class t0424OutBlock1(BaseModel):
+    expcode: str = Field(description="종목번호", default="")
+    jangb: str = Field(description="잔고구분", default="")
+    janqty: int = Field(description="잔고수량", default=0)
+    mdposqt: int = Field(description="매도가능수량", default=0)
+    pamt: int = Field(description="평균단가", default=0)
+    mamt: int = Field(description="매입금액", default=0)
+    sinamt: int = Field(description="대출금액", default=0)
+    lastdt: str = Field(description="만기일자", default="")
+    msat: int = Field(description="당일매수금액", default=0)
+    mpms: int = Field(description="당일매수단가", default=0)
+    mdat: int = Field(description="당일매도금액", default=0)
+    mpmd: int = Field(description="당일매도단가", default=0)
+    jsat: int = Field(description="전일매수금액", default=0)
+    jpms: int = Field(description="전일매수단가", default=0)
+    jdat: int = Field(description="전일매도금액", default=0)
+    jpmd: int = Field(description="전일매도단가", default=0)
+    sysprocseq: int = Field(description="처리순번", default=0)
+    loandt: str = Field(description="대출일자", default="")
+    hname: str = Field(description="종목명", default="")
+    marketgb: str = Field(description="시장구분", default="")
+    jonggb: str = Field(description="종목구분", default="")
+    janrt: float = Field(description="보유비중", default=0.0)
+    price: int = Field(description="현재가", default=0)
+    appamt: int = Field(description="평가금액", default=0)
+    dtsunik: int = Field(description="평가손익", default=0)
+    sunikrt: float = Field(description="수익율", default=0.0)
+    fee: int = Field(description="수수료", default=0)
+    tax: int = Field(description="제세금", default=0)
+    sininter: int = Field(description="신용이자", default=0)
+
+
+# 주식잔고2(t0424)
+class t0424(BaseModel):
+    inblock: t0424InBlock = Field(description="t0424InBlock")
+    outblock: t0424OutBlock = Field(description="t0424OutBlock")
+    outblock1: List[t0424OutBlock1] = Field(description="t0424OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t0424",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
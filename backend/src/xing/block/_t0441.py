@@ -0,0 +1,51 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t0441 - 선물/옵션잔고평가(이동평균)(t0441)>
+class t0441InBlock(BaseModel):
+    accno: str = Field(description="계좌번호", default="")
+    passwd: str = Field(description="비밀번호", default="")
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+    cts_medocd: str = Field(description="CTS_매매구분", default="")
+
+
+class t0441OutBlock(BaseModel):
+    tdtsunik: int = Field(description="매매손익합계", default=0)
+    cts_expcode: str = Field(description="CTS_종목번호", default="")
+    cts_medocd: str = Field(description="CTS_매매구분", default="")
+    tappamt: int = Field(description="평가금액", default=0)
+    tsunik: int = Field(description="평가손익", default=0)
+
+
+class t0441OutBlock1(BaseModel):
+    expcode: str = Field(description="종목번호", default="")
+    medosu: str = Field(description="구분", default="")
+    jqty: int = Field(description="잔고수량", default=0)
+    cqty: int = Field(description="청산가능수량", default=0)
+    pamt: float = Field(description="평균단가", default=0.0)
+    mamt: int = Field(description="총매입금액", default=0)
+    medocd: str = Field(description="매매구분", default="")
+    dtsunik: int = Field(description="매매손익", default=0)
+    sysprocseq: int = Field(description="처리순번", default=0)
+    price: float = Field(description="현재가", default=0.0)
+    appamt: int = Field(description="평가금액", default=0)
+    dtsunik1: int = Field(description="평가손익", default=0)
+    sunikrt: float = Field(description="수익율", default=0.0)
+
+
+# 선물/옵션잔고평가(이동평균)(t0441)
+class t0441(BaseModel):
+    inblock: t0441InBlock = Field(description="t0441InBlock")
+    outblock: t0441OutBlock = Field(description="t0441OutBlock")
+    outblock1: List[t0441OutBlock1] = Field(description="t0441OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t0441",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
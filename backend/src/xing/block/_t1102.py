@@ -0,0 +1,184 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1102 - 주식현재가(시세)조회(t1102)>
+class t1102InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1102OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    recprice: int = Field(description="기준가(평가가격)", default=0)
+    avg: int = Field(description="가중평균", default=0)
+    uplmtprice: int = Field(description="상한가(최고호가가격)", default=0)
+    dnlmtprice: int = Field(description="하한가(최저호가가격)", default=0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    volumediff: int = Field(description="거래량차", default=0)
+    open: int = Field(description="시가", default=0)
+    opentime: str = Field(description="시가시간", default="")
+    high: int = Field(description="고가", default=0)
+    hightime: str = Field(description="고가시간", default="")
+    low: int = Field(description="저가", default=0)
+    lowtime: str = Field(description="저가시간", default="")
+    high52w: int = Field(description="52최고가", default=0)
+    high52wdate: str = Field(description="52최고가일", default="")
+    low52w: int = Field(description="52최저가", default=0)
+    low52wdate: str = Field(description="52최저가일", default="")
+    exhratio: float = Field(description="소진율", default=0.0)
+    per: float = Field(description="PER", default=0.0)
+    pbrx: float = Field(description="PBRX", default=0.0)
+    listing: int = Field(description="상장주식수(천)", default=0)
+    jkrate: int = Field(description="증거금율", default=0)
+    memedan: str = Field(description="수량단위", default="")
+    offernocd1: str = Field(description="매도증권사코드1", default="")
+    bidnocd1: str = Field(description="매수증권사코드1", default="")
+    offerno1: str = Field(description="매도증권사명1", default="")
+    bidno1: str = Field(description="매수증권사명1", default="")
+    dvol1: int = Field(description="총매도수량1", default=0)
+    svol1: int = Field(description="총매수수량1", default=0)
+    dcha1: int = Field(description="매도증감1", default=0)
+    scha1: int = Field(description="매수증감1", default=0)
+    ddiff1: float = Field(description="매도비율1", default=0.0)
+    sdiff1: float = Field(description="매수비율1", default=0.0)
+    offernocd2: str = Field(description="매도증권사코드2", default="")
+    bidnocd2: str = Field(description="매수증권사코드2", default="")
+    offerno2: str = Field(description="매도증권사명2", default="")
+    bidno2: str = Field(description="매수증권사명2", default="")
+    dvol2: int = Field(description="총매도수량2", default=0)
+    svol2: int = Field(description="총매수수량2", default=0)
+    dcha2: int = Field(description="매도증감2", default=0)
+    scha2: int = Field(description="매수증감2", default=0)
+    ddiff2: float = Field(description="매도비율2", default=0.0)
+    sdiff2: float = Field(description="매수비율2", default=0.0)
+    offernocd3: str = Field(description="매도증권사코드3", default="")
+    bidnocd3: str = Field(description="매수증권사코드3", default="")
+    offerno3: str = Field(description="매도증권사명3", default="")
+    bidno3: str = Field(description="매수증권사명3", default="")
+    dvol3: int = Field(description="총매도수량3", default=0)
+    svol3: int = Field(description="총매수수량3", default=0)
+    dcha3: int = Field(description="매도증감3", default=0)
+    scha3: int = Field(description="매수증감3", default=0)
+    ddiff3: float = Field(description="매도비율3", default=0.0)
+    sdiff3: float = Field(description="매수비율3", default=0.0)
+    offernocd4: str = Field(description="매도증권사코드4", default="")
+    bidnocd4: str = Field(description="매수증권사코드4", default="")
+    offerno4: str = Field(description="매도증권사명4", default="")
+    bidno4: str = Field(description="매수증권사명4", default="")
+    dvol4: int = Field(description="총매도수량4", default=0)
+    svol4: int = Field(description="총매수수량4", default=0)
+    dcha4: int = Field(description="매도증감4", default=0)
+    scha4: int = Field(description="매수증감4", default=0)
+    ddiff4: float = Field(description="매도비율4", default=0.0)
+    sdiff4: float = Field(description="매수비율4", default=0.0)
+    offernocd5: str = Field(description="매도증권사코드5", default="")
+    bidnocd5: str = Field(description="매수증권사코드5", default="")
+    offerno5: str = Field(description="매도증권사명5", default="")
+    bidno5: str = Field(description="매수증권사명5", default="")
+    dvol5: int = Field(description="총매도수량5", default=0)
+    svol5: int = Field(description="총매수수량5", default=0)
+    dcha5: int = Field(description="매도증감5", default=0)
+    scha5: int = Field(description="매수증감5", default=0)
+    ddiff5: float = Field(description="매도비율5", default=0.0)
+    sdiff5: float = Field(description="매수비율5", default=0.0)
+    fwdvl: int = Field(description="외국계매도합계수량", default=0)
+    ftradmdcha: int = Field(description="외국계매도직전대비", default=0)
+    ftradmddiff: float = Field(description="외국계매도비율", default=0.0)
+    fwsvl: int = Field(description="외국계매수합계수량", default=0)
+    ftradmscha: int = Field(description="외국계매수직전대비", default=0)
+    ftradmsdiff: float = Field(description="외국계매수비율", default=0.0)
+    vol: float = Field(description="회전율", default=0.0)
+    shcode: str = Field(description="단축코드", default="")
+    value: int = Field(description="누적거래대금", default=0)
+    jvolume: int = Field(description="전일동시간거래량", default=0)
+    highyear: int = Field(description="연중최고가", default=0)
+    highyeardate: str = Field(description="연중최고일자", default="")
+    lowyear: int = Field(description="연중최저가", default=0)
+    lowyeardate: str = Field(description="연중최저일자", default="")
+    target: int = Field(description="목표가", default=0)
+    capital: int = Field(description="자본금", default=0)
+    abscnt: int = Field(description="유동주식수", default=0)
+    parprice: int = Field(description="액면가", default=0)
+    gsmm: str = Field(description="결산월", default="")
+    subprice: int = Field(description="대용가", default=0)
+    total: int = Field(description="시가총액", default=0)
+    listdate: str = Field(description="상장일", default="")
+    name: str = Field(description="전분기명", default="")
+    bfsales: int = Field(description="전분기매출액", default=0)
+    bfoperatingincome: int = Field(description="전분기영업이익", default=0)
+    bfordinaryincome: int = Field(description="전분기경상이익", default=0)
+    bfnetincome: int = Field(description="전분기순이익", default=0)
+    bfeps: float = Field(description="전분기EPS", default=0.0)
+    name2: str = Field(description="전전분기명", default="")
+    bfsales2: int = Field(description="전전분기매출액", default=0)
+    bfoperatingincome2: int = Field(description="전전분기영업이익", default=0)
+    bfordinaryincome2: int = Field(description="전전분기경상이익", default=0)
+    bfnetincome2: int = Field(description="전전분기순이익", default=0)
+    bfeps2: float = Field(description="전전분기EPS", default=0.0)
+    salert: float = Field(description="전년대비매출액", default=0.0)
+    opert: float = Field(description="전년대비영업이익", default=0.0)
+    ordrt: float = Field(description="전년대비경상이익", default=0.0)
+    netrt: float = Field(description="전년대비순이익", default=0.0)
+    epsrt: float = Field(description="전년대비EPS", default=0.0)
+    info1: str = Field(description="락구분", default="")
+    info2: str = Field(description="관리/급등구분", default="")
+    info3: str = Field(description="정지/연장구분", default="")
+    info4: str = Field(description="투자/불성실구분", default="")
+    janginfo: str = Field(description="장구분", default="")
+    t_per: float = Field(description="T.PER", default=0.0)
+    tonghwa: str = Field(description="통화ISO코드", default="")
+    dval1: int = Field(description="총매도대금1", default=0)
+    sval1: int = Field(description="총매수대금1", default=0)
+    dval2: int = Field(description="총매도대금2", default=0)
+    sval2: int = Field(description="총매수대금2", default=0)
+    dval3: int = Field(description="총매도대금3", default=0)
+    sval3: int = Field(description="총매수대금3", default=0)
+    dval4: int = Field(description="총매도대금4", default=0)
+    sval4: int = Field(description="총매수대금4", default=0)
+    dval5: int = Field(description="총매도대금5", default=0)
+    sval5: int = Field(description="총매수대금5", default=0)
+    davg1: int = Field(description="총매도평단가1", default=0)
+    savg1: int = Field(description="총매수평단가1", default=0)
+    davg2: int = Field(description="총매도평단가2", default=0)
+    savg2: int = Field(description="총매수평단가2", default=0)
+    davg3: int = Field(description="총매도평단가3", default=0)
+    savg3: int = Field(description="총매수평단가3", default=0)
+    davg4: int = Field(description="총매도평단가4", default=0)
+    savg4: int = Field(description="총매수평단가4", default=0)
+    davg5: int = Field(description="총매도평단가5", default=0)
+    savg5: int = Field(description="총매수평단가5", default=0)
+    ftradmdval: int = Field(description="외국계매도대금", default=0)
+    ftradmsval: int = Field(description="외국계매수대금", default=0)
+    ftradmdvag: int = Field(description="외국계매도평단가", default=0)
+    ftradmsvag: int = Field(description="외국계매수평단가", default=0)
+    info5: str = Field(description="투자주의환기", default="")
+    spac_gubun: str = Field(description="기업인수목적회사여부", default="")
+    issueprice: int = Field(description="발행가격", default=0)
+    alloc_gubun: str = Field(description="배분적용구분코드(1:배분발생2:배분해제그외:미발생)", default="")
+    alloc_text: str = Field(description="배분적용구분", default="")
+    shterm_text: str = Field(description="단기과열/VI발동", default="")
+    svi_uplmtprice: int = Field(description="정적VI상한가", default=0)
+    svi_dnlmtprice: int = Field(description="정적VI하한가", default=0)
+    low_lqdt_gu: str = Field(description="저유동성종목여부", default="")
+    abnormal_rise_gu: str = Field(description="이상급등종목여부", default="")
+    lend_text: str = Field(description="대차불가표시", default="")
+    ty_text: str = Field(description="ETF/ETN투자유의", default="")
+
+
+# 주식현재가(시세)조회(t1102)
+class t1102(BaseModel):
+    inblock: t1102InBlock = Field(description="t1102InBlock")
+    outblock: t1102OutBlock = Field(description="t1102OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1102",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
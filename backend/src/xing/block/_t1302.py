@@ -0,0 +1,57 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1302 - 주식분별주가조회(t1302)>
+class t1302InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    gubun: str = Field(description="작업구분", default="")
+    time: str = Field(description="시간", default="")
+    cnt: str = Field(description="건수", default="")
+
+
+class t1302OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t1302OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    mdvolume: int = Field(description="매도체결수량", default=0)
+    msvolume: int = Field(description="매수체결수량", default=0)
+    revolume: int = Field(description="순매수체결량", default=0)
+    mdchecnt: int = Field(description="매도체결건수", default=0)
+    mschecnt: int = Field(description="매수체결건수", default=0)
+    rechecnt: int = Field(description="순체결건수", default=0)
+    volume: int = Field(description="거래량", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    cvolume: int = Field(description="체결량", default=0)
+    mdchecnttm: int = Field(description="매도체결건수(시간)", default=0)
+    mschecnttm: int = Field(description="매수체결건수(시간)", default=0)
+    totofferrem: int = Field(description="매도잔량", default=0)
+    totbidrem: int = Field(description="매수잔량", default=0)
+    mdvolumetm: int = Field(description="시간별매도체결량", default=0)
+    msvolumetm: int = Field(description="시간별매수체결량", default=0)
+
+
+# 주식분별주가조회(t1302)
+class t1302(BaseModel):
+    inblock: t1302InBlock = Field(description="t1302InBlock")
+    outblock: t1302OutBlock = Field(description="t1302OutBlock")
+    outblock1: List[t1302OutBlock1] = Field(description="t1302OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1302",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
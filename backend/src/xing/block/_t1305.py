@@ -0,0 +1,65 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1305 - 기간별주가(t1305)>
+class t1305InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    dwmcode: int = Field(description="일주월구분", default=0)
+    date: str = Field(description="날짜", default="")
+    idx: int = Field(description="IDX", default=0)
+    cnt: int = Field(description="건수", default=0)
+
+
+class t1305OutBlock(BaseModel):
+    cnt: int = Field(description="CNT", default=0)
+    date: str = Field(description="날짜", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1305OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    sojinrate: float = Field(description="소진율", default=0.0)
+    changerate: float = Field(description="회전율", default=0.0)
+    fpvolume: int = Field(description="외인순매수", default=0)
+    covolume: int = Field(description="기관순매수", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    value: int = Field(description="누적거래대금(단위:백만)", default=0)
+    ppvolume: int = Field(description="개인순매수", default=0)
+    o_sign: str = Field(description="시가대비구분", default="")
+    o_change: int = Field(description="시가대비", default=0)
+    o_diff: float = Field(description="시가기준등락율", default=0.0)
+    h_sign: str = Field(description="고가대비구분", default="")
+    h_change: int = Field(description="고가대비", default=0)
+    h_diff: float = Field(description="고가기준등락율", default=0.0)
+    l_sign: str = Field(description="저가대비구분", default="")
+    l_change: int = Field(description="저가대비", default=0)
+    l_diff: float = Field(description="저가기준등락율", default=0.0)
+    marketcap: int = Field(description="시가총액(단위:백만)", default=0)
+
+
+# 기간별주가(t1305)
+class t1305(BaseModel):
+    inblock: t1305InBlock = Field(description="t1305InBlock")
+    outblock: t1305OutBlock = Field(description="t1305OutBlock")
+    outblock1: List[t1305OutBlock1] = Field(description="t1305OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1305",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
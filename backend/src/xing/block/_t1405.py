@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1405 - 투자경고/매매정지/정리매매조회(t1405)>
+class t1405InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    jongchk: str = Field(description="종목체크", default="")
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1405OutBlock(BaseModel):
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1405OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    date: str = Field(description="지정일", default="")
+    edate: str = Field(description="해제일", default="")
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 투자경고/매매정지/정리매매조회(t1405)
+class t1405(BaseModel):
+    inblock: t1405InBlock = Field(description="t1405InBlock")
+    outblock: t1405OutBlock = Field(description="t1405OutBlock")
+    outblock1: List[t1405OutBlock1] = Field(description="t1405OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1405",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
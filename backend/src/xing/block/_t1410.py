@@ -0,0 +1,39 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1410 - 초저유동성조회(t1410)>
+class t1410InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1410OutBlock(BaseModel):
+    cts_shcode: str = Field(description="종목코드_CTS", default="")
+
+
+class t1410OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 초저유동성조회(t1410)
+class t1410(BaseModel):
+    inblock: t1410InBlock = Field(description="t1410InBlock")
+    outblock: t1410OutBlock = Field(description="t1410OutBlock")
+    outblock1: List[t1410OutBlock1] = Field(description="t1410OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1410",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
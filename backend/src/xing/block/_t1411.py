@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1411 - 증거금율별종목조회(t1411)>
+class t1411InBlock(BaseModel):
+    gubun: str = Field(description="시장구분", default="")
+    jongchk: str = Field(description="위탁신용구분", default="")
+    jkrate: str = Field(description="증거금율구분", default="")
+    shcode: str = Field(description="종목코드", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1411OutBlock(BaseModel):
+    jkrate: int = Field(description="위탁증거금율", default=0)
+    sjkrate: int = Field(description="신용증거금율", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1411OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    jkrate: int = Field(description="위탁증거금율", default=0)
+    sjkrate: int = Field(description="신용증거금율", default=0)
+    subprice: int = Field(description="대용가", default=0)
+    recprice: int = Field(description="전일종가", default=0)
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+
+
+# 증거금율별종목조회(t1411)
+class t1411(BaseModel):
+    inblock: t1411InBlock = Field(description="t1411InBlock")
+    outblock: t1411OutBlock = Field(description="t1411OutBlock")
+    outblock1: List[t1411OutBlock1] = Field(description="t1411OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1411",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
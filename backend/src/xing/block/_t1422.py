@@ -0,0 +1,53 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1422 - 상/하한(t1422)>
+class t1422InBlock(BaseModel):
+    qrygb: str = Field(description="조회구분", default="")
+    gubun: str = Field(description="구분", default="")
+    jnilgubun: str = Field(description="전일구분", default="")
+    sign: str = Field(description="상하한구분", default="")
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1422OutBlock(BaseModel):
+    cnt: int = Field(description="CNT", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1422OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    last: str = Field(description="최종진입", default="")
+    lmtdaycnt: int = Field(description="연속", default=0)
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    shcode: str = Field(description="종목코드", default="")
+
+
+# 상/하한(t1422)
+class t1422(BaseModel):
+    inblock: t1422InBlock = Field(description="t1422InBlock")
+    outblock: t1422OutBlock = Field(description="t1422OutBlock")
+    outblock1: List[t1422OutBlock1] = Field(description="t1422OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1422",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,58 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1427 - 상/하한가직전(t1427)>
+class t1427InBlock(BaseModel):
+    qrygb: str = Field(description="조회구분", default="")
+    gubun: str = Field(description="구분", default="")
+    signgubun: str = Field(description="상하한가구분", default="")
+    diff: int = Field(description="등락율", default=0)
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+    jshex: str = Field(description="전일상하한제외", default="")
+
+
+class t1427OutBlock(BaseModel):
+    cnt: int = Field(description="CNT", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1427OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    lmtprice: int = Field(description="상한가/하한가", default=0)
+    rate: float = Field(description="대비율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    jnilvolume: int = Field(description="전일거래량", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    lmtdaycnt: int = Field(description="연속", default=0)
+    value: int = Field(description="거래대금", default=0)
+    total: int = Field(description="시가총액", default=0)
+
+
+# 상/하한가직전(t1427)
+class t1427(BaseModel):
+    inblock: t1427InBlock = Field(description="t1427InBlock")
+    outblock: t1427OutBlock = Field(description="t1427OutBlock")
+    outblock1: List[t1427OutBlock1] = Field(description="t1427OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1427",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,58 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1441 - 등락율상위(t1441)>
+class t1441InBlock(BaseModel):
+    gubun1: str = Field(description="구분", default="")
+    gubun2: str = Field(description="상승하락", default="")
+    gubun3: str = Field(description="당일전일", default="")
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+    jc_num2: int = Field(description="대상제외2", default=0)
+
+
+class t1441OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1441OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    offerrem1: int = Field(description="매도잔량", default=0)
+    offerho1: int = Field(description="매도호가", default=0)
+    bidho1: int = Field(description="매수호가", default=0)
+    bidrem1: int = Field(description="매수잔량", default=0)
+    updaycnt: int = Field(description="연속", default=0)
+    jnildiff: float = Field(description="전일등락율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    voldiff: float = Field(description="거래량대비율", default=0.0)
+    value: int = Field(description="거래대금", default=0)
+    total: int = Field(description="시가총액", default=0)
+
+
+# 등락율상위(t1441)
+class t1441(BaseModel):
+    inblock: t1441InBlock = Field(description="t1441InBlock")
+    outblock: t1441OutBlock = Field(description="t1441OutBlock")
+    outblock1: List[t1441OutBlock1] = Field(description="t1441OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1441",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
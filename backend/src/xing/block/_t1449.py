@@ -0,0 +1,47 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1449 - 가격대별매매비중조회(t1449)>
+class t1449InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    dategb: str = Field(description="일자구분", default="")
+
+
+class t1449OutBlock(BaseModel):
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    msvolume: int = Field(description="매수체결량", default=0)
+    mdvolume: int = Field(description="매도체결량", default=0)
+
+
+class t1449OutBlock1(BaseModel):
+    price: int = Field(description="체결가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    tickdiff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    diff: float = Field(description="비중", default=0.0)
+    mdvolume: int = Field(description="매도체결량", default=0)
+    msvolume: int = Field(description="매수체결량", default=0)
+    msdiff: float = Field(description="매수비율", default=0.0)
+
+
+# 가격대별매매비중조회(t1449)
+class t1449(BaseModel):
+    inblock: t1449InBlock = Field(description="t1449InBlock")
+    outblock: t1449OutBlock = Field(description="t1449OutBlock")
+    outblock1: List[t1449OutBlock1] = Field(description="t1449OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1449",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1466 - 전일동시간대비거래급증(t1466)>
+class t1466InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    type1: str = Field(description="전일거래량", default="")
+    type2: str = Field(description="거래급등율", default="")
+    jc_num: int = Field(description="대상제외", default=0)
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    idx: int = Field(description="IDX", default=0)
+    jc_num2: int = Field(description="대상제외2", default=0)
+
+
+class t1466OutBlock(BaseModel):
+    hhmm: str = Field(description="현재시분", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1466OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    stdvolume: int = Field(description="전일거래량", default=0)
+    volume: int = Field(description="당일거래량", default=0)
+    voldiff: float = Field(description="거래급등율", default=0.0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+
+
+# 전일동시간대비거래급증(t1466)
+class t1466(BaseModel):
+    inblock: t1466InBlock = Field(description="t1466InBlock")
+    outblock: t1466OutBlock = Field(description="t1466OutBlock")
+    outblock1: List[t1466OutBlock1] = Field(description="t1466OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1466",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1475 - 체결강도추이(t1475)>
+class t1475InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    vptype: str = Field(description="상승하락", default="")
+    datacnt: int = Field(description="데이터개수", default=0)
+    date: int = Field(description="기준일자", default=0)
+    time: int = Field(description="기준시간", default=0)
+    rankcnt: int = Field(description="랭크카운터", default=0)
+    gubun: str = Field(description="조회구분", default="")
+
+
+class t1475OutBlock(BaseModel):
+    date: int = Field(description="기준일자", default=0)
+    time: int = Field(description="기준시간", default=0)
+    rankcnt: int = Field(description="랭크카운터", default=0)
+
+
+class t1475OutBlock1(BaseModel):
+    datetime: str = Field(description="일자", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    todayvp: float = Field(description="당일VP", default=0.0)
+    ma5vp: float = Field(description="5일MAVP", default=0.0)
+    ma20vp: float = Field(description="20일MAVP", default=0.0)
+    ma60vp: float = Field(description="60일MAVP", default=0.0)
+
+
+# 체결강도추이(t1475)
+class t1475(BaseModel):
+    inblock: t1475InBlock = Field(description="t1475InBlock")
+    outblock: t1475OutBlock = Field(description="t1475OutBlock")
+    outblock1: List[t1475OutBlock1] = Field(description="t1475OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1475",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1482 - 시간외거래량상위(t1482)>
+class t1482InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    jongchk: str = Field(description="거래량", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1482OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1482OutBlock1(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    vol: float = Field(description="회전율", default=0.0)
+    shcode: str = Field(description="종목코드", default="")
+    value: int = Field(description="누적거래대금", default=0)
+
+
+# 시간외거래량상위(t1482)
+class t1482(BaseModel):
+    inblock: t1482InBlock = Field(description="t1482InBlock")
+    outblock: t1482OutBlock = Field(description="t1482OutBlock")
+    outblock1: List[t1482OutBlock1] = Field(description="t1482OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1482",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1485 - 예상지수(t1485)>
+class t1485InBlock(BaseModel):
+    upcode: str = Field(description="업종코드", default="")
+    gubun: str = Field(description="조회구분", default="")
+
+
+class t1485OutBlock(BaseModel):
+    pricejisu: float = Field(description="현재지수", default=0.0)
+    sign: str = Field(description="지수전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    yhighjo: int = Field(description="상승종목수", default=0)
+    yupjo: int = Field(description="상한종목수", default=0)
+    yunchgjo: int = Field(description="보합종목수", default=0)
+    ylowjo: int = Field(description="하락종목수", default=0)
+    ydownjo: int = Field(description="하한종목수", default=0)
+    ytrajo: int = Field(description="거래형성수", default=0)
+
+
+class t1485OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    jisu: float = Field(description="예상지수", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    volume: int = Field(description="예상체결량", default=0)
+    volcha: int = Field(description="예상체결량직전대비", default=0)
+    diff: float = Field(description="예상등락율", default=0.0)
+
+
+# 예상지수(t1485)
+class t1485(BaseModel):
+    inblock: t1485InBlock = Field(description="t1485InBlock")
+    outblock: t1485OutBlock = Field(description="t1485OutBlock")
+    outblock1: List[t1485OutBlock1] = Field(description="t1485OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1485",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
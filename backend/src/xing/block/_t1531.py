@@ -0,0 +1,30 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1531 - 테마별종목(t1531)>
+class t1531InBlock(BaseModel):
+    tmname: str = Field(description="테마명", default="")
+    tmcode: str = Field(description="테마코드", default="")
+
+
+class t1531OutBlock(BaseModel):
+    tmname: str = Field(description="테마명", default="")
+    avgdiff: float = Field(description="평균등락율", default=0.0)
+    tmcode: str = Field(description="테마코드", default="")
+
+
+# 테마별종목(t1531)
+class t1531(BaseModel):
+    inblock: t1531InBlock = Field(description="t1531InBlock")
+    outblock: List[t1531OutBlock] = Field(description="t1531OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1531",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1532 - 종목별테마(t1532)>
+class t1532InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t1532OutBlock(BaseModel):
+    tmname: str = Field(description="테마명", default="")
+    avgdiff: float = Field(description="평균등락율", default=0.0)
+    tmcode: str = Field(description="테마코드", default="")
+
+
+# 종목별테마(t1532)
+class t1532(BaseModel):
+    inblock: t1532InBlock = Field(description="t1532InBlock")
+    outblock: List[t1532OutBlock] = Field(description="t1532OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1532",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,41 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1533 - 특이테마(t1533)>
+class t1533InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    chgdate: int = Field(description="대비일자", default=0)
+
+
+class t1533OutBlock(BaseModel):
+    bdate: str = Field(description="일자", default="")
+
+
+class t1533OutBlock1(BaseModel):
+    tmname: str = Field(description="테마명", default="")
+    totcnt: int = Field(description="전체", default=0)
+    upcnt: int = Field(description="상승", default=0)
+    dncnt: int = Field(description="하락", default=0)
+    uprate: float = Field(description="상승비율", default=0.0)
+    diff_vol: float = Field(description="거래증가율", default=0.0)
+    avgdiff: float = Field(description="평균등락율", default=0.0)
+    chgdiff: float = Field(description="대비등락율", default=0.0)
+    tmcode: str = Field(description="테마코드", default="")
+
+
+# 특이테마(t1533)
+class t1533(BaseModel):
+    inblock: t1533InBlock = Field(description="t1533InBlock")
+    outblock: t1533OutBlock = Field(description="t1533OutBlock")
+    outblock1: List[t1533OutBlock1] = Field(description="t1533OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1533",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
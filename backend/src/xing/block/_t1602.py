@@ -0,0 +1,111 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1602 - 시간대별투자자매매추이(t1602)>
+class t1602InBlock(BaseModel):
+    market: str = Field(description="시장구분", default="")
+    upcode: str = Field(description="업종코드", default="")
+    gubun1: str = Field(description="수량구분", default="")
+    gubun2: str = Field(description="전일분구분", default="")
+    cts_time: str = Field(description="CTSTIME", default="")
+    cts_idx: int = Field(description="CTSIDX", default=0)
+    cnt: str = Field(description="조회건수", default="")
+    gubun3: str = Field(description="직전대비구분(C:직전대비)", default="")
+
+
+class t1602OutBlock(BaseModel):
+    cts_time: str = Field(description="CTSTIME", default="")
+    tjjcode_08: str = Field(description="개인투자자코드", default="")
+    ms_08: int = Field(description="개인매수", default=0)
+    md_08: int = Field(description="개인매도", default=0)
+    rate_08: int = Field(description="개인증감", default=0)
+    svolume_08: int = Field(description="개인순매수", default=0)
+    jjcode_17: str = Field(description="외국인투자자코드", default="")
+    ms_17: int = Field(description="외국인매수", default=0)
+    md_17: int = Field(description="외국인매도", default=0)
+    rate_17: int = Field(description="외국인증감", default=0)
+    svolume_17: int = Field(description="외국인순매수", default=0)
+    jjcode_18: str = Field(description="기관계투자자코드", default="")
+    ms_18: int = Field(description="기관계매수", default=0)
+    md_18: int = Field(description="기관계매도", default=0)
+    rate_18: int = Field(description="기관계증감", default=0)
+    svolume_18: int = Field(description="기관계순매수", default=0)
+    jjcode_01: str = Field(description="증권투자자코드", default="")
+    ms_01: int = Field(description="증권매수", default=0)
+    md_01: int = Field(description="증권매도", default=0)
+    rate_01: int = Field(description="증권증감", default=0)
+    svolume_01: int = Field(description="증권순매수", default=0)
+    jjcode_03: str = Field(description="투신투자자코드", default="")
+    ms_03: int = Field(description="투신매수", default=0)
+    md_03: int = Field(description="투신매도", default=0)
+    rate_03: int = Field(description="투신증감", default=0)
+    svolume_03: int = Field(description="투신순매수", default=0)
+    jjcode_04: str = Field(description="은행투자자코드", default="")
+    ms_04: int = Field(description="은행매수", default=0)
+    md_04: int = Field(description="은행매도", default=0)
+    rate_04: int = Field(description="은행증감", default=0)
+    svolume_04: int = Field(description="은행순매수", default=0)
+    jjcode_02: str = Field(description="보험투자자코드", default="")
+    ms_02: int = Field(description="보험매수", default=0)
+    md_02: int = Field(description="보험매도", default=0)
+    rate_02: int = Field(description="보험증감", default=0)
+    svolume_02: int = Field(description="보험순매수", default=0)
+    jjcode_05: str = Field(description="종금투자자코드", default="")
+    ms_05: int = Field(description="종금매수", default=0)
+    md_05: int = Field(description="종금매도", default=0)
+    rate_05: int = Field(description="종금증감", default=0)
+    svolume_05: int = Field(description="종금순매수", default=0)
+    jjcode_06: str = Field(description="기금투자자코드", default="")
+    ms_06: int = Field(description="기금매수", default=0)
+    md_06: int = Field(description="기금매도", default=0)
+    rate_06: int = Field(description="기금증감", default=0)
+    svolume_06: int = Field(description="기금순매수", default=0)
+    jjcode_07: str = Field(description="기타투자자코드", default="")
+    ms_07: int = Field(description="기타매수", default=0)
+    md_07: int = Field(description="기타매도", default=0)
+    rate_07: int = Field(description="기타증감", default=0)
+    svolume_07: int = Field(description="기타순매수", default=0)
+    jjcode_11: str = Field(description="국가투자자코드", default="")
+    ms_11: int = Field(description="국가매수", default=0)
+    md_11: int = Field(description="국가매도", default=0)
+    rate_11: int = Field(description="국가증감", default=0)
+    svolume_11: int = Field(description="국가순매수", default=0)
+    jjcode_00: str = Field(description="사모펀드코드", default="")
+    ms_00: int = Field(description="사모펀드매수", default=0)
+    md_00: int = Field(description="사모펀드매도", default=0)
+    rate_00: int = Field(description="사모펀드증감", default=0)
+    svolume_00: int = Field(description="사모펀드순매수", default=0)
+
+
+class t1602OutBlock1(BaseModel):
+    time: str = Field(description="시간", default="")
+    sv_08: int = Field(description="개인순매수", default=0)
+    sv_17: int = Field(description="외국인순매수", default=0)
+    sv_18: int = Field(description="기관계순매수", default=0)
+    sv_01: int = Field(description="증권순매수", default=0)
+    sv_03: int = Field(description="투신순매수", default=0)
+    sv_04: int = Field(description="은행순매수", default=0)
+    sv_02: int = Field(description="보험순매수", default=0)
+    sv_05: int = Field(description="종금순매수", default=0)
+    sv_06: int = Field(description="기금순매수", default=0)
+    sv_07: int = Field(description="기타순매수", default=0)
+    sv_11: int = Field(description="국가순매수", default=0)
+    sv_00: int = Field(description="사모펀드순매수", default=0)
+
+
+# 시간대별투자자매매추이(t1602)
+class t1602(BaseModel):
+    inblock: t1602InBlock = Field(description="t1602InBlock")
+    outblock: t1602OutBlock = Field(description="t1602OutBlock")
+    outblock1: List[t1602OutBlock1] = Field(description="t1602OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1602",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
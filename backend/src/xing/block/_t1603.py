@@ -0,0 +1,46 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1603 - 시간대별투자자매매추이상세(t1603)>
+class t1603InBlock(BaseModel):
+    market: str = Field(description="시장구분", default="")
+    gubun1: str = Field(description="투자자구분", default="")
+    gubun2: str = Field(description="전일분구분", default="")
+    cts_time: str = Field(description="CTSTIME", default="")
+    cts_idx: int = Field(description="CTSIDX", default=0)
+    cnt: str = Field(description="조회건수", default="")
+    upcode: str = Field(description="업종코드", default="")
+
+
+class t1603OutBlock(BaseModel):
+    cts_idx: int = Field(description="CTSIDX", default=0)
+    cts_time: str = Field(description="CTSTIME", default="")
+
+
+class t1603OutBlock1(BaseModel):
+    time: str = Field(description="시간", default="")
+    tjjcode: str = Field(description="투자자구분", default="")
+    msvolume: int = Field(description="매수수량", default=0)
+    mdvolume: int = Field(description="매도수량", default=0)
+    msvalue: int = Field(description="매수금액", default=0)
+    mdvalue: int = Field(description="매도금액", default=0)
+    svolume: int = Field(description="순매수수량", default=0)
+    svalue: int = Field(description="순매수금액", default=0)
+
+
+# 시간대별투자자매매추이상세(t1603)
+class t1603(BaseModel):
+    inblock: t1603InBlock = Field(description="t1603InBlock")
+    outblock: t1603OutBlock = Field(description="t1603OutBlock")
+    outblock1: List[t1603OutBlock1] = Field(description="t1603OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1603",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
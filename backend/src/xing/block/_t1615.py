@@ -0,0 +1,42 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1615 - 투자자매매종합1(t1615)>
+class t1615InBlock(BaseModel):
+    gubun1: str = Field(description="주식구분", default="")
+    gubun2: str = Field(description="옵션구분", default="")
+
+
+class t1615OutBlock(BaseModel):
+    dwvolume: int = Field(description="위탁매도수량", default=0)
+    dwvalue: int = Field(description="위탁매도금액", default=0)
+    djvolume: int = Field(description="자기매도수량", default=0)
+    djvalue: int = Field(description="자기매도금액", default=0)
+    sum_volume: int = Field(description="합계수량", default=0)
+    sum_value: int = Field(description="합계금액", default=0)
+
+
+class t1615OutBlock1(BaseModel):
+    hname: str = Field(description="시장명", default="")
+    sv_08: int = Field(description="개인", default=0)
+    sv_17: int = Field(description="외국인", default=0)
+    sv_18: int = Field(description="기관계", default=0)
+    sv_07: int = Field(description="증권", default=0)
+
+
+# 투자자매매종합1(t1615)
+class t1615(BaseModel):
+    inblock: t1615InBlock = Field(description="t1615InBlock")
+    outblock: t1615OutBlock = Field(description="t1615OutBlock")
+    outblock1: List[t1615OutBlock1] = Field(description="t1615OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1615",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,54 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1617 - 투자자매매종합2(t1617)>
+class t1617InBlock(BaseModel):
+    gubun1: str = Field(description="시장구분(1:코스피2:코스닥3:선물4:콜옵션5:풋옵션6:주식선물)", default="")
+    gubun2: str = Field(description="수량금액구분(1:수량2:금액)", default="")
+    gubun3: str = Field(description="일자구분(1:시간대별2:일별)", default="")
+    cts_date: str = Field(description="CTSDATE(연속키값-일자)", default="")
+    cts_time: str = Field(description="CTSTIME(연속키값-시간)", default="")
+
+
+class t1617OutBlock(BaseModel):
+    cts_date: str = Field(description="CTSDATE", default="")
+    cts_time: str = Field(description="CTSTIME", default="")
+    ms_08: int = Field(description="개인매수", default=0)
+    md_08: int = Field(description="개인매도", default=0)
+    sv_08: int = Field(description="개인순매수", default=0)
+    ms_17: int = Field(description="외국인매수", default=0)
+    md_17: int = Field(description="외국인매도", default=0)
+    sv_17: int = Field(description="외국인순매수", default=0)
+    ms_18: int = Field(description="기관계매수", default=0)
+    md_18: int = Field(description="기관계매도", default=0)
+    sv_18: int = Field(description="기관계순매수", default=0)
+    ms_01: int = Field(description="증권매수", default=0)
+    md_01: int = Field(description="증권매도", default=0)
+    sv_01: int = Field(description="증권순매수", default=0)
+
+
+class t1617OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    sv_08: int = Field(description="개인", default=0)
+    sv_17: int = Field(description="외국인", default=0)
+    sv_18: int = Field(description="기관계", default=0)
+    sv_01: int = Field(description="증권", default=0)
+
+
+# 투자자매매종합2(t1617)
+class t1617(BaseModel):
+    inblock: t1617InBlock = Field(description="t1617InBlock")
+    outblock: t1617OutBlock = Field(description="t1617OutBlock")
+    outblock1: List[t1617OutBlock1] = Field(description="t1617OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1617",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,52 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1632 - 시간대별프로그램매매추이(t1632)>
+class t1632InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+    gubun1: str = Field(description="금액수량구분", default="")
+    gubun2: str = Field(description="직전대비증감", default="")
+    gubun3: str = Field(description="전일구분", default="")
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+
+
+class t1632OutBlock(BaseModel):
+    date: str = Field(description="날짜CTS", default="")
+    time: str = Field(description="시간CTS", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1632OutBlock1(BaseModel):
+    time: str = Field(description="시간", default="")
+    k200jisu: float = Field(description="KP200", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    k200basis: float = Field(description="BASIS", default=0.0)
+    tot3: int = Field(description="전체순매수", default=0)
+    tot1: int = Field(description="전체매수", default=0)
+    tot2: int = Field(description="전체매도", default=0)
+    cha3: int = Field(description="차익순매수", default=0)
+    cha1: int = Field(description="차익매수", default=0)
+    cha2: int = Field(description="차익매도", default=0)
+    bcha3: int = Field(description="비차익순매수", default=0)
+    bcha1: int = Field(description="비차익매수", default=0)
+    bcha2: int = Field(description="비차익매도", default=0)
+
+
+# 시간대별프로그램매매추이(t1632)
+class t1632(BaseModel):
+    inblock: t1632InBlock = Field(description="t1632InBlock")
+    outblock: t1632OutBlock = Field(description="t1632OutBlock")
+    outblock1: List[t1632OutBlock1] = Field(description="t1632OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1632",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,37 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1640 - 프로그램매매종합조회(미니)(t1640)>
+class t1640InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+
+
+class t1640OutBlock(BaseModel):
+    offervolume: int = Field(description="매도수량", default=0)
+    bidvolume: int = Field(description="매수수량", default=0)
+    volume: int = Field(description="순매수수량", default=0)
+    offerdiff: int = Field(description="매도증감", default=0)
+    biddiff: int = Field(description="매수증감", default=0)
+    sundiff: int = Field(description="순매수증감", default=0)
+    basis: float = Field(description="베이시스", default=0.0)
+    offervalue: float = Field(description="매도금액", default=0.0)
+    bidvalue: float = Field(description="매수금액", default=0.0)
+    value: float = Field(description="순매수금액", default=0.0)
+    offervaldiff: float = Field(description="매도금액증감", default=0.0)
+    bidvaldiff: float = Field(description="매수금액증감", default=0.0)
+    sunvaldiff: float = Field(description="순매수증감", default=0.0)
+
+
+# 프로그램매매종합조회(미니)(t1640)
+class t1640(BaseModel):
+    inblock: t1640InBlock = Field(description="t1640InBlock")
+    outblock: t1640OutBlock = Field(description="t1640OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1640",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
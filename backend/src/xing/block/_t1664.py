@@ -0,0 +1,44 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1664 - 투자자매매종합(챠트)>
+class t1664InBlock(BaseModel):
+    mgubun: str = Field(description="시장구분", default="")
+    vagubun: str = Field(description="금액수량구분", default="")
+    bdgubun: str = Field(description="시간일별구분", default="")
+    cnt: str = Field(description="조회건수", default="")
+
+
+class t1664OutBlock1(BaseModel):
+    dt: str = Field(description="일자시간", default="")
+    tjj01: float = Field(description="증권순매수", default=0.0)
+    tjj02: float = Field(description="보험순매수", default=0.0)
+    tjj03: float = Field(description="투신순매수", default=0.0)
+    tjj04: float = Field(description="은행순매수", default=0.0)
+    tjj05: float = Field(description="종금순매수", default=0.0)
+    tjj06: float = Field(description="기금순매수", default=0.0)
+    tjj07: float = Field(description="기타순매수", default=0.0)
+    tjj08: float = Field(description="개인순매수", default=0.0)
+    tjj17: float = Field(description="외국인순매수", default=0.0)
+    tjj18: float = Field(description="기관순매수", default=0.0)
+    cha: float = Field(description="차익순매수", default=0.0)
+    bicha: float = Field(description="비차익순매수", default=0.0)
+    totcha: float = Field(description="종합순매수", default=0.0)
+    basis: float = Field(description="베이시스", default=0.0)
+
+
+# 투자자매매종합(챠트)
+class t1664(BaseModel):
+    inblock: t1664InBlock = Field(description="t1664InBlock")
+    outblock1: List[t1664OutBlock1] = Field(description="t1664OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1664",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,59 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1702 - 외인기관종목별동향(t1702)>
+class t1702InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    todt: str = Field(description="종료일자", default="")
+    volvalgb: str = Field(description="금액수량구분(0:금액1:수량2:단가)", default="")
+    msmdgb: str = Field(description="매수매도구분(0:순매수1:매수2:매도)", default="")
+    cumulgb: str = Field(description="누적구분(0:일간1:누적)", default="")
+    cts_date: str = Field(description="CTSDATE", default="")
+    cts_idx: int = Field(description="CTSIDX", default=0)
+
+
+class t1702OutBlock(BaseModel):
+    cts_idx: int = Field(description="CTSIDX", default=0)
+    cts_date: str = Field(description="CTSDATE", default="")
+
+
+class t1702OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    amt0000: int = Field(description="사모펀드", default=0)
+    amt0001: int = Field(description="증권", default=0)
+    amt0002: int = Field(description="보험", default=0)
+    amt0003: int = Field(description="투신", default=0)
+    amt0004: int = Field(description="은행", default=0)
+    amt0005: int = Field(description="종금", default=0)
+    amt0006: int = Field(description="기금", default=0)
+    amt0007: int = Field(description="기타법인", default=0)
+    amt0008: int = Field(description="개인", default=0)
+    amt0009: int = Field(description="등록외국인", default=0)
+    amt0010: int = Field(description="미등록외국인", default=0)
+    amt0011: int = Field(description="국가외", default=0)
+    amt0018: int = Field(description="기관", default=0)
+    amt0088: int = Field(description="외인계(등록+미등록)", default=0)
+    amt0099: int = Field(description="기타계(기타+국가)", default=0)
+
+
+# 외인기관종목별동향(t1702)
+class t1702(BaseModel):
+    inblock: t1702InBlock = Field(description="t1702InBlock")
+    outblock: t1702OutBlock = Field(description="t1702OutBlock")
+    outblock1: List[t1702OutBlock1] = Field(description="t1702OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1702",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
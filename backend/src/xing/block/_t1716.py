@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1716 - 외인기관종목별동향(t1716)>
+class t1716InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    gubun: str = Field(description="구분(0:일간순매수1:기간누적순매수)", default="")
+    fromdt: str = Field(description="시작일자", default="")
+    todt: str = Field(description="종료일자", default="")
+    prapp: int = Field(description="PR감산적용율", default=0)
+    prgubun: str = Field(description="PR적용구분(0:적용안함1:적용)", default="")
+    orggubun: str = Field(description="기관적용", default="")
+    frggubun: str = Field(description="외인적용", default="")
+
+
+class t1716OutBlock(BaseModel):
+    date: str = Field(description="일자", default="")
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    krx_0008: int = Field(description="거래소_개인", default=0)
+    krx_0018: int = Field(description="거래소_기관", default=0)
+    krx_0009: int = Field(description="거래소_외국인", default=0)
+    pgmvol: int = Field(description="프로그램", default=0)
+    fsc_listing: int = Field(description="금감원_외인보유주식수", default=0)
+    fsc_sjrate: float = Field(description="금감원_소진율", default=0.0)
+    fsc_0009: int = Field(description="금감원_외국인", default=0)
+    gm_volume: int = Field(description="공매도수량", default=0)
+    gm_value: int = Field(description="공매도대금", default=0)
+
+
+# 외인기관종목별동향(t1716)
+class t1716(BaseModel):
+    inblock: t1716InBlock = Field(description="t1716InBlock")
+    outblock: List[t1716OutBlock] = Field(description="t1716OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1716",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,65 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1717 - 외인기관종목별동향(t1717)>
+class t1717InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    gubun: str = Field(description="구분(0:일간순매수1:기간누적순매수)", default="")
+    fromdt: str = Field(description="시작일자(일간조회일경우는space)", default="")
+    todt: str = Field(description="종료일자", default="")
+
+
+class t1717OutBlock(BaseModel):
+    date: str = Field(description="일자", default="")
+    close: int = Field(description="종가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    tjj0000_vol: int = Field(description="사모펀드(순매수량)", default=0)
+    tjj0001_vol: int = Field(description="증권(순매수량)", default=0)
+    tjj0002_vol: int = Field(description="보험(순매수량)", default=0)
+    tjj0003_vol: int = Field(description="투신(순매수량)", default=0)
+    tjj0004_vol: int = Field(description="은행(순매수량)", default=0)
+    tjj0005_vol: int = Field(description="종금(순매수량)", default=0)
+    tjj0006_vol: int = Field(description="기금(순매수량)", default=0)
+    tjj0007_vol: int = Field(description="기타법인(순매수량)", default=0)
+    tjj0008_vol: int = Field(description="개인(순매수량)", default=0)
+    tjj0009_vol: int = Field(description="등록외국인(순매수량)", default=0)
+    tjj0010_vol: int = Field(description="미등록외국인(순매수량)", default=0)
+    tjj0011_vol: int = Field(description="국가외(순매수량)", default=0)
+    tjj0018_vol: int = Field(description="기관(순매수량)", default=0)
+    tjj0016_vol: int = Field(description="외인계(순매수량)(등록+미등록)", default=0)
+    tjj0017_vol: int = Field(description="기타계(순매수량)(기타+국가)", default=0)
+    tjj0000_dan: int = Field(description="사모펀드(단가)", default=0)
+    tjj0001_dan: int = Field(description="증권(단가)", default=0)
+    tjj0002_dan: int = Field(description="보험(단가)", default=0)
+    tjj0003_dan: int = Field(description="투신(단가)", default=0)
+    tjj0004_dan: int = Field(description="은행(단가)", default=0)
+    tjj0005_dan: int = Field(description="종금(단가)", default=0)
+    tjj0006_dan: int = Field(description="기금(단가)", default=0)
+    tjj0007_dan: int = Field(description="기타법인(단가)", default=0)
+    tjj0008_dan: int = Field(description="개인(단가)", default=0)
+    tjj0009_dan: int = Field(description="등록외국인(단가)", default=0)
+    tjj0010_dan: int = Field(description="미등록외국인(단가)", default=0)
+    tjj0011_dan: int = Field(description="국가외(단가)", default=0)
+    tjj0018_dan: int = Field(description="기관(단가)", default=0)
+    tjj0016_dan: int = Field(description="외인계(단가)(등록+미등록)", default=0)
+    tjj0017_dan: int = Field(description="기타계(단가)(기타+국가)", default=0)
+
+
+# 외인기관종목별동향(t1717)
+class t1717(BaseModel):
+    inblock: t1717InBlock = Field(description="t1717InBlock")
+    outblock: List[t1717OutBlock] = Field(description="t1717OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1717",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,33 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1764 - 회원사리스트(t1764)>
+class t1764InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="005930")
+    gubun1: str = Field(description="구분1", default="")
+
+
+class t1764OutBlock(BaseModel):
+    rank: int = Field(description="순위", default=0)
+    tradno: str = Field(description="거래원번호", default="")
+    tradname: str = Field(description="거래원이름", default="")
+
+    class Config:
+        from_attributes = True
+
+
+# 회원사리스트(t1764)
+class t1764(BaseModel):
+    inblock: t1764InBlock = Field(description="t1764InBlock")
+    outblock: List[t1764OutBlock] = Field(description="t1764OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1764",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
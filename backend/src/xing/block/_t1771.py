@@ -0,0 +1,52 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1771 - 종목별회원사추이(t1771)>
+class t1771InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    tradno: str = Field(description="거래원코드", default="")
+    gubun1: str = Field(description="구분1", default="")
+    traddate1: str = Field(description="거래원날짜1", default="")
+    traddate2: str = Field(description="거래원날짜2", default="")
+    cts_idx: int = Field(description="CTSIDX", default=0)
+    cnt: str = Field(description="요청건수", default="")
+
+
+class t1771OutBlock(BaseModel):
+    cts_idx: int = Field(description="CTSIDX", default=0)
+
+
+class t1771OutBlock2(BaseModel):
+    traddate: str = Field(description="날짜", default="")
+    tradtime: str = Field(description="시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="대비구분", default="")
+    change: int = Field(description="대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    tradmdcha: int = Field(description="매도", default=0)
+    tradmscha: int = Field(description="매수", default=0)
+    tradmdval: int = Field(description="매도대금", default=0)
+    tradmsval: int = Field(description="매수대금", default=0)
+    tradmsscha: int = Field(description="순매수", default=0)
+    tradmttvolume: int = Field(description="누적순매수", default=0)
+    tradavg: int = Field(description="평균단가", default=0)
+    tradmttavg: int = Field(description="누적평균단가", default=0)
+
+
+# 종목별회원사추이(t1771)
+class t1771(BaseModel):
+    inblock: t1771InBlock = Field(description="t1771InBlock")
+    outblock: t1771OutBlock = Field(description="t1771OutBlock")
+    outblock2: List[t1771OutBlock2] = Field(description="t1771OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for t1771",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
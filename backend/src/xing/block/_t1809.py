@@ -0,0 +1,48 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1809 - 신호조회(t1809)>
+class t1809InBlock(BaseModel):
+    gubun: str = Field(description="신호구분", default="")
+    jmGb: str = Field(description="종목구분", default="")
+    jmcode: str = Field(description="종목코드", default="")
+    cts: str = Field(description="NEXTKEY", default="")
+
+
+class t1809OutBlock(BaseModel):
+    cts: str = Field(description="NEXTKEY", default="")
+
+
+class t1809OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    time: str = Field(description="시간", default="")
+    signal_id: str = Field(description="신호ID", default="")
+    signal_desc: str = Field(description="신호명", default="")
+    point: str = Field(description="신호강도", default="")
+    keyword: str = Field(description="뉴스신호키워드", default="")
+    seq: str = Field(description="신호별구분", default="")
+    gubun: str = Field(description="신호구분", default="")
+    jmcode: str = Field(description="신호종목", default="")
+    price: int = Field(description="종목가격", default=0)
+    sign: str = Field(description="종목등락부호", default="")
+    chgrate: float = Field(description="대비등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    datetime: str = Field(description="신호일시", default="")
+
+
+# 신호조회(t1809)
+class t1809(BaseModel):
+    inblock: t1809InBlock = Field(description="t1809InBlock")
+    outblock: t1809OutBlock = Field(description="t1809OutBlock")
+    outblock1: List[t1809OutBlock1] = Field(description="t1809OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1809",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
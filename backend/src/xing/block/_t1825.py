@@ -0,0 +1,41 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1825 - 종목Q클릭검색(씽큐스마트)(t1825)>
+class t1825InBlock(BaseModel):
+    search_cd: str = Field(description="검색코드", default="")
+    gubun: str = Field(description="구분(0:전체1:코스피2:코스닥)", default="")
+
+
+class t1825OutBlock(BaseModel):
+    JongCnt: int = Field(description="검색종목수", default=0)
+
+
+class t1825OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    sign: str = Field(description="전일대비구분", default="")
+    signcnt: int = Field(description="연속봉수", default=0)
+    close: int = Field(description="현재가", default=0)
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    volumerate: float = Field(description="거래량전일대비율", default=0.0)
+
+
+# 종목Q클릭검색(씽큐스마트)(t1825)
+class t1825(BaseModel):
+    inblock: t1825InBlock = Field(description="t1825InBlock")
+    outblock: t1825OutBlock = Field(description="t1825OutBlock")
+    outblock1: List[t1825OutBlock1] = Field(description="t1825OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1825",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
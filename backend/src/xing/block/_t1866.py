@@ -0,0 +1,40 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1866 - 서버저장조건리스트조회(API)(t1866)>
+class t1866InBlock(BaseModel):
+    user_id: str = Field(description="로그인ID", default="")
+    gb: str = Field(description="조회구분", default="")
+    group_name: str = Field(description="그룹명", default="")
+    cont: str = Field(description="연속여부", default="")
+    contkey: str = Field(description="연속키", default="")
+
+
+class t1866OutBlock(BaseModel):
+    result_count: int = Field(description="저장조건수", default=0)
+    cont: str = Field(description="연속여부", default="")
+    contkey: str = Field(description="연속키", default="")
+
+
+class t1866OutBlock1(BaseModel):
+    query_index: str = Field(description="서버저장인덱스", default="")
+    group_name: str = Field(description="그룹명", default="")
+    query_name: str = Field(description="조건저장명", default="")
+
+
+# 서버저장조건리스트조회(API)(t1866)
+class t1866(BaseModel):
+    inblock: t1866InBlock = Field(description="t1866InBlock")
+    outblock: t1866OutBlock = Field(description="t1866OutBlock")
+    outblock1: List[t1866OutBlock1] = Field(description="t1866OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1866",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
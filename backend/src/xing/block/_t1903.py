@@ -0,0 +1,47 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1903 - ETF일별추이(t1903)>
+class t1903InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    date: str = Field(description="일자", default="")
+
+
+class t1903OutBlock(BaseModel):
+    date: str = Field(description="일자", default="")
+    hname: str = Field(description="종목명", default="")
+    upname: str = Field(description="업종지수명", default="")
+
+
+class t1903OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    navdiff: float = Field(description="NAV대비", default=0.0)
+    nav: float = Field(description="NAV", default=0.0)
+    navchange: float = Field(description="전일대비", default=0.0)
+    crate: float = Field(description="추적오차", default=0.0)
+    grate: float = Field(description="괴리", default=0.0)
+    jisu: float = Field(description="지수", default=0.0)
+    jichange: float = Field(description="전일대비", default=0.0)
+    jirate: float = Field(description="전일대비율", default=0.0)
+
+
+# ETF일별추이(t1903)
+class t1903(BaseModel):
+    inblock: t1903InBlock = Field(description="t1903InBlock")
+    outblock: t1903OutBlock = Field(description="t1903OutBlock")
+    outblock1: List[t1903OutBlock1] = Field(description="t1903OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1903",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
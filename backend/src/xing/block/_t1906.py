@@ -0,0 +1,130 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t1906 - ETFLP호가(t1906)>
+class t1906InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1906OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="누적거래량", default=0)
+    lp_offerrem1: int = Field(description="LP매도호가수량1", default=0)
+    lp_bidrem1: int = Field(description="LP매수호가수량1", default=0)
+    lp_offerrem2: int = Field(description="LP매도호가수량2", default=0)
+    lp_bidrem2: int = Field(description="LP매수호가수량2", default=0)
+    lp_offerrem3: int = Field(description="LP매도호가수량3", default=0)
+    lp_bidrem3: int = Field(description="LP매수호가수량3", default=0)
+    lp_offerrem4: int = Field(description="LP매도호가수량4", default=0)
+    lp_bidrem4: int = Field(description="LP매수호가수량4", default=0)
+    lp_offerrem5: int = Field(description="LP매도호가수량5", default=0)
+    lp_bidrem5: int = Field(description="LP매수호가수량5", default=0)
+    lp_offerrem6: int = Field(description="LP매도호가수량6", default=0)
+    lp_bidrem6: int = Field(description="LP매수호가수량6", default=0)
+    lp_offerrem7: int = Field(description="LP매도호가수량7", default=0)
+    lp_bidrem7: int = Field(description="LP매수호가수량7", default=0)
+    lp_offerrem8: int = Field(description="LP매도호가수량8", default=0)
+    lp_bidrem8: int = Field(description="LP매수호가수량8", default=0)
+    lp_offerrem9: int = Field(description="LP매도호가수량9", default=0)
+    lp_bidrem9: int = Field(description="LP매수호가수량9", default=0)
+    lp_offerrem10: int = Field(description="LP매도호가수량10", default=0)
+    lp_bidrem10: int = Field(description="LP매수호가수량10", default=0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    offerho1: int = Field(description="매도호가1", default=0)
+    bidho1: int = Field(description="매수호가1", default=0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    preoffercha1: int = Field(description="직전매도대비수량1", default=0)
+    prebidcha1: int = Field(description="직전매수대비수량1", default=0)
+    offerho2: int = Field(description="매도호가2", default=0)
+    bidho2: int = Field(description="매수호가2", default=0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    preoffercha2: int = Field(description="직전매도대비수량2", default=0)
+    prebidcha2: int = Field(description="직전매수대비수량2", default=0)
+    offerho3: int = Field(description="매도호가3", default=0)
+    bidho3: int = Field(description="매수호가3", default=0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    preoffercha3: int = Field(description="직전매도대비수량3", default=0)
+    prebidcha3: int = Field(description="직전매수대비수량3", default=0)
+    offerho4: int = Field(description="매도호가4", default=0)
+    bidho4: int = Field(description="매수호가4", default=0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    preoffercha4: int = Field(description="직전매도대비수량4", default=0)
+    prebidcha4: int = Field(description="직전매수대비수량4", default=0)
+    offerho5: int = Field(description="매도호가5", default=0)
+    bidho5: int = Field(description="매수호가5", default=0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    preoffercha5: int = Field(description="직전매도대비수량5", default=0)
+    prebidcha5: int = Field(description="직전매수대비수량5", default=0)
+    offerho6: int = Field(description="매도호가6", default=0)
+    bidho6: int = Field(description="매수호가6", default=0)
+    offerrem6: int = Field(description="매도호가수량6", default=0)
+    bidrem6: int = Field(description="매수호가수량6", default=0)
+    preoffercha6: int = Field(description="직전매도대비수량6", default=0)
+    prebidcha6: int = Field(description="직전매수대비수량6", default=0)
+    offerho7: int = Field(description="매도호가7", default=0)
+    bidho7: int = Field(description="매수호가7", default=0)
+    offerrem7: int = Field(description="매도호가수량7", default=0)
+    bidrem7: int = Field(description="매수호가수량7", default=0)
+    preoffercha7: int = Field(description="직전매도대비수량7", default=0)
+    prebidcha7: int = Field(description="직전매수대비수량7", default=0)
+    offerho8: int = Field(description="매도호가8", default=0)
+    bidho8: int = Field(description="매수호가8", default=0)
+    offerrem8: int = Field(description="매도호가수량8", default=0)
+    bidrem8: int = Field(description="매수호가수량8", default=0)
+    preoffercha8: int = Field(description="직전매도대비수량8", default=0)
+    prebidcha8: int = Field(description="직전매수대비수량8", default=0)
+    offerho9: int = Field(description="매도호가9", default=0)
+    bidho9: int = Field(description="매수호가9", default=0)
+    offerrem9: int = Field(description="매도호가수량9", default=0)
+    bidrem9: int = Field(description="매수호가수량9", default=0)
+    preoffercha9: int = Field(description="직전매도대비수량9", default=0)
+    prebidcha9: int = Field(description="직전매수대비수량9", default=0)
+    offerho10: int = Field(description="매도호가10", default=0)
+    bidho10: int = Field(description="매수호가10", default=0)
+    offerrem10: int = Field(description="매도호가수량10", default=0)
+    bidrem10: int = Field(description="매수호가수량10", default=0)
+    preoffercha10: int = Field(description="직전매도대비수량10", default=0)
+    prebidcha10: int = Field(description="직전매수대비수량10", default=0)
+    offer: int = Field(description="매도호가수량합", default=0)
+    bid: int = Field(description="매수호가수량합", default=0)
+    preoffercha: int = Field(description="직전매도대비수량합", default=0)
+    prebidcha: int = Field(description="직전매수대비수량합", default=0)
+    hotime: str = Field(description="수신시간", default="")
+    yeprice: int = Field(description="예상체결가격", default=0)
+    yevolume: int = Field(description="예상체결수량", default=0)
+    yesign: str = Field(description="예상체결전일구분", default="")
+    yechange: int = Field(description="예상체결전일대비", default=0)
+    yediff: float = Field(description="예상체결등락율", default=0.0)
+    tmoffer: int = Field(description="시간외매도잔량", default=0)
+    tmbid: int = Field(description="시간외매수잔량", default=0)
+    ho_status: str = Field(description="동시구분", default="")
+    shcode: str = Field(description="단축코드", default="")
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+
+
+# ETFLP호가(t1906)
+class t1906(BaseModel):
+    inblock: t1906InBlock = Field(description="t1906InBlock")
+    outblock: t1906OutBlock = Field(description="t1906OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t1906",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
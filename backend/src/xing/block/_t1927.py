@@ -0,0 +1,50 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1927 - 공매도일별추이(t1927)>
+class t1927InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    date: str = Field(description="일자", default="")
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+
+
+class t1927OutBlock(BaseModel):
+    date: str = Field(description="일자CTS", default="")
+
+
+class t1927OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    gm_vo: int = Field(description="공매도수량", default=0)
+    gm_va: int = Field(description="공매도대금", default=0)
+    gm_per: float = Field(description="공매도거래비중", default=0.0)
+    gm_avg: int = Field(description="평균공매도단가", default=0)
+    gm_vo_sum: int = Field(description="누적공매도수량", default=0)
+    gm_vo1: int = Field(description="업틱룰적용공매도수량", default=0)
+    gm_va1: int = Field(description="업틱룰적용공매도대금", default=0)
+    gm_vo2: int = Field(description="업틱룰예외공매도수량", default=0)
+    gm_va2: int = Field(description="업틱룰예외공매도대금", default=0)
+
+
+# 공매도일별추이(t1927)
+class t1927(BaseModel):
+    inblock: t1927InBlock = Field(description="t1927InBlock")
+    outblock: t1927OutBlock = Field(description="t1927OutBlock")
+    outblock1: List[t1927OutBlock1] = Field(description="t1927OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1927",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
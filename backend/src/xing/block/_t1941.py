@@ -0,0 +1,40 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1941 - 종목별대차거래일간추이(t1941)>
+class t1941InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+
+
+class t1941OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    price: int = Field(description="종가", default=0)
+    sign: str = Field(description="대비구분", default="")
+    change: int = Field(description="대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    upvolume: int = Field(description="당일체결", default=0)
+    dnvolume: int = Field(description="당일상환", default=0)
+    tovolume: int = Field(description="당일잔고", default=0)
+    tovalue: int = Field(description="잔고금액", default=0)
+    shcode: str = Field(description="종목코드", default="")
+    tovoldif: int = Field(description="대차증감", default=0)
+
+
+# 종목별대차거래일간추이(t1941)
+class t1941(BaseModel):
+    inblock: t1941InBlock = Field(description="t1941InBlock")
+    outblock1: List[t1941OutBlock1] = Field(description="t1941OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1941",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
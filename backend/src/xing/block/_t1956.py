@@ -0,0 +1,119 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1956 - ELW현재가(확정지급액)조회(t1956)>
+class t1956InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t1956OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    chetime: str = Field(description="체결시간", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    cvolume: int = Field(description="체결량", default=0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    recprice: int = Field(description="기준가", default=0)
+    avg: int = Field(description="가중평균", default=0)
+    jnilvolume: float = Field(description="전일거래량", default=0.0)
+    jvolume: float = Field(description="전일동시간거래량", default=0.0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    volumechg: float = Field(description="거래량차", default=0.0)
+    volumediff: float = Field(description="거래량차등락율", default=0.0)
+    open: int = Field(description="시가", default=0)
+    odiff: float = Field(description="시가등락율", default=0.0)
+    opentime: str = Field(description="시가시간", default="")
+    high: int = Field(description="고가", default=0)
+    hdiff: float = Field(description="고가등락율", default=0.0)
+    hightime: str = Field(description="고가시간", default="")
+    low: int = Field(description="저가", default=0)
+    ldiff: float = Field(description="저가등락율", default=0.0)
+    lowtime: str = Field(description="저가시간", default="")
+    high52w: int = Field(description="52최고가", default=0)
+    high52wdiff: float = Field(description="52최고가등락율", default=0.0)
+    high52wdate: str = Field(description="52최고가일", default="")
+    low52w: int = Field(description="52최저가", default=0)
+    low52wdiff: float = Field(description="52최저가등락율", default=0.0)
+    low52wdate: str = Field(description="52최저가일", default="")
+    exhratio: float = Field(description="소진율", default=0.0)
+    listing: float = Field(description="상장주식수(천)", default=0.0)
+    memedan: str = Field(description="수량단위", default="")
+    vol: float = Field(description="회전율", default=0.0)
+    parity: float = Field(description="패리티", default=0.0)
+    berate: float = Field(description="손익분기", default=0.0)
+    gearing: float = Field(description="기어링", default=0.0)
+    elwexec: float = Field(description="행사가", default=0.0)
+    issueprice: int = Field(description="발행가", default=0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    lastdate: str = Field(description="최종거래일", default="")
+    capt: float = Field(description="자본지지", default=0.0)
+    egearing: float = Field(description="e.기어링", default=0.0)
+    premium: float = Field(description="프리미엄", default=0.0)
+    spread: float = Field(description="스프레드", default=0.0)
+    espread: float = Field(description="최대스프레드", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    moneyness: str = Field(description="상태", default="")
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    ceta: float = Field(description="쎄타", default=0.0)
+    rhox: float = Field(description="로", default=0.0)
+    bjandatecnt: int = Field(description="잔존일수", default=0)
+    mmsdate: str = Field(description="행사개시일", default="")
+    mmedate: str = Field(description="행사종료일", default="")
+    payday: str = Field(description="지급일", default="")
+    listdate: str = Field(description="발행일", default="")
+    lpmem: str = Field(description="LP회원사", default="")
+    lp_holdvol: float = Field(description="LP보유수량", default=0.0)
+    bcode: str = Field(description="기초자산코드", default="")
+    bgubun: str = Field(description="기초자산구분", default="")
+    bprice: int = Field(description="기초자산현재가", default=0)
+    bsign: str = Field(description="기초자산전일비구분", default="")
+    bchange: int = Field(description="기초자산전일비", default=0)
+    bdiff: float = Field(description="기초자산등락율", default=0.0)
+    bvolume: float = Field(description="기초자산거래량", default=0.0)
+    info1: str = Field(description="락구분", default="")
+    info2: str = Field(description="관리/급등구분", default="")
+    info3: str = Field(description="정지/연장구분", default="")
+    info4: str = Field(description="투자/불성실구분", default="")
+    janginfo: str = Field(description="장구분", default="")
+    basketgb: str = Field(description="바스켓구분", default="")
+    basketcnt: int = Field(description="바스켓갯수", default=0)
+    elwtype: str = Field(description="ELW권리행사방식", default="")
+    settletype: str = Field(description="ELW결제방법", default="")
+    lpord: str = Field(description="LP사주문가능여부", default="")
+    elwdetail: str = Field(description="권리내용", default="")
+    valuation: str = Field(description="만기평가가격방식", default="")
+    givemoney: float = Field(description="확정지급액", default=0.0)
+
+
+class t1956OutBlock1(BaseModel):
+    bskcode: str = Field(description="기초자산코드", default="")
+    bskbno: int = Field(description="기초자산비율", default=0)
+    bskprice: int = Field(description="기초자산현재가", default=0)
+    bsksign: str = Field(description="기초자산전일비구분", default="")
+    bskchange: int = Field(description="기초자산전일비", default=0)
+    bskdiff: float = Field(description="기초자산등락율", default=0.0)
+    bskvolume: float = Field(description="기초자산거래량", default=0.0)
+    bskjnilclose: int = Field(description="기초자산전일종가", default=0)
+
+
+# ELW현재가(확정지급액)조회(t1956)
+class t1956(BaseModel):
+    inblock: t1956InBlock = Field(description="t1956InBlock")
+    outblock: t1956OutBlock = Field(description="t1956OutBlock")
+    outblock1: List[t1956OutBlock1] = Field(description="t1956OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1956",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
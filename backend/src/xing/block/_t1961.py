@@ -0,0 +1,59 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1961 - ELW거래량상위(t1961)>
+class t1961InBlock(BaseModel):
+    gubun: str = Field(description="당일전일(0:당일1:전일)", default="")
+    ggubun: str = Field(description="권리유형구분(00:EX01:콜02:풋" ":전체)", default="")
+    itemcode: str = Field(description="기초자산종목", default="")
+    lastdate: str = Field(description="조회만기일", default="")
+    exgubun: str = Field(description="대상제외", default="")
+    sprice: int = Field(description="시작가격", default=0)
+    eprice: int = Field(description="종료가격", default=0)
+    volume: int = Field(description="거래량", default=0)
+    sjanday: int = Field(description="잔존시작일수", default=0)
+    ejanday: int = Field(description="잔존종료일수", default=0)
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1961OutBlock(BaseModel):
+    idx: int = Field(description="IDX", default=0)
+
+
+class t1961OutBlock1(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="누적거래량", default=0.0)
+    jnilvolume: float = Field(description="전일거래량", default=0.0)
+    elwexec: float = Field(description="행사가", default=0.0)
+    convrate: float = Field(description="전환비율", default=0.0)
+    lastdate: str = Field(description="만기일", default="")
+    itemcode: str = Field(description="기초자산종목코드", default="")
+    itemshcode: str = Field(description="기초자산단축코드", default="")
+    itemname: str = Field(description="기초자산종목명", default="")
+    itemprice: str = Field(description="기초자산현재가", default="")
+    itemsign: str = Field(description="기초자산대비구분", default="")
+    itemchange: str = Field(description="기초자산전일대비", default="")
+    itemdiff: float = Field(description="기초자산등락율", default=0.0)
+    elwshcode: str = Field(description="ELW종목코드", default="")
+
+
+# ELW거래량상위(t1961)
+class t1961(BaseModel):
+    inblock: t1961InBlock = Field(description="t1961InBlock")
+    outblock: t1961OutBlock = Field(description="t1961OutBlock")
+    outblock1: List[t1961OutBlock1] = Field(description="t1961OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1961",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
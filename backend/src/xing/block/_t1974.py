@@ -0,0 +1,39 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1974 - ELW기초자산동일종목(t1974)>
+class t1974InBlock(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+
+
+class t1974OutBlock(BaseModel):
+    cnt: int = Field(description="종목갯수", default=0)
+
+
+class t1974OutBlock1(BaseModel):
+    shcode: str = Field(description="종목코드", default="")
+    hname: str = Field(description="종목명", default="")
+    cpgubun: str = Field(description="콜/풋구분", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+
+
+# ELW기초자산동일종목(t1974)
+class t1974(BaseModel):
+    inblock: t1974InBlock = Field(description="t1974InBlock")
+    outblock: t1974OutBlock = Field(description="t1974OutBlock")
+    outblock1: List[t1974OutBlock1] = Field(description="t1974OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1974",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
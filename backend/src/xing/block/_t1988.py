@@ -0,0 +1,57 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t1988 - 기초자산리스트조회(t1988)>
+class t1988InBlock(BaseModel):
+    mkt_gb: str = Field(description="시장구분(0:전체1:코스피2:코스닥)", default="")
+    chk_price: str = Field(description="가격설정(0:전체1:조건설정)", default="")
+    from_price: str = Field(description="가격1", default="")
+    to_price: str = Field(description="가격2", default="")
+    chk_vol: str = Field(description="거래량설정(0:전체1:조건설정)", default="")
+    from_vol: str = Field(description="거래량1", default="")
+    to_vol: str = Field(description="거래량2", default="")
+    chk_rate: str = Field(description="등락율설정(0:전체1:조건설정)", default="")
+    from_rate: float = Field(description="등락율1", default=0.0)
+    to_rate: float = Field(description="등락율2", default=0.0)
+    chk_amt: str = Field(description="거래대금설정(0:전체1:조건설정)", default="")
+    from_amt: str = Field(description="거래대금1", default="")
+    to_amt: str = Field(description="거래대금2", default="")
+    chk_up: str = Field(description="양봉설정(0:전체1:조건설정)", default="")
+    chk_down: str = Field(description="음봉설정(0:전체1:조건설정)", default="")
+
+
+class t1988OutBlock(BaseModel):
+    ksp_cnt: str = Field(description="코스피종목건수", default="")
+    ksd_cnt: str = Field(description="코스닥종목건수", default="")
+
+
+class t1988OutBlock1(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="표준코드", default="")
+    hname: str = Field(description="종목명", default="")
+    price: str = Field(description="현재가", default="")
+    sign: str = Field(description="부호", default="")
+    change: str = Field(description="대비", default="")
+    rate: float = Field(description="등락율", default=0.0)
+    volume: str = Field(description="누적거래량(주)", default="")
+    value: str = Field(description="누적거래대금(백만)", default="")
+    mkt_gb: str = Field(description="시장구분", default="")
+    jvolume: str = Field(description="전일동시간대거래량(주)", default="")
+
+
+# 기초자산리스트조회(t1988)
+class t1988(BaseModel):
+    inblock: t1988InBlock = Field(description="t1988InBlock")
+    outblock: t1988OutBlock = Field(description="t1988OutBlock")
+    outblock1: List[t1988OutBlock1] = Field(description="t1988OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t1988",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
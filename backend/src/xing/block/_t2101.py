@@ -0,0 +1,93 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t2101 - 선물/옵션현재가(시세)조회(t2101)>
+class t2101InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+
+
+class t2101OutBlock(BaseModel):
+    hname: str = Field(description="한글명", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    jnilclose: float = Field(description="전일종가", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    mgjv: int = Field(description="미결제량", default=0)
+    mgjvdiff: int = Field(description="미결제증감", default=0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    uplmtprice: float = Field(description="상한가", default=0.0)
+    dnlmtprice: float = Field(description="하한가", default=0.0)
+    high52w: float = Field(description="52최고가", default=0.0)
+    low52w: float = Field(description="52최저가", default=0.0)
+    basis: float = Field(description="베이시스", default=0.0)
+    recprice: float = Field(description="기준가", default=0.0)
+    theoryprice: float = Field(description="이론가", default=0.0)
+    glyl: float = Field(description="괴리율", default=0.0)
+    cbhprice: float = Field(description="CB상한가", default=0.0)
+    cblprice: float = Field(description="CB하한가", default=0.0)
+    lastmonth: str = Field(description="만기일", default="")
+    jandatecnt: int = Field(description="잔여일", default=0)
+    pricejisu: float = Field(description="종합지수", default=0.0)
+    jisusign: str = Field(description="종합지수전일대비구분", default="")
+    jisuchange: float = Field(description="종합지수전일대비", default=0.0)
+    jisudiff: float = Field(description="종합지수등락율", default=0.0)
+    kospijisu: float = Field(description="KOSPI200지수", default=0.0)
+    kospisign: str = Field(description="KOSPI200전일대비구분", default="")
+    kospichange: float = Field(description="KOSPI200전일대비", default=0.0)
+    kospidiff: float = Field(description="KOSPI200등락율", default=0.0)
+    listhprice: float = Field(description="상장최고가", default=0.0)
+    listlprice: float = Field(description="상장최저가", default=0.0)
+    delt: float = Field(description="델타", default=0.0)
+    gama: float = Field(description="감마", default=0.0)
+    ceta: float = Field(description="세타", default=0.0)
+    vega: float = Field(description="베가", default=0.0)
+    rhox: float = Field(description="로우", default=0.0)
+    gmprice: float = Field(description="근월물현재가", default=0.0)
+    gmsign: str = Field(description="근월물전일대비구분", default="")
+    gmchange: float = Field(description="근월물전일대비", default=0.0)
+    gmdiff: float = Field(description="근월물등락율", default=0.0)
+    theorypriceg: float = Field(description="이론가", default=0.0)
+    histimpv: float = Field(description="역사적변동성", default=0.0)
+    impv: float = Field(description="내재변동성", default=0.0)
+    sbasis: float = Field(description="시장BASIS", default=0.0)
+    ibasis: float = Field(description="이론BASIS", default=0.0)
+    gmfutcode: str = Field(description="근월물종목코드", default="")
+    actprice: float = Field(description="행사가", default=0.0)
+    greeks_time: str = Field(description="거래소민감도수신시간", default="")
+    greeks_confirm: str = Field(description="거래소민감도확정여부", default="")
+    danhochk: str = Field(description="단일가호가여부", default="")
+    yeprice: float = Field(description="예상체결가", default=0.0)
+    jnilysign: str = Field(description="예상체결가전일종가대비구분", default="")
+    jnilychange: float = Field(description="예상체결가전일종가대비", default=0.0)
+    jnilydrate: float = Field(description="예상체결가전일종가등락율", default=0.0)
+    alloc_gubun: str = Field(description="배분구분(1:배분개시2:배분해제0:미발생)", default="")
+    bjandatecnt: int = Field(description="잔여일(영업일)", default=0)
+    focode: str = Field(description="종목코드", default="")
+    dy_gubun: str = Field(description="실시간가격제한여부(0:대상아님1:적용중2:미적용중3:일시해제)", default="")
+    dy_uplmtprice: float = Field(description="실시간상한가", default=0.0)
+    dy_dnlmtprice: float = Field(description="실시간하한가", default=0.0)
+    updnstep_gubun: str = Field(description="가격제한폭확대(0:미확대1:확대2:대상아님)", default="")
+    upstep: str = Field(description="상한적용단계", default="")
+    dnstep: str = Field(description="하한적용단계", default="")
+    uplmtprice_3rd: float = Field(description="3단계상한가", default=0.0)
+    dnlmtprice_3rd: float = Field(description="3단계하한가", default=0.0)
+
+
+# 선물/옵션현재가(시세)조회(t2101)
+class t2101(BaseModel):
+    inblock: t2101InBlock = Field(description="t2101InBlock")
+    outblock: t2101OutBlock = Field(description="t2101OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t2101",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,49 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2209 - 선물옵션틱분별체결조회챠트(t2209)>
+class t2209InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+    cgubun: str = Field(description="챠트구분", default="")
+    bgubun: str = Field(description="분구분", default="")
+    cnt: str = Field(description="조회건수", default="")
+
+
+class t2209OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    value: float = Field(description="거래대금", default=0.0)
+    openyak: int = Field(description="미결수량", default=0)
+    openupdn: int = Field(description="미결증감", default=0)
+    cvolume: int = Field(description="체결수량", default=0)
+    s_mschecnt: int = Field(description="매수순간체결건수", default=0)
+    s_mdchecnt: int = Field(description="매도순간체결건수", default=0)
+    ss_mschecnt: int = Field(description="순매수순간체결건수", default=0)
+    s_mschevol: float = Field(description="매수순간체결량", default=0.0)
+    s_mdchevol: float = Field(description="매도순간체결량", default=0.0)
+    ss_mschevol: float = Field(description="순매수순간체결량", default=0.0)
+    chdegvol: float = Field(description="체결강도(거래량)", default=0.0)
+    chdegcnt: float = Field(description="체결강도(건수)", default=0.0)
+
+
+# 선물옵션틱분별체결조회챠트(t2209)
+class t2209(BaseModel):
+    inblock: t2209InBlock = Field(description="t2209InBlock")
+    outblock1: List[t2209OutBlock1] = Field(description="t2209OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2209",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
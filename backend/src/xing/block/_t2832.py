@@ -0,0 +1,50 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t2832 - EUREX야간옵션선물시간대별체결조회(t2832)>
+class t2832InBlock(BaseModel):
+    focode: str = Field(description="단축코드", default="")
+    cvolume: int = Field(description="특이거래량", default=0)
+    stime: str = Field(description="시작시간", default="")
+    etime: str = Field(description="종료시간", default="")
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t2832OutBlock(BaseModel):
+    cts_time: str = Field(description="시간CTS", default="")
+
+
+class t2832OutBlock1(BaseModel):
+    chetime: str = Field(description="시간", default="")
+    price: float = Field(description="현재가", default=0.0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: float = Field(description="전일대비", default=0.0)
+    cvolume: int = Field(description="체결수량", default=0)
+    chdegree: float = Field(description="체결강도", default=0.0)
+    offerho: float = Field(description="매도호가", default=0.0)
+    bidho: float = Field(description="매수호가", default=0.0)
+    volume: float = Field(description="거래량", default=0.0)
+    n_msvolume: float = Field(description="누적매수체결량", default=0.0)
+    n_mdvolume: float = Field(description="누적매도체결량", default=0.0)
+    s_msvolume: float = Field(description="누적순매수체결량", default=0.0)
+    n_mschecnt: int = Field(description="누적매수체결건수", default=0)
+    n_mdchecnt: int = Field(description="누적매도체결건수", default=0)
+    s_mschecnt: int = Field(description="누적순매수체결건수", default=0)
+
+
+# EUREX야간옵션선물시간대별체결조회(t2832)
+class t2832(BaseModel):
+    inblock: t2832InBlock = Field(description="t2832InBlock")
+    outblock: t2832OutBlock = Field(description="t2832OutBlock")
+    outblock1: List[t2832OutBlock1] = Field(description="t2832OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t2832",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,37 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t3102 - 뉴스본문(t3102)>
+class t3102InBlock(BaseModel):
+    sNewsno: str = Field(description="뉴스번호", default="")
+
+
+class t3102OutBlock(BaseModel):
+    sJongcode: str = Field(description="뉴스종목", default="")
+
+
+class t3102OutBlock1(BaseModel):
+    sBody: str = Field(description="뉴스본문", default="")
+
+
+class t3102OutBlock2(BaseModel):
+    sTitle: str = Field(description="뉴스타이틀", default="")
+
+
+# 뉴스본문(t3102)
+class t3102(BaseModel):
+    inblock: t3102InBlock = Field(description="t3102InBlock")
+    outblock: List[t3102OutBlock] = Field(description="t3102OutBlock")
+    outblock1: List[t3102OutBlock1] = Field(description="t3102OutBlock1")
+    outblock2: t3102OutBlock2 = Field(description="t3102OutBlock2")
+    metadata: dict = Field(
+        description="The metadata information for t3102",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,32 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t3521 - 해외지수조회(API용)(t3521)>
+class t3521InBlock(BaseModel):
+    kind: str = Field(description="종목종류", default="")
+    symbol: str = Field(description="SYMBOL", default="")
+
+
+class t3521OutBlock(BaseModel):
+    symbol: str = Field(description="심벌", default="")
+    hname: str = Field(description="지수명", default="")
+    close: float = Field(description="지수", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    date: str = Field(description="일자", default="")
+
+
+# 해외지수조회(API용)(t3521)
+class t3521(BaseModel):
+    inblock: t3521InBlock = Field(description="t3521InBlock")
+    outblock: t3521OutBlock = Field(description="t3521OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t3521",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,61 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t4203 - 업종챠트(종합)(t4203)>
+class t4203InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    gubun: str = Field(description="주기구분(0:틱1:분2:일3:주4:월)", default="")
+    ncnt: int = Field(description="틱개수", default=0)
+    qrycnt: int = Field(description="건수", default=0)
+    tdgb: str = Field(description="당일구분(0:전체1:당일만)", default="")
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분(0:연속전체1:연속당일만2:연속전일만)", default="")
+
+
+class t4203OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: float = Field(description="전일시가", default=0.0)
+    jihigh: float = Field(description="전일고가", default=0.0)
+    jilow: float = Field(description="전일저가", default=0.0)
+    jiclose: float = Field(description="전일종가", default=0.0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: float = Field(description="당일시가", default=0.0)
+    dihigh: float = Field(description="당일고가", default=0.0)
+    dilow: float = Field(description="당일저가", default=0.0)
+    diclose: float = Field(description="당일종가", default=0.0)
+    disvalue: int = Field(description="당일거래대금", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    cts_daygb: str = Field(description="연속당일구분", default="")
+
+
+class t4203OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    jdiff_vol: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+
+
+# 업종챠트(종합)(t4203)
+class t4203(BaseModel):
+    inblock: t4203InBlock = Field(description="t4203InBlock")
+    outblock: t4203OutBlock = Field(description="t4203OutBlock")
+    outblock1: List[t4203OutBlock1] = Field(description="t4203OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t4203",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,98 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from pydantic import BaseModel, Field
+
+
+# region <t8403 - 주식선물호가조회(API용)(t8403)>
+class t8403InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+
+
+class t8403OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    price: int = Field(description="현재가", default=0)
+    sign: str = Field(description="전일대비구분", default="")
+    change: int = Field(description="전일대비", default=0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    stimeqrt: float = Field(description="거래량전일동시간비율", default=0.0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    offerho1: int = Field(description="매도호가1", default=0)
+    bidho1: int = Field(description="매수호가1", default=0)
+    offerrem1: int = Field(description="매도호가수량1", default=0)
+    bidrem1: int = Field(description="매수호가수량1", default=0)
+    dcnt1: int = Field(description="매도호가건수1", default=0)
+    scnt1: int = Field(description="매수호가건수1", default=0)
+    offerho2: int = Field(description="매도호가2", default=0)
+    bidho2: int = Field(description="매수호가2", default=0)
+    offerrem2: int = Field(description="매도호가수량2", default=0)
+    bidrem2: int = Field(description="매수호가수량2", default=0)
+    dcnt2: int = Field(description="매도호가건수2", default=0)
+    scnt2: int = Field(description="매수호가건수2", default=0)
+    offerho3: int = Field(description="매도호가3", default=0)
+    bidho3: int = Field(description="매수호가3", default=0)
+    offerrem3: int = Field(description="매도호가수량3", default=0)
+    bidrem3: int = Field(description="매수호가수량3", default=0)
+    dcnt3: int = Field(description="매도호가건수3", default=0)
+    scnt3: int = Field(description="매수호가건수3", default=0)
+    offerho4: int = Field(description="매도호가4", default=0)
+    bidho4: int = Field(description="매수호가4", default=0)
+    offerrem4: int = Field(description="매도호가수량4", default=0)
+    bidrem4: int = Field(description="매수호가수량4", default=0)
+    dcnt4: int = Field(description="매도호가건수4", default=0)
+    scnt4: int = Field(description="매수호가건수4", default=0)
+    offerho5: int = Field(description="매도호가5", default=0)
+    bidho5: int = Field(description="매수호가5", default=0)
+    offerrem5: int = Field(description="매도호가수량5", default=0)
+    bidrem5: int = Field(description="매수호가수량5", default=0)
+    dcnt5: int = Field(description="매도호가건수5", default=0)
+    scnt5: int = Field(description="매수호가건수5", default=0)
+    offerho6: int = Field(description="매도호가6", default=0)
+    bidho6: int = Field(description="매수호가6", default=0)
+    offerrem6: int = Field(description="매도호가수량6", default=0)
+    bidrem6: int = Field(description="매수호가수량6", default=0)
+    dcnt6: int = Field(description="매도호가건수6", default=0)
+    scnt6: int = Field(description="매수호가건수6", default=0)
+    offerho7: int = Field(description="매도호가7", default=0)
+    bidho7: int = Field(description="매수호가7", default=0)
+    offerrem7: int = Field(description="매도호가수량7", default=0)
+    bidrem7: int = Field(description="매수호가수량7", default=0)
+    dcnt7: int = Field(description="매도호가건수7", default=0)
+    scnt7: int = Field(description="매수호가건수7", default=0)
+    offerho8: int = Field(description="매도호가8", default=0)
+    bidho8: int = Field(description="매수호가8", default=0)
+    offerrem8: int = Field(description="매도호가수량8", default=0)
+    bidrem8: int = Field(description="매수호가수량8", default=0)
+    dcnt8: int = Field(description="매도호가건수8", default=0)
+    scnt8: int = Field(description="매수호가건수8", default=0)
+    offerho9: int = Field(description="매도호가9", default=0)
+    bidho9: int = Field(description="매수호가9", default=0)
+    offerrem9: int = Field(description="매도호가수량9", default=0)
+    bidrem9: int = Field(description="매수호가수량9", default=0)
+    dcnt9: int = Field(description="매도호가건수9", default=0)
+    scnt9: int = Field(description="매수호가건수9", default=0)
+    offerho10: int = Field(description="매도호가10", default=0)
+    bidho10: int = Field(description="매수호가10", default=0)
+    offerrem10: int = Field(description="매도호가수량10", default=0)
+    bidrem10: int = Field(description="매수호가수량10", default=0)
+    dcnt10: int = Field(description="매도호가건수10", default=0)
+    scnt10: int = Field(description="매수호가건수10", default=0)
+    dvol: int = Field(description="매도호가총수량", default=0)
+    svol: int = Field(description="매수호가총수량", default=0)
+    toffernum: int = Field(description="총매도호가건수", default=0)
+    tbidnum: int = Field(description="총매수호가건수", default=0)
+    time: str = Field(description="수신시간", default="")
+    shcode: str = Field(description="단축코드", default="")
+
+
+# 주식선물호가조회(API용)(t8403)
+class t8403(BaseModel):
+    inblock: t8403InBlock = Field(description="t8403InBlock")
+    outblock: t8403OutBlock = Field(description="t8403OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8403",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,68 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8411 - 주식챠트(틱/n틱)(t8411)>
+class t8411InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="단위(n틱)", default=0)
+    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
+    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
+    sdate: str = Field(description="시작일자", default="")
+    stime: str = Field(description="시작시간(현재미사용)", default="")
+    edate: str = Field(description="종료일자", default="")
+    etime: str = Field(description="종료시간(현재미사용)", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
+
+
+class t8411OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: int = Field(description="전일시가", default=0)
+    jihigh: int = Field(description="전일고가", default=0)
+    jilow: int = Field(description="전일저가", default=0)
+    jiclose: int = Field(description="전일종가", default=0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: int = Field(description="당일시가", default=0)
+    dihigh: int = Field(description="당일고가", default=0)
+    dilow: int = Field(description="당일저가", default=0)
+    diclose: int = Field(description="당일종가", default=0)
+    highend: int = Field(description="상한가", default=0)
+    lowend: int = Field(description="하한가", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
+    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
+    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+
+
+class t8411OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: int = Field(description="시가", default=0)
+    high: int = Field(description="고가", default=0)
+    low: int = Field(description="저가", default=0)
+    close: int = Field(description="종가", default=0)
+    jdiff_vol: int = Field(description="거래량", default=0)
+    jongchk: int = Field(description="수정구분", default=0)
+    rate: float = Field(description="수정비율", default=0.0)
+    pricechk: int = Field(description="수정주가반영항목", default=0)
+
+
+# 주식챠트(틱/n틱)(t8411)
+class t8411(BaseModel):
+    inblock: t8411InBlock = Field(description="t8411InBlock")
+    outblock: t8411OutBlock = Field(description="t8411OutBlock")
+    outblock1: List[t8411OutBlock1] = Field(description="t8411OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8411",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,67 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8415 - 선물/옵션챠트(N분)(t8415)>
+class t8415InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    ncnt: int = Field(description="단위(n분)", default=0)
+    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
+    nday: str = Field(description="조회영업일수(0:미사용1>=사용)", default="")
+    sdate: str = Field(description="시작일자", default="")
+    stime: str = Field(description="시작시간(현재미사용)", default="")
+    edate: str = Field(description="종료일자", default="")
+    etime: str = Field(description="종료시간(현재미사용)", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
+
+
+class t8415OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: float = Field(description="전일시가", default=0.0)
+    jihigh: float = Field(description="전일고가", default=0.0)
+    jilow: float = Field(description="전일저가", default=0.0)
+    jiclose: float = Field(description="전일종가", default=0.0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: float = Field(description="당일시가", default=0.0)
+    dihigh: float = Field(description="당일고가", default=0.0)
+    dilow: float = Field(description="당일저가", default=0.0)
+    diclose: float = Field(description="당일종가", default=0.0)
+    highend: float = Field(description="상한가", default=0.0)
+    lowend: float = Field(description="하한가", default=0.0)
+    cts_date: str = Field(description="연속일자", default="")
+    cts_time: str = Field(description="연속시간", default="")
+    s_time: str = Field(description="장시작시간(HHMMSS)", default="")
+    e_time: str = Field(description="장종료시간(HHMMSS)", default="")
+    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+
+
+class t8415OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    time: str = Field(description="시간", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    jdiff_vol: int = Field(description="누적거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+    openyak: int = Field(description="미결제약정", default=0)
+
+
+# 선물/옵션챠트(N분)(t8415)
+class t8415(BaseModel):
+    inblock: t8415InBlock = Field(description="t8415InBlock")
+    outblock: t8415OutBlock = Field(description="t8415OutBlock")
+    outblock1: List[t8415OutBlock1] = Field(description="t8415OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8415",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,59 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8419 - 업종챠트(일주월)(t8419)>
+class t8419InBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    gubun: str = Field(description="주기구분(2:일3:주4:월)", default="")
+    qrycnt: int = Field(description="요청건수(최대-압축:2000비압축:500)", default=0)
+    sdate: str = Field(description="시작일자", default="")
+    edate: str = Field(description="종료일자", default="")
+    cts_date: str = Field(description="연속일자", default="")
+    comp_yn: str = Field(description="압축여부(Y:압축N:비압축)", default="")
+
+
+class t8419OutBlock(BaseModel):
+    shcode: str = Field(description="단축코드", default="")
+    jisiga: float = Field(description="전일시가", default=0.0)
+    jihigh: float = Field(description="전일고가", default=0.0)
+    jilow: float = Field(description="전일저가", default=0.0)
+    jiclose: float = Field(description="전일종가", default=0.0)
+    jivolume: int = Field(description="전일거래량", default=0)
+    disiga: float = Field(description="당일시가", default=0.0)
+    dihigh: float = Field(description="당일고가", default=0.0)
+    dilow: float = Field(description="당일저가", default=0.0)
+    diclose: float = Field(description="당일종가", default=0.0)
+    disvalue: int = Field(description="당일거래대금", default=0)
+    cts_date: str = Field(description="연속일자", default="")
+    s_time: str = Field(description="업종시작시간", default="")
+    e_time: str = Field(description="업종종료시간", default="")
+    dshmin: str = Field(description="동시호가처리시간(MM:분)", default="")
+    rec_count: int = Field(description="레코드카운트", default=0)
+
+
+class t8419OutBlock1(BaseModel):
+    date: str = Field(description="날짜", default="")
+    open: float = Field(description="시가", default=0.0)
+    high: float = Field(description="고가", default=0.0)
+    low: float = Field(description="저가", default=0.0)
+    close: float = Field(description="종가", default=0.0)
+    jdiff_vol: int = Field(description="거래량", default=0)
+    value: int = Field(description="거래대금", default=0)
+
+
+# 업종챠트(일주월)(t8419)
+class t8419(BaseModel):
+    inblock: t8419InBlock = Field(description="t8419InBlock")
+    outblock: t8419OutBlock = Field(description="t8419OutBlock")
+    outblock1: List[t8419OutBlock1] = Field(description="t8419OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8419",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
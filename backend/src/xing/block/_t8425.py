@@ -0,0 +1,31 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8425 - 전체테마(t8425)>
+class t8425InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t8425OutBlock(BaseModel):
+    tmname: str = Field(description="테마명", default="")
+    tmcode: str = Field(description="테마코드", default="")
+
+    class Config:
+        from_attributes = True
+
+
+# 전체테마(t8425)
+class t8425(BaseModel):
+    inblock: t8425InBlock = Field(description="t8425InBlock")
+    outblock: List[t8425OutBlock] = Field(description="t8425OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8425",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,55 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8428 - 증시주변자금추이(t8428)>
+class t8428InBlock(BaseModel):
+    fdate: str = Field(description="from일자", default="")
+    tdate: str = Field(description="to일자", default="")
+    gubun: str = Field(description="구분", default="")
+    key_date: str = Field(description="날짜", default="")
+    upcode: str = Field(description="업종코드", default="")
+    cnt: str = Field(description="조회건수", default="")
+
+
+class t8428OutBlock(BaseModel):
+    date: str = Field(description="날짜CTS", default="")
+    idx: int = Field(description="IDX", default=0)
+
+
+class t8428OutBlock1(BaseModel):
+    date: str = Field(description="일자", default="")
+    jisu: float = Field(description="지수", default=0.0)
+    sign: str = Field(description="대비구분", default="")
+    change: float = Field(description="대비", default=0.0)
+    diff: float = Field(description="등락율", default=0.0)
+    volume: int = Field(description="거래량", default=0)
+    custmoney: int = Field(description="고객예탁금_억원", default=0)
+    yecha: int = Field(description="예탁증감_억원", default=0)
+    vol: float = Field(description="회전율", default=0.0)
+    outmoney: int = Field(description="미수금_억원", default=0)
+    trjango: int = Field(description="신용잔고_억원", default=0)
+    futymoney: int = Field(description="선물예수금_억원", default=0)
+    stkmoney: int = Field(description="주식형_억원", default=0)
+    mstkmoney: int = Field(description="혼합형_억원(주식)", default=0)
+    mbndmoney: int = Field(description="혼합형_억원(채권)", default=0)
+    bndmoney: int = Field(description="채권형_억원", default=0)
+    bndsmoney: int = Field(description="필러(구.단기채권)", default=0)
+    mmfmoney: int = Field(description="MMF_억원(주식)", default=0)
+
+
+# 증시주변자금추이(t8428)
+class t8428(BaseModel):
+    inblock: t8428InBlock = Field(description="t8428InBlock")
+    outblock: t8428OutBlock = Field(description="t8428OutBlock")
+    outblock1: List[t8428OutBlock1] = Field(description="t8428OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t8428",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
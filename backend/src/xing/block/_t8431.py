@@ -0,0 +1,33 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t8431 - ELW종목조회(t8431)>
+class t8431InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t8431OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    uplmtprice: int = Field(description="상한가", default=0)
+    dnlmtprice: int = Field(description="하한가", default=0)
+    jnilclose: int = Field(description="전일종가", default=0)
+    recprice: int = Field(description="기준가", default=0)
+
+
+# ELW종목조회(t8431)
+class t8431(BaseModel):
+    inblock: t8431InBlock = Field(description="t8431InBlock")
+    outblock: List[t8431OutBlock] = Field(description="t8431OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t8431",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
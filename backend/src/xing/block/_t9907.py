@@ -0,0 +1,28 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9907 - 만기월조회(t9907)>
+class t9907InBlock(BaseModel):
+    dummy: str = Field(description="DUMMY", default="")
+
+
+class t9907OutBlock1(BaseModel):
+    lastym: str = Field(description="만기월", default="")
+    lastnm: str = Field(description="만기월명", default="")
+
+
+# 만기월조회(t9907)
+class t9907(BaseModel):
+    inblock: t9907InBlock = Field(description="t9907InBlock")
+    outblock1: List[t9907OutBlock1] = Field(description="t9907OutBlock1")
+    metadata: dict = Field(
+        description="The metadata information for t9907",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,32 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9943 - 지수선물마스터조회API용(t9943)>
+class t9943InBlock(BaseModel):
+    gubun: str = Field(description="구분", default="")
+
+
+class t9943OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+    
+    class Config:
+        from_attributes = True
+
+
+# 지수선물마스터조회API용(t9943)
+class t9943(BaseModel):
+    inblock: t9943InBlock = Field(description="t9943InBlock")
+    outblock: List[t9943OutBlock] = Field(description="t9943OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t9943",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,29 @@
+# type: ignore 
+# Generated by eparser.py - make_tr_order_model  2023-09-10T17:16:09.080720
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# region <t9944 - 지수옵션마스터조회API용(t9944)>
+class t9944InBlock(BaseModel):
+    dummy: str = Field(description="Dummy", default="")
+
+
+class t9944OutBlock(BaseModel):
+    hname: str = Field(description="종목명", default="")
+    shcode: str = Field(description="단축코드", default="")
+    expcode: str = Field(description="확장코드", default="")
+
+
+# 지수옵션마스터조회API용(t9944)
+class t9944(BaseModel):
+    inblock: t9944InBlock = Field(description="t9944InBlock")
+    outblock: List[t9944OutBlock] = Field(description="t9944OutBlock")
+    metadata: dict = Field(
+        description="The metadata information for t9944",
+        default_factory=lambda: dict(),
+    )
+
+
+# endregion
@@ -0,0 +1,64 @@
+"""Startup benchmark of ``src.xing.block``.
+
+Every scenario runs in a fresh interpreter, so nothing is cached between
+runs, and reports the median wall time and the peak RSS of that process.
+
+    python -m src.xing.block.benchmark [--repeat N]
+
+``all TRs (eager)`` constructs every model, which is what importing the
+former single-module ``block.py`` did.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_MEASURE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"elapsed": elapsed, "peak_kb": peak // 1024 if sys.platform == "darwin" else peak}}))
+"""
+
+SCENARIOS = {
+    "pydantic only": "from pydantic import BaseModel",
+    "package import": "import src.xing.block",
+    "master TRs": (
+        "from src.xing.block import (o3101InBlock, o3101OutBlock, t8401InBlock, t8401OutBlock, "
+        "t8426InBlock, t8426OutBlock, t8436InBlock, t8436OutBlock, t9943InBlock, t9943OutBlock, "
+        "t9944InBlock, t9944OutBlock)"
+    ),
+    "all TRs (eager)": "import src.xing.block; src.xing.block.load_all()",
+}
+
+
+def measure(code: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _MEASURE.format(code=code)],
+            check=True, capture_output=True, text=True,
+        )
+        runs.append(json.loads(out.stdout))
+    return dict(
+        elapsed=statistics.median(run["elapsed"] for run in runs),
+        peak_kb=statistics.median(run["peak_kb"] for run in runs),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the Xing block models.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<18} {'time (ms)':>10} {'peak RSS (MiB)':>15}")
+    for name, code in SCENARIOS.items():
+        result = measure(code, args.repeat)
+        print(f"{name:<18} {result['elapsed'] * 1000:>10.1f} {result['peak_kb'] / 1024:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+
+from httpx import (AsyncBaseTransport, AsyncClient, HTTPStatusError, Limits,
+                   Response, TransportError)
+from pydantic import BaseModel
+
+from src.xing.auth import TokenManager
+from src.xing.constant import (DEFAULT_TR_RATE_LIMIT, TR_CONTINUATION_FIELDS,
+                               TR_RATE_LIMITS, XING_REST_URL)
+from src.xing.schemas import XingDataConfig, XingTrHeaders
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+AUTH_FAILURE_STATUSES = {401, 403}
+
+
+class TrRateLimiter:
+    """Space the requests of one TR code so they never exceed ``rate`` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def next_inblock(tr_code: str, inblock: BaseModel, payload: dict) -> BaseModel:
+    """Return ``inblock`` updated with the continuation (CTS) fields of the ``{tr_code}OutBlock`` of ``payload``.
+
+    Only the fields of ``TR_CONTINUATION_FIELDS`` are copied, under their
+    InBlock name. ``inblock`` is returned unchanged for the other TRs.
+    """
+    block = payload.get(f"{tr_code}OutBlock")
+    if not isinstance(block, dict):
+        return inblock
+    cts = {field: block[key] for key, field in TR_CONTINUATION_FIELDS.get(tr_code, {}).items() if key in block}
+    return inblock.model_copy(update=cts)
+
+
+class XingClient:
+    """Async client of the Xing (LS증권) REST API sharing one connection pool.
+
+    Every TR code has its own rate limiter set from ``rate_limits``, so
+    requests of different TRs run concurrently while each TR stays within
+    its per-second quota.
+
+    With a ``token_manager``, the token is taken from it before every
+    request, and a request rejected as unauthorized is retried once with a
+    renewed token. ``start_token_refresh`` also renews it in the background
+    before it expires.
+
+    Args:
+        access_token: OAuth access token sent as the bearer token, when no ``token_manager`` is given.
+        base_url: Base URL of the REST API.
+        rate_limits: Requests per second by TR code.
+        default_rate_limit: Requests per second of the TR codes missing in ``rate_limits``.
+        max_connections: Size of the connection pool.
+        max_retries: Retries of a request failing with a transport error or a retryable status.
+        backoff: Base delay in seconds of the exponential backoff between retries.
+        timeout: Timeout in seconds of a request.
+        token_manager: Source of the access token, renewed when it expires or is rejected.
+        transport: Transport of the underlying httpx client, e.g. an ``httpx.MockTransport`` in tests.
+    """
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        base_url: str = XING_REST_URL,
+        rate_limits: Mapping[str, float] = TR_RATE_LIMITS,
+        default_rate_limit: float = DEFAULT_TR_RATE_LIMIT,
+        max_connections: int = 10,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 30,
+        token_manager: Optional[TokenManager] = None,
+        transport: Optional[AsyncBaseTransport] = None,
+    ):
+        if access_token is None and token_manager is None:
+            raise ValueError("Either access_token or token_manager must be provided")
+        self.token_manager = token_manager
+        self.headers = XingTrHeaders.update_access_token(access_token or "")
+        self.rate_limits = dict(rate_limits)
+        self.default_rate_limit = default_rate_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._limiters: Dict[str, TrRateLimiter] = {}
+        self._refreshing_token = False
+        self._client = AsyncClient(
+            verify=False,
+            base_url=base_url,
+            timeout=timeout,
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "XingClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._refreshing_token:
+            self._refreshing_token = False
+            await self.token_manager.stop_background_refresh()  # type: ignore[union-attr]
+        await self._client.aclose()
+
+    def start_token_refresh(self) -> None:
+        """Renew the token of ``token_manager`` ahead of its expiry until the client is closed."""
+        if self.token_manager is None or self._refreshing_token:
+            return
+        self.token_manager.start_background_refresh()
+        self._refreshing_token = True
+
+    def set_access_token(self, access_token: str) -> None:
+        self.headers = XingTrHeaders.update_access_token(access_token)
+
+    def limiter(self, tr_code: str) -> TrRateLimiter:
+        if tr_code not in self._limiters:
+            self._limiters[tr_code] = TrRateLimiter(self.rate_limits.get(tr_code, self.default_rate_limit))
+        return self._limiters[tr_code]
+
+    async def post(self, config: XingDataConfig, headers: Optional[XingTrHeaders] = None) -> Response:
+        """Send the TR request of ``config`` once its rate limiter allows it, retrying transient failures."""
+        headers = (headers or self.headers).model_copy(update={"tr_code": config.tr_code})
+        token = None
+        reauthenticated = False
+        attempt = 0
+        while True:
+            if self.token_manager is not None:
+                token = await self.token_manager.aget_token()
+                headers.authorization = f"Bearer {token}"
+            await self.limiter(config.tr_code).acquire()
+            try:
+                response = await self._client.post(
+                    url=config.path,
+                    json={config.inblock.__class__.__name__: config.inblock.model_dump()},
+                    headers=headers.model_dump(by_alias=True),
+                )
+                if response.status_code in AUTH_FAILURE_STATUSES and self.token_manager is not None and not reauthenticated:
+                    logger.warning(f"{config.tr_code} request was rejected with {response.status_code}, renewing the access token")
+                    await self.token_manager.aget_token(rejected=token)
+                    reauthenticated = True
+                    continue
+                if response.status_code in RETRYABLE_STATUSES:
+                    response.raise_for_status()
+                return response
+            except (TransportError, HTTPStatusError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                attempt += 1
+                logger.warning(f"{config.tr_code} request failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def request(self, config: XingDataConfig) -> List[Optional[BaseModel]]:
+        """Send the TR request of ``config`` and parse the response with its ``cb_handler``."""
+        return config.cb_handler(await self.post(config), config=config)
+
+    async def paginate(
+        self,
+        config: XingDataConfig,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[List[Optional[BaseModel]]]:
+        """Send the TR request of ``config`` and follow its continuation pages, yielding one batch per page.
+
+        While the response carries ``tr_cont: Y``, the next page is requested
+        with ``tr_cont=Y`` and the returned ``tr_cont_key``. The CTS fields
+        of the single (non-array) OutBlock of the page, e.g. ``date``/``idx``
+        of t1305 or ``cts_time`` of t1302, are copied into the InBlock of the
+        next request as listed in ``TR_CONTINUATION_FIELDS``. Paging stops
+        when they leave the InBlock unchanged, since the same page would
+        be requested again.
+
+        Args:
+            config: Configuration of the first page.
+            max_pages: Stop after this many pages, all of them when None.
+        """
+        headers = self.headers.model_copy(update={"tr_cont": "N", "tr_cont_key": ""})
+        pages = 0
+        while True:
+            response = await self.post(config, headers=headers)
+            yield config.cb_handler(response, config=config)
+            pages += 1
+
+            tr_cont_key = response.headers.get("tr_cont_key", "")
+            if response.headers.get("tr_cont") != "Y" or not tr_cont_key:
+                return
+            if max_pages is not None and pages >= max_pages:
+                return
+            inblock = next_inblock(config.tr_code, config.inblock, response.json())
+            if inblock == config.inblock:
+                logger.warning(f"{config.tr_code} continuation did not advance the InBlock, stopping after {pages} pages")
+                return
+            headers = headers.model_copy(update={"tr_cont": "Y", "tr_cont_key": tr_cont_key})
+            config = config.model_copy(update={"inblock": inblock})
+
+    async def request_many(self, configs: Mapping[str, XingDataConfig]) -> Dict[str, List[Optional[BaseModel]]]:
+        """Send independent TR requests concurrently and return their results by key.
+
+        The total time is bounded by the slowest TR instead of the sum of all of them.
+        """
+        results = await asyncio.gather(*(self.request(config) for config in configs.values()))
+        return dict(zip(configs.keys(), results))
@@ -0,0 +1,151 @@
+from typing import Any, Dict, List, Literal, Type
+
+import numpy as np
+import pandas as pd
+from httpx import Response
+from pydantic import BaseModel
+
+from src.xing.schemas import XingDataConfig
+
+ColumnarOutput = Literal["numpy", "pandas", "arrow"]
+
+_DTYPES: Dict[Any, Any] = {
+    int: np.int64,
+    float: np.float64,
+    str: object,
+}
+
+
+def outblock_dtypes(outblock_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """NumPy dtype of every field of ``outblock_cls``, from its declared ``int``/``float``/``str`` types."""
+    dtypes = {}
+    for name, field in outblock_cls.model_fields.items():
+        if field.annotation not in _DTYPES:
+            raise TypeError(f"{outblock_cls.__name__}.{name} has an unsupported type for columnar decoding: {field.annotation}")
+        dtypes[name] = _DTYPES[field.annotation]
+    return dtypes
+
+
+def _invalid(outblock_cls: Type[BaseModel], name: str, index: int, value: Any) -> ValueError:
+    expected = outblock_cls.model_fields[name].annotation.__name__  # type: ignore[union-attr]
+    return ValueError(f"{outblock_cls.__name__}[{index}].{name}: expected {expected}, got {value!r}")
+
+
+def _check_integral(outblock_cls: Type[BaseModel], name: str, values: List[Any]) -> None:
+    if bool in set(map(type, values)):
+        bad = np.array([isinstance(value, bool) for value in values])
+    else:
+        try:
+            numeric = np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Strings that are not numbers, left to the lax parsing of _decode_column.
+            return
+        bad = ~np.isfinite(numeric) | (numeric != np.floor(numeric))
+    if bad.any():
+        index = int(np.argmax(bad))
+        raise _invalid(outblock_cls, name, index, values[index])
+
+
+def _decode_column(outblock_cls: Type[BaseModel], name: str, dtype: Any, values: List[Any], validate: bool) -> np.ndarray:
+    if dtype is object:
+        column = np.array(values, dtype=object)
+        if validate:
+            for index, value in enumerate(values):
+                if not isinstance(value, str):
+                    raise _invalid(outblock_cls, name, index, value)
+        return column
+    if validate and dtype is np.int64:
+        # The int64 conversion below takes True as 1 and truncates 1.5, so check the values first.
+        _check_integral(outblock_cls, name, values)
+    try:
+        # Numbers already decoded as JSON numbers convert in one pass.
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        if not validate:
+            raise
+    # Numeric strings such as "005" are accepted like pydantic's lax mode does, anything else is rejected.
+    numeric = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+    bad = np.isnan(numeric)
+    if dtype is np.int64:
+        bad |= ~bad & (numeric != np.floor(numeric))
+    if bad.any():
+        index = int(np.argmax(bad))
+        raise _invalid(outblock_cls, name, index, values[index])
+    return numeric.astype(dtype)
+
+
+def decode_columns(
+    data: List[Dict[str, Any]],
+    outblock_cls: Type[BaseModel],
+    validate: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Decode the rows of an OutBlock array into one NumPy array per field.
+
+    Missing keys take the field default, unknown keys are ignored, as the
+    pydantic model would do.
+
+    Args:
+        data: OutBlock array of the JSON response.
+        outblock_cls: OutBlock model declaring the fields and their types.
+        validate: Check every value against its declared type. Without it,
+            values are handed to NumPy as they are, which is faster but
+            lets malformed values through or fails with NumPy's own error.
+
+    Returns:
+        Dict[str, np.ndarray]: Column arrays by field name, in field order.
+
+    Raises:
+        ValueError: If ``validate`` is set and a value does not match its field type.
+    """
+    columns = {}
+    for name, dtype in outblock_dtypes(outblock_cls).items():
+        default = outblock_cls.model_fields[name].default
+        values = [row.get(name, default) for row in data]
+        columns[name] = _decode_column(outblock_cls, name, dtype, values, validate)
+    return columns
+
+
+def to_rows(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Turn column arrays back into row mappings of plain Python values, e.g. for ``bulk_insert``."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(column.tolist() for column in columns.values()))]
+
+
+def to_arrow(columns: Dict[str, np.ndarray]) -> Any:
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError as e:
+        raise ImportError("Arrow output requires the `pyarrow` package: pip install pyarrow") from e
+    return pa.table({name: pa.array(column) for name, column in columns.items()})
+
+
+class ColumnarOutBlockHandler:
+    """Response handler decoding an OutBlock array into columns instead of one model per row.
+
+    A drop-in alternative to ``SingleOutBlockHandler`` for large arrays such
+    as t8436 or the chart TRs.
+
+    Args:
+        outblock_cls: OutBlock model of the array, its name is the key of the array in the response.
+        output: ``numpy`` for a dict of arrays, ``pandas`` for a DataFrame or ``arrow`` for a pyarrow Table.
+        validate: Check every value against its declared type, see ``decode_columns``.
+    """
+    def __init__(self, outblock_cls: Type[BaseModel], output: ColumnarOutput = "pandas", validate: bool = True):
+        outblock_dtypes(outblock_cls)
+        self.outblock_cls = outblock_cls
+        self.output = output
+        self.validate = validate
+
+    def __call__(self, response: Response, config: XingDataConfig) -> Any:
+        try:
+            data = response.json()[self.outblock_cls.__name__]
+        except KeyError:
+            raise KeyError(f"Response does not contain expected outblock data: {response.json()}")
+        columns = decode_columns(data, self.outblock_cls, validate=self.validate)
+        if self.output == "numpy":
+            return columns
+        if self.output == "pandas":
+            return pd.DataFrame(columns)
+        if self.output == "arrow":
+            return to_arrow(columns)
+        raise ValueError(f"Unknown columnar output: {self.output}")
@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings
 class XingSettings(BaseSettings):
     XING_APP_KEY: str
     XING_APP_SECRET: str
+    XING_TOKEN_CACHE_PATH: str | None = ".xing_token_cache.sqlite"
+    XING_TOKEN_REFRESH_MARGIN: int = 600
     class Config:
         env_file = (
             ".env.dev.xing" if os.getenv("ENVIRONMENT", "DEV") == 'DEV' else
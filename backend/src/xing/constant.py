@@ -25,6 +25,10 @@ T9943S = "t9943S"
 T9943 = "t9943"
 T9944 = "t9944"
 O3101 = "o3101"
+T1302 = "t1302"
+T1305 = "t1305"
+T8412 = "t8412"
+T8410 = "t8410"
 
 CODE = 'code'
 TICKER = 'ticker'
@@ -50,6 +54,8 @@ STOCK_SECTOR_PATH = "/stock/sector"
 STOCK_ETC_PATH = "/stock/etc"
 FUTUREOPTION_MARKET_DATA_PATH = "/futureoption/market-data" 
 OVERSEAS_FUTUREOPTION_MARKET_DATA_PATH = "/overseas-futureoption/market-data"
+STOCK_MARKET_DATA_PATH = "/stock/market-data"
+STOCK_CHART_PATH = "/stock/chart"
 
 TR_CODE_TO_URL = {
     T1764: STOCK_EXCHANGE_PATH,
@@ -61,6 +67,37 @@ TR_CODE_TO_URL = {
     T9943: FUTUREOPTION_MARKET_DATA_PATH,
     T9944: FUTUREOPTION_MARKET_DATA_PATH,
     O3101: OVERSEAS_FUTUREOPTION_MARKET_DATA_PATH,
+    T1302: STOCK_MARKET_DATA_PATH,
+    T1305: STOCK_MARKET_DATA_PATH,
+    T8412: STOCK_CHART_PATH,
+    T8410: STOCK_CHART_PATH,
+}
+
+# Requests per second allowed by LS증권 for each TR. TRs missing here fall back to DEFAULT_TR_RATE_LIMIT.
+DEFAULT_TR_RATE_LIMIT = 1.0
+TR_RATE_LIMITS = {
+    T1764: 1.0,
+    T8424: 1.0,
+    T8425: 1.0,
+    T8436: 2.0,
+    T8401: 2.0,
+    T8426: 2.0,
+    T9943: 2.0,
+    T9944: 2.0,
+    O3101: 1.0,
+    T1302: 1.0,
+    T1305: 1.0,
+    T8412: 1.0,
+    T8410: 1.0,
+}
+
+# Continuation (CTS) field of the single OutBlock of a page -> InBlock field of the next page's request.
+# The names do not always match, t1302 returns cts_time but reads it back as time.
+TR_CONTINUATION_FIELDS = {
+    T1302: {"cts_time": "time"},
+    T1305: {"date": "date", "idx": "idx"},
+    T8410: {"cts_date": "cts_date"},
+    T8412: {"cts_date": "cts_date", "cts_time": "cts_time"},
 }
 
 
@@ -0,0 +1,196 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+from pydantic import BaseModel
+from sqlalchemy import BigInteger, Column, Float, Index, String, inspect
+from sqlalchemy.orm import Session
+
+import src.xing.block as block
+from src.crawler.constant import KST
+from src.database.models.xing_outblock import BaseOrm
+from src.database.session import SessionLocal, add_missing_columns, add_missing_indexes, engine
+from src.xing.client import XingClient
+from src.xing.columnar import ColumnarOutBlockHandler, to_rows
+from src.xing.constant import T1302, T8412, TR_CODE_TO_URL
+from src.xing.schemas import XingDataConfig
+from src.xing.tasks.orm import stream_to_orm
+
+_COLUMN_TYPES: Dict[Any, Any] = {
+    int: BigInteger,
+    float: Float,
+    str: String,
+}
+
+
+@dataclass(frozen=True)
+class OutBlockTable:
+    """Storage of the OutBlock array of one TR in a generated ``xing_*`` table.
+
+    Args:
+        tr_code: TR code, also the key of its entry in ``OUTBLOCK_TABLES``.
+        outblock: Name of the OutBlock model in ``src.xing.block`` whose rows are stored.
+        key_columns: Natural key of a row, a unique index is created on it and rows are upserted on it.
+        inblock_columns: InBlock fields copied into every row, e.g. the ``shcode``
+            that chart OutBlocks do not repeat.
+        date_column: Column of the trading date, as ``YYYYMMDD``, for OutBlocks that
+            only carry a time such as the ``chetime`` of t1302. It is filled with
+            the date given to ``ingest`` and belongs in ``key_columns``.
+        validate: Validate the decoded values against their declared types.
+    """
+    tr_code: str
+    outblock: str
+    key_columns: Tuple[str, ...]
+    inblock_columns: Tuple[str, ...] = ()
+    date_column: Optional[str] = None
+    validate: bool = True
+
+    @property
+    def key_index(self) -> str:
+        return f"uq_{self.table_name}_key"
+
+    @property
+    def inblock(self) -> str:
+        return f"{self.tr_code}InBlock"
+
+    @property
+    def table_name(self) -> str:
+        return f"xing_{self.tr_code}_{self.outblock[len(self.tr_code):].lower()}"
+
+
+# Adding a TR to storage only needs an entry here.
+OUTBLOCK_TABLES: Dict[str, OutBlockTable] = {
+    T1302: OutBlockTable(T1302, "t1302OutBlock1", ("shcode", "date", "chetime"), inblock_columns=("shcode",), date_column="date"),
+    T8412: OutBlockTable(T8412, "t8412OutBlock1", ("shcode", "date", "time"), inblock_columns=("shcode",)),
+}
+
+
+def _column(field: Any) -> Column:
+    if field.annotation not in _COLUMN_TYPES:
+        raise TypeError(f"Unsupported OutBlock field type: {field.annotation}")
+    return Column(
+        _COLUMN_TYPES[field.annotation],
+        nullable=False,
+        default=field.default,
+        comment=field.description,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_outblock_orm(tr_code: str) -> Type[BaseOrm]:
+    """Build, once, the ORM class of the table storing the OutBlock of ``tr_code``.
+
+    Columns follow the OutBlock fields: ``int`` as BIGINT, ``float`` as
+    FLOAT and ``str`` as VARCHAR, with the field description as comment.
+    The ``inblock_columns`` and the ``date_column`` come first and
+    ``key_columns`` get a unique index.
+    """
+    spec = OUTBLOCK_TABLES[tr_code]
+    outblock_cls, inblock_cls = getattr(block, spec.outblock), getattr(block, spec.inblock)
+    attrs: Dict[str, Any] = {"__tablename__": spec.table_name}
+    for name in spec.inblock_columns:
+        attrs[name] = _column(inblock_cls.model_fields[name])
+    if spec.date_column:
+        attrs[spec.date_column] = Column(String, nullable=False, comment="거래일자")
+    for name, field in outblock_cls.model_fields.items():
+        attrs.setdefault(name, _column(field))
+
+    missing = set(spec.key_columns) - set(attrs)
+    if missing:
+        raise ValueError(f"Key columns {sorted(missing)} are not fields of {spec.outblock} or {spec.inblock}")
+    attrs["__table_args__"] = (Index(spec.key_index, *spec.key_columns, unique=True),)
+    orm_cls = type(f"{spec.outblock}Orm", (BaseOrm,), attrs)
+    orm_cls.__repr__ = lambda self: (  # type: ignore[method-assign]
+        f"<{type(self).__name__}(id={self.id}, " + ", ".join(f"{name}={getattr(self, name)!r}" for name in spec.key_columns) + ")>"
+    )
+    return orm_cls
+
+
+def create_outblock_tables(tr_codes: Optional[List[str]] = None, bind: Any = engine) -> None:
+    """Create the generated tables of ``tr_codes``, all of ``OUTBLOCK_TABLES`` by default, if missing.
+
+    Tables created by an older ``OUTBLOCK_TABLES`` get the columns they
+    lack, and their key index is rebuilt when ``key_columns`` changed.
+    """
+    for tr_code in tr_codes or list(OUTBLOCK_TABLES):
+        spec = OUTBLOCK_TABLES[tr_code]
+        table = get_outblock_orm(tr_code).__table__  # type: ignore[attr-defined]
+        table.create(bind=bind, checkfirst=True)
+        add_missing_columns(bind, table)
+        for index in inspect(bind).get_indexes(table.name):
+            if index["name"] == spec.key_index and tuple(index["column_names"]) != spec.key_columns:
+                next(key for key in table.indexes if key.name == spec.key_index).drop(bind)
+        add_missing_indexes(bind, table)
+
+
+class OutBlockMapper:
+    """Vectorized mapping of decoded OutBlock columns to rows of the generated table.
+
+    Args:
+        tr_code: TR code of the OutBlock.
+        trading_date: ``YYYYMMDD`` written to the ``date_column``, today in KST by default.
+    """
+
+    def __init__(self, tr_code: str, trading_date: Optional[str] = None):
+        self.spec = OUTBLOCK_TABLES[tr_code]
+        self.trading_date = trading_date or datetime.now(KST).strftime("%Y%m%d")
+        self.table_columns = set(get_outblock_orm(tr_code).__table__.columns.keys())  # type: ignore[attr-defined]
+
+    def __call__(self, columns: Dict[str, np.ndarray], inblock: BaseModel) -> List[Dict[str, Any]]:
+        size = len(next(iter(columns.values()))) if columns else 0
+        mapped = {name: column for name, column in columns.items() if name in self.table_columns}
+        for name in self.spec.inblock_columns:
+            mapped[name] = np.full(size, getattr(inblock, name), dtype=object)
+        if self.spec.date_column:
+            mapped[self.spec.date_column] = np.full(size, self.trading_date, dtype=object)
+        return to_rows(mapped)
+
+
+def build_config(tr_code: str, inblock: BaseModel) -> XingDataConfig:
+    """Request configuration of ``tr_code`` whose pages are decoded into columns."""
+    spec = OUTBLOCK_TABLES[tr_code]
+    return XingDataConfig(
+        path=TR_CODE_TO_URL[tr_code],
+        tr_code=tr_code,
+        inblock=inblock,
+        cb_handler=ColumnarOutBlockHandler(getattr(block, spec.outblock), output="numpy", validate=spec.validate),
+    )
+
+
+async def ingest(
+    client: XingClient,
+    tr_code: str,
+    inblock: BaseModel,
+    max_pages: Optional[int] = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    trading_date: Optional[str] = None,
+) -> int:
+    """Fetch every continuation page of ``tr_code`` and upsert its rows into the generated table.
+
+    Pages are decoded into columns, mapped in bulk and written one
+    transaction per page, without building a model per row.
+    ``trading_date`` (``YYYYMMDD``, today in KST by default) fills the
+    ``date_column`` of TRs whose rows only carry a time.
+
+    Returns:
+        int: Number of rows written.
+    """
+    spec = OUTBLOCK_TABLES[tr_code]
+    mapper = OutBlockMapper(tr_code, trading_date)
+
+    async def rows() -> AsyncIterator[List[Dict[str, Any]]]:
+        async for columns in client.paginate(build_config(tr_code, inblock), max_pages=max_pages):
+            yield mapper(columns, inblock)
+
+    with session_factory() as sess:
+        await asyncio.to_thread(create_outblock_tables, [tr_code], sess.get_bind())
+    return await stream_to_orm(
+        rows(),
+        get_outblock_orm(tr_code),
+        to_row=dict,
+        key_columns=spec.key_columns,
+        session_factory=session_factory,
+    )
@@ -1,33 +1,33 @@
 import asyncio
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
-from httpx import Client, Response
+from httpx import Response
 from pydantic import BaseModel
 
-from src.xing.auth import get_access_token
+from src.xing.auth import get_token_manager
 from src.xing.block import ( # type: ignore
     o3101InBlock, o3101OutBlock, t1764InBlock, t1764OutBlock, t8401InBlock,
     t8401OutBlock, t8424InBlock, t8424OutBlock, t8425InBlock, t8425OutBlock,
     t8426InBlock, t8426OutBlock, t8436InBlock, t8436OutBlock, t9943InBlock,
     t9943OutBlock, t9944InBlock, t9944OutBlock
 )
+from src.xing.client import XingClient
 from src.xing.config import settings
 from src.xing.constant import (
     O3101, T1764, T8401, T8424, T8425, T8426, T8436, T9943, T9943S, T9943V,
-    T9944, TR_CODE_TO_URL, XING_REST_URL
+    T9944, TR_CODE_TO_URL
 )
-from src.xing.schemas import XingDataConfig, XingTrHeaders
+from src.xing.schemas import XingDataConfig
 
 
-def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
-    """Get data configuration for a given TR code and type.
-    
+def get_data_configs(config_type: str) -> Dict[str, XingDataConfig]:
+    """Get the data configurations of every TR of a given type.
+
     Args:
         config_type: Type of configuration ("code" or "ticker")
-        tr_code: Trading request code
-    
+
     Returns:
-        XingDataConfig if found, None otherwise
+        Dict[str, XingDataConfig]: Configurations by TR code, empty for an unknown type
     """
     configs = {
         "code": {
@@ -101,7 +101,20 @@ def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
             ),
         }
     }
-    return configs.get(config_type, {}).get(tr_code, None)
+    return configs.get(config_type, {})
+
+
+def get_data_config(config_type: str, tr_code: str) -> Optional[XingDataConfig]:
+    """Get data configuration for a given TR code and type.
+    
+    Args:
+        config_type: Type of configuration ("code" or "ticker")
+        tr_code: Trading request code
+    
+    Returns:
+        XingDataConfig if found, None otherwise
+    """
+    return get_data_configs(config_type).get(tr_code, None)
 
 class SingleOutBlockHandler:
     def __init__(self, outblock_cls: Any):
@@ -128,55 +141,54 @@ class SingleOutBlockHandler:
             ValueError: If response indicates an error (e.g. {'rsp_cd': 'IGW00214', 'rsp_msg': 'TR CD는 필수 입니다.'})
         """
         try:
-            data = response.json()[f"{config.tr_code}OutBlock"]
+            data = response.json()[self.outblock_cls.__name__]
         except KeyError:
             raise KeyError(f"Response does not contain expected outblock data: {response.json()}")
         return [self.outblock_cls(**x) for x in data ]
 
 
-def request_xing_api(
-    client: Client,
-    headers: XingTrHeaders,
+async def request_xing_api(
+    client: XingClient,
     config: XingDataConfig
 ) -> List[Optional[BaseModel]]:
-    return config.cb_handler(
-        client.post(
-            url=config.path,
-            json={config.inblock.__class__.__name__: config.inblock.model_dump()},
-            headers=headers.model_dump(by_alias=True),
-        ),
-        config=config
-    )
+    return await client.request(config)
 
 async def fetch_market_data(
-    client: Client,
-    headers: XingTrHeaders,
+    client: XingClient,
     config: XingDataConfig,
-    delay_sec: float = 1
 ) -> List[Optional[BaseModel]]:
     """Fetch market data for given configurations"""
-    headers.update_tr_code(config.tr_code)
-    result = request_xing_api(client, headers, config)
-    await asyncio.sleep(delay_sec)
-    return result
+    return await request_xing_api(client, config)
+
+
+async def fetch_master_data(
+    client: XingClient,
+    config_type: str = "ticker",
+) -> Dict[str, List[Optional[BaseModel]]]:
+    """Fetch every TR of ``config_type`` concurrently, each within its own rate limit."""
+    return await client.request_many(get_data_configs(config_type))
 
 
-async def initialize_client() -> tuple[Client, XingTrHeaders]:
+async def initialize_client() -> XingClient:
     """Initialize HTTP client and headers"""
-    client = Client(verify=False, base_url=XING_REST_URL)
-    access_token = get_access_token(
-        client,
+    token_manager = get_token_manager(
         app_key=settings.XING_APP_KEY,
         app_secret=settings.XING_APP_SECRET,
+        cache_path=settings.XING_TOKEN_CACHE_PATH,
+        refresh_margin=settings.XING_TOKEN_REFRESH_MARGIN,
     )
-    headers = XingTrHeaders.update_access_token(access_token)
-    return client, headers
+    await token_manager.aget_token()
+    client = XingClient(token_manager=token_manager)
+    # Renews the token ahead of its expiry until the client is closed.
+    client.start_token_refresh()
+    return client
 
 
 async def main():
-    client, headers = await initialize_client()
-    print(client)
-    print(headers)
+    async with await initialize_client() as client:
+        results = await fetch_master_data(client, "ticker")
+    for key, rows in results.items():
+        print(key, len(rows))
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,63 @@
+import asyncio
+from typing import (Any, AsyncIterable, Callable, Dict, List, Optional,
+                    Sequence, Type)
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from src.database.base import Base
+from src.database.bulk import bulk_insert, bulk_upsert
+from src.database.session import SessionLocal
+from src.xing.columnar import to_rows
+
+
+def _write_page(
+    session_factory: Callable[[], Session],
+    orm_cls: Type[Base],  # type: ignore[valid-type]
+    rows: List[Dict[str, Any]],
+    key_columns: Optional[Sequence[str]],
+) -> int:
+    with session_factory() as sess:
+        if key_columns:
+            written = bulk_upsert(sess, orm_cls, rows, key_columns=key_columns)
+        else:
+            written = bulk_insert(sess, orm_cls, rows)
+        sess.commit()
+    return written
+
+
+async def stream_to_orm(
+    pages: AsyncIterable[Any],
+    orm_cls: Type[Base],  # type: ignore[valid-type]
+    to_row: Optional[Callable[[BaseModel], Dict[str, Any]]] = None,
+    key_columns: Optional[Sequence[str]] = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """Write OutBlock batches to the table of ``orm_cls`` as they arrive, one transaction per page.
+
+    Only one page is held in memory at a time, so long histories such as
+    ``XingClient.paginate`` over t1305 can be stored without collecting them first.
+
+    Args:
+        pages: Async iterable of OutBlock batches, e.g. ``XingClient.paginate(config)``.
+            A batch is either a list of OutBlock models or, with a
+            ``ColumnarOutBlockHandler(output="numpy")``, a dict of column arrays.
+        orm_cls: Mapped ORM class whose table receives the rows.
+        to_row: Converts an OutBlock model to a row mapping. Defaults to ``model_dump()``.
+            Column batches are converted with ``to_rows``.
+        key_columns: Unique columns to upsert on. Rows are plainly inserted when None.
+        session_factory: Factory of the sessions used to write the pages.
+
+    Returns:
+        int: Number of rows written.
+    """
+    to_row = to_row or (lambda block: block.model_dump())
+    written = 0
+    async for page in pages:
+        if isinstance(page, dict):
+            rows = to_rows(page)
+        else:
+            rows = [to_row(block) for block in page if block is not None]
+        if rows:
+            written += await asyncio.to_thread(_write_page, session_factory, orm_cls, rows, key_columns)
+    return written
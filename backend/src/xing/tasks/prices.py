@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import datetime
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import src.xing.block as block
+from src.database.bulk import bulk_upsert
+from src.database.models.price import DailyPriceOrm, SecurityOrm
+from src.database.models.xing_outblock import t8436OutBlockOrm
+from src.database.session import SessionLocal
+from src.graph.changes import PRICES, record_changes
+from src.xing.client import XingClient
+from src.xing.columnar import ColumnarOutBlockHandler, to_rows
+from src.xing.constant import T1305, T8410, TR_CODE_TO_URL
+from src.xing.schemas import XingDataConfig
+from src.xing.tasks.master import initialize_client
+from src.xing.tasks.orm import stream_to_orm
+
+logger = logging.getLogger(__name__)
+
+KRX_MARKETS = {"1": "KOSPI", "2": "KOSDAQ"}
+KRX_CURRENCY = "KRW"
+XING_SOURCE = "LS증권"
+
+
+@dataclass(frozen=True)
+class DailyPriceSource:
+    """A TR returning daily OHLCV rows and the name of its fields."""
+    tr_code: str
+    outblock: str
+    volume: str
+
+    def inblock(self, ticker: str, start: datetime.date, end: datetime.date) -> Any:
+        if self.tr_code == T8410:
+            return block.t8410InBlock(
+                shcode=ticker, gubun="2", qrycnt=500, comp_yn="N", sujung="Y",
+                sdate=start.strftime("%Y%m%d"), edate=end.strftime("%Y%m%d"),
+            )
+        # t1305 has no start date, it pages back from ``date`` until the caller stops.
+        return block.t1305InBlock(shcode=ticker, dwmcode=1, date=end.strftime("%Y%m%d"), cnt=500)
+
+
+DAILY_PRICE_SOURCES = {
+    T8410: DailyPriceSource(T8410, "t8410OutBlock1", volume="jdiff_vol"),
+    T1305: DailyPriceSource(T1305, "t1305OutBlock1", volume="volume"),
+}
+
+
+def to_price_rows(
+    ticker: str,
+    columns: Dict[str, np.ndarray],
+    volume: str,
+    start: Optional[datetime.date] = None,
+) -> List[Dict[str, Any]]:
+    """Map decoded OHLCV columns to ``daily_prices`` rows, dropping the days before ``start``."""
+    dates = pd.to_datetime(columns["date"], format="%Y%m%d")
+    keep = np.ones(len(dates), dtype=bool) if start is None else (dates >= pd.Timestamp(start))
+    mapped = {
+        "date": np.asarray(dates.date)[keep],
+        "open": columns["open"][keep].astype(np.float64),
+        "high": columns["high"][keep].astype(np.float64),
+        "low": columns["low"][keep].astype(np.float64),
+        "close": columns["close"][keep].astype(np.float64),
+        "volume": columns[volume][keep],
+    }
+    mapped["ticker"] = np.full(int(keep.sum()), ticker, dtype=object)
+    return to_rows(mapped)
+
+
+async def ingest_daily_prices(
+    client: XingClient,
+    ticker: str,
+    start: datetime.date,
+    end: datetime.date,
+    tr_code: str = T8410,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """Upsert the daily OHLCV of ``ticker`` over ``start..end`` into ``daily_prices``.
+
+    Every continuation page is decoded into columns and written as it
+    arrives, keyed on ``(ticker, date)`` so re-running a range is harmless.
+    The range is then logged as changed for the graphs cached by the API.
+
+    Returns:
+        int: Number of rows written.
+    """
+    source = DAILY_PRICE_SOURCES[tr_code]
+    config = XingDataConfig(
+        path=TR_CODE_TO_URL[tr_code],
+        tr_code=tr_code,
+        inblock=source.inblock(ticker, start, end),
+        cb_handler=ColumnarOutBlockHandler(getattr(block, source.outblock), output="numpy"),
+    )
+
+    async def pages() -> AsyncIterator[List[Dict[str, Any]]]:
+        async for columns in client.paginate(config):
+            rows = to_price_rows(ticker, columns, source.volume, start)
+            yield rows
+            # t1305 pages backwards in time, stop once a page reaches before ``start``.
+            if len(rows) < len(columns["date"]):
+                return
+
+    written = await stream_to_orm(
+        pages(),
+        DailyPriceOrm,
+        to_row=dict,
+        key_columns=("ticker", "date"),
+        session_factory=session_factory,
+    )
+    if written:
+        await asyncio.to_thread(_record_price_change, session_factory, start, end)
+    return written
+
+
+def _record_price_change(session_factory: Callable[[], Session], start: datetime.date, end: datetime.date) -> None:
+    with session_factory() as sess:
+        record_changes(sess, PRICES, [(start, end)])
+        sess.commit()
+
+
+def sync_securities(session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """Upsert the KOSPI/KOSDAQ stocks of the t8436 master table into ``securities``."""
+    with session_factory() as sess:
+        stocks = sess.execute(select(t8436OutBlockOrm.shcode, t8436OutBlockOrm.expcode, t8436OutBlockOrm.hname, t8436OutBlockOrm.gubun)).all()
+        rows = [
+            dict(
+                ticker=stock.shcode,
+                isin=stock.expcode or None,
+                name=stock.hname,
+                currency=KRX_CURRENCY,
+                market=KRX_MARKETS[stock.gubun],
+                source=XING_SOURCE,
+                updated_at=datetime.datetime.now(),
+            )
+            for stock in stocks
+            if stock.gubun in KRX_MARKETS
+        ]
+        written = bulk_upsert(sess, SecurityOrm, rows, key_columns=["ticker"])
+        sess.commit()
+    return written
+
+
+async def ingest_all_daily_prices(
+    client: XingClient,
+    start: datetime.date,
+    end: datetime.date,
+    tickers: Optional[Sequence[str]] = None,
+    tr_code: str = T8410,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Dict[str, int]:
+    """Ingest the daily prices of every security concurrently, each TR request paced by the client's rate limiter."""
+    if tickers is None:
+        with session_factory() as sess:
+            tickers = list(sess.scalars(select(SecurityOrm.ticker).where(SecurityOrm.source == XING_SOURCE)))
+    results = await asyncio.gather(
+        *(ingest_daily_prices(client, ticker, start, end, tr_code, session_factory) for ticker in tickers),
+        return_exceptions=True,
+    )
+    written = {}
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to ingest the daily prices of {ticker}: {result}")
+            continue
+        written[ticker] = result
+    return written
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Store the daily OHLCV of KRX stocks from the Xing API.")
+    parser.add_argument("--from", dest="start", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end", type=datetime.date.fromisoformat, default=datetime.date.today())
+    parser.add_argument("--tickers", nargs="*", default=None)
+    parser.add_argument("--tr-code", choices=sorted(DAILY_PRICE_SOURCES), default=T8410)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(f"securities: {sync_securities()}")
+    async with await initialize_client() as client:
+        written = await ingest_all_daily_prices(client, args.start, args.end, args.tickers, args.tr_code)
+    print(f"daily prices: {sum(written.values())} rows for {len(written)} tickers")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
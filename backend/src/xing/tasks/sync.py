@@ -0,0 +1,222 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.database.base import Base
+from src.database.bulk import bulk_insert, bulk_update
+from src.database.models.xing_outblock import (RountineTaskOrm,
+                                               o3101OutBlockOrm,
+                                               t1764OutBlockOrm,
+                                               t8401OutBlockOrm,
+                                               t8424OutBlockOrm,
+                                               t8425OutBlockOrm,
+                                               t8426OutBlockOrm,
+                                               t8436OutBlockOrm,
+                                               t9943OutBlockOrm,
+                                               t9943SOutBlockOrm,
+                                               t9943VOutBlockOrm,
+                                               t9944OutBlockOrm)
+from src.database.session import (SessionLocal, add_missing_columns, engine,
+                                  init_db)
+from src.xing.client import XingClient
+from src.xing.constant import (O3101, T1764, T8401, T8424, T8425, T8426,
+                               T8436, T9943, T9943S, T9943V, T9944)
+from src.xing.tasks.master import get_data_configs, initialize_client
+
+logger = logging.getLogger(__name__)
+
+TASK_NAME_PREFIX = "xing_master_sync"
+
+
+@dataclass(frozen=True)
+class MasterTable:
+    """Where the rows of one master TR are stored.
+
+    Args:
+        orm_cls: ORM class of the ``xing_*_outblock`` table.
+        key_columns: Natural key identifying a row across refreshes.
+        renames: OutBlock field -> table column, for columns named differently.
+    """
+    orm_cls: Type[Base]  # type: ignore[valid-type]
+    key_columns: Tuple[str, ...]
+    renames: Dict[str, str] = field(default_factory=dict)
+
+
+MASTER_TABLES: Dict[str, MasterTable] = {
+    T1764: MasterTable(t1764OutBlockOrm, ("tradno",)),
+    T8424: MasterTable(t8424OutBlockOrm, ("upcode",)),
+    T8425: MasterTable(t8425OutBlockOrm, ("tmcode",)),
+    T8436: MasterTable(t8436OutBlockOrm, ("shcode",)),
+    T8401: MasterTable(t8401OutBlockOrm, ("shcode",), renames={"basecode": "BaseOrmcode"}),
+    T8426: MasterTable(t8426OutBlockOrm, ("shcode",)),
+    T9943V: MasterTable(t9943VOutBlockOrm, ("shcode",)),
+    T9943S: MasterTable(t9943SOutBlockOrm, ("shcode",)),
+    T9943: MasterTable(t9943OutBlockOrm, ("shcode",)),
+    T9944: MasterTable(t9944OutBlockOrm, ("shcode",)),
+    O3101: MasterTable(o3101OutBlockOrm, ("Symbol",)),
+}
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    error: Optional[str] = None
+
+
+def _to_rows(table: MasterTable, outblocks: List[Optional[BaseModel]]) -> List[Dict[str, Any]]:
+    columns = set(table.orm_cls.__table__.columns.keys())  # type: ignore[attr-defined]
+    rows = []
+    for outblock in outblocks:
+        if outblock is None:
+            continue
+        row = {table.renames.get(name, name): value for name, value in outblock.model_dump().items()}
+        rows.append({name: value for name, value in row.items() if name in columns})
+    return rows
+
+
+def diff_table(sess: Session, table: MasterTable, rows: List[Dict[str, Any]]) -> Tuple[List[dict], List[dict], List[int]]:
+    """Compare ``rows`` to the current content of the table.
+
+    Returns:
+        Tuple of the rows to insert, the ``{id, changed columns}`` mappings
+        to update and the ids to delete. Rows of the table sharing a key
+        with an earlier one are deleted as well.
+    """
+    orm_cls = table.orm_cls
+    incoming = {tuple(row[name] for name in table.key_columns): row for row in rows}
+    value_columns = sorted(set(table.key_columns) | {name for row in rows for name in row})
+
+    current: Dict[tuple, Any] = {}
+    deletes = []
+    for existing in sess.execute(select(orm_cls.id, *(getattr(orm_cls, name) for name in value_columns))).all():  # type: ignore[attr-defined]
+        existing_row = dict(zip(value_columns, existing[1:]))
+        key = tuple(existing_row[name] for name in table.key_columns)
+        if key in current or key not in incoming:
+            deletes.append(existing.id)
+        else:
+            current[key] = existing
+
+    inserts, updates = [], []
+    now = datetime.now()
+    for key, row in incoming.items():
+        existing = current.get(key)
+        if existing is None:
+            inserts.append(dict(row, created_at=now, updated_at=now))
+            continue
+        changed = {name: value for name, value in row.items() if getattr(existing, name) != value}
+        if changed:
+            updates.append(dict(changed, id=existing.id, updated_at=now))
+    return inserts, updates, deletes
+
+
+def apply_diff(sess: Session, table: MasterTable, rows: List[Dict[str, Any]]) -> SyncResult:
+    inserts, updates, deletes = diff_table(sess, table, rows)
+    bulk_insert(sess, table.orm_cls, inserts)
+    # Rows updated together must share the same columns for one executemany.
+    by_columns: Dict[frozenset, List[dict]] = {}
+    for update in updates:
+        by_columns.setdefault(frozenset(update), []).append(update)
+    for group in by_columns.values():
+        bulk_update(sess, table.orm_cls, group)
+    if deletes:
+        sess.execute(delete(table.orm_cls).where(table.orm_cls.id.in_(deletes)))  # type: ignore[attr-defined]
+    return SyncResult(inserted=len(inserts), updated=len(updates), deleted=len(deletes))
+
+
+def _start_tasks(session_factory: Callable[[], Session], keys: Sequence[str]) -> Dict[str, int]:
+    with session_factory() as sess:
+        tasks = {key: RountineTaskOrm(task_name=f"{TASK_NAME_PREFIX}:{key}", status="running") for key in keys}
+        sess.add_all(tasks.values())
+        sess.commit()
+        return {key: task.id for key, task in tasks.items()}
+
+
+def _finish_tasks(session_factory: Callable[[], Session], task_ids: Dict[str, int], results: Dict[str, SyncResult]) -> None:
+    now = datetime.now()
+    with session_factory() as sess:
+        bulk_update(sess, RountineTaskOrm, [
+            dict(
+                id=task_ids[key],
+                status="failed" if result.error else "success",
+                inserted_count=result.inserted,
+                updated_count=result.updated,
+                deleted_count=result.deleted,
+                message=result.error,
+                updated_at=now,
+            )
+            for key, result in results.items()
+        ])
+        sess.commit()
+
+
+async def sync_master_data(
+    client: XingClient,
+    config_types: Sequence[str] = ("code", "ticker"),
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Dict[str, SyncResult]:
+    """Refresh the ``xing_*_outblock`` master tables, writing only what changed.
+
+    Every configured TR is fetched concurrently, diffed by natural key
+    against its table, and the resulting inserts, updates and deletes of all
+    tables are applied in one transaction. Each TR gets a ``routine_tasks``
+    row holding its status and row counts. A TR whose request fails or
+    returns nothing while its table is not empty is left untouched.
+    """
+    configs = {}
+    for config_type in config_types:
+        configs.update({key: config for key, config in get_data_configs(config_type).items() if key in MASTER_TABLES})
+
+    task_ids = _start_tasks(session_factory, list(configs))
+    fetched = await asyncio.gather(*(client.request(config) for config in configs.values()), return_exceptions=True)
+
+    results: Dict[str, SyncResult] = {}
+    with session_factory() as sess:
+        try:
+            for key, outblocks in zip(configs, fetched):
+                table = MASTER_TABLES[key]
+                if isinstance(outblocks, BaseException):
+                    results[key] = SyncResult(error=f"{type(outblocks).__name__}: {outblocks}")
+                    continue
+                rows = _to_rows(table, outblocks)
+                if not rows and sess.scalar(select(table.orm_cls.id).limit(1)) is not None:  # type: ignore[attr-defined]
+                    results[key] = SyncResult(error="Empty response, table left unchanged")
+                    continue
+                results[key] = apply_diff(sess, table, rows)
+            sess.commit()
+        except Exception as e:
+            sess.rollback()
+            logger.exception("Failed to apply the master data changes")
+            error = f"{type(e).__name__}: {e}"
+            results = {key: SyncResult(error=(results[key].error if key in results else None) or error) for key in configs}
+
+    _finish_tasks(session_factory, task_ids, results)
+    for key, result in results.items():
+        logger.info(f"{key}: {result}")
+    return results
+
+
+def prepare_tables() -> None:
+    """Create the master tables and the ``routine_tasks`` columns added since they were first created."""
+    init_db()
+    add_missing_columns(engine, RountineTaskOrm.__table__)
+
+
+async def main():
+    logging.basicConfig(level=logging.INFO)
+    prepare_tables()
+    async with await initialize_client() as client:
+        results = await sync_master_data(client)
+    for key, result in results.items():
+        print(key, result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
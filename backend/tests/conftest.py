@@ -0,0 +1,17 @@
+import os
+import shutil
+import tempfile
+
+# Importing src.database.session runs init_db() on the configured database,
+# so point it and the blob store at a scratch directory before any test imports src.
+_SCRATCH_DIR = tempfile.mkdtemp(prefix="theme-guide-tests-")
+os.environ["DB_ENGINE"] = "sqlite"
+os.environ["SQLITE_DB_FILE"] = os.path.join(_SCRATCH_DIR, "tg_crawler.db")
+os.environ["BLOB_STORE_BACKEND"] = "local"
+os.environ["BLOB_STORE_DIR"] = os.path.join(_SCRATCH_DIR, "blobs")
+os.environ.setdefault("XING_APP_KEY", "test")
+os.environ.setdefault("XING_APP_SECRET", "test")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_SCRATCH_DIR, ignore_errors=True)
@@ -0,0 +1,54 @@
+import datetime
+
+import pandas as pd
+
+from src.graph.engine import build_graph_from_edges
+from src.graph.prices import PRICE_RANGE_COLUMNS
+
+FROM, TO = datetime.date(2024, 10, 1), datetime.date(2024, 10, 16)
+
+
+def _prices(rows):
+    return pd.DataFrame(
+        [
+            dict(
+                ticker=ticker, isin=isin, name=ticker, currency="KRW", market="KOSPI", source="xing",
+                date_from=FROM, date_to=TO, price_from=100.0, price_to=100.0 * change, price_change=change,
+            )
+            for ticker, isin, change in rows
+        ],
+        columns=PRICE_RANGE_COLUMNS,
+    )
+
+
+def _edges(rows):
+    return pd.DataFrame(
+        [dict(isin=isin, keyword=keyword, weight_sum=weight, abs_weight_sum=abs(weight), link_count=1) for isin, keyword, weight in rows]
+    )
+
+
+def test_securities_without_or_sharing_an_isin_are_skipped():
+    prices = _prices([
+        ("000001", None, 1.1),
+        ("000002", None, 0.9),
+        ("000003", "", 1.2),
+        ("005935", "KR7005930003", 1.5),
+        ("005930", "KR7005930003", 1.2),
+        ("000660", "KR7000660001", 0.8),
+    ])
+    edges = _edges([
+        ("KR7005930003", "반도체", 1.0),
+        ("KR7000660001", "반도체", 1.0),
+        ("KR7000660001", "HBM", -1.0),
+    ])
+
+    graph = build_graph_from_edges(edges, prices, FROM, TO)
+
+    assert graph.companies["ticker"].tolist() == ["000660", "005930"]
+    assert graph.unpriced == 0
+    response = graph.to_response()
+    assert len(response.company_nodes) == 2
+    assert len(response.edges) == 3
+    change = dict(zip(graph.keywords.tolist(), graph.keyword_change.tolist()))
+    assert change["반도체"] == 1.0
+    assert round(change["HBM"], 6) == 1.2
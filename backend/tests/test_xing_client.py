@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import httpx
+
+from src.xing.block import t1302InBlock, t1305InBlock
+from src.xing.client import XingClient
+from src.xing.constant import T1302, T1305, TR_CODE_TO_URL
+from src.xing.schemas import XingDataConfig
+
+
+def _paginate(tr_code, inblock, pages, max_pages=None):
+    """Run ``XingClient.paginate`` against ``pages``, the OutBlock and ``tr_cont`` answered to each request.
+
+    Returns the InBlocks sent and the page batches yielded.
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content)[f"{tr_code}InBlock"])
+        outblock, tr_cont = pages[min(len(requests), len(pages)) - 1]
+        return httpx.Response(
+            200,
+            json={f"{tr_code}OutBlock": outblock, f"{tr_code}OutBlock1": [{"page": len(requests)}]},
+            headers={"tr_cont": tr_cont, "tr_cont_key": f"key{len(requests)}"},
+        )
+
+    config = XingDataConfig(
+        path=TR_CODE_TO_URL[tr_code],
+        tr_code=tr_code,
+        inblock=inblock,
+        cb_handler=lambda response, config: response.json()[f"{tr_code}OutBlock1"],
+    )
+
+    async def run():
+        async with XingClient(
+            access_token="token",
+            rate_limits={tr_code: 1000.0},
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return [batch async for batch in client.paginate(config, max_pages=max_pages)]
+
+    return requests, asyncio.run(run())
+
+
+def test_t1302_continuation_sends_cts_time_as_time():
+    requests, batches = _paginate(
+        T1302,
+        t1302InBlock(shcode="005930", gubun="0", cnt="900"),
+        [({"cts_time": "151000"}, "Y"), ({"cts_time": "150000"}, "Y"), ({"cts_time": "090000"}, "N")],
+    )
+    assert [request["time"] for request in requests] == ["", "151000", "150000"]
+    assert all("cts_time" not in request for request in requests)
+    assert len(batches) == 3
+
+
+def test_t1305_continuation_copies_only_the_cursor():
+    requests, _ = _paginate(
+        T1305,
+        t1305InBlock(shcode="005930", dwmcode=1, cnt=300),
+        [({"cnt": 1, "date": "20241015", "idx": 300}, "Y"), ({"cnt": 1, "date": "20240101", "idx": 600}, "N")],
+    )
+    assert [(request["date"], request["idx"]) for request in requests] == [("", 0), ("20241015", 300)]
+    assert [request["cnt"] for request in requests] == [300, 300]
+
+
+def test_paginate_stops_when_the_cursor_does_not_advance():
+    # The server keeps answering tr_cont: Y with the same cursor.
+    requests, batches = _paginate(
+        T1302,
+        t1302InBlock(shcode="005930", gubun="0", cnt="900"),
+        [({"cts_time": "151000"}, "Y")],
+    )
+    assert [request["time"] for request in requests] == ["", "151000"]
+    assert len(batches) == 2
@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from src.xing.block import t1302InBlock
+from src.xing.constant import T1302
+from src.xing.storage import create_outblock_tables, get_outblock_orm, ingest
+
+TIMES = ["153000", "152900", "152800"]
+
+
+class PageClient:
+    """Answers every TR with one page of ``t1302OutBlock1`` rows, one per time of ``TIMES``."""
+
+    def __init__(self, close: int):
+        self.close = close
+
+    async def paginate(self, config, max_pages=None):
+        rows = [{"chetime": chetime, "close": self.close + i} for i, chetime in enumerate(TIMES)]
+        yield config.cb_handler(httpx.Response(200, json={"t1302OutBlock1": rows}), config=config)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'xing.db'}")
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _ingest(session_factory, close: int, trading_date: str) -> int:
+    inblock = t1302InBlock(shcode="005930", gubun="0", cnt="900")
+    return asyncio.run(ingest(PageClient(close), T1302, inblock, session_factory=session_factory, trading_date=trading_date))
+
+
+def _rows(session_factory):
+    orm_cls = get_outblock_orm(T1302)
+    with session_factory() as sess:
+        return sess.execute(
+            select(orm_cls.date, orm_cls.chetime, orm_cls.close).order_by(orm_cls.date, orm_cls.chetime)
+        ).all()
+
+
+def test_t1302_keeps_the_same_times_of_two_days(session_factory):
+    assert _ingest(session_factory, 100, "20241016") == len(TIMES)
+    assert _ingest(session_factory, 200, "20241017") == len(TIMES)
+    # Ingesting a day again updates its rows instead of adding new ones.
+    assert _ingest(session_factory, 300, "20241017") == len(TIMES)
+
+    rows = _rows(session_factory)
+    assert len(rows) == 2 * len(TIMES)
+    assert {(date, chetime) for date, chetime, _ in rows} == {
+        (date, chetime) for date in ("20241016", "20241017") for chetime in TIMES
+    }
+    assert sorted(close for date, _, close in rows if date == "20241016") == [100, 101, 102]
+    assert sorted(close for date, _, close in rows if date == "20241017") == [300, 301, 302]
+
+
+def test_t1302_table_without_trading_date_is_migrated(session_factory):
+    orm_cls = get_outblock_orm(T1302)
+    table = orm_cls.__table__
+    bind = session_factory.kw["bind"]
+    # Table and key index as created before the trading date column existed.
+    columns = ", ".join(column.name for column in table.columns if column.name not in ("id", "date"))
+    with bind.begin() as conn:
+        conn.execute(text(f"CREATE TABLE {table.name} (id INTEGER PRIMARY KEY, {columns})"))
+        conn.execute(text(f"CREATE UNIQUE INDEX uq_{table.name}_key ON {table.name} (shcode, chetime)"))
+
+    create_outblock_tables([T1302], bind=bind)
+    _ingest(session_factory, 100, "20241016")
+    _ingest(session_factory, 200, "20241017")
+
+    with session_factory() as sess:
+        assert sess.scalar(select(func.count()).select_from(orm_cls)) == 2 * len(TIMES)
@@ -1,7 +1,7 @@
 import { useQuery } from '@tanstack/react-query'
 import { useEffect, useMemo, useRef, useState } from 'react'
 import * as d3 from 'd3'
-import { CompanyKeywordGraph, CompanyNode, KeywordNode } from './dto/graph';
+import { CompanyKeywordGraph, CompanyNode, KeywordNode, fetchGraph } from './dto/graph';
 
 // D3에서 사용할 수 있는 노드 타입 (id, name, x, y, fx, fy 포함)
 type NodeType =
@@ -362,11 +362,7 @@ function D3Graph({ data }: { data: CompanyKeywordGraph }) {
 function GraphData() {
   const { data, isLoading, error } = useQuery<CompanyKeywordGraph>({
     queryKey: ['graphData'],
-    queryFn: async () => {
-      const res = await fetch('http://localhost:8000/test')
-      if (!res.ok) throw new Error('네트워크 오류')
-      return res.json() as Promise<CompanyKeywordGraph>
-    }
+    queryFn: () => fetchGraph('http://localhost:8000/test')
   })
 
   if (isLoading) return <div>로딩 중...</div>
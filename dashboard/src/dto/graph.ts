@@ -38,3 +38,140 @@ export interface CompanyKeywordGraph {
 	keyword_nodes: KeywordNode[];
 	edges: Edge[];
 }
+
+// 바이너리 그래프 포맷 (backend/src/graph/wire.py 의 encode_graph)
+export const GRAPH_BINARY_MEDIA_TYPE = 'application/vnd.company-keyword-graph';
+const GRAPH_BINARY_MAGIC = 'CKG1';
+const ALIGNMENT = 8;
+
+const COLUMN_TYPES = {
+	float64: Float64Array,
+	float32: Float32Array,
+	uint32: Uint32Array,
+	uint16: Uint16Array,
+};
+
+interface ColumnSpec {
+	name: string;
+	type: keyof typeof COLUMN_TYPES;
+	offset: number; // 헤더 이후 데이터 영역 기준 바이트 오프셋
+	length: number;
+}
+
+interface GraphBinaryHeader {
+	query_info: QueryInfo;
+	isin: string[];
+	name: string[];
+	keyword: string[];
+	currency: string[]; // 사전 (코드 -> 값)
+	market: string[];
+	source: string[];
+	columns: ColumnSpec[];
+}
+
+// 컬럼 형태의 그래프, 엣지는 노드 인덱스로 연결
+export interface CompanyKeywordGraphColumns {
+	query_info: QueryInfo;
+	companies: {
+		ISIN: string[];
+		name: string[];
+		priceFrom: Float64Array;
+		priceTo: Float64Array;
+		priceChange: Float64Array;
+		currency: { dictionary: string[]; codes: Uint16Array };
+		market: { dictionary: string[]; codes: Uint16Array };
+		source: { dictionary: string[]; codes: Uint16Array };
+	};
+	keywords: {
+		keyword: string[];
+		priceChange: Float64Array;
+	};
+	edges: {
+		source: Uint32Array; // companies 인덱스
+		target: Uint32Array; // keywords 인덱스
+		weight: Float32Array;
+	};
+}
+
+const isLittleEndian = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+// 바이너리 응답을 복사 없이 typed array 로 읽음
+export function decodeGraphColumns(buffer: ArrayBuffer): CompanyKeywordGraphColumns {
+	if (!isLittleEndian) {
+		throw new Error('binary graph decoding needs a little endian platform');
+	}
+	const view = new DataView(buffer);
+	const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 4));
+	if (magic !== GRAPH_BINARY_MAGIC) {
+		throw new Error(`not a binary graph: ${magic}`);
+	}
+	const headerLength = view.getUint32(4, true);
+	const header: GraphBinaryHeader = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+	const dataOffset = Math.ceil((8 + headerLength) / ALIGNMENT) * ALIGNMENT;
+
+	const columns: Record<string, Float64Array | Float32Array | Uint32Array | Uint16Array> = {};
+	for (const column of header.columns) {
+		columns[column.name] = new COLUMN_TYPES[column.type](buffer, dataOffset + column.offset, column.length);
+	}
+	return {
+		query_info: header.query_info,
+		companies: {
+			ISIN: header.isin,
+			name: header.name,
+			priceFrom: columns.priceFrom as Float64Array,
+			priceTo: columns.priceTo as Float64Array,
+			priceChange: columns.priceChange as Float64Array,
+			currency: { dictionary: header.currency, codes: columns.currency as Uint16Array },
+			market: { dictionary: header.market, codes: columns.market as Uint16Array },
+			source: { dictionary: header.source, codes: columns.source as Uint16Array },
+		},
+		keywords: {
+			keyword: header.keyword,
+			priceChange: columns.keywordPriceChange as Float64Array,
+		},
+		edges: {
+			source: columns.edgeSource as Uint32Array,
+			target: columns.edgeTarget as Uint32Array,
+			weight: columns.edgeWeight as Float32Array,
+		},
+	};
+}
+
+// 바이너리 응답을 JSON 응답과 같은 구조로 변환
+export function decodeGraph(buffer: ArrayBuffer): CompanyKeywordGraph {
+	const { query_info, companies, keywords, edges } = decodeGraphColumns(buffer);
+	const company_nodes: CompanyNode[] = companies.ISIN.map((ISIN, i) => ({
+		type: 'company',
+		ISIN,
+		name: companies.name[i],
+		priceFrom: companies.priceFrom[i],
+		priceTo: companies.priceTo[i],
+		priceChange: companies.priceChange[i],
+		currency: companies.currency.dictionary[companies.currency.codes[i]],
+		market: companies.market.dictionary[companies.market.codes[i]],
+		source: companies.source.dictionary[companies.source.codes[i]],
+	}));
+	const keyword_nodes: KeywordNode[] = keywords.keyword.map((keyword, i) => ({
+		type: 'keyword',
+		keyword,
+		priceChange: keywords.priceChange[i],
+	}));
+	const edgeList: Edge[] = Array.from(edges.weight, (weight, i) => ({
+		source: companies.name[edges.source[i]],
+		target: keywords.keyword[edges.target[i]],
+		weight,
+	}));
+	return { query_info, company_nodes, keyword_nodes, edges: edgeList };
+}
+
+// 바이너리 포맷을 우선 요청하고, 서버가 JSON 으로 답하면 JSON 으로 읽음
+export async function fetchGraph(url: string): Promise<CompanyKeywordGraph> {
+	const res = await fetch(url, { headers: { Accept: `${GRAPH_BINARY_MEDIA_TYPE}, application/json;q=0.9` } });
+	if (!res.ok) {
+		throw new Error('네트워크 오류');
+	}
+	if (res.headers.get('content-type')?.startsWith(GRAPH_BINARY_MEDIA_TYPE)) {
+		return decodeGraph(await res.arrayBuffer());
+	}
+	return res.json() as Promise<CompanyKeywordGraph>;
+}